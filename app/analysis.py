@@ -1,145 +1,127 @@
-import pandas as pd
-import numpy as np
-import json
-from datetime import datetime, timedelta
-import yfinance as yf
-
-# Load the data
-df = pd.read_csv('combined_mutual_fund_data.csv', sep='\t')
-
-# Convert date columns to datetime
-df['Date of calculation'] = pd.to_datetime(df['Date of calculation'])
-df['Valuation date'] = pd.to_datetime(df['Valuation date'])
-
-# Sort the dataframe by fund name and valuation date
-df = df.sort_values(['Name of the open-end investment fund', 'Valuation date'])
-
-# Calculate daily returns
-df['Daily Return'] = df.groupby('Name of the open-end investment fund')['Last daily sale price per unit'].pct_change()
-
-# Calculate cumulative returns correctly
-df['Cumulative Return'] = df.groupby('Name of the open-end investment fund').apply(lambda x: (1 + x['Daily Return']).cumprod() - 1).reset_index(level=0, drop=True)
-
-# Function to calculate average annual return
-def avg_annual_return(start_price, end_price, years):
-    total_return = (end_price / start_price) - 1
-    return (1 + total_return) ** (1 / years) - 1
-
-# Get S&P 500 data
-sp500 = yf.Ticker("^GSPC")
-sp500_data = sp500.history(period="10y")
-
-# Calculate S&P 500 returns
-current_date = df['Valuation date'].max()
-sp500_current_price = sp500_data['Close'].iloc[-1]
-sp500_ytd_start_price = sp500_data.loc[sp500_data.index.year == current_date.year, 'Open'].iloc[0]
-sp500_5y_start_price = sp500_data.loc[sp500_data.index.year == current_date.year - 5, 'Open'].iloc[0]
-sp500_10y_start_price = sp500_data.loc[sp500_data.index.year == current_date.year - 10, 'Open'].iloc[0]
-
-sp500_ytd_return = (sp500_current_price / sp500_ytd_start_price) - 1
-sp500_5y_return = avg_annual_return(sp500_5y_start_price, sp500_current_price, 5)
-sp500_10y_return = avg_annual_return(sp500_10y_start_price, sp500_current_price, 10)
-
-# Calculate metrics for each fund
-metrics = []
-for fund in df['Name of the open-end investment fund'].unique():
-    fund_data = df[df['Name of the open-end investment fund'] == fund]
-
-    current_price = fund_data['Last daily sale price per unit'].iloc[-1]
-
-    # YTD return
-    ytd_start = datetime(current_date.year, 1, 1)
-    ytd_data = fund_data[fund_data['Valuation date'] >= ytd_start]
-    if not ytd_data.empty:
-        ytd_start_price = ytd_data['Last daily sale price per unit'].iloc[0]
-        ytd_return = (current_price / ytd_start_price) - 1
-    else:
-        ytd_return = np.nan
-
-    # 5-year return
-    five_year_start = current_date - timedelta(days=5*365)
-    five_year_data = fund_data[fund_data['Valuation date'] >= five_year_start]
-    if not five_year_data.empty:
-        five_year_start_price = five_year_data['Last daily sale price per unit'].iloc[0]
-        five_year_return = avg_annual_return(five_year_start_price, current_price, 5)
-    else:
-        five_year_return = np.nan
-
-    # 10-year return
-    ten_year_start = current_date - timedelta(days=10*365)
-    ten_year_data = fund_data[fund_data['Valuation date'] >= ten_year_start]
-    if not ten_year_data.empty:
-        ten_year_start_price = ten_year_data['Last daily sale price per unit'].iloc[0]
-        ten_year_return = avg_annual_return(ten_year_start_price, current_price, 10)
-    else:
-        ten_year_return = np.nan
-
-    # Calculate Sharpe Ratio (assuming risk-free rate of 2%)
-    risk_free_rate = 0.02
-    excess_returns = fund_data['Daily Return'] - risk_free_rate / 252  # 252 trading days in a year
-    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / excess_returns.std()
-
-    # Calculate maximum drawdown
-    cumulative_returns = (1 + fund_data['Daily Return']).cumprod()
-    peak = cumulative_returns.expanding(min_periods=1).max()
-    drawdown = (cumulative_returns / peak) - 1
-    max_drawdown = drawdown.min()
-
-    metrics.append({
-        'fund': fund,
-        'current_price': current_price,
-        'ytd_return': ytd_return,
-        'five_year_return': five_year_return,
-        'ten_year_return': ten_year_return,
-        'sharpe_ratio': sharpe_ratio,
-        'max_drawdown': max_drawdown,
-        'ytd_vs_sp500': ytd_return - sp500_ytd_return,
-        'five_year_vs_sp500': five_year_return - sp500_5y_return,
-        'ten_year_vs_sp500': ten_year_return - sp500_10y_return
-    })
-
-metrics_df = pd.DataFrame(metrics)
-
-# Get top and bottom 5 funds by 5-year, 10-year, and YTD returns
-top_5_year = metrics_df.nlargest(5, 'five_year_return')[['fund', 'five_year_return']]
-top_10_year = metrics_df.nlargest(5, 'ten_year_return')[['fund', 'ten_year_return']]
-top_ytd = metrics_df.nlargest(5, 'ytd_return')[['fund', 'ytd_return']]
-bottom_5_year = metrics_df.nsmallest(5, 'five_year_return')[['fund', 'five_year_return']]
-bottom_10_year = metrics_df.nsmallest(5, 'ten_year_return')[['fund', 'ten_year_return']]
-bottom_ytd = metrics_df.nsmallest(5, 'ytd_return')[['fund', 'ytd_return']]
-
-# Prepare data for JavaScript output
-js_data = {
-    'fundList': df['Name of the open-end investment fund'].unique().tolist(),
-    'fundMetrics': metrics_df.to_dict('records'),
-    'fundData': {},
-    'top5Year': top_5_year.to_dict('records'),
-    'top10Year': top_10_year.to_dict('records'),
-    'topYTD': top_ytd.to_dict('records'),
-    'bottom5Year': bottom_5_year.to_dict('records'),
-    'bottom10Year': bottom_10_year.to_dict('records'),
-    'bottomYTD': bottom_ytd.to_dict('records'),
-    'sp500': {
-        'ytd_return': sp500_ytd_return,
-        '5y_return': sp500_5y_return,
-        '10y_return': sp500_10y_return
-    }
+from fund_loader import load_fund_data, exclude_quarantined
+from metrics import FUND_COLUMN, DATE_COLUMN, PRICE_COLUMN, fund_slices, return_series
+from incremental_metrics import MetricsState
+from benchmarks import YahooBenchmark, FundBenchmark, benchmark_returns
+from fund_series_store import FundSeriesStore
+from js_export import write_chunked_output, index_data, INDEX_FILENAME
+from series_pyramid import build_pyramid
+from rolling import compute_rolling, write_rolling
+from portfolio import ReturnMatrix
+from tracing import get_tracer
+
+# Opt-in timing trace (see tracing.py), e.g. MSE_TRACE=trace.json
+tracer = get_tracer('analysis')
+
+# Funds and valuation-date range to analyse (None loads everything)
+FUNDS = None
+START_DATE = None
+END_DATE = None
+
+# Leave out the rows the crawler's data quality checks quarantined for exclusion
+# (fund_quarantine.csv: zero or inverted prices and bad prints)
+EXCLUDE_QUARANTINED = True
+
+# Use only the cached benchmark series under benchmarks/ (no network access)
+OFFLINE_BENCHMARKS = False
+
+# Metrics are updated from the running state in metrics_state.pkl; every this
+# many runs they are recomputed in full and the state is checked for drift
+FULL_RECOMPUTE_EVERY = 30
+
+# Weighted portfolios to backtest on the aligned daily returns, rebalanced daily
+PORTFOLIOS = {
+    'KB Invest 60/40': {'KB Invest - Balanced': 0.6, 'KB Invest - Bonds': 0.4},
 }
-
-for fund in js_data['fundList']:
-    fund_data = df[df['Name of the open-end investment fund'] == fund]
-    # Resample data to monthly frequency
-    monthly_data = fund_data.resample('M', on='Valuation date').last()
-    js_data['fundData'][fund] = {
-        'dates': monthly_data.index.strftime('%Y-%m-%d').tolist(),
-        'prices': monthly_data['Last daily sale price per unit'].tolist(),
-        'returns': monthly_data['Cumulative Return'].tolist()
-    }
-
-# Write JavaScript file
-with open('output/fund_data.js', 'w') as f:
-    f.write('const fundData = ')
-    json.dump(js_data, f)
-    f.write(';')
-
-print("Analysis complete. Data exported to 'output/fund_data.js'.")
\ No newline at end of file
+CORRELATION_PATH = 'output/fund_correlation.csv'
+PORTFOLIOS_PATH = 'output/portfolios.csv'
+
+# Load the data (typed columnar store if present, otherwise the tab-separated CSV)
+with tracer.span('load') as span:
+    df = load_fund_data(funds=FUNDS, start=START_DATE, end=END_DATE)
+    if EXCLUDE_QUARANTINED:
+        df, quarantined = exclude_quarantined(df)
+        span['quarantined'] = quarantined
+        if quarantined:
+            print(f"Left out {quarantined} rows quarantined by the data quality checks")
+
+    # Sort the dataframe by fund name and valuation date
+    df = df.sort_values([FUND_COLUMN, DATE_COLUMN])
+    span['rows'] = len(df)
+
+# Daily returns, cumulative returns and drawdowns for all funds in one pass;
+# the metrics and the export below reuse these arrays
+with tracer.span('returns', rows=len(df)):
+    funds, starts, ends = fund_slices(df)
+    returns = return_series(df[PRICE_COLUMN].to_numpy(), starts, ends)
+    df['Daily Return'] = returns.daily
+    df['Cumulative Return'] = returns.cumulative
+
+# Compact fund x date price arrays for the rolling tables and the monthly export
+store = FundSeriesStore.from_frame(df)
+
+current_date = df[DATE_COLUMN].max()
+
+# S&P 500 returns from the local daily-close cache (topped up with new days only);
+# without any series the comparisons with it are left empty
+with tracer.span('benchmarks', benchmark='sp500'):
+    try:
+        sp500_series = YahooBenchmark('sp500', '^GSPC', offline=OFFLINE_BENCHMARKS).history(until=current_date)
+        sp500 = benchmark_returns(sp500_series, current_date, 'sp500')
+    except Exception as e:
+        print(f"Skipping benchmark sp500: {e}")
+        sp500 = {'ytd_return': float('nan'), '5y_return': float('nan'), '10y_return': float('nan')}
+
+# Additional benchmarks, reported alongside the S&P 500
+benchmark_data = {'sp500': sp500}
+for benchmark in [FundBenchmark('mbi10', 'KB Invest - MBI 10', df)]:
+    try:
+        benchmark_data[benchmark.name] = benchmark_returns(benchmark.history(until=current_date), current_date,
+                                                           benchmark.name)
+    except Exception as e:
+        print(f"Skipping benchmark {benchmark.name}: {e}")
+
+# Calculate metrics, folding only the newly crawled rows into the persisted state
+with tracer.span('metrics', funds=len(funds)) as span:
+    metrics_state = MetricsState()
+    span['appended_rows'], span['rebuilt_rows'] = metrics_state.update(df)
+    sp500_returns = (sp500['ytd_return'], sp500['5y_return'], sp500['10y_return'])
+    if metrics_state.updates_since_check >= FULL_RECOMPUTE_EVERY:
+        metrics_df, drift = metrics_state.check_drift(df, current_date, sp500_returns, returns=returns)
+        print(f"Full metrics recompute; largest drift of the running state: {max(drift.values()):.3g}")
+    else:
+        metrics_df = metrics_state.metrics(df, current_date, sp500_returns)
+    metrics_state.save()
+
+# Rolling 1m/3m/1y/3y volatility, Sharpe, drawdown and spread for every fund and
+# date, persisted so dashboards can read them with rolling.read_rolling
+with tracer.span('rolling', rows=len(df)):
+    rolling_path = write_rolling(compute_rolling(store))
+
+# Cross-fund statistics: every fund's daily returns aligned on the shared calendar,
+# pairwise-complete correlations (cached per data version) and the portfolios above
+with tracer.span('correlation', funds=len(store.fund_names), portfolios=len(PORTFOLIOS)):
+    return_matrix = ReturnMatrix(store)
+    return_matrix.correlation().to_csv(CORRELATION_PATH)
+    if PORTFOLIOS:
+        portfolios, _ = return_matrix.evaluate(list(PORTFOLIOS.values()))
+        portfolios.insert(0, 'portfolio', list(PORTFOLIOS))
+        portfolios.to_csv(PORTFOLIOS_PATH, index=False, date_format='%Y-%m-%d')
+
+# The forward-looking 1/5/10-year projections are a separate, much slower step:
+# python monte_carlo.py writes output/monte_carlo.csv
+
+# Fund list, metrics, top/bottom 5 tables by 5-year, 10-year and YTD return,
+# and benchmarks for the JavaScript index
+js_data = index_data(metrics_df, sp500, benchmark_data)
+
+# Price and cumulative return series per fund at every chart level (daily,
+# weekly, monthly and an LTTB downsample), so charts stay light at any zoom
+with tracer.span('resample', funds=len(funds)):
+    fund_series = build_pyramid(store)
+
+# Write the JavaScript index plus lazily loaded files per fund
+with tracer.span('export', funds=len(fund_series)):
+    write_chunked_output(js_data, fund_series, 'output')
+
+print(f"Analysis complete. Data exported to 'output/{INDEX_FILENAME}', 'output/funds/', '{rolling_path}' "
+      f"and '{CORRELATION_PATH}'.")
\ No newline at end of file
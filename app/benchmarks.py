@@ -0,0 +1,190 @@
+import os
+import argparse
+from datetime import timedelta
+
+import pandas as pd
+
+from metrics import FUND_COLUMN, DATE_COLUMN, PRICE_COLUMN, avg_annual_return
+
+CACHE_DIR = 'benchmarks'
+# Committed daily series used when there is neither a cache nor a way to
+# download one (no network, yfinance not installed); written by
+# `python benchmarks.py sp500 --symbol ^GSPC`
+SEED_DIR = os.path.join(CACHE_DIR, 'seed')
+SEED_PERIOD = '15y'
+# A series whose last close is further back than this from the valuation date
+# doesn't cover it (exchange holidays next to a weekend stay within it)
+MAX_CLOSE_GAP = timedelta(days=4)
+# Daily series are kept as Date,Open,Close; window start prices use Open and
+# the current price uses Close, as the original yfinance-based calculation did
+SERIES_COLUMNS = ['Open', 'Close']
+
+
+def read_series(path):
+    series = pd.read_csv(path, parse_dates=['Date'], index_col='Date')
+    return series[SERIES_COLUMNS].sort_index()
+
+
+def write_series(series, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    series[SERIES_COLUMNS].to_csv(tmp_path, index_label='Date', date_format='%Y-%m-%d')
+    os.replace(tmp_path, path)
+
+
+def closes_until(series, until=None):
+    # The rows of a Date-indexed series up to and including until, so returns
+    # as of a past date don't see later closes
+    if until is None:
+        return series
+    return series[series.index <= pd.Timestamp(until)]
+
+
+def _naive_daily(history):
+    # yfinance returns an exchange-local tz-aware index; the cache stores plain dates
+    history = history[SERIES_COLUMNS].copy()
+    index = history.index
+    if getattr(index, 'tz', None) is not None:
+        index = index.tz_localize(None)
+    history.index = pd.DatetimeIndex(index.normalize(), name='Date')
+    return history[~history.index.duplicated(keep='last')]
+
+
+class FileBenchmark:
+    # A benchmark read from a local Date,Open,Close file, fully offline
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+
+    def history(self, until=None):
+        return closes_until(read_series(self.path), until)
+
+
+def last_business_day(day):
+    # The latest weekday on or before day: the last close a series can have by then
+    return pd.offsets.BDay().rollback(day)
+
+
+class YahooBenchmark:
+    # Yahoo Finance index cached under benchmarks/<name>.csv. Only days after the
+    # last cached one are downloaded; with offline=True (or when the download
+    # fails) the cached series is used as-is, or the committed seed series under
+    # benchmarks/seed/ when nothing is cached yet.
+
+    def __init__(self, name, symbol, cache_dir=CACHE_DIR, initial_period='10y', offline=False, seed_dir=SEED_DIR):
+        self.name = name
+        self.symbol = symbol
+        self.cache_path = os.path.join(cache_dir, f"{name}.csv")
+        self.seed = FileBenchmark(name, os.path.join(seed_dir, f"{name}.csv"))
+        self.initial_period = initial_period
+        self.offline = offline
+
+    def fetch(self, start=None):
+        import yfinance as yf
+
+        ticker = yf.Ticker(self.symbol)
+        if start is None:
+            return _naive_daily(ticker.history(period=self.initial_period))
+        return _naive_daily(ticker.history(start=start.strftime('%Y-%m-%d')))
+
+    def history(self, until=None):
+        # The series up to until (today by default), downloading what's missing
+        cached = read_series(self.cache_path) if os.path.exists(self.cache_path) else None
+        until = pd.Timestamp(until or pd.Timestamp.today()).normalize()
+
+        if self.offline or (cached is not None and not cached.empty and cached.index[-1] >= last_business_day(until)):
+            return closes_until(cached, until) if cached is not None else self.fallback(until)
+
+        try:
+            if cached is None or cached.empty:
+                series = self.fetch()
+            else:
+                new_rows = self.fetch(start=cached.index[-1] + timedelta(days=1))
+                new_rows = new_rows[new_rows.index > cached.index[-1]]
+                series = pd.concat([cached, new_rows])
+        except Exception as e:
+            # ImportError without yfinance, network errors offline
+            if cached is None:
+                print(f"Could not download {self.name} ({self.symbol}): {e}")
+                return self.fallback(until)
+            print(f"Could not update {self.name} ({self.symbol}), using cached series: {e}")
+            return closes_until(cached, until)
+
+        if cached is None or len(series) != len(cached):
+            write_series(series, self.cache_path)
+        return closes_until(series, until)
+
+    def fallback(self, until=None):
+        # The seed series; it isn't copied to the cache, so the first successful
+        # download still fetches the full initial_period
+        if not os.path.exists(self.seed.path):
+            raise FileNotFoundError(f"No cached series for {self.name} at {self.cache_path} and no seed at {self.seed.path}")
+        series = read_series(self.seed.path)
+        print(f"Using the seed series for {self.name}, last close {series.index[-1]:%Y-%m-%d}")
+        return closes_until(series, until)
+
+
+class FundBenchmark:
+    # A benchmark built from one fund's prices in the crawler dataset, e.g. the
+    # KB Invest - MBI 10 index fund as a local stand-in for the MBI10
+
+    def __init__(self, name, fund, df):
+        self.name = name
+        self.fund = fund
+        self.df = df
+
+    def history(self, until=None):
+        fund_data = self.df[self.df[FUND_COLUMN] == self.fund]
+        prices = fund_data.set_index(DATE_COLUMN)[PRICE_COLUMN].sort_index()
+        prices = prices[~prices.index.duplicated(keep='last')]
+        return closes_until(pd.DataFrame({'Open': prices, 'Close': prices}).rename_axis('Date'), until)
+
+
+def benchmark_returns(series, current_date, name='benchmark'):
+    # YTD return and 5y/10y average annual returns, starting from the first
+    # trading day of the respective calendar year. NaN (with a warning) when
+    # the series ends before current_date rather than the last close it has.
+    current_date = pd.Timestamp(current_date)
+    series = closes_until(series, current_date)
+    if series.empty or series.index[-1] < last_business_day(current_date) - MAX_CLOSE_GAP:
+        last_close = f"last close {series.index[-1]:%Y-%m-%d}" if not series.empty else "no closes"
+        print(f"Warning: the {name} series doesn't cover {current_date:%Y-%m-%d} ({last_close}), "
+              f"leaving its returns out")
+        return {'ytd_return': float('nan'), '5y_return': float('nan'), '10y_return': float('nan')}
+
+    current_price = series['Close'].iloc[-1]
+    years = series.index.year
+
+    def start_price(year):
+        opens = series.loc[years == year, 'Open']
+        return opens.iloc[0] if not opens.empty else float('nan')
+
+    return {
+        'ytd_return': (current_price / start_price(current_date.year)) - 1,
+        '5y_return': avg_annual_return(start_price(current_date.year - 5), current_price, 5),
+        '10y_return': avg_annual_return(start_price(current_date.year - 10), current_price, 10),
+    }
+
+
+def update_seed(name, symbol, seed_dir=SEED_DIR, period=SEED_PERIOD):
+    # Downloads the daily series into the seed directory; needs yfinance and network
+    series = YahooBenchmark(name, symbol, initial_period=period).fetch()
+    path = os.path.join(seed_dir, f"{name}.csv")
+    write_series(series, path)
+    print(f"Seed series for {name} ({symbol}): {len(series)} closes from {series.index[0]:%Y-%m-%d} "
+          f"to {series.index[-1]:%Y-%m-%d} written to {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download a benchmark's daily series into the committed seed")
+    parser.add_argument('name', help="seed file name, e.g. sp500")
+    parser.add_argument('--symbol', required=True, help="Yahoo Finance symbol, e.g. ^GSPC")
+    parser.add_argument('--period', default=SEED_PERIOD, help="history to download, e.g. 15y or max")
+    parser.add_argument('--seed-dir', default=SEED_DIR)
+    args = parser.parse_args(argv)
+    update_seed(args.name, args.symbol, args.seed_dir, args.period)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+# Columns of the MSE fund export, in export order. The crawler parses, checks
+# and stores them; the app reads them back. crawl-mse.py puts this directory on
+# the crawler's path (as for tracing.py), so both sides share this one copy.
+NAME_COLUMN = 'Name of the open-end investment fund'
+CALCULATION_COLUMN = 'Date of calculation'
+VALUATION_COLUMN = 'Valuation date'
+SALE_PRICE_COLUMN = 'Last daily sale price per unit'
+AVERAGE_PRICE_COLUMN = 'Daily Average sale price per unit'
+BUY_PRICE_COLUMN = 'Daily buying price per unit'
+
+DATE_COLUMNS = [CALCULATION_COLUMN, VALUATION_COLUMN]
+PRICE_COLUMNS = [SALE_PRICE_COLUMN, AVERAGE_PRICE_COLUMN, BUY_PRICE_COLUMN]
+COLUMNS = [NAME_COLUMN] + DATE_COLUMNS + PRICE_COLUMNS
+
+# Dates in the MSE export are month/day/year without zero padding (e.g. 11/3/2014)
+EXPORT_DATE_FORMAT = '%m/%d/%Y'
+# Month partition of the columnar store (crawler/fund_store.py writes it,
+# app/fund_loader.py reads it)
+PARTITION_COLUMN = 'valuation_month'
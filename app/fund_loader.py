@@ -0,0 +1,99 @@
+import os
+
+import pandas as pd
+
+from export_schema import NAME_COLUMN, VALUATION_COLUMN, DATE_COLUMNS, COLUMNS, EXPORT_DATE_FORMAT, PARTITION_COLUMN
+
+STORE_PATH = 'combined_mutual_fund_data'
+CSV_PATH = 'combined_mutual_fund_data.csv'
+# Rows flagged by the crawler's data quality checks (crawler/data_quality.py)
+QUARANTINE_PATH = 'fund_quarantine.csv'
+
+
+def _and(condition, other):
+    return other if condition is None else condition & other
+
+
+def read_store(path=STORE_PATH, funds=None, start=None, end=None, columns=None):
+    # Reader for the month-partitioned store written by crawler/fund_store.py.
+    # Feather partitions are memory-mapped, so only the columns and months that
+    # survive the filters are actually paged in.
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+
+    store_format = 'parquet' if any(name.endswith('.parquet') for _, _, names in os.walk(path) for name in names) else 'ipc'
+    dataset = ds.dataset(
+        str(path),
+        format=store_format,
+        partitioning='hive',
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+    )
+
+    # Month partitions outside the requested range are pruned before any file is opened
+    condition = None
+    if start is not None:
+        start = pd.Timestamp(start)
+        condition = _and(condition, ds.field(PARTITION_COLUMN) >= start.strftime('%Y-%m'))
+        condition = _and(condition, ds.field(VALUATION_COLUMN) >= start)
+    if end is not None:
+        end = pd.Timestamp(end)
+        condition = _and(condition, ds.field(PARTITION_COLUMN) <= end.strftime('%Y-%m'))
+        condition = _and(condition, ds.field(VALUATION_COLUMN) <= end)
+    if funds is not None:
+        condition = _and(condition, ds.field(NAME_COLUMN).isin(list(funds)))
+
+    return dataset.to_table(columns=columns or COLUMNS, filter=condition).to_pandas()
+
+
+def read_csv(path=CSV_PATH, funds=None, start=None, end=None):
+    df = pd.read_csv(path, sep='\t')
+    for column in DATE_COLUMNS:
+        df[column] = pd.to_datetime(df[column], format=EXPORT_DATE_FORMAT)
+    if funds is not None:
+        df = df[df[NAME_COLUMN].isin(list(funds))]
+    if start is not None:
+        df = df[df[VALUATION_COLUMN] >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df[VALUATION_COLUMN] <= pd.Timestamp(end)]
+    return df
+
+
+def load_fund_data(funds=None, start=None, end=None, store_path=STORE_PATH, csv_path=CSV_PATH):
+    # Prefer the typed columnar store, fall back to the tab-separated CSV
+    if os.path.isdir(store_path):
+        try:
+            return read_store(store_path, funds=funds, start=start, end=end)
+        except ImportError:
+            pass
+    return read_csv(csv_path, funds=funds, start=start, end=end)
+
+
+def read_quarantine(path=QUARANTINE_PATH):
+    # One row per flagged (fund, valuation date, check), with the check's action
+    quarantine = pd.read_csv(path, sep='\t')
+    quarantine[VALUATION_COLUMN] = pd.to_datetime(quarantine[VALUATION_COLUMN], format=EXPORT_DATE_FORMAT)
+    return quarantine
+
+
+def exclude_quarantined(df, path=QUARANTINE_PATH, actions=('exclude',)):
+    # Drop the rows quarantined by a check with one of `actions`; returns the
+    # remaining rows and how many were dropped. Without a quarantine file
+    # nothing is dropped.
+    if not os.path.exists(path):
+        return df, 0
+    quarantine = read_quarantine(path)
+    quarantine = quarantine[quarantine['action'].isin(list(actions))]
+    flagged = pd.MultiIndex.from_frame(quarantine[[NAME_COLUMN, VALUATION_COLUMN]])
+    keep = ~pd.MultiIndex.from_arrays([df[NAME_COLUMN].astype(object), df[VALUATION_COLUMN]]).isin(flagged)
+    return df[keep], int((~keep).sum())
+
+
+def export_csv(output_file, funds=None, start=None, end=None, store_path=STORE_PATH):
+    # Write the store back out in the original tab-separated layout
+    df = read_store(store_path, funds=funds, start=start, end=end)
+    df = df.sort_values([VALUATION_COLUMN, NAME_COLUMN], kind='stable')
+    for column in DATE_COLUMNS:
+        dates = df[column].dt
+        df[column] = dates.month.astype(str) + '/' + dates.day.astype(str) + '/' + dates.year.astype(str)
+    df[NAME_COLUMN] = df[NAME_COLUMN].astype(object)
+    df.to_csv(output_file, index=False, sep='\t')
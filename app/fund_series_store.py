@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+from export_schema import AVERAGE_PRICE_COLUMN, BUY_PRICE_COLUMN
+from metrics import FUND_COLUMN, DATE_COLUMN, PRICE_COLUMN
+PRICE_FIELDS = {
+    'sale': PRICE_COLUMN,
+    'average': AVERAGE_PRICE_COLUMN,
+    'buy': BUY_PRICE_COLUMN,
+}
+
+
+class FundSeriesStore:
+    # Prices of every fund on one shared calendar of valuation dates (every date
+    # any fund was valued on; MSE funds also publish weekend valuations).
+    #
+    # Fund names are interned to small integer IDs and each price field is a
+    # C-contiguous float64 (funds x dates) matrix, NaN where a fund has no
+    # valuation, so prices[fund_id] is the fund's whole series as one array and
+    # date ranges are zero-copy slices. A dense day -> calendar position table
+    # makes date lookups O(1).
+
+    def __init__(self, fund_names, calendar, prices):
+        # calendar: sorted datetime64[D] array; prices: {field: (funds x dates) float64}
+        self.fund_names = list(fund_names)
+        self.fund_ids = {name: fund_id for fund_id, name in enumerate(self.fund_names)}
+        self.calendar = np.asarray(calendar, dtype='datetime64[D]')
+        self.prices = {field: np.ascontiguousarray(matrix, dtype=np.float64) for field, matrix in prices.items()}
+
+        # _positions[day - first day] = position of the last calendar date <= day
+        days = self.calendar.astype(np.int64)
+        self._first_day = int(days[0]) if len(days) else 0
+        span = int(days[-1]) - self._first_day + 1 if len(days) else 0
+        marks = np.zeros(span, dtype=np.int32)
+        marks[days - self._first_day] = 1
+        self._positions = np.cumsum(marks, dtype=np.int32) - 1
+        self._exact = marks.astype(bool)
+
+    @classmethod
+    def from_frame(cls, df, fields=PRICE_FIELDS):
+        # df must be sorted by fund, then valuation date. The export occasionally
+        # repeats a fund/valuation date with a different price; the last row of
+        # each pair is the one kept, as with drop_duplicates(keep='last').
+        names = df[FUND_COLUMN].to_numpy()
+        starts = np.flatnonzero(np.r_[True, names[1:] != names[:-1]])
+        row_fund = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(names)]))
+        calendar, date_index = np.unique(df[DATE_COLUMN].to_numpy().astype('datetime64[D]'), return_inverse=True)
+
+        last = np.r_[(row_fund[1:] != row_fund[:-1]) | (date_index[1:] != date_index[:-1]), True]
+        row_fund, date_index = row_fund[last], date_index[last]
+
+        prices = {}
+        for field, column in fields.items():
+            matrix = np.full((len(starts), len(calendar)), np.nan)
+            matrix[row_fund, date_index] = df[column].to_numpy(dtype=np.float64)[last]
+            prices[field] = matrix
+        return cls([str(name) for name in names[starts]], calendar, prices)
+
+    @property
+    def shape(self):
+        return (len(self.fund_names), len(self.calendar))
+
+    @property
+    def nbytes(self):
+        return self.calendar.nbytes + self._positions.nbytes + self._exact.nbytes + \
+            sum(matrix.nbytes for matrix in self.prices.values())
+
+    def fund_id(self, fund):
+        return self.fund_ids[fund]
+
+    def position(self, date, exact=False):
+        # Calendar position of date, or of the last valuation date before it
+        # (exact=True: -1 unless date is itself a valuation date); -1 if before
+        # the calendar starts
+        day = int(np.datetime64(date, 'D').astype(np.int64)) - self._first_day
+        if day < 0:
+            return -1
+        if day >= len(self._positions):
+            return len(self.calendar) - 1 if not exact else -1
+        if exact and not self._exact[day]:
+            return -1
+        return int(self._positions[day])
+
+    def price(self, fund, date, field='sale'):
+        position = self.position(date, exact=True)
+        return self.prices[field][self.fund_ids[fund], position] if position >= 0 else np.nan
+
+    def window(self, start=None, end=None):
+        # Calendar slice covering [start, end]
+        lo = 0 if start is None else self.position(np.datetime64(start, 'D') - np.timedelta64(1, 'D')) + 1
+        hi = len(self.calendar) if end is None else self.position(end) + 1
+        return slice(lo, max(lo, hi))
+
+    def series(self, fund, start=None, end=None, field='sale'):
+        # (dates, prices) views into the store, NaN on dates the fund wasn't valued
+        window = self.window(start, end)
+        return self.calendar[window], self.prices[field][self.fund_ids[fund], window]
+
+    def first_price(self, fund, field='sale'):
+        prices = self.prices[field][self.fund_ids[fund]]
+        valued = np.flatnonzero(~np.isnan(prices))
+        return prices[valued[0]] if len(valued) else np.nan
+
+    def observations(self, field='sale'):
+        # The valued entries flattened fund by fund, i.e. the layout of the frame
+        # sorted by fund and valuation date: (funds, starts, ends, prices, dates)
+        matrix = self.prices[field]
+        valid = ~np.isnan(matrix)
+        counts = valid.sum(axis=1)
+        ends = np.cumsum(counts)
+        fund_index, date_index = np.nonzero(valid)
+        keep = counts > 0
+        return ([name for name, k in zip(self.fund_names, keep) if k], (ends - counts)[keep], ends[keep],
+                matrix[valid], self.calendar[date_index])
+
+    def monthly(self, fund, field='sale'):
+        # Last valuation of every month between the fund's first and last one,
+        # labelled with the month end, as DataFrame.resample('ME').last() does
+        prices = self.prices[field][self.fund_ids[fund]]
+        valued = np.flatnonzero(~np.isnan(prices))
+        if len(valued) == 0:
+            return np.array([], dtype='datetime64[D]'), np.array([])
+        calendar = self.calendar[valued[0]:valued[-1] + 1]
+        prices = prices[valued[0]:valued[-1] + 1]
+
+        months = calendar.astype('datetime64[M]')
+        month_range = np.arange(months[0], months[-1] + 1)
+        # Last calendar position per month that holds a price
+        last_valued = np.maximum.accumulate(np.where(np.isnan(prices), -1, np.arange(len(prices))))
+        month_last = np.searchsorted(months, month_range, side='right') - 1
+        position = last_valued[month_last]
+        in_month = (position >= 0) & (months[np.maximum(position, 0)] == month_range)
+        month_prices = np.where(in_month, prices[np.maximum(position, 0)], np.nan)
+        month_ends = (month_range + 1).astype('datetime64[D]') - np.timedelta64(1, 'D')
+        return month_ends, month_prices
+
+    def to_frame(self, field='sale'):
+        funds, starts, ends, prices, dates = self.observations(field)
+        return pd.DataFrame({
+            FUND_COLUMN: pd.Categorical(np.repeat(funds, ends - starts), categories=funds),
+            DATE_COLUMN: dates.astype('datetime64[ns]'),
+            PRICE_FIELDS[field]: prices,
+        })
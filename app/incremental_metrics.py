@@ -0,0 +1,214 @@
+import os
+import pickle
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from metrics import (DATE_COLUMN, PRICE_COLUMN, RISK_FREE_RATE, TRADING_DAYS,
+                     avg_annual_return, fund_slices, compute_metrics)
+
+STATE_VERSION = 2
+STATE_PATH = 'metrics_state.pkl'
+METRIC_COLUMNS = ['current_price', 'ytd_return', 'five_year_return', 'ten_year_return', 'sharpe_ratio', 'max_drawdown']
+# Window starts tracked per fund: name -> threshold for a given current date
+WINDOWS = {
+    'ytd': lambda current_date: pd.Timestamp(current_date.year, 1, 1),
+    '5y': lambda current_date: current_date - pd.Timedelta(days=5*365),
+    '10y': lambda current_date: current_date - pd.Timedelta(days=10*365),
+}
+
+
+def _empty_fund():
+    return {
+        'rows': 0,
+        'last_date': None,
+        # Fingerprint of the folded rows' prices and dates
+        'digest': None,
+        'first_price': np.nan,
+        'last_price': np.nan,
+        # Running peak and the deepest drawdown below it
+        'peak': np.nan,
+        'max_drawdown': np.nan,
+        # Welford count/mean/sum of squared deviations of daily excess returns
+        'count': 0,
+        'mean': 0.0,
+        'm2': 0.0,
+        # Row offsets (within the fund) of the first valuation inside each window
+        'window_start': {name: 0 for name in WINDOWS},
+    }
+
+
+class MetricsState:
+    # Running per-fund state behind compute_metrics, persisted between analysis
+    # runs so a refresh only has to fold in the rows crawled since the last one:
+    #   {fund: {'rows', 'last_date', 'digest', 'first_price', 'last_price', 'peak',
+    #           'max_drawdown', 'count', 'mean', 'm2', 'window_start'}}
+    # A fund whose folded rows changed (revised prices, back-filled days) is
+    # rebuilt from its own rows: the digest of its folded prices and dates no
+    # longer matches. A periodic full recompute (check_drift) still compares the
+    # state with compute_metrics.
+
+    def __init__(self, path=STATE_PATH, risk_free_rate=RISK_FREE_RATE):
+        self.path = path
+        self.risk_free_rate = risk_free_rate
+        self.funds = {}
+        self.updates_since_check = 0
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable metrics state {self.path}: {e}")
+            return
+        if data.get('version') != STATE_VERSION or data.get('risk_free_rate') != self.risk_free_rate:
+            print(f"Ignoring metrics state {self.path} from a different version or risk-free rate")
+            return
+        self.funds = data['funds']
+        self.updates_since_check = data['updates_since_check']
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                'version': STATE_VERSION,
+                'risk_free_rate': self.risk_free_rate,
+                'updates_since_check': self.updates_since_check,
+                'funds': self.funds,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+    def _fold(self, state, prices, dates):
+        # Fold a batch of new rows (in date order) into a fund's running state
+        previous = np.r_[state['last_price'], prices[:-1]]
+        daily = prices / previous - 1
+        excess = daily - self.risk_free_rate / TRADING_DAYS
+        excess = excess[~np.isnan(excess)]
+
+        # Chan et al. merge of the batch into the running Welford statistics
+        if len(excess):
+            count = state['count'] + len(excess)
+            batch_mean = excess.mean()
+            delta = batch_mean - state['mean']
+            state['m2'] += ((excess - batch_mean) ** 2).sum() + delta ** 2 * state['count'] * len(excess) / count
+            state['mean'] += delta * len(excess) / count
+            state['count'] = count
+
+        peaks = np.fmax.accumulate(np.r_[state['peak'], prices])[1:]
+        state['max_drawdown'] = np.fmin.reduce(np.r_[state['max_drawdown'], prices / peaks - 1])
+        state['peak'] = peaks[-1]
+
+        if state['rows'] == 0:
+            state['first_price'] = prices[0]
+        state['last_price'] = prices[-1]
+        state['last_date'] = dates[-1]
+        state['rows'] += len(prices)
+
+    @staticmethod
+    def _digest(prices, dates):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(prices, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(dates, dtype='datetime64[ns]').view(np.int64).tobytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def _extends(cls, state, fund_prices, fund_dates):
+        # The folded rows are still the fund's first rows (same count, same last
+        # date, same prices and dates) and every remaining row is strictly later
+        rows = state['rows']
+        return 0 < rows <= len(fund_dates) and fund_dates[rows - 1] == state['last_date'] and \
+            (rows == len(fund_dates) or fund_dates[rows] > state['last_date']) and \
+            state['digest'] == cls._digest(fund_prices[:rows], fund_dates[:rows])
+
+    def update(self, df):
+        # df: the full frame sorted by fund and valuation date. Rows after each
+        # fund's last folded date are appended; returns (appended, rebuilt) row counts.
+        funds, starts, ends = fund_slices(df)
+        prices = df[PRICE_COLUMN].to_numpy(dtype=np.float64)
+        dates = df[DATE_COLUMN].to_numpy()
+
+        appended = rebuilt = 0
+        for fund, start, end in zip(funds, starts, ends):
+            state = self.funds.get(fund)
+            if state is not None and self._extends(state, prices[start:end], dates[start:end]):
+                rows = state['rows']
+                appended += int(end - start - rows)
+            else:
+                state = self.funds[fund] = _empty_fund()
+                rows = 0
+                rebuilt += int(end - start)
+            if start + rows < end:
+                self._fold(state, prices[start + rows:end], dates[start + rows:end])
+                state['digest'] = self._digest(prices[start:end], dates[start:end])
+
+        for fund in set(self.funds) - set(funds):
+            del self.funds[fund]
+        self.updates_since_check += 1
+        return appended, rebuilt
+
+    def rebuild(self, df):
+        self.funds = {}
+        self.updates_since_check = 0
+        return self.update(df)
+
+    def metrics(self, df, current_date, benchmark_returns):
+        # The same frame compute_metrics returns, from the running state. df is the
+        # frame passed to update(); window starts only move forward over its dates.
+        funds, starts, ends = fund_slices(df)
+        dates = df[DATE_COLUMN].to_numpy()
+        prices = df[PRICE_COLUMN].to_numpy(dtype=np.float64)
+        current_date = pd.Timestamp(current_date)
+        thresholds = {name: np.datetime64(window(current_date)) for name, window in WINDOWS.items()}
+
+        records = []
+        for fund, start, end in zip(funds, starts, ends):
+            state = self.funds[fund]
+            fund_dates = dates[start:end]
+            window_prices = {}
+            for name, threshold in thresholds.items():
+                offset = state['window_start'][name]
+                if offset > 0 and fund_dates[offset - 1] >= threshold:
+                    # Current date moved back; search again from the start
+                    offset = np.searchsorted(fund_dates[:offset], threshold, side='left')
+                else:
+                    offset += np.searchsorted(fund_dates[offset:], threshold, side='left')
+                state['window_start'][name] = int(offset)
+                window_prices[name] = prices[start + offset] if offset < end - start else np.nan
+
+            current_price = state['last_price']
+            with np.errstate(invalid='ignore', divide='ignore'):
+                std = np.sqrt(state['m2'] / (state['count'] - 1)) if state['count'] > 1 else np.nan
+                sharpe_ratio = np.sqrt(TRADING_DAYS) * state['mean'] / std if state['count'] else np.nan
+            records.append({
+                'fund': fund,
+                'current_price': current_price,
+                'ytd_return': current_price / window_prices['ytd'] - 1,
+                'five_year_return': avg_annual_return(window_prices['5y'], current_price, 5),
+                'ten_year_return': avg_annual_return(window_prices['10y'], current_price, 10),
+                'sharpe_ratio': sharpe_ratio,
+                'max_drawdown': state['max_drawdown'],
+            })
+
+        metrics_df = pd.DataFrame(records, columns=['fund'] + METRIC_COLUMNS)
+        sp500_ytd_return, sp500_5y_return, sp500_10y_return = benchmark_returns
+        metrics_df['ytd_vs_sp500'] = metrics_df['ytd_return'] - sp500_ytd_return
+        metrics_df['five_year_vs_sp500'] = metrics_df['five_year_return'] - sp500_5y_return
+        metrics_df['ten_year_vs_sp500'] = metrics_df['ten_year_return'] - sp500_10y_return
+        return metrics_df
+
+    def check_drift(self, df, current_date, benchmark_returns, returns=None):
+        # Full recompute to compare against the running state. Returns the full
+        # metrics and the largest absolute difference per metric; the state is
+        # rebuilt from scratch afterwards.
+        full = compute_metrics(df, current_date, benchmark_returns, self.risk_free_rate, returns=returns)
+        incremental = self.metrics(df, current_date, benchmark_returns)
+        difference = (full[METRIC_COLUMNS] - incremental[METRIC_COLUMNS]).abs()
+        # Both NaN is agreement; NaN on one side only is a mismatch
+        mismatched = full[METRIC_COLUMNS].isna() != incremental[METRIC_COLUMNS].isna()
+        drift = difference.where(~mismatched, np.inf).max().fillna(0.0).to_dict()
+        self.rebuild(df)
+        return full, drift
@@ -0,0 +1,140 @@
+import os
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+from metrics import DATE_COLUMN, PRICE_COLUMN
+
+INDEX_FILENAME = 'fund_index.js'
+SERIES_DIR = 'funds'
+
+# MSE prices are published with four decimals, so this scale is lossless for them
+PRICE_SCALE = 10000
+RETURN_SCALE = 1000000
+_EPOCH = np.datetime64('1970-01-01', 'D')
+
+# Chart resolutions, as pandas resample rules (None keeps every valuation)
+RESOLUTIONS = {'daily': None, 'weekly': 'W', 'monthly': 'ME'}
+# Pyramid levels written to their own file, funds/<level>/<fund>.js, and loaded
+# only when a chart zooms in far enough; the rest share the fund's base file
+SEPARATE_LEVELS = ['daily']
+SUMMARY_SIZE = 5
+
+
+def series_filename(fund):
+    # Same naming as the per-fund *_returns.csv files in output/
+    return f"{fund.replace(' ', '_')}.js"
+
+
+def _delta_encode(values, scale):
+    # Fixed-point integers, each stored as the difference to the previous
+    # non-missing value; missing values stay null
+    encoded = []
+    previous = 0
+    for value in values:
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            encoded.append(None)
+            continue
+        current = int(round(value * scale))
+        encoded.append(current - previous)
+        previous = current
+    return encoded
+
+
+def encode_series(dates, prices, returns):
+    days = (pd.to_datetime(pd.Index(dates)).to_numpy().astype('datetime64[D]') - _EPOCH).astype(np.int64)
+    return {
+        'start': int(days[0]) if len(days) else 0,
+        'dateDeltas': np.diff(days).tolist(),
+        'priceScale': PRICE_SCALE,
+        'prices': _delta_encode(prices, PRICE_SCALE),
+        'returnScale': RETURN_SCALE,
+        'returns': _delta_encode(returns, RETURN_SCALE),
+    }
+
+
+def resample_series(fund_data, resolution='monthly'):
+    # fund_data: one fund's rows with the valuation date, the sale price and 'Cumulative Return'
+    rule = RESOLUTIONS[resolution]
+    if rule is None:
+        sampled = fund_data.set_index(DATE_COLUMN)
+    else:
+        sampled = fund_data.resample(rule, on=DATE_COLUMN).last()
+    return {
+        'dates': sampled.index.strftime('%Y-%m-%d').tolist(),
+        'prices': sampled[PRICE_COLUMN].tolist(),
+        'returns': sampled['Cumulative Return'].tolist()
+    }
+
+
+def index_data(metrics_df, sp500, benchmarks, n=SUMMARY_SIZE):
+    # Everything app.html needs for first paint: fund list, metrics, top/bottom
+    # tables by 5-year, 10-year and YTD return, and benchmark returns
+    return {
+        'fundList': metrics_df['fund'].tolist(),
+        'fundMetrics': metrics_df.to_dict('records'),
+        'top5Year': metrics_df.nlargest(n, 'five_year_return')[['fund', 'five_year_return']].to_dict('records'),
+        'top10Year': metrics_df.nlargest(n, 'ten_year_return')[['fund', 'ten_year_return']].to_dict('records'),
+        'topYTD': metrics_df.nlargest(n, 'ytd_return')[['fund', 'ytd_return']].to_dict('records'),
+        'bottom5Year': metrics_df.nsmallest(n, 'five_year_return')[['fund', 'five_year_return']].to_dict('records'),
+        'bottom10Year': metrics_df.nsmallest(n, 'ten_year_return')[['fund', 'ten_year_return']].to_dict('records'),
+        'bottomYTD': metrics_df.nsmallest(n, 'ytd_return')[['fund', 'ytd_return']].to_dict('records'),
+        'sp500': {
+            'ytd_return': sp500['ytd_return'],
+            '5y_return': sp500['5y_return'],
+            '10y_return': sp500['10y_return']
+        },
+        'benchmarks': benchmarks
+    }
+
+
+def series_script(fund, levels):
+    # levels: {level: {'dates', 'prices', 'returns'}}
+    encoded = {level: encode_series(data['dates'], data['prices'], data['returns']) for level, data in levels.items()}
+    return ''.join([
+        'registerFundSeries(',
+        json.dumps(fund),
+        ', ',
+        json.dumps(encoded, separators=(',', ':')),
+        ');',
+    ])
+
+
+def index_script(js_data, series_files):
+    return 'const fundData = ' + json.dumps(dict(js_data, seriesFiles=series_files)) + ';'
+
+
+def level_files(fund, levels, output_dir='output'):
+    # {level: path of the script holding it}, as app.html resolves them
+    base = f"{output_dir}/{SERIES_DIR}/{series_filename(fund)}"
+    return {level: f"{output_dir}/{SERIES_DIR}/{level}/{series_filename(fund)}" if level in SEPARATE_LEVELS else base
+            for level in levels}
+
+
+def write_chunked_output(js_data, series, output_dir='output'):
+    # js_data: everything app.html needs for first paint (fund list, metrics,
+    #          top/bottom tables, benchmarks)
+    # series:  {fund: {level: {'dates', 'prices', 'returns'}}} (series_pyramid),
+    #          written per fund and loaded by app.html only when that fund is
+    #          selected; SEPARATE_LEVELS only when a chart zooms in to them
+    series_dir = os.path.join(output_dir, SERIES_DIR)
+    os.makedirs(series_dir, exist_ok=True)
+    for level in SEPARATE_LEVELS:
+        os.makedirs(os.path.join(series_dir, level), exist_ok=True)
+
+    series_files = {}
+    for fund, levels in series.items():
+        filename = series_filename(fund)
+        series_files[fund] = level_files(fund, levels, output_dir)
+        base = {level: data for level, data in levels.items() if level not in SEPARATE_LEVELS}
+        with open(os.path.join(series_dir, filename), 'w') as f:
+            f.write(series_script(fund, base))
+        for level in SEPARATE_LEVELS:
+            if level in levels:
+                with open(os.path.join(series_dir, level, filename), 'w') as f:
+                    f.write(series_script(fund, {level: levels[level]}))
+
+    with open(os.path.join(output_dir, INDEX_FILENAME), 'w') as f:
+        f.write(index_script(js_data, series_files))
@@ -0,0 +1,149 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from export_schema import NAME_COLUMN, VALUATION_COLUMN, SALE_PRICE_COLUMN
+
+FUND_COLUMN = NAME_COLUMN
+DATE_COLUMN = VALUATION_COLUMN
+PRICE_COLUMN = SALE_PRICE_COLUMN
+
+RISK_FREE_RATE = 0.02
+TRADING_DAYS = 252
+
+# Funds are laid out as contiguous slices of the sorted frame; the fund index is
+# packed above the valuation time (in seconds) so one searchsorted over the
+# whole frame finds window starts for every fund at once
+_FUND_SHIFT = 34
+
+
+# Per-row arrays aligned with the sorted frame
+ReturnSeries = namedtuple('ReturnSeries', ['daily', 'cumulative', 'peak', 'drawdown'])
+
+
+def avg_annual_return(start_price, end_price, years):
+    total_return = (end_price / start_price) - 1
+    return (1 + total_return) ** (1 / years) - 1
+
+
+def fund_slices(df):
+    # df must be sorted by fund, then valuation date.
+    # Returns fund names plus start/end row offsets of each fund's slice.
+    names = df[FUND_COLUMN].to_numpy()
+    starts = np.flatnonzero(np.r_[True, names[1:] != names[:-1]])
+    ends = np.r_[starts[1:], len(names)]
+    return [str(name) for name in names[starts]], starts, ends
+
+
+def grouped_cummax(values, starts, sizes):
+    # Running maximum that restarts at every fund boundary, without a per-group
+    # apply. Values are replaced by their global rank and each fund's ranks are
+    # lifted by fund_index * n, so a single maximum.accumulate over the integers
+    # can never carry a peak across funds. Missing values never become a peak.
+    n = len(values)
+    if n == 0:
+        return values.copy()
+    order = np.argsort(np.where(np.isnan(values), -np.inf, values), kind='stable')
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = np.arange(n, dtype=np.int64)
+    lift = np.repeat(np.arange(len(starts), dtype=np.int64) * n, sizes)
+    peak_ranks = np.maximum.accumulate(ranks + lift) - lift
+    return values[order[peak_ranks]]
+
+
+def return_series(prices, starts, ends):
+    # Daily return, cumulative return since each fund's first valuation and the
+    # running peak/drawdown for every fund in one pass over the sorted prices
+    prices = np.asarray(prices, dtype=np.float64)
+    sizes = ends - starts
+
+    daily = np.empty_like(prices)
+    daily[1:] = prices[1:] / prices[:-1] - 1
+    daily[starts] = np.nan
+
+    # Relative to the first price rather than a compounded product, so the first
+    # row is 0 instead of NaN and there's no accumulated rounding
+    cumulative = prices / np.repeat(prices[starts], sizes) - 1
+
+    peak = grouped_cummax(prices, starts, sizes)
+    drawdown = prices / peak - 1
+    return ReturnSeries(daily, cumulative, peak, drawdown)
+
+
+def _window_start_index(keys, fund_ids, ends, threshold):
+    # First row of each fund with valuation date >= threshold, or -1 if none
+    threshold = np.datetime64(threshold, 's').astype(np.int64)
+    idx = np.searchsorted(keys, (fund_ids << _FUND_SHIFT) + threshold, side='left')
+    return np.where(idx < ends, idx, -1)
+
+
+def _window_return(prices, start_idx, current_price, years=None):
+    start_price = np.where(start_idx >= 0, prices[np.maximum(start_idx, 0)], np.nan)
+    if years is None:
+        return (current_price / start_price) - 1
+    return avg_annual_return(start_price, current_price, years)
+
+
+def compute_metrics(df, current_date, benchmark_returns, risk_free_rate=RISK_FREE_RATE, returns=None):
+    # One pass over the frame sorted by fund/valuation date, replacing the per-fund
+    # boolean masks. benchmark_returns is (ytd, 5y, 10y) of the comparison index;
+    # returns is the frame's return_series, computed here if not supplied.
+    funds, starts, ends = fund_slices(df)
+    return metrics_from_arrays(funds, starts, ends, df[PRICE_COLUMN].to_numpy(dtype=np.float64),
+                               df[DATE_COLUMN].to_numpy(), current_date, benchmark_returns, risk_free_rate, returns)
+
+
+def metrics_from_arrays(funds, starts, ends, prices, dates, current_date, benchmark_returns,
+                        risk_free_rate=RISK_FREE_RATE, returns=None):
+    # compute_metrics on plain arrays laid out fund by fund in date order, e.g.
+    # FundSeriesStore.observations()
+    n_funds = len(funds)
+    sizes = ends - starts
+    fund_ids = np.arange(n_funds, dtype=np.int64)
+    row_fund = np.repeat(fund_ids, sizes)
+
+    prices = np.asarray(prices, dtype=np.float64)
+    seconds = np.asarray(dates).astype('datetime64[s]').astype(np.int64)
+    keys = (row_fund << _FUND_SHIFT) + seconds
+
+    current_price = prices[ends - 1]
+    if returns is None:
+        returns = return_series(prices, starts, ends)
+
+    # Window start prices for YTD / 5y / 10y
+    current_date = pd.Timestamp(current_date)
+    ytd_idx = _window_start_index(keys, fund_ids, ends, pd.Timestamp(current_date.year, 1, 1))
+    five_idx = _window_start_index(keys, fund_ids, ends, current_date - pd.Timedelta(days=5*365))
+    ten_idx = _window_start_index(keys, fund_ids, ends, current_date - pd.Timedelta(days=10*365))
+    ytd_return = _window_return(prices, ytd_idx, current_price)
+    five_year_return = _window_return(prices, five_idx, current_price, 5)
+    ten_year_return = _window_return(prices, ten_idx, current_price, 10)
+
+    # Sharpe ratio of daily excess returns (sample std, NaNs skipped)
+    excess = returns.daily - risk_free_rate / TRADING_DAYS
+    valid = ~np.isnan(excess)
+    counts = np.add.reduceat(valid.astype(np.int64), starts)
+    sums = np.add.reduceat(np.where(valid, excess, 0.0), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sums / counts
+        deviations = np.where(valid, excess - np.repeat(mean, sizes), 0.0)
+        std = np.sqrt(np.add.reduceat(deviations ** 2, starts) / (counts - 1))
+        sharpe_ratio = np.sqrt(TRADING_DAYS) * mean / std
+
+    # Maximum drawdown, measured from each fund's first valuation
+    max_drawdown = np.fmin.reduceat(returns.drawdown, starts)
+
+    sp500_ytd_return, sp500_5y_return, sp500_10y_return = benchmark_returns
+    return pd.DataFrame({
+        'fund': funds,
+        'current_price': current_price,
+        'ytd_return': ytd_return,
+        'five_year_return': five_year_return,
+        'ten_year_return': ten_year_return,
+        'sharpe_ratio': sharpe_ratio,
+        'max_drawdown': max_drawdown,
+        'ytd_vs_sp500': ytd_return - sp500_ytd_return,
+        'five_year_vs_sp500': five_year_return - sp500_5y_return,
+        'ten_year_vs_sp500': ten_year_return - sp500_10y_return,
+    })
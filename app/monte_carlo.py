@@ -0,0 +1,214 @@
+import os
+import zlib
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from fund_loader import load_fund_data, exclude_quarantined
+from metrics import FUND_COLUMN, DATE_COLUMN, PRICE_COLUMN, fund_slices, return_series
+
+# Forward-looking outcomes from block-bootstrapped daily returns: every path is
+# a sequence of BLOCK_LENGTH-return blocks drawn (circularly) from the fund's own
+# history, so short-term autocorrelation and volatility clustering survive the
+# resampling. Horizons are in years; steps per year follow the fund's observed
+# valuation frequency (MSE funds also publish weekend valuations).
+#
+# A separate step from analysis.py (tens of seconds at the default paths, too
+# slow for every refresh):
+#
+#   python monte_carlo.py                      # writes output/monte_carlo.csv
+HORIZONS = {'1y': 1, '5y': 5, '10y': 10}
+PATHS = 20000
+BLOCK_LENGTH = 20
+SEED = 20241006
+# Working memory per worker for the path arrays; paths are simulated in chunks
+# that fit it
+MEMORY_BUDGET_MB = 256
+# Per path and block: the eight 8-byte buffers simulate_paths fills in place
+# (uniforms/peak before, starts, four block statistics, entry, peak after)
+BYTES_PER_BLOCK = 64
+# Funds with a shorter history aren't projected
+MIN_RETURNS = 252
+PERCENTILES = [5, 25, 50, 75, 95]
+MONTE_CARLO_PATH = 'output/monte_carlo.csv'
+COLUMNS = ['fund', 'horizon', 'paths', 'history_returns'] + \
+    [f"return_p{p:02d}" for p in PERCENTILES] + \
+    ['return_mean', 'loss_probability', 'max_drawdown_p50', 'max_drawdown_p05']
+
+
+def steps_per_year(dates):
+    # Valuations per year over the fund's history
+    days = (dates[-1] - dates[0]).astype('timedelta64[D]').astype(np.int64)
+    return (len(dates) - 1) / (days / 365.25) if days > 0 else np.nan
+
+
+def chunk_paths(blocks, memory_budget_mb=MEMORY_BUDGET_MB):
+    return max(1, int(memory_budget_mb * 2 ** 20 // (blocks * BYTES_PER_BLOCK)))
+
+
+def block_stats(log_returns, length):
+    # For a block of `length` returns starting at each position (wrapping around
+    # the history): its total log growth, the highest and lowest point of its
+    # cumulative path and the deepest drawdown within it
+    n = len(log_returns)
+    cumulative = np.r_[0.0, np.cumsum(np.r_[log_returns, log_returns[:length]])]
+    starts = np.arange(n)[:, None]
+    path = cumulative[starts + 1 + np.arange(length)] - cumulative[starts]
+    drawdown = (path - np.maximum.accumulate(path, axis=1)).min(axis=1)
+    return path[:, -1], path.max(axis=1), path.min(axis=1), drawdown
+
+
+def simulate_paths(log_returns, horizon_steps, paths, rng, block_length=BLOCK_LENGTH,
+                   memory_budget_mb=MEMORY_BUDGET_MB):
+    # Terminal log growth and maximum log drawdown at each of horizon_steps
+    # (ascending), as (paths x horizons) arrays. Paths share one draw stream of
+    # uniforms, one row per path, so results don't depend on the chunk size.
+    #
+    # A path is a chain of blocks, so it is simulated per block rather than per
+    # step: with each possible block's statistics precomputed, the wealth entering
+    # a block is a cumulative sum of block totals, the running peak a cumulative
+    # maximum, and the drawdown inside a block is the lower of its own internal
+    # drawdown and its lowest point measured from the peak it entered with.
+    n = len(log_returns)
+    steps = int(horizon_steps[-1])
+    blocks = -(-steps // block_length)
+    full = block_stats(log_returns, block_length)
+    # Horizons ending part-way into a block need that block's stats up to there
+    partial = {}
+    for h in horizon_steps:
+        length = (int(h) - 1) % block_length + 1
+        if length not in partial:
+            partial[length] = full if length == block_length else block_stats(log_returns, length)
+
+    growth = np.empty((paths, len(horizon_steps)))
+    drawdown = np.empty((paths, len(horizon_steps)))
+    chunk = min(chunk_paths(blocks, memory_budget_mb), paths)
+    # Every chunk reuses the same buffers, computed into in place, so the
+    # working set stays at BYTES_PER_BLOCK per path and block. Buffers are
+    # reused once their contents are dead: the uniforms hold the peak before
+    # each block, the highest points the drawdown so far.
+    uniforms = np.empty((chunk, blocks))
+    starts = np.empty((chunk, blocks), dtype=np.int64)
+    total, highest, lowest, inner, entry, peak_after = (np.empty((chunk, blocks)) for _ in range(6))
+    for lo in range(0, paths, chunk):
+        hi = min(lo + chunk, paths)
+        u, at_start = uniforms[:hi - lo], starts[:hi - lo]
+        rng.random(out=u)
+        np.multiply(u, n, out=u)
+        # Truncating cast, as astype(np.int64)
+        at_start[...] = u
+        stats = [buffer[:hi - lo] for buffer in (total, highest, lowest, inner)]
+        for stat, buffer in zip(full, stats):
+            # Starts are always in range; the default mode='raise' would buffer the output
+            np.take(stat, at_start, out=buffer, mode='clip')
+        block_total, block_highest, block_lowest, block_inner = stats
+
+        block_entry = entry[:hi - lo]
+        np.cumsum(block_total, axis=1, out=block_entry)
+        block_entry -= block_total
+        # Peak before each block; the starting wealth (0) counts as a peak
+        block_peak_after = peak_after[:hi - lo]
+        np.add(block_entry, block_highest, out=block_peak_after)
+        np.maximum(block_peak_after, 0.0, out=block_peak_after)
+        np.maximum.accumulate(block_peak_after, axis=1, out=block_peak_after)
+        peak_before = u
+        peak_before[:, 0] = 0.0
+        peak_before[:, 1:] = block_peak_after[:, :-1]
+        block_drawdown = block_highest
+        np.add(block_entry, block_lowest, out=block_drawdown)
+        block_drawdown -= peak_before
+        np.minimum(block_drawdown, block_inner, out=block_drawdown)
+        np.minimum.accumulate(block_drawdown, axis=1, out=block_drawdown)
+
+        rows = np.arange(hi - lo)
+        for i, h in enumerate(horizon_steps):
+            block = (int(h) - 1) // block_length
+            stat_total, _, stat_lowest, stat_inner = partial[(int(h) - 1) % block_length + 1]
+            at = at_start[:, block]
+            growth[lo:hi, i] = block_entry[rows, block] + stat_total[at]
+            within = np.minimum(block_entry[rows, block] + stat_lowest[at] - peak_before[rows, block], stat_inner[at])
+            drawdown[lo:hi, i] = np.minimum(within, block_drawdown[rows, block - 1]) if block else np.minimum(within, 0.0)
+    return growth, drawdown
+
+
+def _fund_seed(seed, fund):
+    # Per-fund stream, stable across runs, worker counts and fund order
+    return [seed, zlib.crc32(fund.encode('utf-8'))]
+
+
+def simulate_fund(task):
+    # One fund's rows of the results table (runs in a worker process)
+    fund, returns, dates, paths, horizons, seed, block_length, memory_budget_mb = task
+    valid = ~np.isnan(returns)
+    history = returns[valid]
+    per_year = steps_per_year(dates)
+    if len(history) < MIN_RETURNS or not np.isfinite(per_year):
+        return []
+    horizon_steps = [max(1, int(round(years * per_year))) for years in horizons.values()]
+
+    rng = np.random.default_rng(_fund_seed(seed, fund))
+    growth, drawdown = simulate_paths(np.log1p(history), horizon_steps, paths, rng, block_length, memory_budget_mb)
+    total_returns = np.expm1(growth)
+    max_drawdowns = np.expm1(drawdown)
+
+    rows = []
+    for i, horizon in enumerate(horizons):
+        quantiles = np.percentile(total_returns[:, i], PERCENTILES)
+        rows.append([fund, horizon, paths, len(history)] + quantiles.tolist() + [
+            total_returns[:, i].mean(),
+            (total_returns[:, i] < 0).mean(),
+            np.percentile(max_drawdowns[:, i], 50),
+            np.percentile(max_drawdowns[:, i], 5),
+        ])
+    return rows
+
+
+def run_monte_carlo(funds, starts, ends, daily_returns, dates, paths=PATHS, horizons=HORIZONS, seed=SEED,
+                    block_length=BLOCK_LENGTH, memory_budget_mb=MEMORY_BUDGET_MB, parallel=True, max_workers=None):
+    # Block-bootstrap outcomes for every fund, laid out as in metrics_from_arrays
+    # (daily_returns: return_series(...).daily). Funds are spread over a process
+    # pool; each worker keeps within memory_budget_mb. Returns one row per fund
+    # and horizon: total return percentiles, mean, probability of a loss and the
+    # median and 5th percentile (worst 5%) maximum drawdown within the horizon.
+    dates = np.asarray(dates).astype('datetime64[D]')
+    tasks = [(fund, daily_returns[start:end], dates[start:end], paths, horizons, seed, block_length, memory_budget_mb)
+             for fund, start, end in zip(funds, starts, ends)]
+    max_workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+    # Only forked workers: spawned ones would re-import the calling script, and
+    # callers such as the crawler's in-process analysis have no __main__ guard
+    if parallel and max_workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            results = list(executor.map(simulate_fund, tasks))
+    else:
+        results = [simulate_fund(task) for task in tasks]
+
+    skipped = sum(1 for rows in results if not rows)
+    if skipped:
+        print(f"Monte Carlo: skipped {skipped} funds with fewer than {MIN_RETURNS} daily returns")
+    return pd.DataFrame([row for rows in results for row in rows], columns=COLUMNS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Block-bootstrap projections of every fund's 1/5/10-year outcomes")
+    parser.add_argument('--paths', type=int, default=PATHS, help="simulated paths per fund")
+    parser.add_argument('--output', default=MONTE_CARLO_PATH)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    # The rows analysis.py uses: the whole dataset less the quarantined ones
+    df, _ = exclude_quarantined(load_fund_data())
+    df = df.sort_values([FUND_COLUMN, DATE_COLUMN])
+    funds, starts, ends = fund_slices(df)
+    returns = return_series(df[PRICE_COLUMN].to_numpy(), starts, ends)
+    results = run_monte_carlo(funds, starts, ends, returns.daily, df[DATE_COLUMN].to_numpy(), paths=args.paths,
+                              max_workers=args.workers)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    results.to_csv(args.output, index=False)
+    print(f"Monte Carlo projections for {results['fund'].nunique()} funds written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
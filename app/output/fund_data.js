@@ -1 +0,0 @@
-const fundData = {"fundList": ["Grawe Flex Bond Eur", "Grawe Global", "Innovo Status Balansiran", "Innovo Status Solar", "KB Invest - Akcii", "KB Invest - Balanced", "KB Invest - Bonds", "KB Invest - MBI 10", "KB Invest - Zlaten Fond", "KB Invest Paricen", "NLB Amerika", "NLB BRIK", "NLB Cash Deposit", "NLB Cash Fund", "NLB Global Emerging Markets", "NLB South-East Europe", "NLB Top Brands", "VEGA CASH", "VEGA FINANCE", "VEGA TECHNOLOGY", "VEGA WORLD", "WVP BOND", "WVP Cash Deposit", "WVP Dividend Akcii", "WVP Etiks Akcii", "WVP Premium Akcii"], "fundMetrics": [{"fund": "Grawe Flex Bond Eur", "current_price": 111.2406, "ytd_return": 0.04090713013795422, "five_year_return": 0.02154015825082478, "ten_year_return": 0.010712698174325297, "sharpe_ratio": 1.127030291148486, "max_drawdown": -0.03638035828534858, "ytd_vs_sp500": -0.15945106487201155, "five_year_vs_sp500": -0.15967573834689164, "ten_year_vs_sp500": -0.10326398225786759}, {"fund": "Grawe Global", "current_price": 160.4456, "ytd_return": 0.15764706561430564, "five_year_return": 0.09457071973381548, "ten_year_return": 0.04843521155136088, "sharpe_ratio": 0.3663719651792872, "max_drawdown": -0.3190898398156704, "ytd_vs_sp500": -0.04271112939566013, "five_year_vs_sp500": -0.08664517686390094, "ten_year_vs_sp500": -0.06554146888083201}, {"fund": "Innovo Status Balansiran", "current_price": 42.2005, "ytd_return": 0.12611843316619664, "five_year_return": 0.030523809583167916, "ten_year_return": 0.038131674620946576, "sharpe_ratio": 0.17258125145285616, "max_drawdown": -0.1184934416868958, "ytd_vs_sp500": -0.07423976184376913, "five_year_vs_sp500": -0.1506920870145485, "ten_year_vs_sp500": -0.07584500581124631}, {"fund": "Innovo Status Solar", "current_price": 57.6842, "ytd_return": -0.24290306111065174, "five_year_return": -0.10419934679738907, "ten_year_return": -0.053532539807833124, "sharpe_ratio": -0.8453329292337952, "max_drawdown": -0.4834656556776711, "ytd_vs_sp500": -0.4432612561206175, "five_year_vs_sp500": -0.2854152433951055, "ten_year_vs_sp500": -0.167509220240026}, {"fund": "KB Invest - Akcii", "current_price": 115.8008, "ytd_return": 0.12021096193340486, "five_year_return": 0.029759889474844536, "ten_year_return": 0.01477085564911862, "sharpe_ratio": 0.1380114820155913, "max_drawdown": -0.17026132924554271, "ytd_vs_sp500": -0.08014723307656091, "five_year_vs_sp500": -0.15145600712287188, "ten_year_vs_sp500": -0.09920582478307427}, {"fund": "KB Invest - Balanced", "current_price": 217.6559, "ytd_return": 0.14904866206637335, "five_year_return": 0.057873182159325465, "ten_year_return": 0.07097777547216544, "sharpe_ratio": 0.6058863621928993, "max_drawdown": -0.16259482614948717, "ytd_vs_sp500": -0.05130953294359242, "five_year_vs_sp500": -0.12334271443839095, "ten_year_vs_sp500": -0.04299890496002745}, {"fund": "KB Invest - Bonds", "current_price": 151.3054, "ytd_return": 0.04422511668609408, "five_year_return": -0.0025649822092852492, "ten_year_return": 0.023270305709358396, "sharpe_ratio": -0.08523446853492626, "max_drawdown": -0.21927587454568365, "ytd_vs_sp500": -0.1561330783238717, "five_year_vs_sp500": -0.18378087880700167, "ten_year_vs_sp500": -0.09070637472283449}, {"fund": "KB Invest - MBI 10", "current_price": 368.6643, "ytd_return": 0.40476722121034325, "five_year_return": 0.14996839724442568, "ten_year_return": 0.13936561425111926, "sharpe_ratio": 1.0725969681419396, "max_drawdown": -0.3320268396384295, "ytd_vs_sp500": 0.20440902620037749, "five_year_vs_sp500": -0.031247499353290742, "ten_year_vs_sp500": 0.025388933818926374}, {"fund": "KB Invest - Zlaten Fond", "current_price": 106.6597, "ytd_return": 0.25225067625953335, "five_year_return": 0.012963549423750553, "ten_year_return": 0.0064609030775864, "sharpe_ratio": 0.07760900498698134, "max_drawdown": -0.3878052865234195, "ytd_vs_sp500": 0.05189248124956758, "five_year_vs_sp500": -0.16825234717396587, "ten_year_vs_sp500": -0.10751577735460649}, {"fund": "KB Invest Paricen", "current_price": 139.5358, "ytd_return": 0.018853073080118854, "five_year_return": 0.018593728604229254, "ten_year_return": 0.02218310005102264, "sharpe_ratio": -4.893009381847238, "max_drawdown": -0.0013418921582050158, "ytd_vs_sp500": -0.1815051219298469, "five_year_vs_sp500": -0.16262216799348717, "ten_year_vs_sp500": -0.09179358038117025}, {"fund": "NLB Amerika", "current_price": 164.0657, "ytd_return": 0.17237015483380436, "five_year_return": 0.06417199810114327, "ten_year_return": 0.03638359704830041, "sharpe_ratio": 0.10920659346309694, "max_drawdown": -0.2521581645681509, "ytd_vs_sp500": -0.02798804017616141, "five_year_vs_sp500": -0.11704389849657315, "ten_year_vs_sp500": -0.07759308338389248}, {"fund": "NLB BRIK", "current_price": 167.22, "ytd_return": 0.19174629102641116, "five_year_return": 0.008095228323262038, "ten_year_return": 0.016769468042022728, "sharpe_ratio": 0.010597172712056112, "max_drawdown": -0.33323639156850915, "ytd_vs_sp500": -0.008611903983554603, "five_year_vs_sp500": -0.17312066827445438, "ten_year_vs_sp500": -0.09720721239017016}, {"fund": "NLB Cash Deposit", "current_price": 131.329, "ytd_return": 0.0174713865467766, "five_year_return": 0.016894904082980222, "ten_year_return": 0.01936737950748424, "sharpe_ratio": -12.208504910211685, "max_drawdown": -0.0008167061967385703, "ytd_vs_sp500": -0.18288680846318917, "five_year_vs_sp500": -0.1643209925147362, "ten_year_vs_sp500": -0.09460930092470865}, {"fund": "NLB Cash Fund", "current_price": 1230.8199, "ytd_return": NaN, "five_year_return": 0.007349726854597005, "ten_year_return": 0.014332126568335601, "sharpe_ratio": -6.256270843061085, "max_drawdown": -0.001568040144478311, "ytd_vs_sp500": NaN, "five_year_vs_sp500": -0.17386616974311941, "ten_year_vs_sp500": -0.09964455386385729}, {"fund": "NLB Global Emerging Markets", "current_price": 74.7264, "ytd_return": NaN, "five_year_return": 0.00406975423591982, "ten_year_return": 0.0431410718571037, "sharpe_ratio": 0.21616668622350388, "max_drawdown": -0.20906932478960383, "ytd_vs_sp500": NaN, "five_year_vs_sp500": -0.1771461423617966, "ten_year_vs_sp500": -0.07083560857508919}, {"fund": "NLB South-East Europe", "current_price": 61.5056, "ytd_return": NaN, "five_year_return": 0.00832482227055853, "ten_year_return": 0.036082148921761314, "sharpe_ratio": 0.21615855281374094, "max_drawdown": -0.2742563421580565, "ytd_vs_sp500": NaN, "five_year_vs_sp500": -0.1728910743271579, "ten_year_vs_sp500": -0.07789453151043157}, {"fund": "NLB Top Brands", "current_price": 174.7948, "ytd_return": 0.11706956073831032, "five_year_return": 0.057780094536207915, "ten_year_return": 0.057160969237791015, "sharpe_ratio": 0.2376646050590947, "max_drawdown": -0.18980660116072434, "ytd_vs_sp500": -0.08328863427165545, "five_year_vs_sp500": -0.1234358020615085, "ten_year_vs_sp500": -0.056815711194401874}, {"fund": "VEGA CASH", "current_price": 106.133, "ytd_return": 0.022357723577235644, "five_year_return": 0.011975709109641741, "ten_year_return": 0.0059700339024229, "sharpe_ratio": -9.345790430069096, "max_drawdown": -0.00019419665844455647, "ytd_vs_sp500": -0.17800047143273012, "five_year_vs_sp500": -0.16924018748807468, "ten_year_vs_sp500": -0.10800664652976999}, {"fund": "VEGA FINANCE", "current_price": 127.3673, "ytd_return": 0.11538532269971524, "five_year_return": 0.0495704344998007, "ten_year_return": 0.024485448652054043, "sharpe_ratio": 0.4011896520915462, "max_drawdown": -0.18614217206281936, "ytd_vs_sp500": -0.08497287231025052, "five_year_vs_sp500": -0.13164546209791572, "ten_year_vs_sp500": -0.08949123178013885}, {"fund": "VEGA TECHNOLOGY", "current_price": 153.9704, "ytd_return": 0.2601859377135669, "five_year_return": 0.09015298328664789, "ten_year_return": 0.04410391402707026, "sharpe_ratio": 0.5223184432247858, "max_drawdown": -0.26616175304303336, "ytd_vs_sp500": 0.05982774270360114, "five_year_vs_sp500": -0.09106291331106853, "ten_year_vs_sp500": -0.06987276640512263}, {"fund": "VEGA WORLD", "current_price": 106.8354, "ytd_return": 0.059394699030300924, "five_year_return": 0.013311650773640604, "ten_year_return": 0.0066338215923607, "sharpe_ratio": 0.057759076775409236, "max_drawdown": -0.18004064950354304, "ytd_vs_sp500": -0.14096349597966484, "five_year_vs_sp500": -0.16790424582407582, "ten_year_vs_sp500": -0.10734285883983219}, {"fund": "WVP BOND", "current_price": 122.2868, "ytd_return": 0.04183908281001458, "five_year_return": 0.01657510447155519, "ten_year_return": 0.0203236612938138, "sharpe_ratio": -0.034688278675881444, "max_drawdown": -0.09752017692216375, "ytd_vs_sp500": -0.15851911219995118, "five_year_vs_sp500": -0.16464079212616123, "ten_year_vs_sp500": -0.09365301913837909}, {"fund": "WVP Cash Deposit", "current_price": 119.2574, "ytd_return": 0.018754164459859002, "five_year_return": 0.015606615174013738, "ten_year_return": 0.017754877061214147, "sharpe_ratio": -0.052246044560703926, "max_drawdown": -0.19529220271073977, "ytd_vs_sp500": -0.18160403055010677, "five_year_vs_sp500": -0.16560928142370268, "ten_year_vs_sp500": -0.09622180337097874}, {"fund": "WVP Dividend Akcii", "current_price": 155.4182, "ytd_return": 0.1534117769292711, "five_year_return": 0.0919876448446717, "ten_year_return": 0.04498212656708711, "sharpe_ratio": 0.5630270570182968, "max_drawdown": -0.1344707815403342, "ytd_vs_sp500": -0.04694641808069466, "five_year_vs_sp500": -0.08922825175304472, "ten_year_vs_sp500": -0.06899455386510578}, {"fund": "WVP Etiks Akcii", "current_price": 99.471, "ytd_return": -0.005196488469916161, "five_year_return": -0.0010414647334947569, "ten_year_return": -0.0005208680184937142, "sharpe_ratio": -0.42804345723280995, "max_drawdown": -0.03842676989887994, "ytd_vs_sp500": -0.20555468347988193, "five_year_vs_sp500": -0.18225736133121118, "ten_year_vs_sp500": -0.1144975484506866}, {"fund": "WVP Premium Akcii", "current_price": 180.3629, "ytd_return": 0.11749701051431538, "five_year_return": 0.09150796021668417, "ten_year_return": 0.06075399854563379, "sharpe_ratio": 0.23718584743240764, "max_drawdown": -0.33047023363590433, "ytd_vs_sp500": -0.08286118449565039, "five_year_vs_sp500": -0.08970793638103225, "ten_year_vs_sp500": -0.0532226818865591}], "fundData": {"Grawe Flex Bond Eur": {"dates": ["2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [99.2041, 96.6227, 98.4201, 98.735, 98.9453, 100.3266, 101.7266, 101.7996, 100.4333, 100.6395, 103.5039, 106.8647, 107.4001, 107.2233, 107.5192, 107.8688, 108.4175, 108.3039, 108.9764, 110.2921, 111.1901, 111.2406], "returns": [-0.00792725367211744, -0.033742079746551745, -0.015767504560145085, -0.012618403788920651, -0.010515336490766858, 0.003298105539377705, 0.017298553553713347, 0.01802857691446036, 0.004365139684469055, 0.006427205670580971, 0.0350721223079129, 0.06868119779832949, 0.07403536913181208, 0.07226731255400143, 0.07522640724503171, 0.0787225191206109, 0.08420969471023021, 0.08307365835706637, 0.08979887356395322, 0.10295629460142619, 0.11193658197062195, 0.1124415981311393]}, "Grawe Global": {"dates": ["2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [98.0761, 100.6656, 103.5347, 101.1245, 104.0284, 105.1517, 108.7469, 109.8614, 110.819, 102.8219, 87.5373, 97.0029, 99.0466, 99.4106, 100.4306, 104.5989, 102.8312, 100.1818, 110.4034, 111.6962, 113.3479, 115.0684, 120.8483, 123.1429, 123.447, 127.1462, 128.7898, 131.9162, 128.7985, 134.5756, 135.4701, 138.2728, 131.6425, 128.6381, 132.9282, 130.2253, 128.3792, 120.2921, 130.858, 128.4205, 120.9902, 126.7905, 126.6468, 118.9934, 124.1629, 125.2958, 124.3164, 123.9923, 127.0362, 131.8441, 134.4951, 133.5843, 131.2666, 126.2938, 133.4647, 138.6052, 144.107, 148.7778, 153.4388, 150.0909, 151.9588, 158.8245, 158.0813, 157.4856, 159.3741, 160.4456], "returns": [-0.019039865092613906, 0.006860392659709058, 0.0355572181152759, 0.011450324415854585, 0.040495220529766174, 0.051730501291761266, 0.08768980102960744, 0.09883706392397573, 0.10841500824667327, 0.028427770837479382, -0.1244492632004296, -0.02977404413095841, -0.009332894577598672, -0.005692155507567409, 0.004509915512849849, 0.046201378879914046, 0.0285207897203148, 0.0020214103463018773, 0.10425816440737701, 0.11718878932423493, 0.13370914295602176, 0.1509176362801663, 0.20872837185948812, 0.2316790308432617, 0.23472064829160444, 0.27172015919231796, 0.28815949637776717, 0.3194298442583863, 0.2882465140423516, 0.3460292439365207, 0.3549760601402099, 0.3830087507764084, 0.3166922885345731, 0.28664218836423827, 0.3295518990355053, 0.3025174110344413, 0.28405266269052776, 0.2031652425442383, 0.30884569567622466, 0.284465746546551, 0.21014765997497764, 0.2681624369747089, 0.26672514520447965, 0.1901756056479491, 0.24188110186368084, 0.25321240211763274, 0.24341641353195054, 0.24017475547536504, 0.2706199358469801, 0.31870869786567013, 0.3452240804883424, 0.33611423118893446, 0.3129325253026394, 0.26319442846898156, 0.33491798835163755, 0.38633342568541673, 0.4413625966071144, 0.48808008025629546, 0.5346995440074369, 0.5012137463905211, 0.5198965389974202, 0.5885674791982809, 0.5811339701959539, 0.5751757606794232, 0.5940645951128134, 0.6047817706994576]}, "Innovo Status Balansiran": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [29.2748, 29.5969, 29.903, 29.5764, 29.0892, 29.3907, 29.3542, 29.5989, 29.5491, 29.3979, 29.2451, 29.3961, 29.4166, 29.4706, 29.5819, 29.4517, 29.4478, 29.4027, 29.4007, 29.1053, 29.3242, 29.2676, 29.6325, 29.7515, 30.3014, 31.4067, 31.1455, 31.487, 31.3408, 31.3435, 31.4376, 32.0689, 33.2618, 33.7123, 33.9497, 33.6205, 32.8436, 32.6681, 33.6825, 33.9714, 33.955, 33.855, 33.9961, 33.8578, 34.6916, 34.7498, 34.8793, 35.3069, 35.4837, 35.2342, 35.8254, 35.9172, 35.9489, 36.1525, 35.7321, 36.0758, 36.5705, 36.5125, 36.5544, 36.5041, 36.0998, 36.1518, 36.7286, 36.8833, 36.2987, 33.4861, 35.1377, 34.9178, 34.5913, 35.1882, 35.0509, 35.6493, 34.9548, 34.1099, 35.0457, 36.4725, 36.9461, 36.8854, 37.0783, 37.3498, 37.3633, 37.1593, 37.5295, 36.9864, 36.3535, 35.9427, 36.4828, 36.7152, 36.2872, 36.6646, 37.2232, 36.6909, 36.4408, 36.5254, 36.2139, 35.9416, 36.2839, 36.1237, 36.3249, 36.6503, 36.5687, 36.4003, 36.7774, 36.6594, 36.5126, 36.7499, 36.5325, 36.8489, 37.1636, 37.2863, 37.475, 38.0811, 38.65, 38.8218, 39.5197, 40.0628, 40.8025, 42.2575, 42.4794, 42.3427, 42.2005], "returns": [0.014580250293719121, 0.025743308576597013, 0.03635185294290899, 0.02503283762099562, 0.008147888861547825, 0.018597010476846476, 0.01733202560467917, 0.02581262281616703, 0.024086698250853855, 0.018846541739300227, 0.013550933836090406, 0.018784158923686123, 0.019494629879287073, 0.021366114347699083, 0.025223451779814665, 0.02071109478375499, 0.020575932016591914, 0.019012895914270356, 0.018943581674699894, 0.008705868490091584, 0.016292312011115584, 0.014330719031261152, 0.026977102040954604, 0.031101299295418272, 0.05015924946541128, 0.08846576396421724, 0.07941332427626957, 0.09124873068298456, 0.08618185977035808, 0.0862754339937788, 0.08953666896558499, 0.11141570868610984, 0.1527581868781176, 0.16837121934144128, 0.17659881957849666, 0.16518969574514308, 0.13826457938386327, 0.13218225486152413, 0.16733843717183694, 0.17735087907784042, 0.1767825023133589, 0.1733167903348185, 0.17820690993653843, 0.1734138302702175, 0.20231093674728684, 0.20432798111879769, 0.20881607813100667, 0.22363546255124467, 0.22976284132930314, 0.22111588994284448, 0.24160517915997537, 0.2447867027562749, 0.24588533345347274, 0.2529415230417804, 0.23837166988399727, 0.2502833219542402, 0.26742819911207794, 0.2654180861645248, 0.26687021948353284, 0.26512696635832755, 0.25111509282908906, 0.2529172630579286, 0.27290748975014845, 0.27826894618095, 0.25800839395440356, 0.16053177884597924, 0.21777147788355022, 0.21015037724273977, 0.19883482763280558, 0.21952166243271254, 0.21476323988617607, 0.23550206036576093, 0.21143269067479964, 0.1821508901681126, 0.21458302286329167, 0.2640318013731051, 0.2804454133034724, 0.27834172613249875, 0.2850270845391032, 0.2944364925608396, 0.29490436367794226, 0.28783431124171943, 0.30066437698627446, 0.2818420952308218, 0.2599076041186399, 0.24567045931079612, 0.2643887697068925, 0.2724430843450214, 0.2576098370768689, 0.2706894340838806, 0.29004890119600724, 0.27160091633423855, 0.2629331706759097, 0.2658651630097546, 0.25506947019660275, 0.24563233647903737, 0.25749546858157957, 0.25194339799195986, 0.258916410492783, 0.27019383727095225, 0.2673658162964627, 0.26152955732460126, 0.2745987571956767, 0.2705092170609993, 0.26542155187650174, 0.2736456864015764, 0.2661112285602296, 0.27707674126033144, 0.28798333685679744, 0.2922357654544667, 0.2987755639579732, 0.3197812442599053, 0.3394976797058207, 0.34545177288495266, 0.3696389767831847, 0.3884612585386391, 0.41409713004390114, 0.4645232393316616, 0.4722136542120423, 0.467476025937378, 0.462547783503894]}, "Innovo Status Solar": {"dates": ["2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [99.8008, 99.144, 101.2612, 99.8168, 99.774, 100.8527, 99.8105, 86.0529, 77.5792, 66.3063, 67.1658, 76.1974, 64.4789, 65.8285, 65.2098, 57.7029, 67.7904, 58.2008, 59.7727, 56.3859, 59.3927, 57.6842], "returns": [-0.001992000000000216, -0.008560000000000234, 0.01261199999999918, -0.0018320000000000558, -0.0022599999999999287, 0.00852699999999973, -0.0018950000000004241, -0.13947100000000068, -0.2242080000000003, -0.3369370000000005, -0.328342, -0.23802600000000018, -0.35521100000000005, -0.341715, -0.34790200000000027, -0.42297100000000043, -0.32209600000000094, -0.4179920000000009, -0.402273000000001, -0.43614100000000133, -0.4060730000000018, -0.4231580000000017]}, "KB Invest - Akcii": {"dates": ["2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [99.3307, 100.6937, 101.0493, 100.6955, 101.6016, 100.039, 101.6567, 101.873, 103.2427, 104.1322, 98.3242, 99.6712, 98.5519, 99.9494, 93.0272, 96.4282, 94.58, 88.5771, 92.3673, 95.5532, 91.0879, 96.7739, 97.4259, 96.947, 96.6129, 94.4949, 97.6269, 101.6338, 98.7904, 97.1755, 94.9634, 98.5939, 103.3816, 104.1641, 106.3045, 111.156, 107.8209, 111.3255, 111.5934, 116.7922, 115.3787, 115.7426, 115.8008], "returns": [-0.006765506118053377, 0.006863498964576831, 0.010419239395524915, 0.00688149765067303, 0.0159418362459558, 0.0003169768606909873, 0.016492796025891376, 0.01865563813841775, 0.032351638330403665, 0.041245989042801856, -0.016829771426683626, -0.0033607546649073727, -0.014552937635550656, -0.0005789577360832965, -0.06979590489894105, -0.03578838744771473, -0.054269038360197475, -0.11429365656306878, -0.07639442320710366, -0.04453774874433991, -0.08918748931327791, -0.03233163979029363, -0.025812115715550976, -0.030600766144070146, -0.03394152226887348, -0.055119976241733704, -0.023802262434841848, 0.016263812741670547, -0.012168111727842601, -0.028315932936894384, -0.05043531822176861, -0.01413296829331323, 0.033740536940804144, 0.041564965757500794, 0.06296740337955486, 0.11147886204307311, 0.07813029648835856, 0.11317373831710498, 0.11585254276438084, 0.1678367479174041, 0.15370277969708424, 0.1573415140694756, 0.15792347158657694]}, "KB Invest - Balanced": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [111.5332, 113.4508, 111.7379, 112.1348, 113.4976, 111.9665, 114.0226, 113.9773, 112.1329, 113.1736, 112.3823, 112.5471, 116.3149, 118.9035, 116.798, 114.9963, 114.7119, 115.8696, 117.1211, 117.3935, 116.9581, 120.1907, 122.5085, 123.2097, 128.4452, 133.6599, 134.6462, 139.2784, 140.6228, 140.4393, 139.5789, 143.4081, 143.6977, 145.247, 147.5145, 148.0627, 148.7838, 146.6127, 146.1531, 149.8438, 149.0637, 147.3852, 150.5969, 151.4996, 153.4345, 155.1144, 152.9126, 154.803, 153.6167, 151.9752, 151.0857, 154.3701, 155.4265, 155.8011, 157.3821, 157.8652, 159.3396, 162.0225, 161.8231, 164.6341, 164.7159, 167.2074, 169.9395, 172.5274, 168.8178, 151.5793, 159.2531, 161.1388, 162.2657, 163.5037, 164.5342, 164.3085, 161.8245, 169.6912, 171.7137, 174.978, 178.374, 178.7586, 180.3607, 185.243, 186.5151, 186.1804, 190.3456, 189.6959, 191.0347, 189.075, 191.5161, 192.6858, 177.1055, 174.2082, 174.5307, 173.2204, 167.155, 170.574, 169.8767, 162.914, 165.1977, 170.426, 169.2247, 176.803, 176.8882, 178.8599, 179.0422, 178.0632, 180.9967, 184.7224, 183.3733, 183.4115, 182.888, 186.4624, 189.4269, 193.2371, 197.2844, 201.593, 202.6116, 205.7286, 209.3672, 215.1725, 215.6486, 218.2536, 217.6559], "returns": [0.021015676850898224, 0.03857008811076845, 0.02288957546630166, 0.02652294312850567, 0.03899851241560914, 0.024982263416867934, 0.04380455429683172, 0.04338986154022351, 0.026505549834078934, 0.03603249799748398, 0.028788648586795418, 0.03029728801922471, 0.06478910630507029, 0.08848609680741659, 0.06921158027234342, 0.05271815997253837, 0.05011465842773988, 0.060712667353246985, 0.07216935576153127, 0.0746630049204744, 0.0706771941869806, 0.10026959606362529, 0.12148758439180973, 0.12790662547202492, 0.17583430598466876, 0.22357157569516173, 0.23260052637601714, 0.2750053781897257, 0.28731250715184986, 0.28563268108479467, 0.27775626501888295, 0.3128101613456933, 0.31546126559103116, 0.3296441240416548, 0.35040164778578986, 0.35542007094633443, 0.36202128389976185, 0.3421462409886724, 0.3379388946103685, 0.37172491131708596, 0.3645835907998636, 0.34921798832818474, 0.3786190639661293, 0.3868827096921845, 0.40459549147499785, 0.41997391005835993, 0.3998178281267879, 0.41712324064538264, 0.4062634168669179, 0.3912365259182973, 0.3830937178166842, 0.4131603158256092, 0.42283098752717563, 0.4262602128389956, 0.4407332646755908, 0.44515573864286373, 0.45865293511843297, 0.48321318228630217, 0.4813878018079867, 0.5071207231948724, 0.5078695502917949, 0.5306776519052523, 0.5556882938551317, 0.5793788763016361, 0.5454198420871947, 0.3876123126215796, 0.45786108250371793, 0.47512346950451967, 0.4854395239729943, 0.49677262844719006, 0.5062062020826172, 0.5041400617919669, 0.4814006179196697, 0.5534152649044508, 0.5719299691040156, 0.6018125643666317, 0.632900789564022, 0.6364215585307234, 0.6510877674791158, 0.6957821261013843, 0.7074273944387213, 0.7043634283098734, 0.7424931914406663, 0.7365456001830855, 0.7488014646984769, 0.7308616546515603, 0.7532083762444193, 0.7639162375557824, 0.6212884769424403, 0.5947655338139355, 0.5977178166838291, 0.5857228515848469, 0.5301979631536773, 0.5614967387572942, 0.5551133997024822, 0.4913742991188912, 0.5122801235839327, 0.5601418926650632, 0.5491447534042779, 0.6185192813823075, 0.6192992333218885, 0.6373488957546614, 0.6390177365831322, 0.6300556127703394, 0.656909943929511, 0.69101636342831, 0.6786662089483928, 0.6790159057100358, 0.674223595377047, 0.7069449593775039, 0.7340830758668044, 0.768963039249343, 0.8060135026890962, 0.8454560018308743, 0.854780638516994, 0.8833147957432215, 0.9166238700080118, 0.969767707975743, 0.9741261013846003, 0.99797322348095, 0.992501659228747]}, "KB Invest - Bonds": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [121.1808, 120.395, 120.1589, 120.6983, 123.1162, 125.7356, 128.9836, 127.7323, 125.5493, 126.2117, 125.6972, 125.1937, 128.6798, 129.5314, 126.6648, 126.3193, 126.0787, 126.7169, 127.8973, 130.1761, 131.1278, 132.004, 134.8545, 136.5983, 139.6232, 140.1895, 141.4403, 143.701, 143.6524, 143.9548, 144.3429, 145.7252, 144.9455, 144.0588, 144.2941, 143.6372, 145.1571, 144.9947, 144.5626, 144.2195, 144.8177, 144.3058, 144.1733, 144.8923, 144.7091, 146.2758, 145.0827, 145.7614, 145.7451, 145.1826, 144.9145, 147.0774, 148.2134, 149.4419, 150.5784, 150.1777, 150.1995, 151.7014, 152.3299, 153.4736, 153.2253, 153.5783, 153.5042, 155.1014, 154.3558, 145.8714, 149.1634, 151.6519, 153.785, 153.4455, 153.9037, 154.0373, 153.4069, 155.567, 155.0181, 155.6093, 156.1044, 157.0936, 156.7217, 157.4236, 158.7995, 158.8033, 159.387, 159.3185, 158.8168, 158.2549, 157.5858, 156.2198, 145.0188, 130.4179, 131.6061, 131.844, 127.6053, 128.588, 129.5603, 125.5404, 126.3808, 130.853, 130.1196, 133.247, 132.8907, 134.2666, 134.9078, 135.5999, 137.2797, 139.1935, 140.3033, 140.2381, 139.6921, 142.2711, 144.8903, 146.3194, 146.7764, 147.5225, 147.0963, 147.7345, 147.6748, 148.8014, 150.0552, 151.1625, 151.3054], "returns": [0.007599769845044735, 0.001065963341504217, -0.0008971719543547918, 0.003587856332754269, 0.02369232406616062, 0.04547223340107287, 0.07247885534495135, 0.0620744877222994, 0.0439231774687634, 0.04943093189475678, 0.045152943289422875, 0.04096641799732281, 0.06995280493037481, 0.07703372834398503, 0.05319838891531492, 0.050325609395115434, 0.04832505728929726, 0.0536315924261761, 0.06344643742080525, 0.08239430998414021, 0.09030754954817621, 0.09759301818956345, 0.12129448858704728, 0.13579391818856634, 0.16094549784313417, 0.1656541955053321, 0.17605440570465558, 0.19485177954348676, 0.19444767799592766, 0.19696208762518475, 0.2001890796129988, 0.21168269214779611, 0.2051996062088668, 0.19782683167757398, 0.19978331509610636, 0.194321292326731, 0.20695902776161446, 0.20560869666442128, 0.20201585142367362, 0.19916302753545123, 0.2041369688060266, 0.19988059880200315, 0.1987788816198719, 0.20475725636668418, 0.2032339764590123, 0.21626084671747114, 0.20634040317029023, 0.21198368959680214, 0.21184815759628361, 0.20717105635138466, 0.20494184596248233, 0.22292602779820103, 0.23237169360123255, 0.24258648272009187, 0.25203630594645143, 0.24870454689075228, 0.24888581054788816, 0.26137387874293383, 0.2665997598672345, 0.2761094499895296, 0.27404487356444873, 0.2769800144345822, 0.27636388429725356, 0.28964435737876926, 0.28344480771086444, 0.21289832272914033, 0.24027079792595218, 0.26096229383338554, 0.27869869323870766, 0.2758758027984536, 0.27968566553696395, 0.28079652905041885, 0.2755548497174696, 0.2935157499825458, 0.28895173065219026, 0.29386746799616237, 0.2979841485763395, 0.30620919489003495, 0.30311690341807473, 0.30895309428704376, 0.32039349180323273, 0.3204250882205315, 0.3252784642145712, 0.3247088972185259, 0.3205373386504091, 0.3158652263135049, 0.3103017624149056, 0.29894368188062614, 0.20580908446887047, 0.08440483990594871, 0.09428454070450676, 0.09626264272434981, 0.061018502196789504, 0.06918950200721175, 0.0772740274123942, 0.043849175333515955, 0.05083697246456165, 0.08802262968667174, 0.0819245211479891, 0.10792837258496069, 0.1049657927208576, 0.11640619023704679, 0.12173766991389812, 0.12749237528562118, 0.1414596547010536, 0.15737260823436516, 0.16660042505496686, 0.166058297052891, 0.16151839077784214, 0.18296238030778755, 0.204740626673368, 0.2166233740317416, 0.22042325895426385, 0.2266269660454976, 0.22308317840002934, 0.2283897135369084, 0.22789331719144967, 0.23726082343589971, 0.2476859781751961, 0.25689300787915426, 0.25808119946652486]}, "KB Invest - MBI 10": {"dates": ["2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [99.826, 102.1221, 103.3568, 109.8094, 113.1417, 113.5836, 110.931, 107.9306, 107.5155, 118.9361, 116.5298, 116.0046, 122.0801, 126.1192, 139.5722, 142.1871, 141.6687, 146.9493, 148.0052, 144.0956, 144.3751, 149.6305, 150.7392, 151.0779, 152.3522, 162.3507, 161.3474, 164.5143, 168.7585, 180.4194, 178.2505, 185.4959, 192.6304, 202.3519, 193.4566, 151.6773, 186.4138, 180.6447, 175.6425, 182.3182, 179.1505, 188.4984, 186.1911, 187.8337, 196.463, 203.0313, 206.5376, 200.7197, 208.0076, 216.185, 217.3756, 222.822, 241.9208, 236.091, 246.8603, 242.669, 252.4534, 254.8119, 241.1749, 250.5626, 260.2055, 253.5467, 245.7543, 249.4852, 244.9571, 238.4335, 240.8701, 236.8074, 240.2087, 246.3226, 244.3855, 245.6666, 253.7177, 248.4817, 248.3026, 250.9396, 248.6345, 251.4687, 255.1802, 260.0537, 262.4493, 275.8583, 288.5324, 298.3813, 310.8701, 317.3594, 331.9756, 361.1928, 364.2399, 370.5337, 368.6643], "returns": [-0.001740000000000741, 0.021220999999999268, 0.0335679999999996, 0.09809399999999946, 0.13141699999999945, 0.13583599999999962, 0.10931000000000002, 0.07930599999999988, 0.07515500000000075, 0.1893610000000001, 0.1652980000000004, 0.1600459999999999, 0.2208010000000007, 0.2611920000000012, 0.39572200000000146, 0.42187100000000055, 0.4166870000000005, 0.46949300000000016, 0.48005200000000015, 0.4409559999999999, 0.44375099999999956, 0.49630499999999955, 0.5073920000000001, 0.5107790000000001, 0.5235220000000003, 0.623507, 0.6134739999999999, 0.6451429999999996, 0.6875850000000003, 0.8041939999999987, 0.7825049999999985, 0.8549589999999989, 0.9263039999999982, 1.0235189999999976, 0.9345659999999987, 0.5167730000000004, 0.8641380000000012, 0.8064470000000015, 0.7564250000000026, 0.8231820000000032, 0.7915050000000039, 0.8849840000000044, 0.8619110000000041, 0.8783370000000044, 0.9646300000000041, 1.030313000000005, 1.0653760000000054, 1.0071970000000054, 1.0800760000000067, 1.1618500000000078, 1.1737560000000058, 1.2282200000000052, 1.4192080000000065, 1.3609100000000058, 1.4686030000000043, 1.4266900000000042, 1.524534000000004, 1.5481190000000056, 1.4117490000000066, 1.5056260000000052, 1.6020550000000058, 1.5354670000000055, 1.4575430000000043, 1.4948520000000038, 1.4495710000000015, 1.3843350000000019, 1.4087010000000015, 1.3680740000000005, 1.4020870000000012, 1.463226000000001, 1.4438550000000019, 1.456666000000003, 1.5371770000000033, 1.4848170000000036, 1.4830260000000024, 1.5093960000000024, 1.4863450000000018, 1.5146870000000008, 1.5518020000000003, 1.6005369999999988, 1.6244929999999997, 1.7585830000000002, 1.8853239999999998, 1.9838129999999992, 2.1087009999999995, 2.173594000000001, 2.3197560000000017, 2.6119280000000007, 2.6423990000000006, 2.705337000000003, 2.6866430000000037]}, "KB Invest - Zlaten Fond": {"dates": ["2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [98.7348, 104.8037, 93.9303, 95.5322, 90.3683, 84.3868, 91.9685, 95.1574, 95.5381, 92.0147, 99.5779, 102.7182, 97.8393, 87.4939, 75.8889, 75.4053, 70.4342, 73.5318, 72.6394, 82.5342, 81.814, 87.8012, 76.975, 87.6697, 90.6188, 85.0165, 81.5873, 84.233, 79.4565, 75.5225, 79.8237, 84.6677, 85.1809, 79.1056, 72.7229, 86.0052, 92.5783, 97.7839, 95.1911, 104.0453, 104.4714, 105.8233, 106.6597], "returns": [-0.012723083937956847, 0.04796154676863251, -0.06076462494700441, -0.044746778231967266, -0.09638206049164455, -0.15619275412170341, -0.08038121255269637, -0.0484945083953956, -0.04468778247966143, -0.07991924581430143, -0.004292690926253617, 0.027108048220527703, -0.021677439224376593, -0.1251239910726435, -0.24116563607420327, -0.24600128790727116, -0.2957087089729541, -0.2647349390843865, -0.2736582966026452, -0.1747174203457359, -0.18191890183906823, -0.12205121231271476, -0.23030541800990467, -0.12336611763953154, -0.093877240838661, -0.1498962074730631, -0.18418573862682053, -0.15773064339367726, -0.20549220456127326, -0.24482937228519752, -0.2018204689262395, -0.15338395635514457, -0.1482523258325421, -0.2090009519314624, -0.27282335671831726, -0.14000991928581286, -0.07428365157708816, -0.022231399339249225, -0.048157532657650104, 0.040378092777318075, 0.044638786007405784, 0.0581568127094827, 0.06652021054483859]}, "KB Invest Paricen": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [112.2892, 112.6164, 112.9562, 113.2782, 113.5688, 113.8982, 114.2043, 114.5211, 114.8112, 115.0684, 115.3226, 115.6056, 115.8607, 116.1008, 116.3597, 116.6386, 116.8869, 117.1525, 117.4095, 117.6772, 117.9372, 118.1736, 118.4555, 118.732, 119.03, 119.2859, 119.5653, 119.8909, 120.1065, 120.4317, 120.6703, 120.955, 121.2112, 121.4245, 121.7135, 121.877, 122.1263, 122.4118, 122.6085, 122.8695, 123.1298, 123.3139, 123.544, 123.7817, 123.9997, 124.2244, 124.4407, 124.6496, 124.8717, 125.0817, 125.3144, 125.5876, 125.7753, 126.0311, 126.2346, 126.4564, 126.665, 126.8357, 127.0183, 127.2079, 127.4129, 127.5853, 127.7219, 127.9598, 128.1329, 128.3169, 128.499, 128.6797, 128.8402, 128.9893, 129.1256, 129.2706, 129.4156, 129.5607, 129.7239, 129.8713, 130.0142, 130.1419, 130.2749, 130.4253, 130.674, 130.6834, 130.8424, 131.1183, 131.2661, 131.4341, 131.5461, 132.0773, 132.246, 132.4064, 132.4273, 132.7428, 132.9181, 132.8685, 133.0608, 133.2484, 133.6342, 133.8334, 133.8576, 134.2741, 134.4888, 134.7377, 134.7952, 135.0366, 135.4323, 135.5443, 135.8095, 136.0885, 136.3861, 136.6545, 136.9453, 137.3978, 137.6668, 137.7804, 138.0584, 138.4034, 138.661, 138.9116, 139.2031, 139.5034, 139.5358], "returns": [0.0029358568423678566, 0.005858316102553385, 0.00889331505307478, 0.01176932936169206, 0.014364887616612698, 0.017306996663999374, 0.0200409966014774, 0.022870565958526434, 0.025461658352718297, 0.02775889711103008, 0.030029340704976093, 0.0325570178768364, 0.034835500020092836, 0.03698000634151932, 0.03929242902630525, 0.04178348614019822, 0.044001232577557614, 0.04637349779609501, 0.048668950210116524, 0.05105997204370971, 0.053382219622096105, 0.05549367857413756, 0.058011530852395854, 0.060481151834796076, 0.06314280482848589, 0.06542843234890583, 0.06792395532352624, 0.0708321238293832, 0.07275780297515322, 0.07566239879242875, 0.07779350753167114, 0.08033636863000493, 0.0826246756668616, 0.08452981185328468, 0.08711107935387719, 0.08857141581182493, 0.0907980939706392, 0.09334810044613717, 0.09510497005640128, 0.09743614935624367, 0.09976107645106613, 0.10140540637099238, 0.10346059547786646, 0.10558366566779864, 0.10753078094506208, 0.10953773875607609, 0.11146967010686382, 0.1133355067188826, 0.11531924205411159, 0.1171949035597315, 0.11927331514238748, 0.12171346144398476, 0.12338994556115024, 0.12567467990942438, 0.12749228522558465, 0.12947334104437713, 0.13133649813995962, 0.13286114299238583, 0.1344920753301304, 0.13618552971806186, 0.138016532616406, 0.13955636139530658, 0.140776434546106, 0.14290129108033023, 0.14444737206424807, 0.1460908088120294, 0.14771727528904566, 0.14933123735602472, 0.15076477864960536, 0.15209649831859462, 0.15331389195295753, 0.15460899156398145, 0.15590409117500492, 0.1572000839581733, 0.15865774089968254, 0.1599742766422001, 0.161250619638168, 0.16239120046801347, 0.16357911942157344, 0.1649224503284561, 0.16714376945439757, 0.1672277276360774, 0.16864787134747528, 0.17111213329700203, 0.17243224172809968, 0.17393277093259618, 0.17493312373559378, 0.17967765417266812, 0.18118443558218345, 0.18261708370361918, 0.18280375668203575, 0.18562171480119405, 0.18718744557231504, 0.1867444321881302, 0.18846200222399134, 0.19013759316901058, 0.19358345130647914, 0.19536265022038224, 0.19557879787960153, 0.1992988598657479, 0.20121650046220796, 0.20343960593244015, 0.20395317991612227, 0.20610929747544104, 0.20964357965531688, 0.21064393245831448, 0.21301262498826956, 0.21550457527430789, 0.21816265557941583, 0.22055992961802784, 0.22315727421723786, 0.22719887817577678, 0.22960151124726114, 0.23061615480458797, 0.23309917336917163, 0.23618061727126127, 0.23848142871815514, 0.24071971811486237, 0.24332331491909343, 0.24600551087213107, 0.2462948986472835]}, "NLB Amerika": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [114.2845, 116.2434, 110.7604, 112.2711, 112.2026, 110.1997, 111.4404, 110.7032, 105.346, 105.5204, 100.1387, 97.2963, 98.6928, 98.6246, 99.3562, 97.7041, 96.5191, 101.0659, 102.2456, 102.9398, 101.4812, 107.6285, 109.0647, 110.6324, 114.6805, 110.3942, 111.4, 115.8497, 120.777, 119.2614, 118.3025, 119.7799, 120.8861, 123.3901, 123.3453, 119.9624, 120.4135, 117.8778, 118.0216, 121.2187, 119.9515, 118.2089, 119.8349, 122.6301, 122.6097, 122.8955, 119.8349, 117.963, 114.2504, 114.4181, 111.0885, 114.1433, 115.1439, 115.8094, 118.2181, 118.0989, 118.2851, 119.0343, 117.6108, 120.7616, 120.4461, 122.5353, 123.6337, 126.1074, 119.3817, 100.9226, 105.9172, 108.8497, 108.4167, 107.6669, 109.7391, 108.9403, 106.3007, 112.2357, 114.3022, 117.4832, 118.8841, 118.5965, 120.5528, 124.004, 124.5372, 125.1767, 127.5535, 127.2062, 128.4597, 128.4192, 130.5915, 132.0092, 122.6031, 128.831, 128.7153, 127.2091, 124.3036, 124.877, 125.1186, 115.6831, 119.0452, 119.7199, 120.8206, 126.0535, 126.0963, 128.327, 129.0897, 131.1173, 134.571, 137.6121, 137.0533, 134.1457, 131.3121, 136.3426, 139.9559, 145.3907, 151.8524, 154.8925, 150.1971, 154.5427, 161.0833, 160.0093, 159.8803, 162.0919, 164.0657], "returns": [0.005692658063880085, 0.02293079051299851, -0.02531908452836107, -0.012025069167248215, -0.012627862608855733, -0.030253190845284106, -0.019335149633572746, -0.025822439051863544, -0.07296528613768716, -0.07143058283525938, -0.1187890275753809, -0.14380187543559597, -0.13151280914063712, -0.13211296261096783, -0.12567495265651574, -0.1402132744795742, -0.1506411610241687, -0.11062975634825156, -0.10024850929621942, -0.09413961576098062, -0.10697515611030184, -0.05287950467098923, -0.040241082177025156, -0.026445472273260884, 0.009177420149669713, -0.02854160946728801, -0.019690665765555226, 0.019466268207003035, 0.06282603645272467, 0.049488901560752696, 0.04105067336867507, 0.054051651918028965, 0.06378610600716872, 0.08582106626680086, 0.08542683055608569, 0.05565763444493976, 0.059627271255291436, 0.03731335403071134, 0.03857878026287431, 0.06671295416306333, 0.0555617154885395, 0.04022700233021914, 0.054535646652169145, 0.07913313903145247, 0.07895362098460867, 0.08146863362127132, 0.054535646652169145, 0.038063105873413106, 0.005392581328720336, 0.006868325272625819, -0.022431835941619904, 0.004450111582791294, 0.013255295782387266, 0.019111632065448747, 0.040307961449385754, 0.039259012861945664, 0.0408975550346069, 0.047490443303982666, 0.03496377959408381, 0.06269051792717151, 0.05991414813407481, 0.07829890810788687, 0.08796472294382252, 0.10973304610446721, 0.05054753004288104, -0.11189078262827801, -0.06793878082605709, -0.04213306159228203, -0.04594342013558106, -0.05254158834751088, -0.034306426746069096, -0.041335790266594286, -0.06456401754348118, -0.012336585777938947, 0.00584841636923783, 0.03384091181088822, 0.04616869768457854, 0.043637845220253046, 0.06085309791830329, 0.091223327490207, 0.09591543644006073, 0.1015429752124386, 0.1224585876505746, 0.11940238090210453, 0.13043306088830486, 0.1300766647658942, 0.14919269678346603, 0.1616683210486738, 0.07889554161651313, 0.13370046533894375, 0.13268231641640393, 0.11942790062444875, 0.09385977880561391, 0.09890564390660206, 0.10103170077510293, 0.018000204157785582, 0.04758636226038626, 0.05352365766261302, 0.06320971227833816, 0.10925873126501195, 0.10963536716721367, 0.1292653135933961, 0.13597700057024142, 0.1538196864418191, 0.18421191577436336, 0.21097330461045272, 0.2060559181116175, 0.18046931649384268, 0.1555339077910891, 0.19980182615613762, 0.23159852020810678, 0.27942423986427656, 0.3362865812020033, 0.3630391701338358, 0.321720099685322, 0.3599609636247223, 0.41751761740833016, 0.408066520236267, 0.4069313325871091, 0.4263932008419815, 0.44376245186453045]}, "NLB BRIK": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [144.7075, 142.9718, 138.4522, 145.0549, 152.3164, 152.2416, 162.4088, 159.6043, 154.6423, 148.6441, 134.859, 131.9582, 138.7349, 140.4887, 133.556, 126.6393, 124.7454, 132.815, 134.4158, 132.247, 135.6997, 140.2293, 142.4651, 143.4538, 147.5278, 148.9038, 148.4728, 152.5882, 154.0477, 154.946, 152.2218, 151.2338, 146.8489, 151.2018, 153.7267, 152.8337, 159.5358, 157.4326, 159.5898, 170.704, 163.5823, 156.9829, 160.8553, 159.7519, 152.5758, 160.6351, 157.7346, 161.7243, 157.0628, 159.2158, 153.3623, 165.4574, 164.6401, 172.0271, 173.947, 165.2338, 168.6172, 167.392, 158.9548, 164.2066, 167.9408, 168.7762, 175.4148, 167.9139, 155.6046, 128.0612, 136.1523, 133.1821, 136.7465, 139.9675, 141.6102, 138.6609, 137.0341, 147.9606, 154.3939, 154.3906, 160.4037, 163.1946, 158.1763, 162.7872, 166.1943, 161.0891, 163.1207, 163.1911, 166.5062, 159.4897, 161.4255, 168.5812, 153.0786, 152.2515, 152.4694, 149.6261, 145.9103, 151.4982, 153.6552, 145.7678, 139.8566, 149.6476, 143.4043, 147.4369, 143.2732, 144.0576, 140.098, 136.769, 142.2686, 150.2266, 141.1628, 143.0671, 136.4981, 137.1854, 140.3274, 137.8854, 144.3863, 144.3522, 148.876, 149.8367, 150.5139, 148.827, 147.3042, 159.9829, 167.22], "returns": [0.04168166360968972, 0.029187170487167347, -0.003347317682764195, 0.0441824338526835, 0.09645457869867768, 0.09591612845637476, 0.16910504962668327, 0.14891676480666072, 0.11319764579187996, 0.07001940724402589, -0.02921308520471322, -0.05009458871903649, -0.001312292502296808, 0.01131249406120971, -0.03859277324910182, -0.08838286403699525, -0.10201616502492195, -0.043926885943570304, -0.03240347487568218, -0.04801565248939732, -0.023161278804929686, 0.009445194691511949, 0.02553967399285062, 0.03265686322499728, 0.061983685245596165, 0.07188886617351575, 0.06878629860089025, 0.09841113987324457, 0.10891739827753133, 0.11538384015801961, 0.09577359750988146, 0.08866144725059, 0.057096601428762384, 0.08843109420575446, 0.10660666929652818, 0.10017837963909182, 0.14842366532005813, 0.13328371144825524, 0.14881238608321734, 0.22881831767412097, 0.17755252769275143, 0.1300465313150534, 0.15792212915319048, 0.1499792682259613, 0.09832187806837056, 0.156337012263416, 0.13545766830888795, 0.16417765402699858, 0.13062169407387514, 0.14612013487170317, 0.10398352399846411, 0.19105049626683646, 0.18516713553108932, 0.2383426962247983, 0.252163159061654, 0.18944090436605143, 0.21379641973779817, 0.20497677753366528, 0.14424131784976768, 0.18204657162683735, 0.20892733225259086, 0.2149409864293228, 0.2627291652869439, 0.20873369172427436, 0.12012479376203467, -0.07814727046039349, -0.01990322292704283, -0.04128430460735322, -0.0156258548257574, 0.007560618843450051, 0.019385648429419033, -0.0018449839184823125, -0.0135555568352983, 0.06509921017699427, 0.11140953028134515, 0.11138577512359649, 0.15467127180795126, 0.1747616565839185, 0.1386372601808814, 0.1718289743818584, 0.1963550949774362, 0.1596051460870178, 0.1742296850210019, 0.1747364617196403, 0.1986003173113169, 0.14809181296484253, 0.16202673247085042, 0.21353727256235788, 0.10194130028534643, 0.09598739392961808, 0.09755595419429319, 0.07708836630740845, 0.05034005868243541, 0.09056473928354136, 0.10609197421197347, 0.049314267779652754, 0.006762301572444507, 0.07724313475940736, 0.032300535858766244, 0.06132933862761014, 0.03135680822820763, 0.037003337239734035, 0.008500027354421125, -0.015463887841106083, 0.0241251623269072, 0.08141108516439521, 0.016165024921314997, 0.029873190648811887, -0.017413970336292883, -0.012466418845188731, 0.010151370744581278, -0.007427445989415693, 0.03936949492214903, 0.03912402495874567, 0.0716887469658114, 0.07860437728372704, 0.08347922359505544, 0.07133601886590779, 0.06037409334480648, 0.1516421292683634, 0.2037386299176709]}, "NLB Cash Deposit": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [108.6095, 108.8942, 109.1938, 109.4793, 109.7372, 110.0114, 110.2694, 110.5219, 110.7434, 110.9507, 111.1759, 111.4165, 111.6071, 111.7913, 111.9892, 112.2042, 112.3883, 112.5868, 112.7796, 112.9775, 113.1726, 113.3315, 113.5427, 113.7513, 113.9883, 114.1879, 114.4134, 114.6842, 114.8532, 115.1087, 115.2963, 115.5272, 115.7337, 115.8982, 116.1257, 116.2575, 116.4537, 116.6849, 116.8427, 117.059, 117.2751, 117.4232, 117.614, 117.8132, 117.9907, 118.1785, 118.3582, 118.5325, 118.714, 118.8842, 119.0761, 119.297, 119.4596, 119.6733, 119.8554, 120.0573, 120.2554, 120.4253, 120.5973, 120.7391, 120.8824, 121.0133, 121.1313, 121.2957, 121.4468, 121.6182, 121.7819, 121.9466, 122.0803, 122.1795, 122.2783, 122.38, 122.4946, 122.6176, 122.7518, 122.8743, 123.0295, 123.1414, 123.2516, 123.3783, 123.5595, 123.5931, 123.7253, 123.9269, 124.0369, 124.1702, 124.2745, 124.4359, 124.5683, 124.7059, 124.7488, 124.9857, 125.1151, 125.0741, 125.2258, 125.3824, 125.6583, 125.8267, 125.9268, 126.2742, 126.4912, 126.737, 126.8854, 127.1521, 127.5048, 127.6766, 127.9433, 128.2261, 128.5171, 128.7847, 129.0659, 129.4047, 129.6417, 129.8149, 130.0472, 130.319, 130.5492, 130.786, 131.0367, 131.2824, 131.329], "returns": [0.0025717500731554654, 0.005199809103404229, 0.007965409684586477, 0.01060085349609352, 0.012981522354194253, 0.015512656130429514, 0.017894248086188114, 0.020225069670796403, 0.02226973098165086, 0.02418331242517313, 0.026262128349346714, 0.028483101312739567, 0.030242525447496282, 0.031942871332188316, 0.033769681595926304, 0.03575434155905777, 0.037453764346093266, 0.039286113195774686, 0.041065845478992724, 0.04289265574273049, 0.04469361927206528, 0.046160421449468636, 0.04811000370162377, 0.050035585414689, 0.05222332686241993, 0.0540658297863319, 0.05614741500347642, 0.058647163459364604, 0.06020719850015199, 0.06256571301447833, 0.06429744421951722, 0.06642887671015396, 0.06833507337241707, 0.06985356901862683, 0.07195361618891627, 0.07317025890119866, 0.07498137650476289, 0.07711557828837212, 0.07857222639154537, 0.08056888662422068, 0.08256370066158114, 0.08393080829199873, 0.08569207862207007, 0.08753088915535279, 0.08916938749700787, 0.09090296489736249, 0.09256177138747801, 0.0941707306041002, 0.09584615285204601, 0.09741726506472026, 0.09918868946902193, 0.10122781219393273, 0.10272876898465433, 0.10470142867824173, 0.10638238951213097, 0.10824612368215947, 0.11007478014121186, 0.11164312306091473, 0.11323085103141883, 0.11453980350942827, 0.11586260245229751, 0.11707093728566487, 0.1181601925212441, 0.11967776506979733, 0.12107256562993274, 0.12265475501449452, 0.12416586587944556, 0.12568620772097017, 0.12692038928874072, 0.12783610216475383, 0.12874812265013724, 0.12968691296758195, 0.13074478288281455, 0.13188019300125742, 0.13311899005731553, 0.13424978468747195, 0.13568243225155552, 0.13671537853004123, 0.13773263214835274, 0.13890219688011407, 0.1405748498350876, 0.14088501064793002, 0.1421053457508421, 0.14396631062790033, 0.14498171805089832, 0.14621220722803963, 0.14717499808457268, 0.1486648777034072, 0.1498870590016328, 0.15115724137803688, 0.15155325027300615, 0.1537400686230801, 0.15493455699158742, 0.1545560869521061, 0.15595642609818539, 0.1574019970294711, 0.15994882346587946, 0.16150331992072364, 0.16242734067565, 0.16563418193700752, 0.1676373038532839, 0.16990627789485546, 0.17127615481824487, 0.1737380562701849, 0.1769938217073781, 0.1785797034825678, 0.18104160493450805, 0.1836521251092682, 0.18633833929192467, 0.18880854862278063, 0.19140429923502578, 0.19453175409785817, 0.19671949554558976, 0.19831830068798295, 0.2004626565458223, 0.20297163597828205, 0.20509660678531927, 0.2072825020377349, 0.20959670786451223, 0.21186475880842637, 0.21229492231671454]}, "NLB Cash Fund": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31"], "prices": [1069.9039, 1073.045, 1076.3519, 1079.575, 1082.3582, 1085.2699, 1087.7031, 1090.2576, 1092.7031, 1094.6739, 1097.3424, 1099.4016, 1101.3327, 1103.1433, 1104.9977, 1106.8458, 1108.5283, 1110.5041, 1112.1458, 1114.3014, 1116.0898, 1117.8477, 1119.8033, 1121.6114, 1123.2727, 1125.5136, 1127.6743, 1131.1868, 1132.9247, 1134.6047, 1136.1949, 1137.9767, 1139.7203, 1141.4256, 1143.1138, 1144.5824, 1146.1455, 1148.2004, 1149.5521, 1152.2589, 1155.1391, 1156.1997, 1157.1039, 1158.7256, 1160.2242, 1161.788, 1163.4674, 1164.9745, 1166.6853, 1168.2916, 1170.092, 1172.3618, 1173.7636, 1176.1913, 1178.0553, 1179.8814, 1181.9176, 1183.4059, 1184.8282, 1186.212, 1187.5107, 1188.8674, 1190.3001, 1192.3232, 1193.8816, 1195.558, 1197.1292, 1198.7447, 1200.2744, 1201.4934, 1202.6817, 1203.8978, 1205.0407, 1206.1063, 1206.2047, 1206.6925, 1207.9378, 1209.091, 1210.4437, 1211.8217, 1214.4698, 1214.6684, 1216.6451, 1219.7467, 1221.3872, 1223.0836, 1224.2852, 1226.5287, 1228.288, 1230.0444, 1230.6354, 1230.8199], "returns": [0.003278107133656505, 0.006223602390115879, 0.009324572834732647, 0.012346961730691053, 0.014956844382557621, 0.017687224993882644, 0.019968903086912126, 0.02236432750276074, 0.024657539641716353, 0.02650561262615736, 0.029007937955457086, 0.03093890603418825, 0.03274975124438417, 0.03444760031361005, 0.036186521839055796, 0.037919535682443106, 0.03949726188313507, 0.04135002350413175, 0.04288949043053636, 0.04491085542204476, 0.04658788694496696, 0.04823631778490678, 0.050070137314222496, 0.05176564206517198, 0.05332348844687029, 0.05542484157800276, 0.05745098897879641, 0.0607447561585468, 0.06237443245226615, 0.06394981433468039, 0.06544098830457057, 0.06711183082724181, 0.06874685216663434, 0.07034595855001613, 0.07192902979637994, 0.0733061761252578, 0.074771937685022, 0.07669887353631588, 0.07796639954254214, 0.08050463982785105, 0.083205482028881, 0.08420003561488554, 0.08504792864945676, 0.08656864102964223, 0.08797391917784791, 0.08944033714672872, 0.0910151563927557, 0.09242840522310591, 0.09403266910669816, 0.0955389404862943, 0.09722722473694856, 0.09935567818736812, 0.10067018433187314, 0.10294670492469304, 0.10469462863232404, 0.10640701247487039, 0.10831641282544968, 0.10971203238235305, 0.11104576193673199, 0.11234338898963925, 0.11356121544838405, 0.11483343009116465, 0.11617691200957836, 0.11807402813238466, 0.11953538237378636, 0.12110738843788083, 0.12258074558886234, 0.12409564405971962, 0.1255300855272965, 0.12667317511935816, 0.12778747648297362, 0.12892784666583323, 0.12999957520952998, 0.1309988174320904, 0.13109108979948858, 0.1315485131817753, 0.13271626500211475, 0.13379765213711425, 0.13506611587065098, 0.1363583041051568, 0.13884149979731264, 0.13902773244126942, 0.14088133801684677, 0.14378979304452444, 0.14532813469815542, 0.1469188953084699, 0.14804566844532174, 0.15014945966746307, 0.15179920332563812, 0.15344622757460957, 0.1540004244153872, 0.15417343510425963]}, "NLB Global Emerging Markets": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31"], "prices": [50.5747, 51.8719, 51.6934, 54.4594, 56.5953, 56.8326, 57.6728, 58.4332, 55.5321, 57.1139, 51.9512, 51.3957, 56.0065, 58.1617, 55.6849, 53.7329, 52.3923, 53.7777, 53.2655, 54.7462, 55.1527, 57.0826, 57.6427, 57.1665, 58.1709, 61.2132, 62.3746, 62.6343, 64.8691, 64.3708, 63.568, 65.2968, 64.0644, 65.3094, 65.8287, 66.0415, 67.0988, 66.4854, 67.4122, 69.5376, 67.1171, 65.4126, 66.0758, 67.4969, 67.1771, 70.2307, 71.157, 72.5118, 71.0629, 67.5978, 63.592, 66.3326, 67.6731, 68.7865, 70.3482, 70.2065, 70.2434, 71.0057, 71.0083, 73.483, 72.5863, 74.5805, 75.9513, 78.7313, 74.154, 65.8729, 73.8457, 72.0676, 70.9233, 71.0837, 71.9773, 72.9449, 70.9121, 72.0197, 72.4432, 72.5737, 72.3481, 73.7917, 73.8023, 73.3057, 76.2856, 74.7784, 75.8566, 73.4126, 76.6776, 76.0399, 76.2685, 78.8743, 74.5765, 75.4474, 74.9362, 74.7264], "returns": [0.01664636377159434, 0.042722517719804065, 0.03913433279862355, 0.09473612266968967, 0.13767172027837082, 0.14244189552652808, 0.15933149200146324, 0.17461695874692884, 0.1162994053864983, 0.1480965533322871, 0.044316596511117634, 0.03315000422139347, 0.12583573550755123, 0.1691592993289983, 0.11937097208653347, 0.0801321095311025, 0.05318353415107624, 0.0810326735897513, 0.07073649254421199, 0.10050134079514805, 0.10867275351481132, 0.14746736460380983, 0.15872642552455596, 0.14915391202614625, 0.16934423659104092, 0.2305001748863209, 0.2538464940317493, 0.25906695130923096, 0.3039906244848847, 0.2939738595200434, 0.2778360732190699, 0.31258819698230234, 0.28781464461892425, 0.31284148062379713, 0.32328038499113076, 0.3275580642697149, 0.3488117780913629, 0.3364812871633396, 0.3551117061266458, 0.39783623403408086, 0.3491796424278204, 0.3149159942589004, 0.3282475586271181, 0.356814335050029, 0.3503857550063678, 0.41176884450394047, 0.4303892125290918, 0.45762323455270804, 0.4284976259684026, 0.35884261436962084, 0.27831851825048903, 0.3334097204633035, 0.36035628565569966, 0.38273771473829066, 0.41413081497026605, 0.4112823790972626, 0.41202413833306917, 0.4273477986435221, 0.42740006352192617, 0.4771461768241414, 0.4591208243377394, 0.499207986073416, 0.5267636381179785, 0.582646854257372, 0.4906345358275699, 0.324168887923995, 0.4844371273614636, 0.4486939810961914, 0.4256914040356483, 0.4289157449956331, 0.44687878166547623, 0.46632935718219515, 0.4254662630209862, 0.44773110122098414, 0.4562442458379028, 0.45886754069624414, 0.4543325574009036, 0.4833516260407702, 0.4835647059296475, 0.47358211415453044, 0.5334836953681201, 0.503186147394993, 0.524859990431503, 0.47573100473197694, 0.541363630881301, 0.5285446643589651, 0.533139953283233, 0.5855214225695742, 0.49912757856817436, 0.5166343026458011, 0.5063582234765711, 0.5021408498269146]}, "NLB South-East Europe": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31"], "prices": [42.5253, 42.0881, 41.1139, 40.6675, 40.3874, 39.2339, 40.3291, 39.7526, 38.9984, 39.6525, 38.3047, 37.4866, 37.9338, 37.7557, 37.973, 36.5093, 36.4973, 37.5739, 37.739, 37.7343, 37.3879, 40.0771, 42.1883, 42.8888, 45.0315, 46.4381, 46.0168, 47.8926, 49.1223, 46.8884, 46.5463, 49.9792, 50.2579, 54.9309, 56.162, 54.6855, 53.7689, 52.1923, 53.5722, 57.0534, 55.3525, 55.0111, 55.3603, 56.186, 56.9305, 57.8604, 58.1092, 59.4452, 59.6247, 54.2658, 53.6342, 54.9149, 55.9773, 56.1245, 55.3973, 56.5756, 56.4527, 56.0247, 56.0035, 58.1825, 57.182, 58.6196, 60.6566, 62.7751, 59.0488, 47.8553, 53.6678, 53.0059, 52.4308, 52.7365, 52.5715, 53.8747, 51.9598, 53.7998, 54.4878, 55.1676, 56.12, 55.8479, 56.901, 58.7676, 59.1488, 59.6637, 60.8397, 60.7434, 61.6346, 61.6885, 62.5485, 63.578, 58.7042, 61.9008, 61.6657, 61.5056], "returns": [0.0007459946909655901, -0.009542613475911454, -0.032468418773650476, -0.04297353013159633, -0.0495651109814188, -0.07671037520944401, -0.050937082290040236, -0.064503831165165, -0.08225238624169418, -0.06685948001581521, -0.09857719750739058, -0.11782950844362594, -0.10730557072123992, -0.1114967901048649, -0.10638307886364273, -0.14082826590357334, -0.1411106613701847, -0.11577508142402815, -0.11188979046256575, -0.11200039535365502, -0.12015221115650532, -0.05686738708888095, -0.007184611329708268, 0.009300224033734317, 0.05972428789276152, 0.09282574317073267, 0.08291130899711696, 0.12705442701959546, 0.15599290246060238, 0.1034226330553274, 0.09537200896134679, 0.1761582920722149, 0.18271692678426565, 0.29268642807387124, 0.321657849652651, 0.2869114407816684, 0.2653411337236651, 0.22823907600203142, 0.2607122013667922, 0.3426351262307723, 0.30260792213415555, 0.29457377110905925, 0.30279147918745153, 0.3222226405858748, 0.33974292599356026, 0.36162622136039246, 0.3674812207014704, 0.3989212493175449, 0.40314541483894106, 0.2770346593369355, 0.2621712446109534, 0.2923099007850607, 0.3173113127623932, 0.320775363819493, 0.30366219854284004, 0.3313910800685287, 0.3284988798313171, 0.31842677485550963, 0.3179278761978286, 0.369206186343356, 0.3456614643146274, 0.3794924412146783, 0.42742907167197064, 0.4772836380066665, 0.3895927857371486, 0.1261766477775499, 0.2629619519174682, 0.24738548863829246, 0.23385168590093985, 0.24104571041286582, 0.23716277274695874, 0.2678309204209621, 0.22276766383644064, 0.26606830205019505, 0.2822589754692504, 0.2982566786527885, 0.3206694655195166, 0.3142661483141025, 0.3390487038048109, 0.3829753186362199, 0.39194608129224373, 0.4040632001054294, 0.4317379558333505, 0.42947173221379353, 0.4504443022008031, 0.45171272850499955, 0.47195107027881966, 0.49617824801852595, 0.3814833292542885, 0.45670877496846685, 0.45117617711843794, 0.4474085509347303]}, "NLB Top Brands": {"dates": ["2014-10-31", "2014-11-30", "2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [102.6241, 104.5716, 104.3663, 107.103, 110.6694, 110.7771, 112.0188, 111.6115, 108.4846, 109.8883, 104.1719, 103.038, 110.1025, 111.5029, 107.3384, 103.0257, 101.6647, 104.3813, 103.9849, 105.105, 105.0126, 107.4828, 107.5306, 107.3413, 108.55, 110.871, 114.8864, 115.1629, 117.8693, 118.7261, 118.4628, 118.6284, 116.1645, 115.1489, 114.7557, 116.8122, 121.3597, 120.6142, 120.0324, 121.4013, 116.7784, 114.9226, 118.0605, 120.7717, 120.2048, 122.8884, 123.7013, 125.1039, 123.3278, 122.3348, 116.53, 120.7028, 124.3859, 128.7529, 133.7573, 128.187, 131.9361, 133.597, 131.7588, 133.5345, 133.7079, 135.0727, 135.649, 135.8224, 127.9304, 121.395, 128.6827, 130.6855, 132.3466, 132.2969, 136.5247, 133.7082, 128.4781, 136.3664, 137.1756, 136.5204, 138.4052, 145.999, 146.5166, 147.3393, 151.3468, 152.5601, 154.6407, 150.1815, 154.9819, 152.6997, 156.4288, 155.706, 150.2045, 151.632, 148.5536, 148.0116, 140.6931, 148.144, 145.5681, 140.2137, 144.8311, 147.2343, 141.3709, 145.2707, 145.7805, 147.159, 149.2424, 149.4825, 153.1822, 155.3486, 152.8416, 150.329, 147.2365, 152.4986, 156.4899, 161.2985, 167.5027, 171.6367, 168.2543, 172.6527, 176.8653, 173.7183, 173.7414, 173.6405, 174.7948], "returns": [0.01664287462070524, 0.035935730765839224, 0.033901931861296974, 0.06101297648896775, 0.09634342175520816, 0.09741034889607159, 0.10971121640591153, 0.10567630995768917, 0.07469975956990105, 0.08860547570387967, 0.03197611351232954, 0.020743163790651886, 0.09072744221801887, 0.10460046699113601, 0.06334496023046343, 0.020621314172893257, 0.007138604435523943, 0.03405052895612548, 0.030123603063477722, 0.041219843457914296, 0.04030448535377551, 0.06477545493000636, 0.06524898433885729, 0.06337368900213103, 0.07534764290334972, 0.09834056670969415, 0.13811901834777962, 0.14085815812910463, 0.16766903662522337, 0.17615690268178397, 0.17354852834390844, 0.17518904027080695, 0.15078048147440293, 0.14071946750726694, 0.1368242423281827, 0.1571969040290646, 0.20224658994433842, 0.19486131433139997, 0.18909772834668281, 0.20265869922066115, 0.15686206524205337, 0.13847763266996638, 0.16956315426062907, 0.19642158382709285, 0.19080560428990379, 0.21739061520188407, 0.22544358709424883, 0.23933840610794044, 0.2217435194330386, 0.21190639175544224, 0.1544012973517075, 0.19573902783818542, 0.23222555850218596, 0.27548712604303227, 0.32506307946675816, 0.26988105297883047, 0.3070214108600744, 0.32347507184670055, 0.3052649931992111, 0.3228559172849188, 0.3245736997011268, 0.33809405403585147, 0.3438031544191329, 0.3455209368353416, 0.26733905200997765, 0.20259628844083366, 0.27479169163923767, 0.2946323757406355, 0.3110880180218578, 0.31059566631432833, 0.352478252815174, 0.32457667164302073, 0.27276482726578655, 0.35091005814109244, 0.35892637608339983, 0.35243565498132434, 0.371107375270078, 0.44633514985026657, 0.4514627402691225, 0.45961279559677415, 0.49931298609825037, 0.5113325097752157, 0.5319439174751202, 0.48776897312473233, 0.5353240060588011, 0.5127154534044127, 0.5496576818258856, 0.5424972831497872, 0.48799682200346917, 0.5021383121945755, 0.4716422257467294, 0.46627291738695353, 0.3937723948205034, 0.4675845344106335, 0.442066450639516, 0.389023231669809, 0.4347653800469806, 0.4585726159329806, 0.4004870022121203, 0.4391202655727322, 0.4441705855022773, 0.45782665851694637, 0.47846580434121977, 0.4808443485057621, 0.5174953266213731, 0.5389567097036925, 0.5141211819214846, 0.4892301778905406, 0.4585944101735566, 0.5107232616864243, 0.5502629673254855, 0.5978992333380604, 0.6593609730534093, 0.7003143323879315, 0.6668066781515771, 0.7103793089442632, 0.7521113170556841, 0.7209356465608252, 0.72116448608686, 0.7201649229623188, 0.7315999647329623]}, "VEGA CASH": {"dates": ["2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [100.0, 100.1305, 100.2697, 100.4188, 100.563, 100.7063, 100.8457, 100.9964, 101.1521, 101.3021, 101.4959, 101.6559, 101.8407, 101.9854, 102.1857, 102.4167, 102.6044, 102.8367, 103.0722, 103.3228, 103.5507, 103.8054, 104.1152, 104.3589, 104.5578, 104.8064, 105.0679, 105.2886, 105.5324, 105.8046, 106.0795, 106.133], "returns": [NaN, 0.0013050000000009998, 0.0026970000000006156, 0.004188000000000303, 0.005630000000000468, 0.00706300000000093, 0.008457000000001491, 0.009964000000001638, 0.01152100000000189, 0.013021000000002392, 0.014959000000002831, 0.01655900000000332, 0.018407000000003393, 0.01985400000000226, 0.021857000000002458, 0.024167000000002492, 0.026044000000002177, 0.02836700000000225, 0.03072200000000236, 0.033228000000002256, 0.0355070000000024, 0.03805400000000314, 0.041152000000003186, 0.043589000000002986, 0.04557800000000367, 0.04806400000000255, 0.050679000000002805, 0.05288600000000332, 0.055324000000003926, 0.058046000000003595, 0.06079500000000326, 0.061330000000003215]}, "VEGA FINANCE": {"dates": ["2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [100.0, 98.1774, 100.2824, 92.2388, 97.5881, 96.9324, 91.3967, 100.9529, 106.4866, 101.7859, 110.3632, 112.5833, 96.0226, 98.4285, 96.703, 100.6998, 106.1269, 104.1188, 104.0504, 99.0965, 106.7379, 114.2019, 115.7056, 118.1171, 126.1002, 125.6699, 129.4893, 125.8422, 128.7614, 127.5504, 126.4786, 127.3673], "returns": [NaN, -0.01822600000000041, 0.0028239999999999377, -0.07761199999999957, -0.024118999999999113, -0.03067599999999937, -0.08603299999999925, 0.009529000000000343, 0.0648660000000012, 0.017859000000000513, 0.10363200000000106, 0.12583300000000097, -0.0397739999999992, -0.015714999999999257, -0.032969999999998834, 0.006998000000000948, 0.06126900000000157, 0.04118800000000089, 0.040504000000000984, -0.009034999999999238, 0.06737900000000074, 0.14201900000000123, 0.15705600000000097, 0.18117100000000064, 0.2610020000000006, 0.2566990000000007, 0.2948929999999996, 0.25842200000000015, 0.2876139999999998, 0.2755039999999991, 0.2647859999999993, 0.2736729999999994]}, "VEGA TECHNOLOGY": {"dates": ["2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [100.0, 89.761, 86.8399, 80.5138, 90.7004, 87.8422, 80.6433, 81.2893, 86.6578, 75.1114, 85.1203, 88.1479, 95.3448, 92.434, 106.6144, 110.147, 113.7115, 112.2635, 109.0209, 105.4949, 115.9157, 122.1921, 129.879, 139.7965, 142.2006, 138.6548, 143.3179, 152.5841, 146.3679, 146.4938, 151.7779, 153.9704], "returns": [NaN, -0.10238999999999998, -0.13160099999999997, -0.1948620000000001, -0.09299599999999975, -0.12157799999999985, -0.19356700000000016, -0.18710700000000047, -0.13342200000000048, -0.24888600000000027, -0.14879700000000007, -0.11852100000000043, -0.04655200000000037, -0.07566000000000028, 0.06614399999999976, 0.10147000000000017, 0.13711499999999943, 0.12263499999999916, 0.09020899999999954, 0.05494899999999947, 0.15915699999999888, 0.22192099999999892, 0.2987899999999999, 0.3979649999999999, 0.4220060000000001, 0.38654800000000056, 0.43317900000000065, 0.5258410000000013, 0.4636790000000013, 0.46493800000000096, 0.5177790000000011, 0.5397040000000015]}, "VEGA WORLD": {"dates": ["2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [100.0, 98.8441, 96.8238, 92.1508, 99.3769, 96.8017, 91.2476, 98.653, 105.8296, 99.5187, 105.2301, 102.8429, 101.4223, 97.8653, 95.4252, 99.7576, 103.128, 98.3458, 94.948, 89.5582, 94.6833, 100.8551, 98.0188, 100.1238, 102.3913, 100.3999, 102.449, 102.6372, 101.3105, 102.6626, 105.1426, 106.8354], "returns": [NaN, -0.011559000000000208, -0.03176200000000018, -0.0784919999999999, -0.0062309999999995425, -0.03198299999999976, -0.08752399999999971, -0.013469999999999982, 0.058295999999999015, -0.004813000000000511, 0.05230099999999904, 0.028428999999998927, 0.014222999999998764, -0.021347000000001226, -0.045748000000001565, -0.002424000000001314, 0.031279999999999086, -0.016542000000001167, -0.05052000000000112, -0.10441800000000057, -0.05316700000000052, 0.00855099999999931, -0.01981200000000083, 0.0012379999999989622, 0.023912999999999185, 0.0039989999999987536, 0.02448999999999879, 0.026371999999999396, 0.013105000000000144, 0.026625999999999816, 0.051426000000000416, 0.06835400000000047]}, "WVP BOND": {"dates": ["2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [100.3219, 100.5802, 100.7917, 101.0091, 101.2407, 101.4961, 101.4278, 101.9666, 102.2051, 102.8279, 103.2751, 103.451, 104.0742, 104.4366, 104.2184, 103.4872, 104.867, 104.468, 104.8812, 104.0791, 105.0371, 105.4363, 105.1186, 104.8489, 107.5375, 108.3024, 109.5323, 110.1718, 110.1856, 110.9259, 112.0393, 112.7709, 112.9951, 112.6512, 113.3643, 113.6001, 114.6549, 114.0267, 107.8734, 110.6481, 112.2113, 112.6895, 113.0537, 113.3922, 113.4556, 113.9164, 115.7696, 115.7358, 115.9815, 115.758, 116.1975, 116.0345, 116.4081, 117.464, 117.3149, 117.7622, 117.8292, 117.8208, 118.0057, 118.1835, 117.8335, 115.5589, 114.0473, 112.1345, 111.107, 107.5744, 110.1388, 111.3378, 108.0667, 109.1102, 112.2264, 110.6841, 112.0, 111.3765, 111.4039, 110.8513, 111.2845, 112.1815, 113.3076, 113.8209, 113.34, 113.2403, 115.2907, 117.3695, 118.7665, 118.8384, 119.2238, 119.3378, 119.7509, 119.6851, 120.326, 121.336, 122.1903, 122.2868], "returns": [0.003219000000000527, 0.005802000000000751, 0.007917000000001284, 0.01009100000000207, 0.012407000000001167, 0.014961000000000446, 0.014278000000000679, 0.019666000000000627, 0.022051000000001153, 0.028279000000001275, 0.03275100000000086, 0.03451000000000026, 0.04074199999999939, 0.04436599999999857, 0.04218399999999778, 0.03487199999999757, 0.04866999999999755, 0.04467999999999761, 0.04881199999999697, 0.04079099999999691, 0.050370999999996835, 0.05436299999999705, 0.05118599999999751, 0.04848899999999734, 0.07537499999999664, 0.08302399999999621, 0.09532299999999627, 0.10171799999999687, 0.10185599999999728, 0.10925899999999755, 0.12039299999999842, 0.1277089999999983, 0.1299509999999986, 0.12651199999999907, 0.1336429999999995, 0.13600099999999893, 0.14654899999999849, 0.14026699999999837, 0.0787339999999983, 0.10648099999999938, 0.12211299999999903, 0.1268949999999991, 0.1305369999999999, 0.13392200000000032, 0.13455600000000012, 0.13916400000000007, 0.15769600000000072, 0.15735800000000144, 0.15981500000000182, 0.1575800000000025, 0.16197500000000242, 0.16034500000000174, 0.16408100000000259, 0.17464000000000213, 0.17314900000000155, 0.1776220000000015, 0.17829200000000212, 0.17820800000000192, 0.18005700000000235, 0.18183500000000286, 0.17833500000000302, 0.15558900000000309, 0.14047300000000318, 0.12134500000000314, 0.11107000000000289, 0.0757440000000027, 0.1013880000000027, 0.11337800000000287, 0.08066700000000204, 0.09110200000000179, 0.12226400000000148, 0.10684100000000196, 0.12000000000000144, 0.11376500000000145, 0.11403900000000045, 0.10851300000000164, 0.11284500000000164, 0.121815000000002, 0.13307600000000175, 0.13820900000000136, 0.13340000000000174, 0.1324030000000016, 0.15290700000000168, 0.1736950000000017, 0.18766500000000197, 0.18838400000000233, 0.19223800000000235, 0.19337800000000316, 0.19750900000000304, 0.19685100000000277, 0.20326000000000266, 0.21336000000000288, 0.2219030000000033, 0.22286800000000317]}, "WVP Cash Deposit": {"dates": ["2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [100.2749, 100.5608, 100.8011, 101.0794, 101.3195, 101.6008, 101.7686, 101.8798, 102.0304, 102.2689, 102.4114, 102.5578, 102.7393, 102.9278, 103.0822, 103.2552, 103.4305, 103.6085, 103.7795, 103.8815, 104.0884, 104.3, 104.54, 104.7041, 104.9145, 105.2277, 105.356, 105.6116, 105.7762, 106.002, 106.1929, 106.3309, 106.5453, 106.6398, 106.8195, 107.0418, 107.1518, 107.3366, 107.5321, 107.6362, 107.7964, 107.9691, 108.1103, 108.2685, 108.4257, 108.5842, 108.749, 108.9067, 109.0669, 109.2564, 109.3633, 109.5444, 109.6696, 109.8225, 109.9882, 110.1046, 110.2303, 110.3429, 110.4465, 110.551, 110.6196, 110.7997, 110.9266, 111.0479, 111.1512, 111.2542, 111.3362, 111.4261, 111.3638, 111.4699, 111.5829, 111.6947, 111.7886, 111.8695, 111.9529, 112.0119, 112.0691, 112.1466, 112.3254, 112.2638, 112.3711, 112.5754, 112.6497, 112.75, 112.8224, 112.9814, 113.1034, 113.2231, 113.2401, 113.4648, 113.6827, 113.7037, 113.8348, 113.9671, 114.2231, 114.3793, 114.4422, 114.7486, 114.9248, 115.1275, 115.2041, 115.4227, 115.7444, 115.8922, 116.0998, 116.3331, 116.5706, 116.8065, 117.0545, 117.4085, 117.6545, 117.7894, 118.0237, 118.3037, 118.524, 118.7326, 118.9677, 119.2113, 119.2574], "returns": [0.002625677041724117, 0.005484325427973058, 0.007887029895323971, 0.010669687628423574, 0.013070392341743009, 0.015883046385296362, 0.017560840016679347, 0.018672703257500256, 0.020178518042281768, 0.022563224723360475, 0.023988049469917172, 0.02545186942006339, 0.02726664620251862, 0.02915141437603319, 0.030695224487389483, 0.03242501172356049, 0.0341777961310783, 0.035957577218004744, 0.03766736691387185, 0.03868724146930136, 0.04075598701359917, 0.042871726777608865, 0.04527143161391489, 0.046912229795738725, 0.049015971035564876, 0.05214758584694379, 0.05343042805735121, 0.05598611370801598, 0.05763191127491574, 0.05988963357507271, 0.061798398796951926, 0.06317822907782755, 0.06532196539826085, 0.06626684917755532, 0.06806362817373923, 0.07028635477836631, 0.07138621949500612, 0.07323399221896154, 0.07518875178353635, 0.0762296237562834, 0.07783142673451704, 0.07955821433964227, 0.08097004068500224, 0.08255184612293243, 0.0841236527907121, 0.08570845785968872, 0.08735625518061796, 0.088933061233474, 0.0905348642117072, 0.09242963115537384, 0.09349849968454382, 0.09530927695893943, 0.09656112298187924, 0.09808993493800866, 0.09974673115207522, 0.10091058799768327, 0.10216743340569767, 0.10329329492473005, 0.10432916751240251, 0.1053740389932103, 0.10605995462558737, 0.1078607331298318, 0.10912957706202753, 0.11034242788137694, 0.11137530083800362, 0.11240517416358453, 0.11322507331598897, 0.11412396275258807, 0.11350103937216427, 0.11456190888521256, 0.11569176991230479, 0.11680963241521725, 0.11774851693242172, 0.1185574174376598, 0.1193913148682757, 0.11998124230720109, 0.12055317195985427, 0.12132807664657763, 0.12311585674962555, 0.1224999325083076, 0.12357280054553899, 0.12561554928744423, 0.12635845790968303, 0.12736133455585485, 0.12808524551480716, 0.12967504996885904, 0.13089489992731296, 0.13209175271442097, 0.13226173180699208, 0.13450845545998336, 0.13668718747594633, 0.1368971616491237, 0.13820800041595538, 0.13953083770696906, 0.1420905228656939, 0.1436523307633224, 0.1442812534058373, 0.1473448765801868, 0.14910665988084015, 0.15113341059050378, 0.1518993163840907, 0.15408504753915797, 0.15730165189682266, 0.15877947012518012, 0.16085521480858378, 0.16318792788487535, 0.16556263579580244, 0.16792134567448747, 0.1704010406720038, 0.17394060530555522, 0.17640030276276764, 0.1777491368561741, 0.18009184870261774, 0.18289150434497303, 0.18509423340929843, 0.18717997686285393, 0.18953068772541815, 0.1919663881342688, 0.1924273314382423]}, "WVP Dividend Akcii": {"dates": ["2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [96.5033, 99.0572, 107.4064, 107.6791, 109.1221, 113.6071, 114.8684, 117.2899, 112.7789, 117.6962, 117.9762, 123.9433, 123.6599, 118.2788, 122.1727, 120.2361, 118.422, 110.898, 120.2023, 116.7336, 110.0956, 114.0852, 120.2464, 112.7185, 119.5587, 119.8843, 122.3172, 121.8851, 123.5768, 128.7702, 132.6754, 131.7163, 129.0286, 125.0765, 129.0921, 134.7551, 140.1388, 147.1809, 152.2371, 147.1054, 149.6635, 153.4235, 154.2214, 154.3758, 154.3211, 155.4182], "returns": [-0.03588483763457195, -0.010370127638488547, 0.0730424635746767, 0.07576686993981685, 0.09018314564534591, 0.13499048905442024, 0.1475914928987594, 0.17178346214403795, 0.1267163660195485, 0.17584259784684875, 0.17863993478208617, 0.2382541820187165, 0.2354228774206939, 0.18166305676995353, 0.2205650220989599, 0.20121744099616867, 0.18309369480254478, 0.1079252551570884, 0.2008797624661307, 0.1662257530830631, 0.0999088867398219, 0.13976694187133698, 0.20132034303343116, 0.12611294048066113, 0.19444988371070626, 0.1977027869468253, 0.2220086477673242, 0.2176917574469095, 0.23459266778027188, 0.28647727363549746, 0.32549213149081924, 0.31591025343872436, 0.28905881600715966, 0.24957540421518565, 0.2896932120621154, 0.346269351577297, 0.40005514749957927, 0.47040917046971265, 0.5209230812266719, 0.4696548885461027, 0.4952115585962138, 0.5327757974408329, 0.540747208657355, 0.542289740167357, 0.5417432604160806, 0.5527038259576855]}, "WVP Etiks Akcii": {"dates": ["2024-08-31", "2024-09-30", "2024-10-31"], "prices": [99.8231, 99.7004, 99.471], "returns": [-0.0016751574648016243, -0.002902272813644302, -0.00519648846991605]}, "WVP Premium Akcii": {"dates": ["2014-12-31", "2015-01-31", "2015-02-28", "2015-03-31", "2015-04-30", "2015-05-31", "2015-06-30", "2015-07-31", "2015-08-31", "2015-09-30", "2015-10-31", "2015-11-30", "2015-12-31", "2016-01-31", "2016-02-29", "2016-03-31", "2016-04-30", "2016-05-31", "2016-06-30", "2016-07-31", "2016-08-31", "2016-09-30", "2016-10-31", "2016-11-30", "2016-12-31", "2017-01-31", "2017-02-28", "2017-03-31", "2017-04-30", "2017-05-31", "2017-06-30", "2017-07-31", "2017-08-31", "2017-09-30", "2017-10-31", "2017-11-30", "2017-12-31", "2018-01-31", "2018-02-28", "2018-03-31", "2018-04-30", "2018-05-31", "2018-06-30", "2018-07-31", "2018-08-31", "2018-09-30", "2018-10-31", "2018-11-30", "2018-12-31", "2019-01-31", "2019-02-28", "2019-03-31", "2019-04-30", "2019-05-31", "2019-06-30", "2019-07-31", "2019-08-31", "2019-09-30", "2019-10-31", "2019-11-30", "2019-12-31", "2020-01-31", "2020-02-29", "2020-03-31", "2020-04-30", "2020-05-31", "2020-06-30", "2020-07-31", "2020-08-31", "2020-09-30", "2020-10-31", "2020-11-30", "2020-12-31", "2021-01-31", "2021-02-28", "2021-03-31", "2021-04-30", "2021-05-31", "2021-06-30", "2021-07-31", "2021-08-31", "2021-09-30", "2021-10-31", "2021-11-30", "2021-12-31", "2022-01-31", "2022-02-28", "2022-03-31", "2022-04-30", "2022-05-31", "2022-06-30", "2022-07-31", "2022-08-31", "2022-09-30", "2022-10-31", "2022-11-30", "2022-12-31", "2023-01-31", "2023-02-28", "2023-03-31", "2023-04-30", "2023-05-31", "2023-06-30", "2023-07-31", "2023-08-31", "2023-09-30", "2023-10-31", "2023-11-30", "2023-12-31", "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30", "2024-07-31", "2024-08-31", "2024-09-30", "2024-10-31"], "prices": [99.9154, 101.9756, 105.0959, 107.308, 105.5012, 106.1683, 102.2545, 105.1355, 97.5079, 95.2064, 103.6299, 106.782, 101.5368, 95.0238, 93.1045, 95.6786, 96.1897, 98.4437, 95.8904, 98.5712, 99.2025, 98.9911, 98.9769, 100.593, 105.7232, 105.501, 108.6727, 110.5796, 110.6401, 110.6873, 108.1263, 106.7006, 106.4055, 110.9424, 114.1297, 113.3031, 112.893, 115.4669, 110.3041, 107.0102, 110.9576, 111.8004, 110.8022, 114.8619, 112.7312, 113.8349, 108.874, 108.7301, 101.0506, 107.4753, 111.1145, 113.4059, 117.7046, 111.9812, 117.2638, 117.8991, 116.5595, 120.4925, 121.3666, 125.2273, 126.3717, 125.3886, 114.2643, 99.9685, 107.6836, 109.9394, 112.874, 111.2195, 115.1375, 111.9621, 104.9499, 118.8964, 120.5953, 118.8892, 121.5737, 130.7225, 132.8516, 135.4126, 138.5928, 139.7571, 142.5561, 138.6161, 145.616, 143.1516, 150.6171, 147.8755, 141.2954, 144.0824, 142.8294, 141.3371, 132.2591, 142.2081, 136.4379, 128.7564, 138.5286, 146.5911, 139.0147, 146.8644, 148.2817, 150.4649, 153.6651, 151.5082, 155.6832, 157.9204, 156.2665, 152.5638, 148.9581, 156.673, 161.4091, 166.9993, 172.4888, 177.9752, 174.0458, 178.4437, 179.966, 180.8793, 182.8571, 181.4768, 180.3629], "returns": [-0.0008469991530013488, 0.019754980245018983, 0.050957949042049755, 0.07307892692107276, 0.055010944989053234, 0.06168193831805935, 0.022543977456020103, 0.05135394864604792, -0.02492197507802807, -0.04793695206305104, 0.03629796370203242, 0.06781893218106361, 0.015366984633012004, -0.049762950237053016, -0.06895593104407205, -0.04321495678504661, -0.03810396189604104, -0.015563984436018585, -0.04109695890304421, -0.014288985711017221, -0.007975992024011225, -0.010089989910012864, -0.010231989768013539, 0.005928994071002114, 0.05723094276905427, 0.055008944991052244, 0.08672591327408341, 0.10579489420510257, 0.10639989360010316, 0.10687189312810297, 0.08126191873807742, 0.06700493299506283, 0.06405393594606035, 0.10942289057710508, 0.1412958587041364, 0.13302986697012775, 0.1289288710711225, 0.15466784533214795, 0.10303989696009652, 0.07010092989906358, 0.10957489042510282, 0.11800288199711062, 0.10802089197910081, 0.14861785138214145, 0.12731087268911923, 0.13834786165213053, 0.08873891126108124, 0.08729991270007997, 0.01050498949500378, 0.07475192524806751, 0.11114388885610338, 0.1340578659421261, 0.17704482295516888, 0.11981088018911201, 0.17263682736316488, 0.17898982101017058, 0.16559383440615738, 0.20492379507619685, 0.21366478633520591, 0.2522717477282448, 0.2637157362842568, 0.25388474611524714, 0.14264185735813673, -0.0003159996840054191, 0.07683492316507157, 0.09939290060709416, 0.12873887126112282, 0.11219388780610551, 0.151373848626144, 0.11961988038011229, 0.049497950502042753, 0.18896281103718082, 0.20595179404819808, 0.1888908111091805, 0.21573578426420692, 0.30722369277629746, 0.3285146714853189, 0.35412464587534376, 0.3859266140733757, 0.3975696024303865, 0.4255595744404146, 0.38615961384037556, 0.4561585438414453, 0.4315145684854209, 0.5061694938304957, 0.4787535212464682, 0.4129525870474029, 0.44082255917742974, 0.4282925717074175, 0.4133695866304026, 0.32258967741031297, 0.42207957792041184, 0.3643776356223549, 0.2875627124372786, 0.3852846147153757, 0.46590953409045666, 0.39014560985438096, 0.4686425313574585, 0.4828155171844719, 0.5046474953524935, 0.5366494633505254, 0.5150804849195034, 0.5568304431695439, 0.5792024207975655, 0.5626634373365498, 0.5256364743635125, 0.48957951042047654, 0.5667284332715523, 0.614089385910598, 0.6699913300086537, 0.7248862751137077, 0.779750220249763, 0.7404562595437243, 0.7844352155647685, 0.7996582003417838, 0.8087911912087917, 0.8285691714308114, 0.8147661852337984, 0.8036271963727872]}}, "top5Year": [{"fund": "KB Invest - MBI 10", "five_year_return": 0.14996839724442568}, {"fund": "Grawe Global", "five_year_return": 0.09457071973381548}, {"fund": "WVP Dividend Akcii", "five_year_return": 0.0919876448446717}, {"fund": "WVP Premium Akcii", "five_year_return": 0.09150796021668417}, {"fund": "VEGA TECHNOLOGY", "five_year_return": 0.09015298328664789}], "top10Year": [{"fund": "KB Invest - MBI 10", "ten_year_return": 0.13936561425111926}, {"fund": "KB Invest - Balanced", "ten_year_return": 0.07097777547216544}, {"fund": "WVP Premium Akcii", "ten_year_return": 0.06075399854563379}, {"fund": "NLB Top Brands", "ten_year_return": 0.057160969237791015}, {"fund": "Grawe Global", "ten_year_return": 0.04843521155136088}], "topYTD": [{"fund": "KB Invest - MBI 10", "ytd_return": 0.40476722121034325}, {"fund": "VEGA TECHNOLOGY", "ytd_return": 0.2601859377135669}, {"fund": "KB Invest - Zlaten Fond", "ytd_return": 0.25225067625953335}, {"fund": "NLB BRIK", "ytd_return": 0.19174629102641116}, {"fund": "NLB Amerika", "ytd_return": 0.17237015483380436}], "bottom5Year": [{"fund": "Innovo Status Solar", "five_year_return": -0.10419934679738907}, {"fund": "KB Invest - Bonds", "five_year_return": -0.0025649822092852492}, {"fund": "WVP Etiks Akcii", "five_year_return": -0.0010414647334947569}, {"fund": "NLB Global Emerging Markets", "five_year_return": 0.00406975423591982}, {"fund": "NLB Cash Fund", "five_year_return": 0.007349726854597005}], "bottom10Year": [{"fund": "Innovo Status Solar", "ten_year_return": -0.053532539807833124}, {"fund": "WVP Etiks Akcii", "ten_year_return": -0.0005208680184937142}, {"fund": "VEGA CASH", "ten_year_return": 0.0059700339024229}, {"fund": "KB Invest - Zlaten Fond", "ten_year_return": 0.0064609030775864}, {"fund": "VEGA WORLD", "ten_year_return": 0.0066338215923607}], "bottomYTD": [{"fund": "Innovo Status Solar", "ytd_return": -0.24290306111065174}, {"fund": "WVP Etiks Akcii", "ytd_return": -0.005196488469916161}, {"fund": "NLB Cash Deposit", "ytd_return": 0.0174713865467766}, {"fund": "WVP Cash Deposit", "ytd_return": 0.018754164459859002}, {"fund": "KB Invest Paricen", "ytd_return": 0.018853073080118854}], "sp500": {"ytd_return": 0.20035819500996577, "5y_return": 0.18121589659771642, "10y_return": 0.11397668043219289}};
\ No newline at end of file
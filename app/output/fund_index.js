@@ -0,0 +1 @@
+const fundData = {"fundList": ["Grawe Flex Bond Eur", "Grawe Global", "Innovo Status Balansiran", "Innovo Status Solar", "KB Invest - Akcii", "KB Invest - Balanced", "KB Invest - Bonds", "KB Invest - MBI 10", "KB Invest - Zlaten Fond", "KB Invest Paricen", "NLB Amerika", "NLB BRIK", "NLB Cash Deposit", "NLB Cash Fund", "NLB Global Emerging Markets", "NLB South-East Europe", "NLB Top Brands", "VEGA CASH", "VEGA FINANCE", "VEGA TECHNOLOGY", "VEGA WORLD", "WVP BOND", "WVP Cash Deposit", "WVP Dividend Akcii", "WVP Etiks Akcii", "WVP Premium Akcii"], "fundMetrics": [{"fund": "Grawe Flex Bond Eur", "current_price": 111.2406, "ytd_return": 0.04090713013795422, "five_year_return": 0.02154015825082478, "ten_year_return": 0.010712698174325297, "sharpe_ratio": 1.127030291148486, "max_drawdown": -0.03638035828534869, "ytd_vs_sp500": -0.1594511266267764, "five_year_vs_sp500": -0.1596757370514741, "ten_year_vs_sp500": -0.1032639862140372}, {"fund": "Grawe Global", "current_price": 160.4456, "ytd_return": 0.15764706561430564, "five_year_return": 0.09457071973381548, "ten_year_return": 0.04843521155136088, "sharpe_ratio": 0.3663719651792873, "max_drawdown": -0.31908983981567074, "ytd_vs_sp500": -0.04271119115042499, "five_year_vs_sp500": -0.08664517556848339, "ten_year_vs_sp500": -0.06554147283700162}, {"fund": "Innovo Status Balansiran", "current_price": 42.2005, "ytd_return": 0.12611843316619664, "five_year_return": 0.030523809583167916, "ten_year_return": 0.038131674620946576, "sharpe_ratio": 0.17258125145285613, "max_drawdown": -0.11849344168689502, "ytd_vs_sp500": -0.07423982359853398, "five_year_vs_sp500": -0.15069208571913095, "ten_year_vs_sp500": -0.07584500976741593}, {"fund": "Innovo Status Solar", "current_price": 57.6842, "ytd_return": -0.24290306111065174, "five_year_return": -0.10419934679738907, "ten_year_return": -0.053532539807833124, "sharpe_ratio": -0.8453329292337952, "max_drawdown": -0.4834656556776701, "ytd_vs_sp500": -0.44326131787538237, "five_year_vs_sp500": -0.28541524209968794, "ten_year_vs_sp500": -0.16750922419619563}, {"fund": "KB Invest - Akcii", "current_price": 115.8008, "ytd_return": 0.12021096193340486, "five_year_return": 0.029759889474844536, "ten_year_return": 0.01477085564911862, "sharpe_ratio": 0.13801148201559127, "max_drawdown": -0.1702613292455435, "ytd_vs_sp500": -0.08014729483132577, "five_year_vs_sp500": -0.15145600582745433, "ten_year_vs_sp500": -0.09920582873924388}, {"fund": "KB Invest - Balanced", "current_price": 217.6559, "ytd_return": 0.14904866206637335, "five_year_return": 0.057873182159325465, "ten_year_return": 0.07097777547216544, "sharpe_ratio": 0.6058863621928993, "max_drawdown": -0.1625948261494874, "ytd_vs_sp500": -0.051309594698357275, "five_year_vs_sp500": -0.1233427131429734, "ten_year_vs_sp500": -0.042998908916197065}, {"fund": "KB Invest - Bonds", "current_price": 151.3054, "ytd_return": 0.04422511668609408, "five_year_return": -0.0025649822092852492, "ten_year_return": 0.023270305709358396, "sharpe_ratio": -0.08523446853492632, "max_drawdown": -0.21927587454568453, "ytd_vs_sp500": -0.15613314007863655, "five_year_vs_sp500": -0.18378087751158412, "ten_year_vs_sp500": -0.09070637867900411}, {"fund": "KB Invest - MBI 10", "current_price": 368.6643, "ytd_return": 0.40476722121034325, "five_year_return": 0.14996839724442568, "ten_year_return": 0.13936561425111926, "sharpe_ratio": 1.0725969681419396, "max_drawdown": -0.33202683963842994, "ytd_vs_sp500": 0.20440896444561263, "five_year_vs_sp500": -0.03124749805787319, "ten_year_vs_sp500": 0.02538892986275676}, {"fund": "KB Invest - Zlaten Fond", "current_price": 106.6597, "ytd_return": 0.25225067625953335, "five_year_return": 0.012963549423750553, "ten_year_return": 0.0064609030775864, "sharpe_ratio": 0.07760900498698141, "max_drawdown": -0.3878052865234195, "ytd_vs_sp500": 0.05189241949480272, "five_year_vs_sp500": -0.16825234587854832, "ten_year_vs_sp500": -0.1075157813107761}, {"fund": "KB Invest Paricen", "current_price": 139.5358, "ytd_return": 0.018853073080118854, "five_year_return": 0.018593728604229254, "ten_year_return": 0.02218310005102264, "sharpe_ratio": -4.893009381847238, "max_drawdown": -0.0013418921582047938, "ytd_vs_sp500": -0.18150518368461177, "five_year_vs_sp500": -0.16262216669806961, "ten_year_vs_sp500": -0.09179358433733986}, {"fund": "NLB Amerika", "current_price": 164.0657, "ytd_return": 0.17237015483380436, "five_year_return": 0.06417199810114327, "ten_year_return": 0.03638359704830041, "sharpe_ratio": 0.10920659346309701, "max_drawdown": -0.252158164568151, "ytd_vs_sp500": -0.027988101930926268, "five_year_vs_sp500": -0.1170438972011556, "ten_year_vs_sp500": -0.0775930873400621}, {"fund": "NLB BRIK", "current_price": 167.22, "ytd_return": 0.19174629102641116, "five_year_return": 0.008095228323262038, "ten_year_return": 0.016769468042022728, "sharpe_ratio": 0.01059717271205604, "max_drawdown": -0.3332363915685085, "ytd_vs_sp500": -0.00861196573831946, "five_year_vs_sp500": -0.17312066697903683, "ten_year_vs_sp500": -0.09720721634633978}, {"fund": "NLB Cash Deposit", "current_price": 131.329, "ytd_return": 0.0174713865467766, "five_year_return": 0.016894904082980222, "ten_year_return": 0.01936737950748424, "sharpe_ratio": -12.208504910211685, "max_drawdown": -0.0008167061967382372, "ytd_vs_sp500": -0.18288687021795402, "five_year_vs_sp500": -0.16432099121931865, "ten_year_vs_sp500": -0.09460930488087826}, {"fund": "NLB Cash Fund", "current_price": 1230.8199, "ytd_return": NaN, "five_year_return": 0.007349726854597005, "ten_year_return": 0.014332126568335601, "sharpe_ratio": -6.256270843061087, "max_drawdown": -0.0015680401444782, "ytd_vs_sp500": NaN, "five_year_vs_sp500": -0.17386616844770186, "ten_year_vs_sp500": -0.0996445578200269}, {"fund": "NLB Global Emerging Markets", "current_price": 74.7264, "ytd_return": NaN, "five_year_return": 0.00406975423591982, "ten_year_return": 0.0431410718571037, "sharpe_ratio": 0.2161666862235038, "max_drawdown": -0.20906932478960405, "ytd_vs_sp500": NaN, "five_year_vs_sp500": -0.17714614106637905, "ten_year_vs_sp500": -0.07083561253125881}, {"fund": "NLB South-East Europe", "current_price": 61.5056, "ytd_return": NaN, "five_year_return": 0.00832482227055853, "ten_year_return": 0.036082148921761314, "sharpe_ratio": 0.216158552813741, "max_drawdown": -0.27425634215805716, "ytd_vs_sp500": NaN, "five_year_vs_sp500": -0.17289107303174034, "ten_year_vs_sp500": -0.07789453546660119}, {"fund": "NLB Top Brands", "current_price": 174.7948, "ytd_return": 0.11706956073831032, "five_year_return": 0.057780094536207915, "ten_year_return": 0.057160969237791015, "sharpe_ratio": 0.23766460505909473, "max_drawdown": -0.18980660116072445, "ytd_vs_sp500": -0.0832886960264203, "five_year_vs_sp500": -0.12343580076609095, "ten_year_vs_sp500": -0.05681571515057149}, {"fund": "VEGA CASH", "current_price": 106.133, "ytd_return": 0.022357723577235644, "five_year_return": 0.011975709109641741, "ten_year_return": 0.0059700339024229, "sharpe_ratio": -9.345790430069092, "max_drawdown": -0.00019419665844444545, "ytd_vs_sp500": -0.17800053318749498, "five_year_vs_sp500": -0.16924018619265713, "ten_year_vs_sp500": -0.1080066504859396}, {"fund": "VEGA FINANCE", "current_price": 127.3673, "ytd_return": 0.11538532269971524, "five_year_return": 0.0495704344998007, "ten_year_return": 0.024485448652054043, "sharpe_ratio": 0.4011896520915464, "max_drawdown": -0.18614217206281924, "ytd_vs_sp500": -0.08497293406501538, "five_year_vs_sp500": -0.13164546080249817, "ten_year_vs_sp500": -0.08949123573630846}, {"fund": "VEGA TECHNOLOGY", "current_price": 153.9704, "ytd_return": 0.2601859377135669, "five_year_return": 0.09015298328664789, "ten_year_return": 0.04410391402707026, "sharpe_ratio": 0.5223184432247858, "max_drawdown": -0.2662300000000001, "ytd_vs_sp500": 0.05982768094883628, "five_year_vs_sp500": -0.09106291201565098, "ten_year_vs_sp500": -0.06987277036129225}, {"fund": "VEGA WORLD", "current_price": 106.8354, "ytd_return": 0.059394699030300924, "five_year_return": 0.013311650773640604, "ten_year_return": 0.0066338215923607, "sharpe_ratio": 0.057759076775409264, "max_drawdown": -0.18004064950354282, "ytd_vs_sp500": -0.1409635577344297, "five_year_vs_sp500": -0.16790424452865826, "ten_year_vs_sp500": -0.1073428627960018}, {"fund": "WVP BOND", "current_price": 122.2868, "ytd_return": 0.04183908281001458, "five_year_return": 0.01657510447155519, "ten_year_return": 0.0203236612938138, "sharpe_ratio": -0.03468827867588142, "max_drawdown": -0.09752017692216375, "ytd_vs_sp500": -0.15851917395471604, "five_year_vs_sp500": -0.16464079083074368, "ten_year_vs_sp500": -0.0936530230945487}, {"fund": "WVP Cash Deposit", "current_price": 119.2574, "ytd_return": 0.018754164459859002, "five_year_return": 0.015606615174013738, "ten_year_return": 0.017754877061214147, "sharpe_ratio": -0.05224604456070395, "max_drawdown": -0.19529220271073966, "ytd_vs_sp500": -0.18160409230487162, "five_year_vs_sp500": -0.16560928012828513, "ten_year_vs_sp500": -0.09622180732714836}, {"fund": "WVP Dividend Akcii", "current_price": 155.4182, "ytd_return": 0.1534117769292711, "five_year_return": 0.0919876448446717, "ten_year_return": 0.04498212656708711, "sharpe_ratio": 0.563027057018297, "max_drawdown": -0.13447078154033376, "ytd_vs_sp500": -0.04694647983545952, "five_year_vs_sp500": -0.08922825045762717, "ten_year_vs_sp500": -0.06899455782127539}, {"fund": "WVP Etiks Akcii", "current_price": 99.471, "ytd_return": -0.005196488469916161, "five_year_return": -0.0010414647334947569, "ten_year_return": -0.0005208680184937142, "sharpe_ratio": -0.42804345723280995, "max_drawdown": -0.039381701879976694, "ytd_vs_sp500": -0.20555474523464679, "five_year_vs_sp500": -0.18225736003579363, "ten_year_vs_sp500": -0.11449755240685622}, {"fund": "WVP Premium Akcii", "current_price": 180.3629, "ytd_return": 0.11749701051431538, "five_year_return": 0.09150796021668417, "ten_year_return": 0.06075399854563379, "sharpe_ratio": 0.2371858474324076, "max_drawdown": -0.33047023363590433, "ytd_vs_sp500": -0.08286124625041524, "five_year_vs_sp500": -0.0897079350856147, "ten_year_vs_sp500": -0.05322268584272871}], "top5Year": [{"fund": "KB Invest - MBI 10", "five_year_return": 0.14996839724442568}, {"fund": "Grawe Global", "five_year_return": 0.09457071973381548}, {"fund": "WVP Dividend Akcii", "five_year_return": 0.0919876448446717}, {"fund": "WVP Premium Akcii", "five_year_return": 0.09150796021668417}, {"fund": "VEGA TECHNOLOGY", "five_year_return": 0.09015298328664789}], "top10Year": [{"fund": "KB Invest - MBI 10", "ten_year_return": 0.13936561425111926}, {"fund": "KB Invest - Balanced", "ten_year_return": 0.07097777547216544}, {"fund": "WVP Premium Akcii", "ten_year_return": 0.06075399854563379}, {"fund": "NLB Top Brands", "ten_year_return": 0.057160969237791015}, {"fund": "Grawe Global", "ten_year_return": 0.04843521155136088}], "topYTD": [{"fund": "KB Invest - MBI 10", "ytd_return": 0.40476722121034325}, {"fund": "VEGA TECHNOLOGY", "ytd_return": 0.2601859377135669}, {"fund": "KB Invest - Zlaten Fond", "ytd_return": 0.25225067625953335}, {"fund": "NLB BRIK", "ytd_return": 0.19174629102641116}, {"fund": "NLB Amerika", "ytd_return": 0.17237015483380436}], "bottom5Year": [{"fund": "Innovo Status Solar", "five_year_return": -0.10419934679738907}, {"fund": "KB Invest - Bonds", "five_year_return": -0.0025649822092852492}, {"fund": "WVP Etiks Akcii", "five_year_return": -0.0010414647334947569}, {"fund": "NLB Global Emerging Markets", "five_year_return": 0.00406975423591982}, {"fund": "NLB Cash Fund", "five_year_return": 0.007349726854597005}], "bottom10Year": [{"fund": "Innovo Status Solar", "ten_year_return": -0.053532539807833124}, {"fund": "WVP Etiks Akcii", "ten_year_return": -0.0005208680184937142}, {"fund": "VEGA CASH", "ten_year_return": 0.0059700339024229}, {"fund": "KB Invest - Zlaten Fond", "ten_year_return": 0.0064609030775864}, {"fund": "VEGA WORLD", "ten_year_return": 0.0066338215923607}], "bottomYTD": [{"fund": "Innovo Status Solar", "ytd_return": -0.24290306111065174}, {"fund": "WVP Etiks Akcii", "ytd_return": -0.005196488469916161}, {"fund": "NLB Cash Deposit", "ytd_return": 0.0174713865467766}, {"fund": "WVP Cash Deposit", "ytd_return": 0.018754164459859002}, {"fund": "KB Invest Paricen", "ytd_return": 0.018853073080118854}], "sp500": {"ytd_return": 0.20035825676473062, "5y_return": 0.18121589530229887, "10y_return": 0.1139766843883625}, "benchmarks": {"sp500": {"ytd_return": 0.20035825676473062, "5y_return": 0.18121589530229887, "10y_return": 0.1139766843883625}, "mbi10": {"ytd_return": 0.40476722121034325, "5y_return": 0.2062321113321519, "10y_return": NaN}}, "seriesFiles": {"Grawe Flex Bond Eur": {"daily": "output/funds/daily/Grawe_Flex_Bond_Eur.js", "weekly": "output/funds/Grawe_Flex_Bond_Eur.js", "lttb": "output/funds/Grawe_Flex_Bond_Eur.js", "monthly": "output/funds/Grawe_Flex_Bond_Eur.js"}, "Grawe Global": {"daily": "output/funds/daily/Grawe_Global.js", "weekly": "output/funds/Grawe_Global.js", "lttb": "output/funds/Grawe_Global.js", "monthly": "output/funds/Grawe_Global.js"}, "Innovo Status Balansiran": {"daily": "output/funds/daily/Innovo_Status_Balansiran.js", "weekly": "output/funds/Innovo_Status_Balansiran.js", "lttb": "output/funds/Innovo_Status_Balansiran.js", "monthly": "output/funds/Innovo_Status_Balansiran.js"}, "Innovo Status Solar": {"daily": "output/funds/daily/Innovo_Status_Solar.js", "weekly": "output/funds/Innovo_Status_Solar.js", "lttb": "output/funds/Innovo_Status_Solar.js", "monthly": "output/funds/Innovo_Status_Solar.js"}, "KB Invest - Akcii": {"daily": "output/funds/daily/KB_Invest_-_Akcii.js", "weekly": "output/funds/KB_Invest_-_Akcii.js", "lttb": "output/funds/KB_Invest_-_Akcii.js", "monthly": "output/funds/KB_Invest_-_Akcii.js"}, "KB Invest - Balanced": {"daily": "output/funds/daily/KB_Invest_-_Balanced.js", "weekly": "output/funds/KB_Invest_-_Balanced.js", "lttb": "output/funds/KB_Invest_-_Balanced.js", "monthly": "output/funds/KB_Invest_-_Balanced.js"}, "KB Invest - Bonds": {"daily": "output/funds/daily/KB_Invest_-_Bonds.js", "weekly": "output/funds/KB_Invest_-_Bonds.js", "lttb": "output/funds/KB_Invest_-_Bonds.js", "monthly": "output/funds/KB_Invest_-_Bonds.js"}, "KB Invest - MBI 10": {"daily": "output/funds/daily/KB_Invest_-_MBI_10.js", "weekly": "output/funds/KB_Invest_-_MBI_10.js", "lttb": "output/funds/KB_Invest_-_MBI_10.js", "monthly": "output/funds/KB_Invest_-_MBI_10.js"}, "KB Invest - Zlaten Fond": {"daily": "output/funds/daily/KB_Invest_-_Zlaten_Fond.js", "weekly": "output/funds/KB_Invest_-_Zlaten_Fond.js", "lttb": "output/funds/KB_Invest_-_Zlaten_Fond.js", "monthly": "output/funds/KB_Invest_-_Zlaten_Fond.js"}, "KB Invest Paricen": {"daily": "output/funds/daily/KB_Invest_Paricen.js", "weekly": "output/funds/KB_Invest_Paricen.js", "lttb": "output/funds/KB_Invest_Paricen.js", "monthly": "output/funds/KB_Invest_Paricen.js"}, "NLB Amerika": {"daily": "output/funds/daily/NLB_Amerika.js", "weekly": "output/funds/NLB_Amerika.js", "lttb": "output/funds/NLB_Amerika.js", "monthly": "output/funds/NLB_Amerika.js"}, "NLB BRIK": {"daily": "output/funds/daily/NLB_BRIK.js", "weekly": "output/funds/NLB_BRIK.js", "lttb": "output/funds/NLB_BRIK.js", "monthly": "output/funds/NLB_BRIK.js"}, "NLB Cash Deposit": {"daily": "output/funds/daily/NLB_Cash_Deposit.js", "weekly": "output/funds/NLB_Cash_Deposit.js", "lttb": "output/funds/NLB_Cash_Deposit.js", "monthly": "output/funds/NLB_Cash_Deposit.js"}, "NLB Cash Fund": {"daily": "output/funds/daily/NLB_Cash_Fund.js", "weekly": "output/funds/NLB_Cash_Fund.js", "lttb": "output/funds/NLB_Cash_Fund.js", "monthly": "output/funds/NLB_Cash_Fund.js"}, "NLB Global Emerging Markets": {"daily": "output/funds/daily/NLB_Global_Emerging_Markets.js", "weekly": "output/funds/NLB_Global_Emerging_Markets.js", "lttb": "output/funds/NLB_Global_Emerging_Markets.js", "monthly": "output/funds/NLB_Global_Emerging_Markets.js"}, "NLB South-East Europe": {"daily": "output/funds/daily/NLB_South-East_Europe.js", "weekly": "output/funds/NLB_South-East_Europe.js", "lttb": "output/funds/NLB_South-East_Europe.js", "monthly": "output/funds/NLB_South-East_Europe.js"}, "NLB Top Brands": {"daily": "output/funds/daily/NLB_Top_Brands.js", "weekly": "output/funds/NLB_Top_Brands.js", "lttb": "output/funds/NLB_Top_Brands.js", "monthly": "output/funds/NLB_Top_Brands.js"}, "VEGA CASH": {"daily": "output/funds/daily/VEGA_CASH.js", "weekly": "output/funds/VEGA_CASH.js", "lttb": "output/funds/VEGA_CASH.js", "monthly": "output/funds/VEGA_CASH.js"}, "VEGA FINANCE": {"daily": "output/funds/daily/VEGA_FINANCE.js", "weekly": "output/funds/VEGA_FINANCE.js", "lttb": "output/funds/VEGA_FINANCE.js", "monthly": "output/funds/VEGA_FINANCE.js"}, "VEGA TECHNOLOGY": {"daily": "output/funds/daily/VEGA_TECHNOLOGY.js", "weekly": "output/funds/VEGA_TECHNOLOGY.js", "lttb": "output/funds/VEGA_TECHNOLOGY.js", "monthly": "output/funds/VEGA_TECHNOLOGY.js"}, "VEGA WORLD": {"daily": "output/funds/daily/VEGA_WORLD.js", "weekly": "output/funds/VEGA_WORLD.js", "lttb": "output/funds/VEGA_WORLD.js", "monthly": "output/funds/VEGA_WORLD.js"}, "WVP BOND": {"daily": "output/funds/daily/WVP_BOND.js", "weekly": "output/funds/WVP_BOND.js", "lttb": "output/funds/WVP_BOND.js", "monthly": "output/funds/WVP_BOND.js"}, "WVP Cash Deposit": {"daily": "output/funds/daily/WVP_Cash_Deposit.js", "weekly": "output/funds/WVP_Cash_Deposit.js", "lttb": "output/funds/WVP_Cash_Deposit.js", "monthly": "output/funds/WVP_Cash_Deposit.js"}, "WVP Dividend Akcii": {"daily": "output/funds/daily/WVP_Dividend_Akcii.js", "weekly": "output/funds/WVP_Dividend_Akcii.js", "lttb": "output/funds/WVP_Dividend_Akcii.js", "monthly": "output/funds/WVP_Dividend_Akcii.js"}, "WVP Etiks Akcii": {"daily": "output/funds/daily/WVP_Etiks_Akcii.js", "weekly": "output/funds/WVP_Etiks_Akcii.js", "lttb": "output/funds/WVP_Etiks_Akcii.js", "monthly": "output/funds/WVP_Etiks_Akcii.js"}, "WVP Premium Akcii": {"daily": "output/funds/daily/WVP_Premium_Akcii.js", "weekly": "output/funds/WVP_Premium_Akcii.js", "lttb": "output/funds/WVP_Premium_Akcii.js", "monthly": "output/funds/WVP_Premium_Akcii.js"}}};
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("Grawe Flex Bond Eur", {"weekly":{"start":19393,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[999054,-15119,-10456,-6664,-1320,11351,768,6062,633,4184,-1879,-1316,2052,1771,5853,-2028,-4458,3337,1307,4566,6925,-2843,-7009,12800,3745,5207,-1591,2385,-3673,2282,2355,-199,-215,-2966,-10524,-6403,5354,-2337,3523,9914,3297,6626,3382,11104,9218,13506,5137,1949,-5854,3207,-1484,3742,6840,-289,-792,-691,-1197,1709,-1976,2822,508,-75,1672,-634,422,3846,-420,6583,-2019,-128,139,-475,-665,-399,668,2668,385,-158,5481,-1751,2400,9171,1061,2557,2922,2827,212,924],"returnScale":1000000,"returns":[-914,-15120,-10456,-6664,-1320,11351,768,6062,633,4185,-1879,-1316,2052,1771,5853,-2028,-4458,3337,1307,4566,6925,-2843,-7009,12800,3745,5208,-1592,2386,-3674,2283,2355,-199,-215,-2967,-10524,-6403,5354,-2337,3523,9914,3298,6626,3382,11104,9219,13506,5137,1949,-5854,3207,-1484,3742,6840,-289,-792,-691,-1197,1709,-1976,2822,508,-75,1672,-634,422,3847,-420,6583,-2019,-128,139,-475,-665,-399,668,2668,385,-158,5481,-1751,2400,9171,1061,2557,2922,2828,212,924]},"lttb":{"start":19387,"dateDeltas":[1,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,1,2],"priceScale":10000,"prices":[999968,-7927,-1064,9343,-1354,88,-8544,-3113,-1511,2898,-4894,45,-14,-2688,-2809,-5023,33,45,-549,-8365,2886,-730,94,-336,-252,-611,-1688,1522,45,2230,7184,462,1424,7,44,2757,-2294,-803,884,224,-619,940,898,4055,744,44,727,-173,-530,501,64,44,826,2520,726,44,24,88,-1388,248,441,-1312,88,-904,406,-341,-566,44,45,83,1874,-856,863,88,44,-218,1019,1021,-139,44,-330,587,4902,642,9,43,-414,-512,-1794,605,44,247,-1915,-1787,65,-1113,88,-11,945,715,1601,44,43,636,818,-1011,749,71,44,2097,723,54,1610,82,109,1771,1571,2773,658,43,466,475,-1229,-1069,-1529,145,-878,-413,-4199,-1724,103,181,1546,3861,6372,797,43,933,3434,-502,-217,54,43,1991,564,1710,856,86,743,-1014,-1019,-1507,1163,43,262,1793,687,-507,108,42,-2473,60,-1257,-163,160,-833,-18,2373,1171,-454,43,-4,1730,344,168,74,43,-386,-573,67,607,86,178,-378,-233,903,-728,43,-582,-241,-1948,-346,109,42,-4593,-1309,-5822,1164,36,-3927,-2207,-1719,878,529,43,55,1413,2561,1238,44,43,-46,-1725,-380,-246,60,-815,2137,60,2035,63,43,1116,765,1138,6875,-23,43,1475,934,580,185,123,-243,2352,1271,946,2215,85,1090,1298,1196,-287,42,43,1992,4579,735,3748,50,2988,3957,2610,834,-1254,83,-158,1409,1119,11053,41,42,2032,1832,940,147,145,82,41,1117,818,-184,116,42,-1313,-2503,-2164,42,42,-223,-271,1121,1793,745,401,-728,-1038,-524,364,83,1548,-208,757,1562,41,42,1990,3753,1365,-348,38,-1388,1054,681,-119,-560,85,427,-682,-134,896,-1344,45,-46,-969,376,-143,45,46,-802,-203,-88,-233,129,14,448,227,892,83,45,309,-314,-1128,-712,-176,137,-230,538,1455,947,20,-310,-195,887,286,-206,46,45,-1197,944,-9,96,46,1934,-231,-1030,934,65,-795,-2386,796,1280,425,46,853,661,-2031,875,18,46,2587,-426,-207,1801,91,572,2181,-531,-2877,189,46,-558,-99,7663,-478,10,45,-548,-477,-979,-106,91,118,373,-2009,1126,218,46,352,-1,879,-1142,5,46,-1776,2525,-602,-713,91,-158,13,-264,-381,34,91,-143,261,-373,-235,46,45,-1291,958,301,608,46,928,-3,233,1134,376,46,-5,304,307,-340,74,45,22,39,-552,134,156,43,2234,928,945,1288,86,-661,-416,-1059,298,43,44,293,1016,-276,1281,43,675,3156,2971,1031,1296,85,-219,573,559,130,-25,43,68,341,934,1152,19,43,707,1095,320,715,85,834,943,442,518,48,42,352,-447,-68,277,55,462,1343,46,-258,-616,-10],"returnScale":1000000,"returns":[0,-7927,-1064,9343,-1354,88,-8544,-3113,-1511,2898,-4895,45,-14,-2688,-2809,-5023,33,45,-549,-8365,2886,-730,94,-336,-252,-611,-1688,1522,45,2230,7184,462,1424,7,44,2757,-2294,-803,884,224,-619,940,898,4055,744,44,728,-174,-530,501,64,44,827,2520,726,44,24,88,-1388,248,441,-1312,88,-904,406,-341,-566,44,45,83,1874,-856,863,88,44,-218,1019,1021,-139,44,-330,587,4902,642,9,43,-414,-512,-1794,605,44,247,-1915,-1787,65,-1113,88,-11,945,715,1601,44,43,636,818,-1011,749,71,44,2097,723,54,1610,82,109,1771,1571,2773,658,43,466,475,-1229,-1069,-1529,145,-878,-413,-4199,-1724,103,181,1546,3861,6372,797,43,933,3434,-502,-217,54,43,1991,564,1710,857,86,743,-1014,-1020,-1507,1163,43,262,1794,687,-507,108,42,-2474,60,-1257,-163,160,-833,-18,2373,1172,-454,43,-4,1730,344,168,74,43,-386,-573,67,607,86,178,-378,-233,903,-728,43,-582,-241,-1949,-346,109,42,-4593,-1309,-5822,1164,36,-3927,-2207,-1719,878,529,43,55,1413,2561,1238,44,43,-46,-1725,-380,-246,60,-815,2137,60,2035,63,43,1116,765,1138,6875,-23,43,1476,934,580,185,123,-243,2352,1271,946,2215,85,1090,1298,1196,-287,42,43,1992,4579,735,3748,50,2988,3957,2611,834,-1254,83,-158,1409,1119,11053,41,42,2032,1832,940,147,145,82,41,1117,818,-184,116,42,-1313,-2503,-2164,42,42,-223,-271,1121,1793,745,401,-728,-1038,-524,364,83,1548,-208,757,1562,41,42,1990,3753,1365,-348,38,-1388,1054,681,-119,-560,85,427,-682,-134,896,-1344,45,-46,-969,376,-143,45,46,-802,-203,-88,-233,129,14,448,227,892,83,45,309,-314,-1128,-712,-176,137,-230,538,1455,947,20,-310,-195,887,286,-206,46,45,-1197,944,-9,96,46,1934,-231,-1030,934,65,-795,-2386,796,1280,425,46,853,661,-2031,875,18,46,2588,-426,-207,1801,91,572,2181,-531,-2877,189,46,-558,-99,7663,-478,10,45,-548,-477,-979,-106,91,118,373,-2009,1126,218,46,352,-1,879,-1142,5,46,-1776,2525,-602,-713,91,-158,13,-264,-381,34,91,-143,261,-373,-235,46,45,-1291,958,301,608,46,928,-3,233,1134,376,46,-5,304,307,-340,74,45,22,39,-552,134,156,43,2234,928,945,1288,86,-661,-416,-1059,298,43,44,293,1016,-276,1281,43,675,3156,2971,1031,1296,85,-219,573,559,130,-25,43,68,341,934,1152,19,43,707,1095,320,715,85,834,944,442,518,48,42,352,-447,-68,277,55,462,1343,46,-258,-616,-10]},"monthly":{"start":19388,"dateDeltas":[28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[992041,-25814,17974,3149,2103,13813,14000,730,-13663,2062,28644,33608,5354,-1768,2959,3496,5487,-1136,6725,13157,8980,505],"returnScale":1000000,"returns":[-7927,-25815,17974,3150,2103,13813,14001,730,-13664,2062,28645,33609,5354,-1768,2959,3497,5487,-1136,6725,13157,8981,505]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("Grawe Global", {"weekly":{"start":18035,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1006437,-18703,-7116,8901,12961,15516,-11340,27367,-4524,813,12818,-15027,-23552,-19726,16787,9566,19396,12646,-675,-1867,-25891,10242,12339,9080,7208,16236,3206,-4108,18407,-14076,7193,16209,6222,-2159,10405,7418,5689,-16130,28594,18509,-3079,-124038,-19441,-178859,-23905,67232,-19846,64600,7398,8595,35919,-10222,-20489,23332,27998,26949,-41291,33286,-14330,17751,1273,13635,-3286,-20294,17324,13402,-3706,17961,-13906,-12841,5099,-18544,22263,22910,5273,-17940,-39703,55956,22293,10284,12428,-2961,255,11780,-5046,7960,23809,13641,5206,-23877,33527,7385,-1587,-22120,-8446,43504,3916,-931,19852,17636,8866,-7165,3354,1077,-21749,6245,14778,7338,8079,10373,6812,10321,-8219,8658,8310,4518,13918,13386,-15551,12032,7398,-10082,717,1145,-28156,15549,16928,15432,15229,24160,5149,15996,-14669,-39695,25873,-5338,7124,18675,-15980,-10958,-24407,-25638,4850,7414,-27444,-25909,5939,-23743,51734,21584,-3707,-522,-3234,-8191,-2652,-20745,-5348,-38169,43985,-107,-38371,-64038,36764,-8242,50960,-12060,26820,34964,8542,21181,16402,-21366,-44431,12615,-48208,-25937,-17658,9309,-12596,11324,36743,-17702,30091,-7690,17105,-82,-29783,-40295,-10951,-5335,21698,17798,-12518,32375,26501,-9691,1492,-16614,10815,-27999,-15150,-7789,32259,-6369,9204,177,-6124,-5479,13380,22249,5182,19433,5244,17595,-21576,20272,-15712,4434,18473,18777,-19346,-10097,-22091,15466,34267,-1769,7137,-30359,-2835,-16421,24266,-40417,-25394,47233,4317,18230,8921,15260,16105,20038,-163,1509,-9650,20966,10898,30318,15499,14201,11901,8934,7195,1597,-9790,38468,7799,-21655,10558,-45519,24894,-1867,29071,7955,1539,-19764,35027,17115,10803,5700,1747,13731,-29433,-14566,-48971,-3240,50280,3772,13181,-53630,48980,7498,19374,7488],"returnScale":1000000,"returns":[6641,-18706,-7118,8903,12964,15519,-11343,27373,-4525,813,12821,-15030,-23557,-19730,16790,9568,19400,12649,-675,-1868,-25896,10244,12342,9081,7210,16239,3207,-4109,18411,-14079,7194,16213,6223,-2159,10407,7419,5690,-16133,28600,18513,-3080,-124063,-19445,-178896,-23909,67245,-19850,64613,7400,8597,35926,-10224,-20493,23336,28004,26955,-41300,33293,-14333,17755,1273,13638,-3287,-20298,17327,13405,-3707,17965,-13909,-12843,5100,-18548,22267,22915,5274,-17944,-39711,55968,22297,10286,12431,-2962,255,11783,-5047,7961,23814,13644,5207,-23882,33534,7386,-1587,-22124,-8448,43513,3917,-932,19856,17640,8868,-7167,3355,1077,-21753,6246,14781,7340,8080,10375,6814,10323,-8221,8660,8312,4518,13921,13389,-15554,12034,7400,-10084,717,1145,-28162,15553,16931,15435,15232,24165,5150,15999,-14672,-39703,25879,-5339,7125,18679,-15983,-10961,-24412,-25643,4851,7416,-27450,-25914,5940,-23748,51745,21588,-3708,-522,-3234,-8193,-2653,-20749,-5349,-38177,43994,-107,-38379,-64051,36772,-8244,50971,-12063,26826,34971,8543,21186,16405,-21370,-44440,12617,-48218,-25942,-17661,9311,-12599,11326,36751,-17706,30097,-7691,17108,-82,-29789,-40303,-10953,-5336,21702,17802,-12521,32382,26506,-9693,1492,-16617,10817,-28005,-15153,-7790,32265,-6370,9206,177,-6125,-5480,13382,22254,5183,19437,5245,17599,-21581,20276,-15715,4435,18477,18781,-19350,-10099,-22096,15469,34274,-1769,7138,-30365,-2835,-16425,24271,-40425,-25399,47242,4318,18234,8923,15263,16108,20042,-163,1509,-9652,20971,10900,30324,15502,14204,11904,8935,7197,1597,-9792,38476,7801,-21660,10560,-45528,24899,-1867,29077,7956,1540,-19768,35034,17118,10805,5701,1748,13734,-29439,-14569,-48981,-3241,50290,3773,13184,-53641,48990,7499,19378,7490]},"lttb":{"start":18029,"dateDeltas":[3,3,5,4,3,3,3,5,6,4,2,4,3,4,5,5,3,5,3,5,4,3,3,6,3,2,6,4,5,2,4,3,4,4,5,5,2,4,3,6,5,4,4,2,3,5,5,5,3,3,4,5,1,5,6,2,6,4,3,3,5,3,6,4,1,5,2,6,3,4,3,7,3,5,3,3,3,5,3,7,3,1,6,4,3,6,1,4,6,4,5,3,4,2,5,5,4,4,3,5,3,3,3,7,4,4,4,3,3,6,3,5,3,4,1,5,4,4,6,4,1,6,2,4,7,4,2,5,2,6,4,4,3,2,7,4,4,3,3,4,3,7,3,5,1,5,3,6,3,4,5,2,6,4,2,5,3,3,5,6,2,2,6,5,3,3,4,4,5,4,5,3,6,3,3,5,2,6,3,5,1,5,6,2,5,2,5,3,5,3,4,6,3,4,4,3,4,6,4,4,4,2,5,3,3,7,4,2,4,5,3,5,4,1,6,2,6,5,3,3,3,4,4,4,4,3,5,3,4,4,4,6,5,1,8,3,3,5,3,6,2,4,3,4,7,1,5,3,7,5,4,4,4,1,5,5,6,1,4,6,2,6,4,2,3,7,1,5,4,4,7,1,4,4,6,1,4,7,2,5,3,3,7,2,6,3,6,1,4,6,4,5,1,6,5,4,2,3,6,3,4,7,2,6,4,3,2,3,4,5,3,8,4,1,5,6,4,3,3,4,3,5,2,6,5,2,5,2,6,4,3,3,4,4,7,1,7,1,6,3,3,5,5,2,5,4,4,2,6,5,2,6,4,3,4,2,4,5,3,3,4,7,2,4,3,4,4,5,5,3,2,5,3,4,5,3,5,5,3,6,3,5,1,4,7,2,4,5,4,2,6,5,4,3,2,4,5,4,3,6,3,4,5,4,4,4,2,6,4,4,3,3,4,3,6,3,4,3,6,3,3,4,3,4,5,3,4,6,5,2,3,5,4,4,5,2,3,5,5,2,5,3,4,5,6,1,6,4,4,3,4,4,4,5,3,5,1,4,5,5,3,4,6,4,3,4,4,3,2,5,6,1,7,3,3,3,5,4,3,4,4,4,5,2,5,3,4,6,4,4,4,5,2,5,2,7,3,4,2],"priceScale":10000,"prices":[999797,7296,-656,-18551,3235,-10360,-9933,15837,12831,1211,17455,-166,-14351,3011,27018,-3770,-405,4919,-6468,15932,-906,-14805,-42387,18946,-8889,-11016,21439,-14625,19645,4496,14800,-439,13218,-5255,4510,-6250,6096,-31891,13737,-5119,23641,-6898,10617,6833,-1863,2139,16389,4326,2143,-5576,-1948,19530,-20393,-2995,14258,1124,12941,8186,1422,-3990,-6653,3625,15152,1936,11960,1007,-1802,-14360,-10974,34161,2087,19787,4665,-7472,-124278,-13512,24835,-30524,-178832,22994,-60757,68045,13128,-26675,10983,60510,13249,-11427,24270,-10273,36101,-31429,21244,6193,-26762,31345,-8152,28918,594,21838,17877,-55429,3081,29273,-19865,-503,24715,10047,-8796,11798,1723,9790,-24448,1498,-9749,12316,4337,16494,-6489,-309,24025,-5925,7406,-21382,-12349,12299,-7761,-18946,402,19337,2373,23602,15967,-10696,-137,-17940,-39195,-922,49344,7026,29538,-7245,10284,12309,1441,-3020,-1263,7693,-9624,14115,-8910,3715,11745,-6151,26427,-252,13525,-7874,15617,-6066,-30965,31489,12910,3798,13774,-11776,-1091,-21007,16072,-24677,40151,12413,-4975,-7090,5990,19756,18,14172,3642,8787,-14688,8330,5933,-7047,-4874,15112,-25493,7871,-13970,16293,8586,-45,13535,-719,8671,5019,-10026,16855,4345,10885,-12890,19898,-3686,-29307,29835,7640,-7784,18510,-162,13134,-2191,-12905,15322,-3493,7588,-190,1757,-16082,5048,-24342,25580,-2772,-25216,-7587,22873,-5640,22568,15480,-134,5432,9743,24391,-4035,21669,5116,-5194,-11257,-35655,-3933,33151,-21273,8718,-17614,24918,16607,1466,5436,-28295,8097,-25539,-47293,10944,28029,-23258,-180639,188136,-11357,-41120,-12527,32990,-15483,-42050,12434,57772,-165,21852,-81085,89626,5815,-18769,-10031,9011,6864,-31659,11868,-7626,-13696,-30402,29136,-36618,-14518,53402,10826,-2683,-204,-85733,-24735,14396,22372,6583,-14905,51259,-19396,-9034,38174,3670,36110,-179,11805,-7079,25122,23436,-25664,9902,-61897,4703,-11963,24763,9407,-57638,10370,-36388,-17739,30293,-20831,-19671,18246,79,26832,9987,12748,-30411,5996,24124,-16207,20531,7041,-19538,22550,-40709,5659,8877,-49093,4939,-15969,-5335,18030,13629,-13633,26193,-19279,2038,32528,-4698,31198,-686,-9157,15714,-14142,-16550,-9786,20615,-2186,-51302,14204,-9606,12686,-14892,32388,5020,-11269,-326,14257,2848,-7647,-19017,12893,-13274,16168,5007,4349,18058,-15152,20257,-4974,29700,-5609,20473,2601,-19933,-5102,25949,3421,-18437,-8264,8426,17470,2361,18943,2932,-19984,-9712,4313,-29162,681,17660,-2962,34416,7821,-9525,11294,-4371,-27431,-12736,7071,-21431,4912,25142,3513,-44567,-2147,-23321,-1283,48549,-1273,5392,22928,-4698,11390,-7339,20354,1135,14948,6014,14037,6771,-7046,-3490,5841,-10595,14604,5614,933,10713,29001,10509,-13294,19601,14394,-2500,14402,-19303,28139,-5239,14944,-1009,-9794,4,38462,-2942,11216,-567,-21437,-3096,13534,-34629,-10881,16298,8683,-13488,32348,8464,-3168,18603,-5961,2399,-22371,7005,28303,-269,17275,14577,-3731,5704,-7554,8500,594,13782,2944,-32283,18437,-33037,20978,-106825,27242,10018,42215,8102,0,16927,5640,-62768,11486,37492,-4306,11760,19378,-3433,11073,-358],"returnScale":1000000,"returns":[0,7297,-656,-18554,3235,-10362,-9935,15840,12834,1211,17459,-166,-14354,3011,27024,-3771,-405,4920,-6469,15935,-906,-14808,-42396,18950,-8891,-11018,21443,-14628,19649,4497,14803,-439,13221,-5256,4511,-6252,6098,-31898,13740,-5120,23646,-6900,10619,6835,-1863,2139,16392,4327,2144,-5578,-1948,19534,-20397,-2996,14261,1124,12944,8188,1422,-3991,-6654,3626,15155,1936,11962,1008,-1803,-14363,-10976,34168,2087,19792,4665,-7473,-124303,-13515,24840,-30530,-178868,22998,-60769,68059,13130,-26680,10985,60522,13252,-11429,24275,-10275,36108,-31435,21248,6194,-26767,31351,-8154,28924,594,21843,17880,-55440,3082,29279,-19869,-503,24720,10049,-8798,11800,1724,9792,-24453,1498,-9751,12319,4337,16498,-6491,-309,24030,-5926,7408,-21387,-12351,12301,-7762,-18950,402,19341,2373,23607,15970,-10698,-137,-17944,-39203,-922,49354,7028,29544,-7247,10286,12312,1441,-3020,-1264,7695,-9626,14118,-8912,3716,11747,-6152,26432,-252,13528,-7876,15620,-6067,-30971,31495,12913,3799,13777,-11779,-1091,-21011,16075,-24682,40159,12416,-4976,-7092,5991,19760,18,14175,3643,8789,-14691,8331,5935,-7049,-4875,15115,-25498,7873,-13973,16296,8588,-45,13538,-719,8672,5020,-10028,16859,4346,10887,-12893,19902,-3686,-29313,29841,7641,-7785,18513,-162,13137,-2191,-12908,15325,-3494,7590,-190,1757,-16085,5049,-24347,25585,-2772,-25222,-7588,22878,-5642,22573,15483,-134,5433,9745,24396,-4036,21674,5117,-5195,-11260,-35662,-3934,33158,-21277,8720,-17618,24923,16610,1467,5437,-28301,8099,-25544,-47303,10946,28035,-23263,-180676,188175,-11360,-41128,-12530,32997,-15486,-42058,12436,57784,-165,21856,-81101,89644,5816,-18773,-10033,9013,6865,-31665,11870,-7627,-13699,-30408,29142,-36626,-14521,53413,10829,-2684,-204,-85750,-24741,14399,22377,6584,-14908,51270,-19400,-9036,38182,3670,36118,-179,11807,-7080,25127,23441,-25670,9904,-61909,4704,-11966,24768,9409,-57649,10372,-36396,-17742,30299,-20835,-19675,18249,79,26838,9989,12750,-30417,5997,24129,-16210,20535,7043,-19542,22554,-40717,5660,8879,-49103,4940,-15972,-5336,18033,13632,-13636,26199,-19283,2038,32535,-4699,31204,-686,-9159,15717,-14145,-16553,-9788,20619,-2186,-51313,14207,-9608,12689,-14895,32394,5021,-11271,-326,14260,2849,-7649,-19021,12896,-13277,16171,5008,4350,18062,-15155,20261,-4975,29706,-5610,20477,2602,-19938,-5103,25955,3421,-18440,-8266,8428,17473,2362,18947,2932,-19988,-9714,4314,-29168,681,17664,-2963,34423,7823,-9527,11296,-4372,-27436,-12739,7073,-21436,4913,25147,3514,-44576,-2147,-23326,-1283,48558,-1273,5393,22933,-4699,11392,-7340,20358,1135,14951,6015,14040,6773,-7048,-3491,5843,-10598,14607,5616,933,10715,29007,10511,-13297,19605,14397,-2500,14405,-19307,28144,-5240,14947,-1009,-9796,4,38470,-2943,11219,-567,-21442,-3096,13536,-34636,-10883,16301,8685,-13491,32355,8466,-3169,18607,-5962,2399,-22375,7006,28309,-269,17278,14580,-3732,5706,-7556,8502,594,13785,2944,-32289,18440,-33043,20982,-106847,27248,10020,42223,8104,0,16930,5642,-62781,11488,37500,-4307,11762,19382,-3433,11075,-358]},"monthly":{"start":18047,"dateDeltas":[30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[980761,25895,28691,-24102,29039,11233,35952,11145,9576,-79971,-152846,94656,20437,3640,10200,41683,-17677,-26494,102216,12928,16517,17205,57799,22946,3041,36992,16436,31264,-31177,57771,8945,28027,-66303,-30044,42901,-27029,-18461,-80871,105659,-24375,-74303,58003,-1437,-76534,51695,11329,-9794,-3241,30439,48079,26510,-9108,-23177,-49728,71709,51405,55018,46708,46610,-33479,18679,68657,-7432,-5957,18885,10715],"returnScale":1000000,"returns":[-19040,25900,28697,-24107,29045,11236,35959,11147,9578,-79987,-152877,94675,20441,3641,10202,41691,-17680,-26500,102237,12931,16520,17209,57810,22951,3042,36999,16439,31271,-31183,57782,8947,28033,-66317,-30050,42910,-27035,-18464,-80888,105681,-24380,-74318,58014,-1437,-76549,51705,11331,-9796,-3241,30445,48089,26515,-9110,-23181,-49739,71724,51415,55030,46717,46620,-33486,18683,68670,-7433,-5958,18889,10717]}});
\ No newline at end of file
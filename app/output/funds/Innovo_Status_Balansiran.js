@@ -0,0 +1 @@
+registerFundSeries("Innovo Status Balansiran", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[289116,1700,280,2507,-862,4104,1151,-1560,-467,-2464,892,-2406,760,6330,-2594,779,-1885,374,-1036,-201,-892,-2742,2661,947,544,-83,-341,152,332,-718,-844,-840,2805,1043,-553,775,-1267,998,177,-1976,3004,-4915,1960,-1031,-139,137,718,-4454,3133,-43,-1180,799,800,-699,901,94,378,180,-2193,41,2127,-676,572,634,-204,1145,-515,-836,-205,288,931,-647,-137,-582,637,258,-1953,164,761,-551,-201,340,464,-1380,-1739,-711,1445,-884,633,-1112,-1701,5030,381,-464,432,-1255,254,480,706,2462,852,-360,-5314,5714,29,681,255,2124,2250,503,289,10535,-600,-924,-955,-2762,1811,739,1084,879,1071,564,-3897,995,-598,171,2394,-2499,2663,178,-1033,-1196,345,153,1657,2756,-401,549,3339,771,3879,-1487,1922,6893,-1090,3984,804,2526,-671,1468,-1383,60,1082,-5665,216,-1096,3360,-2082,-1970,-1840,-4004,704,-517,-948,-1679,2592,-441,599,5270,4949,-597,-1418,309,494,4509,-4355,1569,861,1138,-50,637,-1576,190,54,-2861,3063,869,-117,724,-361,-3503,2749,-597,-355,6232,2470,-2442,190,1155,1866,-270,-1235,-200,-801,3615,671,1048,128,2441,-6076,1435,810,1871,3290,1510,-710,-3602,720,609,394,1522,3451,766,1049,-412,-604,218,-633,48,1254,-117,-1053,490,210,2016,-695,-464,71,-1110,-2551,1284,1725,1955,-1025,1612,-3164,32,6510,-2759,-343,-120,429,832,1039,-264,2611,-1605,712,-502,534,454,-3650,3465,-4346,-213,-1475,1448,-843,180,214,697,-1195,2590,888,2871,-44,276,983,259,-1221,645,-606,-4675,3928,-15333,-19262,-6560,7512,5921,-818,6356,6620,-2358,404,1015,-1218,-782,-3203,1247,-119,25,-424,2814,1836,1282,-1871,-705,1140,-859,2936,2508,4008,-1854,-1608,-1124,-2341,-2366,-183,-6977,996,1986,-3468,-26,2846,1961,850,2275,1504,4177,9293,-227,-1998,2641,5754,-1661,-1702,683,-1685,844,742,-1215,1634,-1099,3098,-261,816,1455,816,1307,836,-626,-2994,1502,441,-2577,161,-66,2511,-1860,-195,2729,-1184,-666,-4741,-1213,2077,-4763,336,-1608,541,-168,-536,-1686,-1284,-181,1351,-485,406,3970,1097,1940,569,-1743,1336,1708,-1074,-5663,-1178,-650,4713,934,-136,1745,194,212,3305,-1765,-1174,-2088,-2257,4639,-2459,-3096,123,597,-580,-1937,1553,1467,-380,-324,-922,-998,-1474,36,863,-582,-2051,-317,-1453,46,4831,-590,1197,-1049,-946,679,1303,-320,-560,1010,2281,3662,-1776,-443,-195,-680,-1105,-82,2120,-308,-967,-734,-1006,1271,-493,1032,1944,-42,-1124,696,-335,-667,-673,-544,-1400,1082,2122,-75,-301,-134,814,-1092,-40,-1590,1135,877,66,1362,585,3373,1800,-434,-1606,-582,-1376,2352,348,751,1904,-1087,656,155,2224,475,700,-189,5629,-283,1079,729,768,-926,182,2146,934,3404,-265,1234,2465,-333,1135,2510,1821,459,2938,5870,-1293,-138,2813,1475,4672,3107,3435,-1931,-124,2094,1216,-6084,852,2511,650,-706],"returnScale":1000000,"returns":[1993,5891,971,8688,-2987,14223,3989,-5406,-1619,-8539,3091,-8338,2634,21938,-8990,2699,-6533,1297,-3591,-696,-3092,-9503,9222,3282,1886,-288,-1182,527,1151,-2489,-2925,-2911,9721,3615,-1916,2686,-4392,3459,614,-6849,10411,-17034,6793,-3573,-482,475,2489,-15437,10858,-149,-4089,2769,2772,-2422,3123,325,1310,624,-7600,142,7372,-2343,1982,2197,-707,3969,-1785,-2898,-710,998,3227,-2243,-474,-2017,2207,894,-6768,568,2638,-1910,-697,1179,1608,-4783,-6027,-2464,5008,-3064,2194,-3854,-5895,17433,1320,-1608,1497,-4349,880,1664,2446,8533,2953,-1248,-18417,19803,101,2360,884,7361,7798,1743,1002,36511,-2080,-3202,-3310,-9572,6277,2561,3756,3047,3712,1954,-13506,3449,-2073,593,8297,-8661,9229,617,-3580,-4145,1196,530,5743,9551,-1390,1903,11572,2672,13444,-5154,6661,23889,-3777,13807,2787,8754,-2325,5087,-4793,208,3750,-19633,748,-3798,11645,-7216,-6827,-6377,-13877,2440,-1792,-3285,-5819,8983,-1529,2076,18265,17151,-2069,-4914,1071,1712,15627,-15093,5437,2984,3944,-173,2208,-5462,658,187,-9915,10615,3012,-405,2509,-1251,-12141,9528,-2069,-1231,21599,8560,-8463,658,4003,6467,-936,-4280,-693,-2776,12528,2326,3632,444,8459,-21057,4973,2807,6485,11402,5233,-2461,-12483,2495,2111,1365,5275,11960,2655,3636,-1428,-2094,756,-2194,167,4346,-406,-3649,1698,728,6987,-2409,-1608,246,-3847,-8841,4450,5978,6776,-3553,5587,-10965,110,22562,-9562,-1188,-416,1486,2884,3601,-915,9049,-5563,2468,-1740,1851,1573,-12650,12009,-15062,-738,-5112,5018,-2921,624,741,2416,-4142,8977,3077,9950,-152,956,3407,898,-4232,2235,-2100,-16202,13613,-53140,-66756,-22735,26034,20521,-2835,22028,22943,-8172,1400,3518,-4222,-2710,-11100,4321,-412,86,-1469,9753,6363,4443,-6485,-2443,3951,-2977,10175,8692,13891,-6426,-5573,-3895,-8113,-8200,-634,-24181,3452,6883,-12019,-90,9863,6797,2945,7885,5212,14477,32207,-787,-6925,9153,19942,-5757,-5898,2367,-5840,2925,2572,-4211,5663,-3809,10737,-905,2828,5043,2828,4530,2897,-2170,-10376,5206,1528,-8931,558,-229,8702,-6446,-676,9458,-4103,-2308,-16431,-4204,7198,-16507,1165,-5573,1875,-583,-1857,-5843,-4450,-628,4682,-1680,1407,13759,3801,6724,1972,-6041,4630,5920,-3722,-19627,-4082,-2253,16334,3237,-471,6047,673,734,11454,-6117,-4068,-7237,-7822,16078,-8523,-10729,426,2069,-2010,-6713,5382,5084,-1317,-1123,-3195,-3459,-5108,124,2991,-2017,-7108,-1098,-5036,159,16743,-2045,4149,-3636,-3278,2353,4516,-1109,-1941,3500,7906,12691,-6155,-1535,-676,-2357,-3830,-284,7348,-1068,-3351,-2544,-3487,4405,-1708,3576,6738,-146,-3895,2412,-1161,-2312,-2332,-1886,-4852,3750,7355,-260,-1044,-464,2821,-3784,-139,-5510,3933,3040,228,4721,2027,11690,6238,-1504,-5566,-2017,-4769,8152,1206,2602,6599,-3767,2273,538,7707,1647,2426,-656,19509,-981,3740,2526,2662,-3209,630,7438,3237,11797,-918,4276,8543,-1154,3934,8699,6311,1591,10182,20344,-4482,-478,9749,5112,16192,10768,11905,-6693,-429,7257,4214,-21085,2952,8703,2253,-2447]},"lttb":{"start":16344,"dateDeltas":[6,3,9,5,9,11,5,8,7,4,7,14,2,10,9,4,12,3,9,9,8,2,10,10,2,9,8,5,10,11,2,6,9,9,7,11,5,8,7,3,7,13,2,12,7,4,6,10,8,7,7,5,7,9,6,10,9,8,7,3,8,9,8,8,6,10,5,8,8,7,6,11,4,10,3,7,8,6,12,2,14,1,11,9,2,11,5,6,11,7,4,7,8,13,5,4,13,6,3,13,2,11,4,12,8,3,5,12,8,3,9,7,6,8,9,10,5,10,3,10,8,3,6,13,7,3,10,6,11,7,5,6,8,10,7,9,5,3,10,6,6,8,8,7,12,8,2,12,4,5,11,8,8,5,7,8,9,6,10,7,3,9,11,3,12,7,7,8,6,4,11,6,9,5,8,9,2,9,8,7,11,4,7,11,6,7,8,2,12,8,8,6,3,12,8,6,3,10,11,8,2,12,6,3,13,7,3,6,7,13,7,2,11,7,8,10,4,7,8,5,6,9,6,9,6,13,6,7,8,3,13,7,7,7,7,8,4,6,7,13,3,7,6,12,3,8,10,9,6,4,9,8,7,4,8,11,3,13,8,5,10,1,9,6,13,4,9,3,12,3,10,11,6,4,9,7,8,7,6,8,11,4,10,5,6,11,4,9,3,7,12,3,12,3,9,5,14,3,10,7,3,10,11,5,10,6,8,2,13,3,9,9,7,9,1,12,8,6,8,4,12,4,5,9,9,6,11,3,12,1,8,6,14,1,11,7,8,9,5,7,10,5,11,4,7,10,5,4,9,7,11,4,10,8,5,10,8,8,5,8,6,5,11,6,5,9,11,6,4,5,12,4,8,9,9,8,6,3,12,4,11,8,4,8,6,11,8,5,7,10,3,10,4,12,2,11,10,5,6,8,6,10,8,7,2,9,6,11,3,8,13,8,4,10,8,4,10,5,6,5,13,3,12,7,9,7,4,7,7,7,11,2,13,7,5,12,5,3,11,5,11,9,4,6,7,7,8,11,4,7,5,12,3,11,4,9,11,6,8,5,10,5,8,10,4,7,7,6,8,12,5,10,8,5,7,10,7,6,5,5,10,6,9,4,10,5,13,4,11,8,2,6,12,6,4,11,7,7,5],"priceScale":10000,"prices":[288541,615,1664,276,2516,-871,6198,-658,-3425,1419,-2770,892,-1646,6053,-2324,786,-2173,1263,-1595,-243,-5134,-1373,5255,2180,-1799,1315,-1017,-501,1652,-1626,-776,-939,4133,-443,1331,-1256,1369,-217,-2207,3841,-5258,1946,-1994,608,851,-4076,-407,3140,-1494,1451,888,-1084,-170,1335,-612,1820,-3130,67,2519,-1761,1147,757,-209,1666,-1948,-613,542,1443,-1115,327,-898,997,-64,-2086,297,891,-78,-1029,639,384,-1422,-243,-2206,1902,-2758,2114,-2579,-251,5037,952,-6143,5533,-1255,-370,1810,2475,-454,1184,-5565,5723,-168,849,-60,2480,3069,-297,249,10540,-74,-3563,1153,-3488,4564,-1297,2107,1126,374,-3868,1307,-1277,509,2707,-3047,4320,-2466,418,-1388,298,163,4418,654,-2597,5811,-1676,5998,-1521,1898,6914,-2118,4822,-1457,4193,-635,2912,-2123,-243,2496,-6726,511,-1418,3389,-1602,-2659,-5348,1824,-2135,1503,-3970,2847,-674,599,4508,5756,-768,-1274,-1435,6321,-4567,-204,4321,-1067,346,1603,-1770,-243,629,-3018,2252,581,3301,-1556,-339,-3550,2747,-1854,378,9351,319,-2694,-885,3826,99,-240,-1299,-1380,3992,1151,-492,572,3045,-7432,3174,5322,-3024,3728,1711,-3529,8606,-10884,2188,3240,-1883,4028,600,1650,-2069,832,-962,-308,2976,-1288,550,-1719,4119,-3392,2939,-2668,809,-1074,-2956,1746,3699,-931,1712,-3235,-301,6721,-2221,-1407,595,181,2213,-1384,3201,188,-1916,1134,-613,2156,-2850,-1931,3428,-6641,2709,-2135,1497,-1373,709,950,-1230,2850,609,2871,-1669,3401,-1110,857,-1226,1478,-916,-5435,4165,-36279,1898,-6774,12067,2630,-5379,15858,-3223,2144,555,-1668,-332,-3178,1298,-1193,1048,-449,2682,1659,2032,-4076,353,1871,-884,2962,6517,-2565,625,-4099,1426,-4721,-169,-6954,645,2314,-4441,2214,896,2661,833,5355,-2049,15164,-1202,-37,-1912,8941,-2575,603,-1537,-2826,1352,1874,-1713,1802,-1678,3498,-1661,1781,404,2885,-125,2946,-1628,-3871,2806,-3213,1548,-1821,3308,-1876,-219,2763,-2173,289,-4803,-1974,3735,-5516,-5262,3921,1084,-2049,789,-2840,-799,1901,-833,350,3838,162,3350,1204,-5794,4995,-1366,1756,-9475,3255,-1271,4377,1271,-137,2608,-1033,631,3260,-2220,-729,-4429,4725,-601,-5073,-45,881,-579,-1950,1567,2098,-1115,-221,-810,-1291,-1988,337,1533,-4317,1635,-13,-3162,6148,-688,1194,8,-3101,738,2281,-840,-467,1510,1452,4483,-2803,-535,928,-2446,1562,-983,2108,-1972,709,-1757,1279,-484,1032,1844,768,-2050,1290,-1288,200,-939,-1748,-222,3188,-916,851,-760,1451,-1426,-12,-1749,1088,-351,1657,278,1542,3323,1808,-2402,582,-1308,-1086,2567,361,2640,-1732,1339,-713,3084,-308,1409,-130,5442,-320,1624,-461,2255,-1771,409,1562,4787,1156,-1170,3606,-339,376,4064,-812,2902,-843,8736,526,-1858,936,3139,5097,5476,-3124,2264,-963,4925,-309,-6539,775,3995,72,-1570],"returnScale":1000000,"returns":[0,2131,5767,957,8720,-3019,21480,-2280,-11870,4918,-9600,3091,-5704,20978,-8055,2724,-7531,4378,-5528,-842,-17793,-4759,18212,7556,-6235,4557,-3524,-1737,5726,-5636,-2689,-3254,14324,-1536,4613,-4353,4745,-752,-7649,13312,-18223,6744,-6910,2107,2949,-14126,-1411,10883,-5178,5029,3077,-3757,-589,4627,-2121,6307,-10847,232,8730,-6103,3975,2624,-725,5774,-6751,-2124,1878,5001,-3864,1133,-3112,3455,-222,-7229,1029,3088,-270,-3566,2214,1331,-4928,-842,-7646,6592,-9558,7326,-8938,-870,17457,3299,-21290,19176,-4349,-1283,6273,8578,-1573,4103,-19287,19835,-583,2943,-208,8595,10636,-1029,863,36528,-256,-12349,3996,-12088,15818,-4496,7303,3902,1296,-13405,4530,-4426,1764,9382,-10560,14971,-8546,1449,-4811,1033,565,15311,2267,-9000,20139,-5809,20788,-5272,6578,23962,-7340,16711,-5049,14532,-2201,10092,-7358,-842,8651,-23311,1771,-4914,11745,-5552,-9215,-18535,6322,-7400,5209,-13759,9867,-2336,2076,15624,19948,-2661,-4416,-4973,21907,-15828,-707,14975,-3698,1200,5555,-6134,-842,2180,-10460,7805,2013,11441,-5393,-1175,-12303,9520,-6425,1310,32408,1105,-9336,-3068,13260,343,-831,-4502,-4783,13835,3989,-1705,1982,10553,-25757,11000,18445,-10480,12920,5930,-12231,29826,-37721,7583,11229,-6526,13960,2080,5718,-7171,2884,-3334,-1068,10314,-4463,1906,-5958,14275,-11755,10185,-9246,2804,-3722,-10245,6051,12820,-3227,5933,-11211,-1043,23293,-7698,-4876,2062,627,7670,-4796,11093,652,-6640,3930,-2125,7472,-9877,-6692,11880,-23016,9389,-7399,5188,-4759,2458,3292,-4263,9877,2111,9950,-5784,11787,-3847,2970,-4249,5122,-3174,-18836,14434,-125732,6578,-23477,41821,9114,-18642,54960,-11170,7430,1924,-5781,-1151,-11014,4499,-4135,3632,-1556,9295,5750,7042,-14126,1223,6485,-3064,10265,22586,-8889,2166,-14206,4942,-16362,-585,-24101,2235,8020,-15391,7673,3105,9223,2886,18559,-7101,52554,-4166,-128,-6626,30987,-8925,2090,-5327,-9794,4686,6495,-5937,6245,-5815,12123,-5757,6173,1400,9998,-433,10210,-5642,-13416,9725,-11135,5365,-6311,11464,-6502,-759,9576,-7531,1002,-16646,-6841,12944,-19117,-18236,13589,3757,-7102,2735,-9843,-2769,6588,-2887,1213,13302,561,11610,4173,-20080,17311,-4734,6086,-32838,11281,-4405,15169,4405,-474,9038,-3580,2187,11298,-7694,-2526,-15350,16376,-2083,-17582,-156,3053,-2006,-6758,5430,7271,-3864,-766,-2807,-4474,-6890,1168,5313,-14962,5667,-45,-10959,21307,-2384,4138,28,-10747,2557,7906,-2912,-1618,5233,5032,15537,-9714,-1854,3216,-8477,5413,-3407,7306,-6834,2457,-6089,4432,-1677,3576,6391,2662,-7105,4471,-4464,693,-3254,-6058,-770,11049,-3174,2949,-2634,5029,-4942,-42,-6062,3771,-1216,5742,964,5344,11517,6266,-8325,2017,-4533,-3764,8897,1251,9149,-6002,4640,-2471,10688,-1067,4883,-451,18861,-1109,5628,-1598,7816,-6138,1417,5414,16590,4007,-4055,12497,-1175,1303,14085,-2814,10057,-2921,30276,1823,-6439,3244,10879,17664,18979,-10827,7846,-3337,17068,-1071,-22662,2686,13845,250,-5441]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[292748,3221,3061,-3266,-4872,3015,-365,2447,-498,-1512,-1528,1510,205,540,1113,-1302,-39,-451,-20,-2954,2189,-566,3649,1190,5499,11053,-2612,3415,-1462,27,941,6313,11929,4505,2374,-3292,-7769,-1755,10144,2889,-164,-1000,1411,-1383,8338,582,1295,4276,1768,-2495,5912,918,317,2036,-4204,3437,4947,-580,419,-503,-4043,520,5768,1547,-5846,-28126,16516,-2199,-3265,5969,-1373,5984,-6945,-8449,9358,14268,4736,-607,1929,2715,135,-2040,3702,-5431,-6329,-4108,5401,2324,-4280,3774,5586,-5323,-2501,846,-3115,-2723,3423,-1602,2012,3254,-816,-1684,3771,-1180,-1468,2373,-2174,3164,3147,1227,1887,6061,5689,1718,6979,5431,7397,14550,2219,-1367,-1422],"returnScale":1000000,"returns":[14580,11163,10609,-11319,-16885,10449,-1265,8481,-1726,-5240,-5296,5233,711,1871,3857,-4512,-135,-1563,-69,-10238,7586,-1961,12646,4124,19058,38307,-9053,11836,-5067,93,3262,21879,41342,15613,8228,-11409,-26925,-6083,35156,10013,-568,-3466,4890,-4793,28897,2017,4488,14819,6128,-8647,20489,3182,1098,7057,-14570,11911,17145,-2010,1452,-1743,-14012,1802,19990,5362,-20261,-97476,57239,-7621,-11315,20687,-4759,20739,-24069,-29282,32432,49449,16413,-2103,6685,9409,468,-7070,12830,-18822,-21934,-14238,18719,8054,-14833,13079,19360,-18448,-8668,2932,-10796,-9437,11863,-5552,6973,11278,-2828,-5836,13069,-4090,-5087,8224,-7535,10966,10906,4253,6540,21005,19717,5954,24187,18822,25636,50426,7691,-4738,-4928]}});
\ No newline at end of file
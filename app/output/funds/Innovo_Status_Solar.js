@@ -0,0 +1 @@
+registerFundSeries("Innovo Status Solar", {"weekly":{"start":19372,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[999838,-565,-1444,764,-1183,-3089,-3761,10908,4605,-8475,1737,13118,-6284,3884,4845,-16730,3412,9832,-11117,2413,1424,-10570,-4379,-17932,40371,-37602,5859,36379,-31957,-50731,-38558,-54011,-8476,36222,-34012,13011,-50679,-21337,-53196,18945,-57438,-31672,38890,-60079,37207,-3426,39719,-14152,75616,-7512,3342,-52589,-31777,-40606,12672,10798,38549,15386,-64438,18927,-8100,-46373,11227,26448,-35298,-18596,-35542,15801,31397,-16018,4876,66058,11615,-23130,4401,-35880,-39774,-9283,54234,-47982,24806,-33181,-28596,15501,12496,-6190,-30433,36897,606,24713,-18754],"returnScale":1000000,"returns":[-162,-565,-1444,764,-1183,-3089,-3761,10908,4605,-8475,1737,13118,-6284,3884,4845,-16730,3412,9832,-11117,2413,1424,-10570,-4379,-17932,40371,-37602,5859,36379,-31957,-50731,-38558,-54011,-8476,36222,-34012,13011,-50679,-21337,-53196,18945,-57438,-31672,38890,-60079,37207,-3426,39719,-14152,75616,-7512,3342,-52589,-31777,-40606,12672,10798,38549,15386,-64438,18927,-8100,-46373,11227,26448,-35298,-18596,-35542,15801,31397,-16018,4876,66058,11615,-23130,4401,-35880,-39774,-9283,54234,-47982,24806,-33181,-28596,15501,12496,-6190,-30433,36897,606,24713,-18754]},"lttb":{"start":19370,"dateDeltas":[1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,2,1,1,1,2,1,1,1,1,2,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,2,1,1,1,1,2,1,1,1,2,1,1,1,2,1,2,1,1,1,2,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,2,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,2,1,1,1,1,2,1,1,1,2,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,2,1,1,2],"priceScale":10000,"prices":[1000000,-81,-81,-80,-81,-162,-80,-81,-162,-80,-984,-61,-77,-161,-81,260,-160,904,-80,-79,-160,-80,799,-1582,-160,-1020,-696,-1140,-73,-80,105,-1333,128,-925,-1658,-158,636,244,9117,1070,-79,-80,2827,-1034,4732,-1754,-166,-3804,2548,-2773,-4303,-63,-80,137,2476,1021,-1736,-161,-200,824,508,12145,-78,-81,-2877,-3783,628,-88,-164,471,1807,784,984,-81,-81,3670,462,241,634,-162,-1719,743,-9219,3179,-9634,-80,-1379,-2355,3843,3281,22,-848,-1230,2760,-4146,13377,-81,1338,-2630,-3445,-6322,22,-80,5075,-3628,-2028,3074,-80,-917,-4051,8232,-1679,-81,-38,-3450,-1040,-6000,959,-1081,1414,-4913,4402,-1999,-3204,-1344,-12171,-672,-820,-8930,5926,-2149,11054,1432,26939,3176,-81,-4396,-12312,-31001,9584,523,15540,-4612,26753,-29280,-2463,-79,38377,4373,-10051,-834,4514,2275,-2644,-34967,-3444,6902,-79,1767,-43294,165,-8420,-949,-4752,-4503,199,-30207,777,-72,270,-40082,-14926,-842,1569,-5967,-7433,13980,-10642,1653,-67,37666,-4921,-4741,6981,1306,-844,-2373,-13957,-19413,2573,-67,17836,-17374,19292,-10539,3796,-24926,6112,-7240,-18404,-6158,-63,-5284,-12730,-2720,2333,-2936,-32578,-20394,3702,-15918,12050,-58,-3328,43372,-16559,-8861,4381,3985,11872,-21334,-50462,-1504,-55,3460,-18302,6562,-23257,-82,1937,8704,-12431,33617,8976,-1966,-14418,-167,-42069,-3657,282,-2211,48445,8425,-22506,6064,-1060,8057,-14043,7732,-4413,-706,-11879,9492,10858,-1827,30683,2339,5126,-11337,1158,-8989,-55,-55,-12356,34686,53124,1626,-1464,-24985,23429,-28885,24929,-1939,-61,-635,13325,-1244,-11088,3045,-122,-4907,-37855,-11070,1361,-57,1490,-11273,-14144,-9981,2185,-1041,-23421,-12841,656,-3962,-51,34909,-14112,-2676,-6227,778,12273,-10119,-7039,29038,-13302,-53,-22538,39777,1241,20809,-740,27096,-35918,30728,12651,-19114,-57,-751,-27655,-27459,-8875,354,991,10692,-9756,16497,504,-53,-12382,-9877,14420,1327,-1535,-368,-16343,-9979,-14792,-4895,-49,2955,-5130,20780,-10394,3066,-50,-8645,29114,3875,2156,-52,-2047,-19791,2266,-16052,376,7198,17847,-19114,-14988,-12212,2623,-16263,-14504,3004,-8537,803,2232,10308,-420,-9025,12564,97,11233,-12667,11375,21554,-49,-49,3773,-12413,6612,-12254,-1736,10468,24074,-13355,-16962,699,-48,7207,47822,-13866,25002,-107,1483,7690,8472,-4517,-1458,-55,-12010,15208,-8954,-16003,-1371,12064,12145,6185,-29647,3706,-52,-13499,-8929,-10268,-3084,-100,-5622,-16006,-5588,12683,-25194,-47,-16778,-4630,21600,-8592,-883,5719,2822,10675,36383,-1315,-50,-31352,18738,-26841,-9790,1310,-47,11484,1307,12380,-317,-48,-10192,4136,-6014,-21020,-46,-45,-18615,96,3515,-13897,305,-3588,17704,1479,-528,479,13189,-13495,3213,-14506,23701,349,3768,-10826,-6315,7269,-40,469,-20572,9521,-3605,-16026,-266,-5157,3452,34399,6358,-2109,-46,11879,-1653,-2529,-6692,-399,4295,6899,-13649,27358,-142,-48,-1669,-19562,-7227,9510,194],"returnScale":1000000,"returns":[0,-81,-81,-80,-81,-162,-80,-81,-162,-80,-984,-61,-77,-161,-81,260,-160,904,-80,-79,-160,-80,799,-1582,-160,-1020,-696,-1140,-73,-80,105,-1333,128,-925,-1658,-158,636,244,9117,1070,-79,-80,2827,-1034,4732,-1754,-166,-3804,2548,-2773,-4303,-63,-80,137,2476,1021,-1736,-161,-200,824,508,12145,-78,-81,-2877,-3783,628,-88,-164,471,1807,784,984,-81,-81,3670,462,241,634,-162,-1719,743,-9219,3179,-9634,-80,-1379,-2355,3843,3281,22,-848,-1230,2760,-4146,13377,-81,1338,-2630,-3445,-6322,22,-80,5075,-3628,-2028,3074,-80,-917,-4051,8232,-1679,-81,-38,-3450,-1040,-6000,959,-1081,1414,-4913,4402,-1999,-3204,-1344,-12171,-672,-820,-8930,5926,-2149,11054,1432,26939,3176,-81,-4396,-12312,-31001,9584,523,15540,-4612,26753,-29280,-2463,-79,38377,4373,-10051,-834,4514,2275,-2644,-34967,-3444,6902,-79,1767,-43294,165,-8420,-949,-4752,-4503,199,-30207,777,-72,270,-40082,-14926,-842,1569,-5967,-7433,13980,-10642,1653,-67,37666,-4921,-4741,6981,1306,-844,-2373,-13957,-19413,2573,-67,17836,-17374,19292,-10539,3796,-24926,6112,-7240,-18404,-6158,-63,-5284,-12730,-2720,2333,-2936,-32578,-20394,3702,-15918,12050,-58,-3328,43372,-16559,-8861,4381,3985,11872,-21334,-50462,-1504,-55,3460,-18302,6562,-23257,-82,1937,8704,-12431,33617,8976,-1966,-14418,-167,-42069,-3657,282,-2211,48445,8425,-22506,6064,-1060,8057,-14043,7732,-4413,-706,-11879,9492,10858,-1827,30683,2339,5126,-11337,1158,-8989,-55,-55,-12356,34686,53124,1626,-1464,-24985,23429,-28885,24929,-1939,-61,-635,13325,-1244,-11088,3045,-122,-4907,-37855,-11070,1361,-57,1490,-11273,-14144,-9981,2185,-1041,-23421,-12841,656,-3962,-51,34909,-14112,-2676,-6227,778,12273,-10119,-7039,29038,-13302,-53,-22538,39777,1241,20809,-740,27096,-35918,30728,12651,-19114,-57,-751,-27655,-27459,-8875,354,991,10692,-9756,16497,504,-53,-12382,-9877,14420,1327,-1535,-368,-16343,-9979,-14792,-4895,-49,2955,-5130,20780,-10394,3066,-50,-8645,29114,3875,2156,-52,-2047,-19791,2266,-16052,376,7198,17847,-19114,-14988,-12212,2623,-16263,-14504,3004,-8537,803,2232,10308,-420,-9025,12564,97,11233,-12667,11375,21554,-49,-49,3773,-12413,6612,-12254,-1736,10468,24074,-13355,-16962,699,-48,7207,47822,-13866,25002,-107,1483,7690,8472,-4517,-1458,-55,-12010,15208,-8954,-16003,-1371,12064,12145,6185,-29647,3706,-52,-13499,-8929,-10268,-3084,-100,-5622,-16006,-5588,12683,-25194,-47,-16778,-4630,21600,-8592,-883,5719,2822,10675,36383,-1315,-50,-31352,18738,-26841,-9790,1310,-47,11484,1307,12380,-317,-48,-10192,4136,-6014,-21020,-46,-45,-18615,96,3515,-13897,305,-3588,17704,1479,-528,479,13189,-13495,3213,-14506,23701,349,3768,-10826,-6315,7269,-40,469,-20572,9521,-3605,-16026,-266,-5157,3452,34399,6358,-2109,-46,11879,-1653,-2529,-6692,-399,4295,6899,-13649,27358,-142,-48,-1669,-19562,-7227,9510,194]},"monthly":{"start":19388,"dateDeltas":[28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[998008,-6568,21172,-14444,-428,10787,-10422,-137576,-84737,-112729,8595,90316,-117185,13496,-6187,-75069,100875,-95896,15719,-33868,30068,-17085],"returnScale":1000000,"returns":[-1992,-6568,21172,-14444,-428,10787,-10422,-137576,-84737,-112729,8595,90316,-117185,13496,-6187,-75069,100875,-95896,15719,-33868,30068,-17085]}});
\ No newline at end of file
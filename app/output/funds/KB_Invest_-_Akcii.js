@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Akcii", {"weekly":{"start":18721,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1000044,462,1081,-4192,-4137,6343,-52,4089,3830,11176,-1864,-13569,8494,1515,-6749,-6019,1163,5296,4941,4638,-10798,9839,-655,-10899,-6636,2221,2916,12757,7182,3122,-8972,26652,16584,-9002,-28039,-9490,6947,-1328,10449,3665,17944,5179,-25904,-2272,-5039,12710,-13006,-18983,-39295,-8970,33530,15530,48,4624,-2888,-24940,4182,-2977,-758,-8959,29690,-4901,-28170,-39217,16855,-12157,25590,-16483,6568,13746,1008,21313,-5340,-12569,-31447,9941,-21374,-26896,-15550,21363,-6443,21645,4288,4863,20607,-9696,5372,1487,-17141,-19484,4603,-4015,39548,15407,-5789,13255,13151,1197,-1395,-10583,12093,-30207,-13134,-1476,26852,2529,7768,-14295,391,-10714,-5193,10644,-9989,19321,2449,6344,-9813,9280,-10041,3810,14865,26560,-24254,-1499,-15294,5198,16846,-11738,15810,-31445,4410,-13486,18177,-15909,-13061,23813,-6546,20316,482,13307,12846,6304,12908,2979,2352,1119,-3381,10395,-2500,8608,10740,9195,-6518,5463,7867,12544,21860,-8758,-8176,-11997,5009,-4234,15618,17697,-8854,2909,-5109,-799,12031,-963,6496,19941,938,7069,-22705,-11986,22396,5868,9751,-37758,18483,5728,19362,-1509],"returnScale":1000000,"returns":[-29,462,1081,-4192,-4137,6343,-52,4089,3829,11176,-1864,-13568,8493,1515,-6748,-6019,1163,5296,4940,4638,-10797,9838,-655,-10898,-6636,2221,2916,12756,7181,3122,-8971,26650,16583,-9002,-28037,-9489,6947,-1328,10448,3665,17942,5179,-25902,-2272,-5039,12709,-13005,-18981,-39292,-8970,33528,15529,48,4623,-2887,-24939,4182,-2977,-758,-8958,29688,-4901,-28168,-39214,16854,-12156,25588,-16482,6568,13745,1008,21311,-5340,-12568,-31444,9940,-21373,-26894,-15548,21361,-6443,21644,4288,4862,20606,-9696,5372,1487,-17140,-19482,4602,-4014,39545,15406,-5789,13254,13150,1197,-1395,-10582,12092,-30205,-13133,-1476,26850,2529,7767,-14293,390,-10713,-5192,10643,-9988,19319,2449,6344,-9813,9280,-10041,3810,14864,26558,-24252,-1499,-15293,5198,16844,-11737,15809,-31443,4410,-13485,18176,-15908,-13060,23811,-6545,20314,482,13306,12845,6304,12907,2979,2351,1119,-3380,10394,-2500,8607,10740,9194,-6518,5463,7866,12543,21859,-8757,-8176,-11996,5009,-4234,15617,17695,-8853,2909,-5109,-799,12030,-962,6495,19940,938,7068,-22703,-11985,22394,5867,9751,-37755,18481,5728,19360,-1509]},"lttb":{"start":18718,"dateDeltas":[1,4,1,4,1,2,4,3,2,3,3,1,4,2,3,2,3,3,2,1,4,2,3,2,2,3,4,2,3,1,3,2,3,2,4,2,3,1,3,3,4,1,3,2,2,4,2,3,2,3,3,1,3,3,3,3,2,2,2,4,1,4,3,1,3,3,3,1,3,4,1,3,3,3,1,5,1,4,2,2,3,2,4,2,3,1,4,2,2,3,2,2,4,1,3,2,4,3,2,3,3,1,3,3,3,1,4,2,2,3,3,2,2,2,5,3,3,2,3,2,3,3,2,3,1,3,2,4,1,4,1,3,2,3,4,3,2,3,1,2,4,2,2,4,3,3,1,4,3,2,3,1,3,2,3,4,1,3,2,3,2,4,1,3,3,2,4,3,2,3,2,1,3,4,1,3,3,2,3,2,3,4,1,3,3,1,4,1,4,2,2,3,2,3,4,1,2,3,3,2,4,1,4,2,2,3,2,4,1,4,3,2,3,3,1,2,4,2,3,2,2,3,4,2,3,2,1,5,2,1,3,2,4,1,5,1,2,4,2,3,3,2,2,3,2,2,4,1,5,2,2,2,4,1,3,3,1,5,1,4,2,1,4,1,3,4,3,2,2,2,2,5,1,2,4,1,3,2,3,3,3,3,1,3,3,2,4,2,3,3,2,2,3,2,2,3,3,2,3,3,3,1,3,3,3,1,4,1,3,4,3,2,3,1,4,1,2,5,2,3,2,1,4,3,1,3,2,4,3,1,4,2,2,4,2,3,2,3,1,3,2,3,2,4,2,3,3,3,1,3,2,3,3,1,3,4,2,3,2,3,3,1,3,4,1,4,2,2,3,2,2,4,2,2,4,2,1,3,3,2,3,3,2,4,2,3,1,3,4,2,1,4,1,4,3,2,2,2,4,3,2,3,2,2,3,2,4,2,2,4,2,2,2,3,2,4,3,2,3,1,4,1,2,3,4,2,3,3,1,3,2,3,2,4,3,2,3,2,2,3,2,3,2,3,2,4,2,2,4,2,3,1,2,5,2,1,4,2,3,1,4,2,3,3,3,2,3,3,2,3,2,1,4,2,2,3,3,3,2,3,3,2,1,4,2,2,3,4,2,2,3,2,3,2,4,1,2,5,1],"priceScale":10000,"prices":[1000073,-9,-39,-85,566,877,-368,572,-444,-3400,265,-1264,-3437,325,5311,658,-5550,5711,2808,-3207,3373,2492,-1228,3503,-566,6929,4816,-5452,2534,1878,-1784,-12571,-76,6882,2024,-2024,2566,561,769,-14725,7207,702,-6658,-10024,11215,-185,-2732,11667,-3545,6476,-2564,3977,-1186,3760,-3296,-11719,3333,9598,-2611,2902,-1348,2287,-722,-10574,-1257,2045,-6757,-1914,-11820,13748,5620,-4769,2987,-2565,12508,2707,-1454,7112,-1214,9772,-4742,2146,-7248,-3562,7966,16699,2047,980,15156,388,3963,-16380,3415,-5098,-20409,387,-11300,-1109,19220,-13645,-4358,10583,-6699,-8891,21717,-1859,3674,-587,578,11069,7002,290,10968,-7048,842,-25554,-9399,-117,6957,20495,-21718,-3879,23830,-12017,-10790,18439,-20416,658,-47500,31578,-42992,12556,-11859,-15756,11756,-7356,33035,2883,11092,-2111,7768,9115,-18114,7830,-6269,13488,-10824,6736,-1460,2945,-27757,-8605,-8539,23854,-2656,20429,-23406,-20784,-7937,28030,15654,-24764,11362,-12148,31857,2649,-8369,-478,6691,-34729,-26705,15138,-22824,-4958,-3184,21601,4644,-22952,4654,-10063,32651,2937,-29470,15999,-2559,15554,-10558,-6496,20476,885,-5041,9851,-3802,-1810,20681,6511,-5310,-10656,-6609,24922,-24257,-22962,-7578,-4610,371,21906,328,-32157,1754,4445,-37836,-6070,16241,-19166,40048,-6554,-15459,-3747,13507,-12935,18362,-8033,11316,-9891,14242,7011,-22028,26210,-15060,47123,-17783,1826,-15121,-1930,14171,-3336,-13859,24024,-8678,-19232,2966,840,2062,-22698,-4263,14294,-5688,210,-9654,7763,26133,10908,-130,14406,1775,-314,-18371,12099,5718,7546,-11557,19870,10982,-11916,15885,-12989,9013,-9776,3455,-14820,6201,-1899,-450,12878,-400,-17905,-10626,-12412,-12453,10117,9121,-17626,9938,972,22643,3153,-5702,5344,11176,-3273,-532,-2764,-11002,-129,-19066,17259,1245,-23789,14091,-9796,3069,8654,-5851,9333,1135,-19074,8960,-639,-6323,25316,8114,-5667,1931,9485,2382,-13571,-3288,-5692,2510,9800,6814,-4380,-11122,2929,17229,-13304,1565,6117,4975,15445,-1714,15515,-21888,-4118,-5446,5297,-2284,-9774,-7216,1765,-1999,7555,-427,13297,3620,-931,-13701,2823,4112,9008,2690,-5208,-25250,3588,-7784,10869,-17787,-3542,4593,18528,-5608,11959,5665,-26371,-738,-11290,-2938,2227,20241,1345,-6012,-1023,2836,20839,-2041,-6631,5958,1357,-3447,2883,12912,-2873,15792,-145,14413,-8035,12440,-8064,8533,6699,-7409,3689,-191,1467,4642,-9097,6649,1735,-13812,8622,9347,-179,3478,-4911,4131,-8632,14794,-1525,-2910,15238,-868,-2858,10793,540,-11588,4858,-2421,10277,-2181,8670,-6398,10041,-1806,11530,-1626,20262,1679,1394,-11199,1044,4805,-15924,2865,-16507,4588,11875,-11032,4088,-9429,-976,6171,14746,4003,-3131,7655,9343,-476,-10382,2783,-12195,17505,-3132,-10424,10492,1824,-9049,-4754,13173,5164,348,6678,-6697,-944,7656,-1079,1908,15333,2619,14583,-15426,8561,-7719,-3462,15530,13484,-40083,-37732,21478,4102,11767,10055,4692,-2853,-2097,7737,-3773,13335,-1114,-37240,-252,1221,20477,-3215,-1100,8206,11082,-7508,14087,3341,-4527],"returnScale":1000000,"returns":[0,-9,-39,-85,566,877,-368,572,-444,-3400,265,-1264,-3437,325,5311,658,-5550,5711,2808,-3207,3373,2492,-1228,3502,-566,6929,4816,-5452,2534,1878,-1784,-12570,-76,6881,2024,-2024,2566,561,769,-14724,7207,701,-6657,-10023,11214,-185,-2732,11666,-3544,6475,-2564,3977,-1186,3760,-3296,-11718,3333,9597,-2611,2902,-1348,2287,-722,-10573,-1257,2045,-6757,-1914,-11819,13747,5620,-4769,2987,-2565,12507,2707,-1454,7111,-1213,9771,-4742,2146,-7247,-3562,7965,16698,2047,980,15155,388,3962,-16378,3414,-5097,-20408,387,-11299,-1109,19219,-13644,-4358,10582,-6698,-8891,21716,-1859,3674,-587,578,11068,7001,290,10967,-7047,842,-25552,-9399,-117,6957,20493,-21716,-3879,23829,-12017,-10789,18438,-20415,658,-47496,31576,-42989,12555,-11858,-15755,11755,-7356,33033,2883,11091,-2111,7768,9114,-18113,7830,-6269,13487,-10823,6735,-1459,2944,-27755,-8604,-8538,23852,-2656,20428,-23405,-20782,-7937,28028,15653,-24762,11361,-12147,31855,2649,-8369,-478,6691,-34727,-26703,15137,-22822,-4958,-3184,21600,4643,-22950,4654,-10063,32649,2937,-29468,15998,-2559,15553,-10557,-6496,20475,885,-5041,9850,-3801,-1810,20679,6511,-5310,-10655,-6609,24921,-24256,-22960,-7577,-4610,371,21904,328,-32154,1753,4445,-37833,-6070,16240,-19164,40045,-6554,-15458,-3747,13506,-12934,18361,-8032,11315,-9890,14241,7010,-22026,26208,-15059,47119,-17781,1826,-15120,-1930,14170,-3336,-13858,24022,-8677,-19231,2966,840,2062,-22696,-4263,14293,-5688,210,-9653,7762,26131,10908,-130,14405,1774,-314,-18369,12098,5718,7545,-11556,19868,10982,-11916,15884,-12988,9013,-9776,3455,-14819,6201,-1899,-450,12877,-400,-17904,-10625,-12411,-12452,10116,9120,-17624,9937,972,22641,3153,-5702,5344,11175,-3273,-532,-2763,-11002,-128,-19065,17258,1245,-23788,14090,-9795,3069,8653,-5850,9332,1135,-19073,8960,-639,-6323,25314,8114,-5667,1931,9484,2382,-13570,-3288,-5691,2509,9800,6813,-4379,-11122,2929,17228,-13303,1565,6116,4975,15444,-1714,15514,-21887,-4117,-5446,5297,-2284,-9773,-7216,1765,-1999,7555,-427,13296,3619,-931,-13700,2823,4112,9007,2690,-5208,-25248,3588,-7783,10868,-17786,-3542,4593,18527,-5608,11958,5665,-26369,-738,-11289,-2938,2227,20239,1345,-6011,-1023,2835,20838,-2041,-6630,5957,1357,-3447,2883,12911,-2873,15791,-145,14412,-8034,12439,-8064,8533,6698,-7408,3689,-191,1466,4642,-9096,6648,1735,-13811,8622,9346,-179,3478,-4911,4131,-8632,14793,-1525,-2909,15236,-868,-2857,10792,540,-11587,4857,-2420,10276,-2181,8669,-6397,10040,-1806,11529,-1626,20261,1679,1394,-11198,1043,4805,-15923,2865,-16506,4588,11874,-11031,4088,-9429,-976,6171,14745,4003,-3131,7654,9343,-476,-10382,2783,-12194,17504,-3132,-10423,10491,1824,-9049,-4753,13172,5163,348,6678,-6697,-943,7655,-1079,1908,15332,2619,14582,-15425,8560,-7718,-3462,15529,13483,-40080,-37730,21477,4102,11766,10054,4692,-2853,-2097,7736,-3772,13334,-1114,-37237,-252,1220,20476,-3215,-1100,8206,11081,-7508,14086,3341,-4527]},"monthly":{"start":18747,"dateDeltas":[31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[993307,13630,3556,-3538,9061,-15626,16177,2163,13697,8895,-58080,13470,-11193,13975,-69222,34010,-18482,-60029,37902,31859,-44653,56860,6520,-4789,-3341,-21180,31320,40069,-28434,-16149,-22121,36305,47877,7825,21404,48515,-33351,35046,2679,51988,-14135,3639,582],"returnScale":1000000,"returns":[-6766,13629,3556,-3538,9061,-15625,16176,2163,13696,8894,-58076,13469,-11192,13974,-69217,34008,-18481,-60025,37900,31856,-44649,56855,6520,-4789,-3341,-21178,31318,40066,-28432,-16148,-22119,36302,47874,7824,21402,48512,-33349,35044,2679,51984,-14134,3639,581]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Balanced", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1092816,-872,-477,14237,10677,12002,357,6874,-1106,-7025,-14550,230,4827,3046,1686,4554,16527,-22475,3973,9595,-2643,2700,1550,-4483,-8076,-4843,-476,26729,-1667,1690,-7344,3721,-110,-721,-1150,-7982,-2584,-6754,8394,-7644,-5248,19235,-6374,2,1194,-1191,-12020,7517,-983,2384,-2622,1477,1912,14390,-886,8900,12241,8309,-9180,22748,3779,-14320,-16996,7933,2588,505,-15165,-12921,2581,6971,-13515,-7845,9758,5802,17769,2449,-1567,-6465,-1876,-907,11010,6942,-331,-10143,3963,5676,5347,-7035,7707,-7410,-1226,5143,5280,12931,6945,3542,5197,3795,3410,10159,5723,-599,-7540,7799,3300,6268,4660,26735,13289,-10595,17616,46722,4223,-8727,3210,-3962,17075,-3243,10003,11460,10849,16831,1777,4388,-2937,794,10541,-41421,28259,522,7710,536,-10202,-2463,2720,12959,7385,11810,7124,5539,285,-293,-3200,-405,-3173,16950,4450,-6586,15823,6020,2057,3910,-2419,1391,-4894,6334,3765,-613,-1109,-610,8222,-2246,-6201,-11047,-6183,1625,938,-4364,2712,-214,11991,10805,8703,6369,-4046,-20644,6001,9279,-8229,9825,1023,-16104,-2689,8649,-9099,12121,17669,13546,3422,3664,-8070,4815,8878,-576,10127,-4653,3758,5559,-4970,9004,-2769,-6959,-6232,-1372,-453,-4776,4307,7830,10795,-13960,-7001,6416,4256,2232,2257,-8041,-16584,2634,-4763,3957,-11853,2824,8472,5880,10710,8033,905,-1703,2697,8303,-503,4152,4385,-2780,-944,11983,1729,1191,913,1162,-5325,10302,1596,-3260,5253,-6045,9988,5898,6941,-3451,5797,14530,-170,-4743,-3562,4347,5132,6247,8115,4799,8352,-3105,12371,-16556,10218,97,21255,-6733,5466,3326,2599,3276,5936,13298,5517,18424,2924,7577,-6706,7068,6978,-1821,-48952,-3900,-94575,-82352,-7740,13660,53568,49,21,22997,-4005,-3304,14221,14561,40437,-22405,-3821,-5650,10728,7930,4783,2050,-12395,6065,4723,-3922,4973,2511,6719,3874,-19225,4735,387,-4059,-1717,-19877,21564,31048,13908,15158,6128,-3333,7708,-1361,6049,15604,19744,-4804,4135,21449,14137,12974,-14600,7700,15520,-9818,-11199,4822,8331,8197,-4039,290,20625,2880,17190,11533,20148,1180,-11605,173,4927,-6316,3235,-9258,3504,13043,5379,-1113,13408,12436,-4632,-5248,338,1409,10110,5090,14997,-16630,26098,-3450,-10782,-26695,-4811,12881,-8883,3286,17870,21267,1890,-11287,-10596,-2162,7986,-17975,-77859,-126797,-13288,42771,16665,3677,8593,-14609,-8349,9494,-8476,-5170,-4538,2207,4172,-21686,-31811,6302,-8403,8930,-7831,9050,17712,12482,21283,-6677,-14096,-27350,-1951,-7608,-28603,-25234,4756,1645,5933,14105,2501,22390,7548,6810,15887,-6297,-12772,4542,-2794,32985,22009,723,19352,15310,4466,-4606,-13917,12363,-6710,-6442,2444,18667,3531,3989,-8915,2933,-2419,3330,-646,-10290,14854,2966,11624,-1990,1719,-8478,12974,8923,24280,-15556,4194,-14710,4601,9955,2415,2905,-10715,3742,-506,12960,-10410,-9064,13087,3395,20451,-3383,9469,9090,12091,8994,-6005,3988,6544,15994,5397,16534,12811,6086,16820,-7814,-745,14744,17001,14301,6425,683,-6110,18506,409,9900,11198,-6690,6214,9447,23703,8203,-4146,19259,18247,6638,-2262,-1532,4265,2972,7807,7391,-10328,12402,16645,5951,-4568],"returnScale":1000000,"returns":[404,-799,-436,13033,9774,10987,327,6293,-1013,-6431,-13319,210,4419,2788,1544,4169,15129,-20574,3637,8783,-2419,2471,1419,-4104,-7393,-4433,-436,24469,-1526,1547,-6723,3406,-100,-660,-1053,-7307,-2366,-6182,7684,-6998,-4804,17608,-5835,2,1093,-1090,-11004,6882,-900,2182,-2400,1352,1750,13173,-811,8148,11206,7606,-8404,20825,3459,-13109,-15559,7262,2370,462,-13883,-11828,2363,6381,-12372,-7182,8933,5312,16266,2242,-1435,-5918,-1717,-831,10079,6355,-303,-9285,3628,5196,4895,-6440,7055,-6783,-1123,4708,4834,11837,6358,3243,4757,3474,3122,9300,5239,-549,-6902,7140,3020,5738,4266,24475,12165,-9699,16126,42771,3866,-7989,2939,-3627,15631,-2969,9157,10491,9931,15408,1627,4017,-2689,727,9650,-37919,25870,478,7058,490,-9339,-2255,2490,11863,6761,10811,6522,5070,261,-268,-2929,-371,-2905,15517,4074,-6029,14484,5511,1883,3580,-2215,1274,-4480,5798,3447,-562,-1015,-558,7526,-2056,-5676,-10113,-5660,1487,859,-3995,2483,-196,10977,9891,7967,5831,-3704,-18898,5493,8494,-7533,8994,937,-14742,-2462,7918,-8330,11096,16175,12401,3132,3354,-7387,4408,8127,-527,9270,-4259,3440,5089,-4550,8243,-2535,-6371,-5705,-1256,-414,-4373,3943,7168,9882,-12779,-6409,5873,3896,2044,2066,-7361,-15182,2411,-4360,3623,-10851,2585,7756,5382,9805,7353,829,-1559,2469,7601,-461,3801,4014,-2545,-864,10970,1583,1090,836,1063,-4874,9431,1461,-2985,4809,-5534,9144,5399,6354,-3159,5307,13301,-156,-4342,-3260,3979,4698,5719,7428,4394,7645,-2842,11325,-15156,9354,89,19457,-6163,5003,3045,2379,2999,5434,12174,5050,16866,2677,6936,-6139,6471,6388,-1667,-44813,-3570,-86578,-75388,-7085,12505,49038,45,19,21052,-3666,-3025,13019,13329,37018,-20510,-3498,-5172,9820,7260,4378,1877,-11347,5552,4324,-3591,4553,2299,6150,3547,-17599,4334,354,-3715,-1572,-18196,19740,28423,12732,13876,5610,-3052,7057,-1246,5537,14285,18074,-4398,3786,19635,12941,11877,-13365,7049,14207,-8988,-10252,4415,7626,7504,-3697,265,18881,2636,15737,10558,18444,1080,-10624,159,4510,-5782,2962,-8476,3208,11940,4924,-1019,12275,11384,-4240,-4805,310,1290,9255,4659,13729,-15224,23892,-3159,-9870,-24438,-4404,11792,-8132,3008,16359,19469,1730,-10333,-9700,-1979,7311,-16455,-71275,-116075,-12164,39154,15256,3366,7866,-13373,-7643,8691,-7759,-4733,-4154,2020,3819,-19852,-29121,5769,-7692,8175,-7169,8285,16214,11426,19483,-6112,-12904,-25037,-1786,-6965,-26184,-23100,4354,1506,5431,12912,2290,20496,6910,6234,14544,-5765,-11692,4158,-2558,30196,20148,662,17715,14016,4088,-4217,-12740,11318,-6143,-5897,2237,17089,3232,3652,-8161,2685,-2215,3049,-592,-9420,13598,2716,10641,-1822,1574,-7762,11877,8169,22227,-14241,3839,-13466,4212,9113,2211,2660,-9809,3425,-463,11864,-9530,-8297,11980,3108,18722,-3097,8668,8321,11069,8233,-5497,3651,5990,14642,4941,15135,11728,5571,15398,-7153,-682,13497,15563,13092,5882,625,-5593,16941,374,9063,10251,-6124,5688,8648,21699,7509,-3795,17630,16704,6077,-2071,-1402,3904,2721,7147,6766,-9455,11353,15238,5447,-4181]},"lttb":{"start":16344,"dateDeltas":[7,2,6,13,2,8,11,3,11,9,4,6,12,3,8,10,6,10,4,6,9,8,7,11,4,7,4,12,9,6,3,10,7,9,5,9,5,12,6,5,10,4,10,9,5,4,7,13,7,5,10,4,8,9,5,11,5,10,5,9,3,11,9,3,11,3,8,11,7,6,9,7,4,5,10,6,8,7,8,6,12,3,7,7,9,5,7,12,9,5,8,7,3,11,8,8,6,8,6,5,8,12,3,6,11,7,5,7,12,8,6,6,5,9,6,11,6,7,5,6,13,6,4,9,8,8,4,11,9,2,12,5,8,4,11,10,3,5,8,11,9,2,7,13,9,7,6,9,4,7,11,5,5,7,9,7,10,5,6,6,8,12,4,11,3,7,6,8,11,6,6,8,6,11,7,6,5,9,8,7,10,8,1,9,10,5,6,11,8,9,5,3,12,8,6,9,5,4,13,6,10,7,4,4,8,11,5,10,3,7,12,3,12,4,12,3,11,6,6,9,5,12,4,9,3,13,3,12,4,8,8,8,8,8,6,5,8,6,9,8,5,7,8,6,6,8,9,5,9,11,5,8,4,9,5,12,3,10,6,7,11,5,7,5,8,13,3,11,6,5,9,4,7,14,5,7,7,8,5,12,2,13,5,3,7,13,8,3,8,6,9,10,3,7,7,11,9,6,8,2,9,12,4,11,3,11,2,10,10,4,9,9,3,6,11,6,8,8,10,4,9,6,8,3,8,11,6,10,5,4,9,11,4,10,4,10,10,7,4,8,8,6,9,5,9,5,10,3,9,7,12,4,9,6,11,8,5,8,5,7,8,10,5,8,5,7,13,6,4,8,10,3,12,2,9,10,7,8,5,8,7,6,8,6,10,4,8,9,5,7,9,9,8,4,7,11,7,4,8,12,6,6,9,8,2,8,10,5,9,6,11,5,7,6,11,3,11,9,6,3,12,9,6,6,8,11,2,10,3,13,3,12,5,5,7,14,6,3,13,6,9,5,5,7,12,6,9,3,6,12,9,7,6,9,5,8,7,4,8,8,6,9,8,9,5,5,13,3,7,9,8,6,9,7,7,10,4,7,5,8,9,6,9,11,6,5,11,3,12,5,4,6,8,10,8,10,7,4,5],"priceScale":10000,"prices":[1092375,3963,-6075,-3233,17597,10705,13083,-1711,8938,-3646,-18550,-12028,14263,5381,-5795,5293,23263,-22717,1696,13006,-7918,7086,1527,-4483,-14022,5796,-6019,27631,2011,-9323,-4369,8029,-2832,6152,-15458,2553,-12001,12750,-18617,3654,19253,-13528,8056,3968,-1052,-27958,19648,-3227,11445,-13990,129,24794,-5522,940,24671,6623,-9945,22855,3920,-14556,-18515,9867,4079,-4193,-12361,-22906,12565,6948,-27296,15682,314,24897,5900,-8076,1430,-1488,-10913,14331,7199,2445,-15901,8743,-2129,12431,-9325,8521,-11543,13983,-8522,22549,-1813,9971,-4615,10392,4743,11584,7601,3977,-13383,11026,-6455,11655,5756,24406,14581,-9113,17616,44997,6958,-13425,-646,22985,10956,-16527,21949,-318,27106,-3891,10674,3735,-7873,12324,-41415,42018,-12972,7445,530,-9674,6532,-8031,14852,-949,29738,-4855,7264,764,-3969,19185,-19598,443,21126,-9928,16370,7915,-1792,-1287,8818,-9613,9059,-5764,11189,-5408,4196,-3891,10694,-3223,-18717,-6338,5285,-6145,4267,-3960,1215,11691,9511,10383,6923,-144,-24727,5991,10726,-10098,11605,-757,-20466,12253,-12967,419,17205,26303,7249,1183,-13229,-3246,23246,-1724,12172,-12023,14395,-8502,11686,4582,-8283,-9652,-5155,7352,-10609,5694,-1086,18655,-13851,-9723,24487,-12515,-3229,10815,-9855,-17483,7457,-8893,6524,-17786,7809,13888,-949,18598,1095,-1721,315,10767,-1233,6166,6383,-7708,593,12604,-1421,3529,-1202,3468,-8050,18126,-7778,5919,-5644,11339,-1869,14524,-4767,-1468,22383,2521,-9396,-4550,9050,-4007,12833,11321,-1510,11743,-2842,12129,-21372,14601,530,20396,-7056,6657,-274,8706,1601,19541,324,4010,30218,-8451,-2106,10936,7215,-3333,-49086,-3766,-113153,-82361,14014,59863,8954,-17907,43653,-24452,9701,14500,14289,40438,7892,-31872,-7897,17162,-2325,8848,4642,-15223,17925,-7495,-5046,6475,1871,14298,-21452,6911,-3025,1789,-7180,-25159,26831,30007,14949,13486,7985,-5306,9766,-1631,7502,13870,21752,-8632,6236,32560,16492,-17094,11440,13471,-3301,-22989,5584,5775,15856,-6103,2073,20641,-7358,27962,7641,21749,3354,-11965,-2363,-4735,13612,-15050,-2501,10859,15358,-2984,15186,14464,3630,-15912,-17913,21926,-3992,16539,15158,-16503,26141,-3473,-17306,-24959,18810,-14875,-9778,27598,24708,6871,-6133,-37913,29250,-30157,5853,-115826,-92997,-9341,38234,34192,-17164,16698,-6687,-28292,29563,-30515,13367,-16954,16841,5730,-52043,-13711,14548,-23233,6575,17437,-5851,33629,20335,-6691,30,-41886,7201,-16325,-32035,-21818,10863,-8306,18685,-6905,47138,-10154,1829,29956,-9543,-11800,6465,-3983,33003,21687,-5859,20491,25262,1659,-21706,2105,12341,-19650,5192,21198,-4112,16146,-15232,-5607,8856,-5232,7896,-15736,26819,-3544,15435,-9172,-3653,19432,-6193,33230,-15203,3814,-15542,-1443,16945,6210,-1004,-16948,11439,-6744,20419,-23347,13911,10,24786,-7252,7277,14207,-301,21050,7403,-13267,3699,23426,5351,18383,9282,3928,20440,-7938,-403,24629,7116,22727,1872,-17797,26910,-9225,23413,-3786,13528,-7498,-347,39397,12968,-10119,19940,29842,-6627,14898,-40925,27262,-4025,14746,8521,-12111,30270,5729,2047,-6680],"returnScale":1000000,"returns":[0,3628,-5561,-2960,16109,9800,11976,-1566,8182,-3337,-16982,-11011,13057,4926,-5305,4846,21295,-20796,1553,11906,-7248,6487,1397,-4104,-12836,5306,-5510,25295,1840,-8534,-4000,7350,-2592,5632,-14151,2337,-10986,11672,-17043,3345,17625,-12384,7374,3633,-963,-25594,17987,-2954,10477,-12807,118,22697,-5055,861,22584,6063,-9104,20923,3588,-13325,-16949,9032,3734,-3838,-11316,-20969,11503,6360,-24988,14356,288,22791,5401,-7393,1309,-1362,-9990,13119,6590,2239,-14557,8004,-1949,11380,-8537,7801,-10567,12800,-7801,20642,-1659,9127,-4224,9513,4342,10604,6958,3641,-12251,10093,-5909,10670,5269,22342,13348,-8342,16126,41192,6370,-12290,-592,21042,10029,-15129,20093,-291,24814,-3562,9771,3419,-7207,11282,-37913,38465,-11875,6815,485,-8856,5980,-7352,13596,-869,27224,-4445,6650,699,-3633,17563,-17941,405,19340,-9088,14985,7246,-1641,-1178,8073,-8801,8293,-5276,10243,-4951,3841,-3562,9790,-2951,-17134,-5802,4838,-5625,3906,-3625,1112,10703,8706,9505,6338,-132,-22636,5484,9819,-9244,10624,-693,-18735,11216,-11870,384,15750,24078,6636,1083,-12110,-2972,21281,-1578,11142,-11006,13178,-7783,10697,4195,-7583,-8835,-4720,6731,-9712,5212,-994,17078,-12680,-8901,22416,-11456,-2956,9900,-9021,-16005,6827,-8141,5972,-16282,7149,12713,-869,17026,1002,-1575,288,9856,-1128,5644,5844,-7057,543,11538,-1300,3230,-1100,3174,-7369,16593,-7120,5419,-5167,10380,-1711,13296,-4364,-1344,20490,2308,-8601,-4165,8284,-3668,11748,10364,-1383,10750,-2602,11104,-19565,13366,486,18671,-6459,6094,-251,7970,1465,17889,296,3671,27663,-7736,-1928,10011,6605,-3051,-44936,-3447,-103585,-75396,12829,54801,8197,-16393,39962,-22385,8881,13274,13080,37019,7225,-29177,-7229,15710,-2128,8100,4249,-13936,16410,-6862,-4619,5928,1712,13089,-19638,6327,-2769,1637,-6572,-23032,24562,27470,13685,12345,7310,-4857,8940,-1493,6867,12697,19913,-7902,5709,29806,15098,-15649,10473,12332,-3022,-21045,5111,5287,14515,-5587,1898,18896,-6736,25597,6995,19910,3070,-10953,-2163,-4335,12461,-13777,-2290,9941,14059,-2731,13902,13240,3324,-14567,-16398,20072,-3655,15141,13876,-15108,23931,-3179,-15843,-22848,17219,-13617,-8951,25264,22619,6290,-5615,-34707,26777,-27607,5358,-106031,-85133,-8551,35000,31301,-15712,15285,-6121,-25900,27063,-27934,12237,-15521,15417,5246,-47642,-12552,13318,-21269,6019,15963,-5356,30785,18615,-6125,28,-38344,6592,-14945,-29326,-19973,9945,-7604,17105,-6321,43152,-9296,1675,27422,-8736,-10802,5919,-3647,30212,19854,-5364,18758,23126,1519,-19871,1927,11298,-17989,4753,19406,-3765,14781,-13944,-5133,8107,-4789,7228,-14405,24551,-3244,14129,-8396,-3344,17789,-5670,30420,-13917,3491,-14227,-1321,15512,5685,-919,-15515,10471,-6173,18692,-21373,12735,9,22690,-6639,6662,13006,-276,19270,6777,-12145,3386,21445,4899,16828,8497,3596,18711,-7266,-369,22546,6514,20805,1714,-16292,24635,-8445,21433,-3466,12384,-6864,-318,36066,11871,-9263,18254,27318,-6066,13638,-37465,24957,-3685,13499,7801,-11087,27710,5245,1874,-6115]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1115332,19176,-17129,3969,13628,-15311,20561,-453,-18444,10407,-7913,1648,37678,25886,-21055,-18017,-2844,11577,12515,2724,-4354,32326,23178,7012,52355,52147,9863,46322,13444,-1835,-8604,38292,2896,15493,22675,5482,7211,-21711,-4596,36907,-7801,-16785,32117,9027,19349,16799,-22018,18904,-11863,-16415,-8895,32844,10564,3746,15810,4831,14744,26829,-1994,28110,818,24915,27321,25879,-37096,-172385,76738,18857,11269,12380,10305,-2257,-24840,78667,20225,32643,33960,3846,16021,48823,12721,-3347,41652,-6497,13388,-19597,24411,11697,-155803,-28973,3225,-13103,-60654,34190,-6973,-69627,22837,52283,-12013,75783,852,19717,1823,-9790,29335,37257,-13491,382,-5235,35744,29645,38102,40473,43086,10186,31170,36386,58053,4761,26050,-5977],"returnScale":1000000,"returns":[21016,17554,-15680,3633,12476,-14017,18823,-415,-16884,9526,-7243,1508,34492,23697,-19274,-16494,-2603,10598,11456,2494,-3986,29593,21218,6419,47927,47738,9029,42404,12308,-1680,-7877,35054,2651,14183,20758,5018,6601,-19875,-4207,33786,-7141,-15366,29401,8264,17712,15379,-20156,17305,-10860,-15026,-8143,30066,9671,3429,14473,4423,13497,24560,-1825,25733,749,22808,25010,23691,-33959,-157808,70249,17262,10317,11333,9433,-2066,-22739,72014,18515,29883,31088,3521,14666,44694,11645,-3064,38130,-5947,12255,-17939,22346,10708,-142628,-26522,2952,-11995,-55525,31299,-6384,-63739,20906,47862,-10997,69374,780,18050,1669,-8962,26854,34106,-12350,350,-4792,32721,27138,34880,37051,39442,9325,28534,33309,53144,4358,23847,-5471]}});
\ No newline at end of file
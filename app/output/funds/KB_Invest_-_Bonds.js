@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Bonds", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1201169,-66,-4096,11082,5798,4024,-6228,-7464,-269,-20469,-13970,18180,7841,10131,4423,542,5696,-9190,1769,15817,2398,4329,13452,10203,-13753,10402,5309,15050,-355,21876,-9451,-21081,-1111,14683,652,-12232,-899,-12361,7802,1109,-461,15559,-1450,-13398,2391,-3482,505,-1761,5307,-13418,540,3193,-161,5403,3964,5663,17806,4335,1566,7410,-3932,-11909,-17657,2031,-5459,3817,740,-6445,2673,-919,-6395,-5675,9040,-387,7444,1174,-2131,1217,-3443,6019,7381,6251,-4565,-1076,5204,11014,5073,3024,-1196,1510,5141,3342,4685,1100,3391,-295,1276,4090,15583,3743,4594,7467,-727,5869,6033,3018,7140,13812,2234,-4584,-675,6686,5013,761,6047,6800,1532,-1207,5046,-449,8611,7683,371,3087,-3565,4552,-1668,-5097,-3742,2698,9214,3620,69,175,-1721,6788,5523,-8091,6923,4613,-1231,4467,-5017,-7689,-5215,1155,-4407,-1450,-3944,3869,2004,1752,-1567,1861,-11792,2796,1721,6335,-3364,1699,10332,-5622,-1071,-2040,52,6194,3591,-2491,-1606,-2881,1748,-2565,312,-3063,-792,6142,-8765,7859,671,-1447,-3506,-443,1371,4490,-14634,-2047,11188,658,-799,1876,3009,470,-7017,499,2760,3570,-647,10585,623,3689,220,-3419,4592,-8376,-1842,-91,-2363,-4235,11707,-806,-4992,2627,5218,-4406,3963,-731,-3031,-2317,-137,1549,-3420,-1954,3150,-2672,10362,9652,-122,9038,4411,-2447,2633,6740,-605,1078,4024,2974,-3731,5017,5879,325,-6553,2658,1382,-1038,-4174,-642,4399,1080,5932,-2380,3479,6790,4197,-4475,4239,610,2989,1751,1289,3837,4257,76,-2678,-3467,3578,-393,2863,740,-1314,1958,-4326,2001,3542,-2661,2547,4365,4238,4462,593,4606,3220,43,-14832,-14139,-25029,-23213,-1917,-15661,23378,4639,3275,-4388,6975,12970,4569,1389,15522,-1021,8951,-1415,4134,-4104,-144,2323,-9118,1010,2020,3315,922,2808,867,640,358,-3278,-7124,1382,-4061,3671,6301,9017,2493,3793,-93,775,-781,1379,-8494,264,3611,544,3107,9539,-2743,-201,-1644,4975,3143,2045,961,-2242,-599,-3792,1890,-13,4959,-3198,630,4098,4313,3192,4029,1016,3722,-2755,1780,2713,-3797,1586,2200,2035,-84,-380,2265,1212,-1150,-2471,-1745,-1540,-1448,-426,6031,-2450,724,-9980,463,327,-5986,-2998,2410,-393,-13591,-1621,1490,-10570,-3299,-8184,-65774,-182546,-16717,22526,-2601,13369,-5855,-2134,804,14564,786,1712,6974,-4865,-2980,-19800,-13567,370,-4904,-6030,-10818,11604,11221,24309,9440,6663,-2093,-29387,-224,-3436,-17629,-18620,-6369,3388,-2295,15130,1825,8518,6699,17005,14930,-5614,1487,-3980,-4291,3442,4321,4404,20890,227,3078,-5941,-3010,-486,6261,2111,-2700,9152,3373,2000,-2186,2806,-1706,6419,-4987,2561,8860,1527,1722,7442,935,-9688,12911,5011,11296,-5467,12480,-647,3804,2314,3874,2379,-2532,-5087,-7988,4554,-4441,1097,10761,2749,4549,4010,8486,8399,10591,2273,1364,-1869,5933,2438,3740,4852,-918,1823,1747,2287,3642,-3091,4614,1124,-3328,1600,-2292,-953,3956,-872,4191,-1208,1182,-79,1892,-1606,-960,1036,4146,-34,2400,7600,-1176,3501,6793,-349,3797,2814,2198,1814,1766],"returnScale":1000000,"returns":[-1246,-55,-3406,9214,4821,3346,-5178,-6206,-224,-17020,-11616,15117,6520,8423,3678,451,4736,-7642,1471,13152,1994,3599,11185,8484,-11435,8649,4414,12514,-295,18189,-7858,-17529,-923,12208,542,-10170,-748,-10278,6488,922,-384,12937,-1205,-11140,1988,-2896,420,-1464,4413,-11157,449,2655,-134,4492,3296,4709,14806,3604,1302,6161,-3269,-9902,-14682,1689,-4539,3174,615,-5359,2223,-764,-5318,-4718,7516,-322,6190,976,-1772,1012,-2863,5005,6137,5198,-3796,-895,4328,9158,4218,2514,-994,1255,4275,2779,3895,915,2819,-245,1061,3401,12957,3112,3820,6209,-605,4880,5016,2510,5937,11484,1858,-3812,-561,5559,4168,633,5028,5654,1274,-1004,4196,-373,7160,6388,309,2566,-2964,3785,-1387,-4238,-3111,2243,7661,3010,58,145,-1431,5644,4592,-6727,5756,3836,-1024,3715,-4172,-6393,-4336,960,-3664,-1206,-3279,3217,1666,1457,-1303,1547,-9805,2325,1431,5268,-2798,1413,8591,-4675,-890,-1696,43,5150,2986,-2071,-1336,-2395,1453,-2132,259,-2547,-658,5107,-7288,6534,558,-1203,-2915,-369,1140,3734,-12168,-1702,9302,548,-665,1560,2502,391,-5835,415,2295,2968,-537,8801,518,3067,183,-2843,3818,-6964,-1532,-75,-1965,-3522,9735,-670,-4151,2184,4339,-3664,3295,-607,-2521,-1926,-114,1288,-2844,-1625,2620,-2222,8616,8025,-101,7515,3667,-2034,2189,5604,-503,897,3345,2473,-3102,4172,4888,270,-5449,2211,1149,-863,-3471,-534,3658,898,4932,-1979,2893,5646,3490,-3721,3524,507,2486,1456,1071,3191,3540,63,-2227,-2883,2975,-326,2380,615,-1092,1628,-3597,1664,2945,-2213,2118,3629,3524,3710,493,3830,2678,35,-12332,-11757,-20811,-19301,-1594,-13022,19439,3857,2723,-3649,5800,10784,3799,1155,12907,-849,7442,-1176,3437,-3412,-120,1931,-7581,840,1679,2757,766,2335,721,532,298,-2726,-5923,1149,-3377,3053,5239,7497,2073,3154,-77,644,-649,1146,-7062,219,3003,452,2583,7932,-2281,-167,-1367,4137,2613,1701,799,-1865,-498,-3153,1572,-11,4123,-2659,524,3408,3586,2654,3350,845,3094,-2290,1480,2256,-3158,1319,1829,1693,-70,-316,1883,1008,-956,-2055,-1451,-1280,-1204,-355,5015,-2037,602,-8298,385,272,-4978,-2493,2004,-326,-11301,-1348,1239,-8789,-2743,-6805,-54690,-151784,-13900,18730,-2163,11116,-4868,-1774,668,12110,654,1423,5799,-4045,-2478,-16464,-11280,307,-4077,-5014,-8995,9648,9331,20212,7849,5540,-1740,-24435,-186,-2857,-14658,-15482,-5296,2817,-1908,12580,1518,7082,5570,14140,12414,-4668,1236,-3309,-3568,2862,3593,3662,17369,189,2559,-4939,-2503,-404,5206,1755,-2245,7610,2804,1663,-1817,2333,-1419,5337,-4146,2129,7367,1270,1432,6188,777,-8055,10735,4167,9392,-4546,10377,-538,3163,1924,3221,1978,-2105,-4230,-6641,3786,-3693,913,8947,2286,3782,3335,7056,6983,8807,1889,1135,-1554,4933,2027,3110,4034,-763,1516,1452,1902,3028,-2570,3836,935,-2767,1330,-1906,-792,3289,-725,3485,-1004,982,-65,1573,-1335,-799,862,3447,-28,1995,6320,-978,2911,5648,-290,3157,2340,1827,1509,1468]},"lttb":{"start":16344,"dateDeltas":[2,12,5,4,12,5,9,9,5,9,5,4,8,11,4,12,3,12,4,5,12,5,5,9,12,4,4,12,6,9,8,6,7,8,9,5,5,7,11,5,9,3,8,13,6,3,9,6,11,6,10,4,11,6,4,12,5,4,9,7,6,13,8,6,8,3,12,1,7,11,5,12,7,6,9,5,5,11,3,8,11,5,11,6,3,12,3,7,11,3,13,7,9,4,4,14,3,9,6,5,8,7,10,9,3,11,7,4,12,3,6,13,4,10,4,11,7,6,8,6,6,9,7,11,4,10,3,10,10,1,10,5,13,5,9,3,11,8,9,5,9,4,6,6,14,7,6,6,7,8,10,4,11,5,5,9,6,6,8,9,4,7,8,9,12,3,9,4,7,13,8,2,9,7,11,4,9,8,4,12,3,11,2,9,11,7,3,9,5,7,11,10,6,7,4,6,11,8,8,3,8,6,11,7,10,7,6,4,11,6,4,10,4,10,11,7,7,8,6,7,8,5,8,7,7,10,4,11,6,7,5,12,4,4,13,5,8,9,4,9,10,2,8,7,6,8,12,8,7,7,6,5,9,8,6,9,10,6,3,13,6,5,9,6,8,9,3,13,4,11,7,6,8,4,7,10,8,7,4,10,3,13,3,8,8,6,11,4,12,5,5,10,9,4,8,9,2,14,7,4,9,6,6,8,5,7,8,10,11,5,9,2,10,9,4,12,7,6,8,4,9,4,8,9,10,4,7,12,6,2,14,3,9,10,1,10,5,7,14,6,4,9,4,7,12,7,3,7,13,2,14,2,9,8,8,5,6,11,8,4,6,10,9,4,12,6,4,12,6,3,8,6,8,9,6,11,7,3,11,10,5,10,6,8,8,4,6,8,5,13,4,11,8,6,3,10,7,4,14,5,9,8,5,8,3,7,11,7,5,7,7,13,2,12,3,10,3,13,8,8,7,6,7,6,8,8,9,5,6,7,10,5,6,11,8,5,7,4,11,5,8,6,9,8,7,11,8,2,10,5,8,7,8,10,4,11,8,5,4,12,2,11,4,11,8,4,8,5,9,10,7,8,8,5,9,3,8,12,6,3,13,7,5,6,6,10,9,8,9,5,6,10,3,12,3,12,5,10,1],"priceScale":10000,"prices":[1202668,-2091,1474,-6574,11477,10180,595,-15561,1582,-18609,-15273,-8640,26463,14170,8823,-4968,10608,-18525,10263,17627,-3792,7306,15539,10707,-14260,22542,-6556,14623,24468,-1170,-34246,-1463,16679,7136,-21056,2046,-15385,11921,-5909,5462,15294,-1185,-14509,4937,1031,-17898,10398,5603,-13565,3552,-3012,10996,-2577,9644,20277,-1871,5447,7185,902,-7670,-24888,-5275,461,7862,-8267,-5580,6383,-511,-7045,-7335,15001,-4290,14451,-9066,4404,-5677,6346,584,12720,495,-10236,9454,11316,7194,2471,-4436,849,-2301,13450,6308,-2271,7326,-3907,6005,-1815,17549,8337,8061,-2280,7567,-823,7757,1418,20773,4433,-5831,-4421,12009,3756,-1263,6793,7366,3689,-3718,8142,-3723,15563,-903,5285,-4046,6648,-5722,-1203,-5803,1727,10565,5431,-1881,1701,-4790,9233,5584,-8908,11402,-4963,8237,45,-12778,-5080,1679,-4934,-532,-4794,4839,-1398,-1063,7063,-17466,9762,-11828,18406,-6095,266,13097,-8953,5803,-7287,6643,-2909,7582,-3505,1263,1115,-7662,4546,-1313,-4732,-871,6738,-10204,13543,-9831,4383,-5142,-1003,7966,-19089,-214,13827,-1497,-2543,5836,-231,8016,-14374,8736,-4102,7927,-3315,9986,4330,1918,-9984,11277,-10446,2614,-3623,1127,-8396,12184,-3175,3158,-7721,9784,-4413,8299,-11125,3902,-4394,-911,4417,-5869,-318,5519,-4588,19302,-1180,10195,4486,-3593,2204,8316,-1089,-2136,7987,3202,-4507,4828,7693,-778,-7545,3422,2465,838,-6976,7345,-4947,7506,-2878,536,11450,3791,-5950,-291,6331,-1012,10855,-4049,6445,4470,-4203,-754,-3487,6040,-3509,5316,-3865,3433,-4320,4129,1498,-2754,-705,7625,2293,6403,998,3838,4389,-674,-17972,-43530,-24427,13969,-31316,30129,6483,3881,-5346,540,19586,6734,-715,13395,-990,10489,-3220,7257,-7075,6600,-1405,-10011,4832,-3675,6388,-1952,7467,-2110,998,-3278,-9496,4882,-7096,1082,15851,-1765,7353,5477,-934,2623,-2943,1642,-8551,-381,6326,-1313,12044,-3435,4654,-8278,6760,6433,-2035,-1755,3708,-1755,-6435,5285,-1459,6747,-6799,3095,4042,5321,621,5497,1423,3412,-2757,4499,-3506,-1251,5394,-702,2322,-664,2263,1556,227,-2271,-3446,-1192,-2253,-128,6519,-4889,2675,-10054,2502,-2212,-8847,437,4721,-16851,-4737,5162,-10668,498,-15200,-62457,-178296,-23156,28853,-9013,15537,-7040,-2837,2563,15841,-4244,13580,-5082,-3783,-19928,-13452,497,-8754,3685,-18823,2540,23175,24310,13081,3205,-29923,-2923,2747,-4365,-21800,-23788,9186,-9035,17303,-2092,18479,-5190,8488,30686,-6881,1958,-626,-7582,-411,5953,7838,18384,-2930,9584,-15189,713,8901,1765,-5754,10967,3966,4583,-4247,3087,-2364,6978,-6685,4358,8584,-73,1699,13349,-3073,-9688,13312,3971,11808,-5340,12360,-2148,8019,-60,5920,-2419,203,-13246,4964,-5191,-571,12935,1405,5653,5287,15420,407,10452,4266,-1478,-1092,5850,3866,8285,-2572,-130,2603,1623,6047,-3327,4740,1240,-3693,1965,-2916,-1356,6751,-2591,4924,-3326,4863,-3678,3146,-1718,-2946,6946,-244,2944,7372,-3015,5568,5474,891,3242,5244,402,4193,-613],"returnScale":1000000,"returns":[0,-1739,1226,-5466,9543,8464,495,-12939,1316,-15473,-12700,-7184,22004,11782,7336,-4131,8821,-15403,8533,14657,-3153,6074,12921,8903,-11857,18743,-5451,12159,20344,-973,-28475,-1216,13868,5934,-17508,1701,-12792,9912,-4913,4541,12717,-985,-12064,4105,857,-14882,8646,4659,-11279,2953,-2504,9143,-2143,8019,16860,-1556,4529,5974,750,-6377,-20694,-4386,383,6537,-6874,-4639,5307,-425,-5858,-6099,12473,-3567,12016,-7538,3662,-4721,5277,486,10576,412,-8511,7861,9409,5981,2055,-3689,706,-1913,11184,5245,-1889,6092,-3249,4993,-1509,14592,6932,6702,-1895,6292,-685,6450,1179,17273,3685,-4848,-3676,9985,3123,-1050,5649,6124,3068,-3092,6770,-3095,12940,-751,4394,-3364,5528,-4758,-1000,-4825,1436,8784,4516,-1564,1415,-3983,7677,4643,-7407,9481,-4127,6849,37,-10624,-4224,1396,-4103,-442,-3986,4023,-1162,-884,5873,-14523,8117,-9835,15304,-5067,221,10890,-7445,4826,-6059,5523,-2419,6305,-2915,1050,928,-6371,3780,-1092,-3935,-724,5603,-8485,11261,-8174,3644,-4275,-834,6623,-15872,-178,11497,-1245,-2114,4852,-192,6665,-11951,7263,-3410,6591,-2756,8303,3600,1595,-8302,9377,-8686,2174,-3013,937,-6981,10131,-2640,2626,-6420,8135,-3669,6900,-9250,3245,-3654,-757,3672,-4880,-264,4589,-3815,16049,-981,8477,3730,-2987,1832,6915,-906,-1776,6641,2663,-3748,4015,6396,-647,-6273,2845,2050,697,-5801,6107,-4113,6241,-2393,446,9520,3153,-4948,-242,5264,-841,9026,-3367,5359,3717,-3495,-627,-2899,5022,-2918,4420,-3213,2854,-3592,3433,1246,-2290,-586,6340,1906,5324,830,3191,3650,-561,-14943,-36195,-20310,11615,-26039,25052,5390,3227,-4445,449,16286,5599,-595,11138,-823,8721,-2677,6034,-5883,5488,-1168,-8324,4018,-3056,5311,-1623,6209,-1754,829,-2725,-7896,4059,-5900,900,13180,-1468,6114,4554,-777,2181,-2447,1366,-7110,-317,5260,-1092,10014,-2856,3870,-6883,5621,5349,-1692,-1460,3084,-1460,-5350,4394,-1213,5610,-5653,2573,3361,4424,517,4570,1184,2837,-2293,3741,-2915,-1040,4485,-584,1931,-552,1881,1294,189,-1888,-2866,-991,-1873,-107,5421,-4065,2224,-8360,2081,-1840,-7356,363,3926,-14011,-3939,4292,-8870,414,-12639,-51932,-148250,-19254,23991,-7494,12918,-5853,-2359,2131,13171,-3528,11291,-4225,-3146,-16570,-11185,413,-7278,3064,-15652,2112,19270,20214,10876,2665,-24880,-2431,2284,-3629,-18127,-19779,7638,-7512,14387,-1740,15365,-4315,7058,25515,-5722,1628,-520,-6305,-341,4949,6518,15286,-2437,7969,-12629,593,7401,1467,-4784,9119,3297,3811,-3531,2567,-1966,5802,-5558,3623,7138,-61,1413,11099,-2555,-8055,11068,3302,9818,-4440,10277,-1786,6668,-50,4923,-2012,169,-11014,4128,-4317,-474,10755,1168,4700,4397,12821,338,8691,3547,-1229,-908,4864,3215,6889,-2139,-108,2165,1349,5028,-2766,3941,1031,-3071,1634,-2424,-1128,5613,-2154,4094,-2765,4043,-3058,2616,-1429,-2449,5775,-203,2448,6130,-2507,4630,4551,741,2696,4360,334,3487,-510]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1211808,-7858,-2361,5394,24179,26194,32480,-12513,-21830,6624,-5145,-5035,34861,8516,-28666,-3455,-2406,6382,11804,22788,9517,8762,28505,17438,30249,5663,12508,22607,-486,3024,3881,13823,-7797,-8867,2353,-6569,15199,-1624,-4321,-3431,5982,-5119,-1325,7190,-1832,15667,-11931,6787,-163,-5625,-2681,21629,11360,12285,11365,-4007,218,15019,6285,11437,-2483,3530,-741,15972,-7456,-84844,32920,24885,21331,-3395,4582,1336,-6304,21601,-5489,5912,4951,9892,-3719,7019,13759,38,5837,-685,-5017,-5619,-6691,-13660,-112010,-146009,11882,2379,-42387,9827,9723,-40199,8404,44722,-7334,31274,-3563,13759,6412,6921,16798,19138,11098,-652,-5460,25790,26192,14291,4570,7461,-4262,6382,-597,11266,12538,11073,1429],"returnScale":1000000,"returns":[7600,-6534,-1963,4485,20104,21780,27007,-10405,-18151,5508,-4278,-4187,28987,7081,-23836,-2872,-2001,5307,9814,18948,7914,7285,23701,14500,25151,4709,10400,18798,-404,2514,3227,11494,-6483,-7373,1956,-5462,12638,-1350,-3593,-2853,4974,-4256,-1102,5978,-1523,13027,-9921,5644,-136,-4677,-2229,17984,9446,10214,9450,-3331,181,12488,5226,9509,-2064,2935,-616,13280,-6199,-70547,27373,20691,17737,-2823,3810,1111,-5242,17961,-4564,4915,4117,8225,-3092,5836,11440,32,4853,-569,-4172,-4672,-5563,-11358,-93135,-121404,9880,1978,-35244,8171,8084,-33425,6988,37186,-6098,26003,-2962,11440,5332,5754,13968,15913,9227,-542,-4540,21444,21779,11882,3800,6204,-3544,5307,-497,9368,10425,9207,1188]}});
\ No newline at end of file
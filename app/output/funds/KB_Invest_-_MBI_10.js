@@ -0,0 +1 @@
+registerFundSeries("KB Invest - MBI 10", {"weekly":{"start":17258,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[999951,440,130,209,-2470,5227,6260,11849,1656,1532,151,1641,3167,3828,-4377,30569,41219,-6593,11234,15525,2335,6844,-1812,3548,985,1987,767,-22647,8859,-9691,-4111,-33,-12800,-2365,-36923,13828,-6450,-2872,-412,14970,27996,15791,20242,28831,27706,-40209,7733,2715,7906,14384,10489,-20794,-17953,12266,-16074,28378,34018,25678,-1995,7715,-4881,31582,56210,12769,70692,-20680,6648,10879,-11330,17434,-3724,619,-9519,4471,5439,11740,4157,281,36728,-81613,24675,36845,26236,10693,-1606,-4984,-39769,891,-22377,21543,-5606,9382,21489,25309,-563,1021,7517,-3112,5964,24111,-20287,11131,5477,-5378,-5703,-9589,12997,10125,7225,1281,25534,49332,33586,-17888,-1134,-33250,15083,9393,13700,-445,1301,2017,21113,17326,-12797,27575,4255,30775,-2337,30252,60984,-3681,34826,-73673,19682,-6335,43741,-14628,17930,29824,8298,-6209,5856,48826,13297,68790,15546,18300,-4221,3484,15760,4378,-112492,103512,-238560,-265722,-164707,188826,119600,4527,58389,123561,-34448,-8537,-3366,-11120,-21469,-36502,-176,4005,7634,7308,17232,32540,6004,-8389,-3448,-14868,-5099,16880,38969,41636,-11048,9507,-4085,-31856,640,9969,-34145,25697,18999,17276,-9168,-12221,20961,15199,59968,4512,39168,6253,15983,-3355,43122,27192,-31896,-21311,3263,-19555,-13229,11895,15282,18581,4280,15325,13126,11255,59246,10,19175,18713,-21612,-26077,27055,20301,15759,-9643,20914,61557,-22948,64364,57035,22954,10545,-50805,-14277,-4662,-14752,23351,98517,9595,-521,-18149,-637,-15344,-2607,13236,-2127,16396,65560,17581,31562,10350,-44906,28769,15848,-22259,-132076,-11771,-9771,96030,5426,730,43167,-34581,20174,63271,-22081,-10942,-37934,-36308,58189,-39020,-49145,-1582,1032,8047,-24914,40512,7044,-10075,5077,-12970,-6777,-30571,1591,-9157,-11505,-36315,-10631,-10629,-23683,71494,-17643,-5611,-22185,1583,10378,27581,-12485,4255,5422,38436,30089,-7633,1412,-8123,-17346,-1276,-9151,39429,-3788,-20838,385,12887,5825,19806,16260,38807,20711,-50782,-9213,980,-16884,-8846,4151,-35691,41226,6885,13723,-11925,1190,12477,-22329,-4760,-8970,17372,4578,3264,18978,1275,53799,26542,-7614,-35084,-11289,-1981,43394,1280,19245,14751,-756,-1825,9444,50519,7313,4827,4799,131187,-10174,22459,23588,18877,-15815,39431,36645,45664,21168,5814,26648,58027,13422,8928,-13520,35391,33654,64578,106060,-32384,8157,79562,52152,112311,33106,27026,-32756,5427,32287,13392,4244,21737,28867,3923,-14391],"returnScale":1000000,"returns":[-49,440,130,209,-2470,5227,6260,11849,1656,1532,151,1641,3167,3828,-4377,30569,41219,-6593,11234,15525,2335,6844,-1812,3548,985,1987,767,-22647,8859,-9691,-4111,-33,-12800,-2365,-36923,13828,-6450,-2872,-412,14970,27996,15791,20242,28831,27706,-40209,7733,2715,7906,14384,10489,-20794,-17953,12266,-16074,28378,34018,25678,-1995,7715,-4881,31582,56210,12769,70692,-20680,6648,10879,-11330,17434,-3724,619,-9519,4471,5439,11740,4157,281,36728,-81613,24675,36845,26236,10693,-1606,-4984,-39769,891,-22377,21543,-5606,9382,21489,25309,-563,1021,7517,-3112,5964,24111,-20287,11131,5477,-5378,-5703,-9589,12997,10125,7225,1281,25534,49332,33586,-17888,-1134,-33250,15083,9393,13700,-445,1301,2017,21113,17326,-12797,27575,4255,30775,-2337,30252,60984,-3681,34826,-73673,19682,-6335,43741,-14628,17930,29824,8298,-6209,5856,48826,13297,68790,15546,18300,-4221,3484,15760,4378,-112492,103512,-238560,-265722,-164707,188826,119600,4527,58389,123561,-34448,-8537,-3366,-11120,-21469,-36502,-176,4005,7634,7308,17232,32540,6004,-8389,-3448,-14868,-5099,16880,38969,41636,-11048,9507,-4085,-31856,640,9969,-34145,25697,18999,17276,-9168,-12221,20961,15199,59968,4512,39168,6253,15983,-3355,43122,27192,-31896,-21311,3263,-19555,-13229,11895,15282,18581,4280,15325,13126,11255,59246,10,19175,18713,-21612,-26077,27055,20301,15759,-9643,20914,61557,-22948,64364,57035,22954,10545,-50805,-14277,-4662,-14752,23351,98517,9595,-521,-18149,-637,-15344,-2607,13236,-2127,16396,65560,17581,31562,10350,-44906,28769,15848,-22259,-132076,-11771,-9771,96030,5426,730,43167,-34581,20174,63271,-22081,-10942,-37934,-36308,58189,-39020,-49145,-1582,1032,8047,-24914,40512,7044,-10075,5077,-12970,-6777,-30571,1591,-9157,-11505,-36315,-10631,-10629,-23683,71494,-17643,-5611,-22185,1583,10378,27581,-12485,4255,5422,38436,30089,-7633,1412,-8123,-17346,-1276,-9151,39429,-3788,-20838,385,12887,5825,19806,16260,38807,20711,-50782,-9213,980,-16884,-8846,4151,-35691,41226,6885,13723,-11925,1190,12477,-22329,-4760,-8970,17372,4578,3264,18978,1275,53799,26542,-7614,-35084,-11289,-1981,43394,1280,19245,14751,-756,-1825,9444,50519,7313,4827,4799,131187,-10174,22459,23588,18877,-15815,39431,36645,45664,21168,5814,26648,58027,13422,8928,-13520,35391,33654,64578,106060,-32384,8157,79562,52152,112311,33106,27026,-32756,5427,32287,13392,4244,21737,28867,3923,-14391]},"lttb":{"start":17257,"dateDeltas":[5,5,6,2,6,6,8,1,7,5,8,2,10,3,3,6,9,6,5,5,6,4,8,5,5,6,2,9,5,2,9,4,7,6,1,8,5,7,2,9,5,5,4,5,6,6,6,4,10,2,5,5,8,3,6,8,6,6,1,7,7,7,1,7,5,9,6,5,3,5,9,1,6,7,8,4,7,3,7,4,7,6,3,5,4,8,3,7,8,4,3,8,4,8,5,3,5,10,4,5,5,5,6,6,4,7,5,6,5,5,6,7,6,2,10,2,4,8,7,4,6,4,9,2,9,4,4,4,7,7,6,4,7,6,3,5,9,5,2,8,6,5,3,8,6,4,7,4,6,6,5,7,2,9,4,3,7,8,4,7,4,4,9,4,7,2,9,3,4,8,3,9,5,6,5,4,7,4,3,10,6,5,3,8,6,3,6,5,7,2,6,9,4,3,7,6,8,3,5,4,7,8,6,5,4,5,3,10,6,3,4,8,4,4,7,6,4,9,2,5,5,6,7,5,5,9,6,3,7,2,6,6,7,5,6,3,10,3,5,4,5,7,6,7,3,6,5,9,6,4,6,5,3,9,3,8,4,7,2,5,5,5,8,4,5,7,4,8,5,4,6,4,10,6,5,5,5,3,7,4,10,4,4,6,4,8,6,7,4,6,6,4,3,7,6,6,7,1,7,8,6,5,5,6,4,8,2,6,5,7,6,5,6,7,3,4,5,8,6,7,3,4,7,6,6,4,4,10,3,5,4,9,6,4,4,10,5,6,1,5,6,9,3,5,9,3,4,8,7,4,7,6,5,3,6,6,4,5,9,4,3,9,3,9,2,8,5,7,5,5,4,7,6,1,8,3,10,4,5,6,3,10,3,6,3,10,3,3,6,10,5,6,4,7,1,6,7,4,7,7,6,3,5,9,4,3,5,7,6,4,6,9,3,4,7,5,7,2,6,10,1,6,8,3,7,6,7,5,6,5,5,7,2,7,5,5,4,10,2,9,5,5,6,2,6,4,10,6,5,5,2,10,5,5,4,6,4,6,6,8,4,3,9,5,2,6,7,6,5,7,2,6,7,6,3,6,6,9,4,2,10,6,5,5,4,4,9,6,2,5,6,7,6,3,6,9,5,6,1],"priceScale":10000,"prices":[1000000,367,-294,504,2224,-4279,-218,6134,9270,-7253,21525,-8473,5204,224,5178,-3553,3168,3843,-4374,28626,4326,53058,-20859,11248,14147,-1066,3349,8875,-2410,5638,-2075,994,10715,-1170,-32235,-5700,17440,618,-21432,7007,-112,-12721,2403,-4847,-36847,23139,-17141,1686,-3212,-603,15246,2106,25763,16629,19547,-5064,60989,-37233,11015,-4813,-8390,9467,23078,-4274,18714,-8788,-37144,19822,-4499,-15856,4433,34782,23120,29571,-5913,7734,-10840,3141,34398,56207,-6402,35193,90193,-85078,62997,-27516,10826,-21675,27511,3351,-12886,9700,-12422,-1203,13300,-2931,14322,-1491,4092,3780,32848,-81528,30920,-15814,120617,-47958,10695,-3732,13099,-16053,-39675,4886,-27976,38823,-15671,-15946,-9564,29187,21438,33749,-8865,-4070,15910,-12333,5930,5866,24687,172,-20928,11129,5479,-6664,1141,-5250,-10004,14324,-1437,18031,-627,-8015,20764,34748,48476,14002,-17949,5575,-10002,-40311,25441,2104,22872,-5015,5077,-5945,6871,5041,16074,17328,-12863,29153,-4839,7451,28577,-74,11383,85732,-5796,-3829,41112,-6286,-124480,66966,-2736,45166,-18546,-500,21004,29827,-2778,11075,-9761,9249,48989,14572,-1600,117304,-33342,25259,-11057,-7622,159,32769,-2030,-3585,-120873,127739,-115520,-444557,44293,-164583,147634,167298,-14413,4818,65881,123781,-58772,24247,-16490,4444,-14605,3485,-20970,-36856,-21447,31031,-6325,8212,7155,11457,5775,32698,13708,-22622,9229,-6306,-22732,3051,16455,13262,25926,41720,-18546,27629,-33241,18291,-29327,-1812,-21686,34352,-36684,25236,-4588,40819,-25071,16412,-13346,-2799,28664,71536,-310,4590,43698,-4608,5878,16520,-3436,41049,47521,-18168,3871,-50449,-6716,3181,-19662,2787,-26727,22794,15201,18731,6803,-6595,19416,24000,212,59422,16257,-18117,19752,19954,17281,-61352,-6511,30002,25645,-9455,27082,-18867,22658,61833,-24026,77614,-12358,67955,-1014,28803,7497,-92294,-19621,43041,-27677,1435,21264,98713,-7058,18865,-43656,23569,-11994,16281,-29441,5575,13427,4964,-4494,13608,65733,-1443,24458,38114,-108328,61813,11184,42577,-61464,29861,-214667,65061,-3811,-201,96227,10733,-9071,43341,4123,-34139,19732,63473,-5039,-17045,7600,-42759,-50599,375,58386,-39217,-55404,6259,-5796,-6264,19751,-24917,42829,-16545,21276,-11018,7565,-1740,-12776,-6971,-36579,6008,5237,-12613,-11695,-57909,-5880,33941,-58822,7503,77532,-8129,-23728,2474,-12269,-25068,16918,8096,29866,-17567,-6930,16266,5146,38805,1642,28263,-20491,14370,-13264,4947,-36463,25270,-16580,36922,9753,-10842,-27621,-1570,22375,-1021,27004,-1294,-3141,8018,86520,-15619,-44651,-14176,1342,-1530,-16584,-9614,4817,5310,-41003,41227,7548,-5133,18198,-12068,1131,16694,-4217,-33467,7709,-12243,18676,-3050,18714,-7184,19182,-6890,22078,39889,26547,-22627,14692,-34761,-11074,-14975,56171,-18638,33732,5219,14510,-15550,15261,-15847,23240,50748,-631,7948,-632,10140,131173,-16759,6484,28084,-7413,58934,-30901,405,269,76049,-703,46371,27856,-4562,40320,-5803,75254,-8544,11970,3107,-17990,34390,35581,-2919,179303,5084,-47746,10520,79696,64103,-6645,107017,-1141,61407,-99407,66513,-22201,46380,34159,5955,-18142,13119,46694,-7081,14937,-18600],"returnScale":1000000,"returns":[0,367,-294,504,2224,-4279,-218,6134,9270,-7253,21525,-8473,5204,224,5178,-3553,3168,3843,-4374,28626,4326,53058,-20859,11248,14147,-1066,3349,8875,-2410,5638,-2075,994,10715,-1170,-32235,-5700,17440,618,-21432,7007,-112,-12721,2403,-4847,-36847,23139,-17141,1686,-3212,-603,15246,2106,25763,16629,19547,-5064,60989,-37233,11015,-4813,-8390,9467,23078,-4274,18714,-8788,-37144,19822,-4499,-15856,4433,34782,23120,29571,-5913,7734,-10840,3141,34398,56207,-6402,35193,90193,-85078,62997,-27516,10826,-21675,27511,3351,-12886,9700,-12422,-1203,13300,-2931,14322,-1491,4092,3780,32848,-81528,30920,-15814,120617,-47958,10695,-3732,13099,-16053,-39675,4886,-27976,38823,-15671,-15946,-9564,29187,21438,33749,-8865,-4070,15910,-12333,5930,5866,24687,172,-20928,11129,5479,-6664,1141,-5250,-10004,14324,-1437,18031,-627,-8015,20764,34748,48476,14002,-17949,5575,-10002,-40311,25441,2104,22872,-5015,5077,-5945,6871,5041,16074,17328,-12863,29153,-4839,7451,28577,-74,11383,85732,-5796,-3829,41112,-6286,-124480,66966,-2736,45166,-18546,-500,21004,29827,-2778,11075,-9761,9249,48989,14572,-1600,117304,-33342,25259,-11057,-7622,159,32769,-2030,-3585,-120873,127739,-115520,-444557,44293,-164583,147634,167298,-14413,4818,65881,123781,-58772,24247,-16490,4444,-14605,3485,-20970,-36856,-21447,31031,-6325,8212,7155,11457,5775,32698,13708,-22622,9229,-6306,-22732,3051,16455,13262,25926,41720,-18546,27629,-33241,18291,-29327,-1812,-21686,34352,-36684,25236,-4588,40819,-25071,16412,-13346,-2799,28664,71536,-310,4590,43698,-4608,5878,16520,-3436,41049,47521,-18168,3871,-50449,-6716,3181,-19662,2787,-26727,22794,15201,18731,6803,-6595,19416,24000,212,59422,16257,-18117,19752,19954,17281,-61352,-6511,30002,25645,-9455,27082,-18867,22658,61833,-24026,77614,-12358,67955,-1014,28803,7497,-92294,-19621,43041,-27677,1435,21264,98713,-7058,18865,-43656,23569,-11994,16281,-29441,5575,13427,4964,-4494,13608,65733,-1443,24458,38114,-108328,61813,11184,42577,-61464,29861,-214667,65061,-3811,-201,96227,10733,-9071,43341,4123,-34139,19732,63473,-5039,-17045,7600,-42759,-50599,375,58386,-39217,-55404,6259,-5796,-6264,19751,-24917,42829,-16545,21276,-11018,7565,-1740,-12776,-6971,-36579,6008,5237,-12613,-11695,-57909,-5880,33941,-58822,7503,77532,-8129,-23728,2474,-12269,-25068,16918,8096,29866,-17567,-6930,16266,5146,38805,1642,28263,-20491,14370,-13264,4947,-36463,25270,-16580,36922,9753,-10842,-27621,-1570,22375,-1021,27004,-1294,-3141,8018,86520,-15619,-44651,-14176,1342,-1530,-16584,-9614,4817,5310,-41003,41227,7548,-5133,18198,-12068,1131,16694,-4217,-33467,7709,-12243,18676,-3050,18714,-7184,19182,-6890,22078,39889,26547,-22627,14692,-34761,-11074,-14975,56171,-18638,33732,5219,14510,-15550,15261,-15847,23240,50748,-631,7948,-632,10140,131173,-16759,6484,28084,-7413,58934,-30901,405,269,76049,-703,46371,27856,-4562,40320,-5803,75254,-8544,11970,3107,-17990,34390,35581,-2919,179303,5084,-47746,10520,79696,64103,-6645,107017,-1141,61407,-99407,66513,-22201,46380,34159,5955,-18142,13119,46694,-7081,14937,-18600]},"monthly":{"start":17286,"dateDeltas":[31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[998260,22961,12347,64526,33323,4419,-26526,-30004,-4151,114206,-24063,-5252,60755,40391,134530,26149,-5184,52806,10559,-39096,2795,52554,11087,3387,12743,99985,-10033,31669,42442,116609,-21689,72454,71345,97215,-88953,-417793,347365,-57691,-50022,66757,-31677,93479,-23073,16426,86293,65683,35063,-58179,72879,81774,11906,54464,190988,-58298,107693,-41913,97844,23585,-136370,93877,96429,-66588,-77924,37309,-45281,-65236,24366,-40627,34013,61139,-19371,12811,80511,-52360,-1791,26370,-23051,28342,37115,48735,23956,134090,126741,98489,124888,64893,146162,292172,30471,62938,-18694],"returnScale":1000000,"returns":[-1740,22961,12347,64526,33323,4419,-26526,-30004,-4151,114206,-24063,-5252,60755,40391,134530,26149,-5184,52806,10559,-39096,2795,52554,11087,3387,12743,99985,-10033,31669,42442,116609,-21689,72454,71345,97215,-88953,-417793,347365,-57691,-50022,66757,-31677,93479,-23073,16426,86293,65683,35063,-58179,72879,81774,11906,54464,190988,-58298,107693,-41913,97844,23585,-136370,93877,96429,-66588,-77924,37309,-45281,-65236,24366,-40627,34013,61139,-19371,12811,80511,-52360,-1791,26370,-23051,28342,37115,48735,23956,134090,126741,98489,124888,64893,146162,292172,30471,62938,-18694]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Zlaten Fond", {"weekly":{"start":18721,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1000036,-915,13883,-3960,-21767,41293,-5964,26023,-1669,-7636,-16890,-73946,-2318,5130,-5840,-4089,-15980,29870,-43007,-9225,-25210,29176,193,-41543,-12057,-8237,1094,43819,51334,12321,-34234,29754,57406,-8093,-49155,-20711,-17252,13651,15551,15094,-41306,11053,21147,-48123,6822,49866,61587,-1351,8272,18922,-25443,31461,5050,16380,21070,-94154,-18858,-32257,-66371,18661,-20,-5863,-11021,-37774,-25923,-39475,-9534,-40289,-1333,26927,-3204,20537,-29775,-2396,-38087,32894,-30908,-18659,48028,15485,-47541,31296,6182,6211,73326,-30941,26581,26314,-20165,-21973,28311,-7484,72339,18398,-10764,-8263,-45758,-7077,-39099,-34803,32677,-31682,72770,22891,17533,52637,15628,-33527,-5797,55121,-38204,-34618,-41607,27438,-12888,-10637,-33816,2375,-20074,47901,-5701,-11873,-29924,-7057,-41407,30072,12428,-10896,43075,-18087,-52637,-4560,67420,11947,-6933,-1773,-61191,23545,11244,73047,-45225,18301,25829,-15014,-28100,3807,-53758,15671,3859,-29917,-15456,-14739,15519,55097,4887,-1097,52470,57254,25032,-1741,16990,-32703,50771,31604,-35220,3318,-49653,1377,23165,1665,40836,49032,-19501,-21830,11538,-34856,65547,18759,-16803,-57048,91506,-1439,3999,-15054],"returnScale":1000000,"returns":[-36,-915,13882,-3960,-21765,41290,-5964,26022,-1669,-7636,-16889,-73940,-2318,5130,-5840,-4089,-15979,29868,-43004,-9224,-25208,29174,193,-41540,-12056,-8237,1094,43816,51330,12320,-34231,29752,57402,-8093,-49151,-20710,-17251,13650,15550,15093,-41303,11052,21146,-48120,6822,49862,61583,-1351,8271,18921,-25441,31458,5050,16379,21068,-94147,-18856,-32255,-66366,18659,-20,-5862,-11020,-37772,-25921,-39472,-9533,-40286,-1333,26925,-3204,20535,-29772,-2396,-38084,32891,-30906,-18657,48024,15484,-47537,31293,6182,6210,73321,-30939,26579,26313,-20164,-21971,28309,-7484,72334,18397,-10764,-8262,-45755,-7076,-39096,-34801,32675,-31680,72765,22889,17532,52633,15627,-33525,-5796,55117,-38201,-34616,-41604,27436,-12887,-10636,-33814,2375,-20073,47898,-5701,-11872,-29922,-7056,-41404,30070,12427,-10895,43072,-18086,-52633,-4560,67415,11946,-6932,-1773,-61187,23544,11243,73042,-45222,18299,25828,-15013,-28098,3806,-53754,15670,3859,-29915,-15455,-14738,15518,55093,4887,-1097,52466,57250,25030,-1741,16989,-32701,50768,31601,-35217,3318,-49650,1377,23164,1664,40834,49028,-19500,-21828,11537,-34853,65542,18758,-16802,-57044,91499,-1439,3999,-15053]},"lttb":{"start":18718,"dateDeltas":[2,3,1,4,1,4,2,3,2,3,1,3,4,2,2,4,1,4,2,1,4,3,2,3,2,3,3,1,4,3,1,3,3,3,2,3,1,4,1,4,3,1,3,2,4,2,2,4,2,2,4,1,4,2,2,3,1,3,3,4,1,3,2,2,4,2,4,2,2,3,2,2,4,2,3,1,3,4,2,2,3,2,2,4,2,2,3,2,4,2,2,2,3,3,3,2,3,3,2,4,1,2,3,3,3,3,2,2,4,2,1,3,2,4,2,4,1,2,3,2,4,3,2,2,3,2,4,2,1,3,3,2,4,3,2,1,3,3,3,3,2,3,2,4,2,3,2,2,3,2,2,4,2,3,3,2,2,4,1,4,1,2,4,2,4,1,2,4,3,2,2,3,2,3,2,4,2,1,4,2,3,3,1,3,3,4,2,3,1,4,1,4,1,3,3,2,3,3,3,1,3,3,2,3,3,3,1,3,3,3,1,3,3,3,2,3,2,4,1,4,1,3,4,2,2,3,1,4,3,1,3,3,3,3,3,2,3,2,3,1,2,5,1,4,2,1,4,1,3,3,2,3,4,2,3,2,2,3,2,2,3,2,3,4,2,2,2,3,3,2,2,3,4,2,3,3,2,2,2,3,2,3,3,2,3,3,3,2,3,1,3,4,3,2,3,2,3,1,3,3,3,1,3,3,2,2,5,2,1,4,1,4,3,2,3,1,3,3,2,2,4,2,3,3,1,3,2,3,4,2,3,1,3,3,2,4,1,4,3,2,1,4,3,1,4,1,4,1,3,3,4,1,3,3,3,2,2,4,2,2,2,3,3,2,3,2,2,3,2,3,4,3,1,2,4,2,3,3,2,3,2,2,2,3,2,3,4,1,4,1,3,2,3,4,3,1,3,2,4,2,3,3,2,1,4,1,5,2,2,2,3,2,3,3,2,2,4,3,1,2,5,1,2,3,4,2,1,3,4,2,2,3,2,4,2,2,2,3,2,4,3,2,3,3,1,3,3,1,4,2,4,1,2,3,3,2,3,3,3,2,2,4,1,3,4,2,3,2,3,3,2,1,3,3,2,2,3,4,2,2,2,4,1,3,3,4,2,2,2,4,2,3,2,2,3,3,1,3,3],"priceScale":10000,"prices":[1000072,-24,-36,-1032,141,-3693,18039,-463,10259,-13306,-979,-11085,-10545,7404,24941,8923,-17712,745,42207,-9461,5953,-362,-9914,6949,5549,-21874,8628,-22897,13165,-14351,-60225,-6416,9625,-8373,-3682,-13106,15117,3179,4315,-19180,1485,27678,-24218,-15221,9114,-9942,9465,27418,-10310,3128,-44607,-22447,17075,-2084,-4213,-22439,1442,24259,-15865,20782,-10041,11299,-272,-24543,-17980,18421,-28425,-3288,9020,-15270,-2452,-16809,20532,10662,26260,6155,-924,61093,-17129,14132,6133,5629,-6753,-29362,-1356,3809,23967,5274,47612,8943,1880,-19012,4552,-37034,-12057,1913,-27227,4539,12820,-32582,-5809,-15287,37714,239,16053,-1198,-2399,16944,549,-46634,5389,-61,37319,-26480,-14951,49305,-26796,10693,-40255,-4758,31021,-24139,29100,-12935,33706,14106,50417,-5818,7331,-28190,22325,-41174,38073,44200,-20948,7043,-37841,18468,-6070,27414,4120,-24755,3027,26777,-23834,36135,2551,19649,-1500,5743,-19964,-75420,-46214,27685,-465,8005,-38724,-1538,-95411,27098,13518,-24854,35128,6490,-8634,851,-25315,33489,-24805,-30527,28421,-46512,18101,-9365,-740,-41353,14898,-32835,-24822,21639,-27014,15290,-18210,16372,-38454,11121,-12455,-17483,38377,11086,-15993,-10197,17881,19786,-7875,8626,-2784,-33836,4577,32163,-29886,-12580,-46420,18559,275,41815,-1756,-27824,-12201,15967,-11415,-28226,-8867,61866,1670,43406,-31151,3230,-23406,-25090,21355,-20821,31766,15989,-14897,5041,-28653,-17993,63137,68631,14907,-26756,-29742,5065,32357,-5721,-23627,60410,-10467,-25057,12295,-7238,10838,-32289,-4314,36906,-6153,1072,12934,-20442,24,60940,11516,-1360,21666,-55,-34469,22815,-1307,9812,-19610,-5625,10835,-49094,16305,-27467,4029,-4227,-38207,3494,-29411,-6966,2405,31961,-274,-44110,12479,40915,-1294,34307,16029,-21637,27350,15982,5965,-4474,50478,2226,-7335,40213,-17181,-19655,-13872,981,-13845,6999,-5163,58639,-4195,2154,-32628,-1958,10459,-47456,2379,-10760,-33082,-1777,35207,-3629,550,-7475,-6091,-7774,6008,-7568,-24732,-15858,10576,-20168,13959,14633,-33366,2138,51562,8499,-12160,10746,-19963,8337,-23184,6490,12725,-50339,7690,-11362,4360,-55,-39753,-1654,6670,24244,-842,25353,-12077,-898,-13535,2743,-54,13241,29894,-732,-17428,13,-49520,-3064,-21737,2440,14684,34058,4122,29298,14617,-242,-2486,-21589,14201,455,-31130,31562,-5772,-57408,-5525,33909,-3000,-3798,12399,644,47171,4579,21241,-28256,-2046,-14863,-23691,55549,-13617,25671,2297,-658,9095,-25525,-130,-26298,-1131,-20049,20160,4139,-53537,-1270,16443,-2284,6484,-3345,25511,-42545,10897,-21548,-38870,20610,2856,-14,-20967,6190,-22391,37040,870,57772,-2675,12587,3562,-20166,-12234,27958,-7917,50525,2010,-65,46541,10713,18606,-109,6535,-24695,23028,-33048,7368,42105,9549,-42063,302,19078,35483,-10391,17382,19216,19054,-61211,8694,18327,-14568,-965,-33966,36441,-51754,12252,-18203,2456,29068,-1031,-11370,16434,-12214,-531,52353,-2224,47422,1663,25334,-47303,4907,-587,-24621,939,40005,-28311,-156,-60615,25759,45128,-6708,27207,34187,-25133,9625,-26465,9662,-30009,-1401,-25562,26828,70371,-6532,-23807,24439,-4718,32719,-25370,-23358,8364],"returnScale":1000000,"returns":[0,-24,-36,-1032,141,-3693,18038,-463,10258,-13305,-979,-11084,-10544,7403,24940,8922,-17711,745,42204,-9460,5952,-362,-9913,6949,5548,-21872,8627,-22895,13164,-14350,-60221,-6415,9624,-8372,-3682,-13105,15116,3179,4314,-19178,1484,27676,-24216,-15220,9114,-9942,9465,27416,-10310,3128,-44604,-22445,17074,-2084,-4213,-22437,1442,24257,-15864,20781,-10041,11299,-272,-24542,-17978,18419,-28423,-3287,9019,-15269,-2452,-16808,20531,10661,26258,6155,-924,61089,-17128,14131,6132,5629,-6753,-29359,-1356,3808,23966,5273,47609,8942,1880,-19011,4552,-37031,-12056,1912,-27225,4539,12819,-32579,-5809,-15286,37711,239,16052,-1198,-2399,16943,549,-46630,5388,-61,37316,-26478,-14950,49302,-26794,10692,-40252,-4758,31019,-24137,29098,-12934,33703,14105,50414,-5818,7330,-28188,22324,-41171,38070,44197,-20947,7043,-37838,18466,-6069,27412,4119,-24753,3027,26775,-23832,36132,2551,19648,-1500,5742,-19962,-75415,-46210,27683,-465,8004,-38721,-1538,-95404,27096,13517,-24852,35125,6490,-8634,851,-25313,33487,-24804,-30524,28419,-46509,18100,-9365,-740,-41350,14897,-32832,-24821,21638,-27012,15289,-18209,16371,-38451,11120,-12454,-17482,38374,11085,-15992,-10196,17880,19785,-7875,8625,-2783,-33834,4577,32160,-29883,-12579,-46417,18558,274,41812,-1755,-27822,-12201,15966,-11414,-28224,-8866,61861,1670,43403,-31149,3230,-23404,-25088,21353,-20819,31763,15988,-14896,5041,-28651,-17992,63133,68626,14906,-26754,-29740,5064,32355,-5721,-23625,60406,-10466,-25056,12294,-7237,10837,-32286,-4314,36903,-6152,1072,12933,-20441,24,60936,11515,-1360,21664,-55,-34466,22813,-1307,9812,-19609,-5625,10835,-49091,16304,-27465,4029,-4227,-38204,3494,-29409,-6966,2405,31959,-274,-44107,12478,40912,-1294,34305,16028,-21636,27348,15981,5965,-4474,50474,2226,-7334,40210,-17180,-19654,-13871,981,-13844,6999,-5163,58635,-4195,2154,-32626,-1957,10458,-47453,2379,-10759,-33080,-1777,35205,-3629,550,-7474,-6091,-7773,6007,-7567,-24731,-15856,10575,-20167,13958,14632,-33363,2137,51559,8498,-12159,10745,-19961,8336,-23182,6489,12724,-50335,7689,-11361,4360,-55,-39750,-1654,6669,24243,-842,25351,-12076,-898,-13534,2743,-54,13240,29892,-732,-17427,13,-49517,-3063,-21736,2440,14683,34056,4121,29296,14616,-242,-2486,-21587,14200,455,-31128,31560,-5772,-57404,-5524,33906,-3000,-3797,12398,644,47167,4579,21240,-28254,-2046,-14862,-23690,55545,-13616,25670,2296,-658,9095,-25523,-130,-26296,-1131,-20048,20159,4138,-53533,-1270,16442,-2284,6484,-3345,25509,-42542,10896,-21546,-38867,20608,2856,-14,-20965,6189,-22389,37037,870,57768,-2675,12586,3562,-20165,-12233,27956,-7916,50521,2010,-65,46538,10712,18605,-109,6534,-24693,23026,-33045,7367,42102,9548,-42060,302,19077,35480,-10390,17381,19215,19052,-61206,8693,18326,-14567,-965,-33964,36439,-51751,12251,-18201,2456,29066,-1031,-11370,16433,-12213,-531,52349,-2223,47418,1663,25332,-47299,4906,-587,-24619,939,40002,-28309,-156,-60610,25757,45124,-6707,27205,34184,-25131,9625,-26464,9662,-30007,-1401,-25560,26826,70366,-6532,-23805,24437,-4717,32716,-25368,-23356,8363]},"monthly":{"start":18747,"dateDeltas":[31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[987348,60689,-108734,16019,-51639,-59815,75817,31889,3807,-35234,75632,31403,-48789,-103454,-116050,-4836,-49711,30976,-8924,98948,-7202,59872,-108262,106947,29491,-56023,-34292,26457,-47765,-39340,43012,48440,5132,-60753,-63827,132823,65731,52056,-25928,88542,4261,13519,8364],"returnScale":1000000,"returns":[-12723,60685,-108727,16018,-51635,-59811,75812,31886,3807,-35231,75626,31401,-48785,-103447,-116042,-4835,-49708,30974,-8923,98941,-7202,59868,-108254,106939,29489,-56019,-34290,26455,-47761,-39337,43009,48436,5132,-60749,-63822,132813,65726,52053,-25927,88536,4261,13518,8363]}});
\ No newline at end of file
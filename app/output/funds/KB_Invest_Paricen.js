@@ -0,0 +1 @@
+registerFundSeries("KB Invest Paricen", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1120031,762,784,759,773,769,766,762,758,766,766,757,770,758,735,717,721,735,723,716,722,745,838,759,721,666,754,687,686,712,727,676,694,814,682,702,664,665,679,623,626,606,547,425,545,607,617,625,758,636,663,601,593,552,606,556,582,526,500,598,613,643,644,595,464,571,593,706,643,601,606,592,604,593,587,612,599,591,603,545,591,668,602,608,603,600,602,614,596,601,609,621,420,608,466,609,633,618,644,646,647,641,657,631,645,637,640,634,787,502,630,635,611,638,619,634,635,641,681,616,623,1047,647,373,450,695,605,617,783,977,636,448,285,662,817,798,604,343,712,735,562,621,587,602,276,451,493,663,357,540,557,1000,773,559,521,87,306,615,525,584,543,541,554,555,711,1058,435,15,520,579,584,547,660,517,719,842,555,554,408,186,531,502,522,635,438,548,527,523,553,494,570,524,526,514,502,500,509,493,515,515,503,467,503,493,480,501,477,492,482,522,478,496,508,491,490,465,505,498,499,514,541,544,563,542,535,653,872,572,375,263,554,524,508,532,771,310,511,534,512,542,509,521,491,438,406,386,441,738,223,398,437,447,435,402,424,404,422,435,452,420,454,440,628,373,372,496,316,354,424,498,269,310,251,395,410,387,347,893,569,274,79,121,1175,440,413,392,416,433,424,409,432,421,268,549,406,410,397,364,364,363,388,338,306,321,347,339,229,322,326,334,326,336,355,352,333,310,328,324,333,311,344,362,362,347,374,378,-383,-192,970,520,788,357,334,372,366,382,346,361,360,-685,822,326,317,492,373,-136,94,973,1182,461,357,392,403,-329,-143,96,294,434,341,336,315,355,850,760,690,285,471,355,365,224,506,325,372,363,406,337,379,-371,808,758,387,379,391,3410,637,300,351,384,365,356,351,363,368,-487,-108,334,1674,509,393,402,404,386,395,413,437,-597,-911,428,427,444,444,421,439,401,458,419,448,435,464,428,776,1978,460,479,476,464,484,463,155,-787,211,520,2306,578,530,535,534,523,550,555,395,685,598,587,554,-52,-170,79,700,272,575,599,586,598,552,2303,-659,91,579,630,576,570,631,597,607,638,1198,470,425,481,681,649,643,682,599,645,654,672,655,669,625,657,651,732,1356,1422,726,659,652,632,655,656,69,-456,585,663,664,618,671,652,664,663,633,722,1198,706,568,409,638,576,380,661,688,664,680,649,671,541,801,661,681,660,435],"returnScale":1000000,"returns":[380,681,700,678,691,687,684,680,677,684,685,676,688,677,656,640,644,657,646,639,645,665,749,678,644,595,673,614,612,636,650,604,619,727,610,627,593,594,606,557,559,541,488,380,487,542,551,558,677,568,593,536,530,493,541,497,520,470,446,534,548,574,575,532,414,510,530,630,575,536,542,529,539,530,524,547,535,527,539,487,528,596,538,543,539,536,537,549,532,537,544,554,375,544,416,544,565,552,575,577,578,573,586,564,576,569,572,566,703,448,563,567,546,570,553,566,567,573,608,550,556,936,577,334,402,620,541,551,699,873,568,400,255,591,730,712,540,306,636,657,501,555,524,538,247,402,441,592,319,482,498,893,690,500,465,78,273,549,469,522,485,483,495,495,635,945,389,13,465,517,522,488,590,461,643,752,495,495,365,166,474,448,467,567,391,489,471,467,494,441,510,468,469,459,449,446,455,440,460,460,450,417,449,440,429,448,426,439,431,466,427,443,453,439,438,415,451,445,445,460,483,486,503,484,477,584,779,510,335,235,495,468,454,475,689,277,456,477,457,484,455,465,439,391,363,344,394,659,200,355,390,400,388,359,379,361,377,388,404,375,406,393,561,333,332,443,282,316,379,445,240,277,224,353,366,346,310,797,509,244,71,108,1049,393,369,350,372,387,379,365,386,376,239,490,363,366,355,325,325,324,347,302,273,287,310,302,205,288,291,298,291,300,317,315,297,277,293,289,298,278,307,323,324,310,334,337,-342,-171,866,464,704,319,298,333,327,341,309,322,322,-612,734,291,284,439,333,-121,84,869,1055,412,319,350,360,-294,-128,86,263,387,305,300,281,318,759,679,616,254,421,317,326,200,452,290,333,324,363,301,338,-331,721,677,346,339,349,3046,568,268,314,343,326,318,313,325,328,-435,-96,298,1495,455,351,359,361,345,352,369,391,-534,-813,382,381,397,397,376,392,358,409,374,400,389,414,383,693,1766,411,428,425,415,432,413,139,-703,188,465,2060,516,473,478,477,467,491,496,353,612,534,524,495,-47,-151,70,625,243,514,535,523,534,493,2057,-588,81,517,563,514,510,563,533,543,569,1070,420,380,429,609,579,575,609,535,576,584,600,585,598,558,587,581,654,1211,1270,649,588,583,564,585,586,62,-408,523,592,593,552,600,582,593,592,565,645,1070,631,507,366,569,515,339,591,614,593,608,579,600,483,715,591,608,589,389]},"lttb":{"start":16344,"dateDeltas":[5,8,3,13,1,12,4,6,11,8,9,5,6,9,3,14,7,3,6,10,8,6,6,13,2,9,4,12,9,6,9,7,8,6,7,5,11,2,13,7,7,4,5,7,12,8,3,12,8,7,8,6,6,7,6,9,6,7,8,7,11,7,2,12,7,9,7,5,10,6,8,5,4,9,9,7,10,3,12,7,1,8,11,5,9,7,11,6,3,10,4,10,6,6,12,7,5,9,9,5,10,4,10,7,4,9,10,4,9,5,9,9,7,4,12,6,7,6,7,11,3,12,6,3,12,2,8,10,10,5,8,3,11,7,4,9,12,6,6,9,8,2,8,12,4,5,13,5,5,6,8,8,6,10,7,11,4,10,5,7,8,10,4,11,7,7,8,2,6,13,6,4,9,10,7,7,3,10,6,11,8,4,5,8,7,7,13,6,4,9,5,10,10,2,13,7,6,4,13,2,6,8,9,7,8,9,3,13,2,10,9,9,4,10,6,9,6,5,11,4,9,5,12,7,4,9,8,7,3,7,7,8,10,10,7,8,4,4,8,9,9,7,6,5,11,5,6,10,5,13,2,7,12,6,4,13,8,4,5,13,4,8,9,9,5,7,5,9,10,4,5,8,6,10,5,10,7,8,11,6,4,6,10,6,5,13,4,7,6,11,9,7,2,10,10,6,7,10,2,10,8,8,9,2,12,7,5,10,5,4,13,3,10,5,9,4,13,3,11,5,8,4,13,6,6,8,9,5,10,5,10,8,3,7,8,11,6,2,12,8,7,6,8,9,8,6,5,7,10,6,5,12,4,5,12,4,9,7,11,6,7,6,5,6,14,1,9,11,6,9,2,9,5,7,14,3,6,11,4,6,9,10,9,4,6,13,2,8,5,13,8,4,9,9,5,9,5,5,13,5,10,7,4,5,8,7,11,6,8,8,4,12,5,4,14,4,9,3,13,5,6,5,9,11,5,7,8,8,7,6,5,13,7,8,7,4,5,10,10,2,9,12,3,10,7,6,8,6,5,8,13,7,2,6,9,6,8,12,5,5,10,9,9,4,5,11,5,5,14,3,10,5,8,4,12,5,11,3,7,11,6,5,10,9,7,5,10,3,12,5,4,8,13,6,2,8,9,9,4],"priceScale":10000,"prices":[1119605,532,874,348,1402,131,1323,429,654,1192,884,969,543,676,950,304,1435,754,309,603,1027,851,734,660,1334,154,964,373,1186,946,594,876,815,780,608,657,485,1058,182,1146,599,537,179,377,595,1046,723,411,1126,692,595,634,543,452,631,405,638,542,580,725,692,919,383,226,1008,756,763,611,421,864,506,685,400,369,773,772,541,843,329,1025,616,77,697,939,448,762,601,969,512,79,883,194,872,550,525,1111,635,476,846,798,467,904,373,900,803,227,801,925,321,833,424,832,800,694,363,1056,949,665,480,248,1063,233,1075,691,584,1129,24,342,920,1231,474,674,9,1183,616,291,799,1011,200,366,654,758,-18,574,977,750,607,1039,367,-71,225,696,599,508,765,576,852,348,1424,408,-97,578,807,362,849,713,469,1027,228,483,1008,299,-13,685,717,683,404,212,786,435,859,565,358,337,656,522,474,961,403,315,627,381,713,661,167,902,505,373,316,895,173,425,514,687,481,574,596,240,894,164,718,686,741,294,838,397,1113,533,385,398,332,682,328,936,795,63,649,619,500,257,524,457,628,631,528,434,824,268,10,459,591,560,390,340,329,635,342,345,588,350,826,347,354,651,457,152,664,569,264,148,508,210,490,497,453,783,565,334,20,307,989,332,576,220,588,320,589,414,506,503,487,244,334,597,336,240,670,236,356,240,521,456,331,-7,457,481,269,315,528,84,503,352,382,410,103,541,344,271,510,238,221,693,-596,-38,872,620,634,664,128,581,283,416,186,671,-770,814,315,471,378,547,-248,257,1575,420,461,406,641,306,-487,-239,276,518,310,387,380,402,812,328,1004,441,421,249,627,63,431,546,227,471,412,544,-342,350,1059,318,309,770,3072,800,475,295,502,88,476,268,332,727,-692,-160,560,1503,452,502,589,506,187,371,784,128,-1734,160,793,518,232,559,571,269,593,284,329,857,278,638,2297,304,286,531,499,773,218,607,-963,-29,917,2149,360,1081,271,656,262,1016,399,289,545,766,909,383,158,-704,809,187,415,478,1106,593,648,2685,-1314,-92,840,786,282,708,1026,309,836,1215,628,282,392,465,794,1161,702,123,578,780,611,719,1203,397,427,966,925,2326,445,455,1044,445,454,1311,234,-708,396,897,245,1079,498,1000,315,672,994,639,998,1024,490,558,538,517,342,1154,350,521,768,1226,430,337,789,828,849,435],"returnScale":1000000,"returns":[0,475,781,311,1252,117,1182,383,584,1064,790,866,485,603,849,271,1282,674,275,539,917,760,656,590,1191,138,861,333,1059,845,531,782,728,697,543,586,434,945,162,1024,535,479,160,337,531,935,645,368,1005,618,532,566,485,404,563,362,570,484,518,648,618,820,343,201,901,675,681,546,376,772,452,612,357,330,690,689,484,753,294,915,550,69,623,838,400,681,537,865,458,70,789,173,779,491,469,992,568,425,755,713,417,808,333,804,717,203,715,826,287,744,379,743,714,620,324,944,847,594,429,221,950,208,960,617,522,1008,22,305,822,1099,424,602,8,1056,551,259,714,903,179,327,584,677,-16,512,873,670,542,928,328,-64,201,622,535,454,683,515,761,310,1272,365,-87,516,721,323,759,637,418,918,203,432,900,267,-11,611,641,610,361,189,702,389,767,504,320,301,586,466,424,858,360,281,560,341,636,591,149,806,451,333,282,800,154,380,459,613,430,513,532,214,799,146,642,612,662,263,748,355,994,476,344,355,297,609,293,836,710,56,580,553,446,230,468,408,561,564,471,388,736,239,9,410,528,500,349,303,294,567,306,308,525,313,737,310,317,581,408,136,593,508,236,132,454,187,438,444,405,699,505,298,18,274,883,297,514,197,525,286,526,370,452,449,435,218,298,533,300,215,598,211,318,214,466,407,296,-7,409,429,240,282,471,75,450,314,341,366,92,484,307,242,456,212,197,619,-532,-34,779,554,566,593,114,519,253,372,166,599,-688,727,282,421,337,489,-222,230,1406,376,411,363,573,273,-435,-214,247,463,276,346,339,360,725,293,897,393,376,223,560,56,385,488,202,421,368,486,-305,312,946,284,276,688,2744,714,424,264,448,79,425,239,297,649,-618,-143,500,1343,404,448,526,452,167,331,701,114,-1549,143,708,463,207,500,510,240,530,253,294,765,249,570,2051,272,255,474,446,691,194,542,-860,-26,819,1920,321,966,242,586,234,907,357,258,487,684,812,342,141,-629,723,167,370,427,988,530,579,2398,-1174,-82,750,702,252,633,916,276,747,1085,561,252,350,415,709,1037,627,110,516,697,546,642,1074,355,381,863,826,2078,397,407,932,398,405,1171,209,-632,353,802,218,964,445,893,282,600,888,570,892,914,438,498,481,462,305,1031,312,466,686,1095,384,301,705,739,758,389]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1122892,3272,3398,3220,2906,3294,3061,3168,2901,2572,2542,2830,2551,2401,2589,2789,2483,2656,2570,2677,2600,2364,2819,2765,2980,2559,2794,3256,2156,3252,2386,2847,2562,2133,2890,1635,2493,2855,1967,2610,2603,1841,2301,2377,2180,2247,2163,2089,2221,2100,2327,2732,1877,2558,2035,2218,2086,1707,1826,1896,2050,1724,1366,2379,1731,1840,1821,1807,1605,1491,1363,1450,1450,1451,1632,1474,1429,1277,1330,1504,2487,94,1590,2759,1478,1680,1120,5312,1687,1604,209,3155,1753,-496,1923,1876,3858,1992,242,4165,2147,2489,575,2414,3957,1120,2652,2790,2976,2684,2908,4525,2690,1136,2780,3450,2576,2506,2915,3003,324],"returnScale":1000000,"returns":[2936,2922,3035,2876,2596,2942,2734,2830,2591,2297,2270,2528,2279,2144,2312,2491,2218,2372,2296,2391,2322,2112,2518,2469,2662,2285,2496,2908,1926,2904,2132,2542,2289,1905,2581,1460,2227,2550,1757,2331,2325,1644,2056,2123,1947,2007,1932,1866,1983,1876,2078,2440,1677,2285,1817,1981,1863,1525,1631,1694,1831,1539,1220,2125,1546,1644,1626,1614,1434,1331,1218,1295,1295,1296,1458,1316,1277,1140,1188,1343,2222,84,1420,2464,1320,1501,1000,4745,1506,1433,187,2818,1565,-443,1718,1676,3445,1780,216,3720,1918,2223,513,2156,3535,1000,2369,2492,2658,2397,2597,4042,2403,1014,2483,3082,2300,2239,2603,2683,289]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB Amerika", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1141913,-9031,-11261,10404,10664,4831,16409,-2085,590,-22437,-23703,-17201,294,6132,12279,-3759,6019,2563,-5306,1613,-3001,6010,821,6117,-4320,-24854,9269,7439,8437,-10707,106,-3263,3059,9209,-16218,2873,-12910,-32913,4343,-26033,-1423,14418,1566,-2782,-14142,2420,-17065,-17531,-17942,-6913,-22863,14644,9185,-642,-6884,10024,380,5905,-4281,4171,2192,-4584,-14913,13042,-3972,8830,-18109,-15823,-492,18233,-10884,-23897,12074,8608,7201,20213,3944,5483,4721,-1741,7463,5618,6521,-7223,-203,6914,3729,-4727,608,-10231,-9582,15489,15572,10830,-3270,36014,-13238,6449,10516,10506,8432,10180,-3527,12451,-12080,7116,-176,24612,6901,-10014,-3204,-18766,-1155,-11930,7607,-4524,2517,8944,13355,22993,-3544,11698,13734,7044,10523,10294,10688,7421,7672,-9677,-23655,-2784,-4951,-1029,-659,-1083,5875,1114,1690,8748,1985,-644,942,7086,-3762,11481,11109,1359,2978,-5636,5148,10175,-3600,-10416,-20047,-932,-7073,-526,17840,-4919,-7013,-20102,2496,-2351,-7567,2934,-5277,6885,-7121,5415,7112,14671,4401,10546,-4553,-20950,5488,-6327,5159,2712,-129,-12726,-3627,4064,3295,-3086,8928,4455,34244,13265,-7927,-7874,1090,-1668,1575,-6359,-7950,10739,-3613,3773,-3268,-4259,-5272,-8304,-9559,-8637,1814,1837,-13666,-6295,-12233,-8914,-4520,41,4191,529,-12507,4378,-17950,-13423,-10800,8858,-11319,-1287,41707,-4221,7398,-6039,1332,14429,-5560,15802,-6230,3385,-2288,3225,7377,4675,1509,8474,-12609,7899,4469,-2170,-2220,2831,10395,-9098,8868,-6411,-486,8754,-3098,-2560,-4268,-65,-7573,-21,9697,7648,17928,-13100,7800,1790,-820,-1771,6969,1719,9987,1409,-219,2226,-1294,10382,3089,21285,-2648,8611,-5813,3136,-1801,-4582,-63905,-21483,-134880,-61425,21475,9723,58205,-11151,-9169,13451,409,4368,1968,23292,23547,-13920,-4802,-14613,6399,1987,267,-6479,-4174,4152,16396,2113,37,-11208,6124,-780,-4639,-2450,-2192,700,-4510,-17539,9212,22010,11177,14259,12013,-401,3687,536,5743,30800,14683,-8638,-3162,7828,4044,6532,-4395,5584,5379,-8819,-10521,7851,8072,4668,-896,5156,14349,4184,12644,3503,11600,6651,1224,-3363,-8784,-3224,-4515,-2530,14602,12605,6176,-2465,4654,6250,-8008,-10107,5367,7926,-1704,5979,6821,-553,8915,2211,1216,-2871,-7894,7111,146,4647,8183,24497,17361,-5224,-26855,2337,4591,-13568,-52755,-36425,-2551,45982,10869,19221,6485,-10948,5049,-7289,-6463,-19610,8147,-7606,17333,10080,-37394,-1180,-7494,-2245,-7252,7285,8131,6483,15359,-2756,-7812,-18177,-18231,2323,-27609,-41514,15893,-4250,-1604,17542,-4945,13942,17001,-12100,8926,11568,-11967,3668,-2270,17160,41534,-13792,5950,18832,703,3624,-21691,15156,-25775,13745,-39,20459,5271,-4743,4706,1557,-14704,8114,22542,11299,20778,-9092,10568,-6583,17426,-23146,-2933,23835,26676,-19128,-10652,-6113,14401,22334,3131,1017,-33683,-5645,7494,5797,-27533,-29782,42385,15913,5716,6751,11809,10754,5355,3146,415,-1069,22691,24672,15384,21059,22605,-5235,18000,9387,-22894,5013,35611,4142,-18775,3615,-37746,26008,7405,10078,15667,-4053,-10269,18100,46924,3194,1760,10055,-5184,-29170,-5258,-21071,-15554,47587,174,6245,-62638,65297,6928,6345,26068],"returnScale":1000000,"returns":[4873,-7948,-9909,9155,9384,4252,14439,-1834,519,-19745,-20858,-15137,259,5396,10806,-3308,5296,2256,-4669,1419,-2641,5289,722,5383,-3801,-21872,8157,6546,7425,-9422,93,-2871,2691,8104,-14271,2528,-11361,-28963,3822,-22909,-1252,12687,1379,-2449,-12444,2129,-15017,-15427,-15789,-6083,-20119,12886,8083,-565,-6058,8821,335,5196,-3767,3670,1929,-4034,-13123,11477,-3496,7771,-15936,-13924,-433,16045,-9578,-21029,10625,7575,6337,17787,3470,4825,4155,-1532,6567,4944,5738,-6356,-178,6084,3281,-4159,535,-9004,-8432,13631,13703,9530,-2877,31691,-11649,5675,9254,9245,7420,8959,-3104,10957,-10630,6262,-155,21658,6073,-8812,-2820,-16514,-1016,-10498,6694,-3981,2214,7871,11752,20234,-3119,10294,12086,6199,9260,9059,9405,6530,6752,-8516,-20816,-2450,-4357,-905,-580,-953,5170,980,1487,7698,1747,-567,829,6236,-3311,10104,9775,1196,2621,-4960,4530,8954,-3168,-9166,-17641,-820,-6224,-463,15699,-4329,-6171,-17690,2197,-2069,-6659,2582,-4644,6059,-6266,4765,6258,12911,3872,9281,-4007,-18436,4830,-5568,4540,2387,-114,-11199,-3191,3576,2899,-2715,7856,3921,30134,11673,-6976,-6929,960,-1468,1386,-5596,-6996,9450,-3179,3320,-2876,-3748,-4639,-7307,-8412,-7601,1597,1616,-12026,-5539,-10765,-7845,-3977,36,3688,465,-11006,3853,-15796,-11812,-9504,7795,-9960,-1133,36702,-3715,6510,-5314,1172,12698,-4893,13906,-5483,2979,-2013,2838,6491,4114,1328,7457,-11096,6951,3933,-1909,-1954,2491,9148,-8006,7803,-5641,-428,7703,-2726,-2253,-3755,-58,-6664,-18,8533,6730,15777,-11528,6864,1575,-722,-1558,6133,1512,8789,1240,-193,1959,-1139,9136,2718,18731,-2330,7577,-5115,2760,-1585,-4032,-56236,-18905,-118693,-54053,18897,8556,51220,-9812,-8069,11837,360,3843,1732,20497,20721,-12249,-4226,-12859,5631,1748,235,-5701,-3673,3653,14429,1859,33,-9863,5389,-687,-4082,-2156,-1929,616,-3969,-15434,8107,19368,9836,12548,10571,-353,3245,471,5054,27104,12921,-7602,-2782,6888,3559,5748,-3867,4914,4733,-7761,-9258,6909,7103,4108,-789,4538,12627,3682,11126,3083,10208,5852,1078,-2960,-7730,-2837,-3973,-2226,12849,11093,5434,-2169,4096,5500,-7047,-8894,4723,6974,-1499,5261,6003,-487,7845,1946,1070,-2527,-6946,6257,129,4089,7201,21557,15278,-4597,-23632,2056,4040,-11940,-46423,-32054,-2245,40464,9564,16915,5706,-9634,4443,-6414,-5687,-17257,7169,-6693,15253,8870,-32906,-1038,-6595,-1976,-6381,6410,7156,5705,13515,-2425,-6874,-15996,-16043,2044,-24295,-36532,13985,-3740,-1411,15437,-4352,12269,14961,-10648,7855,10179,-10531,3228,-1997,15100,36550,-12137,5236,16572,619,3189,-19088,13337,-22682,12096,-35,18004,4638,-4173,4141,1370,-12939,7140,19837,9943,18284,-8001,9300,-5793,15335,-20369,-2581,20975,23475,-16833,-9374,-5379,12673,19654,2755,895,-29641,-4968,6595,5101,-24228,-26208,37298,14003,5030,5941,10392,9464,4712,2768,366,-941,19968,21711,13538,18531,19892,-4606,15840,8260,-20146,4411,31337,3645,-16522,3182,-33217,22887,6517,8868,13787,-3567,-9036,15927,41293,2811,1549,8848,-4562,-25669,-4627,-18543,-13687,41876,153,5496,-55121,57461,6096,5584,22939]},"lttb":{"start":16344,"dateDeltas":[6,7,2,12,6,11,6,5,5,8,9,5,7,10,7,8,9,8,3,6,12,3,11,10,4,4,12,7,6,7,7,10,7,9,7,4,7,11,1,10,9,7,5,10,7,6,5,10,7,5,9,10,8,5,6,9,4,8,9,11,4,9,8,4,12,2,7,13,3,8,10,8,4,8,8,5,7,8,9,5,13,2,12,2,12,9,4,11,7,8,6,7,5,6,10,5,9,5,9,10,4,10,3,12,7,6,4,14,5,7,5,10,5,8,7,7,9,4,8,8,7,7,11,9,1,11,4,12,2,13,7,5,7,7,13,7,1,12,8,4,12,2,9,11,7,5,8,5,6,13,6,5,11,5,5,11,4,11,2,8,7,6,9,7,12,4,9,6,7,7,5,12,9,9,2,13,5,10,6,2,8,13,6,8,8,4,11,3,7,8,5,8,7,7,10,7,5,11,4,10,4,11,8,3,10,9,10,3,8,8,8,6,10,5,9,3,9,9,5,9,5,12,7,2,10,9,7,9,6,8,4,7,6,11,6,7,8,5,7,9,10,3,13,6,6,7,10,8,6,8,6,4,13,4,7,8,10,8,6,6,5,11,6,4,8,9,4,14,7,6,7,7,4,13,2,7,7,8,6,14,5,3,8,11,7,4,10,9,5,11,8,4,5,10,8,5,7,6,9,12,3,9,4,13,4,11,5,6,8,6,12,6,6,7,10,4,10,2,12,3,12,7,6,4,13,8,4,6,8,6,8,7,11,5,6,6,9,12,8,2,12,8,2,10,8,3,10,4,8,8,12,3,11,4,9,7,5,7,13,8,5,3,14,6,8,2,12,8,3,9,10,4,5,9,8,8,8,5,8,5,12,8,6,5,10,3,11,7,10,5,10,4,11,2,9,6,12,4,8,6,11,3,11,4,7,10,4,8,9,4,9,12,6,9,5,8,5,7,9,8,5,8,7,8,5,13,3,5,14,6,2,7,13,8,8,6,6,3,13,4,5,10,5,8,8,11,3,12,7,6,10,7,7,5,4,11,7,8,6,6,10,3,9,8,6,7,13,2,10,6,8,6,8,10,9,4,8,5,9,11,4,10,3,6,7,8,7,9,12,6,2,11,9,5,6,6,10,7,5],"priceScale":10000,"prices":[1136376,10268,-21633,-11738,26732,-231,24395,-8108,9131,-2758,-22433,-56006,22751,-6950,24854,-16410,12043,2338,-12850,9340,-5773,13127,-10281,15137,-33292,2153,8702,27655,-21021,2485,-8458,-8501,22073,-15901,2689,-12910,-38654,14548,-36533,7665,11548,1384,-2782,-14074,3685,-48249,12320,-18083,-4353,-27591,17037,12418,-12872,12223,-5218,13664,-564,-18651,17327,-92,-23985,19386,-4097,12476,-21597,-28886,12563,18232,-27316,-7614,17782,3971,26663,-1117,12706,8394,-9538,1503,12906,7018,-12612,13148,-4144,10458,-9176,-11331,13197,-26145,37519,10059,-3157,36181,-13317,10035,-8412,25796,0,18610,-6826,15688,-16464,11456,318,22287,11577,-9852,-37345,12720,-13210,7853,3130,-11862,9519,4593,36664,-4625,4621,22423,9175,3994,17447,9942,-3673,21071,-32395,-11024,8167,-9705,11084,-13627,11832,-8978,8380,-7957,17464,-7485,12681,-2476,-863,6392,16552,-7087,11288,-5854,15130,-7944,8683,-33858,-7353,5670,-7497,18023,-2040,-10177,-19784,3147,-3320,-8263,7706,-12913,10834,-9819,-5240,20262,14446,6367,8619,-24179,4612,1800,-11654,8334,3570,-13824,-4004,5442,285,-1062,13862,-7770,38133,16999,-21189,8448,-6329,4124,-8140,-6257,14978,-13963,12923,-5988,4354,-12644,-3116,-16342,-8774,7352,-3631,-13745,-6216,-23940,9298,-16394,5684,7112,-15320,4613,-1700,-26997,-13720,9057,-14251,1602,42067,-4581,10490,-9097,1298,14976,-6107,15876,2776,-11112,3137,634,15782,-3241,12267,-19558,14900,-3847,9223,-8072,2144,13544,-9193,9152,-8774,-5242,15965,-6717,2825,-2319,-11766,-2039,235,21239,16284,-12779,7419,1870,-5867,2992,9920,-3106,11774,3873,-4517,6130,-3277,10711,1408,34646,-14670,8734,-11118,8754,-6596,-63900,2555,-179375,-55975,-9337,55327,53334,7003,-29890,24013,-11172,22825,-8032,17759,30040,-20709,2701,-16390,10498,755,-6375,-6815,4288,22230,-6997,10490,-18153,5427,4735,-8077,1113,-13386,6821,-4708,-21257,40531,-5591,25851,-6,14560,-6567,-1433,14710,31396,13547,-8888,-2473,9680,2192,7905,-5768,7263,3355,-14176,-4819,7467,12556,-2602,6589,841,19850,-1317,17127,-935,18049,5447,-12641,2915,-4411,-19619,9866,12568,18829,5859,-8877,8047,4066,-9266,-24277,19810,7763,-1818,13718,-5161,12743,-3579,10484,1357,-17720,8823,-5637,23756,-4873,23202,23796,-42159,16143,-8718,1815,-98067,34372,-60919,67954,19659,-8819,24440,-9704,6867,-8993,5791,-44075,19275,-6615,28041,-628,-37687,7737,-15933,1899,-12504,22283,-12396,28420,852,-11431,-10542,-28246,14160,-37181,-45388,19880,-12824,3718,23118,-12102,18986,16922,-18278,15150,11388,-17111,9421,-2990,57906,-16218,9276,26671,-11343,13910,-30179,18509,-26713,28122,-26311,31400,6228,4507,-33590,30604,-32820,49426,-16127,28560,19115,21549,-37813,28460,-24186,18827,-20844,50640,-16438,10221,-33067,265,43967,-6256,6883,-38657,-8872,28688,4658,-65959,47024,-6330,32134,-12619,584,11402,39601,-19906,11979,-9899,19982,1906,41849,-5039,49911,-11413,26839,7809,-22761,4880,35747,4006,-30408,-25402,36003,-29015,44003,18207,-11189,-22326,30157,36781,21829,-7786,14211,14145,-56898,18856,-93674,30678,70363,-33452,24504,-62493,65443,18394,-17122,37923],"returnScale":1000000,"returns":[0,9036,-19037,-10329,23523,-203,21468,-7135,8035,-2427,-19741,-49285,20021,-6116,21871,-14440,10597,2058,-11308,8219,-5080,11551,-9047,13321,-29297,1895,7657,24336,-18498,2187,-7443,-7481,19424,-13993,2367,-11361,-34015,12802,-32149,6745,10163,1218,-2449,-12385,3243,-42458,10841,-15913,-3830,-24280,14992,10928,-11327,10756,-4592,12024,-496,-16413,15248,-81,-21107,17060,-3606,10979,-19005,-25419,11055,16044,-24038,-6700,15648,3494,23463,-983,11182,7386,-8393,1323,11357,6175,-11098,11570,-3647,9203,-8074,-9972,11614,-23008,33017,8851,-2778,31839,-11719,8831,-7402,22700,0,16377,-6007,13805,-14488,10081,280,19612,10188,-8670,-32863,11193,-11624,6910,2755,-10439,8377,4042,32264,-4070,4066,19732,8074,3515,15353,8749,-3232,18542,-28507,-9701,7186,-8540,9754,-11992,10412,-7900,7374,-7002,15368,-6587,11160,-2179,-760,5625,14566,-6237,9934,-5152,13314,-6990,7641,-29795,-6470,4989,-6597,15860,-1795,-8956,-17410,2770,-2922,-7271,6781,-11363,9533,-8640,-4611,17830,12712,5603,7585,-21277,4058,1584,-10255,7333,3142,-12165,-3523,4788,251,-934,12198,-6837,33556,14959,-18646,7434,-5569,3629,-7163,-5506,13180,-12287,11372,-5269,3831,-11126,-2743,-14380,-7721,6469,-3195,-12095,-5470,-21067,8182,-14427,5002,6259,-13482,4059,-1496,-23757,-12073,7970,-12541,1410,37019,-4032,9231,-8005,1142,13179,-5374,13971,2443,-9779,2761,558,13888,-2852,10794,-17210,13111,-3385,8116,-7103,1887,11918,-8090,8054,-7721,-4613,14049,-5911,2486,-2040,-10354,-1795,207,18690,14330,-11245,6528,1646,-5163,2633,8729,-2733,10361,3408,-3975,5395,-2884,9426,1239,30488,-12910,7686,-9784,7704,-5805,-56231,2248,-157848,-49257,-8217,48687,46934,6162,-26302,21131,-9831,20085,-7068,15628,26435,-18224,2377,-14423,9238,664,-5609,-5998,3774,19562,-6157,9231,-15975,4776,4167,-7108,980,-11780,6002,-4143,-18706,35667,-4920,22749,-5,12812,-5779,-1261,12945,27628,11921,-7821,-2176,8518,1929,6956,-5075,6391,2952,-12474,-4241,6571,11049,-2290,5799,740,17467,-1158,15071,-823,15883,4794,-11124,2565,-3882,-17264,8682,11059,16570,5156,-7812,7081,3578,-8154,-21363,17432,6832,-1600,12072,-4542,11214,-3150,9226,1194,-15593,7764,-4961,20905,-4288,20418,20940,-37100,14206,-7672,1598,-86298,30247,-53609,59799,17300,-7761,21507,-8539,6043,-7914,5096,-38785,16961,-5821,24676,-553,-33164,6809,-14021,1671,-11004,19609,-10908,25009,750,-10059,-9277,-24856,12460,-32718,-39941,17494,-11285,3272,20343,-10649,16707,14891,-16084,13332,10021,-15058,8291,-2631,50956,-14271,8162,23471,-9982,12241,-26558,16288,-23507,24747,-23153,27631,5481,3966,-29559,26931,-28881,43494,-14191,25132,16821,18963,-33275,25045,-21284,16568,-18343,44563,-14465,8994,-29098,233,38690,-5505,6057,-34018,-7807,25245,4099,-58043,41381,-5571,28278,-11105,514,10034,34848,-17517,10542,-8711,17584,1677,36827,-4435,43921,-10043,23618,6872,-20029,4294,31457,3525,-26759,-22353,31682,-25533,38722,16022,-9846,-19646,26537,32367,19210,-6852,12506,12447,-50070,16594,-82433,26997,61918,-29437,21563,-54993,57589,16187,-15067,33371]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1142845,19589,-54830,15107,-685,-20029,12407,-7372,-53572,1744,-53817,-28424,13965,-682,7316,-16521,-11850,45468,11797,6942,-14586,61473,14362,15677,40481,-42863,10058,44497,49273,-15156,-9589,14774,11062,25040,-448,-33829,4511,-25357,1438,31971,-12672,-17426,16260,27952,-204,2858,-30606,-18719,-37126,1677,-33296,30548,10006,6655,24087,-1192,1862,7492,-14235,31508,-3155,20892,10984,24737,-67257,-184591,49946,29325,-4330,-7498,20722,-7988,-26396,59350,20665,31810,14009,-2876,19563,34512,5332,6395,23768,-3473,12535,-405,21723,14177,-94061,62279,-1157,-15062,-29055,5734,2416,-94355,33621,6747,11007,52329,428,22307,7627,20276,34537,30411,-5588,-29076,-28336,50305,36133,54348,64617,30401,-46954,43456,65406,-10740,-1290,22116,19738],"returnScale":1000000,"returns":[5693,17238,-48250,13294,-603,-17625,10918,-6487,-47143,1534,-47358,-25013,12289,-600,6438,-14538,-10428,40011,10381,6109,-12835,54095,12639,13796,35622,-37719,8851,39157,43360,-13337,-8438,13001,9734,22035,-394,-29769,3969,-22314,1266,28134,-11151,-15335,14309,24597,-179,2515,-26933,-16473,-32670,1475,-29300,26882,8805,5857,21196,-1049,1639,6592,-12526,27727,-2777,18385,9666,21768,-59185,-162439,43952,25806,-3810,-6599,18236,-7030,-23228,52227,18185,27993,12328,-2531,17215,30370,4692,5628,20916,-3057,11031,-356,19116,12475,-82772,54804,-1018,-13254,-25568,5046,2126,-83032,29586,5938,9686,46049,376,19630,6712,17843,30392,26761,-4917,-25587,-24935,44268,31797,47825,56863,26752,-41319,38241,57557,-9451,-1136,19462,17369]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB BRIK", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1393598,-1116,-4672,9219,54976,-25745,-8407,38370,-26505,-5236,-90461,26309,23675,10003,32844,37556,73190,-87156,10955,50951,3139,7563,-15887,-4542,25177,-38147,49786,105301,-7482,30839,-56985,-11700,-5752,19252,-16867,-50080,7285,-11227,13048,-9763,-43543,39981,-42289,-15123,-23489,-34585,-81160,11423,-38971,6981,6859,-10613,12542,49791,3011,10384,-9253,22376,-30237,42183,-17067,-31815,-55303,20590,14304,-14962,-63221,-44950,23443,13800,-37220,-36591,38544,9609,80744,-2695,16821,-16275,-1000,-10771,52567,6911,-22979,-45711,-10095,335,31036,8254,-5672,-8696,4207,44234,-1184,38353,12598,-9424,9967,15815,-1252,-9746,26870,-1892,-20251,24505,-7605,29384,-6815,27405,-15051,-54355,1366,26542,30463,-8243,35368,-12599,-17796,10239,32663,2827,-6656,24760,-14956,32014,-1493,725,-11131,-30577,29888,-8557,19084,13278,-29843,-15315,895,-12713,40589,-48916,17292,-7032,-3888,-19143,4438,-24441,3378,53495,-21556,2954,1110,-18256,12979,35845,6253,65024,9199,-87561,-3056,36711,10268,-11388,37899,-3712,7750,-12238,24968,-55367,15273,-524,30955,-12909,57091,19405,32231,24083,-62916,-88871,52092,37762,-52616,12507,-4391,-59359,6777,-4732,-4979,2320,43772,-7727,51402,-23575,-16114,-170,-8057,-22094,-16366,-37749,-7533,48736,-8719,49868,-5078,-15697,-14999,1289,7638,-17933,-6967,21885,39129,-48190,-13628,-1859,-6175,52076,-2426,12562,-37766,22823,-20534,-11551,-42504,9595,35109,19416,37528,18620,12806,-12659,10393,17681,-19626,5137,58406,-20120,27914,33034,-33595,27239,-8976,406,-94952,-30317,33535,3506,-6139,-1652,47943,-4131,29558,898,-2342,-11693,-65931,-49221,-2585,-10846,15401,24236,24694,-1205,5303,-21243,22533,-5050,41214,11934,24870,-22784,-1907,-4395,7959,35689,27107,3460,14081,10188,14657,-32791,-91822,37418,25928,-21268,-162314,-84929,-135598,-96008,22359,20306,48787,2406,-14968,16466,6454,-29572,5638,14577,80138,-39513,18672,-16866,27661,31195,-13551,11386,-38951,12036,18432,-9314,17375,-31133,7104,3787,-25127,-3022,26196,-5462,16862,-49505,50648,40547,6839,26898,13050,16910,7956,-6733,16021,39690,18948,-7190,-49899,82541,20965,12713,-56088,32940,20002,-27730,-13477,15613,-29317,-3886,-9500,-7198,22041,-20159,5121,40947,26908,-6817,-6585,23092,-4525,-27859,-3871,699,-19727,16735,6267,-39277,31077,18962,-10672,-13956,10937,6249,26995,29842,-6092,-22754,2413,29367,-25898,-68442,-5860,34389,-53454,22466,15376,39317,32217,-36265,-2912,1633,9354,-17444,-99128,-34937,-49210,74120,2661,18155,6540,-30687,-58753,54476,-50038,-14866,6241,22069,2650,-11944,-26125,19722,-12278,58477,-34958,8491,22985,4711,21116,-4316,15880,-21844,12627,-36288,-26902,-27083,17084,-34862,23955,-53017,39484,-5124,13104,2539,21627,-542,-41076,-8823,6685,35634,25781,8345,-14426,-19900,7933,1023,-40754,28759,-56863,-4651,4917,31975,-5987,-20537,-17561,3375,-257,794,5615,-18664,31408,19525,17558,-34493,6157,-6567,13355,2809,46185,-20593,-33515,-36622,14799,17278,11538,8688,-12267,-3168,-14487,5007,-58169,18902,9674,-12309,-2781,12702,-4617,9036,6701,-28621,31693,1640,-7265,-42124,36676,-13207,26766,35218,17899,864,-32252,-6347,5341,17039,-6489,15775,-23401,63069,34003,-11479,46958,-36726,-31512,-5778,13730,-1401,4868,7360,23357,-54121,-13466,-12449,3676,7110,-11925,18231,-36662,10547,26813,116707,81883],"returnScale":1000000,"returns":[3186,-803,-3363,6636,39575,-18533,-6052,27621,-19080,-3769,-65119,18939,17043,7200,23643,27035,52686,-62740,7886,36678,2259,5445,-11437,-3269,18123,-27460,35839,75801,-5386,22200,-41021,-8422,-4141,13859,-12142,-36050,5244,-8082,9392,-7027,-31345,28780,-30441,-10887,-16908,-24897,-58423,8223,-28053,5025,4937,-7639,9028,35842,2168,7475,-6661,16107,-21766,30366,-12286,-22902,-39810,14822,10296,-10770,-45510,-32357,16875,9934,-26793,-26340,27746,6917,58124,-1940,12109,-11716,-720,-7753,37840,4975,-16541,-32906,-7267,242,22341,5942,-4083,-6260,3028,31842,-852,27608,9069,-6784,7175,11384,-901,-7015,19342,-1362,-14578,17640,-5474,21152,-4906,19728,-10835,-39127,983,19106,21929,-5934,25460,-9069,-12811,7371,23512,2035,-4791,17824,-10767,23046,-1075,522,-8013,-22011,21515,-6159,13737,9558,-21482,-11025,645,-9152,29218,-35212,12448,-5062,-2799,-13780,3194,-17594,2432,38509,-15518,2127,799,-13142,9343,25803,4502,46807,6622,-63031,-2200,26427,7391,-8197,27281,-2672,5579,-8809,17973,-39856,10994,-377,22283,-9293,41098,13968,23202,17336,-45290,-63974,37498,27183,-37875,9003,-3161,-42730,4879,-3407,-3584,1670,31510,-5563,37002,-16970,-11600,-122,-5800,-15905,-11781,-27174,-5422,35083,-6277,35898,-3656,-11299,-10797,928,5498,-12909,-5015,15754,28167,-34690,-9810,-1338,-4446,37488,-1747,9043,-27186,16429,-14781,-8315,-30597,6907,25273,13977,27015,13403,9219,-9113,7482,12727,-14127,3697,42044,-14483,20094,23779,-24183,19608,-6461,292,-68352,-21823,24140,2524,-4420,-1189,34512,-2974,21278,646,-1686,-8417,-47461,-35431,-1861,-7808,11087,17446,17776,-867,3817,-15292,16221,-3636,29668,8591,17903,-16401,-1373,-3164,5730,25690,19514,2490,10136,7334,10551,-23605,-66098,26936,18664,-15310,-116842,-61137,-97610,-69112,16095,14618,35119,1732,-10775,11853,4646,-21287,4058,10494,57687,-28443,13441,-12141,19912,22455,-9754,8196,-28039,8664,13268,-6704,12507,-22411,5114,2726,-18088,-2175,18857,-3932,12138,-35636,36459,29188,4923,19363,9394,12173,5727,-4847,11533,28571,13639,-5175,-35920,59417,15092,9151,-40375,23712,14399,-19962,-9701,11239,-21104,-2797,-6839,-5182,15867,-14512,3687,29475,19370,-4907,-4740,16623,-3258,-20054,-2787,503,-14200,12047,4511,-28274,22371,13650,-7682,-10046,7873,4498,19432,21482,-4385,-16380,1737,21140,-18643,-49268,-4218,24755,-38479,16172,11069,28302,23192,-26106,-2096,1175,6734,-12557,-71358,-25149,-35424,53355,1916,13069,4708,-22091,-42293,39215,-36020,-10702,4493,15886,1908,-8598,-18806,14197,-8839,42095,-25164,6112,16546,3391,15200,-3106,11431,-15725,9090,-26122,-19366,-19495,12298,-25096,17244,-38164,28422,-3688,9433,1827,15569,-390,-29569,-6351,4812,25651,18559,6007,-10385,-14325,5711,736,-29337,20702,-40933,-3348,3540,23017,-4310,-14783,-12641,2429,-185,572,4042,-13436,22609,14056,12639,-24830,4432,-4727,9613,2022,33247,-14824,-24126,-26363,10654,12437,8306,6254,-8830,-2281,-10428,3604,-41873,13606,6964,-8860,-2002,9143,-3323,6504,4824,-20603,22814,1181,-5230,-30323,26401,-9507,19268,25352,12884,622,-23216,-4569,3844,12266,-4671,11356,-16846,45401,24477,-8263,33803,-26438,-22684,-4159,9883,-1008,3504,5298,16814,-38959,-9694,-8961,2646,5118,-8584,13124,-26392,7593,19301,84012,58944]},"lttb":{"start":16344,"dateDeltas":[5,4,10,7,5,6,11,4,14,6,4,6,8,7,13,5,6,10,4,10,5,10,8,8,7,4,9,4,8,10,4,7,9,9,8,6,5,11,3,9,11,5,8,8,6,5,9,10,7,5,10,4,10,6,6,11,5,11,4,6,6,10,7,5,12,9,6,7,6,10,6,4,9,7,6,8,6,11,10,7,8,4,4,12,6,10,7,5,8,8,4,7,13,2,7,13,7,8,5,9,8,4,7,11,4,6,8,8,4,9,9,10,4,7,8,8,6,10,9,6,9,7,6,6,7,5,10,5,12,6,6,9,3,12,4,11,3,10,5,8,10,7,4,8,5,13,4,9,5,9,10,8,6,3,8,7,7,9,10,4,11,6,4,11,8,8,7,7,8,3,9,5,11,5,8,11,2,10,9,4,11,7,6,4,12,7,8,8,6,9,5,5,8,5,9,7,7,12,5,6,6,13,5,3,11,4,7,10,7,6,8,10,6,5,11,4,7,8,12,4,9,8,4,12,5,7,4,14,6,4,8,9,7,10,4,5,9,6,8,11,7,9,7,6,7,9,7,4,9,6,4,8,8,10,7,5,6,8,9,7,12,2,6,12,7,7,9,7,9,5,8,3,8,8,9,6,6,8,6,13,4,9,5,6,12,7,6,10,5,10,3,10,7,8,5,6,7,9,10,5,9,7,3,14,4,10,5,4,12,5,9,5,10,6,10,6,3,11,7,5,8,7,7,7,11,8,8,6,3,8,10,8,3,12,8,9,4,6,5,10,8,6,7,6,9,12,5,3,11,4,11,7,4,14,7,7,6,5,9,3,10,6,7,12,8,2,13,2,6,13,6,3,13,4,8,10,7,4,9,5,7,9,11,2,7,13,3,6,12,3,11,4,12,8,7,5,6,11,4,9,9,5,7,5,9,10,2,14,1,12,7,6,10,4,7,7,8,10,7,7,5,12,4,10,1,14,4,5,11,7,9,2,13,8,4,6,5,12,9,2,8,10,6,7,5,13,3,8,6,7,9,11,5,9,3,12,2,13,8,5,7,10,3,8,11,1,8,8,10,6,10,2,12,3,14,7,7,5,10,2,9,5,7,9,12,2,9,7,10,8,3,10,4,9,8,9,5,9,4],"priceScale":10000,"prices":[1389172,32808,-37245,-1593,-1414,70398,-34036,-15757,54013,-31747,-88299,-50959,94898,1640,-2485,72796,85523,-88187,14191,53173,-17505,23779,-40158,51289,-52632,80418,-20402,144553,-48976,40331,-94839,19594,-20809,44144,-86144,13811,-18230,37033,-26841,-63952,60604,-72832,15206,-11461,-54148,-125075,62964,-42762,40212,-40469,-8565,84519,-24730,31885,-14427,35463,-38347,42494,-14855,-34246,-52909,25569,6839,-14962,-57185,-62039,49277,-20382,-64256,49597,8488,84678,-19630,30109,-16635,20312,-47317,70155,4544,-74979,10115,-21694,225,39124,29757,-48893,-1657,65213,-20490,59898,8356,6419,-32105,57648,-19944,-13955,55385,-47313,34367,-20992,30206,-9171,4141,42073,-77126,32765,-41662,58679,17611,-19638,36894,-30385,8703,48955,1136,-23631,27257,-20315,48768,14584,-40889,-24262,43050,-28003,341,42500,-7622,-49370,17594,-25078,42108,-61617,28474,2241,-13283,-23219,16844,-31396,2003,53483,-21424,17348,4901,-36442,12860,35216,7794,77463,-4133,-101641,46397,11716,-11517,38033,-6478,17830,-49092,72322,-70164,24808,-16337,45327,-24290,55723,16350,69953,-36458,-118170,61982,23975,13516,-89424,46082,-73517,-15747,31120,-35122,26221,33975,-7053,56847,-18071,-44036,32243,-32661,-10267,-77200,6557,53275,-18422,60686,-27540,27356,-47823,26861,10021,-38540,-17806,34132,42605,-47668,-30683,-9988,10150,64674,-23091,33188,-46895,50924,-76852,21431,-52535,23370,58692,-19091,67671,-31881,53410,-17434,29827,-29095,8562,80103,-51776,68644,5523,-40578,30351,-14849,-90676,-31067,31607,15150,-16636,2493,73853,-46632,48770,7296,-4484,-17622,-116031,-27345,34709,-27374,8876,66709,-27124,26110,-23683,-12259,37743,-5193,45890,39954,-40706,9137,11747,-28960,60727,21894,-4214,25611,-19338,40198,-71081,-54113,81697,-7960,-192014,3859,-298658,73027,-134022,79258,56371,-39153,-7843,85501,-51891,18129,-31148,21243,80384,-56968,49695,-37467,75552,-25039,33894,-52197,-7790,38472,-27239,27655,-26829,-10696,32063,-48670,5489,28550,-7816,16862,-55922,106596,-8984,35472,-17282,29439,27864,-29222,38594,-1277,70093,12284,-83339,81611,14103,25318,-68975,38907,39380,-44849,-36515,42500,-49675,-18872,41787,-40322,35249,-20183,10371,52490,10122,-14681,25662,-5963,-37522,23082,-37832,23531,-8481,15691,-47116,30000,24072,-8914,-44106,44478,-14291,40790,39663,492,-39835,31786,-25898,-68447,-11010,47389,-61815,-26273,64028,14231,80841,-96484,81924,-41711,26268,-40182,-134655,817,-77443,99314,-5374,60386,-53469,-59087,60783,-11140,-94884,66352,-38557,48966,-67909,50253,-41719,18652,55837,-33136,-1532,41907,-5655,22381,29606,-40889,32580,-52813,868,-57285,37118,-57066,25997,-61434,60813,-30768,30662,-11761,49904,-25700,-33877,-11724,7084,56199,-2710,24494,-36402,-23042,34679,-52701,34958,-54315,-32541,20203,39495,-5162,13813,-76539,28422,-19634,37041,-1101,-49726,52449,46865,-56336,21772,19524,-29776,874,61482,17722,-62185,-49600,30623,-9476,25807,8543,-37324,29094,-30369,27213,-71578,3467,37592,13386,-40958,-4647,12733,18705,-31590,33577,3960,-11590,-49176,48172,-21596,57085,-17694,47951,-2650,-32125,-11487,22636,19382,-22232,-9270,65386,34721,-20472,55818,368,-60428,33197,-46569,30217,-14631,18824,17085,-62844,686,-53466,34207,19586,-24818,19400,-42449,20253,24527,193756,3201],"returnScale":1000000,"returns":[0,23617,-26811,-1147,-1018,50677,-24501,-11343,38881,-22853,-63562,-36683,68313,1180,-1789,52403,61564,-63482,10215,38277,-12601,17118,-28908,36920,-37887,57889,-14686,104057,-35256,29032,-68270,14105,-14979,31777,-62011,9942,-13123,26658,-19321,-46036,43626,-52429,10946,-8250,-38979,-90035,45325,-30783,28947,-29132,-6165,60841,-17802,22952,-10385,25528,-27604,30590,-10694,-24652,-38087,18406,4923,-10770,-41165,-44659,35472,-14672,-46255,35703,6110,60956,-14131,21674,-11975,14622,-34061,50501,3271,-53974,7281,-15616,162,28163,21421,-35196,-1192,46943,-14749,43117,6015,4621,-23111,41498,-14356,-10046,39869,-34058,24739,-15111,21744,-6602,2981,30286,-55519,23586,-29991,42241,12677,-14137,26559,-21873,6265,35240,818,-17011,19621,-14624,35106,10498,-29434,-17465,30990,-20158,245,30594,-5487,-35539,12665,-18052,30312,-44356,20497,1614,-9562,-16714,12125,-22601,1442,38500,-15422,12488,3528,-26233,9257,25351,5610,55762,-2975,-73167,33399,8434,-8290,27378,-4663,12835,-35339,52061,-50508,17858,-11760,32629,-17486,40113,11769,50356,-26244,-85065,44618,17258,9730,-64372,33172,-52921,-11336,22402,-25283,18875,24457,-5077,40922,-13009,-31699,23210,-23511,-7391,-55572,4720,38350,-13261,43685,-19825,19692,-34425,19336,7213,-27743,-12818,24571,30669,-34314,-22087,-7190,7306,46556,-16622,23890,-33757,36658,-55322,15427,-37818,16823,42250,-13743,48713,-22949,38447,-12550,21471,-20944,6163,57663,-37271,49413,3976,-29210,21848,-10689,-65273,-22364,22752,10906,-11975,1794,53164,-33569,35108,5252,-3228,-12685,-83526,-19684,24985,-19705,6389,48021,-19525,18795,-17048,-8825,27170,-3739,33034,28762,-29303,6577,8457,-20847,43714,15761,-3034,18436,-13920,28936,-51167,-38954,58810,-5730,-138222,2778,-214990,52569,-96476,57054,40579,-28185,-5646,61549,-37354,13050,-22422,15292,57864,-41008,35773,-26971,54386,-18024,24399,-37574,-5608,27694,-19608,19908,-19313,-7700,23081,-35035,3951,20552,-5627,12138,-40255,76733,-6467,25535,-12441,21192,20058,-21036,27782,-919,50457,8843,-59992,58748,10152,18225,-49652,28007,28348,-32284,-26286,30594,-35759,-13585,30081,-29026,25374,-14529,7466,37785,7286,-10568,18473,-4293,-27010,16616,-27234,16939,-6105,11295,-33917,21596,17328,-6416,-31750,32017,-10287,29363,28551,354,-28675,22881,-18642,-49272,-7926,34113,-44497,-18913,46091,10244,58194,-69455,58974,-30026,18909,-28925,-96932,588,-55748,71492,-3869,43469,-38489,-42534,43754,-8019,-68302,47763,-27755,35248,-48884,36175,-30032,13427,40194,-23853,-1103,30167,-4070,16111,21312,-29435,23453,-38017,625,-41237,26719,-41079,18714,-44223,43776,-22148,22072,-8466,35923,-18500,-24387,-8439,5099,40455,-1950,17632,-26204,-16587,24963,-37937,25165,-39099,-23424,14543,28430,-3716,9944,-55097,20460,-14134,26664,-792,-35796,37756,33736,-40554,15673,14054,-21434,629,44258,12757,-44764,-35705,22044,-6821,18577,6150,-26868,20944,-21862,19590,-51526,2496,27061,9635,-29483,-3345,9165,13465,-22740,24171,2850,-8343,-35399,34676,-15545,41092,-12737,34518,-1908,-23125,-8269,16295,13952,-16004,-6673,47068,24994,-14736,40180,265,-43499,23897,-33523,21752,-10532,13550,12299,-45239,494,-38487,24624,14099,-17866,13966,-30558,14580,17655,139476,2305]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1447075,-17357,-45196,66027,72615,-748,101672,-28045,-49620,-59982,-137851,-29008,67767,17538,-69327,-69167,-18939,80696,16008,-21688,34527,45296,22358,9887,40740,13760,-4310,41154,14595,8983,-27242,-9880,-43849,43529,25249,-8930,67021,-21032,21572,111142,-71217,-65994,38724,-11034,-71761,80593,-29005,39897,-46615,21530,-58535,120951,-8173,73870,19199,-87132,33834,-12252,-84372,52518,37342,8354,66386,-75009,-123093,-275434,80911,-29702,35644,32210,16427,-29493,-16268,109265,64333,-33,60131,27909,-50183,46109,34071,-51052,20316,704,33151,-70165,19358,71557,-155026,-8271,2179,-28433,-37158,55879,21570,-78874,-59112,97910,-62433,40326,-41637,7844,-39596,-33290,54996,79580,-90638,19043,-65690,6873,31420,-24420,65009,-341,45238,9607,6772,-16869,-15228,126787,72371],"returnScale":1000000,"returns":[41682,-12495,-32534,47529,52273,-539,73189,-20188,-35719,-43179,-99232,-20882,48783,12624,-49905,-49790,-13633,58089,11524,-15613,24855,32606,16095,7117,29327,9905,-3103,29625,10506,6467,-19610,-7113,-31564,31334,18176,-6429,48246,-15140,15528,80006,-51265,-47506,27875,-7943,-51657,58015,-20879,28720,-33556,15498,-42136,87066,-5883,53176,13820,-62722,24355,-8819,-60736,37806,26880,6014,47788,-53995,-88609,-198272,58244,-21381,25658,23187,11825,-21231,-11711,78655,46311,-24,43285,20091,-36125,33192,24526,-36750,14625,506,23864,-50508,13935,51510,-111596,-5954,1569,-20468,-26748,40225,15527,-56778,-42552,70481,-44942,29028,-29972,5646,-28503,-23964,39589,57286,-65246,13708,-47287,4948,22617,-17578,46796,-245,32565,6915,4875,-12143,-10962,91268,52097]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB Cash Deposit", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1083691,654,619,661,656,659,666,665,671,675,668,674,679,664,643,636,663,641,690,625,623,639,670,611,599,599,607,612,596,596,590,581,553,567,576,551,537,510,478,481,477,491,455,345,452,536,557,590,682,602,523,478,488,405,472,361,442,351,353,496,525,516,547,451,292,401,425,617,496,440,434,437,453,444,430,458,454,452,435,377,446,547,443,459,452,464,407,465,452,442,458,463,239,444,274,444,459,441,485,510,483,490,510,449,495,488,516,507,639,362,503,513,498,505,514,516,519,476,553,511,503,892,566,293,335,534,465,477,610,792,481,337,180,532,709,710,480,132,615,649,470,496,463,472,179,354,397,511,297,436,444,762,624,446,415,101,210,491,414,455,434,432,456,448,579,852,354,39,420,427,492,464,534,417,588,709,459,458,340,143,434,389,433,540,361,436,443,432,468,417,473,417,430,418,417,425,441,410,425,417,419,393,415,406,406,435,386,405,403,430,397,402,406,401,400,379,400,406,405,443,459,432,446,442,448,528,684,475,345,259,467,460,450,459,585,331,448,453,432,481,448,461,450,455,462,429,434,537,321,392,416,409,371,412,396,370,381,370,336,303,304,325,317,308,303,377,268,271,288,380,231,271,222,321,342,295,257,532,407,282,208,180,805,426,388,369,368,386,391,376,389,354,293,467,368,366,351,334,324,252,246,229,208,207,244,241,192,218,226,208,231,237,260,272,236,252,267,276,273,279,294,302,258,308,290,336,-242,-101,755,429,585,315,300,636,301,314,329,311,275,-496,636,290,271,377,305,-27,98,727,796,346,280,320,322,-146,-30,113,264,365,302,267,256,283,606,566,526,165,354,288,264,157,373,263,288,310,338,291,312,-128,525,530,274,280,295,489,284,248,289,329,306,309,318,305,284,-227,3,282,1155,428,330,311,307,293,320,279,311,-283,-451,-100,302,334,333,340,362,337,366,320,420,352,353,346,529,1335,440,380,408,379,421,489,345,-277,288,547,1559,599,533,541,532,547,545,547,444,641,581,568,564,261,210,294,704,398,628,650,632,646,628,1543,-2,253,637,637,575,465,611,606,605,634,944,603,527,568,660,648,639,663,630,613,636,657,625,632,653,644,613,647,949,919,616,564,605,587,547,542,321,91,524,578,524,542,539,554,549,594,562,586,761,579,531,459,563,538,462,564,575,559,585,570,564,531,607,560,564,557,562],"returnScale":1000000,"returns":[353,603,572,610,605,609,615,613,620,623,617,622,626,613,594,587,612,592,637,577,575,590,618,564,553,553,560,565,550,551,544,536,511,523,532,509,495,471,441,444,441,453,420,318,418,494,515,544,630,556,482,442,450,374,436,333,408,324,326,458,484,476,505,417,269,370,393,569,458,406,401,403,419,409,397,423,419,417,402,348,412,505,409,423,417,429,375,430,417,408,423,427,221,410,253,409,424,407,448,471,446,452,471,414,457,451,476,468,590,334,464,474,459,467,474,476,479,440,510,472,464,824,522,271,309,493,429,440,564,731,444,311,166,491,654,656,443,122,567,600,433,458,428,435,166,326,367,472,274,402,410,703,576,412,383,93,194,454,382,420,400,399,421,414,534,787,326,36,388,394,454,429,493,385,542,655,424,422,314,132,401,359,400,498,333,403,409,398,432,385,437,385,397,386,385,392,407,379,392,385,387,362,383,375,375,402,356,374,372,397,366,371,375,370,369,350,369,375,374,409,424,399,411,408,414,487,632,438,319,239,431,424,416,423,540,306,414,418,398,444,414,426,415,420,426,396,401,496,296,362,384,378,342,380,366,341,352,342,310,279,281,300,293,284,280,348,247,250,266,351,213,250,205,297,315,273,237,491,376,260,192,166,743,393,359,340,340,356,361,347,359,327,271,431,339,338,324,309,299,232,227,212,192,191,225,222,178,201,209,192,213,219,240,251,218,232,247,254,252,258,271,279,238,285,267,310,-223,-93,697,396,540,291,276,588,277,290,304,287,254,-458,587,268,250,348,282,-25,90,671,735,319,259,295,297,-134,-28,104,244,337,279,246,236,262,559,523,485,152,327,266,244,145,344,243,266,286,312,268,288,-118,485,489,253,259,272,451,262,229,267,304,282,286,293,282,262,-210,3,260,1067,395,304,287,284,270,296,257,287,-261,-416,-93,279,308,308,314,334,311,338,295,388,325,326,319,488,1233,406,351,376,350,389,451,319,-256,266,505,1439,553,492,499,491,505,503,505,410,592,536,524,521,241,194,271,650,367,580,600,584,596,580,1424,-2,234,588,588,530,430,564,559,559,585,871,557,486,525,609,598,590,612,581,566,587,607,577,583,603,594,566,598,876,848,569,520,559,541,505,501,296,84,484,533,484,500,498,511,507,548,519,541,703,534,490,424,520,496,427,520,531,516,540,526,521,490,560,517,521,514,519]},"lttb":{"start":16344,"dateDeltas":[1,13,1,8,13,7,3,8,11,4,10,6,6,5,12,5,10,2,8,13,6,9,2,6,11,9,7,6,9,7,3,10,11,2,7,9,6,13,4,10,8,3,5,12,9,6,3,11,6,10,8,6,6,7,6,9,6,6,12,3,12,7,2,10,9,7,5,7,7,8,12,5,3,12,6,7,10,4,11,4,9,8,5,5,10,7,9,8,3,10,4,8,13,8,1,13,7,5,9,3,11,3,12,7,5,8,10,4,7,12,2,13,4,4,14,5,6,5,9,11,6,9,8,3,10,9,7,7,4,5,9,6,10,6,6,7,14,5,6,11,6,2,8,12,4,5,13,5,5,8,6,8,9,7,7,12,7,6,9,3,10,8,4,11,7,7,9,1,14,5,9,1,9,12,5,7,10,1,13,8,6,4,10,10,4,7,9,5,5,9,10,8,8,3,11,7,6,4,13,2,14,6,6,5,11,5,4,10,7,7,10,4,8,10,7,8,6,5,11,6,7,5,11,8,4,9,10,8,7,7,4,6,11,7,9,6,4,6,11,4,12,2,14,5,10,2,7,7,8,12,7,4,8,6,6,11,9,3,6,12,8,4,11,8,4,11,7,8,5,4,6,10,9,6,9,3,12,3,13,5,10,4,11,5,8,6,4,11,4,9,11,4,6,7,10,4,9,5,11,11,1,12,5,9,7,10,6,2,8,9,11,1,10,5,11,5,12,3,12,7,3,12,7,4,6,7,10,9,8,7,7,8,2,7,8,13,4,4,10,8,7,6,8,9,9,5,5,7,10,7,10,8,3,6,8,9,8,6,12,6,5,7,6,12,7,2,10,7,6,8,6,12,9,7,5,3,14,7,3,7,7,8,11,7,2,14,7,1,9,9,9,3,9,5,9,12,6,7,5,12,5,7,4,12,8,6,7,9,8,3,5,12,4,6,8,10,5,8,11,9,6,5,10,8,4,5,9,7,7,6,7,10,11,5,8,6,5,11,8,4,7,9,11,7,3,6,8,10,9,5,8,8,3,7,9,8,6,10,7,6,12,4,7,5,12,8,4,7,11,6,5,8,5,9,5,9,10,5,7,12,7,6,6,8,6,5,10,11,6,3,8,11,2,10,5,9,9,10,2],"priceScale":10000,"prices":[1083309,112,1208,48,762,1218,668,281,760,1061,379,964,569,599,475,1076,487,909,235,726,1157,589,814,180,498,943,795,591,515,766,586,243,793,903,135,583,669,418,862,301,696,537,56,299,902,704,538,368,916,425,696,469,431,269,523,231,431,465,402,893,279,804,179,192,597,798,460,295,434,437,529,740,339,177,790,380,366,628,361,685,287,568,542,264,348,634,442,606,506,-10,654,65,501,845,540,103,890,490,391,568,230,753,240,847,671,203,566,751,260,505,905,125,936,343,269,1014,735,532,348,288,807,375,634,921,262,714,201,415,814,216,592,620,51,987,460,368,495,942,36,290,623,496,-17,469,780,559,484,848,282,-25,264,434,471,593,413,468,751,579,796,482,-198,585,484,320,713,566,388,949,95,915,321,207,14,567,693,465,324,603,79,796,541,344,304,586,646,202,417,595,271,323,512,614,445,457,196,630,441,312,251,739,155,774,374,332,300,627,253,246,560,405,443,672,219,501,689,419,799,441,315,400,414,459,299,727,683,117,564,624,563,454,419,296,369,740,417,567,502,251,223,656,231,639,155,774,249,571,79,357,289,344,579,288,191,336,345,213,424,476,143,160,419,362,223,462,291,416,620,230,166,201,642,386,549,460,319,517,154,667,160,585,366,518,225,555,222,383,193,155,359,130,246,409,100,168,218,339,95,298,170,434,366,47,440,214,335,279,433,257,44,352,366,537,-533,36,669,865,247,516,471,506,314,166,525,274,-651,614,327,361,498,275,-151,305,1146,166,348,315,603,164,-271,-70,248,422,255,336,306,367,528,251,748,292,354,411,292,6,337,299,369,386,273,511,-177,253,734,224,484,297,288,410,241,238,379,254,548,395,283,203,-387,277,1163,242,333,306,379,452,320,64,621,-691,-231,-100,395,441,125,441,271,428,594,369,364,225,605,251,1510,278,645,476,311,421,677,261,-451,136,957,1302,534,591,783,366,635,859,589,567,438,785,651,19,487,4,761,351,503,674,891,1003,479,1881,-695,400,1022,687,171,626,783,930,658,569,611,524,831,862,446,725,792,147,713,804,760,522,898,680,547,1064,419,1175,503,951,711,334,554,851,233,-59,593,473,629,419,662,790,384,614,985,761,513,465,518,454,438,651,912,494,195,700,897,134,781,465,702,741,815,127],"returnScale":1000000,"returns":[0,103,1115,45,703,1125,616,260,701,980,349,890,525,553,439,993,450,839,217,670,1068,544,751,166,460,870,734,546,475,707,541,224,733,833,125,538,617,386,796,278,642,496,52,276,832,650,497,340,845,392,643,433,398,248,483,213,398,429,371,824,258,742,165,178,551,736,425,272,401,403,489,683,313,163,729,351,338,580,333,632,265,524,501,243,322,585,408,559,467,-9,604,60,462,780,499,95,822,452,361,524,212,696,221,782,619,188,522,693,240,467,835,115,864,317,248,936,679,491,321,266,745,346,585,851,241,659,186,383,752,199,546,573,47,911,425,339,457,870,33,268,575,458,-16,433,720,516,447,782,261,-23,243,401,435,547,381,432,694,534,735,445,-183,540,447,295,658,523,358,876,88,844,297,191,13,523,640,429,299,557,73,734,500,317,281,541,596,187,385,549,250,298,473,567,410,422,181,582,407,288,232,682,143,714,346,306,277,579,233,227,517,374,409,620,203,462,636,387,737,407,291,369,383,423,276,671,631,108,521,576,519,419,387,273,341,683,385,523,464,231,206,606,213,590,143,715,229,527,73,330,267,317,535,266,176,310,319,196,392,439,132,148,386,335,205,427,269,384,572,212,153,186,593,356,507,424,295,477,142,616,148,540,337,479,207,513,205,353,178,143,332,120,227,377,93,155,201,313,88,275,157,400,338,43,407,197,309,258,400,237,41,324,338,496,-492,33,618,798,228,477,434,467,290,154,484,253,-601,567,302,333,460,254,-140,282,1058,153,321,291,556,152,-250,-65,229,390,235,310,283,338,488,231,691,269,327,380,269,6,311,276,340,357,252,471,-163,234,677,207,447,274,266,378,223,219,350,235,506,364,261,188,-357,255,1074,223,308,282,350,417,296,59,573,-638,-213,-93,365,407,116,407,250,395,548,341,336,208,558,232,1394,256,596,439,287,389,625,241,-417,126,883,1202,493,546,722,338,586,793,544,523,405,724,601,18,449,4,703,324,464,622,823,925,443,1736,-642,370,943,634,158,578,723,858,608,525,564,483,768,795,412,669,731,136,658,742,702,482,829,627,505,983,386,1085,464,878,656,309,511,786,215,-55,548,436,581,387,611,729,355,566,910,702,474,429,478,419,404,601,842,456,180,646,828,124,721,429,648,684,753,117]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1086095,2847,2996,2855,2579,2742,2580,2525,2215,2073,2252,2406,1906,1842,1979,2150,1841,1985,1928,1979,1951,1589,2112,2086,2370,1996,2255,2708,1690,2555,1876,2309,2065,1645,2275,1318,1962,2312,1578,2163,2161,1481,1908,1992,1775,1878,1797,1743,1815,1702,1919,2209,1626,2137,1821,2019,1981,1699,1720,1418,1433,1309,1180,1644,1511,1714,1637,1647,1337,992,988,1017,1146,1230,1342,1225,1552,1119,1102,1267,1812,336,1322,2016,1100,1333,1043,1614,1324,1376,429,2369,1294,-410,1517,1566,2759,1684,1001,3474,2170,2458,1484,2667,3527,1718,2667,2828,2910,2676,2812,3388,2370,1732,2323,2718,2302,2368,2507,2457,466],"returnScale":1000000,"returns":[2572,2628,2765,2636,2381,2531,2381,2331,2045,1913,2079,2221,1760,1700,1827,1984,1700,1832,1780,1827,1801,1466,1950,1926,2187,1843,2081,2500,1560,2359,1731,2132,1906,1519,2100,1216,1811,2135,1456,1997,1995,1367,1761,1839,1638,1734,1659,1609,1675,1571,1772,2039,1501,1972,1681,1864,1829,1568,1588,1309,1323,1208,1089,1518,1395,1582,1511,1520,1234,916,912,939,1058,1135,1239,1131,1432,1033,1018,1169,1673,310,1220,1861,1016,1230,963,1490,1222,1270,396,2187,1195,-379,1400,1446,2547,1554,924,3207,2003,2269,1370,2462,3256,1586,2462,2610,2686,2471,2595,3128,2187,1599,2145,2509,2125,2186,2314,2268,430]}});
\ No newline at end of file
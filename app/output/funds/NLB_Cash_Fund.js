@@ -0,0 +1 @@
+registerFundSeries("NLB Cash Fund", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[10669632,9155,7495,7438,7369,7245,7661,7236,7219,7276,7430,7695,7218,6815,8265,7101,7501,6988,7917,6815,6462,6595,8174,6064,6131,6101,5899,5953,5543,5389,5719,5868,5643,5908,5656,5609,5864,5688,5750,5804,5389,4319,4142,2247,4012,10518,5411,5424,4907,5103,4735,4720,4704,4022,4077,4348,4548,3820,4366,4006,4732,4135,3965,4223,4397,4191,4151,4447,3994,4114,3970,3775,4251,4244,4147,4816,4595,4314,4341,3974,3898,4388,2866,5459,4052,4333,5266,4537,3920,4353,4154,4706,4457,4445,2661,4097,4385,4238,4649,4158,4747,3656,4781,4141,4139,4072,4088,4279,5417,4176,4539,4733,4549,5200,3420,5429,5678,4406,5154,5077,4108,19045,5381,3611,3652,4766,3914,3924,3768,3739,3539,4162,3513,3606,3633,4765,3631,3733,4013,4825,3774,4069,3746,3752,4419,3683,3790,3638,3998,3768,3524,3784,4560,3227,3260,3249,3139,3736,3605,3317,3609,3781,3223,3325,5014,10507,2499,-1042,3524,4127,4596,1875,13526,1545,5800,16682,1520,8788,524,962,1126,3009,6978,564,1440,1631,8364,-72,3975,5726,1136,4308,3243,3460,3237,3211,3639,3021,3663,3703,4697,3429,3867,3509,3523,4186,3335,3255,3243,4187,3322,3460,4197,4391,3609,3380,3778,3794,3764,4072,4204,4274,4175,4361,4111,5760,8194,4699,2469,800,7376,4128,4122,4091,7450,2914,4193,4058,5471,5471,3998,3924,3569,4421,4697,3874,3987,6686,2696,2925,3019,5102,2997,3631,3120,2965,3056,3433,2962,2900,3879,3035,2532,2561,2947,3903,2243,2827,3286,3949,3213,3211,2623,3489,4435,3464,3237,6697,4886,2957,1458,1580,8993,4795,3689,3453,3276,4122,3527,3408,3453,3648,3267,4377,3510,3535,4395,3556,3479,2980,3165,2551,2602,2634,2807,2760,2348,2421,3315,2644,3357,2742,2628,2724,2648,2732,2481,2297,2577,2459,2349,2471,2466,2505,2700,2913,-13120,-1702,-1348,4962,6980,3155,3163,3177,2958,3049,2997,3246,3483,-5681,8024,3507,3027,4440,3636,-1213,-819,10249,11863,5469,3966,4266,4093,-3412,-1174,1208,3635,5110,4469,4146,4102,4381,10798,9329,7904,489,5344,3965,3947,2651,4910,3641,3789,3499,3786,3568,3886,-2319,6953,7363,3922,3885,3995,5731,4212,3634,3921,3958,4015,3999,3973,3989,3981,-3193,236,3813,1180],"returnScale":1000000,"returns":[521,858,703,697,691,680,718,679,677,682,697,721,677,639,775,666,703,656,742,639,606,619,766,569,575,572,553,558,520,505,537,550,529,554,530,526,550,534,539,544,505,405,389,210,377,986,507,509,460,479,444,442,441,378,382,408,426,358,410,375,444,388,372,396,412,393,389,417,375,386,372,354,398,398,389,452,431,404,407,373,366,411,269,512,380,406,494,425,368,408,390,441,418,417,249,384,412,397,436,390,445,343,448,388,389,381,384,401,508,392,425,444,427,487,321,509,532,414,483,476,385,1786,505,338,343,447,367,368,353,351,331,391,329,338,341,447,340,350,377,452,354,382,351,352,414,345,356,341,375,353,331,355,427,303,305,305,294,351,338,311,338,355,302,312,470,985,235,-98,330,387,431,176,1269,144,544,1565,142,824,49,91,105,282,655,53,135,153,784,-7,373,537,106,404,304,325,303,302,341,283,344,347,440,322,362,329,331,392,313,305,304,393,312,324,394,411,339,317,354,356,353,382,394,401,391,409,385,541,768,441,231,75,692,387,386,384,699,273,393,381,513,513,375,368,334,415,440,364,373,627,253,275,283,478,281,341,292,278,287,322,277,272,364,285,237,240,277,366,210,265,308,371,301,301,246,327,416,325,303,628,458,278,136,149,843,450,345,324,307,387,331,319,324,342,307,410,329,332,412,333,326,280,297,239,244,247,263,259,220,227,311,248,315,257,246,256,248,256,233,215,242,231,220,231,232,235,253,273,-1230,-160,-126,465,655,295,297,298,277,286,281,305,326,-533,753,329,284,416,341,-114,-77,961,1113,513,372,400,383,-319,-111,114,341,479,419,389,384,411,1013,874,742,45,502,371,371,248,461,341,355,328,355,335,364,-217,652,690,368,364,375,538,394,341,368,371,377,375,372,374,374,-300,22,358,110]},"lttb":{"start":16344,"dateDeltas":[1,5,6,9,6,3,5,7,3,10,2,9,3,7,5,7,6,6,5,6,1,10,2,8,2,10,6,2,6,4,7,4,6,9,6,3,8,5,2,5,6,7,4,8,7,2,8,7,6,2,9,3,8,6,4,7,4,7,2,8,2,10,1,6,6,9,3,4,9,2,10,5,6,2,5,6,5,8,3,10,2,8,3,10,1,9,2,10,4,5,6,5,3,10,2,9,1,6,8,4,9,4,6,2,7,5,8,7,2,6,7,3,5,11,2,8,2,9,2,9,5,3,6,7,6,6,5,7,4,5,7,3,9,1,7,4,10,2,6,6,4,10,5,6,4,7,2,10,3,5,4,10,4,4,4,6,10,2,7,3,9,2,10,6,3,3,10,4,7,4,3,10,5,2,10,2,9,2,8,7,4,2,9,7,2,9,4,6,2,8,8,5,4,6,7,3,8,6,4,2,11,4,6,6,6,5,4,6,3,9,3,8,6,4,7,6,3,4,10,2,6,6,5,4,5,8,4,5,9,7,1,7,8,5,6,2,9,6,2,5,6,5,10,4,5,7,2,5,9,3,8,7,4,6,2,7,9,4,7,3,4,6,7,3,7,6,8,4,5,7,6,6,4,3,6,5,9,7,1,8,4,4,10,3,8,4,7,6,5,5,3,10,1,10,4,4,4,6,5,9,7,5,2,7,4,6,8,7,3,4,8,6,4,7,4,6,3,6,9,5,5,6,7,4,4,4,7,6,6,8,5,5,7,2,4,8,7,5,6,5,4,9,5,4,5,3,11,4,4,4,10,2,7,8,4,4,4,8,4,7,7,3,8,6,2,8,7,2,6,4,10,6,1,6,9,3,4,9,3,9,5,2,5,9,2,10,2,9,3,8,5,6,3,6,8,6,3,5,7,6,5,3,7,6,5,9,1,6,7,8,4,5,8,1,10,2,5,6,5,10,5,1,8,6,7,6,6,3,3,7,9,3,7,7,2,7,6,7,3,6,3,6,5,10,5,4,7,5,3,7,4,10,2,8,6,2,5,5,7,9,3,4,7,6,8,3,7,2,10,6,1,9,5,7,4,7,6,2,9,5,6,5,6,5,3,5,7,3,8,4,9,3,7,7,4,3,6,5,6],"priceScale":10000,"prices":[10664081,2536,7499,5791,9667,6212,3253,5100,7889,2940,10315,2138,9275,3022,7486,5647,7218,5807,7254,5098,6010,1425,10087,3309,7930,1736,9208,5649,2982,6138,3435,6159,3423,5279,7787,4877,2422,6162,3884,1724,4029,5110,5683,3437,6463,5609,1796,6507,5685,4858,1961,7116,2012,4567,4301,-191,3930,8514,4825,1933,5484,1941,6793,1186,4003,4189,6112,1625,2426,5263,1426,6289,2625,3519,1473,2650,4122,3127,4724,1578,6020,1428,4745,1822,5927,886,5377,990,5907,2373,2401,3344,3387,1675,6009,1836,5365,1019,3573,5099,2336,5078,1849,4171,-8,4007,4326,5025,3913,1150,5430,4099,1326,2849,6823,1645,4804,1560,5599,-263,5257,2931,2040,3262,4945,3514,4010,3239,3656,3115,2806,4211,1672,5329,-162,3393,3891,4162,4480,3567,3795,2838,6446,3943,2794,3541,4408,2458,6360,2665,3106,3271,4384,18878,2207,3665,3263,4807,2048,3579,2286,5035,1070,5339,3087,1430,2196,5037,2087,3543,2142,2624,5239,-7863,11596,5689,2066,4857,1385,4280,3765,2137,1788,4759,3606,1221,4625,2490,3031,1259,4041,4293,3613,1768,2940,3107,1475,3551,3261,-2789,5722,5409,2187,3306,2547,3303,2122,2818,4963,7227,3732,-3253,3919,3745,2012,4559,1378,10180,3346,7071,-3002,19085,5101,-2233,7315,2536,-5021,-653,6323,4051,7306,-4892,6046,-262,2657,7505,-3068,4899,3277,3701,-172,2804,3632,5305,1398,2399,3117,932,3041,3619,1885,3902,4817,2069,2819,1466,3401,4529,2657,3612,1165,2158,2687,3243,2333,3445,2375,5007,2006,3465,3602,2840,3370,1881,1809,2965,2784,5563,3834,789,4930,2137,2781,5808,2042,9660,3221,4488,1796,-507,3467,4486,5791,875,5675,2480,6360,435,3226,3305,4808,7318,3004,1096,3369,2683,2964,5611,4082,1445,2548,4535,6836,100,3655,1352,2641,3399,2344,4709,1965,2476,2422,3056,2482,1313,1904,2590,2735,3534,3630,1150,1964,2947,758,2744,2644,2827,2210,2818,3765,1217,4178,1641,1908,2592,2420,5473,1666,2011,5251,7044,983,1815,613,1942,7360,3508,3923,2265,3137,3439,2299,3897,2897,969,3960,3648,1710,2028,2938,4941,3072,1408,2987,4944,-7931,10924,4201,1042,3288,1865,865,1769,3899,777,3239,755,3018,1963,3018,2660,1885,1637,2171,3125,2247,1283,1815,2492,1920,1949,984,2413,2039,1904,3033,478,2027,2700,3318,-14235,-2341,4406,-5923,6997,4492,2499,2627,2348,4538,2035,377,3567,2479,3246,3022,-6520,1802,5980,4028,3551,2181,4070,3187,-2261,-2223,4011,14795,4335,4761,1982,3250,3142,5868,-4620,957,-2643,2921,553,6002,2201,6492,892,4678,3803,1239,9559,4607,11318,1824,1716,3610,3929,3472,3251,2751,3990,782,5297,3008,491,4899,2455,3886,-3276,3469,9160,1531,5035,2681,3456,4643,3355,3136,1479,2707,3921,1765,4506,2332,5169,1550,4044,3981,2270,-5466,-337,3046,3091],"returnScale":1000000,"returns":[0,238,703,543,907,582,305,478,740,276,967,201,869,284,702,529,677,545,680,478,563,134,946,310,744,163,863,530,279,576,322,578,321,495,730,457,227,578,364,162,378,479,533,322,606,526,169,610,533,456,183,668,188,429,403,-18,369,798,452,182,514,182,637,111,376,392,573,153,227,494,134,589,246,330,139,248,387,293,443,148,564,134,445,171,556,83,504,93,554,222,226,313,318,157,563,172,504,95,335,478,219,477,173,391,-1,376,406,471,367,108,509,384,125,267,640,154,450,147,525,-25,493,275,191,306,464,329,376,304,343,292,263,395,157,499,-15,318,365,390,421,334,356,266,605,369,262,332,414,230,597,249,292,306,412,1770,207,343,306,451,192,336,214,472,101,500,290,134,206,472,196,332,201,246,491,-737,1087,534,194,455,130,401,353,201,167,447,338,114,434,233,285,118,379,402,339,166,276,291,138,333,306,-262,537,507,205,310,239,310,199,264,466,677,350,-305,368,351,188,428,129,955,314,663,-282,1790,478,-209,686,237,-470,-62,593,380,685,-458,567,-25,249,704,-288,460,307,347,-16,263,340,498,131,225,292,88,285,339,177,366,451,194,265,137,319,425,249,339,109,202,252,304,219,323,223,469,189,324,338,267,316,176,170,278,261,521,360,74,462,201,260,545,191,906,302,421,169,-48,325,421,543,82,532,233,596,41,302,310,451,686,282,103,316,251,278,526,383,136,239,425,641,9,343,127,247,319,220,442,184,232,227,287,232,124,178,243,256,332,340,108,184,277,71,257,248,265,207,265,353,114,392,153,179,243,227,514,156,188,493,660,92,171,57,182,690,329,368,213,294,322,216,365,272,91,371,342,161,190,275,464,288,132,280,463,-743,1024,394,98,308,175,81,166,366,72,304,71,283,184,283,249,177,154,203,293,211,120,171,233,180,183,92,227,191,178,285,45,190,253,311,-1335,-219,413,-556,656,422,234,246,221,425,191,35,335,232,305,283,-611,169,560,378,333,205,381,299,-212,-208,376,1387,407,446,186,305,294,551,-434,90,-248,274,52,563,206,609,84,438,357,116,896,432,1062,171,161,338,369,325,305,258,374,74,496,282,46,460,230,364,-307,326,858,144,472,252,324,435,315,294,138,254,368,165,423,219,484,146,379,373,213,-512,-32,286,289]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31],"priceScale":10000,"prices":[10699039,31411,33069,32231,27832,29117,24332,25545,24455,19708,26685,20592,19311,18106,18544,18481,16825,19758,16417,21556,17884,17579,19556,18081,16613,22409,21607,35125,17379,16800,15902,17818,17436,17053,16882,14686,15631,20549,13517,27068,28802,10606,9042,16217,14986,15638,16794,15071,17108,16063,18004,22698,14018,24277,18640,18261,20362,14883,14223,13838,12987,13567,14327,20231,15584,16764,15712,16155,15297,12190,11883,12161,11429,10656,984,4878,12453,11532,13527,13780,26481,1986,19767,31016,16405,16964,12016,22435,17593,17564,5910,1845],"returnScale":1000000,"returns":[3278,2946,3101,3022,2610,2730,2282,2395,2294,1848,2502,1931,1811,1698,1739,1733,1577,1853,1539,2022,1677,1648,1834,1696,1557,2102,2026,3294,1629,1576,1491,1671,1635,1599,1583,1377,1466,1927,1267,2539,2700,995,848,1521,1405,1466,1575,1413,1605,1506,1688,2129,1314,2277,1748,1712,1909,1396,1334,1297,1218,1272,1344,1897,1461,1572,1474,1515,1434,1143,1114,1141,1072,999,92,458,1167,1082,1268,1292,2483,187,1853,2909,1538,1591,1127,2103,1650,1647,554,173]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB Global Emerging Markets", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[497837,-13009,-9593,19710,12861,5731,1661,5736,-2215,3104,-20746,13563,6659,-1259,8177,6478,22735,-12888,2864,11925,3003,3565,5246,9755,2871,-16346,-6132,23850,-5988,10621,-18205,-481,-4130,10728,6644,-21606,-1391,-2818,4127,-3087,-3970,32988,-18824,268,-7601,-8524,-35237,3918,-9250,3823,-5493,6396,2172,8727,5690,14659,10710,10290,-12661,20272,5596,-14999,-21073,6139,6713,-2141,-25767,-9865,9990,4826,-24602,-4342,13209,5091,12486,369,-3597,1854,-2760,-153,10271,1245,-13797,-4407,2678,7332,9283,-3146,-546,-3065,-1153,13408,9153,7011,6668,-4993,3936,1669,-6421,2075,9115,-14002,1824,3151,1621,-380,2995,4968,-2150,-13587,22592,23346,4933,-10634,22099,2736,6540,-13568,8782,-5489,-1532,3863,-1221,12051,6097,2157,9077,-7358,-968,-9764,6265,-8,-6376,-997,-2583,6331,8464,-8189,5920,12529,-2764,-7517,1356,-11221,-2261,16988,-1148,-2854,931,3126,-3349,4002,1995,-7889,6102,-906,5024,4614,-527,1026,6792,3383,-4632,-10502,-5572,8172,70,4680,860,5408,12584,4795,4486,2592,-14899,-23788,10358,5984,-12560,20791,-4332,-31888,5816,-1783,121,4729,3960,12488,7542,-2813,-414,2236,12304,-5620,429,-15535,4591,9141,6581,11943,5730,-2437,3539,-5433,7557,-5500,2473,1775,13453,-20919,-17283,12578,5404,2542,8789,-9694,-46178,16363,-19330,-142,-31127,7443,8772,5632,12027,-273,3188,2311,9827,5853,-1032,51,7996,-3154,3103,8073,1309,510,6151,-162,-7720,9256,5441,-9303,7295,-6466,2103,-1918,6799,-2692,-2839,8062,-1395,-3615,-3913,256,6917,10536,-3789,2066,11981,2612,7784,-22036,4242,2596,12581,-3442,923,9666,-3936,-573,13119,7478,1609,10502,15100,5010,-7698,10158,5496,-5030,-55502,6873,-44821,-51178,-17169,33699,28975,13177,9336,12233,-88,-3697,-1672,-6459,1196,-15699,8572,-9901,8395,1800,1539,-5730,-3099,7197,-515,2027,3020,-2462,-190,3588,4117,1995,542,-1934,-7878,-8205,7116,7678,-4563,1546,-2290,-1218,-2746,2848,6442,-665,565,8567,-6594,12233,-2859,964,-12594,9347,2391,2135,-1544,6066,4250,950,-3506,-5683,3389,-14669,-332,7169,7472,-1481,1724,14388,9903,-7935,3793,887,-14482,5941,3509,-16677,11974,7149,-7916,-5719,-2088,-5136,18342,12837,1635,-4788,9469,14038,-1593,-22335,-16721,20914,-22068,7715,7035,12172,14572,-23254,3354,-979,-1650,-7041,-9968,-8447,-21926,39544,4705,2084,107,-16538,-26274,25605,-2032],"returnScale":1000000,"returns":[746,-26151,-19283,39620,25853,11521,3339,11530,-4452,6239,-41703,27264,13386,-2531,16437,13022,45702,-25907,5757,23971,6037,7166,10546,19609,5771,-32858,-12327,47943,-12037,21350,-36595,-967,-8302,21565,13356,-43432,-2796,-5665,8296,-6205,-7981,66312,-37840,539,-15279,-17135,-70833,7876,-18594,7685,-11042,12857,4366,17543,11438,29467,21529,20685,-25451,40751,11249,-30151,-42361,12341,13494,-4304,-51796,-19831,20082,9701,-49455,-8728,26553,10234,25099,742,-7231,3727,-5548,-308,20647,2503,-27735,-8859,5383,14739,18661,-6324,-1098,-6161,-2318,26953,18399,14093,13404,-10037,7912,3355,-12907,4171,18323,-28147,3667,6334,3259,-764,6020,9987,-4322,-27312,45414,46930,9916,-21377,44424,5499,13147,-27274,17653,-11034,-3079,7765,-2454,24224,12257,4336,18246,-14791,-1946,-19627,12594,-16,-12817,-2005,-5192,12727,17014,-16462,11901,25185,-5556,-15110,2725,-22556,-4545,34149,-2308,-5737,1872,6284,-6732,8044,4011,-15859,12266,-1821,10099,9275,-1059,2062,13654,6800,-9311,-21111,-11201,16427,141,9408,1729,10871,25296,9639,9017,5211,-29950,-47818,20821,12029,-25248,41794,-8708,-64101,11691,-3584,243,9507,7960,25103,15161,-5655,-832,4495,24733,-11297,862,-31228,9229,18375,13229,24008,11518,-4899,7114,-10921,15191,-11056,4971,3568,27043,-42051,-34742,25284,10863,5110,17668,-19487,-92827,32893,-38857,-285,-62571,14962,17633,11321,24177,-549,6408,4646,19754,11766,-2075,103,16073,-6340,6238,16228,2631,1025,12365,-325,-15519,18606,10938,-18701,14664,-12998,4228,-3856,13667,-5411,-5707,16206,-2804,-7267,-7866,515,13904,21180,-7617,4153,24084,5251,15647,-44296,8527,5218,25290,-6919,1856,19430,-7912,-1152,26372,15032,3235,21111,30353,10071,-15474,20419,11048,-10111,-111569,13816,-90099,-102877,-34513,67741,58245,26489,18767,24590,-177,-7431,-3361,-12984,2404,-31558,17232,-19903,16875,3619,3093,-11518,-6230,14468,-1036,4075,6071,-4949,-382,7212,8276,4011,1089,-3888,-15836,-16493,14304,15434,-9172,3108,-4604,-2448,-5520,5725,12949,-1336,1135,17222,-13255,24590,-5747,1938,-25316,18789,4806,4292,-3104,12194,8543,1910,-7048,-11424,6813,-29488,-667,14411,15020,-2977,3466,28922,19907,-15951,7625,1783,-29112,11943,7054,-33524,24070,14371,-15913,-11496,-4198,-10324,36871,25805,3286,-9624,19034,28219,-3202,-44898,-33612,42041,-44361,15509,14142,24468,29292,-46745,6742,-1968,-3317,-14153,-20038,-16980,-44075,79491,9458,4189,215,-33245,-52815,51471,-4085]},"lttb":{"start":16344,"dateDeltas":[5,4,6,3,5,5,8,4,10,2,9,4,7,4,3,8,4,8,7,2,7,4,8,4,4,6,5,10,6,1,7,6,4,6,5,5,6,7,4,5,8,6,5,6,4,5,9,5,5,4,9,5,3,4,7,6,4,9,6,3,4,7,9,2,9,1,6,9,3,4,7,4,6,8,3,8,5,4,6,5,5,8,8,3,5,6,4,8,4,6,6,6,6,3,8,7,6,5,4,8,4,5,7,3,5,6,5,8,3,5,7,4,9,4,7,4,3,6,8,6,5,3,10,2,7,8,6,2,5,8,4,5,9,2,6,6,8,5,3,5,5,6,9,6,5,6,6,4,4,9,4,7,4,5,7,6,1,10,5,4,7,2,5,7,4,10,3,7,3,6,7,8,2,5,7,7,2,8,4,7,3,10,5,7,1,5,10,2,8,3,6,7,7,5,6,5,3,7,5,9,5,3,7,6,2,5,10,5,7,5,6,2,8,4,3,8,4,6,9,5,3,7,6,5,6,6,7,5,2,9,3,6,7,7,3,3,9,5,6,2,8,7,5,6,4,5,8,3,9,3,6,6,3,6,6,7,4,9,2,6,4,9,4,5,6,4,7,4,6,6,9,6,3,8,4,6,3,8,4,6,3,8,4,6,5,7,6,4,5,8,8,3,7,4,5,5,8,3,6,8,6,4,7,3,8,5,5,4,6,7,6,6,1,9,7,3,4,10,3,7,6,2,5,8,7,4,6,3,7,8,3,5,5,5,6,6,5,7,7,5,3,9,5,7,5,6,6,3,7,4,6,4,6,8,3,5,6,7,3,8,6,7,1,8,7,3,6,5,6,4,10,2,9,6,4,3,9,5,4,4,10,4,4,5,5,5,8,3,10,6,1,7,8,6,6,3,3,7,9,1,7,4,7,7,4,5,7,5,9,5,6,3,3,8,4,10,5,6,5,1,9,6,5,3,10,3,7,3,8,2,6,9,5,5,3,8,3,10,3,4,7,4,5,8,5,6,5,5,7,6,6,7,5,5,3,6,4,9,3,6,5,5,10,3,8,2,9,2,9,4,6,4,6,6,3,10,6,2,5,5,7,8,6,2,5,10,1,10,2,5,5,10,2,5,7,8,6,3,4],"priceScale":10000,"prices":[497466,263,-15631,-8292,1429,18814,910,17139,3319,-342,5914,-4429,7031,-21324,-6767,19260,6595,-4421,12066,-8444,14190,22737,-11315,1989,-2287,15817,-4413,6990,1592,17894,-4396,9161,-25818,11091,-12495,23967,11645,-10115,4692,-19854,-8773,651,17054,-8842,13398,-26705,5523,-9729,11214,-12945,8353,-5240,33128,623,-21916,3717,-3204,897,-14566,-64710,33123,-14633,15832,1629,-13801,-3440,-1102,22398,-4934,10064,-5367,32717,-2033,10347,-12718,18566,7077,3101,-17818,-19355,12991,-6074,6142,-9966,-19871,4266,-18750,14556,4081,-23976,-11362,20643,292,1742,17726,6610,-13464,3502,3468,-6675,-206,11441,2351,-3414,-12556,-10697,12955,-4090,5223,11212,153,-6508,2898,-153,-14513,25161,-2345,10341,7998,5664,-2491,-6978,9145,1995,-6922,-1699,10421,2808,-13542,-1665,9750,-8444,5477,3758,-5982,5946,5568,-1401,-16109,19842,4926,21230,6972,-12733,22162,-2038,14136,-3651,-12740,13960,-11288,2803,-7289,7438,-8232,18685,8537,4058,-4026,11665,-7217,-5022,7395,-13009,-4208,7721,122,-6435,-3135,8000,-8589,6331,10419,-14635,10114,240,16916,-7350,-7909,5307,-3107,-11456,-2222,17072,4911,-6078,2231,-4219,6113,-399,-5873,3809,5527,-11147,7962,248,-3159,6450,-1751,8409,2459,-7360,-1444,13703,1848,-5682,-10139,-6823,9858,-4979,7883,2938,-3226,11668,-5082,10837,10701,-7894,12011,-4335,-29795,-12007,18434,-4353,13166,-17147,20858,-4332,-22301,-9590,-731,11288,-7823,7563,-5698,8252,-38,22499,-6963,3758,-2170,-3277,18538,-6854,-2010,6410,-19957,8614,-3414,5650,12976,8444,-1430,7825,-7209,11109,-11083,9142,1603,-6550,6735,-5960,1777,15793,-20653,-17460,-4434,31687,-11550,11925,3517,-10039,-46628,-1126,19663,-21887,6418,-7303,-42539,21032,-4998,11593,6183,11841,-2871,-1870,11828,-3000,10489,5352,-3557,1899,7183,3536,-6998,629,14184,-2934,4865,-3137,8085,-5772,5133,-12411,12202,7665,-8312,-2356,8888,-7325,5890,-7599,9601,3651,-7594,-1599,-845,9516,-11963,6212,-6870,8510,-6063,2048,16553,1530,-8607,4701,11698,-3194,12362,1511,-20980,-3672,11100,-1646,12652,-6270,978,12117,-8211,4719,-766,12579,10248,-6087,5471,19899,925,10004,-6689,-1230,11942,3765,-723,-4360,-55066,21914,-87618,27320,-65222,-3125,33699,20216,18479,-7720,21634,16977,-13153,9436,-5591,-1940,-4750,-446,-18313,2228,8869,-9884,9148,2945,-3838,7831,-8922,-6314,1986,6717,3826,-8504,6670,4963,-8582,5501,3441,-2886,10554,-9193,7792,4154,-11851,-18504,6297,12340,-2914,7367,-7355,4100,824,-5109,-3156,-383,9315,691,-5300,4705,495,9801,-7828,11962,-4253,7258,3722,-24104,3468,14664,-4242,6282,-11289,14626,-1955,7277,-3239,-5308,3190,-9761,7241,-20929,8269,-2341,7158,7553,-6834,2972,4035,15193,9171,-14220,15796,-16405,11574,-14484,3788,8999,-25425,21105,-3791,9707,1442,-11844,-19494,15801,-13549,-5724,28367,22688,-8539,-4468,6195,840,15902,-1094,-2867,-29534,-6655,20985,-22290,-10946,28602,-307,9866,23098,-7656,-34339,34637,-26931,20087,-23924,-27602,20214,-29001,21029,-34179,48699,16926,-22128,18417,-20949,-4978,-30900,36194,-4994],"returnScale":1000000,"returns":[0,529,-31422,-16668,2873,37819,1829,34453,6672,-688,11889,-8903,14133,-42865,-13603,38716,13257,-8887,24255,-16974,28525,45705,-22745,3998,-4597,31795,-8871,14052,3200,35970,-8837,18416,-51899,22295,-25118,48178,23409,-20333,9432,-39910,-17636,1309,34282,-17775,26933,-53682,11102,-19557,22542,-26022,16791,-10533,66594,1252,-44055,7472,-6441,1803,-29280,-130080,66584,-29415,31825,3275,-27743,-6915,-2215,45024,-9918,20230,-10788,65767,-4087,20800,-25566,37321,14226,6234,-35818,-38907,26114,-12209,12346,-20033,-39945,8576,-37691,29260,8204,-48197,-22839,41496,587,3502,35632,13287,-27065,7040,6971,-13418,-414,22999,4726,-6863,-25240,-21503,26042,-8222,10500,22538,307,-13082,5826,-308,-29174,50578,-4713,20787,16077,11386,-5007,-14027,18383,4010,-13914,-3416,20948,5645,-27222,-3347,19600,-16975,11010,7555,-12025,11952,11193,-2816,-32382,39886,9902,42676,14015,-25596,44550,-4097,28416,-7339,-25610,28063,-22691,5634,-14652,14952,-16548,37560,17161,8158,-8093,23448,-14507,-10095,14865,-26150,-8459,15520,246,-12936,-6302,16082,-17266,12727,20944,-29419,20331,482,34004,-14774,-15899,10668,-6246,-23028,-4467,34318,9872,-12218,4485,-8481,12288,-802,-11806,7657,11110,-22407,16005,498,-6350,12966,-3520,16904,4943,-14795,-2903,27546,3715,-11422,-20382,-13715,19816,-10008,15846,5906,-6485,23455,-10216,21784,21511,-15868,24144,-8714,-59893,-24137,37056,-8750,26466,-34469,41929,-8708,-44830,-19277,-1470,22691,-15725,15203,-11454,16588,-77,45227,-13996,7554,-4362,-6588,37265,-13778,-4040,12885,-40117,17316,-6863,11357,26085,16974,-2875,15730,-14492,22332,-22279,18377,3222,-13167,13539,-11981,3572,31747,-41516,-35098,-8913,63697,-23218,23971,7070,-20180,-93731,-2264,39527,-43997,12901,-14680,-85512,42279,-10047,23304,12429,23803,-5772,-3759,23777,-6031,21085,10759,-7151,3818,14439,7108,-14067,1264,28512,-5897,9779,-6306,16253,-11603,10318,-24948,24528,15408,-16709,-4736,17867,-14725,11840,-15275,19300,7339,-15266,-3214,-1698,19128,-24047,12487,-13810,17107,-12188,4117,33274,3076,-17302,9450,23515,-6420,24850,3037,-42174,-7381,22313,-3309,25433,-12604,1966,24358,-16506,9486,-1540,25286,20601,-12236,10998,40000,1860,20110,-13446,-2473,24006,7568,-1453,-8765,-110693,44051,-176128,54918,-131108,-6282,67741,40638,37146,-15518,43488,34127,-26440,18968,-11239,-3899,-9549,-896,-36813,4479,17828,-19869,18390,5920,-7716,15742,-17935,-12692,3992,13503,7691,-17095,13408,9977,-17252,11058,6917,-5801,21215,-18479,15663,8350,-23822,-37197,12658,24806,-5858,14809,-14785,8242,1657,-10270,-6345,-769,18724,1389,-10654,9458,995,19702,-15735,24045,-8549,14590,7482,-48454,6972,29477,-8527,12628,-22693,29401,-3930,14628,-6511,-10670,6413,-19622,14556,-42071,16622,-4706,14389,15183,-13738,5975,8111,30540,18436,-28585,31753,-32977,23266,-29116,7615,18089,-51109,42425,-7620,19513,2898,-23808,-39187,31763,-27236,-11506,57023,45607,-17165,-8982,12453,1689,31966,-2199,-5763,-59369,-13378,42184,-44807,-22004,57496,-618,19833,46431,-15390,-69028,69627,-54136,40379,-48092,-55485,40634,-58298,42272,-68706,97894,34025,-44482,37022,-42111,-10007,-62115,72757,-10039]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31],"priceScale":10000,"prices":[505747,12972,-1785,27660,21359,2373,8402,7604,-29011,15818,-51627,-5555,46108,21552,-24768,-19520,-13406,13854,-5122,14807,4065,19299,5601,-4762,10044,30423,11614,2597,22348,-4983,-8028,17288,-12324,12450,5193,2128,10573,-6134,9268,21254,-24205,-17045,6632,14211,-3198,30536,9263,13548,-14489,-34651,-40058,27406,13405,11134,15617,-1417,369,7623,26,24747,-8967,19942,13708,27800,-45773,-82811,79728,-17781,-11443,1604,8936,9676,-20328,11076,4235,1305,-2256,14436,106,-4966,29799,-15072,10782,-24440,32650,-6377,2286,26058,-42978,8709,-5112,-2098],"returnScale":1000000,"returns":[16646,26077,-3589,55602,42936,4770,16889,15286,-58318,31798,-103780,-11167,92686,43323,-49788,-39239,-26948,27849,-10297,29765,8172,38794,11259,-9572,20190,61156,23346,5221,44924,-10017,-16138,34752,-24773,25026,10439,4278,21254,-12331,18631,42724,-48656,-34264,13332,28566,-6428,61383,18620,27234,-29125,-69655,-80524,55091,26946,22382,31393,-2849,742,15324,52,49746,-18025,40087,27556,55883,-92012,-166466,160268,-35743,-23003,3225,17963,19450,-40863,22265,8513,2624,-4535,29019,213,-9983,59902,-30298,21674,-49129,65633,-12819,4595,52381,-86393,17506,-10276,-4217]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB South-East Europe", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[429036,327,-7135,458,2457,3558,1313,-4848,-4285,-6132,-5377,-5735,1465,4374,815,-1049,-3186,580,-3913,-128,-321,1561,2061,-4510,-4539,-3019,50,6268,8750,-6134,502,-4253,2011,617,-4113,793,-455,-6822,2219,-4019,-2116,8710,932,-570,-954,1506,-2542,-7965,-2718,-2663,-6143,2666,1446,-2519,-1857,5475,-631,-3124,238,1314,2740,-6146,-7114,3162,1140,8072,-6322,-7482,-2884,2200,-454,73,680,-238,1882,2811,1418,2277,2560,-824,-541,3506,-889,-39,3572,1408,-4370,-1566,7060,-6010,-3767,2947,13080,3522,3184,4396,1345,5025,4883,9773,6530,1359,-1648,3043,-2413,7895,-296,8049,4107,-176,177,24114,-3529,-7425,1693,-10195,8907,-1867,4324,8401,3563,1374,5105,7177,-928,1871,1701,-7971,1767,-5518,-12192,-746,-2223,3413,-3777,4218,7395,11763,2180,18065,-3757,-8676,-929,6793,1290,21526,17348,4568,3054,7344,-719,2553,976,-3875,-8044,-1295,-440,-6666,8135,-7461,-1721,-859,-2986,-3391,-10692,622,-4531,4411,-60,14120,6856,7665,8567,4428,8856,-17137,-1316,1313,-3589,12631,4875,-12642,-6172,1420,-6847,5160,720,12361,4499,866,-3547,-352,14481,-177,6551,-15943,-967,-405,3817,6453,-788,-3028,-4496,-1162,12340,-1039,-1537,2029,13986,-34358,2635,8487,26175,-3110,1417,-11589,-40678,-777,-4157,2422,-8999,4408,-332,8694,2511,-1950,4036,-1989,521,13416,-3027,1891,-2208,4968,-1614,-1590,71,-4961,-915,82,276,7497,8300,-4326,4968,-8038,-287,2205,-1779,-1162,-5159,-440,4411,-1933,-2308,6473,-2650,1913,670,1430,17400,2294,10404,-18911,-2102,-1738,8535,-2254,7240,1278,-101,2027,5786,10515,3505,10938,5310,4452,-937,-4831,-4696,-337,-27340,10461,-69354,-53563,-21077,25280,31084,-779,5673,18262,-5478,-2334,444,1010,4839,-7084,245,-5367,2289,-2252,5132,35,-589,2710,588,-4399,-2152,3450,6084,3679,-1712,2552,-6270,-4051,-4831,-3408,1385,3570,5052,7417,4088,-3941,-643,436,7368,8179,4512,-2316,-2978,-2631,-1300,17124,-3669,2840,1577,-1345,-11166,9784,2068,1352,1425,1167,5729,2670,6472,3633,5837,2159,1162,561,-4343,-1990,-816,-2786,9390,4977,2411,1788,2019,2937,-4243,-5092,3372,3614,-125,4954,5554,-2400,1913,2841,2306,-828,-5548,1727,2135,-840,5657,12274,8902,688,-14213,259,1495,-5586,-26416,-16277,-2356,24308,3997,8018,3421,-7594,2244,-2271,-1546],"returnScale":1000000,"returns":[9649,769,-16791,1078,5782,8373,3090,-11409,-10084,-14430,-12654,-13496,3448,10293,1918,-2469,-7497,1365,-9209,-301,-755,3673,4850,-10613,-10682,-7104,117,14751,20591,-14435,1181,-10008,4732,1452,-9679,1866,-1070,-16055,5222,-9458,-4979,20497,2193,-1341,-2245,3544,-5982,-18744,-6396,-6267,-14456,6273,3403,-5928,-4370,12885,-1485,-7352,560,3092,6448,-14463,-16741,7441,2682,18996,-14877,-17608,-6787,5178,-1069,172,1600,-560,4429,6615,3337,5359,6024,-1939,-1273,8251,-2093,-91,8406,3313,-10284,-3685,16614,-14143,-8865,6935,30781,8289,7493,10345,3165,11825,11491,22999,15367,3198,-3878,7161,-5679,18580,-697,18942,9665,-414,416,56748,-8305,-17473,3984,-23992,20961,-4394,10176,19770,8385,3233,12014,16889,-2184,4403,4003,-18758,4158,-12985,-28691,-1756,-5231,8031,-8888,9926,17403,27682,5130,42512,-8841,-20417,-2187,15986,3036,50657,40825,10750,7187,17282,-1692,6008,2297,-9119,-18930,-3047,-1036,-15687,19144,-17558,-4050,-2021,-7027,-7980,-25161,1463,-10663,10381,-141,33228,16134,18038,20161,10420,20841,-40328,-3097,3090,-8446,29724,11473,-29751,-14524,3341,-16113,12143,1695,29089,10587,2038,-8347,-828,34078,-417,15417,-37519,-2275,-954,8983,15186,-1855,-7125,-10581,-2734,29039,-2445,-3617,4775,32913,-80854,6201,19972,61598,-7319,3334,-27272,-95727,-1829,-9782,5699,-21177,10373,-781,20460,5909,-4589,9498,-4681,1226,31572,-7124,4450,-5196,11692,-3799,-3741,167,-11675,-2153,193,649,17643,19532,-10180,11691,-18916,-675,5189,-4187,-2734,-12141,-1035,10380,-4549,-5431,15233,-6237,4502,1577,3365,40948,5398,24484,-44503,-4947,-4090,20085,-5304,17038,3007,-237,4770,13616,24745,8248,25740,12496,10477,-2205,-11368,-11052,-793,-64339,24618,-163210,-126050,-49600,59491,73150,-1833,13350,42976,-12892,-5492,1045,2376,11388,-16671,577,-12630,5386,-5299,12077,82,-1386,6378,1383,-10352,-5064,8119,14317,8658,-4029,6006,-14755,-9534,-11368,-8020,3259,8401,11889,17454,9621,-9275,-1513,1026,17339,19248,10618,-5450,-7008,-6192,-3059,40298,-8635,6684,3711,-3165,-26277,23025,4866,3182,3353,2747,13482,6283,15230,8550,13736,5081,2734,1321,-10221,-4683,-1920,-6556,22097,11712,5674,4208,4751,6912,-9985,-11983,7935,8505,-294,11658,13070,-5648,4502,6686,5427,-1949,-13056,4064,5024,-1976,13312,28885,20949,1619,-33448,610,3518,-13146,-62164,-38305,-5544,57204,9406,18869,8050,-17871,5281,-5344,-3638]},"lttb":{"start":16344,"dateDeltas":[2,6,7,2,9,4,7,7,3,4,9,4,7,6,5,6,3,8,6,4,4,9,3,7,3,6,7,4,7,3,8,3,8,7,2,7,5,7,5,8,4,4,6,4,10,5,4,7,5,3,9,4,7,5,4,5,5,7,8,5,1,6,7,8,4,3,7,4,9,5,5,5,9,2,5,9,2,8,5,5,5,8,4,8,3,4,7,7,4,5,8,4,3,7,8,6,6,5,3,5,6,7,4,6,6,8,5,5,4,8,5,5,3,6,5,6,5,10,4,5,5,7,3,5,10,4,3,7,7,5,5,7,4,5,4,5,11,2,7,3,5,10,4,6,4,7,4,6,4,10,3,4,6,8,7,5,1,7,7,5,4,9,4,7,5,2,10,3,9,5,1,7,5,6,7,7,4,3,6,7,5,9,4,5,6,6,7,4,6,2,6,7,6,5,4,5,7,7,5,7,3,5,6,6,8,6,4,4,7,3,7,5,7,3,9,7,4,6,2,9,3,8,4,6,7,3,5,6,5,6,6,9,4,3,6,7,4,7,8,5,3,8,5,2,10,4,5,8,6,3,7,6,5,3,5,6,5,5,6,8,3,8,5,5,4,8,5,8,1,8,5,5,4,11,3,6,6,6,4,6,5,3,6,10,4,6,2,10,3,4,6,5,9,2,8,5,8,6,3,5,6,8,2,6,8,7,5,2,8,4,8,2,5,5,6,8,7,3,7,5,3,7,5,8,7,4,6,3,9,6,3,4,5,6,6,5,6,8,3,5,8,4,7,8,2,8,7,3,6,5,6,3,5,11,5,4,7,4,3,5,8,5,5,7,7,5,4,4,8,3,9,3,8,4,4,9,5,3,10,3,3,7,6,8,6,1,7,6,5,4,7,6,8,6,1,8,4,5,10,1,10,3,4,7,5,7,6,5,6,6,3,5,8,6,7,4,4,9,3,3,9,3,8,6,6,4,7,5,7,5,2,5,7,8,3,7,6,4,5,4,8,6,3,6,6,9,4,7,3,4,9,6,2,10,2,6,7,6,3,8,5,5,3,8,3,7,8,3,6,7,5,6,3,5,11,4,4,4,8,6,5,8,2,6,6,8,1,10,1,10,4,5,5,8,4,6,2,11,1],"priceScale":10000,"prices":[424936,4190,2366,-13208,3987,-1457,4439,3504,1385,787,-5742,-4306,-2657,-9949,-7565,4487,-95,6037,-37,-2998,1138,-3066,499,-3916,-2677,2433,-1850,-173,4952,1679,-4857,-5461,747,-5213,1020,5981,10116,-5206,-4309,3323,-6290,4114,-2253,3423,-4651,-710,1008,-8726,4534,-4734,1629,-3429,7336,2407,-2848,2451,-1719,-208,3146,-12586,1085,-3196,478,-2663,-7460,4279,-4217,6358,-3146,-2221,5548,-2861,2170,-6094,3203,-902,4904,44,-9788,-3464,3262,-1134,9883,355,-7364,-6359,-4326,-70,5243,-2084,-1962,3725,1008,-3598,1570,4668,-488,4778,-1614,3031,-1163,1179,-1053,3658,-1325,-1088,4648,950,750,-4112,-1770,-291,9188,-7369,114,-5794,4328,13303,1070,5553,3763,2363,-788,5368,-55,14678,-1499,8040,1366,-1575,-332,5144,-4084,7609,3464,-3710,8151,8702,-5125,-1014,1443,24342,-4140,-6939,3295,-814,-14730,12698,-2678,476,13501,-588,4335,-1176,4179,9406,2180,-2305,-788,3681,-306,-7428,1881,-7123,-10965,3427,-6493,475,6498,-7157,432,3195,10297,-5055,18518,-2249,26729,-11688,759,-9455,-929,6857,1226,19935,2928,23399,-2820,3054,7078,-6994,6619,3747,869,-2197,-2584,-8197,-5434,4529,-10506,9052,3958,-8830,2526,-6357,649,-5050,-1327,6646,-19509,3583,-5274,5594,-2464,2678,11894,7578,7665,8606,-2298,6742,8801,-15225,-4671,2098,658,-3589,14713,-5322,8115,-12570,-7550,3832,-7893,-633,5844,-2209,17573,-2217,8943,-8509,1207,-4514,18415,-3759,4009,6352,-15957,2502,198,-9912,9816,6403,309,-764,-3386,583,-7263,952,12419,36,-2614,-200,1969,14169,-34265,4902,-5593,40988,-6810,2573,882,-3458,-9562,-40573,-866,-7360,5037,-1118,-12429,9590,-1115,1293,8281,3381,-2979,3898,-3352,1557,911,12636,1105,-3798,1961,-2278,5375,-2419,2657,-5396,3348,-6141,-1506,504,665,-2653,4573,13239,-5679,1041,5545,-8325,-1873,745,3078,871,-4572,618,-6697,950,4957,-3484,5755,-6791,6465,-3737,3567,938,-1770,2254,14245,5595,10267,-9,-17886,-5875,5219,-4209,8700,-4681,9538,-2516,3815,-158,-1060,4669,14865,-146,2264,20578,-5155,7055,-3158,1684,-5963,922,-4704,-20746,-6713,10461,-73483,4129,-53456,-21139,11427,38660,7420,-5933,9639,18523,-7496,3945,-4448,370,-1211,7691,-632,-6992,154,-5418,-114,3746,-3544,4572,1387,-2313,435,7037,265,-7450,-2701,93,6212,202,7858,-1966,2387,2058,-8800,-5791,1572,-9244,-1372,3762,6222,-2652,5052,7547,4019,-445,-5999,-1365,3600,7989,244,10639,2775,-9820,3051,-3110,-2112,1178,19406,-5977,-613,6602,-469,-2422,-12493,11427,-1034,5923,-1785,2386,-961,1167,10483,-3420,7421,6964,-2944,5958,-1725,6268,-5743,5025,-4483,1072,-3404,-6046,4028,8040,3759,2393,7843,-4630,3917,-1961,3663,-5494,-11521,10616,3882,-1325,-190,4978,6991,-3211,309,1177,3637,2978,1407,-8729,-981,3715,-1563,2053,8912,-3312,10858,10444,5958,-21378,6036,-3934,2825,-888,-49946,17571,-27181,-3452,36177,10782,-6797,7986,3512,-7308,-416,2701,-2364,-1839],"returnScale":1000000,"returns":[0,9860,5568,-31082,9382,-3428,10446,8246,3259,1852,-13512,-10134,-6252,-23413,-17803,10559,-223,14207,-87,-7056,2678,-7215,1174,-9215,-6300,5726,-4354,-407,11654,3951,-11430,-12852,1758,-12267,2400,14075,23806,-12251,-10141,7820,-14802,9682,-5302,8055,-10945,-1671,2372,-20535,10670,-11140,3833,-8069,17263,5665,-6702,5768,-4046,-489,7403,-29618,2553,-7521,1125,-6267,-17556,10070,-9924,14962,-7403,-5227,13056,-6732,5106,-14341,7538,-2123,11541,103,-23034,-8152,7677,-2669,23258,835,-17329,-14965,-10180,-165,12338,-4904,-4617,8766,2372,-8467,3694,10986,-1149,11244,-3798,7133,-2737,2775,-2478,8608,-3118,-2561,10939,2235,1765,-9677,-4165,-685,21622,-17341,268,-13635,10185,31306,2518,13068,8855,5561,-1854,12632,-129,34542,-3528,18921,3214,-3706,-782,12106,-9611,17906,8152,-8731,19182,20478,-12060,-2387,3396,57284,-9743,-16329,7754,-1916,-34664,29883,-6303,1121,31771,-1383,10201,-2767,9834,22135,5131,-5425,-1854,8662,-720,-17480,4426,-16762,-25804,8065,-15280,1118,15291,-16842,1016,7519,24232,-11896,43578,-5292,62901,-27505,1786,-22250,-2187,16137,2885,46913,6890,55065,-6636,7187,16657,-16459,15576,8818,2045,-5170,-6081,-19290,-12788,10658,-24724,21302,9315,-20780,5945,-14960,1527,-11884,-3123,15640,-45910,8431,-12411,13164,-5798,6302,27990,17833,18038,20253,-5408,15866,20711,-35829,-10992,4937,1549,-8446,34624,-12524,19097,-29581,-17768,9018,-18574,-1490,13753,-5199,41355,-5218,21046,-20024,2840,-10623,43336,-8846,9435,14948,-37552,5888,466,-23326,23100,15068,727,-1797,-7969,1372,-17092,2241,29225,85,-6152,-470,4633,33344,-80635,11535,-13162,96457,-16026,6055,2076,-8138,-22502,-95480,-2038,-17320,11853,-2631,-29249,22568,-2624,3043,19488,7956,-7010,9173,-7888,3664,2144,29736,2600,-8938,4615,-5361,12649,-5692,6252,-12698,7879,-14452,-3544,1186,1565,-6243,10762,31155,-13364,2449,13049,-19591,-4408,1754,7243,2050,-10759,1454,-15760,2235,11666,-8199,13543,-15981,15214,-8794,8394,2207,-4165,5304,33523,13167,24161,-21,-42091,-13826,12282,-9905,20474,-11016,22446,-5921,8977,-371,-2495,10988,34981,-343,5328,48426,-12131,16602,-7432,3963,-14032,2169,-11070,-48821,-15798,24618,-172927,9717,-125798,-49746,26891,90978,17462,-13963,22684,43590,-17640,9283,-10467,871,-2850,18099,-1487,-16455,363,-12750,-269,8816,-8340,10759,3264,-5443,1024,16560,623,-17532,-6356,219,14619,475,18492,-4626,5617,4843,-20709,-13628,3699,-21753,-3229,8853,14642,-6241,11889,17760,9458,-1047,-14117,-3213,8472,18801,574,25037,6530,-23109,7180,-7319,-4970,2772,45668,-14066,-1442,15536,-1104,-5699,-29400,26891,-2433,13938,-4200,5615,-2262,2747,24669,-8048,17464,16388,-6928,14021,-4060,14751,-13515,11825,-10550,2523,-8010,-14229,9480,18920,8846,5632,18456,-10895,9218,-4615,8620,-12929,-27112,24982,9136,-3119,-447,11715,16452,-7556,727,2770,8558,7009,3311,-20542,-2309,8743,-3679,4832,20972,-7794,25552,24578,14021,-50309,14205,-9258,6648,-2090,-117537,41349,-63965,-8123,85135,25373,-15995,18793,8265,-17198,-979,6356,-5563,-4327]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31],"priceScale":10000,"prices":[425253,-4372,-9742,-4464,-2801,-11535,10952,-5765,-7542,6541,-13478,-8181,4472,-1781,2173,-14637,-120,10766,1651,-47,-3464,26892,21112,7005,21427,14066,-4213,18758,12297,-22339,-3421,34329,2787,46730,12311,-14765,-9166,-15766,13799,34812,-17009,-3414,3492,8257,7445,9299,2488,13360,1795,-53589,-6316,12807,10624,1472,-7272,11783,-1229,-4280,-212,21790,-10005,14376,20370,21185,-37263,-111935,58125,-6619,-5751,3057,-1650,13032,-19149,18400,6880,6798,9524,-2721,10531,18666,3812,5149,11760,-963,8912,539,8600,10295,-48738,31966,-2351,-1601],"returnScale":1000000,"returns":[746,-10289,-22925,-10506,-6591,-27145,25773,-13567,-17748,15393,-31718,-19253,10524,-4191,5114,-34445,-283,25336,3885,-110,-8152,63285,49682,16485,50424,33102,-9915,44143,28939,-52570,-8051,80786,6559,109969,28972,-34747,-21570,-37102,32473,81923,-40027,-8034,8217,19432,17520,21883,5855,31440,4224,-126110,-14864,30139,25001,3464,-17113,27729,-2892,-10072,-499,51278,-23545,33831,47937,49855,-87691,-263416,136785,-15577,-13533,7194,-3883,30668,-45063,43300,16191,15998,22412,-6403,24783,43926,8971,12117,27675,-2266,20972,1269,20238,24227,-114695,75226,-5533,-3767]}});
\ No newline at end of file
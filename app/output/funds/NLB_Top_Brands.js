@@ -0,0 +1 @@
+registerFundSeries("NLB Top Brands", {"weekly":{"start":16348,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1008804,-10504,-3090,14552,18428,4465,-1281,11669,2673,3751,-28023,20888,8225,-5557,5548,10085,28858,-18518,11237,10111,5042,9278,3383,8445,9420,-20203,-4537,31260,-11607,12127,-19107,1146,-4982,7097,-2968,-19588,-2945,-506,10437,-12981,-2146,31957,-25937,3656,920,-19702,-48758,15065,-17958,4882,-1538,93,5588,28428,3890,22717,9255,9371,-21289,27206,2056,-25660,-30924,8328,9798,-5178,-53594,-16913,16595,9517,-31458,-14218,27193,7088,26499,-1135,-222,-2854,-6138,-5765,24522,7026,-21034,-12773,-437,3201,22919,-4832,-10281,-7103,-3107,24520,3814,16574,6815,-4243,5304,8385,-12993,-3533,9827,-18530,-1780,13908,680,1634,6290,9797,-4523,-33364,31588,14892,13554,-15950,42525,15511,772,-10053,16450,-9117,-916,3881,-8664,9428,13078,6827,10132,-5889,246,-9137,14520,-1100,-7841,-2243,6204,11953,7949,-24120,4213,9159,-6078,-2252,5102,-29005,-2021,17822,-15419,-9631,967,-8192,-730,2733,2186,-3869,14756,-3004,10874,18185,2054,786,21210,12602,-7177,-19745,5593,-1579,6779,9759,-2479,-13685,21878,2203,3236,845,-46876,-36467,22720,7309,-24176,20467,-5708,-36890,20267,4554,16627,1554,7992,12290,17530,8040,-3862,823,2001,-1556,-9066,-4101,7850,10827,-1930,12505,4810,3124,2290,-3043,559,-15175,9989,11125,6150,-5659,-36692,19341,-13118,13303,13404,-9735,-33842,26506,-33142,4572,-45240,7950,10813,1305,20194,2443,18674,4690,23676,5657,3486,-3607,27517,-6952,20946,18649,618,15362,16137,-767,-35350,9664,-11831,-19135,24258,5961,17589,-9323,21322,-3601,-3667,19058,-30028,-17952,1054,-10289,22222,13473,1652,-1075,1427,-6739,4214,-4028,10110,2154,8600,2035,-3878,5182,-3158,2121,11806,1606,109,5541,8798,-1959,-18379,19421,10011,-15758,-91572,-13989,-65481,-54634,47842,11219,43151,25725,-3376,748,25006,-16655,19083,9022,40210,-41498,26939,-20225,25851,14477,-1076,-18441,-15327,19119,5609,8698,17988,-23187,-5879,-11987,-3842,7787,18609,1293,-15528,-51772,47917,23894,-3709,16034,-761,-6620,6147,-2940,5394,19927,-6971,12481,-30262,53022,-2229,-6810,-25135,27056,25520,-168,15711,12931,20974,6058,-16189,-11043,22863,-15165,-8477,13769,17767,7069,-9282,20210,17129,1623,-3462,16499,-19982,18798,15706,-18123,2100,-3777,-16522,-9797,9519,-9890,17319,17061,-4698,6660,25953,-3642,707,-39823,-5438,33099,-19124,18952,4821,8767,-5850,-42890,19477,-19276,-1128,-17222,2544,-39702,-10861,53126,15353,-1556,2410,-14135,-32077,3109,-8699,-342,-22825,32331,-5173,-38962,-36617,27924,-16833,26042,-9766,14866,34081,-1949,21778,4339,-25770,-25204,18086,-27661,-24577,-20703,15068,-3612,33670,6957,-7837,13223,-4195,8871,-1446,-23361,-22886,3670,-4312,21730,14169,-7229,14347,7495,7987,4727,-20475,17771,-31574,-5630,6641,28689,4032,5898,3246,7011,-11636,5500,22455,2133,18173,-12058,10386,-10683,19254,-29621,6160,14926,23222,-24795,-9682,-14675,11161,21209,-896,13763,-37382,-6180,-581,10888,-30781,-24338,43852,10697,11896,6528,10763,16443,2315,4794,-735,-2120,16172,11080,29718,16959,24145,-1723,15800,7770,-9243,7007,30930,4973,-13926,7570,-40531,30873,6304,20367,6216,-2240,-8268,18378,19855,6559,1129,18229,-8953,-43399,-14610,-29143,-3439,40208,2957,6764,-63295,46466,5280,10774,11456],"returnScale":1000000,"returns":[-631,-10406,-3061,14416,18256,4423,-1269,11560,2648,3716,-27761,20692,8148,-5505,5497,9990,28588,-18344,11131,10017,4995,9191,3351,8366,9332,-20014,-4494,30967,-11498,12013,-18928,1135,-4935,7031,-2941,-19404,-2918,-501,10339,-12859,-2126,31658,-25695,3622,912,-19518,-48302,14924,-17790,4836,-1523,92,5535,28163,3853,22505,9168,9284,-21090,26951,2037,-25420,-30635,8250,9707,-5130,-53093,-16754,16439,9428,-31163,-14085,26938,7022,26251,-1124,-220,-2828,-6080,-5711,24292,6961,-20838,-12653,-433,3171,22705,-4787,-10185,-7037,-3077,24290,3779,16419,6751,-4204,5255,8306,-12871,-3500,9735,-18357,-1763,13778,674,1618,6231,9706,-4481,-33052,31293,14752,13428,-15801,42127,15366,765,-9959,16296,-9032,-907,3845,-8583,9339,12956,6763,10038,-5834,243,-9051,14384,-1090,-7767,-2222,6146,11841,7874,-23894,4174,9073,-6021,-2231,5054,-28734,-2002,17656,-15275,-9541,958,-8116,-723,2708,2165,-3833,14618,-2975,10772,18015,2035,778,21012,12484,-7110,-19560,5540,-1564,6716,9668,-2456,-13557,21673,2183,3205,837,-46437,-36126,22507,7241,-23950,20276,-5655,-36545,20078,4511,16471,1540,7917,12175,17366,7965,-3826,815,1983,-1542,-8981,-4063,7777,10726,-1912,12388,4765,3095,2268,-3014,553,-15033,9896,11021,6092,-5606,-36348,19160,-12996,13179,13279,-9644,-33526,26258,-32832,4529,-44816,7875,10712,1293,20005,2420,18499,4647,23454,5604,3454,-3574,27260,-6887,20750,18475,612,15218,15986,-759,-35020,9574,-11721,-18956,24031,5906,17424,-9236,21123,-3567,-3633,18880,-29747,-17785,1045,-10193,22014,13347,1637,-1065,1413,-6676,4175,-3990,10015,2134,8519,2016,-3841,5133,-3128,2101,11695,1591,108,5490,8715,-1940,-18207,19239,9917,-15610,-90716,-13858,-64869,-54123,47395,11114,42747,25485,-3345,741,24772,-16499,18905,8937,39834,-41110,26687,-20035,25609,14341,-1065,-18269,-15184,18941,5556,8617,17819,-22970,-5824,-11875,-3806,7715,18434,1281,-15382,-51288,47469,23670,-3674,15884,-754,-6558,6089,-2912,5344,19740,-6906,12365,-29979,52526,-2208,-6747,-24900,26803,25282,-167,15564,12810,20778,6002,-16038,-10940,22649,-15023,-8398,13641,17601,7002,-9195,20021,16969,1608,-3430,16345,-19795,18622,15559,-17953,2080,-3742,-16367,-9706,9430,-9797,17157,16901,-4654,6598,25710,-3608,701,-39451,-5387,32789,-18945,18775,4776,8685,-5795,-42489,19295,-19096,-1117,-17061,2520,-39331,-10759,52629,15209,-1541,2387,-14003,-31777,3080,-8617,-339,-22612,32029,-5125,-38597,-36275,27663,-16675,25798,-9675,14727,33763,-1931,21574,4298,-25528,-24969,17917,-27402,-24347,-20510,14927,-3578,33355,6892,-7764,13100,-4156,8788,-1432,-23143,-22672,3636,-4272,21527,14036,-7161,14213,7425,7912,4683,-20284,17605,-31279,-5577,6579,28421,3994,5843,3215,6946,-11527,5448,22245,2113,18003,-11945,10289,-10583,19074,-29344,6102,14787,23004,-24563,-9591,-14538,11057,21010,-887,13634,-37032,-6123,-575,10786,-30493,-24110,43441,10597,11785,6467,10662,16290,2293,4749,-728,-2100,16021,10976,29440,16800,23920,-1707,15652,7697,-9156,6941,30641,4926,-13795,7499,-40152,30584,6245,20177,6158,-2220,-8190,18206,19669,6498,1118,18059,-8869,-42994,-14473,-28870,-3407,39832,2929,6701,-62703,46031,5231,10673,11349]},"lttb":{"start":16344,"dateDeltas":[7,2,6,11,5,9,10,2,13,7,3,8,10,4,9,11,4,4,10,5,12,8,8,8,4,6,10,3,9,5,13,6,7,8,6,8,5,6,8,9,10,4,10,8,6,4,7,13,2,10,10,5,7,7,8,10,4,10,2,10,5,13,5,6,11,3,9,10,6,7,9,6,7,3,10,6,9,6,9,5,7,12,3,13,6,9,1,7,9,10,7,6,7,6,7,11,5,7,8,5,8,7,12,9,4,5,6,8,9,6,11,10,4,9,6,9,5,5,9,12,3,11,2,11,5,10,8,5,6,12,6,5,10,7,6,11,3,10,5,6,6,13,4,10,8,2,9,5,10,8,4,11,7,8,6,7,7,7,6,13,2,12,4,11,6,9,8,7,6,5,5,9,11,7,3,8,8,7,8,7,12,7,1,12,9,5,4,12,2,13,7,5,8,5,9,9,6,4,14,2,8,9,4,8,10,9,8,5,4,9,8,7,12,6,6,5,7,6,7,8,10,7,7,12,7,5,4,7,9,8,5,11,5,8,9,6,7,9,9,8,7,3,6,7,7,8,8,7,10,8,3,9,6,10,10,6,6,6,12,5,7,5,8,9,9,6,10,7,9,5,8,2,9,7,6,9,7,8,6,9,6,12,7,3,12,4,9,4,12,3,8,10,8,6,7,6,7,6,10,11,3,10,3,8,11,6,4,11,10,4,7,7,5,11,10,5,4,10,8,4,9,8,5,8,8,9,4,12,3,12,5,7,5,14,3,8,7,7,5,8,8,9,6,11,7,4,10,3,11,4,7,9,12,6,7,7,6,7,9,3,8,7,8,12,8,2,12,8,2,10,7,4,11,8,4,10,6,8,5,8,7,9,6,8,8,11,2,7,12,3,11,7,9,6,9,4,6,12,3,7,13,3,7,8,5,7,8,13,2,12,6,3,13,4,7,8,7,10,7,7,5,9,7,10,3,12,4,5,7,7,13,2,13,8,7,7,6,4,12,5,4,10,10,3,8,7,7,12,7,7,9,7,5,7,7,8,3,12,3,9,10,3,9,9,5,7,13,2,12,2,10,4,11,4,14,4,8,6,8,8,7,7,4,7,13,5,5,9,11,7,3,10,3,11,4,7,9,9,5],"priceScale":10000,"prices":[1009441,-1448,-12240,-4694,16666,20501,7105,-1759,9508,8019,-28646,-7945,32985,-5572,-7947,12262,47235,-22656,13187,10414,-2444,17507,-5851,27062,-27043,10320,-10818,41552,-21838,16622,-23625,-5844,11230,1516,-29515,3463,-6674,18939,-24129,-6914,42566,-34897,13282,8835,-27199,-74568,39790,-22007,26004,-18691,-12837,51190,-12582,7962,36469,10045,-22268,26020,3242,1344,-55818,14915,5440,-9517,-53516,-23813,23493,7815,-55717,41691,-6897,41318,-11605,14958,-8375,10099,-28731,29540,11966,-26941,-18822,11850,-6080,26251,-2628,-27800,29486,-40187,41443,2232,24442,1356,-16974,24283,1822,-18206,11629,2539,-27935,24822,-17163,14089,-4017,20565,-29633,-11371,32066,15233,15788,-19003,42629,22704,-16483,18871,-12433,-5108,8969,-12288,3056,25242,3520,14351,-13040,9300,-14674,15077,807,-16075,16793,-6604,21075,-24678,-608,13569,-8903,-4036,9587,-27631,-3475,18069,-1995,-19551,2823,-13701,4657,-13963,18448,-8920,18993,-9273,23989,7204,8562,-9150,35756,10234,-33479,8472,-8522,1973,25601,-9995,-15539,21105,-5093,16793,-19013,-79088,35479,-7379,20727,-32660,21244,-41827,18851,-10099,29407,8372,-8960,13680,28872,11386,-16117,9848,1233,-4710,-19013,11899,5143,10243,13119,-6715,18025,-12493,13000,2002,-24601,15161,-8222,25848,3729,-53824,22567,-24711,38862,-673,-42699,27409,9876,-43602,3375,-62279,31602,5598,20797,-6267,-633,42685,-9444,22341,8380,-5741,31752,-14106,45361,-2648,4357,14282,16514,-1000,-52506,26926,-27919,-5464,32410,25437,-19616,27094,-8416,-2059,19976,-52119,9768,-19071,23110,-9257,26146,5633,-7335,5079,-15413,10737,-4265,10230,3005,11240,-6767,9258,-13176,9376,11277,4924,-11013,13777,9014,-15485,-4972,31179,-971,-107711,30578,-173194,62855,-75060,93426,-14043,62287,-21660,50416,-24604,-316,35803,2450,44194,-56309,48094,-32113,41640,-4527,14302,-30602,-15441,36200,-11386,28982,3062,-39979,12746,-34520,26384,23949,-17441,-9317,-55280,59185,23714,-11289,17421,-5354,11793,-21016,21265,-12476,25671,13353,-38108,49702,6511,-5093,-38040,27505,36949,-7254,-2884,35666,18815,4933,-15929,-19272,31139,-41037,25394,964,22405,-2214,18378,1506,20679,8281,-39843,33554,-5379,31456,-28770,17143,-7414,-19699,-30977,34011,-23646,28669,16835,-5209,29759,-12526,19142,-1423,-54727,44268,-26386,-12746,44127,13025,-436,-76691,58470,-34698,1114,-49889,30228,-66516,10155,51829,39706,-32884,12456,-7677,-59997,46545,-56660,39484,-31811,31938,717,-80652,24216,-28619,33984,-25029,24130,47320,-5446,29722,-125,-54875,27052,-33826,929,-49937,41222,-34871,46388,-17180,-7360,49710,-28980,18698,4146,-23347,-33169,-6924,8274,19055,-5682,20448,-2167,29353,5010,-28947,21222,-30459,-19666,9146,37771,3548,12086,-18407,23735,-32028,23546,23442,-12687,34495,14301,-36555,24756,-26195,25359,-19470,39254,-27272,11512,-34852,12486,26033,-12103,23768,-42919,-17190,31477,3004,-64308,51486,-8721,30567,-10819,-266,19565,32050,-13428,9400,-10064,15495,-9437,51501,-4750,46385,-6581,23171,-12834,21839,-4501,31587,3911,-14523,-34287,37045,-22878,44356,18025,-16693,-12645,32678,-6644,28440,-183,21018,7071,-65931,-12416,-70449,38460,53268,-19912,17360,-62339,52031,-1096,-2199,24429],"returnScale":1000000,"returns":[0,-1434,-12126,-4650,16510,20309,7039,-1743,9419,7944,-28378,-7870,32676,-5520,-7872,12147,46793,-22444,13064,10316,-2421,17343,-5796,26809,-26790,10223,-10716,41163,-21634,16467,-23404,-5790,11125,1502,-29239,3431,-6612,18762,-23903,-6850,42168,-34570,13157,8753,-26945,-73870,39417,-21801,25761,-18516,-12717,50711,-12464,7887,36128,9951,-22059,25776,3212,1331,-55296,14776,5389,-9428,-53015,-23591,23274,7742,-55196,41301,-6833,40932,-11497,14818,-8296,10004,-28462,29264,11854,-26689,-18646,11739,-6023,26005,-2603,-27540,29210,-39811,41055,2212,24213,1343,-16815,24056,1805,-18036,11520,2516,-27674,24590,-17003,13957,-3979,20373,-29356,-11265,31766,15091,15640,-18825,42230,22492,-16329,18695,-12317,-5060,8885,-12173,3027,25006,3487,14217,-12918,9213,-14537,14936,799,-15924,16636,-6542,20877,-24447,-602,13442,-8820,-3998,9497,-27372,-3443,17900,-1976,-19368,2796,-13572,4613,-13832,18275,-8837,18816,-9186,23764,7137,8482,-9065,35422,10138,-33166,8393,-8442,1954,25362,-9902,-15393,20907,-5045,16636,-18835,-78349,35148,-7310,20533,-32355,21045,-41435,18674,-10004,29132,8293,-8876,13552,28602,11280,-15966,9755,1222,-4666,-18835,11788,5094,10148,12996,-6652,17856,-12376,12878,1984,-24371,15019,-8145,25606,3694,-53320,22356,-24480,38498,-666,-42300,27153,9783,-43194,3343,-61696,31306,5546,20602,-6208,-627,42286,-9356,22132,8302,-5688,31455,-13974,44937,-2623,4316,14149,16359,-990,-52015,26674,-27658,-5413,32107,25199,-19433,26841,-8337,-2040,19789,-51631,9676,-18892,22893,-9170,25902,5580,-7267,5032,-15269,10637,-4225,10134,2977,11135,-6704,9171,-13052,9288,11171,4878,-10910,13649,8929,-15340,-4925,30887,-962,-106704,30292,-171574,62267,-74358,92553,-13912,61704,-21457,49944,-24373,-313,35468,2427,43780,-55782,47644,-31812,41250,-4485,14169,-30316,-15297,35862,-11280,28711,3034,-39606,12627,-34197,26137,23725,-17278,-9229,-54763,58631,23492,-11183,17258,-5304,11683,-20820,21066,-12359,25431,13228,-37751,49237,6450,-5046,-37684,27248,36603,-7186,-2857,35333,18639,4887,-15781,-19091,30848,-40654,25157,955,22195,-2193,18206,1492,20486,8203,-39470,33240,-5329,31162,-28501,16983,-7345,-19515,-30687,33693,-23425,28401,16678,-5161,29481,-12409,18963,-1410,-54215,43854,-26139,-12627,43715,12903,-432,-75974,57923,-34373,1103,-49422,29945,-65894,10060,51345,39334,-32576,12339,-7605,-59436,46110,-56130,39115,-31514,31639,711,-79898,23989,-28351,33666,-24795,23905,46877,-5395,29444,-124,-54362,26799,-33509,920,-49470,40837,-34545,45954,-17019,-7292,49246,-28709,18523,4107,-23129,-32859,-6859,8197,18877,-5629,20257,-2147,29078,4963,-28676,21024,-30174,-19483,9061,37418,3514,11973,-18234,23513,-31729,23326,23223,-12569,34173,14167,-36213,24524,-25950,25122,-19288,38887,-27017,11405,-34527,12370,25789,-11990,23546,-42517,-17030,31183,2976,-63707,51005,-8640,30281,-10717,-264,19382,31750,-13302,9312,-9970,15350,-9349,51020,-4706,45951,-6519,22954,-12714,21635,-4459,31292,3874,-14387,-33966,36698,-22664,43941,17857,-16537,-12527,32372,-6581,28174,-182,20822,7005,-65315,-12300,-69790,38101,52769,-19725,17197,-61756,51545,-1086,-2179,24201]},"monthly":{"start":16374,"dateDeltas":[30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1026241,19475,-2053,27367,35664,1077,12417,-4073,-31269,14037,-57164,-11339,70645,14004,-41645,-43127,-13610,27166,-3964,11201,-924,24702,478,-1893,12087,23210,40154,2765,27064,8568,-2633,1656,-24639,-10156,-3932,20565,45475,-7455,-5818,13689,-46229,-18558,31379,27112,-5669,26836,8129,14026,-17761,-9930,-58048,41728,36831,43670,50044,-55703,37491,16609,-18382,17757,1734,13648,5763,1734,-78920,-65354,72877,20028,16611,-497,42278,-28165,-52301,78883,8092,-6552,18848,75938,5176,8227,40075,12133,20806,-44592,48004,-22822,37291,-7228,-55015,14275,-30784,-5420,-73185,74509,-25759,-53544,46174,24032,-58634,38998,5098,13785,20834,2401,36997,21664,-25070,-25126,-30925,52621,39913,48086,62042,41340,-33824,43984,42126,-31470,231,-1009,11543],"returnScale":1000000,"returns":[16643,19293,-2034,27111,35330,1067,12301,-4035,-30976,13905,-56629,-11233,69984,13873,-41255,-42724,-13482,26912,-3927,11096,-916,24471,474,-1875,11974,22993,39778,2739,26811,8488,-2608,1640,-24409,-10061,-3895,20373,45050,-7386,-5763,13561,-45797,-18384,31085,26859,-5616,26585,8053,13894,-17594,-9838,-57505,41338,36487,43261,49576,-55182,37140,16454,-18210,17591,1718,13520,5709,1718,-78182,-64743,72196,19840,16456,-492,41882,-27901,-51812,78145,8016,-6490,18671,75228,5128,8150,39700,12020,20611,-44175,47555,-22609,36943,-7161,-54500,14141,-30496,-5369,-72501,73813,-25519,-53043,45742,23808,-58086,38633,5051,13656,20639,2378,36651,21462,-24836,-24891,-30636,52129,39540,47636,61462,40953,-33507,43572,41732,-31175,228,-999,11435]}});
\ No newline at end of file
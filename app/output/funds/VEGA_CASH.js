@@ -0,0 +1 @@
+registerFundSeries("VEGA CASH", {"weekly":{"start":19085,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1000187,292,288,292,287,288,288,321,349,340,355,368,333,352,321,326,319,324,325,325,327,319,310,323,325,292,374,331,340,341,352,353,346,338,401,399,390,348,228,361,401,604,391,377,376,384,419,413,408,362,457,400,474,474,268,240,328,509,358,458,462,475,450,461,837,242,416,498,505,440,541,525,537,515,529,761,477,453,491,567,560,562,558,486,542,558,564,567,563,573,606,554,591,814,828,609,588,564,593,596,595,385,246,539,576,574,571,580,582,587,584,576,566,643,535,496,471,543,544,482,580,593,602,608,625,616,597,660,619,645,639,634],"returnScale":1000000,"returns":[187,292,288,292,287,288,288,321,349,340,355,368,333,352,321,326,319,324,325,325,327,319,310,323,325,292,374,331,340,341,352,353,346,338,401,399,390,348,228,361,401,604,391,377,376,384,419,413,408,362,457,400,474,474,268,240,328,509,358,458,462,475,450,461,837,242,416,498,505,440,541,525,537,515,529,761,477,453,491,567,560,562,558,486,542,558,564,567,563,573,606,554,591,814,828,609,588,564,593,596,595,385,246,539,576,574,571,580,582,587,584,576,566,643,535,496,471,543,544,482,580,593,602,608,625,616,597,660,619,645,639,634]},"lttb":{"start":19082,"dateDeltas":[1,2,1,3,2,1,2,1,3,2,2,1,2,2,2,2,1,3,1,2,2,1,3,1,3,1,2,2,2,1,3,1,2,1,2,3,1,2,2,2,1,2,2,3,1,2,1,3,1,2,2,1,2,3,2,1,2,2,2,1,3,1,2,2,2,1,2,3,1,2,2,2,1,3,1,2,2,2,2,2,1,2,2,2,1,2,3,2,1,2,2,1,3,2,1,2,3,2,1,2,2,3,1,2,3,1,2,2,2,2,2,1,2,2,2,2,1,3,2,1,1,3,1,3,2,2,1,1,2,2,2,2,2,1,3,2,2,2,1,2,1,3,2,1,2,2,2,2,1,3,2,1,2,2,1,3,2,1,2,2,2,2,2,1,2,2,2,2,2,1,2,2,2,2,1,2,2,2,1,2,2,2,2,2,1,2,2,2,3,1,1,3,2,1,2,2,2,2,2,1,3,1,2,2,2,2,2,1,2,2,2,2,1,3,1,2,1,3,2,2,1,2,2,1,2,2,2,2,2,2,1,3,1,2,2,2,2,1,2,2,2,2,1,2,2,2,2,1,2,2,2,2,2,2,1,2,2,2,2,2,2,1,3,2,1,2,2,2,2,2,1,2,2,1,3,2,1,2,2,2,1,3,2,1,1,3,2,1,3,1,1,2,2,3,2,2,1,1,2,3,1,3,1,2,2,1,2,2,2,1,2,2,3,1,2,2,1,2,3,1,3,1,1,2,3,1,2,2,1,3,1,2,2,2,2,2,2,1,3,1,2,2,1,3,2,1,2,1,2,2,3,2,1,2,1,2,2,2,3,1,2,2,1,2,3,1,2,1,2,2,2,2,1,2,2,3,2,1,2,1,3,2,1,2,2,1,2,2,2,2,2,1,2,3,2,1,2,2,2,2,1,2,2,2,1,2,2,2,2,2,1,2,2,3,2,1,2,2,2,1,3,1,2,2,2,2,2,2,1,2,2,2,2,2,1,1,3,2,2,1,3,1,1,3,1,2,2,2,2,2,1,3,1,2,2,1,3,2,2,2,1,1,3,1,3,2,1,1,2,2,3,2,1,1,2,2,3,2,2,1,2,1,2,3,1,2,2,1,2,2,3,1,1,2,3,1,3,2,1],"priceScale":10000,"prices":[1000000,105,82,41,128,82,41,82,42,123,82,82,46,82,82,82,82,41,123,42,82,82,42,123,41,123,42,107,87,91,48,158,46,97,58,93,142,52,110,97,96,58,99,118,140,46,95,53,139,45,108,99,53,94,138,89,51,94,90,91,51,135,44,89,93,92,47,92,139,47,93,93,92,47,139,50,92,93,92,93,136,-2,92,92,91,45,82,137,94,46,91,94,46,140,108,46,92,137,93,51,92,93,139,51,95,144,47,101,96,96,99,98,50,98,99,105,99,54,150,100,49,50,147,50,147,80,111,57,55,113,120,112,113,121,52,171,87,133,99,65,81,73,142,88,17,11,112,77,116,55,170,112,60,116,129,79,342,109,59,110,111,114,105,108,53,107,118,101,103,89,58,117,120,115,126,62,116,118,120,57,118,116,116,118,116,58,81,107,115,207,53,80,175,138,17,130,134,132,141,133,62,209,66,129,135,-74,149,146,153,-198,139,161,-15,46,204,69,195,79,163,114,49,62,137,138,43,146,125,129,140,130,134,82,194,65,134,121,132,126,61,126,142,137,212,217,270,143,221,9,-132,143,57,141,146,138,144,79,137,143,146,144,144,39,102,227,132,102,156,151,153,131,165,76,154,151,64,246,138,89,139,142,159,54,245,210,177,141,233,172,90,141,74,77,88,130,255,107,150,65,72,166,241,82,242,75,164,157,89,167,158,148,76,170,156,240,103,64,158,77,165,216,83,240,80,69,169,241,84,160,157,85,231,99,152,172,159,154,157,136,97,261,87,168,159,103,262,164,81,136,66,176,188,241,170,117,366,81,192,346,208,281,82,166,162,86,170,249,83,169,75,166,154,175,167,92,159,178,259,159,95,170,87,243,178,66,-21,162,91,85,-54,124,143,160,92,144,258,195,46,165,167,158,161,92,156,170,153,89,159,177,155,179,164,84,155,179,253,155,77,179,173,155,84,256,84,152,170,185,139,154,209,94,184,164,142,162,141,86,54,208,148,149,44,213,65,86,210,95,152,174,147,148,157,69,160,91,165,156,94,245,177,156,178,82,93,229,114,265,144,104,91,170,183,272,170,95,88,153,195,273,170,152,87,215,96,184,250,99,172,176,87,192,189,264,103,93,175,268,99,282,164,89],"returnScale":1000000,"returns":[0,105,82,41,128,82,41,82,42,123,82,82,46,82,82,82,82,41,123,42,82,82,42,123,41,123,42,107,87,91,48,158,46,97,58,93,142,52,110,97,96,58,99,118,140,46,95,53,139,45,108,99,53,94,138,89,51,94,90,91,51,135,44,89,93,92,47,92,139,47,93,93,92,47,139,50,92,93,92,93,136,-2,92,92,91,45,82,137,94,46,91,94,46,140,108,46,92,137,93,51,92,93,139,51,95,144,47,101,96,96,99,98,50,98,99,105,99,54,150,100,49,50,147,50,147,80,111,57,55,113,120,112,113,121,52,171,87,133,99,65,81,73,142,88,17,11,112,77,116,55,170,112,60,116,129,79,342,109,59,110,111,114,105,108,53,107,118,101,103,89,58,117,120,115,126,62,116,118,120,57,118,116,116,118,116,58,81,107,115,207,53,80,175,138,17,130,134,132,141,133,62,209,66,129,135,-74,149,146,153,-198,139,161,-15,46,204,69,195,79,163,114,49,62,137,138,43,146,125,129,140,130,134,82,194,65,134,121,132,126,61,126,142,137,212,217,270,143,221,9,-132,143,57,141,146,138,144,79,137,143,146,144,144,39,102,227,132,102,156,151,153,131,165,76,154,151,64,246,138,89,139,142,159,54,245,210,177,141,233,172,90,141,74,77,88,130,255,107,150,65,72,166,241,82,242,75,164,157,89,167,158,148,76,170,156,240,103,64,158,77,165,216,83,240,80,69,169,241,84,160,157,85,231,99,152,172,159,154,157,136,97,261,87,168,159,103,262,164,81,136,66,176,188,241,170,117,366,81,192,346,208,281,82,166,162,86,170,249,83,169,75,166,154,175,167,92,159,178,259,159,95,170,87,243,178,66,-21,162,91,85,-54,124,143,160,92,144,258,195,46,165,167,158,161,92,156,170,153,89,159,177,155,179,164,84,155,179,253,155,77,179,173,155,84,256,84,152,170,185,139,154,209,94,184,164,142,162,141,86,54,208,148,149,44,213,65,86,210,95,152,174,147,148,157,69,160,91,165,156,94,245,177,156,178,82,93,229,114,265,144,104,91,170,183,272,170,95,88,153,195,273,170,152,87,215,96,184,250,99,172,176,87,192,189,264,103,93,175,268,99,282,164,89]},"monthly":{"start":19082,"dateDeltas":[30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1000000,1305,1392,1491,1442,1433,1394,1507,1557,1500,1938,1600,1848,1447,2003,2310,1877,2323,2355,2506,2279,2547,3098,2437,1989,2486,2615,2207,2438,2722,2749,535],"returnScale":1000000,"returns":[0,1305,1392,1491,1442,1433,1394,1507,1557,1500,1938,1600,1848,1447,2003,2310,1877,2323,2355,2506,2279,2547,3098,2437,1989,2486,2615,2207,2438,2722,2749,535]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("VEGA FINANCE", {"weekly":{"start":19085,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[999721,8596,-10829,5527,-21332,-11252,7377,-14107,43294,-11837,-47501,-16159,22261,-24383,15520,-6808,24446,13347,8684,35690,-14577,-30763,323,24236,-1002,-46926,-39518,11022,11812,39966,36742,18377,20959,-3692,13983,-14664,-24031,-26061,23980,-2656,52098,17707,-10691,27167,280,13598,6977,-11461,9260,-81464,-101018,-17908,38327,-300,29127,19,-5198,-28415,1909,30519,4661,9974,5154,-6068,-24359,30866,-11917,9027,41933,14483,-10635,-2675,-24605,1403,22080,-15296,44348,-36227,-38,-14193,-427,-36224,-11200,45999,-9149,35654,-2471,34814,24501,29619,387,4302,14952,-29118,-2913,26828,2163,-23314,22778,14129,13486,18124,16008,27851,18009,-5031,-23473,12146,25474,-4687,28319,9307,-10676,548,-8075,-35547,7642,1473,18725,2965,-1783,7354,-69459,-612,38006,7616,14151,-33886,9930,20608,-1331,2967],"returnScale":1000000,"returns":[-279,8596,-10829,5527,-21332,-11252,7377,-14107,43294,-11837,-47501,-16159,22261,-24383,15520,-6808,24446,13347,8684,35690,-14577,-30763,323,24236,-1002,-46926,-39518,11022,11812,39966,36742,18377,20959,-3692,13983,-14664,-24031,-26061,23980,-2656,52098,17707,-10691,27167,280,13598,6977,-11461,9260,-81464,-101018,-17908,38327,-300,29127,19,-5198,-28415,1909,30519,4661,9974,5154,-6068,-24359,30866,-11917,9027,41933,14483,-10635,-2675,-24605,1403,22080,-15296,44348,-36227,-38,-14193,-427,-36224,-11200,45999,-9149,35654,-2471,34814,24501,29619,387,4302,14952,-29118,-2913,26828,2163,-23314,22778,14129,13486,18124,16008,27851,18009,-5031,-23473,12146,25474,-4687,28319,9307,-10676,548,-8075,-35547,7642,1473,18725,2965,-1783,7354,-69459,-612,38006,7616,14151,-33886,9930,20608,-1331,2967]},"lttb":{"start":19082,"dateDeltas":[1,2,2,2,1,3,1,1,2,2,3,2,1,1,2,2,2,2,2,2,2,1,4,1,3,1,1,3,1,2,2,2,1,2,3,2,1,2,1,3,2,1,3,2,1,1,2,2,3,1,2,2,2,2,2,1,2,1,2,2,2,2,3,1,2,2,2,1,2,2,2,2,2,2,1,2,1,2,2,2,2,2,1,2,2,2,2,2,2,1,2,2,3,2,1,1,2,2,3,2,1,1,2,3,2,2,1,2,2,2,1,2,2,2,2,2,2,2,2,1,2,2,1,3,2,1,2,1,2,3,2,2,1,1,2,2,2,3,1,1,2,3,1,2,2,1,3,2,2,2,2,1,1,3,1,3,2,1,2,1,2,2,2,2,1,3,1,2,3,2,1,1,3,2,1,3,1,2,1,3,2,2,1,2,1,2,2,2,3,1,1,2,2,3,2,1,1,2,3,2,1,2,2,2,2,1,3,2,1,1,3,1,2,2,2,1,2,2,2,2,2,2,2,2,2,1,2,1,2,3,2,2,2,1,2,2,2,2,2,1,1,2,2,2,3,1,1,2,3,2,1,2,2,2,1,3,2,2,1,2,1,3,2,2,1,1,2,3,1,2,3,1,1,3,2,2,2,1,2,2,2,1,3,1,2,1,2,2,2,2,2,2,2,2,2,1,2,2,2,2,1,3,1,1,2,3,1,3,1,1,2,2,2,3,1,2,2,2,2,2,2,1,2,1,3,1,3,1,2,1,3,1,3,2,1,2,2,2,2,3,1,2,2,1,2,2,2,2,1,2,3,2,1,2,2,2,2,2,2,1,1,3,2,2,1,2,2,2,2,2,1,2,2,1,3,1,2,2,2,1,3,1,3,1,2,2,2,1,2,3,1,1,3,1,2,3,2,1,2,2,1,3,1,2,2,2,1,2,2,2,2,1,2,3,2,2,1,2,2,2,2,1,2,2,2,1,3,2,1,1,3,1,3,2,1,2,2,2,2,2,1,2,1,2,3,1,3,1,1,3,2,1,2,2,2,2,2,2,1,2,2,2,1,2,3,1,2,1,3,1,2,3,1,2,2,2,2,2,1,2,1,3,1,3,1,2,1,2,3,1,3,1,2,1,3,2,2,1,2],"priceScale":10000,"prices":[1000000,-93,-186,-185,-1553,8341,408,-11225,3084,-2563,1460,24549,-18835,-93,-94,-23495,9315,-7061,-4749,24602,-30454,-742,-18976,23238,3206,4402,-12586,-5640,-374,25479,128,18373,-686,3600,-11671,-3674,5431,818,-26490,-27176,-18415,20501,-21406,2985,16481,-5778,-19743,31390,-3891,-27569,9666,-2678,-13555,24805,4358,-9020,3366,-25281,26884,-2845,26369,3093,-4926,-11468,11335,16956,-3566,-11659,11459,11414,-2530,2676,23857,9252,-2169,7944,-7664,-18216,5433,-16894,10899,-24677,-2013,2928,-12734,12142,-8881,5859,33197,-6030,15603,-24215,6516,4013,-23792,-5315,-26348,5610,-21049,-16530,-1939,12786,34126,-30704,-5186,-16060,28119,-677,430,33419,-9058,11778,3827,27024,-987,10799,-2135,2165,24065,-5812,7568,-11305,42126,-17333,-342,-12772,12152,-2827,-1085,13114,2052,-13565,17136,-6452,-7872,-4009,-27837,-1413,5219,4880,10268,-39649,-1560,2679,27472,-5799,-277,-297,3493,-5853,6653,41986,-10678,14243,3145,-2994,18363,-1007,2915,-15831,-12114,14439,9266,1702,15130,1072,-517,6603,-7953,-6634,23876,1490,-6717,6988,-3227,7190,-347,-1308,-14110,5493,-1536,12393,-21577,18617,-173,2135,-26864,-56325,-410,-92158,21655,-29325,-1190,41266,-65216,6042,18216,-814,17525,3400,-7696,-4471,11596,271,12869,-210,16652,-994,15392,-7570,-6809,2033,-21948,10455,4170,-2394,-20274,-33578,27828,2411,-2344,697,1056,4664,24578,1369,-92,10865,-14900,9502,-2131,-24604,36089,-186,-6595,17241,-4289,-1203,6314,-3300,-3336,-5653,559,-8831,-21219,7051,7055,-189,20460,12425,-12107,-19155,8541,1577,16506,5027,-14176,25002,15787,-1704,2848,8448,-1549,7683,-882,-9425,-13765,14052,5924,-18446,8507,626,-1787,-12769,-11004,955,-8590,13616,-4726,1103,22220,-6572,5300,977,-6237,-13244,4533,-193,21836,22859,-245,-10202,1223,-26347,-1003,-6364,-1896,10804,-2582,-29039,5213,11265,-8313,17100,-177,-14488,13039,4497,-48654,-1195,-92,-9490,10486,-12105,12511,3994,31080,-1677,-7479,-2414,838,3488,20082,-1129,14057,758,-9785,6307,-591,-3950,633,35103,3031,-1208,13024,12790,-206,3911,37022,-11208,3441,-6098,4459,-1521,-106,6285,-5212,3335,8515,-12524,17764,4209,-14466,-15389,-2170,-967,-10895,9053,-209,9576,10492,299,6461,15207,-24548,14457,-2953,-6095,-15778,-1335,11336,-11872,24321,-1006,-107,2873,8563,2802,-1940,8515,6963,-161,7874,9958,1965,-1673,14566,-4299,4778,963,13819,18467,-8005,2059,3088,14431,2001,-4947,6393,-7354,877,6408,-31139,-2448,3706,-12924,16727,7275,1068,25953,-2385,2024,-118,-13419,8967,-235,21356,304,8933,-2274,7647,-2966,4118,508,-1755,-12190,3510,545,-16050,6845,10931,-5205,-10659,7523,-1698,-9100,-7673,-23959,5185,14093,3767,-9984,-234,14421,-15041,2211,-118,24234,4069,-8359,-2863,6859,2883,-5014,4470,7524,-14887,991,12678,-12352,8107,-1079,4786,-2855,-71164,-21916,-4606,21757,4051,-347,5904,24457,7868,5866,-10891,11971,670,-2878,6250,11570,-791,-456,-11847,-21380,12812,-15936,8058,7316,-2523,7674,16798,-3864,-7650,-7780,13041,1058,-18155,-338,21014,446],"returnScale":1000000,"returns":[0,-93,-186,-185,-1553,8341,408,-11225,3084,-2563,1460,24549,-18835,-93,-94,-23495,9315,-7061,-4749,24602,-30454,-742,-18976,23238,3206,4402,-12586,-5640,-374,25479,128,18373,-686,3600,-11671,-3674,5431,818,-26490,-27176,-18415,20501,-21406,2985,16481,-5778,-19743,31390,-3891,-27569,9666,-2678,-13555,24805,4358,-9020,3366,-25281,26884,-2845,26369,3093,-4926,-11468,11335,16956,-3566,-11659,11459,11414,-2530,2676,23857,9252,-2169,7944,-7664,-18216,5433,-16894,10899,-24677,-2013,2928,-12734,12142,-8881,5859,33197,-6030,15603,-24215,6516,4013,-23792,-5315,-26348,5610,-21049,-16530,-1939,12786,34126,-30704,-5186,-16060,28119,-677,430,33419,-9058,11778,3827,27024,-987,10799,-2135,2165,24065,-5812,7568,-11305,42126,-17333,-342,-12772,12152,-2827,-1085,13114,2052,-13565,17136,-6452,-7872,-4009,-27837,-1413,5219,4880,10268,-39649,-1560,2679,27472,-5799,-277,-297,3493,-5853,6653,41986,-10678,14243,3145,-2994,18363,-1007,2915,-15831,-12114,14439,9266,1702,15130,1072,-517,6603,-7953,-6634,23876,1490,-6717,6988,-3227,7190,-347,-1308,-14110,5493,-1536,12393,-21577,18617,-173,2135,-26864,-56325,-410,-92158,21655,-29325,-1190,41266,-65216,6042,18216,-814,17525,3400,-7696,-4471,11596,271,12869,-210,16652,-994,15392,-7570,-6809,2033,-21948,10455,4170,-2394,-20274,-33578,27828,2411,-2344,697,1056,4664,24578,1369,-92,10865,-14900,9502,-2131,-24604,36089,-186,-6595,17241,-4289,-1203,6314,-3300,-3336,-5653,559,-8831,-21219,7051,7055,-189,20460,12425,-12107,-19155,8541,1577,16506,5027,-14176,25002,15787,-1704,2848,8448,-1549,7683,-882,-9425,-13765,14052,5924,-18446,8507,626,-1787,-12769,-11004,955,-8590,13616,-4726,1103,22220,-6572,5300,977,-6237,-13244,4533,-193,21836,22859,-245,-10202,1223,-26347,-1003,-6364,-1896,10804,-2582,-29039,5213,11265,-8313,17100,-177,-14488,13039,4497,-48654,-1195,-92,-9490,10486,-12105,12511,3994,31080,-1677,-7479,-2414,838,3488,20082,-1129,14057,758,-9785,6307,-591,-3950,633,35103,3031,-1208,13024,12790,-206,3911,37022,-11208,3441,-6098,4459,-1521,-106,6285,-5212,3335,8515,-12524,17764,4209,-14466,-15389,-2170,-967,-10895,9053,-209,9576,10492,299,6461,15207,-24548,14457,-2953,-6095,-15778,-1335,11336,-11872,24321,-1006,-107,2873,8563,2802,-1940,8515,6963,-161,7874,9958,1965,-1673,14566,-4299,4778,963,13819,18467,-8005,2059,3088,14431,2001,-4947,6393,-7354,877,6408,-31139,-2448,3706,-12924,16727,7275,1068,25953,-2385,2024,-118,-13419,8967,-235,21356,304,8933,-2274,7647,-2966,4118,508,-1755,-12190,3510,545,-16050,6845,10931,-5205,-10659,7523,-1698,-9100,-7673,-23959,5185,14093,3767,-9984,-234,14421,-15041,2211,-118,24234,4069,-8359,-2863,6859,2883,-5014,4470,7524,-14887,991,12678,-12352,8107,-1079,4786,-2855,-71164,-21916,-4606,21757,4051,-347,5904,24457,7868,5866,-10891,11971,670,-2878,6250,11570,-791,-456,-11847,-21380,12812,-15936,8058,7316,-2523,7674,16798,-3864,-7650,-7780,13041,1058,-18155,-338,21014,446]},"monthly":{"start":19082,"dateDeltas":[30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1000000,-18226,21050,-80436,53493,-6557,-55357,95562,55337,-47007,85773,22201,-165607,24059,-17255,39968,54271,-20081,-684,-49539,76414,74640,15037,24115,79831,-4303,38194,-36471,29192,-12110,-10718,8887],"returnScale":1000000,"returns":[0,-18226,21050,-80436,53493,-6557,-55357,95562,55337,-47007,85773,22201,-165607,24059,-17255,39968,54271,-20081,-684,-49539,76414,74640,15037,24115,79831,-4303,38194,-36471,29192,-12110,-10718,8887]}});
\ No newline at end of file
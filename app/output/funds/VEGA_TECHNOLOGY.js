@@ -0,0 +1 @@
+registerFundSeries("VEGA TECHNOLOGY", {"weekly":{"start":19085,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[999721,-22619,-38152,-41315,-108,-11119,-2671,-52087,38125,-384,-39506,-24858,54703,-52711,55892,-8439,31990,20542,34223,9706,-15660,-31863,-34149,25827,-34276,-27742,-29772,1608,-26284,46421,-761,-33804,54863,-10562,6828,11472,-41939,-31739,-24278,-4079,24088,28401,9530,50214,32410,-7593,5048,-17038,26774,-31742,53099,8139,21797,-18591,-7037,-8993,4790,14986,18280,52153,68504,7446,-2897,22880,-19111,19600,-16575,17385,-13947,41969,-40010,-35785,-3727,21350,57670,-1137,-15012,-42546,14292,27467,2769,-47608,-26891,66991,44007,6133,-6775,10919,17124,26141,7273,4263,-25998,44855,62828,18243,22126,51089,-23696,6725,58879,-15123,-24980,31549,-6412,6850,832,-57421,32886,5961,3677,29563,15689,-30328,24289,71405,-632,1064,38510,-12180,-76411,-36423,-61717,13191,75012,-5669,4647,-103107,105676,30693,20354,21287],"returnScale":1000000,"returns":[-279,-22619,-38152,-41315,-108,-11119,-2671,-52087,38125,-384,-39506,-24858,54703,-52711,55892,-8439,31990,20542,34223,9706,-15660,-31863,-34149,25827,-34276,-27742,-29772,1608,-26284,46421,-761,-33804,54863,-10562,6828,11472,-41939,-31739,-24278,-4079,24088,28401,9530,50214,32410,-7593,5048,-17038,26774,-31742,53099,8139,21797,-18591,-7037,-8993,4790,14986,18280,52153,68504,7446,-2897,22880,-19111,19600,-16575,17385,-13947,41969,-40010,-35785,-3727,21350,57670,-1137,-15012,-42546,14292,27467,2769,-47608,-26891,66991,44007,6133,-6775,10919,17124,26141,7273,4263,-25998,44855,62828,18243,22126,51089,-23696,6725,58879,-15123,-24980,31549,-6412,6850,832,-57421,32886,5961,3677,29563,15689,-30328,24289,71405,-632,1064,38510,-12180,-76411,-36423,-61717,13191,75012,-5669,4647,-103107,105676,30693,20354,21287]},"lttb":{"start":19082,"dateDeltas":[1,2,2,2,1,2,2,1,2,2,2,3,1,2,1,2,2,3,1,1,4,2,1,2,2,1,2,2,3,1,2,2,2,2,1,2,3,1,1,3,2,1,2,2,2,2,2,1,3,1,2,1,3,2,2,2,1,1,3,2,1,2,2,1,2,3,2,2,1,2,2,1,3,1,2,2,1,2,2,2,2,1,3,2,2,2,2,1,2,2,2,1,3,1,2,1,3,2,2,1,1,2,3,2,2,1,1,3,1,2,3,2,1,2,2,1,3,1,2,2,2,2,1,3,1,2,1,2,2,2,2,2,1,2,2,2,2,2,2,1,3,3,2,1,1,3,2,1,2,2,2,1,2,3,1,2,1,3,2,1,3,1,2,2,2,1,2,3,1,1,3,2,2,1,2,2,2,2,1,2,2,1,2,3,1,2,2,2,2,1,2,3,1,1,3,2,1,2,2,2,1,3,2,2,1,2,2,1,2,3,2,1,1,2,2,2,2,2,2,1,2,2,2,2,2,2,2,2,2,2,1,1,3,2,1,2,2,1,3,2,2,2,1,1,3,1,2,2,2,2,2,2,2,2,1,2,2,2,2,2,1,2,2,2,1,2,3,1,2,2,2,1,3,1,2,1,2,2,2,2,2,1,3,2,1,3,1,1,2,2,3,2,1,2,2,2,2,2,1,1,2,2,3,2,2,1,1,3,2,2,2,1,2,2,2,1,2,2,2,1,3,1,2,2,2,1,2,2,3,1,1,3,1,2,2,2,2,2,2,2,2,1,2,2,1,3,2,1,2,2,2,1,2,2,2,1,2,2,3,2,2,1,2,1,3,1,3,1,2,2,2,2,1,2,2,1,2,3,2,1,1,3,1,2,2,2,1,3,2,2,2,1,2,2,1,3,2,2,1,1,2,3,1,3,1,1,3,2,2,2,1,2,2,1,2,3,2,1,1,3,2,2,2,1,1,2,2,3,1,2,1,3,1,3,2,1,1,2,3,2,1,2,2,1,2,3,2,1,2,2,1,2,2,2,2,1,2,3,2,1,2,2,2,2,2,1,2,1,3,1,3,2,2,1,2,1,2,3,2,2,2,2,1,2,3,1,1,3,2,1,3,1,1,2,3,2,2,1,2],"priceScale":10000,"prices":[1000000,-93,-186,-185,-11118,-14124,2808,-39484,25503,-28243,4072,22716,-63864,-83,9330,-33043,57090,-33486,21719,27641,-47722,-53464,51743,-66568,52860,-19107,20953,-44433,-9505,-14118,9574,44184,-1592,-1376,24080,-20802,-2286,7922,-21904,-25370,-33011,37931,-36604,6747,734,11343,44724,-2173,-6124,-48468,4168,-2287,-367,56360,-21,-24246,2539,-3150,20021,-6221,33516,21904,-20809,-4643,-23585,43705,4982,12386,32412,-6942,-3633,-22422,25013,7203,-88,4077,-6970,-20340,7573,-19559,25370,-37590,-84,-24988,-9647,486,-3455,19548,20388,-10654,-37376,7982,-7004,6986,-10188,-20131,-9692,49,20849,-40130,-3060,-75,47163,-49717,4162,-17872,226,12775,-21413,22419,-1819,25897,1276,17360,-42278,22882,-77,-38158,-10443,14871,9962,-25516,97145,-26724,15048,-26160,4142,-3592,-10090,33423,-19257,2674,-23514,48485,-6822,-6677,-43366,6412,-4909,7915,11863,-51255,-12112,11776,-23871,-530,51,-21283,20635,-3291,819,19105,-14734,18900,10496,7987,11911,-1991,2362,-17317,23708,27580,-5639,19928,9128,-22024,9870,61044,-16560,-12394,29792,-30579,5588,23145,3565,-27004,5342,-20074,13476,-13297,2857,5375,-11070,33388,-2220,-12782,-146,-17431,1356,16806,45025,-10084,5815,-13128,16198,-832,-13856,14695,20235,723,-7191,-15787,4474,1904,-13658,12769,-8053,-801,3382,-10069,-1591,-29912,2477,21430,10881,175,-13875,24304,4296,1686,16062,-2296,2828,13338,38119,790,6801,-17581,80865,-1675,4430,-16549,17154,2411,8048,-19948,13156,-4153,25989,24301,-27307,-294,-22296,8660,-14829,-2826,16994,-2353,17433,3497,-8067,-12919,811,4785,35509,-19070,-3839,11448,-33111,7818,2216,12508,3904,23344,1997,2305,-35356,-9061,9063,-29537,-16495,1184,18130,-26550,1952,2741,24279,16371,-21953,2653,34363,11431,9804,2387,10215,-14263,2596,9857,-20922,13172,-17014,-7134,-43966,9695,-1246,-12413,29004,-2198,9177,-15912,21301,16516,-3716,18280,-24328,8817,11514,-7996,-47797,-3329,15441,-55034,12968,-266,9104,58354,3767,-4234,10828,6900,25666,-1135,26585,-19800,1204,13182,-15528,-778,-3652,-1722,4851,-280,7963,-17457,-1493,36295,-221,16997,16204,-6947,5995,-14258,21492,-5956,-227,12032,-13345,5690,-114,-33546,4968,2694,33045,12515,-5449,4744,-197,8657,54611,-1324,28718,-11361,2090,12751,-5088,-172751,187216,5186,24542,23007,-1771,-34976,27933,-14062,-2591,-20832,-14208,41092,3914,-8262,24893,37980,3719,-24962,39064,-31785,-16416,23173,-34216,2347,6219,24773,-6516,7073,-7108,-1483,2312,10943,4535,-16717,7220,736,-11063,12705,-810,-17155,859,-42863,1738,28568,-7025,11165,178,-18605,-8374,33203,14056,-13000,-799,7041,-5090,34035,-5004,1738,7501,-2969,-1138,12431,6466,-8070,-25396,-3331,567,28152,-4428,9143,23231,29393,-886,28516,-5149,-12053,-1416,-15374,10191,11410,-5304,19574,14022,7586,-2672,8679,10108,-27241,-3726,-666,-50627,-28855,21002,-50157,-14116,10719,-2114,26322,-85802,-257,-31538,-9027,46152,7604,2620,67457,5071,15454,-8921,-31371,17668,1365,-37223,42107,-237,-47978,-3683,-50508,-938,85905,11606,15843,-4880,-13482,43675,-2298,2832,12786,18073,-13337,-29165,22498,27262,692],"returnScale":1000000,"returns":[0,-93,-186,-185,-11118,-14124,2808,-39484,25503,-28243,4072,22716,-63864,-83,9330,-33043,57090,-33486,21719,27641,-47722,-53464,51743,-66568,52860,-19107,20953,-44433,-9505,-14118,9574,44184,-1592,-1376,24080,-20802,-2286,7922,-21904,-25370,-33011,37931,-36604,6747,734,11343,44724,-2173,-6124,-48468,4168,-2287,-367,56360,-21,-24246,2539,-3150,20021,-6221,33516,21904,-20809,-4643,-23585,43705,4982,12386,32412,-6942,-3633,-22422,25013,7203,-88,4077,-6970,-20340,7573,-19559,25370,-37590,-84,-24988,-9647,486,-3455,19548,20388,-10654,-37376,7982,-7004,6986,-10188,-20131,-9692,49,20849,-40130,-3060,-75,47163,-49717,4162,-17872,226,12775,-21413,22419,-1819,25897,1276,17360,-42278,22882,-77,-38158,-10443,14871,9962,-25516,97145,-26724,15048,-26160,4142,-3592,-10090,33423,-19257,2674,-23514,48485,-6822,-6677,-43366,6412,-4909,7915,11863,-51255,-12112,11776,-23871,-530,51,-21283,20635,-3291,819,19105,-14734,18900,10496,7987,11911,-1991,2362,-17317,23708,27580,-5639,19928,9128,-22024,9870,61044,-16560,-12394,29792,-30579,5588,23145,3565,-27004,5342,-20074,13476,-13297,2857,5375,-11070,33388,-2220,-12782,-146,-17431,1356,16806,45025,-10084,5815,-13128,16198,-832,-13856,14695,20235,723,-7191,-15787,4474,1904,-13658,12769,-8053,-801,3382,-10069,-1591,-29912,2477,21430,10881,175,-13875,24304,4296,1686,16062,-2296,2828,13338,38119,790,6801,-17581,80865,-1675,4430,-16549,17154,2411,8048,-19948,13156,-4153,25989,24301,-27307,-294,-22296,8660,-14829,-2826,16994,-2353,17433,3497,-8067,-12919,811,4785,35509,-19070,-3839,11448,-33111,7818,2216,12508,3904,23344,1997,2305,-35356,-9061,9063,-29537,-16495,1184,18130,-26550,1952,2741,24279,16371,-21953,2653,34363,11431,9804,2387,10215,-14263,2596,9857,-20922,13172,-17014,-7134,-43966,9695,-1246,-12413,29004,-2198,9177,-15912,21301,16516,-3716,18280,-24328,8817,11514,-7996,-47797,-3329,15441,-55034,12968,-266,9104,58354,3767,-4234,10828,6900,25666,-1135,26585,-19800,1204,13182,-15528,-778,-3652,-1722,4851,-280,7963,-17457,-1493,36295,-221,16997,16204,-6947,5995,-14258,21492,-5956,-227,12032,-13345,5690,-114,-33546,4968,2694,33045,12515,-5449,4744,-197,8657,54611,-1324,28718,-11361,2090,12751,-5088,-172751,187216,5186,24542,23007,-1771,-34976,27933,-14062,-2591,-20832,-14208,41092,3914,-8262,24893,37980,3719,-24962,39064,-31785,-16416,23173,-34216,2347,6219,24773,-6516,7073,-7108,-1483,2312,10943,4535,-16717,7220,736,-11063,12705,-810,-17155,859,-42863,1738,28568,-7025,11165,178,-18605,-8374,33203,14056,-13000,-799,7041,-5090,34035,-5004,1738,7501,-2969,-1138,12431,6466,-8070,-25396,-3331,567,28152,-4428,9143,23231,29393,-886,28516,-5149,-12053,-1416,-15374,10191,11410,-5304,19574,14022,7586,-2672,8679,10108,-27241,-3726,-666,-50627,-28855,21002,-50157,-14116,10719,-2114,26322,-85802,-257,-31538,-9027,46152,7604,2620,67457,5071,15454,-8921,-31371,17668,1365,-37223,42107,-237,-47978,-3683,-50508,-938,85905,11606,15843,-4880,-13482,43675,-2298,2832,12786,18073,-13337,-29165,22498,27262,692]},"monthly":{"start":19082,"dateDeltas":[30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1000000,-102390,-29211,-63261,101866,-28582,-71989,6460,53685,-115464,100089,30276,71969,-29108,141804,35326,35645,-14480,-32426,-35260,104208,62764,76869,99175,24041,-35458,46631,92662,-62162,1259,52841,21925],"returnScale":1000000,"returns":[0,-102390,-29211,-63261,101866,-28582,-71989,6460,53685,-115464,100089,30276,71969,-29108,141804,35326,35645,-14480,-32426,-35260,104208,62764,76869,99175,24041,-35458,46631,92662,-62162,1259,52841,21925]}});
\ No newline at end of file
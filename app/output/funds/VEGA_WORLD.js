@@ -0,0 +1 @@
+registerFundSeries("VEGA WORLD", {"weekly":{"start":19085,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[999721,7005,-557,-20873,3053,-17718,6736,-38532,32243,-1994,-37974,-22093,39060,-17991,32513,-2343,9739,23774,2333,9807,5171,-25495,-18138,36539,-38906,-34266,-21636,17311,1731,35863,26641,31550,29377,-16110,9806,11166,-32297,-27663,3679,-5137,46133,10594,-11872,17102,-3889,188,-787,-33287,41091,-66810,-17123,4446,33905,-15309,-372,-15200,-5252,-13348,-2557,15334,-10220,23477,2470,17631,-26513,15605,-14563,4384,9099,27599,-20985,-10950,-22305,-3026,20715,-14701,8734,-37172,2031,-8368,-201,-40231,-14662,39389,-6679,18259,7957,21801,15704,26773,-8433,7850,-10926,-12675,-13573,11853,-1274,3941,10088,3631,6364,-6595,2873,10377,11278,-14193,2437,-16687,15674,364,7292,19239,-13798,-2415,-4277,964,10166,-2307,17529,-1888,-27550,-12753,-30388,-2142,49342,4027,3981,-43818,34517,4155,35119,11851],"returnScale":1000000,"returns":[-279,7005,-557,-20873,3053,-17718,6736,-38532,32243,-1994,-37974,-22093,39060,-17991,32513,-2343,9739,23774,2333,9807,5171,-25495,-18138,36539,-38906,-34266,-21636,17311,1731,35863,26641,31550,29377,-16110,9806,11166,-32297,-27663,3679,-5137,46133,10594,-11872,17102,-3889,188,-787,-33287,41091,-66810,-17123,4446,33905,-15309,-372,-15200,-5252,-13348,-2557,15334,-10220,23477,2470,17631,-26513,15605,-14563,4384,9099,27599,-20985,-10950,-22305,-3026,20715,-14701,8734,-37172,2031,-8368,-201,-40231,-14662,39389,-6679,18259,7957,21801,15704,26773,-8433,7850,-10926,-12675,-13573,11853,-1274,3941,10088,3631,6364,-6595,2873,10377,11278,-14193,2437,-16687,15674,364,7292,19239,-13798,-2415,-4277,964,10166,-2307,17529,-1888,-27550,-12753,-30388,-2142,49342,4027,3981,-43818,34517,4155,35119,11851]},"lttb":{"start":19082,"dateDeltas":[1,2,2,1,3,1,2,2,1,3,2,2,1,2,1,2,2,3,1,2,2,1,3,1,3,1,1,3,2,2,2,2,1,2,1,2,3,1,2,2,1,2,2,3,1,2,1,3,1,2,2,2,1,2,3,1,3,1,2,2,1,2,3,1,2,1,2,2,2,2,3,1,1,3,2,1,2,2,1,3,1,3,2,2,1,2,2,2,1,2,2,1,2,2,2,2,3,1,1,2,2,2,3,1,1,2,2,3,2,1,1,2,3,2,2,2,1,1,2,2,3,2,1,1,3,2,2,1,2,2,2,2,1,2,2,2,2,1,2,3,1,3,1,2,1,2,2,2,2,2,2,1,2,3,1,2,2,2,1,2,3,1,2,2,2,1,2,2,2,2,1,2,3,1,2,1,3,1,3,2,1,2,2,2,2,1,2,2,2,1,2,2,2,3,1,2,1,3,2,1,2,2,2,2,1,2,2,2,1,2,3,2,2,1,2,2,1,2,3,1,2,2,2,2,1,3,1,2,1,3,2,2,1,2,1,2,3,2,2,1,1,2,2,2,3,1,1,2,3,2,1,3,1,2,1,2,3,1,2,2,2,2,2,2,2,1,2,2,2,2,1,2,2,2,1,2,3,2,1,2,2,1,2,3,1,2,2,2,1,3,1,2,1,3,2,2,1,2,2,2,1,3,1,2,1,3,1,3,1,3,1,2,2,2,2,1,2,2,2,1,3,2,1,2,2,1,3,2,1,2,2,2,2,2,1,3,1,2,1,3,1,2,2,2,2,2,1,2,2,2,1,2,3,1,3,1,1,2,3,2,1,3,1,2,2,1,2,2,2,1,3,2,2,2,1,2,1,3,2,2,1,2,1,2,2,3,1,2,2,2,2,1,2,2,2,2,1,3,1,3,1,1,3,1,2,3,1,2,2,2,1,3,2,1,1,3,2,2,2,1,2,2,1,3,2,1,2,2,1,2,3,1,2,2,2,2,2,1,2,2,1,3,1,3,1,2,2,1,2,2,2,3,1,1,2,2,3,2,2,1,2,1,2,2,2,2,2,1,3,1,3,2,1,1,2,2,3,1,2,2,2,2,1,2,2,2,1,2,3,1,2,2,1,3,2,2,2,1,2],"priceScale":10000,"prices":[1000000,-93,-186,-185,3677,3592,-79,-10883,11279,-2545,-27,9870,-28941,-91,4075,-26285,37312,-12049,-2994,19571,-33655,-732,-23292,-4159,33080,-8348,8820,-32636,-5174,9813,-5359,28702,-1000,2521,-8528,11783,-7680,5693,-4886,-38698,-173,-22283,23152,-18052,-4078,12934,-439,27229,-2497,-19940,-5628,8665,212,-9007,38937,2284,-11376,-9081,21869,-3755,15148,-7445,639,5748,-12845,26564,10415,-4711,-6271,13928,-5232,-4548,10278,-4724,8709,14691,-5362,-11557,7399,-14882,15103,-23273,-5147,-14864,-742,262,-5424,17540,34937,-10511,6095,-44855,5448,-5597,7596,-34643,-16337,-1763,10397,20628,-38572,-3298,52032,-38955,4321,-87,7787,10868,-16924,21733,-14805,1356,27669,24494,-16594,18743,-4286,8098,-18529,55756,-9581,-6308,64490,-28707,-98,-26375,14371,-4106,-3992,21043,-9617,2372,-14095,27044,4295,-6078,-30565,9755,-9876,-1611,13801,-35431,-6033,-8441,26112,-16820,2921,-186,-10465,6824,-1403,6806,24171,15350,-3434,463,15041,-1572,2828,-3229,-21745,10176,11976,3592,-133,1667,-11383,20410,-16024,3108,8385,-7525,-6150,13461,1411,-9043,-5671,5873,-14859,-22619,2851,7850,5531,28381,-671,-29647,-783,-34664,-1716,-990,-24558,10742,-2317,21906,-27139,9771,3002,7871,22377,563,328,-20176,3295,1244,13635,-11689,-2133,-185,4135,-1940,-17212,938,-28682,18334,4067,-1435,-19954,-10598,18637,-4482,1479,-1989,2345,1547,15831,-2165,-275,-6915,-14317,12633,-1823,-13012,37272,-93,-4755,6530,7096,-6493,20397,10956,-3674,-9954,-1349,-16121,-16319,7627,10649,-6201,7756,9030,-8765,-18197,6325,7540,10971,6358,-20393,4288,-1071,892,4898,8870,4922,13903,4133,-25460,2816,-2477,3063,-1995,-13036,1017,-1117,-16946,-6319,2076,3313,-10267,3927,-90,23651,-9978,5466,1576,-7463,-8752,1605,5565,-5206,10287,-2003,-9660,-12642,-16586,1716,-11793,13330,4416,-3922,-17440,542,11242,-5085,17794,-9920,-12118,14068,960,-46763,-1997,5984,-12525,-7699,-505,9652,30931,1740,-2934,-6940,-5184,5073,3679,27018,-16453,4474,7250,-5076,6844,-1148,-5783,5280,18665,3639,-9449,15636,9700,7273,-3812,28964,-3826,-7312,13077,-10374,-5740,-186,9840,-6271,4468,-188,-11333,-1336,1929,2595,-13638,-4868,2029,-13526,-6174,7422,-1495,11992,-4654,5830,5832,-8874,6029,-4169,-6269,17869,-6515,-1144,-9436,21092,-1567,852,-9724,14184,-2293,-4412,-473,11508,354,101,-11449,10308,-5555,5505,2652,-7017,1639,3646,12595,-10987,5123,-4872,14048,2197,-95,53,-12754,-1492,5695,1902,-10688,5622,-1779,-7904,-8837,1739,13212,-5330,7521,8628,-24810,10724,6281,7479,-6646,9598,-3327,4785,7285,6054,1212,861,-17416,2850,-190,170,-12889,12968,-4587,-5251,11935,-8944,1682,8001,-15895,7176,5585,-1705,5820,372,9686,-4266,-6766,-961,3010,12556,3764,-1801,-14732,15130,-2189,-97,-2634,-26733,1817,1864,-20480,6785,-922,-1593,12988,-41602,-181,-26708,23083,1158,2307,28411,18024,925,8558,-6735,-10645,12944,562,-12856,16616,-436,-18822,-4739,-19803,-454,7745,28394,2550,-4172,-3280,18770,-11240,1122,16986,17147,-231,-5466,1126,15829,362],"returnScale":1000000,"returns":[0,-93,-186,-185,3677,3592,-79,-10883,11279,-2545,-27,9870,-28941,-91,4075,-26285,37312,-12049,-2994,19571,-33655,-732,-23292,-4159,33080,-8348,8820,-32636,-5174,9813,-5359,28702,-1000,2521,-8528,11783,-7680,5693,-4886,-38698,-173,-22283,23152,-18052,-4078,12934,-439,27229,-2497,-19940,-5628,8665,212,-9007,38937,2284,-11376,-9081,21869,-3755,15148,-7445,639,5748,-12845,26564,10415,-4711,-6271,13928,-5232,-4548,10278,-4724,8709,14691,-5362,-11557,7399,-14882,15103,-23273,-5147,-14864,-742,262,-5424,17540,34937,-10511,6095,-44855,5448,-5597,7596,-34643,-16337,-1763,10397,20628,-38572,-3298,52032,-38955,4321,-87,7787,10868,-16924,21733,-14805,1356,27669,24494,-16594,18743,-4286,8098,-18529,55756,-9581,-6308,64490,-28707,-98,-26375,14371,-4106,-3992,21043,-9617,2372,-14095,27044,4295,-6078,-30565,9755,-9876,-1611,13801,-35431,-6033,-8441,26112,-16820,2921,-186,-10465,6824,-1403,6806,24171,15350,-3434,463,15041,-1572,2828,-3229,-21745,10176,11976,3592,-133,1667,-11383,20410,-16024,3108,8385,-7525,-6150,13461,1411,-9043,-5671,5873,-14859,-22619,2851,7850,5531,28381,-671,-29647,-783,-34664,-1716,-990,-24558,10742,-2317,21906,-27139,9771,3002,7871,22377,563,328,-20176,3295,1244,13635,-11689,-2133,-185,4135,-1940,-17212,938,-28682,18334,4067,-1435,-19954,-10598,18637,-4482,1479,-1989,2345,1547,15831,-2165,-275,-6915,-14317,12633,-1823,-13012,37272,-93,-4755,6530,7096,-6493,20397,10956,-3674,-9954,-1349,-16121,-16319,7627,10649,-6201,7756,9030,-8765,-18197,6325,7540,10971,6358,-20393,4288,-1071,892,4898,8870,4922,13903,4133,-25460,2816,-2477,3063,-1995,-13036,1017,-1117,-16946,-6319,2076,3313,-10267,3927,-90,23651,-9978,5466,1576,-7463,-8752,1605,5565,-5206,10287,-2003,-9660,-12642,-16586,1716,-11793,13330,4416,-3922,-17440,542,11242,-5085,17794,-9920,-12118,14068,960,-46763,-1997,5984,-12525,-7699,-505,9652,30931,1740,-2934,-6940,-5184,5073,3679,27018,-16453,4474,7250,-5076,6844,-1148,-5783,5280,18665,3639,-9449,15636,9700,7273,-3812,28964,-3826,-7312,13077,-10374,-5740,-186,9840,-6271,4468,-188,-11333,-1336,1929,2595,-13638,-4868,2029,-13526,-6174,7422,-1495,11992,-4654,5830,5832,-8874,6029,-4169,-6269,17869,-6515,-1144,-9436,21092,-1567,852,-9724,14184,-2293,-4412,-473,11508,354,101,-11449,10308,-5555,5505,2652,-7017,1639,3646,12595,-10987,5123,-4872,14048,2197,-95,53,-12754,-1492,5695,1902,-10688,5622,-1779,-7904,-8837,1739,13212,-5330,7521,8628,-24810,10724,6281,7479,-6646,9598,-3327,4785,7285,6054,1212,861,-17416,2850,-190,170,-12889,12968,-4587,-5251,11935,-8944,1682,8001,-15895,7176,5585,-1705,5820,372,9686,-4266,-6766,-961,3010,12556,3764,-1801,-14732,15130,-2189,-97,-2634,-26733,1817,1864,-20480,6785,-922,-1593,12988,-41602,-181,-26708,23083,1158,2307,28411,18024,925,8558,-6735,-10645,12944,562,-12856,16616,-436,-18822,-4739,-19803,-454,7745,28394,2550,-4172,-3280,18770,-11240,1122,16986,17147,-231,-5466,1126,15829,362]},"monthly":{"start":19082,"dateDeltas":[30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1000000,-11559,-20203,-46730,72261,-25752,-55541,74054,71766,-63109,57114,-23872,-14206,-35570,-24401,43324,33704,-47822,-33978,-53898,51251,61718,-28363,21050,22675,-19914,20491,1882,-13267,13521,24800,16928],"returnScale":1000000,"returns":[0,-11559,-20203,-46730,72261,-25752,-55541,74054,71766,-63109,57114,-23872,-14206,-35570,-24401,43324,33704,-47822,-33978,-53898,51251,61718,-28363,21050,22675,-19914,20491,1882,-13267,13521,24800,16928]}});
\ No newline at end of file
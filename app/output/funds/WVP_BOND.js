@@ -0,0 +1 @@
+registerFundSeries("WVP BOND", {"weekly":{"start":17188,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[998199,4419,1177,-97,-1008,2641,22,-2047,1257,2484,1410,1363,-1066,635,702,-1195,1009,-2583,2721,4340,1610,1761,47,-2709,-2688,1795,-509,362,-257,511,1860,2506,1181,927,1141,-675,859,2351,-154,858,2014,611,-1274,-12,3143,3141,1756,-523,433,61,1969,1820,3535,-1351,-1369,174,1235,2260,-1711,408,-849,-480,2074,632,-10909,-3437,6750,-1339,4926,2720,5263,823,-3353,770,-418,76,-2472,7487,-4386,6438,-112,-3773,614,-3757,-2970,-2712,2243,2350,6692,96,-1545,1890,2174,-269,468,177,-1773,-401,265,4588,-6410,-1114,4202,567,9762,11596,1209,4085,2370,726,49,2894,2143,3339,3864,497,-623,3427,2460,-459,-3574,2925,1735,-645,1194,473,6874,-348,4773,-111,2032,6313,911,-4828,2693,2864,3827,2927,-2752,2840,-664,-2564,-1202,-2333,2415,702,3195,86,-928,4215,-2573,2451,3806,153,343,3267,1854,3566,-800,3506,4004,154,-13072,-8886,-35272,-24102,9721,1666,13770,4889,380,2471,1959,3778,9226,2184,11534,-8661,7005,-2681,1339,311,-298,4723,-7507,4709,1835,194,-1163,3932,271,153,-2836,529,4855,1309,-1688,-762,6719,8177,1798,2092,-1824,864,-238,1299,-1864,-401,3039,-242,1180,6359,-2131,-2496,-3967,3467,368,769,-150,-580,422,957,-1007,-1371,3707,-3117,-812,3712,3593,3803,2756,-351,1795,-2754,1691,1288,-2573,1696,1215,2210,-1159,-858,2272,2304,-1845,-729,362,565,-1188,170,6706,-475,3428,-8432,3194,2662,-3620,-405,1055,-2510,-6567,2492,2598,-3728,-8279,-407,-6742,-26309,-5741,7618,-975,-3624,602,-3208,-6908,777,-5503,2895,-7315,2670,-2878,-17964,-7808,-286,-4316,4258,-7203,11799,11629,7411,12606,-1092,452,-6542,1673,-5897,-10878,-19433,-2268,-3895,651,17352,5006,9709,5164,8030,5327,-1470,-8122,-4688,-3589,4266,5109,2156,4507,3392,-5349,-4480,-2738,-1392,3433,-4754,1668,1617,2051,-3701,-4002,-165,-536,5297,-2489,-1091,6852,1079,1656,3521,-1529,-5591,7146,4140,5887,-1047,803,1368,2878,1978,2848,988,-1487,-7709,-5363,3557,-2667,2201,7405,1868,5073,2383,7269,6049,7588,3563,1294,-1430,3300,4995,3999,4176,794,-254,-389,-248,2621,-1971,2510,440,-187,2453,-1529,-438,3213,-2559,4624,-1116,907,-686,610,-565,-114,659,2986,612,462,3270,-1936,2849,6753,934,1685,2073,2719,1425,1526],"returnScale":1000000,"returns":[-1801,4419,1177,-97,-1008,2641,22,-2047,1257,2484,1410,1363,-1066,635,702,-1195,1009,-2583,2721,4340,1610,1761,47,-2709,-2688,1795,-509,362,-257,511,1860,2506,1181,927,1141,-675,859,2351,-154,858,2014,611,-1274,-12,3143,3141,1756,-523,433,61,1969,1820,3535,-1351,-1369,174,1235,2260,-1711,408,-849,-480,2074,632,-10909,-3437,6750,-1339,4926,2720,5263,823,-3353,770,-418,76,-2472,7487,-4386,6438,-112,-3773,614,-3757,-2970,-2712,2243,2350,6692,96,-1545,1890,2174,-269,468,177,-1773,-401,265,4588,-6410,-1114,4202,567,9762,11596,1209,4085,2370,726,49,2894,2143,3339,3864,497,-623,3427,2460,-459,-3574,2925,1735,-645,1194,473,6874,-348,4773,-111,2032,6313,911,-4828,2693,2864,3827,2927,-2752,2840,-664,-2564,-1202,-2333,2415,702,3195,86,-928,4215,-2573,2451,3806,153,343,3267,1854,3566,-800,3506,4004,154,-13072,-8886,-35272,-24102,9721,1666,13770,4889,380,2471,1959,3778,9226,2184,11534,-8661,7005,-2681,1339,311,-298,4723,-7507,4709,1835,194,-1163,3932,271,153,-2836,529,4855,1309,-1688,-762,6719,8177,1798,2092,-1824,864,-238,1299,-1864,-401,3039,-242,1180,6359,-2131,-2496,-3967,3467,368,769,-150,-580,422,957,-1007,-1371,3707,-3117,-812,3712,3593,3803,2756,-351,1795,-2754,1691,1288,-2573,1696,1215,2210,-1159,-858,2272,2304,-1845,-729,362,565,-1188,170,6706,-475,3428,-8432,3194,2662,-3620,-405,1055,-2510,-6567,2492,2598,-3728,-8279,-407,-6742,-26309,-5741,7618,-975,-3624,602,-3208,-6908,777,-5503,2895,-7315,2670,-2878,-17964,-7808,-286,-4316,4258,-7203,11799,11629,7411,12606,-1092,452,-6542,1673,-5897,-10878,-19433,-2268,-3895,651,17352,5006,9709,5164,8030,5327,-1470,-8122,-4688,-3589,4266,5109,2156,4507,3392,-5349,-4480,-2738,-1392,3433,-4754,1668,1617,2051,-3701,-4002,-165,-536,5297,-2489,-1091,6852,1079,1656,3521,-1529,-5591,7146,4140,5887,-1047,803,1368,2878,1978,2848,988,-1487,-7709,-5363,3557,-2667,2201,7405,1868,5073,2383,7269,6049,7588,3563,1294,-1430,3300,4995,3999,4176,794,-254,-389,-248,2621,-1971,2510,440,-187,2453,-1529,-438,3213,-2559,4624,-1116,907,-686,610,-565,-114,659,2986,612,462,3270,-1936,2849,6753,934,1685,2073,2719,1425,1526]},"lttb":{"start":17183,"dateDeltas":[4,6,5,3,5,8,6,6,5,8,2,8,4,7,7,3,6,4,8,3,10,3,7,4,4,9,3,9,3,4,8,6,7,5,5,5,8,5,4,8,2,5,9,6,1,9,6,6,6,1,6,7,6,8,6,6,3,5,6,7,2,6,6,10,2,4,6,9,5,3,6,10,3,7,2,10,1,8,8,6,1,6,9,5,7,1,10,3,6,7,2,11,3,4,5,7,5,8,6,3,5,6,6,7,4,9,3,9,3,6,7,2,10,5,3,9,2,5,6,6,4,10,6,5,6,5,7,2,9,5,3,4,10,3,6,8,4,4,5,10,5,1,7,5,10,2,5,10,1,5,8,4,6,5,7,8,6,1,6,7,9,5,5,4,9,2,8,3,7,3,8,7,2,6,6,6,7,8,3,3,7,7,4,6,7,8,4,4,4,6,9,5,3,7,6,8,2,8,2,8,9,5,6,3,4,7,7,6,4,4,8,5,8,5,3,6,5,6,6,8,3,9,5,5,6,4,9,3,6,4,5,7,7,4,8,2,7,8,3,7,6,5,7,6,6,5,3,5,6,9,2,7,6,6,5,3,11,3,5,8,3,9,5,4,8,2,6,4,6,8,7,4,3,8,6,6,4,5,8,6,7,3,4,10,3,4,5,6,11,5,4,3,9,5,4,8,7,3,6,4,7,7,7,3,4,7,9,6,2,9,6,4,8,3,6,4,7,8,4,3,10,3,7,5,4,10,7,7,6,4,3,5,7,6,6,6,4,8,8,7,3,8,4,5,4,8,7,3,7,4,9,4,7,7,5,3,5,8,7,5,3,6,7,8,5,5,4,7,4,6,5,8,4,7,8,1,8,4,7,5,8,2,10,5,4,6,3,9,4,7,4,8,3,5,8,5,8,1,8,3,8,6,4,7,6,3,9,4,5,10,5,6,6,5,5,4,8,4,3,10,6,5,6,2,5,6,8,4,5,9,6,5,6,5,5,5,4,8,3,10,4,7,4,3,5,7,5,10,5,3,5,7,7,2,6,6,8,6,5,6,5,7,4,4,10,5,6,3,7,2,8,6,5,4,6,5,7,5,6,5,10,1,9,2,6,6,8,5,8,4,2,9,3,8,3,6,7,6,4],"priceScale":10000,"prices":[1000000,-1876,4164,-543,1999,1262,-2494,3344,-936,648,-2971,1762,2660,-470,3217,71,-1192,-398,1910,96,-1421,1355,-2651,875,1742,4127,1713,1641,103,479,-3255,-2609,1694,699,-1817,1350,-531,559,2132,-84,1142,3031,-158,2157,-1399,763,215,2298,-499,2309,-1574,416,3681,-403,-3356,4476,515,3315,1152,-1031,1200,-684,1706,-857,4587,-1057,3273,529,-3254,2630,-2241,257,3910,1206,-5010,1831,-2036,1056,-500,2805,-17372,6861,-4848,7814,-2800,3273,3767,2004,5047,2109,-852,-4697,763,2649,-3645,1901,-2472,7355,-4302,3999,72422,-70095,-5825,4673,-7010,1280,-2323,-3392,2309,3786,-265,8102,-2499,-2206,2498,-1278,6851,-3673,-907,2521,-6428,3685,1532,-2216,5137,-6325,314,-1719,4694,334,9581,439,11329,1528,3651,2631,-534,2141,-1761,2551,3227,2993,-727,4600,1415,-1210,-148,3583,3143,-2045,915,-4704,4045,1688,-816,1293,-1149,9093,3278,-6731,7790,-1395,3188,324,6546,139,-7544,-506,5887,2867,-851,9518,-4719,3565,-2375,-1473,2857,-4030,518,-2935,-408,2984,523,3213,915,-2948,5408,-3226,680,3479,836,3533,-4385,3257,3267,-25,5447,-1196,501,3225,4133,232,-12248,905,-10615,-42842,-32102,32740,-11258,5475,14504,4039,-3212,7694,-3941,5941,-1683,10636,2231,2448,13557,-11197,7456,-4477,-557,5650,-3206,1323,8772,-7638,-3977,3752,5221,-6384,5286,-2426,4227,1564,-341,-5132,3041,-1125,5358,1708,-4088,-632,2103,9477,-16,6101,2851,388,-2817,1428,692,-2456,2440,-675,-2465,555,5499,-2375,1649,5891,-2210,-586,-1830,-5741,5668,-2012,3473,-3729,2828,-1144,2034,-1287,1527,-1286,-1627,3807,-4169,-1613,1958,-361,7664,193,3612,-2559,5623,1190,-2586,-239,1709,1341,-2437,-562,3368,110,2013,-1336,700,-1489,4646,491,-2169,-1807,-1304,3750,-1898,-512,878,6646,-1941,4036,918,-8492,-164,6750,-643,-6327,2285,1045,889,-4064,-7078,3726,2541,-12102,-1759,1446,-16202,9460,-30659,-3964,10483,-3270,9230,-10916,667,-3325,-9051,4741,-7399,-2809,5896,-7201,3231,-2670,-1369,-27769,4432,-2235,-9477,8936,-9044,4523,9442,2136,16858,13545,88,-4407,5680,-12101,7526,-9258,-62,-13463,-15476,8136,-13172,-2170,715,14033,3697,20754,-6479,5226,8623,6939,-4533,1715,-8801,-4806,-3703,4956,-957,5091,2495,3628,6398,-7159,-872,-5335,-4541,-1126,7345,-7512,3324,-2154,2943,3992,-1010,-3792,-4002,-1874,1834,-1519,6213,-3573,60,6718,836,2777,-2520,5228,362,-6059,-1106,7132,3906,5810,-2174,2582,-855,1763,-1037,5676,102,2690,1146,-1567,-7756,-4984,-307,3536,-2529,-627,3966,6387,1382,5395,2335,821,6004,6615,824,8108,3449,239,-2064,151,8097,1598,2542,4543,831,573,-1879,787,-503,2693,-2221,-421,3026,-256,592,2364,-3123,3039,-2324,3562,-2679,57,4777,-1201,-378,2116,-2312,1581,-742,-660,-722,5172,-171,219,151,3888,-2717,2101,2500,4644,2101,-138,1867,2425,2360,602,3038,-580],"returnScale":1000000,"returns":[0,-1876,4164,-543,1999,1262,-2494,3344,-936,648,-2971,1762,2660,-470,3217,71,-1192,-398,1910,96,-1421,1355,-2651,875,1742,4127,1713,1641,103,479,-3255,-2609,1694,699,-1817,1350,-531,559,2132,-84,1142,3031,-158,2157,-1399,763,215,2298,-499,2309,-1574,416,3681,-403,-3356,4476,515,3315,1152,-1031,1200,-684,1706,-857,4587,-1057,3273,529,-3254,2630,-2241,257,3910,1206,-5010,1831,-2036,1056,-500,2805,-17372,6861,-4848,7814,-2800,3273,3767,2004,5047,2109,-852,-4697,763,2649,-3645,1901,-2472,7355,-4302,3999,72422,-70095,-5825,4673,-7010,1280,-2323,-3392,2309,3786,-265,8102,-2499,-2206,2498,-1278,6851,-3673,-907,2521,-6428,3685,1532,-2216,5137,-6325,314,-1719,4694,334,9581,439,11329,1528,3651,2631,-534,2141,-1761,2551,3227,2993,-727,4600,1415,-1210,-148,3583,3143,-2045,915,-4704,4045,1688,-816,1293,-1149,9093,3278,-6731,7790,-1395,3188,324,6546,139,-7544,-506,5887,2867,-851,9518,-4719,3565,-2375,-1473,2857,-4030,518,-2935,-408,2984,523,3213,915,-2948,5408,-3226,680,3479,836,3533,-4385,3257,3267,-25,5447,-1196,501,3225,4133,232,-12248,905,-10615,-42842,-32102,32740,-11258,5475,14504,4039,-3212,7694,-3941,5941,-1683,10636,2231,2448,13557,-11197,7456,-4477,-557,5650,-3206,1323,8772,-7638,-3977,3752,5221,-6384,5286,-2426,4227,1564,-341,-5132,3041,-1125,5358,1708,-4088,-632,2103,9477,-16,6101,2851,388,-2817,1428,692,-2456,2440,-675,-2465,555,5499,-2375,1649,5891,-2210,-586,-1830,-5741,5668,-2012,3473,-3729,2828,-1144,2034,-1287,1527,-1286,-1627,3807,-4169,-1613,1958,-361,7664,193,3612,-2559,5623,1190,-2586,-239,1709,1341,-2437,-562,3368,110,2013,-1336,700,-1489,4646,491,-2169,-1807,-1304,3750,-1898,-512,878,6646,-1941,4036,918,-8492,-164,6750,-643,-6327,2285,1045,889,-4064,-7078,3726,2541,-12102,-1759,1446,-16202,9460,-30659,-3964,10483,-3270,9230,-10916,667,-3325,-9051,4741,-7399,-2809,5896,-7201,3231,-2670,-1369,-27769,4432,-2235,-9477,8936,-9044,4523,9442,2136,16858,13545,88,-4407,5680,-12101,7526,-9258,-62,-13463,-15476,8136,-13172,-2170,715,14033,3697,20754,-6479,5226,8623,6939,-4533,1715,-8801,-4806,-3703,4956,-957,5091,2495,3628,6398,-7159,-872,-5335,-4541,-1126,7345,-7512,3324,-2154,2943,3992,-1010,-3792,-4002,-1874,1834,-1519,6213,-3573,60,6718,836,2777,-2520,5228,362,-6059,-1106,7132,3906,5810,-2174,2582,-855,1763,-1037,5676,102,2690,1146,-1567,-7756,-4984,-307,3536,-2529,-627,3966,6387,1382,5395,2335,821,6004,6615,824,8108,3449,239,-2064,151,8097,1598,2542,4543,831,573,-1879,787,-503,2693,-2221,-421,3026,-256,592,2364,-3123,3039,-2324,3562,-2679,57,4777,-1201,-378,2116,-2312,1581,-742,-660,-722,5172,-171,219,151,3888,-2717,2101,2500,4644,2101,-138,1867,2425,2360,602,3038,-580]},"monthly":{"start":17197,"dateDeltas":[28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1003219,2583,2115,2174,2316,2554,-683,5388,2385,6228,4472,1759,6232,3624,-2182,-7312,13798,-3990,4132,-8021,9580,3992,-3177,-2697,26886,7649,12299,6395,138,7403,11134,7316,2242,-3439,7131,2358,10548,-6282,-61533,27747,15632,4782,3642,3385,634,4608,18532,-338,2457,-2235,4395,-1630,3736,10559,-1491,4473,670,-84,1849,1778,-3500,-22746,-15116,-19128,-10275,-35326,25644,11990,-32711,10435,31162,-15423,13159,-6235,274,-5526,4332,8970,11261,5133,-4809,-997,20504,20788,13970,719,3854,1140,4131,-658,6409,10100,8543,965],"returnScale":1000000,"returns":[3219,2583,2115,2174,2316,2554,-683,5388,2385,6228,4472,1759,6232,3624,-2182,-7312,13798,-3990,4132,-8021,9580,3992,-3177,-2697,26886,7649,12299,6395,138,7403,11134,7316,2242,-3439,7131,2358,10548,-6282,-61533,27747,15632,4782,3642,3385,634,4608,18532,-338,2457,-2235,4395,-1630,3736,10559,-1491,4473,670,-84,1849,1778,-3500,-22746,-15116,-19128,-10275,-35326,25644,11990,-32711,10435,31162,-15423,13159,-6235,274,-5526,4332,8970,11261,5133,-4809,-997,20504,20788,13970,719,3854,1140,4131,-658,6409,10100,8543,965]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("WVP Cash Deposit", {"weekly":{"start":16411,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[1000396,686,683,681,672,643,641,643,648,623,639,674,469,1018,704,592,235,802,425,355,566,621,300,499,1320,473,452,392,369,350,355,353,331,164,-165,88,508,578,465,786,504,641,379,381,215,133,590,291,315,172,404,586,388,672,378,174,267,325,548,497,384,385,355,382,368,352,396,400,390,407,265,384,585,416,413,389,408,398,414,391,391,389,415,-37,416,57,408,482,433,476,485,488,488,521,460,485,462,499,469,770,137,473,455,404,477,459,502,492,481,548,478,482,1391,502,18,187,610,395,415,648,922,431,230,-98,564,826,758,457,17,647,632,373,479,437,501,-61,306,343,592,192,394,402,831,573,394,351,-73,153,473,368,427,381,354,386,391,563,1023,216,-266,342,400,413,370,489,335,573,684,384,387,224,-59,386,338,368,463,266,368,394,378,422,339,421,337,310,339,340,366,349,337,366,370,369,322,367,370,368,383,349,362,377,372,359,382,374,374,372,341,383,370,371,350,350,381,341,360,351,461,690,369,173,42,367,351,331,356,631,98,342,357,339,362,338,356,342,337,339,294,336,598,99,300,316,321,345,270,306,248,250,256,270,216,296,269,213,187,197,312,115,189,277,407,105,184,76,257,257,246,196,783,449,105,-141,-101,1347,345,308,230,252,223,231,219,242,263,67,464,216,178,206,173,181,189,216,197,192,198,230,210,-1368,215,216,228,244,249,263,261,261,242,262,257,259,254,262,263,81,245,252,256,-430,-289,784,360,534,222,212,194,206,197,237,180,163,-715,552,170,143,293,202,-309,-75,834,974,347,196,223,236,-508,-304,-70,170,323,228,226,195,212,675,597,500,128,272,190,193,93,302,183,207,232,248,254,250,-248,497,519,281,273,275,440,281,234,265,272,272,247,265,313,294,-350,-107,242,1125,385,293,313,306,323,294,789,685,-161,-360,301,306,301,308,282,293,288,280,313,323,325,329,306,519,1233,391,354,369,372,375,350,198,-283,213,414,1525,501,436,435,436,431,453,456,346,537,483,475,448,94,-1,96,546,306,526,559,546,561,529,1521,-68,194,539,551,497,490,525,344,508,527,914,432,382,431,552,528,520,526,499,666,511,563,545,556,560,561,557,624,1032,1041,607,688,534,567,576,571,183,-137,504,559,550,533,564,548,563,563,547,602,869,577,500,396,534,491,333,538,554,536,550,511,539,458,641,537,554,542,550],"returnScale":1000000,"returns":[273,686,683,681,672,643,640,643,648,623,639,674,469,1018,704,592,235,802,425,355,565,621,300,499,1320,473,452,392,369,350,355,353,331,164,-165,88,508,578,465,785,504,641,379,381,215,133,590,291,315,172,404,586,388,672,378,174,267,325,548,496,384,385,355,382,368,352,396,400,390,407,265,384,585,416,413,389,408,398,414,390,391,389,415,-37,416,57,408,482,433,476,485,488,488,521,460,485,462,499,469,769,137,473,455,404,477,459,502,492,481,548,478,482,1391,502,18,187,609,395,415,648,922,431,230,-98,564,826,758,457,17,647,632,373,478,437,501,-61,306,343,592,192,394,402,831,573,394,351,-73,153,473,368,427,381,354,386,390,563,1023,216,-266,342,400,413,370,489,335,573,684,384,387,224,-59,386,338,368,463,266,367,394,378,422,339,421,337,310,339,340,366,349,337,366,370,369,322,367,370,368,383,349,362,376,372,359,382,374,374,372,341,383,370,371,350,350,381,341,360,351,461,690,369,173,42,366,351,331,356,631,98,342,357,339,362,338,356,342,337,339,294,336,598,99,300,316,321,345,270,305,248,250,256,270,216,296,269,213,187,197,312,115,189,277,407,105,184,76,257,257,246,196,783,449,105,-141,-101,1347,345,307,230,252,223,231,219,242,263,67,464,216,178,206,173,181,189,216,197,192,198,230,210,-1368,215,216,228,244,249,263,261,261,242,262,257,259,254,262,263,81,245,252,256,-430,-289,784,359,534,222,212,194,206,197,237,180,163,-715,552,170,143,293,202,-309,-75,834,974,347,196,223,236,-508,-304,-70,170,323,228,226,195,212,675,597,500,128,272,189,193,93,302,183,207,232,248,254,250,-248,497,519,281,273,275,440,281,234,265,272,272,247,265,313,294,-350,-107,242,1125,385,293,312,306,323,294,789,685,-161,-360,301,306,301,308,282,293,288,280,313,323,325,329,306,519,1233,390,354,369,372,375,350,198,-283,213,414,1525,501,436,435,436,431,453,456,346,537,482,475,448,94,-1,96,546,306,526,559,546,561,529,1521,-68,194,539,551,496,490,525,344,508,527,914,432,382,431,552,528,520,526,499,666,510,563,545,556,560,561,557,624,1032,1041,607,688,533,567,576,571,183,-137,504,559,550,533,564,548,563,563,547,602,868,577,500,396,534,491,333,538,554,536,550,511,539,458,641,537,553,542,550]},"lttb":{"start":16408,"dateDeltas":[4,9,8,6,2,13,2,11,3,10,11,7,7,4,11,6,4,8,9,4,12,5,9,5,10,1,9,6,7,6,14,6,8,3,10,6,8,9,2,12,5,7,7,10,4,7,5,12,8,7,6,4,8,8,5,13,5,3,10,7,7,8,10,4,4,8,12,6,3,11,4,7,11,7,10,6,6,3,10,11,7,7,7,7,7,3,9,4,11,10,4,7,7,10,5,10,4,6,11,7,4,6,9,9,9,6,6,9,4,5,10,9,7,4,11,7,5,10,8,5,6,7,5,7,11,5,6,11,5,11,6,5,6,12,5,4,6,12,4,6,12,5,5,7,7,9,8,7,7,9,6,10,5,7,8,7,3,13,5,9,8,4,4,14,7,4,4,11,9,2,7,10,11,3,6,8,11,3,10,4,7,12,2,7,9,8,8,8,3,11,3,10,4,10,5,8,6,9,7,8,6,6,13,2,12,7,4,9,10,6,6,4,10,10,2,8,9,10,7,6,2,10,5,7,10,7,4,13,8,3,11,4,7,5,9,11,6,9,6,3,12,2,7,7,12,8,7,8,6,4,5,12,9,3,5,13,4,8,9,8,6,9,3,7,10,6,3,13,2,8,6,7,12,3,12,5,5,11,4,11,4,7,7,6,11,6,5,13,4,4,14,3,5,7,11,4,10,6,11,6,9,5,8,7,2,11,9,8,2,9,6,9,4,13,3,8,6,10,4,12,7,6,8,3,6,14,3,8,6,9,8,8,2,13,5,7,4,8,8,13,2,13,3,5,12,9,7,2,9,10,3,7,7,12,1,10,11,3,7,6,9,12,6,5,6,12,6,2,10,8,5,13,4,7,11,6,3,12,3,5,14,7,3,6,12,2,7,12,6,8,3,12,8,6,4,6,13,7,7,8,3,9,5,7,11,6,8,8,4,11,6,2,11,5,5,8,12,8,5,7,5,11,8,3,5,9,7,7,6,8,12,8,5,7,7,5,11,5,7,12,2,9,11,3,6,8,6,13,5,5,12,5,4,6,14,1,12,2,7,10,9,9,2,11,7,5,7,11,4,9,4,10,3,10,6,6,8,6,12,8,5,10,6,3,12,7,3,11,9,1,11,9,1,9,6,8,12,7,2],"priceScale":10000,"prices":[1000123,362,914,733,617,204,1161,201,1021,272,887,1016,500,1021,464,916,150,583,639,362,263,1104,134,636,1180,714,74,503,323,342,325,679,281,210,-360,210,672,441,666,438,1021,313,301,601,28,473,1,449,336,505,583,288,557,458,484,-169,603,531,278,536,399,354,436,529,187,189,491,682,346,25,624,404,424,626,418,560,371,301,197,571,622,-36,392,73,407,484,149,627,264,736,727,341,432,490,657,370,669,576,74,735,459,194,448,556,666,578,497,427,610,272,1212,767,-147,454,433,608,509,855,699,292,-224,376,999,279,752,280,312,776,626,356,687,447,-196,235,557,577,13,316,717,652,511,671,245,-181,145,479,480,488,350,404,467,382,1330,280,-414,370,426,126,735,393,431,636,523,208,776,184,-182,234,538,486,249,223,507,630,142,373,388,651,107,497,152,340,659,56,337,469,447,359,396,187,560,188,481,234,519,277,420,273,525,361,441,282,343,655,131,609,331,245,435,580,236,431,521,528,58,47,429,403,528,631,53,90,475,286,322,534,281,259,616,393,103,530,470,75,209,441,450,324,338,283,84,472,19,297,170,540,274,159,240,279,126,54,333,532,126,10,231,122,334,306,223,757,541,136,-44,-295,1309,203,537,47,292,186,244,365,122,439,-17,400,352,76,332,77,181,189,192,294,193,124,416,-1436,92,431,117,151,236,421,134,380,201,416,211,344,169,309,261,-84,365,337,291,-613,-226,759,422,438,418,75,257,143,346,88,308,-747,546,124,152,110,495,35,-501,243,1546,416,228,78,420,-576,-303,-153,120,421,453,35,381,92,613,1037,187,275,47,260,166,195,211,158,386,44,390,362,-336,218,683,370,466,407,185,248,419,274791,-274477,388,265,202,567,210,-668,283,1087,217,499,179,184,634,295,137,1446,-313,-449,203,532,249,599,-123,501,300,277,127,323,616,292,338,1457,186,467,230,390,597,208,450,-365,26,656,1470,201,666,339,294,472,775,533,209,538,366,730,525,-185,427,-328,611,233,398,669,951,593,420,1751,-632,345,867,393,420,922,-10,733,743,602,510,312,357,1017,354,396,855,517,287,424,1105,107,899,208,531,810,798,1674,150,1063,554,367,588,895,287,-251,207,866,151,800,436,505,604,509,939,688,709,828,402,98,917,482,-11,899,601,171,859,596,145,604,568,610,940,592,114],"returnScale":1000000,"returns":[0,362,914,733,617,204,1161,200,1021,272,887,1016,500,1021,464,916,150,583,639,362,262,1104,134,636,1180,714,74,503,323,342,325,679,281,210,-360,210,672,441,665,438,1021,313,301,601,28,473,1,449,336,505,583,288,557,458,484,-169,603,531,277,536,399,354,436,529,187,189,491,682,346,25,624,404,424,626,418,560,371,301,196,571,622,-36,392,73,407,484,149,627,264,736,727,341,432,490,657,370,669,575,74,735,459,194,448,556,666,578,497,427,610,272,1212,767,-147,453,433,608,509,855,699,292,-224,376,999,279,752,280,312,776,626,356,686,447,-196,235,557,577,13,316,717,652,511,671,245,-181,145,479,480,488,350,404,467,381,1330,280,-414,370,426,126,735,393,431,636,523,208,776,184,-182,234,538,486,249,223,506,630,142,373,388,651,107,497,152,340,659,56,337,469,447,359,396,187,560,188,481,234,518,277,420,273,525,361,441,282,343,655,131,609,331,245,435,580,236,431,521,528,58,47,428,403,528,631,53,90,475,286,322,534,281,259,616,393,103,530,470,75,209,441,450,324,338,282,84,472,19,297,170,540,274,159,240,279,126,54,333,532,126,10,231,122,334,306,223,757,541,136,-44,-295,1309,203,536,47,292,186,244,365,122,439,-17,400,352,76,332,77,181,189,192,294,193,124,416,-1436,92,431,117,151,236,421,134,380,201,416,211,344,169,309,261,-84,365,337,291,-613,-226,759,421,438,418,75,257,143,346,88,308,-747,546,124,152,110,495,35,-501,243,1546,416,228,78,420,-576,-303,-153,120,421,453,35,381,92,613,1037,187,275,47,259,166,195,211,158,386,44,390,362,-336,218,683,370,466,407,185,248,419,274757,-274443,388,265,202,567,210,-668,283,1087,217,499,178,184,634,295,137,1446,-313,-449,203,532,249,599,-123,501,300,277,127,323,616,292,338,1457,186,466,230,390,597,208,450,-365,26,656,1470,201,666,339,294,472,775,533,209,538,365,730,525,-185,427,-328,611,233,398,669,951,593,420,1751,-632,345,867,393,419,922,-10,733,743,602,510,312,357,1017,354,396,855,517,287,423,1105,107,899,208,531,810,798,1674,150,1063,554,366,588,895,287,-251,207,866,151,800,436,505,604,509,939,688,708,828,402,98,917,482,-11,899,601,171,859,596,145,604,568,610,939,592,114]},"monthly":{"start":16435,"dateDeltas":[31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[1002749,2859,2403,2783,2401,2813,1678,1112,1506,2385,1425,1464,1815,1885,1544,1730,1753,1780,1710,1020,2069,2116,2400,1641,2104,3132,1283,2556,1646,2258,1909,1380,2144,945,1797,2223,1100,1848,1955,1041,1602,1727,1412,1582,1572,1585,1648,1577,1602,1895,1069,1811,1252,1529,1657,1164,1257,1126,1036,1045,686,1801,1269,1213,1033,1030,820,899,-623,1061,1130,1118,939,809,834,590,572,775,1788,-616,1073,2043,743,1003,724,1590,1220,1197,170,2247,2179,210,1311,1323,2560,1562,629,3064,1762,2027,766,2186,3217,1478,2076,2333,2375,2359,2480,3540,2460,1349,2343,2800,2203,2086,2351,2436,461],"returnScale":1000000,"returns":[2626,2858,2403,2783,2400,2813,1678,1112,1506,2384,1425,1464,1815,1884,1544,1730,1753,1780,1709,1020,2069,2116,2399,1641,2104,3132,1282,2556,1646,2258,1908,1380,2144,945,1797,2222,1100,1848,1955,1041,1601,1727,1412,1582,1572,1584,1648,1577,1602,1895,1068,1811,1252,1529,1657,1164,1256,1126,1036,1045,686,1801,1269,1212,1033,1030,820,899,-623,1061,1130,1118,939,808,834,590,572,775,1788,-616,1073,2043,742,1003,724,1590,1220,1197,170,2246,2179,210,1311,1323,2560,1561,629,3064,1762,2026,766,2186,3217,1477,2076,2333,2375,2358,2480,3540,2459,1349,2343,2800,2202,2086,2351,2435,461]}});
\ No newline at end of file
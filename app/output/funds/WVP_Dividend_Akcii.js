@@ -0,0 +1 @@
+registerFundSeries("WVP Dividend Akcii", {"weekly":{"start":18651,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[990902,-25869,42467,9362,-9931,-16359,22850,27419,7671,25434,1423,16482,3689,-15273,-3620,24927,-12118,-4790,9091,12162,19109,-4954,11256,19674,-2074,-3279,11923,-8966,16563,10367,-7663,3102,-1649,-18464,-3779,169,-9993,18387,17800,2815,699,31453,6540,4440,-32779,-5222,44647,-10589,16018,9059,-1810,-2666,-40603,26695,-23471,-4274,-11598,5009,-969,-32223,60712,16308,3351,13509,-19675,-40606,14066,-20417,4833,-39928,43308,-5966,-52737,-43382,50665,-19015,42599,-8495,17547,30727,329,23007,3018,-31506,-36738,27129,-35933,-21482,-32392,16483,-9156,30297,11388,-2184,30254,-9880,18402,7372,-25219,-25278,-7595,-5226,38391,14855,-401,22126,13037,1501,5418,-26898,23946,-33838,3970,5341,29102,1583,10253,85,-16733,-17784,12874,27667,9807,16569,-1785,19585,-11957,17735,-21565,11320,8816,17062,-7292,-3016,-17614,15562,31307,-675,5372,-33590,-7048,1105,13864,-42595,-23094,39552,11509,8057,4272,6516,11833,19354,3152,3825,-6946,20951,19576,22091,15215,29114,8745,13400,16507,-8244,-5235,37791,11855,-24417,2205,-38115,21723,-7358,17920,11755,-7436,-5992,18630,20951,1172,826,11224,6881,-30570,-1629,-27653,-11081,44026,2989,15236,-65047,41333,-3258,31144,6352],"returnScale":1000000,"returns":[-10040,-25845,42427,9353,-9922,-16343,22828,27393,7664,25410,1421,16467,3685,-15258,-3617,24903,-12106,-4786,9083,12150,19091,-4949,11245,19655,-2072,-3276,11912,-8957,16547,10357,-7656,3099,-1647,-18447,-3775,169,-9984,18370,17783,2812,699,31423,6533,4436,-32748,-5217,44605,-10579,16003,9050,-1808,-2664,-40564,26670,-23449,-4270,-11587,5004,-968,-32192,60654,16293,3347,13497,-19657,-40567,14053,-20398,4828,-39890,43267,-5960,-52687,-43341,50617,-18997,42559,-8487,17530,30698,328,22986,3015,-31476,-36703,27103,-35899,-21462,-32361,16468,-9148,30268,11378,-2182,30225,-9871,18385,7365,-25195,-25254,-7588,-5221,38354,14841,-400,22105,13024,1500,5413,-26873,23924,-33806,3966,5336,29074,1582,10243,85,-16717,-17767,12861,27641,9798,16553,-1783,19566,-11946,17719,-21545,11309,8808,17046,-7285,-3013,-17598,15547,31278,-675,5367,-33558,-7041,1104,13851,-42555,-23072,39515,11498,8049,4268,6510,11821,19336,3149,3821,-6939,20931,19557,22070,15201,29086,8737,13387,16491,-8236,-5230,37755,11844,-24394,2203,-38079,21703,-7351,17903,11744,-7429,-5987,18613,20931,1171,825,11213,6875,-30541,-1628,-27626,-11071,43984,2986,15222,-64985,41293,-3255,31115,6346]},"lttb":{"start":18647,"dateDeltas":[2,3,3,2,1,4,3,1,3,4,3,2,3,3,3,2,1,5,2,3,2,3,3,2,2,4,2,3,2,3,3,2,2,4,3,1,5,1,4,2,3,3,2,3,2,2,3,2,3,3,2,4,2,3,2,4,2,2,5,2,3,3,1,2,4,2,2,3,4,3,3,1,3,4,3,2,2,3,2,5,3,3,1,5,2,3,1,3,3,4,2,5,3,4,3,2,3,2,4,1,3,4,1,2,3,4,2,4,1,4,3,1,4,2,3,2,4,2,2,2,5,1,3,3,3,1,4,3,3,3,3,2,3,4,2,4,1,4,2,4,2,2,3,2,2,5,2,3,1,4,4,2,3,3,2,4,1,5,2,4,2,3,3,1,3,4,2,4,2,2,4,2,3,2,3,3,2,4,1,3,4,2,2,4,2,3,2,3,4,2,3,3,1,4,2,3,2,2,4,3,1,4,2,2,3,3,4,1,4,2,3,3,3,1,3,2,5,1,3,3,2,4,1,7,2,4,2,3,1,5,1,4,1,4,2,2,3,4,1,4,3,1,4,2,3,2,2,4,2,3,2,5,2,2,4,2,1,4,2,4,3,1,2,3,3,4,2,2,2,5,2,3,1,4,3,3,1,3,3,2,3,4,2,3,1,3,3,3,2,3,3,4,2,1,5,2,3,3,1,3,2,4,3,2,3,3,2,3,2,3,2,3,4,1,3,4,2,3,1,5,2,2,2,4,2,2,4,2,2,4,3,3,2,3,2,4,1,6,2,4,1,4,3,3,3,1,2,4,2,2,5,2,1,3,4,3,3,3,2,2,5,1,4,2,3,3,1,3,4,2,3,2,2,3,4,1,4,2,4,1,3,2,4,2,3,3,2,4,2,3,1,5,2,2,3,2,4,1,3,2,4,2,4,2,3,3,2,3,2,2,4,2,4,2,1,6,2,3,1,3,3,2,4,3,1,5,2,3,3,1,4,2,3,1,5,2,2,2,4,3,1,4,1,5,2,2,3,3,3,3,2,2,3,4,2,1,3,4,3,3,1,4,2,3,3,1,3,4,3,2,1,3,5,1,2,3,4,3,3,1,3,3,2,4,2,3,1,3,4,3,3,2,1,3,3,2,4,3,2],"priceScale":10000,"prices":[1000952,-9832,809,-7314,-19519,-63,39705,2762,6555,78,6959,-2418,-11672,309,-22802,24741,-6286,-7364,40987,5768,-1514,11242,-4915,13471,-14766,27279,-794,6865,-3854,10333,7617,-3288,-2903,9332,-15769,795,-1146,3945,-7494,709,22851,1223,-37559,26515,-1512,-16135,10579,8779,-9148,10737,-6389,6182,25250,-3281,9511,3637,-8518,-148,13003,-1747,3078,12261,5206,-6458,-4654,10299,3010,-8224,-18000,29585,949,-601,-8044,-3916,16582,3527,9027,2518,-1167,-13731,11866,-3709,243,6392,-7964,2817,-17843,-3629,2785,-2338,-23120,8653,13277,-22218,-915,30304,-1454,-2829,18179,3514,5251,-4178,2534,-9125,12257,-740,24132,3696,-9845,15642,6095,-7226,6393,-2924,-26549,5119,-22378,8652,38346,686,5694,1283,-12949,-18314,37730,-2400,11027,-3064,7986,-8611,-89,11420,-15707,1501,-39891,-592,-2555,27649,21097,-31199,-12897,30725,-35525,-7493,20463,-24101,-26570,37962,-10218,-10661,14790,-4170,-34857,1858,53804,11856,924,13388,25839,-33832,25513,-12618,13957,-24477,13378,-8578,5519,-46052,-18103,51784,-19689,24998,-44906,-31743,-4068,40134,11808,-55174,20446,-17010,45125,-7751,12695,-12725,10678,-63347,-39047,23184,-27593,7863,44888,-4304,-27532,13660,-3457,41898,1163,-13646,-10543,13098,29598,-11440,-10636,40573,2852,-9170,14021,-10375,19139,9644,14408,-21396,-9600,28247,-36289,-14243,-19150,-9915,4107,38768,-701,-51027,2761,4669,-45334,26275,-39484,54991,-43554,5117,7494,-17682,27157,-16773,20874,27095,-39124,23417,-23990,31277,-3103,50401,-26440,-15713,9795,-7507,27823,-8106,-16588,37058,-10943,-28923,3704,18736,-36819,-17892,19276,-16147,392,-11959,6314,31800,-12999,19664,-2998,18739,1070,-21984,19629,12877,9250,-12566,36420,-14798,15740,-16768,21055,811,-15376,5686,-22512,-4635,-2049,26320,2770,-12933,-21597,-9299,26761,-15895,9408,-15809,9500,19669,11108,-6787,7833,1754,12922,-3238,-1028,3887,-2931,-48062,27914,4101,-38178,19784,-2489,11268,4019,2247,25418,-12195,-6839,28930,-15734,32379,-3308,10405,-9045,20087,13398,-13818,-11436,-9496,8893,3119,14698,4124,-26799,3991,24975,-16536,6779,-4365,7666,10255,25020,-24756,-2095,11292,-15039,4205,-23925,2837,8180,11336,-3954,26490,-4162,13140,-7773,3111,7598,-8545,4398,-33661,1818,-14985,17561,-26309,10000,7790,20634,-14928,16914,378,-48751,1150,-27848,626,11284,35905,-7637,1962,9171,19351,-16831,11577,-10665,10841,-1568,-11950,18552,-6806,18726,-173,28723,-9281,10361,-16792,9160,7611,-8877,5340,-9231,2371,12204,1078,7756,-3164,22829,4635,15398,1882,-1835,23480,-8292,26200,6650,-12149,21000,2598,-15922,26723,-9968,23996,-322,-15551,11431,-9320,13093,-12310,27797,10970,-6263,13740,3402,-7544,-15303,1904,-11324,10151,-96,-40440,2325,29567,-14902,5990,-22895,16796,16880,-10531,12765,14181,-4945,6063,-12938,573,-17114,15101,-3979,21216,-2586,12571,11210,-2732,2301,-1129,6450,-2120,-3602,4555,9265,-4063,-4384,14198,790,-35606,2780,13536,-27655,15422,19141,-49532,-53473,42031,-1644,40239,4616,11701,-18852,11221,-8844,25201,-1687,-22737,-41484,9753,36315,-4375,-15425,26026,-14578,12454,18017,-13452,19583,894],"returnScale":1000000,"returns":[0,-9823,809,-7307,-19501,-63,39667,2760,6549,77,6953,-2416,-11661,309,-22780,24717,-6280,-7357,40948,5763,-1513,11231,-4910,13458,-14752,27253,-793,6859,-3851,10323,7610,-3285,-2900,9323,-15754,794,-1145,3942,-7487,708,22829,1222,-37523,26490,-1511,-16119,10569,8770,-9139,10727,-6383,6176,25226,-3278,9502,3633,-8509,-148,12990,-1745,3075,12249,5201,-6451,-4650,10289,3007,-8216,-17983,29557,948,-600,-8037,-3912,16566,3524,9019,2515,-1166,-13718,11855,-3705,242,6386,-7956,2814,-17826,-3625,2782,-2336,-23098,8645,13264,-22197,-914,30275,-1452,-2827,18162,3511,5246,-4174,2531,-9116,12245,-739,24109,3693,-9836,15627,6089,-7219,6387,-2921,-26524,5114,-22356,8643,38310,685,5689,1282,-12937,-18297,37694,-2397,11016,-3061,7979,-8603,-89,11409,-15692,1500,-39854,-591,-2553,27623,21077,-31169,-12885,30696,-35491,-7486,20443,-24078,-26545,37926,-10208,-10651,14776,-4166,-34824,1856,53753,11845,923,13375,25815,-33800,25489,-12606,13943,-24453,13365,-8570,5514,-46008,-18086,51735,-19671,24975,-44864,-31712,-4065,40096,11797,-55121,20426,-16994,45082,-7743,12683,-12713,10668,-63287,-39010,23162,-27567,7856,44845,-4300,-27506,13647,-3453,41858,1162,-13633,-10533,13085,29570,-11429,-10626,40534,2850,-9162,14008,-10365,19121,9635,14394,-21376,-9591,28220,-36254,-14229,-19132,-9906,4103,38731,-700,-50978,2758,4665,-45291,26250,-39447,54939,-43513,5112,7487,-17665,27131,-16757,20854,27070,-39087,23395,-23968,31248,-3100,50353,-26415,-15698,9785,-7499,27796,-8098,-16572,37022,-10932,-28896,3701,18718,-36784,-17875,19258,-16132,392,-11948,6308,31770,-12987,19645,-2995,18721,1069,-21963,19611,12864,9242,-12554,36385,-14784,15725,-16752,21035,810,-15361,5680,-22490,-4631,-2047,26295,2768,-12921,-21577,-9290,26736,-15880,9399,-15794,9491,19650,11098,-6781,7826,1752,12910,-3235,-1027,3883,-2928,-48016,27887,4097,-38142,19766,-2487,11257,4015,2245,25394,-12183,-6833,28903,-15719,32348,-3305,10395,-9036,20068,13385,-13805,-11425,-9487,8884,3117,14684,4120,-26774,3987,24952,-16521,6773,-4361,7659,10245,24996,-24732,-2093,11281,-15025,4201,-23902,2834,8173,11325,-3951,26465,-4158,13128,-7766,3108,7591,-8537,4394,-33629,1816,-14971,17545,-26284,9990,7783,20614,-14914,16898,378,-48705,1149,-27821,625,11273,35871,-7629,1960,9162,19333,-16815,11566,-10655,10830,-1566,-11939,18535,-6800,18708,-173,28696,-9272,10351,-16776,9151,7604,-8868,5334,-9222,2369,12192,1077,7749,-3161,22807,4631,15383,1880,-1833,23458,-8284,26175,6643,-12137,20980,2596,-15907,26697,-9958,23973,-322,-15536,11420,-9311,13081,-12299,27771,10959,-6257,13727,3399,-7537,-15288,1902,-11313,10141,-96,-40401,2322,29539,-14887,5984,-22873,16780,16864,-10521,12752,14168,-4940,6057,-12926,573,-17098,15087,-3976,21196,-2583,12559,11199,-2729,2298,-1128,6444,-2118,-3598,4550,9257,-4059,-4380,14184,789,-35572,2778,13523,-27629,15407,19123,-49485,-53422,41991,-1642,40200,4612,11690,-18834,11210,-8835,25177,-1686,-22715,-41445,9744,36281,-4371,-15411,26002,-14565,12443,18000,-13440,19565,893]},"monthly":{"start":18658,"dateDeltas":[28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[965033,25539,83492,2727,14430,44850,12613,24215,-45110,49173,2800,59671,-2834,-53811,38939,-19366,-18141,-75240,93043,-34687,-66380,39896,61612,-75279,68402,3256,24329,-4321,16917,51934,39052,-9591,-26877,-39521,40156,56630,53837,70421,50562,-51317,25581,37600,7979,1544,-547,10971],"returnScale":1000000,"returns":[-35885,25515,83412,2725,14416,44807,12601,24192,-45067,49127,2797,59614,-2831,-53760,38902,-19348,-18123,-75169,92955,-34654,-66317,39858,61553,-75207,68337,3253,24306,-4317,16901,51884,39015,-9582,-26851,-39484,40118,56576,53786,70354,50514,-51268,25557,37564,7971,1543,-547,10961]}});
\ No newline at end of file
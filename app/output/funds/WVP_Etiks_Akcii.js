@@ -0,0 +1 @@
+registerFundSeries("WVP Etiks Akcii", {"weekly":{"start":19967,"dateDeltas":[7,7,7,7,7],"priceScale":10000,"prices":[998133,-37605,28374,-5398,12878,-1672],"returnScale":1000000,"returns":[-1773,-37609,28377,-5399,12880,-1672]},"lttb":{"start":19964,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[999906,-1580,-95,-98,780,-13393,-1228,-7573,-15749,-349,-93,6180,3238,13338,4957,5122,-4369,-92,293,-4793,-6019,20658,-14550,-900,-87,2016,6912,-998,3244,1894,-102,-88,622,-11399,7364,-5576,6905,497,-85],"returnScale":1000000,"returns":[0,-1580,-95,-98,780,-13394,-1228,-7574,-15751,-349,-93,6181,3238,13339,4958,5122,-4369,-92,293,-4793,-6020,20660,-14551,-901,-87,2017,6912,-998,3245,1894,-102,-88,622,-11400,7364,-5576,6905,498,-85]},"monthly":{"start":19966,"dateDeltas":[30,31],"priceScale":10000,"prices":[998231,-1227,-2294],"returnScale":1000000,"returns":[-1675,-1227,-2294]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("WVP Premium Akcii", {"weekly":{"start":16411,"dateDeltas":[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7],"priceScale":10000,"prices":[999804,169,267,765,-2300,-2454,11688,19387,-7562,6925,9657,2274,12331,8143,19268,10287,-21461,2847,30070,-26697,4394,-24241,8862,-11394,22522,-11868,-23665,-1058,-6272,19656,-22521,15204,29842,-22800,-76,3227,-26188,-57079,8251,-18735,4741,-4525,-2852,-3601,30740,6413,35933,9919,12055,-24804,35471,8720,-39463,-35600,15748,9709,-1491,-67520,-26300,19816,7660,-46487,-24655,35539,18409,23718,3283,-794,-7051,-8532,-4807,27515,17064,-21602,-16774,6864,3652,30828,-12980,-18438,-15862,-3197,26556,-5960,22788,5986,411,273,17042,-13814,1783,11676,-16032,-12620,21004,-3760,-6875,4145,9568,-4635,-40340,38928,7686,6679,-10778,46856,16611,2692,-4638,14477,-8640,-6008,12974,-10306,8469,12476,5735,16582,-6843,5579,-10243,16400,-1874,-12208,-6171,18839,17420,2213,-20333,2701,9507,-688,-3200,-2772,-29981,-1391,17228,-20245,-8521,5325,-17034,6008,4180,1252,1618,18283,3266,18115,13459,155,1316,16186,10573,-19839,-15988,9025,450,13848,579,-638,-9548,25139,5230,8294,2149,-43535,-52918,27923,6296,-36021,30551,-6369,-45156,19521,8962,10820,9319,10607,7683,18454,9525,-11608,-6164,-842,5866,-11566,-13140,10179,10248,1343,20651,-4967,-5749,-7073,1936,-5516,-18585,10176,19192,-1436,-7296,-46575,14066,-25342,15055,18243,-19802,-23165,24336,-41642,576,-46487,6129,19093,13060,27319,2662,8774,-1812,31594,2845,5479,-7457,25069,-15082,16070,22708,-5789,10841,9412,4622,-35860,16692,-12537,-25278,31640,1769,21545,-1186,18065,-6539,-2400,13348,-36501,-17728,-852,-2802,28291,19496,11649,4952,-281,-26708,21102,-3132,20870,7134,23957,4131,-6871,10372,-7590,6299,19786,3464,-1570,9397,10598,-2349,-37170,45662,12754,-9925,-158978,-19101,-162288,-47070,58855,5514,68478,16325,-12582,15458,8637,-30612,29975,25236,73211,-63440,36300,-26640,24561,5880,14322,-21162,-33444,24578,15474,-5148,16873,-21734,5716,-5211,-29290,5900,24645,-6702,-15334,-69316,69282,62835,919,16882,334,-10025,8294,-1246,7960,25255,-4529,1887,-38389,47730,7591,-3593,-24883,25461,41576,1900,13792,11035,17552,14185,-8759,-4132,29686,-5084,-3691,11832,11731,13230,-9225,15141,6009,519,-6973,14485,-8526,24765,18451,-15876,3168,-5372,-15012,-9516,13441,-21389,19082,29911,4004,13022,33042,2375,5446,-58974,-1408,43127,-9137,22958,13667,1084,-13683,-31088,1216,-17430,12027,-21011,-14491,-69000,11645,70814,5403,8615,9829,-9819,-26565,3403,-36765,8407,-32789,52048,-8232,-61904,-49493,49407,-20525,33087,-5094,27065,38664,-4317,19420,3485,-39713,-37647,17580,-37310,-39942,-17115,15301,4363,34421,44340,12739,28472,10632,20377,4158,-19717,-43735,1164,-8977,54784,27445,-11603,12092,11057,3980,15589,-27515,27585,-32489,-26643,15557,45182,7782,16380,9578,-2170,-7088,3464,20786,-11494,5200,-10987,19390,-22442,24326,-48574,28421,16139,21724,-30652,7760,-26868,12020,19580,-1296,14703,-34583,-10639,-5703,14074,-43159,-17737,45644,11879,24318,12781,16488,21491,5219,-739,3994,-1494,9194,571,41828,14512,16203,12875,23331,2858,7876,4322,19778,13807,-32089,-3148,-15788,27055,-8266,51222,1342,-9950,-7950,27851,-17893,12527,-5005,7957,18549,-44665,11528,-45945,106,48676,12892,19699,-73149,38034,-5104,39202,-23811],"returnScale":1000000,"returns":[-197,169,267,765,-2300,-2454,11688,19387,-7562,6925,9657,2274,12331,8143,19268,10287,-21461,2847,30070,-26697,4394,-24241,8862,-11394,22522,-11868,-23665,-1058,-6272,19656,-22521,15204,29842,-22800,-76,3227,-26188,-57079,8251,-18735,4741,-4525,-2852,-3601,30740,6413,35933,9919,12055,-24804,35471,8720,-39463,-35600,15748,9709,-1491,-67520,-26300,19816,7660,-46487,-24655,35539,18409,23718,3283,-794,-7051,-8532,-4807,27515,17064,-21602,-16774,6864,3652,30828,-12980,-18438,-15862,-3197,26556,-5960,22788,5986,411,273,17042,-13814,1783,11676,-16032,-12620,21004,-3760,-6875,4145,9568,-4635,-40340,38928,7686,6679,-10778,46856,16611,2692,-4638,14477,-8640,-6008,12974,-10306,8469,12476,5735,16582,-6843,5579,-10243,16400,-1874,-12208,-6171,18839,17420,2213,-20333,2701,9507,-688,-3200,-2772,-29981,-1391,17228,-20245,-8521,5325,-17034,6008,4180,1252,1618,18283,3266,18115,13459,155,1316,16186,10573,-19839,-15988,9025,450,13848,579,-638,-9548,25139,5230,8294,2149,-43535,-52918,27923,6296,-36021,30551,-6369,-45156,19521,8962,10820,9319,10607,7683,18454,9525,-11608,-6164,-842,5866,-11566,-13140,10179,10248,1343,20651,-4967,-5749,-7073,1936,-5516,-18585,10176,19192,-1436,-7296,-46575,14066,-25342,15055,18243,-19802,-23165,24336,-41642,576,-46487,6129,19093,13060,27319,2662,8774,-1812,31594,2845,5479,-7457,25069,-15082,16070,22708,-5789,10841,9412,4622,-35860,16692,-12537,-25278,31640,1769,21545,-1186,18065,-6539,-2400,13348,-36501,-17728,-852,-2802,28291,19496,11649,4952,-281,-26708,21102,-3132,20870,7134,23957,4131,-6871,10372,-7590,6299,19786,3464,-1570,9397,10598,-2349,-37170,45662,12754,-9925,-158978,-19101,-162288,-47070,58855,5514,68478,16325,-12582,15458,8637,-30612,29975,25236,73211,-63440,36300,-26640,24561,5880,14322,-21162,-33444,24578,15474,-5148,16873,-21734,5716,-5211,-29290,5900,24645,-6702,-15334,-69316,69282,62835,919,16882,334,-10025,8294,-1246,7960,25255,-4529,1887,-38389,47730,7591,-3593,-24883,25461,41576,1900,13792,11035,17552,14185,-8759,-4132,29686,-5084,-3691,11832,11731,13230,-9225,15141,6009,519,-6973,14485,-8526,24765,18451,-15876,3168,-5372,-15012,-9516,13441,-21389,19082,29911,4004,13022,33042,2375,5446,-58974,-1408,43127,-9137,22958,13666,1084,-13682,-31088,1216,-17430,12027,-21011,-14491,-69000,11645,70814,5403,8615,9829,-9819,-26565,3403,-36765,8407,-32789,52048,-8232,-61904,-49493,49407,-20525,33087,-5094,27065,38664,-4317,19420,3485,-39713,-37647,17580,-37310,-39942,-17115,15301,4363,34421,44340,12739,28472,10632,20377,4158,-19717,-43735,1164,-8977,54784,27445,-11603,12092,11057,3980,15588,-27514,27584,-32488,-26643,15557,45181,7782,16380,9578,-2170,-7088,3464,20786,-11494,5200,-10987,19390,-22442,24326,-48574,28421,16139,21724,-30652,7760,-26868,12020,19580,-1296,14703,-34583,-10639,-5703,14074,-43158,-17737,45643,11879,24318,12781,16488,21491,5219,-739,3994,-1494,9194,571,41828,14512,16203,12875,23331,2858,7876,4322,19778,13807,-32089,-3148,-15788,27055,-8266,51222,1342,-9950,-7950,27851,-17893,12527,-5005,7957,18549,-44665,11528,-45945,106,48676,12892,19699,-73149,38034,-5104,39202,-23811]},"lttb":{"start":16408,"dateDeltas":[4,10,7,4,7,10,8,3,5,9,5,8,9,10,7,6,10,5,7,4,8,7,11,4,6,9,10,8,7,7,3,10,7,9,7,6,6,4,7,13,7,5,6,9,9,5,9,8,5,7,6,9,6,4,13,5,7,5,9,10,3,6,7,7,8,6,13,7,6,3,7,13,6,9,7,4,9,6,9,4,5,8,6,11,6,7,6,7,11,5,7,8,4,8,9,11,6,6,4,6,10,9,6,6,5,11,4,12,6,3,11,9,7,6,3,11,8,8,3,8,9,5,7,9,8,4,11,5,8,4,11,9,5,8,9,6,6,4,13,3,9,3,12,4,6,13,7,3,11,7,6,6,11,4,6,11,4,4,10,7,6,10,8,9,6,7,8,5,10,3,6,7,7,8,7,12,7,1,9,6,11,7,3,13,5,5,10,8,6,8,9,5,9,3,9,8,5,8,5,9,11,2,9,4,7,14,2,8,6,9,10,8,5,5,12,6,5,9,3,12,2,9,9,7,9,4,5,13,7,7,6,6,8,8,8,6,3,8,9,6,6,9,8,4,13,2,9,9,5,6,7,8,12,6,3,9,5,12,8,5,4,9,6,10,7,9,5,8,6,8,6,8,6,5,9,5,10,4,13,5,6,6,11,8,3,6,7,10,11,2,6,13,2,11,6,7,6,8,11,5,4,10,8,5,6,6,11,4,7,8,9,6,10,5,11,3,8,9,3,13,7,5,5,11,2,12,3,12,2,10,5,10,3,7,13,6,5,5,8,11,7,5,13,3,11,3,11,3,6,7,11,5,12,7,2,9,4,11,4,11,6,7,7,8,5,9,12,5,4,10,11,2,9,11,6,8,5,8,5,8,9,5,6,8,8,9,5,10,4,13,6,4,7,11,2,9,11,3,9,9,9,7,7,6,8,5,8,3,14,6,7,6,4,8,13,7,4,10,7,1,10,7,10,3,13,3,5,8,8,11,2,9,5,7,9,5,8,13,6,7,8,8,3,8,10,5,5,7,8,6,10,6,5,7,7,8,9,5,7,8,11,9,6,3,12,6,3,7,11,8,4,12,7,3,8,7,9,8,5,6,8,8,8,6,9,5,10,5,4,13,7,3,12,6,4,7,9,5,6],"priceScale":10000,"prices":[1000001,-262,389,790,256,-8970,6061,24377,9314,-12200,-698,17297,2265,6536,33608,11128,-24956,5099,30125,-26081,12612,-31501,-13049,8888,23434,2240,-40391,-9177,25210,-29800,-10032,32145,32530,-42800,28118,-39241,5455,-95833,45423,-21651,21772,-39181,-2593,37596,-5538,57726,13137,9447,-25476,32918,12441,-5903,-69460,25409,-16716,14344,-62578,-30531,-13992,42151,-69071,-19827,53791,-7182,47966,-15600,20557,-5706,-23305,5548,30819,16247,-46906,20162,-14138,39866,3587,-10950,-47333,52051,-65633,45975,-6023,22847,11917,-20862,30232,4371,-19177,18031,4620,-33612,27265,-21524,13720,-15380,21459,-6967,-40279,35395,11978,7662,-12581,46925,17841,5975,-9220,15610,-18007,-4154,18831,-17054,30560,13454,-9676,19165,-12721,-7189,18807,3026,-2604,-22850,30734,-6199,19941,-24305,5466,10053,-9403,222,15559,-43166,-1386,17266,-20213,-9924,6658,-16965,17044,-17022,13952,-985,20006,1752,19240,11425,7169,-9742,21004,10020,-36225,14134,-8123,18339,5071,6229,-19278,-3709,27144,-1041,21749,-8865,-90116,24629,7008,-35951,30552,-6440,-43948,11162,27115,-8739,21868,-8909,12027,32465,12590,-32896,13002,-7472,14534,-37068,3047,14514,16190,-5479,20774,4436,-31502,17543,662,-32597,10873,19742,-6494,11422,-58423,15961,-30886,250,35832,-20567,-26499,29021,9460,-62383,-47722,15693,-5401,40418,27163,-7112,33980,-17775,31304,3825,7944,-10612,31649,-25464,38901,5063,-7173,16642,9426,-39759,-13259,32732,-36948,31312,1304,27270,-14461,29747,-11906,-1239,15512,-1109,-68305,-5305,34348,-14615,39659,19739,-6685,9847,-42201,33161,-3287,20631,437,30305,6738,4412,-30999,20781,5997,19306,-7514,19928,-4596,14634,-29438,-10164,61654,5421,-177275,44427,-268083,-35333,126939,-39262,77904,-18194,32234,31530,-49663,-7452,44541,16950,73362,-71382,41200,-23749,42248,-23468,33274,-2782,-59044,57013,-17933,-8180,26197,-25806,13553,-44715,20025,-13067,33793,-31041,-72167,2708,138689,-6419,16692,-9431,10721,5700,-29778,33442,-8012,29825,5285,-47179,46264,17736,-11889,-28629,28748,39748,-536,29000,91,18373,-9172,16237,-12629,36042,-30922,20561,6135,18784,19441,-15347,15583,-11545,24867,-44634,44823,-8617,44012,-24800,12166,2575,-21696,-34774,43053,-37014,32063,-4283,29727,17650,31614,16649,-15905,-47807,-4070,46276,-33582,44964,30268,-28591,4893,-72868,63504,-44150,17632,-41107,-76954,-10951,98279,40625,-34055,20453,810,-69691,34797,-70443,55683,-45375,59319,-11076,-99909,-15915,52300,-41986,19364,53627,43214,-14248,30219,-1298,-6808,-82250,48532,-42759,-59607,43357,-41949,7001,66461,1150,62715,-12127,32061,12161,-28023,14635,-57259,-7813,54878,27517,-22354,20458,-2002,35446,-776,-28848,30231,-58700,18584,-11479,51547,8916,14301,-9809,18691,-29094,24124,22133,-38829,32632,-11182,25836,-35203,30641,-48928,28871,32834,-27601,22211,-40440,13121,25666,-14505,21828,-34723,-19276,-12805,39328,-2148,-67582,55718,-11082,34428,1243,3985,47869,11401,-6416,-2113,10923,-13375,18092,38469,32550,-10337,24258,21081,-5220,32816,-11780,32358,-32152,7206,-25502,32951,-25544,66220,5491,-5508,-33652,45401,-28936,29098,-13826,11756,14638,-45895,22306,-91605,33649,45740,15581,24668,-75285,41012,-8099,38804,-23413],"returnScale":1000000,"returns":[0,-262,389,790,256,-8970,6061,24377,9314,-12200,-698,17297,2265,6536,33608,11128,-24956,5099,30125,-26081,12612,-31501,-13049,8888,23434,2240,-40391,-9177,25210,-29800,-10032,32145,32530,-42800,28118,-39241,5455,-95833,45423,-21651,21772,-39181,-2593,37596,-5538,57726,13137,9447,-25476,32918,12441,-5903,-69460,25409,-16716,14344,-62578,-30531,-13992,42151,-69071,-19827,53791,-7182,47966,-15600,20557,-5706,-23305,5548,30819,16247,-46906,20162,-14138,39866,3587,-10950,-47333,52051,-65633,45975,-6023,22847,11917,-20862,30232,4371,-19177,18031,4620,-33612,27265,-21524,13720,-15380,21459,-6967,-40279,35395,11978,7662,-12581,46925,17841,5975,-9220,15610,-18007,-4154,18831,-17054,30560,13454,-9676,19165,-12721,-7189,18807,3026,-2604,-22850,30734,-6199,19941,-24305,5466,10053,-9403,222,15559,-43166,-1386,17266,-20213,-9924,6658,-16965,17044,-17022,13952,-985,20006,1752,19240,11425,7169,-9742,21004,10020,-36225,14134,-8123,18339,5071,6229,-19278,-3709,27144,-1041,21749,-8865,-90116,24629,7008,-35951,30552,-6440,-43948,11162,27115,-8739,21868,-8909,12027,32465,12590,-32896,13002,-7472,14534,-37068,3047,14514,16190,-5479,20774,4436,-31502,17543,662,-32597,10873,19742,-6494,11422,-58423,15961,-30886,250,35832,-20567,-26499,29021,9460,-62383,-47722,15693,-5401,40418,27163,-7112,33980,-17775,31304,3825,7944,-10612,31649,-25464,38901,5063,-7173,16642,9426,-39759,-13259,32732,-36948,31312,1304,27270,-14461,29747,-11906,-1239,15512,-1109,-68305,-5305,34348,-14615,39659,19739,-6685,9847,-42201,33161,-3287,20631,437,30305,6738,4412,-30999,20781,5997,19306,-7514,19928,-4596,14634,-29438,-10164,61654,5421,-177275,44427,-268083,-35333,126939,-39262,77904,-18194,32234,31530,-49663,-7452,44541,16950,73362,-71382,41200,-23749,42248,-23468,33274,-2782,-59044,57013,-17933,-8180,26197,-25806,13553,-44715,20025,-13067,33793,-31041,-72167,2708,138689,-6419,16692,-9431,10721,5700,-29778,33442,-8012,29825,5285,-47179,46264,17736,-11889,-28629,28748,39748,-536,29000,91,18373,-9172,16237,-12629,36042,-30922,20561,6135,18784,19441,-15347,15583,-11545,24867,-44634,44823,-8617,44012,-24800,12166,2575,-21696,-34774,43053,-37014,32063,-4283,29727,17650,31614,16648,-15904,-47807,-4070,46276,-33582,44964,30267,-28590,4892,-72867,63504,-44150,17632,-41107,-76954,-10951,98279,40625,-34055,20453,810,-69691,34797,-70443,55683,-45375,59319,-11076,-99909,-15915,52300,-41986,19364,53627,43214,-14248,30219,-1298,-6808,-82250,48532,-42759,-59607,43357,-41949,7001,66461,1150,62715,-12127,32061,12161,-28023,14635,-57259,-7813,54878,27517,-22354,20458,-2002,35445,-776,-28847,30230,-58699,18584,-11479,51546,8916,14301,-9809,18691,-29094,24124,22133,-38829,32632,-11182,25836,-35203,30641,-48928,28871,32834,-27601,22211,-40440,13121,25666,-14505,21828,-34723,-19276,-12805,39328,-2148,-67581,55717,-11082,34428,1243,3985,47869,11401,-6416,-2113,10923,-13375,18092,38469,32550,-10337,24258,21081,-5220,32816,-11780,32358,-32152,7206,-25502,32951,-25544,66220,5491,-5508,-33652,45401,-28936,29098,-13826,11756,14638,-45895,22306,-91605,33649,45740,15581,24668,-75285,41012,-8099,38804,-23413]},"monthly":{"start":16435,"dateDeltas":[31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,28,31,30,31,30,31,31,30,31,30,31,31,29,31,30,31,30,31,31,30,31],"priceScale":10000,"prices":[999154,20602,31203,22121,-18068,6671,-39138,28810,-76276,-23015,84235,31521,-52452,-65130,-19193,25741,5111,22540,-25533,26808,6313,-2114,-142,16161,51302,-2222,31717,19069,605,472,-25610,-14257,-2951,45369,31873,-8266,-4101,25739,-51628,-32939,39474,8428,-9982,40597,-21307,11037,-49609,-1439,-76795,64247,36392,22914,42987,-57234,52826,6353,-13396,39330,8741,38607,11444,-9831,-111243,-142958,77151,22558,29346,-16545,39180,-31754,-70122,139465,16989,-17061,26845,91488,21291,25610,31802,11643,27990,-39400,69999,-24644,74655,-27416,-65801,27870,-12530,-14923,-90780,99490,-57702,-76815,97722,80625,-75764,78497,14173,21832,32002,-21569,41750,22372,-16539,-37027,-36057,77149,47361,55902,54895,54864,-39294,43979,15223,9133,19778,-13803,-11139],"returnScale":1000000,"returns":[-847,20602,31203,22121,-18068,6671,-39138,28810,-76276,-23015,84235,31521,-52452,-65130,-19193,25741,5111,22540,-25533,26808,6313,-2114,-142,16161,51302,-2222,31717,19069,605,472,-25610,-14257,-2951,45369,31873,-8266,-4101,25739,-51628,-32939,39474,8428,-9982,40597,-21307,11037,-49609,-1439,-76795,64247,36392,22914,42987,-57234,52826,6353,-13396,39330,8741,38607,11444,-9831,-111243,-142958,77151,22558,29346,-16545,39180,-31754,-70122,139465,16989,-17061,26845,91488,21291,25610,31802,11643,27990,-39400,69999,-24644,74654,-27415,-65801,27870,-12530,-14923,-90780,99490,-57702,-76815,97722,80625,-75764,78497,14173,21831,32002,-21569,41750,22372,-16539,-37027,-36056,77148,47361,55902,54895,54864,-39294,43979,15223,9133,19778,-13803,-11139]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("Grawe Flex Bond Eur", {"daily":{"start":19387,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[999968,-7927,-1064,9343,-1354,44,44,-8544,-3113,-1511,2898,-4942,48,45,-14,-1704,-984,-2809,-5023,33,45,-549,-6250,-2115,2886,-730,49,45,-336,-252,-611,-1688,1474,48,45,2230,7184,123,339,1424,7,44,2757,-2217,-77,-803,884,179,45,-619,940,898,4055,701,43,44,727,-173,-469,-61,501,64,44,826,1162,1358,726,44,24,44,44,-1388,248,441,-1312,44,44,-904,406,-235,-106,-566,44,45,83,1756,118,-856,863,44,44,44,-218,1019,1021,2,-141,44,-330,587,2578,2324,642,9,43,-346,-68,-512,-1794,605,44,43,204,-1915,-1787,65,-1113,44,44,-11,945,31,684,1601,44,43,636,818,-261,-750,749,71,44,1390,707,723,54,1610,38,44,109,1771,764,807,2773,658,43,466,249,226,-1229,-1069,-1529,43,102,-878,-413,-4199,-1724,60,43,181,1546,3861,6372,803,-6,43,933,2230,1204,-502,-217,54,43,906,1085,564,1710,856,43,43,743,-1014,-1019,-1507,1120,43,43,262,1793,338,349,-507,108,42,-935,-1538,60,-1257,-163,117,43,-833,-18,2373,1171,-510,56,43,-4,970,760,344,168,74,43,-160,-226,-573,67,607,43,43,178,-378,-233,903,-655,-73,43,-582,-236,-5,-1948,-346,109,42,-2449,-2144,-1309,-5822,1164,-8,44,-3927,-2207,-1719,878,453,76,43,55,1413,2561,783,455,44,43,-46,-736,-989,-380,-246,16,44,-815,2137,60,611,1424,63,43,1116,765,1138,4512,2363,-23,43,873,602,934,580,185,80,43,-243,2352,1271,946,2215,42,43,1090,1298,1196,230,-517,42,43,880,1112,4579,735,3748,8,42,2988,3957,2610,834,-1254,42,41,-158,1409,1119,7592,3461,41,42,2032,568,1264,940,147,145,41,41,41,1117,818,-184,75,41,42,-1313,-1396,-1107,-2164,42,42,-223,-525,254,1121,1793,745,42,359,-728,-1038,-524,364,41,42,1548,-208,45,712,1562,41,42,1990,1385,2368,1365,-348,38,42,-1430,1054,681,-119,-560,43,42,427,-682,-134,896,-1393,49,45,-46,-135,-834,376,-143,45,46,-761,-41,-203,-88,-233,84,45,14,448,227,503,389,83,45,309,-647,333,-1128,-712,-176,45,92,-230,538,1455,947,-25,45,-310,-195,887,93,193,-206,46,45,-1197,-59,1003,-9,96,46,284,1650,-231,-1030,934,19,46,-795,-2386,796,1280,379,46,46,853,661,-624,-1407,875,18,46,2587,-476,50,-207,1801,45,46,572,2181,-531,-2877,144,45,46,-558,-99,5266,2397,-478,10,45,-322,-226,-477,-979,-106,46,45,118,373,-2009,377,749,218,46,352,-1,308,571,-1142,5,46,-1468,-308,2525,-602,-713,45,46,-158,13,-264,-381,34,46,45,-143,261,-373,-69,-166,46,45,-933,-358,958,301,608,46,46,882,-3,233,1134,217,159,46,-5,304,251,56,-340,74,45,25,-3,39,-552,134,156,43,1628,606,928,945,1288,43,43,-661,-416,-1059,200,98,43,44,293,713,303,-276,1281,43,43,632,3156,2971,1031,1296,43,42,-219,573,283,276,130,-25,43,68,121,220,934,1152,19,43,395,312,1095,320,715,42,43,834,943,442,518,-11,59,42,352,-80,-367,-68,277,55,43,419,1343,46,-258,-616,-53,43],"returnScale":1000000,"returns":[0,-7927,-1064,9343,-1354,44,44,-8544,-3113,-1511,2898,-4943,48,45,-14,-1704,-984,-2809,-5023,33,45,-549,-6250,-2115,2886,-730,49,45,-336,-252,-611,-1688,1474,48,45,2230,7184,123,339,1424,7,44,2757,-2217,-77,-803,884,179,45,-619,940,898,4055,701,43,44,728,-174,-469,-61,501,64,44,827,1162,1358,726,44,24,44,44,-1388,248,441,-1312,44,44,-904,406,-235,-106,-566,44,45,83,1756,118,-856,863,44,44,44,-218,1019,1021,2,-141,44,-330,587,2578,2324,642,9,43,-346,-68,-512,-1794,605,44,43,204,-1915,-1787,65,-1113,44,44,-11,945,31,684,1601,44,43,636,818,-261,-750,749,71,44,1390,707,723,54,1610,38,44,109,1771,764,807,2773,658,43,466,249,226,-1229,-1069,-1529,43,102,-878,-413,-4199,-1724,60,43,181,1546,3861,6372,803,-6,43,933,2230,1204,-502,-217,54,43,906,1085,564,1710,857,43,43,743,-1014,-1020,-1507,1120,43,43,262,1794,338,349,-507,108,42,-935,-1539,60,-1257,-163,117,43,-833,-18,2373,1172,-510,56,43,-4,970,760,344,168,74,43,-160,-226,-573,67,607,43,43,178,-378,-233,903,-655,-73,43,-582,-236,-5,-1949,-346,109,42,-2449,-2144,-1309,-5822,1164,-8,44,-3927,-2207,-1719,878,453,76,43,55,1413,2561,783,455,44,43,-46,-736,-989,-380,-246,16,44,-815,2137,60,611,1424,63,43,1116,765,1138,4512,2363,-23,43,873,603,934,580,185,80,43,-243,2352,1271,946,2215,42,43,1090,1298,1196,230,-517,42,43,880,1112,4579,735,3748,8,42,2988,3957,2611,834,-1254,42,41,-158,1409,1119,7592,3461,41,42,2032,568,1264,940,147,145,41,41,41,1117,818,-184,75,41,42,-1313,-1396,-1107,-2164,42,42,-223,-525,254,1121,1793,745,42,359,-728,-1038,-524,364,41,42,1548,-208,45,712,1562,41,42,1990,1385,2368,1365,-348,38,42,-1430,1054,681,-119,-560,43,42,427,-682,-134,896,-1393,49,45,-46,-135,-834,376,-143,45,46,-761,-41,-203,-88,-233,84,45,14,448,227,503,389,83,45,309,-647,333,-1128,-712,-176,45,92,-230,538,1455,947,-25,45,-310,-195,887,93,193,-206,46,45,-1197,-59,1003,-9,96,46,284,1650,-231,-1030,934,19,46,-795,-2386,796,1280,379,46,46,853,661,-624,-1407,875,18,46,2588,-476,50,-207,1801,45,46,572,2181,-531,-2877,144,45,46,-558,-99,5266,2397,-478,10,45,-322,-226,-477,-979,-106,46,45,118,373,-2009,377,749,218,46,352,-1,308,571,-1142,5,46,-1468,-308,2525,-602,-713,45,46,-158,13,-264,-381,34,46,45,-143,261,-373,-69,-166,46,45,-933,-358,958,301,608,46,46,882,-3,233,1134,217,159,46,-5,304,251,56,-340,74,45,25,-3,39,-552,134,156,43,1628,606,928,945,1288,43,43,-661,-416,-1059,200,98,43,44,293,713,303,-276,1281,43,43,632,3156,2971,1031,1296,43,42,-219,573,283,276,130,-25,43,68,121,220,934,1152,19,43,395,312,1095,320,715,42,43,834,944,442,518,-11,59,42,352,-80,-367,-68,277,55,43,419,1343,46,-258,-616,-53,43]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("Grawe Global", {"daily":{"start":18029,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[999797,3038,569,3689,-537,-40,-79,-3035,-5519,4336,-4887,-9446,-76,-76,2149,1238,-5407,465,-5418,-67,-76,-9790,1786,9238,4813,2973,-43,-76,1123,8854,799,-1437,3778,-78,-78,-1773,3476,9643,678,3658,-88,-78,-4928,-5122,-3995,-306,3247,-159,-77,8042,6724,5602,6650,444,-26,-69,-2426,-1693,-254,580,-545,-118,-68,3390,1455,74,-4977,1126,-187,-68,-2362,3215,9140,3577,-622,-61,-69,791,-945,-7629,-1717,-5391,-68,-68,-20611,-21708,1329,6989,10628,-110,-69,-7476,-1755,1134,-613,-10979,30,-67,15325,6114,-3519,5270,-6324,-12,-67,-9973,2496,2921,5139,9089,-39,-67,1878,4346,-1622,7995,6805,62,-68,1744,-2177,3165,6435,3618,-69,-70,-2966,-2150,710,1337,2343,120,-69,-703,-1755,-3534,-189,4440,-56,-70,-394,2176,-15606,-16285,4354,-68,-68,9519,-3111,-8226,6218,5978,-68,-68,10480,109,7210,-1999,-3369,-22,-70,-1438,4160,347,1894,4216,-29,-70,3228,3704,-961,-902,2017,192,-70,2712,5303,1979,3611,2784,-81,-72,825,1693,1961,-1322,208,-87,-72,3416,-1044,-729,-3803,-2049,173,-72,5659,8122,2907,2842,-1172,121,-72,-7256,-12014,-2995,4125,4307,-171,-72,6069,-2539,-929,2660,2078,-74,-72,5392,7549,-1164,694,4011,-200,-73,4918,62,-109,0,1469,-44,-74,-3872,-459,94,-6288,8492,-56,-70,-660,-4081,3212,7868,4072,65,-71,-219,1397,1069,-305,5526,21,-71,6484,1007,-2271,1165,-994,369,-71,-2918,-11442,7462,-1726,-7484,49,-71,-9204,8424,13438,12299,4159,-450,-72,-1550,4187,8838,6762,1275,-929,-74,2701,-949,487,2154,-7308,-91,-73,-15873,-31691,-20971,-15173,-40570,305,-65,-13752,11246,-1870,15459,-30390,-70,-64,-38887,-56105,12066,-35168,-60738,26,-53,23021,-51601,15735,-21519,10560,-51,-50,-13831,-2491,51485,19051,13128,-55,-55,-12375,14567,-9506,-19251,6826,-53,-54,4264,39842,4273,16395,-58,-58,-58,-117,8978,4562,-11427,5519,-58,-59,18868,-14558,-13583,13758,4233,-64,-59,5678,11394,8265,10764,-60,-61,-61,-28063,-3184,12058,186,9000,-146,-73,8182,-1770,-13272,-13490,-19,-48,-72,11805,19679,-7374,-1969,1337,-73,-73,9047,5120,5788,8963,-729,-116,-75,1514,749,11419,9670,3750,-77,-76,12030,2250,-8596,-9415,-37418,-68,-74,3223,11827,15284,2162,939,-73,-76,-3259,2569,-4798,-15167,6475,-75,-75,-6828,5854,9868,3688,5305,-68,-68,3287,6896,-6435,-906,-1455,-46,-68,11912,-6925,3733,5869,-839,-46,-69,3161,7061,-432,-4203,-8736,-69,-68,-11372,213,-1156,2441,-10273,-80,-67,671,12316,237,3243,992,-67,-68,2121,3325,3461,7587,-2954,-68,-70,-3397,757,-754,-457,286,-70,-71,3959,6346,3615,10105,-5925,-69,-70,-3151,-2572,5207,8061,-21313,-69,-69,-5036,-200,-7044,10264,-10690,-68,-67,2427,6852,3581,-2835,-4790,-68,-68,-10152,-8794,6219,-7409,1745,-87,-66,9743,9594,27,1126,1909,-68,-68,-553,9557,-3199,8494,8750,-69,-70,8205,7901,-3946,-2595,-4155,-67,-70,-4057,-6369,-1792,-7110,1526,-69,-69,-4528,-9142,-10720,-14805,-374,-67,-67,-414,15127,18860,15357,7164,-68,-70,8364,7063,6801,7310,-7101,-72,-72,8305,6000,-2210,-4077,2411,-73,-72,-825,5223,7911,311,-21,-98,-73,1322,-3020,3971,-4514,-573,-74,-73,5216,943,1534,-3978,-3304,-83,-73,-2404,218,8755,2604,2756,-75,-74,-4410,-4351,4117,-184,-70,-74,-74,8896,2849,-1329,-194,-2121,-70,-71,-2366,-1861,3750,11665,12873,-180,-72,7449,-2478,3933,2299,2322,190,-74,-7990,2634,4586,8397,-2276,-72,-73,-3645,0,-4998,-13507,-1585,-70,-72,-10733,20196,11293,5984,6926,-65,-74,4179,3862,-3838,-266,3598,-75,-75,6727,3599,-6489,-5287,-62,-75,-954,-9445,598,306,-12466,-85,-74,339,15892,-3506,-8824,-12200,-74,-73,16343,8591,8823,6394,3506,-77,-76,3495,5565,-1190,868,-4653,-92,-77,-904,2104,-4099,-4022,6162,-95,-77,12985,449,6322,611,-464,27,-78,-78,14959,-787,-1639,5290,-29,-80,2478,-2378,3958,-1054,5883,59,-80,4884,-10346,-9205,8330,-574,-175,-79,4757,2004,-1439,-649,-1160,-79,-80,-3640,226,-5100,7161,2562,-53,-79,5521,-11665,-13828,56,-1340,-415,-78,9648,-2624,-9188,-2158,10732,-87,-78,690,5036,121,4248,4217,567,-101,2849,-3360,5066,993,1859,33,-102,5686,579,75,-1373,3275,-61,-102,5559,973,-368,2472,1942,-102,-103,-9821,9001,3683,-3374,7545,-119,-103,2730,653,3856,-2672,5923,-86,-83,5131,406,-765,-1849,-10682,-374,-86,11659,8699,-3384,-302,-7520,-407,-87,-11238,-10055,8694,13320,7821,-145,-87,7872,-3700,-3614,2984,1059,4,-87,-4430,1664,6495,3362,6989,-74,-88,2980,3295,2718,4141,430,-89,-89,-1258,-1185,-4958,-3991,-3956,-115,-88,6633,6364,2528,361,-3641,-124,-89,7588,-22,-4977,3912,1049,-62,-90,-1115,2872,-4047,-3842,-4139,277,-88,-4243,3833,-3209,765,3238,421,-88,-13467,-10787,4408,11786,9386,-92,-89,-2591,-6893,-14065,760,-5018,-264,-85,-4046,-3192,8861,6175,7845,-8,-86,-1388,-2359,-1807,9756,12898,-86,-86,6436,1512,4017,3601,41,-88,-87,5067,2708,3938,-6281,10381,-496,-88,-54,9126,326,9222,5717,-89,-88,1262,-1825,-489,-2806,9191,-96,-88,6922,5740,5116,-1182,-440,-160,2454,-8090,-1393,3617,-11079,-89,-89,-23424,1733,-13964,-2929,-937,-87,-87,107,17866,-2997,18282,-7299,-86,1509,-8753,-6644,12542,-3824,-82,-86,-14403,-3043,15849,8941,128,-261,-87,8494,8461,-138,2199,-644,387,-84,-2927,2673,5436,-5386,-15610,-83,-83,-7133,-2223,8612,1708,-11757,-82,-83,-1244,-11306,-1067,-10645,-64,-81,-28342,-8161,4812,7795,-1584,-79,-79,10377,12661,5070,-6204,-16888,-83,-83,-180639,177499,20954,-10254,-63,-83,-13157,-3200,7492,-2409,-16006,-82,-82,-10794,-5476,-8680,-12527,11729,-80,-81,21422,-6190,-8501,9441,-10072,-80,-81,-15369,-26681,1720,19726,-3000,-60,-79,-5873,10210,13482,21257,12823,-83,-82,10996,4990,5866,-7272,7172,-84,-84,2648,6894,-90359,89626,-12349,-83,-84,10400,7931,-15764,-2922,-83,-84,-2130,-3178,-4639,8045,-425,-823,-84,-83,-1336,3717,6864,-17187,-83,-83,-14306,-253,2675,4015,5431,-128,-86,-16532,7005,-5297,7412,-13696,447,-84,-15834,-14931,10742,-10025,24868,-84,-84,-591,4310,-11437,-25181,-5108,-80,-82,10471,-19719,13817,14670,24915,-85,-84,10995,-9093,-2651,-167,980,-87,-84,8419,-204,-12416,-34006,-82,-82,-25561,-13586,5522,-28363,-1894,-78,-78,2527,9820,2354,-149,22372,-80,-80,8175,-1432,-8447,-11513,4925,50,80,3791,18746,20042,8680,-297,-82,-3050,-896,-15071,-9034,16088,-15,-82,6370,-1049,16862,4421,391,-91,-84,-967,-2360,9883,16626,11961,-92,-87,3033,0,8772,-2230,-855,-91,-87,5887,-9703,5783,10094,9245,-37,-88,23561,-6895,5664,-5760,-79,-89,-6770,-11735,5092,4810,-12584,-91,-88,-25171,-13604,-10359,-7549,12458,-121,-85,-8389,-229,-3345,17723,7040,-100,-85,9592,-17760,-14773,-4517,-20588,-80,-82,1429,-730,9833,-23768,-12551,-69,-81,1649,-3306,-15553,-266,-101,-81,-4130,24382,2703,7338,-20831,-74,-79,-8978,-5287,-5253,1317,5760,-77,-78,6457,4867,4965,566,-6100,648,-79,15720,11191,1985,-732,8734,-73,-82,13405,-502,-6053,-14342,-10016,-114,-80,6414,9176,-9400,18125,5999,-140,-83,435,3911,-12934,-7396,8460,-83,-83,5007,7230,6444,597,-1999,-90,-84,-6141,-11224,7529,15021,-5023,-160,-84,-10186,-18670,-6586,1233,4271,237,-82,-5069,15424,-1478,-35730,-12775,-588,-79,-7233,-4793,17044,-10618,-4476,-797,-78,-79,1076,-5476,4510,-5197,-93,-76,18030,-8290,8359,-4424,8176,-76,-77,9961,-13633,10885,5096,4333,1234,-78,4723,2262,-6310,-15231,2186,-71,-77,19729,-676,-7894,10869,10500,-74,-79,-3821,-3761,3037,25690,5508,-72,-80,-6016,2362,3120,-2371,-6644,-62,-80,8677,-1651,6960,1728,-14059,-83,-80,1720,-8162,-5978,166,-4216,-64,-80,4866,-2807,-11701,2302,18313,-78,-80,7596,-6344,-5579,2299,-25761,-131,-79,-25331,5947,-4009,12266,-4026,80,-77,-5583,8792,3894,-10458,-4302,-56,-76,8566,-2936,8074,6883,11801,-52,-77,5149,-5018,-4704,-1547,-73,-99,-77,-77,7875,-2043,-2531,6135,-78,-77,4976,3659,-811,-4458,-3033,-78,-78,-3692,-1771,-13554,2346,10692,-67,-78,-78,-4746,-906,-7544,8117,-245,-77,5497,2876,-492,1773,3919,-115,-78,3126,-614,1837,15428,2630,-78,-80,4796,-2652,-17138,4184,16157,-84,-81,4249,-2668,-6474,3132,21359,-83,-82,5374,2251,-1744,-6116,5617,-55,-83,2524,12470,579,-3618,5842,-118,-84,-8781,-3858,-7294,-1034,-1255,728,-82,-2812,-647,11683,5118,9148,-2135,-83,5055,815,-231,-18437,-2771,-60,-83,-5350,4570,5742,-71,-220,-154,-83,-1358,7035,10435,1038,1489,-69,-97,5122,6409,-3386,10798,-67,-99,2756,342,-11075,-8909,-2262,-101,-97,-3715,-1451,-2086,4322,-7061,-9,-97,7158,-7132,-2455,-9320,-10255,8,-95,768,11179,6481,-893,-1902,-71,-96,8116,11308,1346,8946,4700,-51,-98,2371,5599,-10021,-2052,2548,-107,-107,-124,594,-1043,12081,-4041,-230,-100,-4573,-6379,1859,-18338,-2813,-17,-98,-901,-8907,289,3396,3567,-181,-98,-1981,-14511,-4841,-675,5751,-67,-97,9038,16104,-3555,10259,-7414,-68,-98,4389,-1351,-5750,-15243,-22223,-144,-95,-6285,4377,-4813,-8301,-10207,-71,-94,-1118,9454,11747,20021,7327,-198,0,-1075,7689,-3866,3596,-1884,-46,-97,8625,8310,5993,-7542,3049,-107,-98,1279,758,9353,181,-2446,-105,-99,-797,-4073,1341,4873,14140,-124,-100,1359,4871,1996,1820,6261,-101,-101,6216,2522,3770,824,6921,-113,-102,499,2581,3906,-11672,4608,18,-103,-102,-98,-3187,3759,1276,-36,-103,-89,1034,-4686,-2457,-3287,-77,-88,2875,11729,915,-3345,8044,838,-90,2438,3405,-5658,3966,6927,-90,-90,13630,4449,5834,5088,1493,-84,-92,4233,4959,-6706,-6588,19816,-122,-93,1687,3492,5029,1415,2771,-99,-94,10587,-11839,-1055,8541,5861,-100,-94,-3002,-12810,-3297,21055,7175,-91,-96,-3794,-2512,1163,3802,8671,-39,-96,2606,-9300,2824,4613,1006,-57,-95,-9794,8722,1692,-931,-8999,-385,-95,11141,2976,5057,19288,269,-165,-98,-2948,1805,-1257,10668,73,-444,-98,-98,-11696,779,725,-11245,-23,-97,2985,-5961,5541,744,7452,-106,-97,-3695,-20942,-9992,1993,-12704,-84,-95,9,16298,1649,-14803,21969,-132,-96,235,-1992,-90,-11545,11717,-96,-96,10858,9965,611,2802,5051,-118,-98,-1429,-1523,9918,6763,-5538,-138,-98,7696,-2419,2237,-43,-5736,-98,-98,2595,-3034,-4915,-5627,-8795,109,-97,10567,-3574,15403,5479,7421,-170,-99,5871,386,7751,-330,3597,-60,-100,647,7340,2951,3799,-3731,-102,-101,1769,-1591,731,-284,5282,-106,-101,-7347,973,4389,3138,807,-112,-101,2510,1979,4740,-2133,6686,52,-103,1792,1203,-13041,-10490,-8752,-44,-101,4534,14048,-24958,-9199,1075,45,-111,4149,1141,15799,-11867,-57981,-106,-106,-36765,4735,22507,-654,7143,-100,-106,3735,13407,4505,24303,4541,-102,-109,3772,-2367,522,3082,-1024,-104,-109,1251,149,72,15455,-3429,-207,-110,9386,-13307,-19150,-10090,-20221,-141,-107,13912,4736,-6914,25249,12243,-137,-109,-5797,9253,-7516,18908,-7148,-91,-111,8532,1256,1459,1802,6531,-94,-112,-3227,691,5222,-3484,8644,-246,-112],"returnScale":1000000,"returns":[0,3039,569,3689,-537,-40,-79,-3035,-5520,4336,-4888,-9447,-76,-76,2149,1238,-5408,465,-5419,-67,-76,-9792,1786,9240,4814,2974,-43,-76,1123,8856,799,-1437,3779,-78,-78,-1774,3477,9645,678,3659,-88,-78,-4929,-5123,-3996,-306,3247,-159,-77,8044,6725,5604,6651,444,-26,-69,-2427,-1693,-254,580,-545,-118,-68,3391,1455,74,-4978,1126,-187,-68,-2362,3215,9142,3578,-622,-61,-69,791,-945,-7631,-1717,-5392,-68,-68,-20615,-21713,1329,6991,10630,-110,-69,-7478,-1755,1134,-613,-10981,30,-67,15328,6115,-3519,5271,-6326,-12,-67,-9975,2497,2921,5140,9091,-39,-67,1879,4347,-1623,7997,6806,62,-68,1745,-2178,3166,6436,3619,-69,-70,-2967,-2150,710,1337,2344,120,-69,-703,-1756,-3535,-189,4441,-56,-70,-394,2177,-15610,-16288,4355,-68,-68,9521,-3112,-8227,6219,5979,-68,-68,10482,109,7212,-2000,-3369,-22,-70,-1439,4161,347,1895,4216,-29,-70,3229,3705,-961,-902,2017,192,-70,2712,5305,1979,3612,2784,-81,-72,825,1694,1961,-1322,208,-87,-72,3417,-1045,-729,-3804,-2049,173,-72,5660,8124,2907,2843,-1172,121,-72,-7258,-12016,-2996,4126,4308,-171,-72,6070,-2539,-930,2661,2078,-74,-72,5393,7551,-1164,694,4012,-200,-73,4919,62,-109,0,1469,-44,-74,-3873,-459,94,-6289,8494,-56,-70,-661,-4081,3212,7870,4073,65,-71,-219,1397,1069,-305,5527,21,-71,6485,1008,-2272,1165,-994,369,-71,-2918,-11445,7464,-1726,-7486,49,-71,-9206,8426,13441,12301,4160,-450,-72,-1551,4188,8840,6764,1275,-929,-74,2701,-949,487,2154,-7309,-91,-73,-15876,-31698,-20975,-15176,-40578,305,-65,-13755,11248,-1870,15462,-30396,-70,-64,-38895,-56116,12068,-35175,-60750,26,-54,23026,-51611,15738,-21523,10562,-51,-50,-13834,-2492,51496,19055,13130,-55,-55,-12377,14570,-9508,-19255,6827,-53,-54,4265,39850,4274,16398,-58,-58,-58,-117,8980,4563,-11429,5520,-58,-59,18872,-14561,-13586,13761,4234,-64,-59,5679,11396,8267,10766,-60,-61,-61,-28069,-3184,12060,186,9002,-146,-73,8184,-1771,-13275,-13492,-19,-48,-72,11807,19683,-7375,-1970,1337,-73,-73,9049,5121,5789,8965,-729,-116,-75,1514,750,11421,9672,3751,-77,-76,12032,2250,-8597,-9417,-37426,-68,-74,3224,11829,15287,2163,939,-73,-76,-3260,2570,-4799,-15170,6476,-75,-75,-6829,5855,9870,3689,5306,-68,-68,3287,6898,-6437,-906,-1455,-46,-68,11914,-6926,3734,5870,-839,-46,-69,3161,7063,-432,-4204,-8738,-69,-68,-11374,213,-1156,2441,-10275,-80,-67,671,12319,237,3243,992,-67,-68,2122,3326,3461,7589,-2955,-68,-70,-3398,758,-755,-457,286,-70,-71,3960,6347,3616,10107,-5926,-69,-70,-3152,-2572,5208,8063,-21318,-69,-69,-5037,-200,-7045,10266,-10692,-68,-67,2427,6853,3582,-2835,-4791,-68,-68,-10154,-8796,6220,-7410,1745,-87,-66,9745,9596,27,1126,1909,-68,-68,-553,9559,-3199,8495,8752,-69,-70,8207,7902,-3947,-2595,-4156,-67,-70,-4058,-6370,-1792,-7112,1526,-69,-69,-4528,-9144,-10722,-14809,-374,-67,-67,-414,15130,18864,15360,7166,-68,-70,8365,7065,6802,7312,-7103,-72,-72,8307,6001,-2210,-4078,2411,-73,-72,-825,5224,7913,311,-21,-98,-73,1322,-3020,3971,-4515,-573,-74,-73,5217,944,1534,-3979,-3305,-83,-73,-2404,218,8757,2604,2757,-75,-74,-4411,-4352,4118,-184,-70,-74,-74,8898,2849,-1329,-194,-2122,-70,-71,-2366,-1862,3751,11668,12875,-180,-72,7451,-2479,3934,2299,2323,190,-74,-7992,2635,4587,8398,-2276,-72,-73,-3646,0,-4999,-13510,-1585,-70,-72,-10735,20200,11295,5986,6927,-65,-74,4180,3863,-3839,-266,3598,-75,-75,6729,3600,-6491,-5288,-62,-75,-954,-9447,598,306,-12468,-85,-74,339,15895,-3507,-8826,-12202,-74,-73,16346,8593,8825,6395,3507,-77,-76,3495,5567,-1191,869,-4654,-92,-77,-905,2105,-4100,-4023,6163,-95,-77,12988,449,6323,611,-464,27,-78,-78,14962,-787,-1639,5291,-29,-80,2478,-2378,3959,-1054,5884,59,-80,4885,-10348,-9207,8331,-574,-175,-79,4758,2005,-1440,-649,-1160,-79,-80,-3641,226,-5101,7163,2562,-53,-79,5522,-11667,-13831,56,-1340,-415,-78,9650,-2625,-9190,-2158,10734,-87,-78,690,5037,121,4249,4218,567,-101,2850,-3361,5067,993,1860,33,-102,5687,579,75,-1373,3275,-61,-102,5560,974,-369,2473,1942,-102,-103,-9823,9003,3684,-3375,7547,-119,-103,2730,653,3857,-2672,5924,-86,-83,5132,406,-765,-1850,-10684,-374,-86,11661,8701,-3384,-302,-7522,-407,-87,-11240,-10057,8695,13323,7823,-145,-87,7873,-3701,-3614,2984,1059,4,-87,-4430,1664,6496,3363,6990,-74,-88,2981,3296,2718,4142,430,-89,-89,-1258,-1185,-4959,-3992,-3957,-115,-88,6634,6366,2528,361,-3642,-124,-89,7590,-22,-4978,3913,1049,-62,-90,-1115,2872,-4048,-3842,-4140,277,-88,-4244,3834,-3210,765,3239,421,-88,-13470,-10789,4409,11788,9388,-92,-89,-2591,-6895,-14068,761,-5020,-264,-85,-4046,-3193,8863,6176,7847,-8,-86,-1389,-2359,-1808,9758,12901,-86,-86,6437,1513,4017,3602,41,-88,-87,5068,2709,3939,-6283,10383,-496,-88,-54,9128,326,9224,5718,-89,-88,1262,-1825,-489,-2807,9193,-96,-88,6924,5741,5117,-1182,-441,-160,2455,-8092,-1393,3618,-11081,-90,-89,-23428,1733,-13967,-2929,-938,-87,-87,107,17870,-2998,18286,-7300,-86,1509,-8755,-6645,12544,-3824,-82,-86,-14406,-3044,15852,8943,128,-261,-87,8496,8462,-138,2200,-644,387,-84,-2928,2674,5437,-5387,-15613,-83,-83,-7135,-2223,8613,1709,-11760,-82,-83,-1244,-11308,-1067,-10648,-64,-81,-28347,-8163,4813,7797,-1585,-79,-79,10379,12664,5071,-6205,-16892,-83,-83,-180676,177536,20958,-10256,-63,-83,-13160,-3201,7494,-2410,-16009,-82,-82,-10796,-5477,-8682,-12530,11732,-80,-81,21426,-6191,-8503,9443,-10074,-80,-81,-15372,-26686,1720,19730,-3001,-60,-79,-5874,10212,13485,21261,12826,-83,-82,10998,4991,5867,-7273,7173,-84,-84,2649,6895,-90377,89644,-12352,-83,-84,10402,7933,-15767,-2923,-83,-84,-2130,-3179,-4640,8047,-425,-823,-84,-83,-1337,3718,6865,-17190,-83,-83,-14309,-253,2676,4015,5432,-128,-86,-16535,7006,-5298,7414,-13699,447,-84,-15837,-14934,10744,-10027,24873,-84,-84,-591,4311,-11439,-25187,-5109,-80,-82,10473,-19723,13820,14673,24920,-85,-84,10998,-9095,-2652,-167,980,-87,-84,8421,-204,-12419,-34013,-82,-82,-25566,-13588,5523,-28369,-1895,-78,-78,2528,9822,2354,-149,22377,-80,-80,8177,-1433,-8448,-11516,4926,50,80,3792,18750,20046,8682,-297,-82,-3051,-896,-15074,-9036,16091,-15,-82,6371,-1049,16866,4422,391,-91,-84,-968,-2360,9885,16629,11964,-92,-87,3033,0,8774,-2230,-856,-91,-87,5889,-9705,5784,10096,9247,-37,-88,23566,-6897,5665,-5761,-79,-89,-6771,-11738,5093,4811,-12586,-91,-88,-25176,-13607,-10361,-7551,12461,-121,-85,-8391,-229,-3346,17727,7041,-100,-85,9594,-17763,-14776,-4518,-20592,-81,-82,1430,-730,9835,-23773,-12554,-69,-81,1650,-3307,-15556,-266,-101,-81,-4131,24387,2703,7340,-20835,-74,-79,-8980,-5288,-5254,1317,5761,-77,-78,6458,4868,4966,566,-6101,648,-79,15723,11194,1985,-732,8736,-73,-82,13407,-502,-6054,-14345,-10018,-114,-80,6415,9178,-9402,18129,6000,-140,-83,435,3912,-12937,-7397,8462,-83,-83,5008,7231,6445,598,-2000,-90,-84,-6142,-11226,7530,15024,-5024,-160,-84,-10188,-18674,-6587,1233,4272,237,-82,-5070,15427,-1478,-35737,-12778,-588,-79,-7235,-4794,17048,-10620,-4477,-797,-78,-79,1076,-5477,4511,-5198,-93,-76,18033,-8291,8360,-4425,8178,-76,-77,9963,-13636,10887,5097,4334,1235,-78,4724,2262,-6311,-15234,2186,-71,-77,19733,-676,-7896,10872,10502,-74,-79,-3822,-3762,3038,25695,5509,-72,-80,-6017,2362,3121,-2372,-6645,-62,-80,8679,-1652,6962,1728,-14062,-83,-80,1721,-8164,-5979,166,-4217,-64,-80,4867,-2808,-11703,2302,18317,-78,-80,7598,-6346,-5580,2300,-25766,-131,-80,-25336,5949,-4010,12268,-4027,80,-77,-5584,8794,3895,-10460,-4303,-56,-76,8568,-2937,8076,6884,11803,-52,-77,5150,-5019,-4705,-1547,-73,-99,-77,-77,7877,-2044,-2531,6136,-78,-77,4977,3660,-811,-4459,-3034,-78,-78,-3693,-1771,-13557,2347,10694,-67,-78,-78,-4747,-906,-7546,8119,-245,-77,5498,2876,-492,1774,3919,-115,-78,3127,-614,1837,15431,2631,-78,-80,4797,-2653,-17141,4185,16160,-84,-81,4250,-2669,-6475,3133,21363,-83,-82,5375,2251,-1744,-6117,5618,-55,-83,2524,12473,579,-3619,5844,-118,-84,-8783,-3859,-7296,-1034,-1255,728,-82,-2812,-648,11686,5119,9150,-2136,-83,5056,815,-231,-18440,-2772,-60,-83,-5351,4571,5743,-71,-220,-154,-83,-1358,7036,10437,1038,1490,-69,-97,5123,6410,-3387,10801,-67,-99,2756,342,-11077,-8911,-2262,-101,-97,-3716,-1451,-2087,4323,-7062,-9,-97,7159,-7133,-2456,-9322,-10257,8,-95,768,11181,6483,-893,-1903,-71,-96,8118,11310,1346,8948,4701,-51,-98,2372,5600,-10023,-2053,2549,-107,-107,-124,594,-1043,12083,-4042,-230,-100,-4574,-6380,1859,-18341,-2814,-17,-98,-901,-8909,289,3397,3568,-181,-98,-1982,-14514,-4842,-675,5752,-67,-97,9040,16107,-3555,10261,-7416,-68,-98,4390,-1351,-5751,-15247,-22227,-144,-95,-6286,4378,-4814,-8303,-10209,-71,-94,-1118,9455,11750,20025,7328,-198,0,-1075,7691,-3867,3597,-1885,-46,-97,8627,8312,5994,-7544,3050,-107,-98,1279,758,9355,181,-2446,-105,-99,-797,-4074,1341,4874,14143,-124,-100,1359,4872,1996,1821,6262,-101,-101,6217,2523,3771,824,6922,-113,-102,499,2582,3907,-11675,4609,18,-103,-102,-98,-3188,3760,1276,-36,-103,-89,1035,-4687,-2458,-3288,-77,-88,2876,11731,916,-3346,8046,838,-90,2438,3406,-5659,3967,6928,-90,-90,13633,4450,5835,5089,1493,-84,-92,4234,4960,-6707,-6590,19820,-122,-93,1688,3492,5030,1416,2771,-99,-94,10589,-11841,-1055,8542,5863,-100,-94,-3003,-12813,-3297,21059,7176,-91,-96,-3794,-2513,1163,3803,8673,-39,-96,2606,-9302,2825,4614,1006,-57,-95,-9796,8724,1692,-931,-9001,-385,-95,11143,2977,5058,19292,269,-165,-98,-2949,1806,-1258,10671,73,-444,-98,-98,-11699,779,725,-11247,-23,-97,2986,-5962,5542,744,7453,-106,-97,-3695,-20947,-9994,1994,-12707,-84,-95,9,16301,1650,-14806,21973,-132,-96,235,-1992,-90,-11548,11720,-96,-96,10860,9967,611,2803,5052,-118,-98,-1430,-1523,9920,6764,-5539,-138,-98,7698,-2420,2238,-43,-5737,-98,-98,2595,-3035,-4916,-5628,-8796,109,-97,10569,-3575,15406,5480,7423,-170,-99,5872,386,7752,-330,3598,-60,-100,647,7342,2951,3800,-3732,-102,-101,1770,-1592,732,-285,5284,-107,-101,-7348,973,4390,3139,807,-112,-101,2510,1980,4741,-2134,6688,52,-103,1792,1203,-13043,-10493,-8753,-44,-101,4535,14050,-24963,-9201,1076,45,-111,4150,1141,15802,-11869,-57993,-106,-106,-36773,4736,22512,-654,7144,-100,-106,3736,13410,4505,24308,4542,-102,-109,3773,-2367,522,3082,-1024,-104,-109,1251,149,72,15458,-3429,-207,-110,9388,-13310,-19154,-10092,-20225,-141,-107,13915,4737,-6916,25254,12246,-137,-109,-5798,9254,-7517,18912,-7150,-91,-111,8534,1256,1460,1802,6532,-94,-112,-3227,691,5223,-3485,8646,-246,-112]}});
\ No newline at end of file
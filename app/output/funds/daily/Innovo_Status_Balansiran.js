@@ -0,0 +1 @@
+registerFundSeries("Innovo Status Balansiran", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[288541,470,136,-20,-11,376,-336,749,359,556,8,-12,518,-703,667,148,-335,-4,-11,1167,391,325,-12,645,3,-12,-34,-168,-57,-857,261,5,-12,457,296,695,1733,943,-8,-12,-166,142,1694,424,-915,-16,-12,-426,711,-866,-635,-331,-1,-12,-701,169,-1048,311,826,-12,-12,-265,567,4,-897,-1848,-14,-11,1450,-1,-987,417,47,-14,-20,-383,-1358,50,-96,-468,-139,-12,-128,1093,-203,6,-379,383,-12,1821,4232,226,26,31,3,-9,-303,-401,-1726,-171,16,-9,922,-365,211,46,-24,-2,-9,-510,-1053,66,-676,304,-7,-9,195,-125,209,48,0,56,-9,149,452,249,-196,-1648,-33,-9,9,-144,-13,-194,164,-14,-9,-241,-461,51,-494,270,-9,-8,-249,-3993,211,1157,158,-18,-8,-285,-60,-2528,1650,3605,288,-9,-2548,1671,-361,596,1619,-21,-9,954,-117,-151,-64,-56,-13,-9,-503,26,-705,-207,1494,-179,-9,-525,-521,719,3,-7,-1,-9,-667,158,253,592,-166,-9,-9,-9,-1311,567,575,557,-38,-9,-162,-20,-87,-293,-159,11,-8,-596,108,-420,72,7,-7,-8,136,206,-190,-115,-821,-48,-8,-362,-577,1166,1201,1415,-30,-8,389,-81,581,-70,159,73,-8,-121,31,-1007,699,-140,-8,-7,612,-276,69,102,280,-4,-8,-348,-11,-168,130,-847,-16,-7,389,-684,211,84,1013,-7,-8,-35,429,-888,645,43,-9,-8,-1501,320,-351,-101,-324,-12,-7,-231,449,-280,-26,3102,-3,-7,606,-4522,-873,137,-250,-7,-6,2456,-212,30,-65,-217,-25,-7,-838,-316,555,429,-596,-258,-7,-384,-186,-144,834,-226,-26,-7,191,-18,-64,249,-208,-7,-6,-46,580,213,-136,115,-1,-7,-759,100,-3388,-74,-320,-6,-7,2475,132,-70,177,328,98,-7,-31,-71,-121,59,124,3,-6,-181,-1263,197,408,-344,9,-6,680,358,149,-299,-79,-4,-6,-486,53,1709,-953,491,-7,-7,174,-671,-111,2,-20,-66,-7,-79,410,640,93,-98,-58,-7,355,28,-101,16,-191,-7,-6,-274,-82,5,261,566,-91,-7,480,611,-255,-450,-169,-29,-8,-907,-71,-185,-408,-648,35,-9,186,-119,-235,-48,280,-18,-5,796,376,760,-2,172,29,-4,392,-436,6,-398,-281,45,-4,-693,711,53,383,124,-1,-5,153,347,74,-41,106,-1,-4,-215,-143,224,274,-280,-59,-5,527,193,437,22,-25,-4,-5,521,-43,0,-474,-528,14,-5,-676,-236,137,-273,77,140,-5,-689,92,506,-87,-16,-6,-5,-70,201,-124,51,231,5,-6,954,259,-48,-53,-168,-8,-5,-432,-275,-126,188,8,-5,-5,-549,-102,-99,891,-274,2,-6,-88,51,-395,-188,49,-6,-5,396,503,60,-417,138,-37,-6,27,-58,52,95,159,-12,-5,-742,-320,-667,-357,141,-2,-6,169,-184,472,-133,-131,-23,-6,172,280,439,-52,-62,-10,-6,-19,56,15,-149,-441,-7,-6,123,-239,-81,-229,219,12,-6,-45,308,151,-70,7,-5,-6,278,-113,351,-41,1,-6,-6,-6,-407,-1015,23,41,-10,-6,-63,-297,-1239,45,-173,-6,-6,-295,566,1177,-2206,61,-9,-5,-252,19,2041,-160,-190,-7,-6,410,-973,67,-385,12,-9,-6,-366,-435,-663,635,1479,-11,-6,-96,-305,-667,-877,846,-7,-6,-1359,-91,209,-90,-356,-8,-6,694,813,240,2943,350,-3,-7,517,-3265,1158,1822,343,-187,-7,182,59,337,-1400,367,-2,-7,45,-4567,-579,389,5192,-42,-6,183,-20,262,55,-1715,-14,-6,74,-6,-70,4,254,5,-7,-624,180,467,218,258,-12,-7,-124,-78,235,265,427,-11,-8,-134,771,137,1032,669,-5,-8,-118,-323,188,719,381,13,-8,-194,-289,116,-85,108,-8,-8,251,-186,-56,-324,-4964,-27,-8,6785,-2366,1304,-76,80,-5,-8,275,-191,-130,-193,284,-8,-8,-23,-165,354,495,46,-18,-8,12,-36,178,124,-11,-4,-8,-335,340,997,361,782,-13,-8,41,817,732,424,154,91,-9,205,350,285,-319,13,-23,-8,-92,144,42,-54,258,0,-9,2454,682,2242,2207,2955,5,-10,-53,-1006,86,411,-11,-17,-10,468,0,63,-389,-1026,-30,-10,-19,134,-990,-1233,1185,-23,-9,-342,-589,-1234,-932,372,-27,-10,-638,-88,1604,600,361,-19,-9,-588,2615,-697,-955,375,-1,-10,-9,632,179,330,-30,-9,-9,556,458,-456,233,107,-10,-9,-13,810,302,162,-167,-13,-10,-722,-191,353,665,479,-10,-10,-599,426,-245,-247,-3203,-19,-10,435,-18,447,183,166,-208,-10,341,21,-961,-337,348,0,-10,260,-197,354,-223,-21,8,-10,226,1468,535,87,104,-16,-10,313,-2958,7,-96,251,-7,-9,2820,489,776,-2156,607,136,-9,172,-19,25,-306,300,15,-9,-849,-373,41,-381,547,-9,-9,-497,726,-456,-341,-591,-27,-10,189,-5,466,-217,-70,-9,-9,-10,149,94,102,-216,44,-10,1079,502,315,287,-549,32,-9,-10,1764,-68,1075,-32,37,-10,501,-559,529,188,-1050,-1,-9,-534,-1003,785,824,593,-107,-9,3725,-432,-42,549,-555,105,-11,-137,-1153,1360,1475,-751,-11,-12,99,-471,483,-62,3888,-46,-12,-547,1224,299,100,-2539,-13,-11,-182,1153,736,-485,727,-15,-12,1307,794,-388,2952,2249,-8,-13,-2097,1501,97,-317,-166,-95,-13,729,277,1574,1235,184,-1,-14,-152,-82,-1392,1076,1418,-50,-14,1362,401,-298,-299,1283,91,-14,-1698,818,-518,356,397,-12,-14,274,297,1180,434,-692,-11,-14,-851,-737,370,-188,49,-12,-14,325,355,-454,-83,-246,176,-13,784,-1110,358,1170,-99,-7,-14,68,558,462,-1009,-5717,-14,-13,-46,-695,1739,-733,3,-38,-14,-91,185,228,-354,-948,-103,-13,551,950,1141,478,269,-16,-13,-307,-842,-1273,-658,1015,-3,-14,356,153,-2261,1197,-1361,-41,-13,627,-389,-418,-1494,-153,0,-13,192,-2321,-634,-925,-275,-28,-13,-241,2381,-986,-994,584,-27,-13,-118,-581,66,-70,203,-4,-13,20,1252,49,-1250,-989,-17,-13,-185,43,-940,-287,-332,35,-13,-714,138,-40,3441,-262,42,-13,269,-715,586,-216,-339,-13,-13,632,38,441,782,-1268,-13,-13,3630,-298,1176,345,437,-6,-14,739,1043,-1017,3609,620,-31,-14,-14,-527,-144,305,-189,-14,-14,-54,-72,629,-290,-1613,-4,-14,-174,-376,275,539,73,-14,-14,-1556,158,-328,373,1889,-28,-14,-185,1591,2695,330,-37,130,-15,-1062,-2254,-1659,123,526,-14,-15,-174,308,-533,-425,2418,-11,-14,186,-253,1995,-1645,604,-12,-14,1240,-117,230,408,-518,-90,-15,-28,-125,131,-770,843,-87,-14,-30,235,656,-130,-70,-9,-15,-195,-307,-290,185,-939,-16,-14,283,-205,-291,26,403,-12,-14,276,-547,478,19,-142,-15,-15,-15,-160,-716,-34,-1902,-19,-15,2267,195,181,410,39,-15,-14,-153,161,-223,443,659,-3,-15,300,-21,1533,405,-2291,-28,-15,67,1601,-205,-685,-56,17,-15,-19,-318,-170,441,-254,-26,-15,76,-155,261,52,-3708,-15,-14,43,-103,479,1755,602,-12,-15,95,439,740,-924,-894,-38,-15,-1065,-165,639,1178,-913,-15,-14,-497,1632,1225,1029,2870,-12,-15,2622,-881,1617,-1913,1042,-4,-13,641,-170,-2333,-361,-158,-48,-13,-175,-93,880,-34,-324,-50,-14,-607,-249,292,1127,641,-36,-13,245,1003,567,-15,92,-13,-13,121,-295,252,-30,-292,-13,-13,96,-164,146,-311,-957,-31,-14,-189,-90,95,458,-489,28,-13,277,-383,-590,-470,392,-14,-13,516,1911,54,716,430,2,-14,-59,469,198,555,-465,-13,-14,265,-89,739,-324,469,1,-13,-425,186,-237,461,170,-14,-13,78,52,-338,383,2299,-19,-14,-1579,-288,-916,-1588,-1676,-15,-14,-1356,2601,573,-115,-241,-14,-13,-875,100,-427,651,1386,-12,-13,4895,-529,-775,-1049,-643,-14,-14,251,69,3408,-3,-407,-14,-14,415,597,-575,702,401,-15,-15,-28,667,-507,-511,-308,-9,-14,-719,-1461,167,-1379,9818,-10015,-13,462,-1870,217,335,1601,-11,-14,118,2,1150,-658,24,-14,-13,-77,520,611,-196,-436,-14,-14,-155,-354,3358,-733,-557,-20,-17,-287,835,-1104,991,3037,-4,-17,-39,-17,372,162,316,-11,-17,-62,-83,900,-98,425,-16,-17,233,223,-25,-52,-717,-57,-17,-342,-44,-815,423,127,64,-17,-252,385,-100,47,125,30,-17,-565,-80,-300,157,190,-17,-18,-388,-52,-180,621,106,-41,-18,-525,959,1182,692,-969,-67,-18,813,-1047,-75,-181,398,-7,-18,433,-1110,173,-443,114,-202,-18,-25,-138,-70,166,607,-32,-18,467,2929,-1775,-504,-869,-21,-17,948,315,-278,-1191,2161,79,-18,750,-468,435,-125,-1253,-16,-18,-345,-150,552,-242,-244,-17,-18,-386,-406,-284,1358,-213,20,-18,-54,-1176,116,44,-5,-17,-18,-18,-1988,-10,-245,-255,-17,-18,260,-683,287,733,726,-21,-18,340,510,296,-258,833,22,-18,697,597,-186,905,-22,-18,-18,-55,-435,73,-456,-109,-25,-18,83,74,1560,147,-224,-10,-18,-134,-267,-380,-2202,-145,-18,-18,-292,-63,167,68,191,-21,-18,98,-136,689,65,5853,-40,-19,-222,-1940,-134,-323,-114,-8,-18,-810,184,69,150,113,-31,-18,128,-141,-34,-172,166,-49,-18,315,77,-146,-39,258,-17,-19,488,1347,378,-831,-513,-18,-19,258,327,-588,952,139,-30,-19,1046,1113,-198,-1970,-244,8,-19,87,719,1220,-171,780,-5,-19,-640,209,-1485,-49,391,-12,-19,-308,147,858,126,-106,14,-19,-122,159,128,-484,-146,-19,-18,973,-231,-306,-131,219,29,-19,1458,164,-1011,-139,17,-16,-19,-1682,122,260,-213,-2100,-18,-19,1614,-1586,1295,1363,817,-19,-19,-2404,-1307,114,-46,-678,-7,-18,-2295,157,3,1847,97,-6,-16,627,-1525,172,-255,-527,48,-15,-140,318,1454,69,-219,-18,-16,-128,-104,-143,-26,-408,-19,-15,-32,299,-781,165,502,42,-15,-354,334,193,23,4,29,-15,-289,428,403,-85,294,-39,-15,-11,-1032,108,-183,-39,-19,-19,98,-586,1056,2301,-212,-48,-19,171,318,-203,527,106,-12,-19,2871,-68,18,101,-16,-16,-19,-17,-1364,-288,593,1033,15,-16,2221,-445,-540,-315,-635,6,-16,474,622,757,-149,-788,83,-16,-593,555,-388,-159,849,11,-16,-344,24,-322,88,-552,-99,-16,1244,420,-186,-65,-549,-203,-16,690,-89,-1140,6,-36,-21,-16,523,-1234,-2312,-1889,177,76,-16,2873,719,550,857,-1037,-18,-16,-6036,-67,-1335,-7726,-164,9,-14,-8439,-2536,-2766,-7205,1710,-13,-13,-2758,1118,1854,-3788,-2961,-13,-12,2416,6701,-3728,-1791,3940,-13,-13,2248,2307,664,642,87,-14,-13,346,918,-2886,843,-12,-13,-14,-13,-3796,512,830,8852,-16,-13,1786,3025,1394,457,-14,-14,-14,-2627,-1011,355,-301,1274,-34,-14,339,-71,596,-322,-116,-8,-14,-45,326,-62,52,772,-14,-14,-3,-832,-367,-466,483,-24,-9,-1572,-244,1662,-168,-433,-13,-14,-1333,1092,-970,52,-2019,-12,-13,306,385,166,466,-49,-13,-14,-430,425,-785,1056,-360,-12,-13,-998,590,91,-248,615,-12,-13,-72,-102,-317,792,-706,-6,-13,1284,169,1229,-58,209,-7,-12,706,227,594,174,161,-13,-13,123,244,590,559,-206,-16,-12,441,-352,96,-3820,1789,-12,-13,-1030,204,51,-1146,1241,-13,-12,-90,-616,638,127,1106,-12,-13,-331,401,171,-105,-970,-12,-13,950,-36,683,1334,31,-13,-13,523,-19,664,133,1233,-13,-13,-1148,3068,1021,346,748,-14,-13,-2538,141,684,-580,471,-18,-14,-1418,-1319,2073,605,-1513,-18,-18,-66,-1197,893,-2180,1462,-18,-18,-483,-898,76,-869,-130,-18,-19,-678,-875,-827,745,-693,-19,-19,-482,128,8,-1900,2088,-12,-13,152,-1010,-122,-260,-5714,-11,-12,272,556,384,120,-320,-8,-8,-328,554,369,-1079,2486,-8,-8,-809,1292,-2268,562,-2224,-13,-8,-973,510,1704,-15,-1236,-8,-8,136,673,2504,-630,197,-25,-9,-489,-194,291,448,1922,-8,-9,367,-131,-91,150,572,-9,-8,386,1634,713,21,-462,-9,-8,-36,3116,-1100,788,-1223,-33,-8,-308,-165,706,1840,2064,49,-9,151,3096,4547,2720,-1202,-10,-9,-354,859,-950,1381,-1145,-9,-9,-672,-114,995,-1301,-890,-7,-9,584,402,1223,-1914,2371,-13,-12,1103,4401,1091,-553,-264,-11,-13,-678,714,-387,-1383,101,-16,-12,530,-1042,-199,-108,-858,-13,-12,132,19,31,431,95,-13,-12,-2133,-149,-532,580,576,-15,-12,223,-61,-418,1013,115,-16,-12,46,708,499,-565,54,12,-12,45,-88,-12,-926,-221,-1,-12,392,85,616,722,-188,18,-11,10,674,-1074,-160,-506,-32,-11,-398,720,1921,857,20,-11,-11,-11,-107,45,-157,-15,-5,-11,1141,-2539,1781,-227,756,-85,-11,-647,266,842,-490,1507,-13,-10,-1,131,1271,-762,53,134,-10,-89,570,-428,1102,143,19,-10,73,-477,-443,2946,-1252,-1,-10,-622,-338,17,324,13,-10,-10,261,-674,-1182,-7,-1370,-13,-9,-616,424,1715,-95,118,-22,-22,317,371,47,8,-199,-82,-21,-139,-445,-736,-1646,498,-87,-22,106,1053,-1662,387,332,-34,-21,204,-1027,1413,-734,102,-2,-22,-271,523,980,555,764,-19,-21,-1218,458,-1076,20,-2,-21,-21,-169,-372,1419,-355,-672,-25,-21,-902,2329,1056,280,16,-29,-21,819,-280,-1765,-913,992,-15,-22,86,326,-362,-374,-375,54,-21,-996,-587,-1505,-1058,-657,82,-20,-1141,-895,1048,-235,52,-21,-21,455,-119,763,1813,-756,-58,-21,-2727,-151,-283,-1520,-57,-5,-20,-69,112,198,510,-402,-7,-6,-5516,697,714,1447,1063,-7,-6,788,48,329,-1217,680,-81,-6,556,-863,-13,558,-395,-5,-6,-775,-550,-19,508,311,-6,-5,-1049,-64,-443,-205,80,-1,-4,-98,-418,-638,-49,-72,-4,-5,-322,-112,-62,-173,497,-4,-5,-43,-126,-3,161,1424,-6,-56,11,0,-782,544,-246,-6,-6,-97,817,-316,-340,377,-35,0,648,2056,792,312,68,94,0,-312,323,1070,16,0,0,0,180,51,316,689,705,-1,0,719,315,53,118,-638,3,-1,-3579,-1579,550,1442,1424,0,-1,367,20,754,439,-243,0,-1,658,892,-61,340,-124,4,-1,-2830,1121,607,-3,32,0,-1,-376,-1345,95,-7849,3812,-1,1,-220,-337,-69,-483,-69,0,0,-472,-98,165,-587,337,4,1,465,537,1945,1430,336,0,0,-231,753,-129,-228,770,-1,0,81,-284,106,-168,129,0,0,143,482,933,-456,644,0,-1,657,206,-451,-128,30,-120,0,444,-458,-350,604,-26,-1,-1,-1,56,496,1229,1535,-9,-1,-1,-1814,509,12,-565,95,-1,-268,-290,113,-547,-180,-1,-1,-636,-648,136,-787,-152,-1,0,-666,-3,-1323,-349,85,0,-1,516,1446,187,696,1796,-1,-1,-197,-402,-1910,44,7,-1,0,-2425,-456,-332,-24,142,-1,0,38,-200,119,89,75,1,1,-436,648,185,-143,302,40,1,-847,320,-142,231,-104,-39,1,-610,223,-280,-1219,-64,13,0,448,532,-268,527,315,-1,0,486,-139,-291,143,1268,0,0,632,9,-403,-721,107,-2,-2,-142,-164,208,-381,151,6,-2,-432,-320,148,-206,-109,-2,-1,-317,-110,-208,-338,-21,-2,-2,-121,-60,-310,-1678,705,-9,-1,-113,71,-66,17,130,-1,-2,-394,535,583,113,29,-2,-1,129,-470,-570,1187,-855,-1,-2,-1477,-1982,237,1193,-28,1,5,227,22,-1133,132,426,4,5,544,-13,-489,-1113,-392,5,5,-1178,25,69,439,546,140,5,-21,750,2974,1221,-100,3,4,310,90,-76,-290,-629,1,4,-386,750,36,329,460,4,4,-653,-47,134,-324,-169,6,4,-212,-1840,646,460,-6,2,4,-368,460,4,286,300,-8,5,-344,744,545,-67,356,65,4,-909,131,-152,154,545,-93,4,-271,-785,325,438,-135,-136,4,-91,415,-37,691,27,1,4,4,730,962,570,7,4,4,-913,88,741,1124,2363,255,4,64,-116,-841,-6,-886,5,4,-466,-565,-505,386,699,4,4,-856,382,-649,223,695,5,5,-236,-300,-46,586,-695,6,5,-592,-635,-539,426,226,3,6,901,-91,-89,-756,-59,6,6,623,149,462,794,80,6,6,59,-20,-92,205,-476,-4,20,-302,-563,-468,-343,666,38,5,-74,-395,70,-506,159,6,6,716,-104,-1546,-89,11,6,395,-59,-118,-385,1429,3,6,-119,-239,304,-315,-136,6,6,6,388,-57,825,-142,6,6,192,273,310,1069,89,5,6,6,15,694,-47,-678,-38,6,-390,-406,-323,-221,212,-2,6,-160,596,154,484,-390,6,6,108,-242,80,87,-380,6,6,-575,147,53,-306,1,7,6,-91,-161,-376,-184,119,14,6,-119,145,-162,-93,-327,5,7,-301,-877,93,-474,152,7,485,272,274,-585,995,-366,7,-433,-21,729,1535,296,10,6,-240,-500,-192,641,215,-5,6,-147,-181,33,-34,13,9,6,58,-60,-463,74,243,7,7,1120,-472,43,1,111,6,5,-352,-281,-158,21,-350,22,6,-308,168,-15,105,-19,23,6,-61,9,-432,-1265,143,10,6,7,222,700,-75,262,13,6,-130,204,-631,1331,90,6,7,221,-322,324,-273,130,-21,7,146,214,24,51,900,20,7,-52,-71,-69,730,45,-5,7,30,696,477,1296,854,14,6,200,151,15,305,1117,6,6,-144,-554,-1716,856,1118,-1,7,6,-673,-393,-251,-312,10,7,208,-201,-1015,-92,521,-9,6,-14,-282,-677,-215,-211,16,7,-228,588,661,1090,228,6,7,-172,-455,-51,382,632,6,6,457,13,-25,47,253,-1,7,646,307,171,765,3,6,6,-1534,124,-337,153,497,5,5,244,-322,-77,834,-57,29,5,-499,-191,489,307,6,50,-7,-7,780,389,638,439,-8,-7,-7,-170,-116,233,389,153,-7,-240,-186,239,828,73,-7,-7,-573,284,95,-256,275,-7,-7,96,797,1958,2591,204,-9,-8,117,-40,-531,-53,239,-15,160,388,202,650,-307,-6,-8,275,-469,54,315,570,-8,-8,789,396,-220,421,-611,1,-8,-79,-355,144,-283,-346,1,-8,126,-353,11,98,364,-56,-8,1152,-117,165,444,533,-23,-8,-267,-20,-297,434,1157,-65,-8,1317,1029,134,789,140,3,-8,787,234,-13,-1362,112,-15,-8,282,-166,1416,-622,340,-8,-8,224,1330,4,429,501,-15,-8,413,-272,-8,-458,9,-9,-8,-9,553,-9,-142,758,-8,-8,-56,3378,-449,-538,200,-16,-9,136,251,659,726,68,-9,-10,201,328,552,-687,45,29,-9,-394,173,444,1717,1028,-19,-11,1090,684,1680,2123,315,-11,-11,233,-791,-946,267,-34,-11,-11,542,-140,-529,-205,152,-11,53,195,547,435,405,1253,-11,-11,23,1136,1154,618,-1458,14,-12,-407,1193,1720,1457,727,-6,-12,452,-181,643,1061,1131,12,-11,540,1847,96,943,34,-13,-12,-2493,-1027,-652,1536,728,-11,-12,267,-1173,-510,476,840,-12,-12,68,1184,-271,-111,1248,-12,-12,903,1112,22,-594,-189,-26,-12,490,-6166,-103,-595,325,-20,-15,-30,-300,-7,367,853,-16,-15,-66,24,870,1059,652,-13,-15,951,491,-1345,1118,-538,-11,-16,716,148,-1352,-183,14,-33,-16],"returnScale":1000000,"returns":[0,1629,471,-69,-38,1303,-1165,2596,1244,1927,28,-42,1796,-2437,2312,513,-1161,-14,-38,4044,1355,1127,-42,2236,10,-42,-117,-583,-197,-2970,904,18,-42,1584,1026,2408,6006,3269,-28,-42,-575,492,5871,1469,-3171,-55,-42,-1476,2464,-3001,-2201,-1147,-4,-41,-2430,586,-3632,1078,2862,-41,-42,-918,1965,14,-3109,-6405,-48,-38,5025,-3,-3421,1445,163,-48,-70,-1327,-4707,174,-333,-1622,-482,-41,-444,3788,-703,20,-1313,1327,-41,6311,14667,783,90,107,11,-31,-1051,-1389,-5982,-593,56,-31,3195,-1265,731,160,-84,-6,-32,-1767,-3650,229,-2343,1054,-24,-32,676,-433,724,167,0,194,-31,516,1567,863,-680,-5711,-115,-31,31,-499,-45,-672,568,-48,-31,-836,-1597,176,-1712,936,-31,-28,-863,-13838,731,4010,547,-62,-28,-988,-208,-8761,5719,12493,999,-32,-8830,5791,-1251,2065,5611,-72,-32,3307,-406,-523,-222,-194,-45,-31,-1743,90,-2444,-717,5178,-621,-31,-1819,-1806,2492,10,-24,-3,-32,-2311,547,877,2052,-575,-32,-31,-31,-4544,1965,1993,1931,-132,-31,-562,-69,-302,-1015,-551,38,-28,-2065,374,-1456,250,24,-24,-28,472,714,-659,-398,-2846,-166,-28,-1254,-2000,4041,4162,4904,-104,-28,1349,-281,2013,-242,551,253,-28,-419,107,-3490,2423,-485,-28,-24,2121,-957,239,354,970,-14,-27,-1207,-38,-582,451,-2936,-55,-25,1349,-2371,731,291,3511,-24,-28,-121,1487,-3078,2236,149,-32,-27,-5202,1109,-1217,-350,-1123,-41,-25,-800,1556,-970,-91,10751,-10,-25,2101,-15672,-3026,475,-866,-25,-21,8512,-734,104,-226,-752,-86,-25,-2904,-1095,1923,1487,-2065,-895,-24,-1331,-644,-499,2890,-783,-90,-25,662,-62,-222,863,-721,-24,-21,-159,2010,738,-471,398,-3,-24,-2631,347,-11742,-257,-1109,-20,-25,8578,457,-242,613,1137,340,-25,-107,-246,-419,204,430,10,-21,-627,-4377,683,1414,-1193,32,-21,2356,1241,517,-1037,-273,-14,-21,-1684,183,5923,-3303,1702,-24,-25,604,-2326,-385,7,-69,-229,-24,-274,1421,2218,322,-339,-201,-24,1230,97,-350,55,-662,-24,-21,-949,-284,17,904,1962,-315,-25,1664,2117,-883,-1560,-586,-100,-28,-3143,-246,-641,-1414,-2246,121,-31,645,-413,-814,-167,971,-63,-17,2759,1303,2634,-7,596,100,-13,1358,-1511,21,-1379,-974,156,-14,-2402,2464,184,1327,430,-4,-17,530,1203,256,-142,368,-4,-14,-745,-495,776,950,-971,-204,-18,1827,669,1514,76,-86,-14,-17,1805,-149,0,-1643,-1829,48,-17,-2343,-818,475,-946,267,485,-18,-2387,318,1754,-301,-56,-21,-17,-243,697,-430,177,801,17,-21,3306,898,-166,-184,-582,-28,-17,-1498,-953,-436,651,28,-17,-18,-1902,-354,-343,3088,-950,7,-20,-305,176,-1369,-651,170,-21,-17,1372,1743,208,-1445,478,-128,-21,94,-201,180,329,551,-41,-18,-2571,-1109,-2312,-1237,489,-7,-21,585,-637,1636,-461,-454,-80,-21,596,971,1521,-180,-215,-35,-20,-66,194,52,-517,-1528,-24,-21,426,-828,-281,-793,759,41,-21,-156,1068,523,-242,24,-18,-20,963,-391,1216,-142,3,-20,-21,-21,-1411,-3517,79,143,-35,-21,-218,-1030,-4294,156,-599,-21,-21,-1022,1961,4080,-7646,212,-32,-17,-873,66,7073,-554,-659,-24,-21,1421,-3372,232,-1334,41,-31,-21,-1268,-1508,-2297,2200,5126,-38,-21,-333,-1057,-2311,-3040,2932,-24,-21,-4710,-315,724,-312,-1233,-28,-21,2405,2818,832,10199,1213,-10,-24,1791,-11315,4013,6315,1188,-648,-24,631,204,1168,-4852,1272,-7,-24,156,-15828,-2007,1349,17994,-146,-21,634,-69,908,191,-5944,-48,-21,256,-21,-242,14,880,17,-24,-2163,624,1619,755,894,-41,-24,-430,-271,815,918,1480,-38,-28,-464,2672,475,3576,2319,-17,-28,-409,-1119,651,2492,1320,45,-27,-673,-1001,402,-295,375,-28,-28,870,-645,-194,-1123,-17203,-94,-28,23515,-8200,4520,-264,277,-17,-28,953,-662,-450,-669,984,-27,-28,-80,-572,1227,1716,159,-62,-28,42,-125,617,429,-38,-14,-27,-1161,1178,3455,1252,2710,-45,-28,142,2832,2536,1470,534,315,-31,710,1213,988,-1106,45,-79,-28,-319,499,146,-187,894,0,-31,8504,2364,7770,7649,10241,18,-35,-184,-3486,298,1424,-38,-59,-35,1622,0,219,-1348,-3556,-104,-35,-66,465,-3431,-4274,4107,-79,-32,-1185,-2041,-4277,-3230,1289,-93,-35,-2211,-305,5559,2079,1252,-66,-31,-2038,9063,-2416,-3310,1300,-4,-34,-32,2191,620,1144,-104,-31,-32,1927,1588,-1581,808,371,-35,-31,-45,2807,1047,561,-579,-45,-34,-2503,-662,1224,2305,1660,-35,-35,-2076,1477,-849,-856,-11101,-66,-35,1508,-62,1549,634,575,-721,-34,1182,72,-3330,-1168,1206,0,-35,901,-682,1227,-773,-73,28,-35,783,5088,1854,302,360,-55,-35,1085,-10252,24,-332,869,-24,-31,9773,1695,2689,-7472,2104,471,-31,596,-66,87,-1060,1039,52,-31,-2942,-1293,142,-1320,1895,-31,-31,-1722,2516,-1581,-1181,-2049,-93,-35,655,-17,1615,-752,-243,-31,-31,-35,516,326,354,-749,153,-35,3739,1740,1092,995,-1903,111,-31,-35,6114,-236,3725,-110,128,-35,1736,-1937,1834,651,-3639,-3,-32,-1850,-3476,2720,2856,2055,-371,-31,12910,-1497,-146,1903,-1924,364,-38,-475,-3996,4714,5112,-2603,-38,-42,343,-1632,1674,-215,13475,-160,-41,-1896,4242,1036,347,-8800,-45,-38,-631,3996,2551,-1681,2520,-52,-42,4530,2752,-1345,10231,7794,-28,-45,-7267,5202,336,-1099,-575,-329,-45,2526,960,5455,4280,638,-3,-49,-527,-284,-4824,3729,4914,-173,-48,4720,1390,-1033,-1036,4446,316,-49,-5885,2835,-1795,1234,1376,-42,-48,949,1029,4090,1504,-2398,-38,-49,-2949,-2554,1282,-652,170,-41,-49,1126,1231,-1574,-287,-853,610,-45,2717,-3847,1241,4055,-343,-25,-48,236,1933,1602,-3497,-19814,-48,-45,-160,-2408,6026,-2540,10,-131,-49,-315,641,790,-1227,-3285,-357,-45,1909,3293,3954,1657,932,-55,-45,-1064,-2918,-4412,-2281,3518,-10,-49,1234,530,-7836,4149,-4717,-142,-45,2173,-1349,-1448,-5178,-530,0,-45,665,-8044,-2197,-3206,-953,-97,-45,-835,8252,-3418,-3445,2024,-93,-45,-409,-2014,229,-243,704,-14,-45,69,4339,170,-4332,-3427,-59,-45,-642,149,-3257,-995,-1151,122,-45,-2475,478,-138,11925,-908,146,-45,932,-2478,2031,-749,-1175,-45,-45,2191,131,1529,2710,-4395,-45,-45,12581,-1033,4076,1195,1515,-21,-48,2561,3615,-3525,12508,2148,-107,-49,-48,-1827,-499,1057,-655,-48,-49,-187,-249,2180,-1005,-5591,-13,-49,-603,-1303,953,1868,253,-49,-48,-5393,548,-1137,1293,6547,-97,-49,-641,5514,9340,1144,-129,451,-52,-3681,-7811,-5750,426,1823,-48,-52,-603,1067,-1847,-1473,8380,-38,-49,645,-877,6914,-5701,2094,-42,-49,4298,-406,798,1414,-1796,-312,-52,-97,-433,454,-2668,2921,-301,-49,-104,815,2273,-450,-243,-31,-52,-676,-1064,-1005,641,-3254,-56,-48,981,-711,-1008,90,1396,-41,-49,957,-1896,1657,66,-493,-52,-52,-52,-554,-2482,-117,-6592,-66,-52,7857,676,627,1421,135,-52,-49,-530,558,-773,1536,2284,-11,-52,1040,-73,5313,1404,-7940,-97,-52,232,5549,-711,-2374,-194,59,-52,-66,-1102,-589,1528,-880,-90,-52,263,-537,905,180,-12851,-52,-49,149,-357,1661,6082,2086,-41,-52,329,1521,2565,-3202,-3099,-131,-52,-3691,-572,2214,4083,-3164,-52,-49,-1722,5656,4245,3567,9946,-41,-52,9087,-3054,5604,-6629,3611,-14,-45,2221,-589,-8085,-1251,-548,-166,-45,-607,-322,3050,-118,-1123,-173,-49,-2104,-863,1012,3906,2222,-125,-45,849,3476,1965,-52,319,-45,-45,419,-1022,873,-104,-1012,-45,-45,333,-568,506,-1078,-3317,-107,-49,-655,-312,329,1588,-1695,97,-45,960,-1327,-2045,-1629,1359,-49,-45,1788,6623,187,2482,1490,7,-49,-204,1625,687,1923,-1611,-45,-49,918,-308,2561,-1123,1626,3,-45,-1473,645,-822,1598,589,-48,-45,270,180,-1171,1327,7968,-66,-49,-5472,-998,-3175,-5503,-5809,-52,-48,-4700,9015,1985,-398,-835,-49,-45,-3032,346,-1480,2256,4804,-42,-45,16965,-1833,-2686,-3636,-2228,-49,-48,870,239,11811,-11,-1410,-49,-48,1438,2069,-1993,2433,1390,-52,-52,-97,2312,-1757,-1771,-1068,-31,-49,-2491,-5064,579,-4779,34026,-34709,-45,1601,-6481,752,1161,5549,-38,-49,409,7,3986,-2281,83,-48,-45,-267,1802,2118,-680,-1511,-48,-49,-537,-1227,11638,-2540,-1931,-69,-59,-994,2893,-3826,3435,10525,-14,-59,-135,-59,1290,561,1095,-38,-59,-215,-287,3119,-340,1473,-55,-59,807,773,-87,-180,-2485,-197,-59,-1186,-152,-2825,1466,441,221,-59,-873,1334,-346,163,433,104,-59,-1958,-277,-1040,544,658,-58,-63,-1345,-180,-624,2153,367,-142,-62,-1820,3324,4096,2398,-3358,-232,-62,2817,-3628,-260,-628,1380,-25,-62,1501,-3847,599,-1535,395,-700,-62,-87,-478,-243,575,2104,-111,-62,1618,10151,-6151,-1747,-3012,-72,-59,3285,1092,-964,-4127,7489,274,-62,2599,-1622,1507,-433,-4342,-56,-62,-1196,-520,1913,-838,-846,-59,-62,-1338,-1407,-984,4706,-738,69,-62,-187,-4076,402,153,-18,-59,-62,-62,-6890,-35,-849,-884,-59,-62,901,-2367,995,2540,2516,-73,-62,1178,1768,1026,-895,2887,77,-63,2416,2069,-645,3137,-77,-62,-62,-191,-1508,253,-1580,-378,-86,-63,288,256,5407,509,-776,-35,-62,-464,-926,-1317,-7631,-503,-62,-62,-1012,-219,579,236,662,-73,-63,340,-471,2388,225,20285,-139,-66,-769,-6724,-464,-1120,-395,-27,-63,-2807,638,239,520,391,-107,-62,443,-488,-118,-596,575,-170,-62,1091,267,-506,-135,894,-59,-66,1692,4668,1310,-2880,-1778,-62,-66,894,1133,-2037,3299,482,-104,-66,3625,3857,-686,-6827,-846,28,-66,301,2492,4228,-592,2703,-17,-66,-2218,724,-5146,-170,1355,-42,-66,-1067,509,2974,437,-368,49,-66,-423,551,444,-1678,-506,-65,-63,3372,-800,-1061,-454,759,101,-66,5053,568,-3504,-481,59,-56,-66,-5829,423,901,-738,-7278,-63,-66,5594,-5497,4489,4723,2832,-66,-66,-8331,-4530,395,-159,-2350,-24,-63,-7954,544,11,6401,336,-21,-55,2173,-5285,596,-884,-1826,166,-52,-485,1102,5039,239,-759,-62,-56,-443,-361,-495,-90,-1414,-66,-52,-111,1036,-2707,572,1740,146,-52,-1227,1157,669,80,14,100,-52,-1001,1483,1397,-295,1019,-135,-52,-38,-3577,374,-634,-135,-66,-66,340,-2031,3660,7974,-734,-167,-65,592,1102,-703,1826,368,-42,-66,9950,-236,63,350,-56,-55,-66,-59,-4727,-998,2055,3580,52,-55,7697,-1542,-1872,-1091,-2201,21,-56,1643,2156,2623,-516,-2731,287,-55,-2055,1923,-1344,-551,2942,38,-55,-1193,84,-1116,305,-1913,-344,-55,4311,1456,-645,-225,-1903,-703,-56,2392,-309,-3951,21,-125,-72,-56,1813,-4277,-8013,-6546,613,263,-55,9957,2492,1906,2970,-3594,-62,-56,-20919,-232,-4627,-26776,-568,31,-49,-29247,-8789,-9586,-24970,5926,-45,-45,-9558,3874,6426,-13129,-10261,-46,-41,8373,23224,-12920,-6207,13654,-45,-45,7791,7996,2301,2225,301,-48,-45,1199,3181,-10002,2922,-42,-45,-48,-45,-13156,1774,2877,30678,-55,-45,6190,10483,4832,1583,-48,-49,-48,-9105,-3503,1230,-1043,4415,-118,-48,1175,-246,2065,-1116,-402,-28,-48,-156,1130,-215,180,2676,-49,-48,-11,-2883,-1272,-1615,1674,-83,-32,-5448,-845,5760,-583,-1500,-45,-49,-4620,3785,-3362,180,-6997,-41,-45,1060,1334,576,1615,-170,-45,-49,-1490,1473,-2721,3660,-1248,-41,-45,-3459,2045,315,-859,2131,-41,-46,-249,-354,-1098,2745,-2447,-21,-45,4450,586,4259,-201,724,-24,-41,2446,787,2059,603,558,-45,-45,426,845,2045,1938,-714,-56,-41,1528,-1220,333,-13239,6200,-42,-45,-3569,707,176,-3971,4301,-45,-42,-312,-2135,2211,440,3834,-42,-45,-1147,1389,593,-364,-3362,-41,-45,3292,-125,2368,4623,107,-45,-45,1813,-66,2301,461,4273,-45,-45,-3978,10632,3539,1199,2592,-48,-45,-8796,488,2371,-2010,1632,-62,-49,-4914,-4571,7184,2097,-5244,-62,-63,-228,-4149,3095,-7555,5067,-63,-62,-1674,-3112,263,-3011,-451,-62,-66,-2350,-3033,-2866,2582,-2401,-66,-66,-1671,444,28,-6585,7236,-41,-45,526,-3500,-423,-901,-19803,-38,-42,943,1927,1331,416,-1109,-28,-28,-1137,1920,1279,-3739,8616,-28,-28,-2804,4478,-7860,1948,-7708,-45,-28,-3372,1767,5906,-52,-4284,-27,-28,471,2333,8678,-2184,683,-86,-32,-1694,-673,1009,1552,6662,-28,-31,1272,-454,-316,520,1982,-31,-28,1338,5663,2471,73,-1601,-31,-28,-125,10799,-3812,2731,-4239,-114,-28,-1067,-572,2447,6377,7153,170,-31,523,10730,15758,9427,-4166,-34,-31,-1227,2977,-3293,4786,-3968,-31,-31,-2329,-395,3448,-4509,-3084,-24,-32,2024,1394,4238,-6633,8217,-45,-42,3823,15253,3781,-1917,-915,-38,-45,-2350,2475,-1342,-4793,350,-55,-42,1837,-3611,-690,-374,-2974,-45,-41,457,66,108,1493,329,-45,-41,-7393,-516,-1844,2010,1997,-52,-42,773,-211,-1449,3511,398,-55,-42,160,2453,1730,-1958,187,41,-41,156,-305,-42,-3209,-766,-4,-41,1358,295,2135,2502,-651,62,-38,35,2335,-3722,-554,-1754,-111,-38,-1379,2495,6658,2970,69,-38,-38,-38,-371,156,-544,-52,-18,-38,3955,-8800,6173,-787,2620,-295,-38,-2242,922,2918,-1698,5223,-45,-35,-4,454,4405,-2640,183,465,-35,-309,1976,-1483,3819,495,66,-34,253,-1654,-1535,10210,-4339,-3,-35,-2156,-1171,59,1123,45,-35,-35,905,-2336,-4096,-25,-4748,-45,-31,-2135,1470,5943,-329,409,-76,-76,1098,1286,163,28,-690,-284,-73,-482,-1542,-2551,-5704,1726,-302,-76,367,3650,-5760,1341,1150,-117,-73,707,-3559,4897,-2544,353,-7,-76,-939,1812,3397,1923,2648,-66,-73,-4221,1588,-3730,70,-7,-73,-73,-585,-1290,4918,-1230,-2329,-87,-73,-3126,8072,3660,970,56,-101,-73,2839,-971,-6117,-3164,3438,-52,-76,298,1130,-1255,-1296,-1300,188,-73,-3452,-2034,-5216,-3667,-2277,284,-69,-3955,-3101,3632,-815,181,-73,-73,1577,-413,2645,6283,-2620,-201,-73,-9451,-523,-981,-5268,-197,-18,-69,-239,388,686,1768,-1393,-25,-20,-19117,2415,2475,5015,3684,-25,-20,2731,166,1140,-4218,2357,-281,-20,1927,-2991,-45,1933,-1369,-17,-21,-2686,-1906,-66,1761,1078,-21,-17,-3636,-222,-1535,-710,277,-4,-13,-340,-1449,-2211,-170,-249,-14,-17,-1116,-389,-214,-600,1722,-13,-18,-149,-436,-11,558,4935,-20,-195,39,0,-2711,1886,-853,-21,-20,-337,2832,-1095,-1179,1307,-121,0,2245,7126,2745,1081,236,326,0,-1082,1120,3708,55,0,0,0,624,177,1095,2388,2443,-3,0,2492,1091,184,409,-2211,10,-3,-12404,-5472,1906,4997,4936,0,-4,1272,69,2614,1521,-842,0,-4,2281,3091,-211,1178,-430,14,-3,-9808,3885,2104,-11,111,0,-3,-1303,-4662,329,-27202,13211,-3,3,-762,-1168,-239,-1674,-239,0,0,-1636,-340,572,-2034,1168,14,3,1612,1861,6740,4956,1165,0,0,-801,2610,-447,-790,2668,-3,0,281,-985,368,-583,448,0,0,495,1671,3233,-1580,2232,0,-4,2277,714,-1563,-444,104,-415,0,1538,-1587,-1213,2093,-90,-3,-4,-3,194,1719,4259,5320,-31,-4,-3,-6287,1764,42,-1958,329,-4,-928,-1005,391,-1896,-623,-4,-3,-2204,-2246,471,-2727,-527,-4,0,-2308,-10,-4585,-1210,295,0,-4,1788,5012,648,2412,6225,-4,-3,-683,-1393,-6620,153,24,-4,0,-8404,-1580,-1151,-83,492,-3,0,131,-693,413,308,260,3,4,-1511,2246,641,-496,1047,138,4,-2936,1109,-492,801,-361,-135,4,-2114,773,-971,-4225,-221,45,0,1552,1844,-929,1827,1091,-3,0,1684,-481,-1009,496,4394,0,0,2190,32,-1397,-2499,371,-7,-7,-492,-568,721,-1321,523,21,-7,-1497,-1109,513,-714,-378,-7,-3,-1099,-381,-721,-1171,-73,-7,-7,-419,-208,-1075,-5815,2443,-31,-3,-392,246,-229,59,451,-4,-7,-1365,1854,2021,391,101,-7,-4,447,-1628,-1976,4114,-2963,-4,-7,-5119,-6869,822,4134,-97,4,17,787,76,-3927,458,1476,14,18,1885,-45,-1695,-3857,-1359,17,18,-4083,87,239,1521,1893,485,17,-73,2600,10307,4231,-346,10,14,1074,312,-263,-1005,-2180,3,14,-1337,2599,125,1140,1594,14,14,-2263,-163,464,-1123,-585,20,14,-734,-6377,2238,1595,-21,7,14,-1276,1595,13,992,1039,-27,17,-1192,2578,1889,-232,1234,225,14,-3151,454,-526,533,1889,-322,14,-940,-2720,1126,1518,-468,-471,14,-315,1438,-128,2394,94,3,14,14,2530,3334,1976,24,14,14,-3165,305,2568,3896,8189,884,14,222,-402,-2915,-21,-3070,17,14,-1615,-1958,-1750,1337,2423,14,14,-2967,1324,-2249,772,2409,17,18,-818,-1040,-159,2031,-2409,21,17,-2052,-2200,-1868,1476,783,11,20,3123,-315,-309,-2620,-204,20,21,2159,517,1601,2752,277,21,21,204,-69,-319,710,-1649,-14,69,-1046,-1952,-1622,-1188,2308,131,18,-257,-1369,243,-1754,551,21,21,2481,-360,-5358,-308,38,20,1369,-204,-409,-1334,4952,11,20,-412,-828,1053,-1091,-472,21,21,21,1344,-197,2859,-492,21,20,666,946,1074,3705,309,17,21,21,52,2405,-163,-2350,-132,21,-1351,-1408,-1119,-766,735,-7,21,-555,2066,534,1677,-1352,21,21,374,-839,278,301,-1317,21,21,-1993,510,183,-1060,3,24,21,-315,-558,-1303,-638,412,49,21,-413,503,-562,-322,-1133,17,24,-1043,-3039,322,-1643,527,24,1681,943,950,-2028,3449,-1269,24,-1500,-73,2526,5320,1026,35,21,-832,-1733,-665,2221,745,-17,21,-510,-627,114,-118,46,31,20,202,-208,-1605,256,843,24,24,3882,-1636,149,3,385,21,17,-1220,-974,-547,73,-1213,76,21,-1068,582,-52,364,-66,80,21,-211,31,-1497,-4385,496,35,21,24,769,2426,-260,908,45,21,-450,707,-2187,4613,311,21,25,765,-1116,1123,-946,451,-73,24,506,742,83,177,3119,69,25,-181,-246,-239,2530,156,-17,24,104,2412,1653,4492,2960,48,21,693,523,52,1057,3872,20,21,-499,-1920,-5947,2967,3874,-3,24,21,-2333,-1362,-870,-1081,35,24,721,-697,-3517,-319,1805,-31,21,-48,-978,-2346,-745,-731,55,24,-790,2038,2291,3777,791,20,25,-597,-1576,-177,1324,2190,21,21,1583,46,-87,163,877,-4,24,2239,1064,593,2651,11,20,21,-5316,429,-1167,530,1722,18,17,846,-1116,-267,2890,-197,100,17,-1729,-662,1695,1064,21,173,-24,-25,2704,1348,2211,1521,-27,-25,-24,-589,-402,807,1349,530,-24,-832,-645,828,2870,253,-24,-24,-1986,984,329,-887,953,-24,-25,333,2762,6786,8980,707,-31,-28,405,-138,-1840,-184,828,-52,555,1344,700,2253,-1064,-21,-27,953,-1626,187,1092,1976,-28,-28,2735,1372,-762,1459,-2118,4,-28,-274,-1230,499,-981,-1199,3,-27,436,-1223,38,340,1261,-194,-28,3993,-406,572,1539,1847,-79,-28,-926,-69,-1029,1504,4010,-226,-27,4564,3566,465,2734,485,11,-28,2728,811,-46,-4720,388,-52,-27,977,-575,4907,-2156,1179,-28,-28,777,4609,14,1487,1736,-52,-28,1432,-943,-28,-1587,31,-31,-28,-31,1917,-32,-492,2627,-27,-28,-194,11707,-1556,-1865,693,-55,-31,471,870,2284,2516,236,-32,-34,696,1137,1913,-2381,156,101,-31,-1366,600,1538,5951,3563,-66,-38,3777,2371,5822,7358,1092,-38,-38,807,-2741,-3279,925,-117,-38,-39,1879,-485,-1834,-710,527,-39,184,676,1896,1507,1404,4342,-38,-38,80,3937,3999,2142,-5053,49,-42,-1410,4134,5961,5050,2519,-21,-41,1566,-627,2229,3677,3919,42,-38,1871,6402,332,3268,118,-45,-41,-8640,-3560,-2259,5323,2523,-38,-42,926,-4066,-1767,1650,2911,-42,-41,235,4104,-940,-384,4325,-42,-41,3129,3854,76,-2058,-655,-90,-42,1698,-21369,-357,-2062,1126,-69,-52,-104,-1040,-24,1272,2956,-56,-52,-228,83,3015,3670,2260,-45,-52,3296,1701,-4661,3875,-1865,-38,-55,2481,513,-4686,-634,49,-115,-55]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("Innovo Status Solar", {"daily":{"start":19370,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000000,-81,-81,-80,-81,-81,-81,-80,-81,-81,-81,-80,-984,-61,-77,-81,-80,-81,260,-81,-79,904,-80,-79,-80,-80,-80,799,-1582,-80,-80,-1020,-696,-1140,422,-495,-80,-80,185,-1333,128,-925,-1658,-78,-80,636,244,9117,-1313,2383,-79,-80,1981,846,-1034,4732,-1754,-86,-80,-3804,2548,-3843,1070,-4303,-63,-80,137,2089,387,1021,-1736,-81,-80,-200,824,508,10174,1971,-78,-81,-2119,-758,-3783,628,-88,-83,-81,471,1807,784,288,696,-81,-81,3670,1017,-555,241,634,-81,-81,-1719,743,-9219,3179,-9767,133,-80,-1379,-1071,-1284,3843,3281,102,-80,-848,-1230,2760,-4146,13321,56,-81,1338,-2630,-1425,-2020,-6322,22,-80,2744,2331,-3628,-2028,3494,-420,-80,-917,942,-4993,8232,-1679,-81,-80,42,-3450,-1040,-6000,959,-1002,-79,1414,876,-5789,4402,-1999,-3204,-79,-1265,-12171,-672,-820,-8930,6004,-78,-2149,11054,7703,-6271,26939,3176,-81,-2085,-2311,-12312,-31001,9584,601,-78,15540,-4612,21085,5668,-29280,-2463,-79,38377,621,3752,-10051,-834,4595,-81,2275,-2644,-19823,-15144,-3444,6902,-79,13804,-12037,-43294,165,-8420,-874,-75,-4752,-4503,199,-13083,-17124,777,-72,270,-23939,-16143,-14926,-842,1636,-67,-5967,-7433,13980,-18072,7430,1653,-67,6566,31100,-4921,-4741,6981,1306,-69,-775,-2373,-13957,-19413,2639,-66,-67,931,16905,-17374,19292,-10539,3864,-68,-24926,6112,-7240,-18404,-5513,-645,-63,-5284,-6716,-6014,-2720,2333,-2874,-62,-32578,-20394,3702,-15918,13776,-1726,-58,-3328,43372,-223,-16336,-8861,4381,-60,4045,11872,-21334,-17320,-33142,-1504,-55,3460,4726,-23028,6562,-23257,-82,-53,1990,8704,-12431,33617,8976,-1910,-56,-14418,-167,-33109,-8960,-3657,282,-50,-2161,48445,8425,-22506,6064,-1006,-54,8057,-14043,5910,1822,-4413,-706,-53,-11826,9492,10858,-1827,30683,2395,-56,5126,-11337,-4745,5903,-8989,-55,-55,5519,-17875,34686,53124,1626,-1403,-61,-24985,23429,-28885,27655,-2726,-1939,-61,-635,12830,495,-1244,-11088,3045,-61,-61,-4907,-17365,-20490,-11070,1361,-57,1490,-3341,-7932,-14144,-9981,2185,-54,-987,-23421,-12841,656,-3910,-52,-51,18612,16297,-14112,-2676,-6227,830,-52,12273,-10119,-7039,29038,-10387,-2915,-53,-22538,19054,20723,1241,20809,-684,-56,27096,-35918,30728,12651,-17906,-1208,-57,-751,-13187,-14468,-27459,-8875,354,-52,1043,10692,-9756,6337,10160,504,-53,-12382,-9877,8273,6147,1327,-1535,-53,-315,-16343,-9979,-14792,-5956,1061,-49,2955,-5130,12453,8327,-10394,3066,-50,-4916,-3729,29114,3875,1453,703,-52,-2047,-19791,5065,-2799,-16052,376,-50,7248,17847,-19114,-14988,-12212,2671,-48,-16263,-14504,3004,-5191,-3346,803,-45,2277,10308,-420,-9025,12564,143,-46,11233,-12667,1232,10143,21554,-49,-49,5585,-1812,-12413,6612,-12254,-1688,-48,10468,24074,-13355,-7780,-9182,699,-48,-1773,8980,47822,-13866,25002,-53,-54,1483,7690,-2994,11466,-4517,-1458,-55,-63,-11947,15208,-8954,-16003,-1319,-52,12064,12145,6185,-12224,-17423,3706,-52,-13499,2944,-11873,-10268,-3084,-50,-50,-5622,-16006,-5588,12683,-24842,-352,-47,-16778,-4630,21251,349,-8592,-837,-46,5719,2822,10675,23848,12535,-1315,-50,-31352,18738,-14523,-12318,-9790,1310,-47,8496,2988,1307,2154,10226,-317,-48,-10192,-4660,8796,-6014,-21020,-46,-45,-14464,-4151,96,3515,-13897,348,-43,-3588,17704,-6866,8345,-528,479,-45,13234,-13495,3213,-14506,23701,395,-46,3768,-10826,-6315,1408,5861,-40,-46,515,-20572,9521,-3605,-16026,-224,-42,-5157,3452,34399,-2337,8695,-2109,-46,107,11772,-1653,-2529,-6692,-353,-46,4295,6899,-13649,12765,14593,-142,-48,-1669,-7692,-11870,-7227,9510,240,-46],"returnScale":1000000,"returns":[0,-81,-81,-80,-81,-81,-81,-80,-81,-81,-81,-80,-984,-61,-77,-81,-80,-81,260,-81,-79,904,-80,-79,-80,-80,-80,799,-1582,-80,-80,-1020,-696,-1140,422,-495,-80,-80,185,-1333,128,-925,-1658,-78,-80,636,244,9117,-1313,2383,-79,-80,1981,846,-1034,4732,-1754,-86,-80,-3804,2548,-3843,1070,-4303,-63,-80,137,2089,387,1021,-1736,-81,-80,-200,824,508,10174,1971,-78,-81,-2119,-758,-3783,628,-88,-83,-81,471,1807,784,288,696,-81,-81,3670,1017,-555,241,634,-81,-81,-1719,743,-9219,3179,-9767,133,-80,-1379,-1071,-1284,3843,3281,102,-80,-848,-1230,2760,-4146,13321,56,-81,1338,-2630,-1425,-2020,-6322,22,-80,2744,2331,-3628,-2028,3494,-420,-80,-917,942,-4993,8232,-1679,-81,-80,42,-3450,-1040,-6000,959,-1002,-79,1414,876,-5789,4402,-1999,-3204,-79,-1265,-12171,-672,-820,-8930,6004,-78,-2149,11054,7703,-6271,26939,3176,-81,-2085,-2311,-12312,-31001,9584,601,-78,15540,-4612,21085,5668,-29280,-2463,-79,38377,621,3752,-10051,-834,4595,-81,2275,-2644,-19823,-15144,-3444,6902,-79,13804,-12037,-43294,165,-8420,-874,-75,-4752,-4503,199,-13083,-17124,777,-72,270,-23939,-16143,-14926,-842,1636,-67,-5967,-7433,13980,-18072,7430,1653,-67,6566,31100,-4921,-4741,6981,1306,-69,-775,-2373,-13957,-19413,2639,-66,-67,931,16905,-17374,19292,-10539,3864,-68,-24926,6112,-7240,-18404,-5513,-645,-63,-5284,-6716,-6014,-2720,2333,-2874,-62,-32578,-20394,3702,-15918,13776,-1726,-58,-3328,43372,-223,-16336,-8861,4381,-60,4045,11872,-21334,-17320,-33142,-1504,-55,3460,4726,-23028,6562,-23257,-82,-53,1990,8704,-12431,33617,8976,-1910,-56,-14418,-167,-33109,-8960,-3657,282,-50,-2161,48445,8425,-22506,6064,-1006,-54,8057,-14043,5910,1822,-4413,-706,-53,-11826,9492,10858,-1827,30683,2395,-56,5126,-11337,-4745,5903,-8989,-55,-55,5519,-17875,34686,53124,1626,-1403,-61,-24985,23429,-28885,27655,-2726,-1939,-61,-635,12830,495,-1244,-11088,3045,-61,-61,-4907,-17365,-20490,-11070,1361,-57,1490,-3341,-7932,-14144,-9981,2185,-54,-987,-23421,-12841,656,-3910,-52,-51,18612,16297,-14112,-2676,-6227,830,-52,12273,-10119,-7039,29038,-10387,-2915,-53,-22538,19054,20723,1241,20809,-684,-56,27096,-35918,30728,12651,-17906,-1208,-57,-751,-13187,-14468,-27459,-8875,354,-52,1043,10692,-9756,6337,10160,504,-53,-12382,-9877,8273,6147,1327,-1535,-53,-315,-16343,-9979,-14792,-5956,1061,-49,2955,-5130,12453,8327,-10394,3066,-50,-4916,-3729,29114,3875,1453,703,-52,-2047,-19791,5065,-2799,-16052,376,-50,7248,17847,-19114,-14988,-12212,2671,-48,-16263,-14504,3004,-5191,-3346,803,-45,2277,10308,-420,-9025,12564,143,-46,11233,-12667,1232,10143,21554,-49,-49,5585,-1812,-12413,6612,-12254,-1688,-48,10468,24074,-13355,-7780,-9182,699,-48,-1773,8980,47822,-13866,25002,-53,-54,1483,7690,-2994,11466,-4517,-1458,-55,-63,-11947,15208,-8954,-16003,-1319,-52,12064,12145,6185,-12224,-17423,3706,-52,-13499,2944,-11873,-10268,-3084,-50,-50,-5622,-16006,-5588,12683,-24842,-352,-47,-16778,-4630,21251,349,-8592,-837,-46,5719,2822,10675,23848,12535,-1315,-50,-31352,18738,-14523,-12318,-9790,1310,-47,8496,2988,1307,2154,10226,-317,-48,-10192,-4660,8796,-6014,-21020,-46,-45,-14464,-4151,96,3515,-13897,348,-43,-3588,17704,-6866,8345,-528,479,-45,13234,-13495,3213,-14506,23701,395,-46,3768,-10826,-6315,1408,5861,-40,-46,515,-20572,9521,-3605,-16026,-224,-42,-5157,3452,34399,-2337,8695,-2109,-46,107,11772,-1653,-2529,-6692,-353,-46,4295,6899,-13649,12765,14593,-142,-48,-1669,-7692,-11870,-7227,9510,240,-46]}});
\ No newline at end of file
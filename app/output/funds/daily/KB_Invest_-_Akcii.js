@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Akcii", {"daily":{"start":18718,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000073,-9,-10,-10,-9,-10,-85,213,524,-152,-19,877,217,-585,808,-39,-174,-23,-1053,-1682,2291,-2105,-1295,-320,-28,613,-1220,-197,153,-3437,-25,-24,2432,-2058,2822,2489,692,-6,-28,-1716,-3834,408,846,4457,-181,-32,3021,-471,-2736,3373,634,301,-33,1590,560,-1788,1665,717,1121,-35,-531,4605,2324,-895,4212,1499,-38,-958,-2731,-1725,1126,1408,1055,-39,862,-1784,-4227,-4708,-3636,-38,-38,1476,2128,3278,-189,2213,-371,-41,-1158,-454,400,2166,-1015,1619,-43,769,-6038,-216,-8471,7968,-718,-43,1285,-797,1206,-992,-6658,-20,-43,-9961,4722,6493,48,-233,137,-43,157,-2983,5625,6042,-3010,-491,-44,692,5784,-987,-787,-790,1078,-49,2948,-1186,2784,-379,1355,-834,-50,-2412,-2502,-2757,-6460,2686,696,-49,7420,2178,630,-3241,2804,98,-50,-461,946,-1783,2287,-776,-818,-50,922,-3001,-4491,-3082,-1257,59,-49,2035,-2136,-975,-3646,-1262,-604,-48,-11820,4196,4967,4585,669,-324,-52,5327,-4769,211,59,2717,-574,-55,-1936,3575,-1029,9962,2707,-466,-56,1862,-2189,-605,7112,1535,-476,-57,-2216,7121,2651,-2861,-1881,366,-58,1838,-118,-7130,2488,-3717,-2276,-57,6076,1890,7910,-33,8822,2047,-60,3043,-2042,39,7755,7401,451,-63,2274,2557,-868,-6047,-10333,3477,-62,-4328,-1579,-979,1788,-20409,-2471,-61,2919,-6951,-4349,1952,-4812,1812,-61,5908,11492,1820,-8423,-5222,1433,-61,-5730,408,2542,7633,-6699,579,-61,-9409,14215,3005,4497,-1356,-441,-62,3674,199,-749,1395,-1432,640,-62,6467,4602,420,708,5874,-64,-63,417,8014,2954,-5565,-1483,906,-64,-8831,-1383,-3946,-11394,-288,-62,-9049,-2097,6504,-4524,6047,910,-63,13370,7188,-2566,-19152,5061,-8876,-64,194,8631,15005,-8255,-3762,962,-65,-11687,18439,278,-11904,-8790,722,-64,-9171,-6674,-7912,-23743,31578,-2998,-63,-20392,-19539,12556,-5842,-13093,7076,-61,-15695,1617,19006,-8867,-8828,3857,-60,-2325,3086,21134,8815,1032,1851,-63,3567,7588,-2111,5858,1910,-1218,-64,-3042,13439,-9530,-8584,5717,2113,-65,5812,-5395,-6621,2968,10520,-2660,-3636,-4528,6736,-589,-3258,2453,-66,-197,4222,-1080,-10986,-16771,-64,-64,-8477,-8539,8618,16826,-1590,-2592,-64,3076,8427,8926,-14285,-8850,-208,-63,-20784,541,-821,-7657,27028,1002,-67,1290,14431,-21929,-2835,2913,-2763,-66,11278,-12148,7620,12633,11604,-1229,-68,3946,-6903,-1466,8436,-6696,-2150,-68,4713,5650,-3672,-17746,-16983,-66,-66,-26573,8833,6305,-22824,8,-4902,-64,2889,9575,-10625,-5023,21601,-1496,-66,6206,-7656,-7765,-7531,6435,-1781,-65,2020,-12018,11294,21357,2333,671,-67,-12077,-1692,-496,-15205,15999,-2946,-66,453,15852,-2450,2152,-10558,1185,-66,2747,-10362,20476,139,4515,-3702,-67,-657,-4384,4886,4965,-870,-2865,-67,589,-2399,9999,3892,6790,2511,-69,-2491,6560,-5310,1328,-11984,6625,-68,-13166,5581,5971,13370,-21834,-2423,-68,-8829,-6942,-7123,-7578,-1009,99,-65,-3635,-906,1277,5452,16454,-8635,-66,9029,-29261,-2896,6583,-6875,2109,-63,4445,-9122,-9416,-1448,-17850,6556,-61,-12565,6360,9881,-6344,-10479,-2343,-60,16689,23419,-6554,-4662,-10797,3329,-61,-5770,-1245,-1106,14613,-13656,783,-62,11314,7048,-8970,937,6963,4416,-63,-343,9817,-6180,-13185,9754,4488,-63,-548,7622,-14707,-7321,26210,-6329,-64,7174,-137,-15704,27739,19384,-17783,-66,-6769,8661,-14988,-133,6162,-2564,-65,-5463,14171,309,-866,-4223,1509,-65,-13859,3706,20318,-1324,-3568,-3721,-65,-8310,-10922,1004,344,1618,-811,-64,1715,4222,-2160,-19844,-2854,-500,-63,-3700,1439,12855,-8652,2964,-241,-62,9,504,-9654,8467,-2892,-387,-62,2637,6286,19847,-1663,12571,-65,-65,2884,743,4167,6612,1775,-708,-66,460,-4066,-8509,-5796,12099,88,-65,8272,-3360,783,7546,-1335,1415,-66,-11571,6072,13798,10982,-8608,2546,-68,-5786,15885,-3462,-5199,-4328,4154,-67,2890,2036,-998,-3021,-5757,3521,-66,-1398,-13422,-1814,8015,-3939,2040,-65,401,-1750,1308,-344,12878,-334,-66,-4607,-8698,-76,-4524,-10626,-1612,-64,-10736,5149,-17602,19864,-8323,-1424,-62,3726,5457,-10405,-1526,-5695,7029,-62,2971,972,10395,7583,4665,332,-66,2887,-2296,-3406,3550,1129,735,-70,3815,7361,-3425,3100,-2948,-67,-68,-397,-141,-2623,-4919,-6083,-66,-66,3,-13882,-5184,10165,7094,2262,-67,-950,-11300,-3582,-8907,11428,2663,-66,-2675,-7055,4379,-513,-797,1533,-65,7186,-5851,5382,5684,-1733,41,-65,1159,-5365,-7230,-6479,8960,-969,-65,976,-581,-6323,11661,13722,-67,-67,-1301,7911,1571,-1635,-2090,-1942,-65,1996,5438,-1843,5890,2382,-7453,-66,-317,-5735,-3288,851,-6543,5285,-66,-1264,2142,-3587,5863,3937,2257,-68,4625,-2554,-1826,-11122,271,631,-66,2093,6114,5560,5555,-13304,-2141,-67,3773,3269,2848,-1399,3302,3139,-67,2700,4117,8628,-1714,6244,6657,-72,2686,-8749,-13139,-3403,-715,-863,-71,472,-4984,959,4338,-2812,599,-71,-2431,-7343,-2959,-889,-3368,1765,-69,2057,-3987,4975,2580,-1960,1602,-69,5917,7380,1760,-4956,5283,1533,-71,-860,-7123,-2036,-4542,2962,-69,-70,2906,3566,-2360,9008,-1239,4004,-75,-4426,-782,-8747,-11638,-4865,-914,-73,4575,-7784,1047,7681,2141,-3181,-69,-7893,-6644,-475,-3067,6869,-2208,-68,9457,9071,-18,-5264,-326,5326,-69,6702,5665,-10246,-6873,-9252,-1837,-68,-5019,6186,-11290,-952,-1747,-171,-68,6316,-4089,1631,18610,3747,-2332,-70,-1207,-4805,-1009,-14,225,333,-69,2347,13817,7022,-8042,6001,-759,-70,2608,-8410,1897,4061,1357,-960,-71,-2416,1427,283,1173,9881,3031,-72,-5,-2796,5791,5472,4529,-73,-72,2601,-1548,6785,6575,-6440,-1595,-74,1918,10596,-8064,9800,742,-2009,-75,337,4937,1500,-4807,-2602,3689,-75,-75,1709,-1750,1467,-309,1384,-74,3641,-3760,-706,-4631,3649,3000,-74,1809,-10167,-3645,4804,3966,-74,-74,3812,3509,2026,1113,-1292,1302,-75,2251,2761,-7672,1073,3058,-3894,-77,-4661,15481,-687,-5238,4915,-1125,-77,6895,-9805,4329,10909,221,-1731,-78,720,-2585,-273,8909,1884,619,-79,-9037,2273,-4824,4289,569,290,-78,4023,-6656,5311,2777,2189,-2103,-78,1062,3244,4364,-6398,4248,1425,-78,4446,-1806,5863,5667,-6673,5127,-80,4754,1034,8628,5846,437,1242,-81,-906,2381,-37,-6435,-4727,1044,-78,2535,2348,-13353,-2571,-1995,4938,-78,-6166,-10341,1988,1349,-320,1571,-78,3647,8306,-2683,-8349,4258,-91,-79,2098,-11527,-264,-712,6328,-79,-78,8192,6554,-6824,7726,3101,-3052,-79,4478,2388,789,3587,5756,780,-81,-421,-754,-5325,-5057,2864,-81,-80,3278,-3096,-12297,4135,13370,-2400,-81,-651,-10424,5041,5451,-2534,-1911,-81,2345,4005,-507,-8542,-4754,6734,-80,3590,2929,1812,3352,509,-81,-80,6678,-6323,-726,2281,-1929,-864,-80,2086,-1529,7099,1031,-541,-1569,-81,3196,-1207,8667,6666,3775,-1073,-83,1084,10462,3037,-8274,-7152,1865,-84,6780,-867,-6852,-3462,13236,-1682,-84,4060,11172,2312,-10324,-29759,-83,-83,-37566,7818,7584,6076,4173,11,-82,1055,10712,2089,1565,6401,658,-84,4118,-1133,-1720,-2097,5912,873,-85,1037,-2503,-1270,3139,10196,-763,-85,-266,-12268,-6421,-1413,-17138,-173,-79,2676,-1455,4950,7297,8230,-3133,-82,992,25,-2117,9427,-1221,-1298,-80,2628,9832,-7508,8958,5129,403,-80,-2091,1360,3749,-4527],"returnScale":1000000,"returns":[0,-9,-10,-10,-9,-10,-85,213,524,-152,-19,877,217,-585,808,-39,-174,-23,-1053,-1682,2291,-2105,-1295,-320,-28,613,-1220,-197,153,-3437,-25,-24,2432,-2058,2822,2489,692,-6,-28,-1716,-3834,408,846,4457,-181,-32,3021,-471,-2736,3373,634,301,-33,1590,560,-1788,1665,717,1120,-35,-531,4605,2324,-895,4212,1499,-38,-958,-2731,-1725,1126,1408,1055,-39,862,-1784,-4227,-4708,-3635,-38,-38,1476,2128,3277,-189,2213,-371,-41,-1158,-454,400,2166,-1015,1619,-43,769,-6038,-216,-8470,7967,-717,-43,1284,-797,1206,-992,-6657,-20,-43,-9960,4721,6493,48,-233,137,-43,157,-2983,5625,6041,-3010,-491,-43,691,5784,-987,-787,-790,1078,-49,2948,-1186,2784,-379,1355,-834,-50,-2412,-2502,-2757,-6459,2686,696,-49,7419,2178,630,-3241,2804,98,-50,-461,946,-1783,2287,-776,-818,-50,922,-3001,-4491,-3081,-1257,59,-49,2035,-2136,-975,-3646,-1262,-604,-48,-11819,4196,4966,4585,669,-324,-52,5327,-4769,211,59,2717,-574,-55,-1936,3575,-1029,9961,2707,-466,-56,1862,-2189,-605,7111,1535,-476,-57,-2215,7120,2651,-2861,-1881,366,-58,1838,-118,-7129,2487,-3716,-2276,-57,6075,1890,7910,-33,8821,2047,-60,3043,-2042,39,7754,7401,451,-63,2273,2557,-868,-6046,-10332,3476,-62,-4327,-1579,-979,1788,-20408,-2471,-61,2919,-6950,-4349,1952,-4812,1812,-61,5908,11491,1820,-8423,-5221,1433,-61,-5730,408,2542,7632,-6698,579,-61,-9409,14214,3005,4497,-1356,-441,-62,3674,199,-749,1395,-1432,640,-62,6466,4602,420,708,5873,-64,-63,417,8014,2953,-5564,-1483,906,-64,-8830,-1383,-3946,-11393,-288,-62,-9049,-2096,6503,-4524,6047,910,-63,13369,7187,-2565,-19151,5061,-8876,-64,194,8631,15004,-8255,-3762,962,-65,-11686,18438,278,-11903,-8790,722,-64,-9170,-6673,-7912,-23741,31576,-2998,-63,-20391,-19537,12555,-5842,-13092,7076,-61,-15694,1617,19004,-8866,-8827,3856,-60,-2325,3086,21133,8814,1032,1851,-63,3567,7587,-2111,5858,1910,-1218,-64,-3042,13438,-9529,-8584,5717,2113,-65,5811,-5394,-6621,2968,10519,-2660,-3635,-4528,6735,-589,-3257,2453,-66,-197,4221,-1080,-10985,-16770,-64,-64,-8476,-8538,8617,16825,-1590,-2592,-64,3076,8426,8926,-14284,-8850,-208,-63,-20782,541,-821,-7657,27026,1002,-67,1290,14430,-21927,-2835,2913,-2763,-66,11277,-12147,7620,12632,11603,-1229,-68,3946,-6903,-1466,8436,-6696,-2150,-68,4713,5649,-3671,-17745,-16982,-66,-66,-26571,8833,6304,-22822,8,-4902,-64,2889,9574,-10624,-5023,21600,-1496,-66,6205,-7655,-7764,-7531,6435,-1781,-65,2020,-12018,11294,21355,2333,671,-67,-12076,-1692,-496,-15204,15998,-2946,-66,453,15851,-2450,2152,-10557,1185,-66,2746,-10361,20475,139,4514,-3701,-67,-657,-4384,4886,4964,-870,-2864,-67,588,-2398,9998,3892,6789,2511,-69,-2491,6560,-5310,1328,-11983,6624,-68,-13165,5581,5970,13370,-21833,-2423,-68,-8828,-6942,-7122,-7577,-1009,99,-65,-3635,-906,1277,5451,16453,-8634,-66,9028,-29259,-2895,6582,-6874,2108,-63,4445,-9121,-9416,-1447,-17849,6555,-61,-12564,6360,9880,-6343,-10479,-2342,-60,16687,23418,-6554,-4662,-10796,3329,-61,-5770,-1245,-1105,14611,-13655,783,-62,11314,7047,-8969,937,6962,4416,-63,-343,9816,-6179,-13184,9753,4488,-63,-548,7621,-14706,-7320,26208,-6329,-64,7174,-137,-15703,27737,19382,-17781,-66,-6769,8661,-14987,-133,6161,-2564,-65,-5462,14170,309,-866,-4223,1509,-65,-13858,3706,20316,-1324,-3567,-3721,-65,-8310,-10921,1004,344,1618,-811,-64,1715,4222,-2160,-19843,-2853,-500,-63,-3700,1439,12854,-8652,2964,-241,-62,9,504,-9653,8466,-2892,-386,-62,2636,6286,19845,-1662,12570,-65,-65,2883,743,4167,6612,1774,-708,-65,459,-4065,-8509,-5795,12098,88,-65,8271,-3359,783,7545,-1335,1415,-66,-11570,6071,13797,10982,-8608,2546,-68,-5786,15884,-3461,-5199,-4328,4154,-67,2890,2036,-998,-3021,-5757,3521,-66,-1398,-13421,-1814,8015,-3939,2040,-65,401,-1750,1308,-344,12877,-334,-66,-4607,-8697,-76,-4524,-10625,-1612,-64,-10735,5149,-17601,19862,-8322,-1424,-62,3726,5456,-10404,-1526,-5694,7028,-62,2971,972,10394,7583,4664,332,-66,2887,-2296,-3406,3550,1129,735,-70,3815,7360,-3425,3100,-2948,-67,-68,-397,-140,-2623,-4919,-6083,-65,-66,3,-13881,-5184,10164,7094,2261,-67,-949,-11300,-3581,-8907,11427,2663,-66,-2675,-7054,4379,-513,-797,1533,-65,7185,-5850,5381,5684,-1733,41,-65,1159,-5365,-7229,-6479,8960,-969,-65,976,-581,-6323,11660,13721,-67,-67,-1301,7911,1571,-1635,-2090,-1942,-65,1996,5437,-1842,5889,2382,-7452,-66,-317,-5735,-3288,851,-6542,5284,-66,-1264,2142,-3587,5863,3937,2257,-68,4624,-2554,-1825,-11122,271,631,-66,2093,6114,5559,5555,-13303,-2141,-67,3773,3269,2847,-1399,3302,3139,-67,2700,4116,8628,-1714,6243,6657,-72,2686,-8749,-13138,-3402,-715,-863,-71,472,-4984,959,4338,-2812,599,-71,-2431,-7342,-2959,-889,-3368,1765,-69,2057,-3987,4975,2580,-1960,1602,-69,5916,7380,1760,-4956,5283,1532,-71,-860,-7122,-2036,-4542,2962,-69,-70,2906,3566,-2360,9007,-1239,4004,-75,-4426,-782,-8746,-11637,-4865,-914,-73,4575,-7783,1047,7680,2141,-3181,-69,-7892,-6644,-475,-3067,6869,-2208,-68,9456,9071,-18,-5264,-326,5326,-69,6701,5665,-10245,-6873,-9251,-1837,-68,-5019,6186,-11289,-952,-1747,-171,-68,6315,-4088,1631,18608,3747,-2332,-70,-1207,-4804,-1009,-14,225,333,-69,2346,13816,7022,-8042,6001,-759,-70,2608,-8409,1896,4061,1357,-960,-71,-2416,1427,283,1173,9880,3031,-72,-5,-2796,5791,5471,4529,-73,-72,2601,-1548,6785,6574,-6439,-1595,-74,1918,10595,-8064,9800,742,-2009,-75,337,4936,1500,-4806,-2602,3689,-75,-75,1708,-1749,1466,-309,1384,-74,3641,-3760,-706,-4630,3648,3000,-74,1809,-10166,-3645,4804,3966,-74,-74,3811,3509,2026,1113,-1292,1302,-75,2251,2760,-7671,1073,3058,-3894,-77,-4661,15480,-687,-5237,4914,-1125,-77,6895,-9804,4328,10908,221,-1730,-78,719,-2584,-273,8908,1884,619,-79,-9036,2272,-4823,4288,569,290,-78,4023,-6655,5310,2777,2189,-2103,-78,1062,3244,4363,-6397,4247,1425,-78,4446,-1806,5863,5666,-6672,5126,-80,4754,1034,8627,5846,437,1242,-81,-906,2381,-37,-6435,-4726,1043,-77,2534,2348,-13352,-2571,-1995,4938,-78,-6165,-10341,1988,1349,-320,1571,-78,3647,8305,-2683,-8348,4258,-91,-79,2097,-11526,-264,-712,6328,-79,-78,8191,6554,-6824,7726,3101,-3052,-79,4477,2388,789,3587,5756,779,-81,-420,-754,-5325,-5057,2864,-81,-80,3278,-3096,-12296,4135,13369,-2400,-81,-651,-10423,5040,5451,-2534,-1911,-81,2345,4005,-507,-8542,-4753,6733,-80,3590,2929,1812,3351,509,-81,-80,6678,-6323,-726,2281,-1929,-863,-80,2085,-1528,7098,1031,-541,-1569,-81,3196,-1207,8666,6666,3775,-1073,-83,1084,10461,3037,-8274,-7151,1865,-84,6779,-867,-6851,-3462,13235,-1682,-84,4060,11171,2312,-10323,-29757,-83,-83,-37564,7818,7583,6076,4173,11,-82,1054,10712,2089,1564,6401,658,-84,4118,-1133,-1720,-2097,5912,872,-85,1037,-2502,-1270,3138,10196,-763,-85,-266,-12267,-6421,-1413,-17136,-173,-79,2675,-1455,4950,7297,8229,-3133,-82,992,25,-2117,9427,-1221,-1298,-80,2628,9831,-7508,8958,5128,403,-80,-2090,1359,3749,-4527]}});
\ No newline at end of file
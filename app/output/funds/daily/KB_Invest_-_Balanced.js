@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Balanced", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1092375,-989,1285,167,-22,3110,-281,693,54,-6129,1703,-22,1429,-577,-2931,-2835,5470,-1006,-27,-44,4446,3640,3232,2523,471,-31,-1873,1178,-382,3048,7657,1070,-21,2285,-1273,3736,3401,2114,1771,-32,-1032,-974,3483,-2628,1297,238,-27,1225,1714,-4975,1722,5600,1616,-28,-2778,1399,-1575,-921,2891,-81,-41,-3415,-1503,2406,-4684,955,-753,-31,-2604,-1429,-6410,-233,-3361,-331,-182,-8058,-3457,3139,7059,1723,-146,-30,2518,439,283,578,215,824,-30,1136,728,-2475,445,1830,1408,-26,-4953,-816,506,7538,102,-668,-23,-1771,1538,-1929,2897,1997,1841,-19,244,-1679,3831,3249,4092,6810,-20,-6064,-4856,-4522,-1301,-5954,242,-20,1569,6316,-2656,1199,-1749,-660,-46,-2499,3298,-25,5582,4151,-889,-23,-2313,-3482,-727,-484,2960,1426,-23,-88,1940,-2766,582,1853,1202,-23,-1887,93,-1773,2632,252,2254,-21,-5943,-2151,2042,3673,-2763,680,-21,-2015,-2365,-2326,-1568,1970,-1751,-21,1178,-1863,-3730,-1531,-530,1657,-24,4693,-4129,2497,2102,-2609,-3007,-23,-850,7919,9236,8638,1838,-26,-26,385,-1733,6401,-196,-4598,-1900,-26,2682,-1796,2844,-278,-802,-926,-34,2021,-1782,-5350,-40,-2132,-31,-30,2792,-2595,-884,-3621,6834,1225,-30,-847,-60,1599,490,-3279,1996,-9,-949,-1378,-395,2387,199,-575,-10,-181,-3719,8051,-2077,-3179,-10,-35,-595,406,-581,-5526,-3861,2185,-10,-1132,1253,257,-1789,-1408,244,-9,-5458,-28,-1545,-238,-1770,2295,-10,7174,920,2371,-1532,-605,76,-10,-10871,1353,55,2125,405,-704,-7,-8902,-1982,-60,1176,7466,-2938,-8,4146,3950,2988,4298,3871,-9,-9,68,-286,-1725,-347,-5394,1319,-9,-7136,319,3854,1184,2699,-909,-9,508,-648,2563,1649,-1525,-1344,-9,3692,-3687,-3232,-128,3556,-1381,-11,2281,1709,-159,-4569,-9186,-2086,-10,-12107,866,96,14474,4212,-12,-12,-2495,-2584,-41,3736,-1819,2232,-12,-192,4719,1276,-282,-1291,-1828,-18,1001,389,2117,3334,-7164,-2286,-13,1073,-2323,658,-3935,4022,1996,-14,-4142,-1733,4772,874,2328,-173,-14,7214,1880,4975,-1616,4554,-2602,-15,-626,-2279,322,999,-891,1604,-15,-434,-65,-580,4136,5876,-17,-16,-2423,4992,4667,-417,7873,-2433,-18,5055,2684,1335,-1594,436,413,-20,-4278,466,2798,-3136,-4138,-873,-19,2120,5560,4800,4942,5433,-86,-21,672,1270,-582,2779,-1293,954,-21,248,-705,-2049,-4047,-1842,-5913,-12,-3649,-3524,793,-5257,-4247,-179,-933,-1507,6687,1125,2055,-513,111,-25,-986,-103,3157,1360,-1251,436,-25,1918,-2288,716,-358,568,-26,-25,-3964,781,403,-6014,-3503,-2844,-24,-789,-802,-1173,-548,-9429,-157,-23,-7875,2018,-4104,2942,7571,2052,-23,-4873,4706,765,-922,7755,-409,-51,-3233,-4196,-1269,4724,-9579,62,-24,-5840,-1204,-2252,-4485,4501,1457,-22,1356,657,5889,1844,283,-250,-21,5257,-1815,-3140,2027,3077,417,-21,2956,7444,4943,-821,4875,-1605,-23,418,-1645,171,-794,9378,-5055,-24,153,-3150,1980,2566,-3736,644,-24,-1206,607,-1937,-2896,-749,-261,-23,-625,2482,3120,-2630,-3215,-976,-32,-167,-3893,2419,-1688,2451,-6,-23,2908,420,7850,1138,-641,-641,-24,-77,5662,1782,-1255,-1049,1903,-24,-3174,2253,2188,1603,-3153,-24,-24,19,-6349,-6370,357,2010,213,-23,-1273,2111,1519,779,31,820,-24,2223,3,516,-2648,6104,-498,-24,-2607,3489,3769,2198,-1452,-26,-24,265,-2360,-3999,-1729,200,613,-25,2314,-2132,194,-2512,9189,680,-26,-3759,-3437,2386,-6707,4156,-25,-24,5154,-1356,1385,4693,-17085,6007,-24,-5883,3536,2869,993,4304,-652,-24,-8,-2555,387,3785,3967,-272,-24,5943,4291,-575,5047,-2303,554,-26,-495,457,969,2754,3377,-91,-26,155,604,2229,628,455,-478,-51,-1206,-4128,165,5522,5234,-364,-26,-227,2712,-166,-814,2453,-136,-27,1086,393,-505,1691,900,-128,-27,2287,2918,586,3357,1058,-19,-28,-793,1836,-426,5202,771,-839,-28,-209,-91,4602,542,-4825,-590,-28,-1560,-4225,-905,1112,-2362,427,-27,643,1895,2946,5142,-3217,418,-28,-2765,-863,3437,-205,2642,1082,-28,108,1178,3441,-158,948,780,-29,2392,-1606,1080,553,1616,661,-36,-445,9732,10705,3969,1031,1781,-38,1988,8178,1641,-2957,4147,330,-38,349,-3207,-4064,-2275,-748,-611,-39,10462,2494,3335,1004,552,-191,-40,6137,10027,8347,10732,9754,1768,-43,12,-30,3757,-771,2265,-968,-42,-3169,-4575,2274,849,-3662,-403,-41,-902,-1901,-885,3974,-476,3442,-42,14,-1263,-1357,-4938,4122,-501,-39,-2972,2838,19537,-2205,21,-104,-40,80,13204,-9497,-4091,-1237,-1662,-40,1029,2953,5128,1152,-180,-39,-40,8235,3711,-774,929,-888,287,-40,168,2597,2391,218,4779,703,-7,719,3744,3829,3155,4978,417,-11,-2748,-33,-1387,-129,4826,1255,-7,-1528,-1249,2335,5042,-994,791,-9,2409,1538,-1667,-135,-5141,66,-7,-989,4495,-742,795,-2068,-689,-8,981,5660,3667,-268,1552,-1042,-9,-4029,-28669,-2113,-3988,-1545,-1071,-6,40727,-2899,4196,-12494,-1421,157,-7,35,2204,-650,246,-1042,-265,-6,-590,926,2718,2133,1718,811,-6,-1295,1959,-314,-125,-512,820,3,-2578,-2551,-3011,-1534,-528,0,0,409,-1820,1626,-752,-3215,1290,-1,9523,-3099,335,-1299,-1729,-1009,-2,-146,-42,-1040,2627,12225,-664,-1,-1549,2184,6515,522,69,-355,-1,3021,-3678,-7012,13263,7640,-1421,-3,10259,1635,398,-1822,-4076,733,-3,-390,-1330,734,4889,1646,-5,-5,-192,-3717,-1476,3001,1634,1040,-5,-1919,1207,1196,-1926,1189,-31,-9,2863,-2807,-1091,-52,-2005,-100,-8,1224,17969,-15779,-3596,-239,27,-11,3470,-1270,-2269,-1171,-1132,-794,-7,3616,1759,4976,4141,2387,75,-4,-4920,-1460,2633,2975,8564,-3338,-4,489,2871,-3960,-1596,-4017,-371,-2,3836,12534,-631,-495,732,-148,-5,4603,3859,-1909,698,-1234,3,1439,-2869,2492,1534,257,-797,1,-1407,2933,1696,204,-71,557,-2,-664,-396,-5544,5305,828,-1945,-3,-124,1348,3409,-1370,-1863,-4,-5,-4811,-1560,1785,-468,1719,-1555,-4,4687,-233,493,2635,105,-1348,-5,-4516,4744,3285,356,461,-559,-6,2908,-2198,-3995,1196,776,706,-6,1550,-1397,-52,-1664,-324,786,-8,2028,-463,1853,-2095,-2266,341,-8,137,3084,-1258,2128,1244,2895,-8,2609,-1282,-2202,-1826,750,-286,-9,-91,10,1713,-4384,-2985,-456,-8,-2903,-1487,-6494,-544,866,-478,-7,-1907,604,1329,-1596,-4197,-408,-8,586,1089,2719,899,-3100,-541,-27,1008,-1552,-1933,1213,2256,-27,-27,-88,940,-2344,-1032,-2531,718,-27,3400,-1177,-967,1976,-603,111,-28,663,684,-2766,3707,-1243,-1207,-52,-27,3175,-1046,5877,3685,355,-28,1537,1761,1450,3772,4601,-2287,-29,-88,-1533,5634,2959,1790,-29,-30,3101,-907,863,-410,4335,-583,-30,-54,-723,-184,1430,-4325,-159,-31,-6899,-6657,1525,-5040,-3141,-399,-33,4370,725,629,1250,-1409,469,-33,700,-278,3050,2403,3872,-434,-34,1869,-1041,-180,-1466,-4614,-2765,-32,911,3478,2330,-588,1697,2031,-34,1780,-2168,-460,-1410,2639,677,-35,-4102,572,-614,-4506,-6857,-560,-37,981,-1651,-2538,-1154,1831,-121,-37,997,-514,4384,5713,-1854,-39,-38,-1647,-1657,-7732,1233,690,52,-38,-1518,3550,4903,4077,-67,1218,-42,2250,2999,-1683,2775,9616,1758,-46,2814,-289,5845,3830,1069,324,-47,2401,-1070,2753,1819,-1444,-992,-45,-934,1148,953,2147,26,371,-47,-3569,254,-1619,-1077,-1968,-46,-45,-5159,-3246,6068,1616,5073,509,-46,3174,917,3794,2141,-2430,1328,-46,-135,-1623,2541,1113,-2378,-47,-47,662,1376,4009,-4412,10537,-1997,-48,200,-6313,-3130,-735,6837,-1475,-37,3045,4696,-4447,2470,-1574,-402,-30,5312,104,-679,-807,1508,153,-32,-3605,-5144,829,3134,1549,-1701,-32,-363,4110,1249,2911,-606,1735,-32,-174,3659,-4668,-1989,-1626,2061,-32,-520,380,-3377,-1649,-4284,2522,-31,-2551,1646,-3817,1519,-2679,-319,-31,907,-58,-1190,-3304,2495,-195,-27,3910,-1777,2946,-2541,-3739,773,-25,-756,824,-769,-2362,-2014,327,-26,2054,901,2438,601,-383,-1278,-26,827,1064,2640,2929,244,156,-30,-281,1786,-834,5176,2500,2478,-30,-1663,-544,-28,-7566,-4020,-111,-28,-3751,4082,-733,-5145,-11,-1419,-24,-2583,1285,1193,1613,4299,634,-25,15488,-3735,-5179,1512,-5113,1308,-25,-2222,-2290,2938,4751,-443,-476,-26,-135,2289,1917,-1651,-1585,1444,-22,-4279,2343,-1485,-984,-2828,-787,-21,-3378,-9463,1367,-2666,-3343,919,-20,3636,-1052,2824,889,-4150,507,-20,3924,-3418,2122,-7597,614,-389,-19,-763,2096,4311,674,-3918,1569,-12,-2024,-2040,-3434,-3675,-1308,641,-13,-2460,-1112,739,1902,5168,-1399,-14,453,-4,891,1008,7173,-1035,-14,1453,1361,4015,-1050,89,26,-14,2275,2807,2562,-34,3364,-247,-17,-475,664,1064,721,5914,152,-7,950,-1458,814,-104,241,468,-6,-710,1831,-874,-1404,-519,-22,-5,-314,1645,574,-1563,2288,69,-2,1694,3031,3687,-628,149,373,-3,2546,-1155,92,-919,-1688,629,-8,2714,1444,1387,-1201,-1080,898,-10,2245,68,908,201,1266,-294,-9,3391,-1306,-2240,-170,-3992,1547,-10,-860,-1748,944,-336,1145,-53,-36,10658,237,1709,-1123,788,-274,-12,337,1224,151,-179,1295,-1087,-12,-654,-1875,1450,172,1907,201,-10,836,-835,221,-1519,2231,-10,-11,943,-949,-2300,1101,1307,1072,-12,-752,-2624,172,-4038,2642,-714,-11,-2725,4796,1703,4465,1407,666,-10,2941,2158,-2702,-1275,507,-16,-17,-198,-2850,-1227,1858,-493,-327,-23,3327,-1052,-300,2929,501,-126,-26,122,78,-2441,-2660,-1092,-26,-26,-768,5674,3520,2965,-1177,-200,-26,-738,272,1040,1839,3785,-274,-26,4373,76,3711,-545,-1155,520,-39,-2923,-625,1312,-113,-1617,539,-24,-205,-190,-1059,-111,7692,-305,-25,-682,8866,1748,2899,2190,-466,-25,2088,281,643,-1238,-1893,-25,-26,-2808,-2637,-769,2256,-626,-145,-14,-1450,1963,-5663,-871,988,1486,-15,2014,2524,2053,-454,-2153,378,-15,949,-2712,1627,2578,1966,738,-14,287,2887,2764,799,-1227,753,-16,2067,2100,2698,1388,2759,-2873,-24,800,-298,885,1846,661,929,-24,5664,1020,18,-999,2628,49,-28,611,799,-1873,-1348,-643,-623,-28,1522,-1280,5205,3558,3399,-16,-17,-8125,-1436,537,-4622,-2294,-597,-19,-4816,2577,1474,9462,1088,449,-16,2761,25,-733,-3552,1086,527,-17,7725,2314,6088,5119,-850,871,-12,45,-3491,-3168,-1501,2186,-792,-12,53,-238,-997,2510,3252,895,-9,-287,686,1107,1826,-650,649,-5,-2264,-1327,2005,996,3295,-100,-6,2516,-589,-496,1334,1273,-755,-7,841,1992,1540,542,756,276,-11,2431,1952,4204,2392,3467,-1136,-12,2126,91,-745,2720,446,894,-15,-689,662,-8,6607,11396,471,-15,11759,-2062,-1583,-6666,212,1274,-10,-271,655,6186,-1421,970,1471,-13,-5771,1599,-137,32,-2069,-346,-14,-2593,3575,3530,3831,-1569,305,-11,-2176,6375,2917,-1747,1886,-267,-10,1512,-300,-410,-1052,-1322,-240,-9,-9204,-10957,-8816,-11977,-8132,125,9,9094,-471,8085,-1460,-16549,-2598,-1,-49942,7024,-8150,-62085,16213,2359,6,-44867,-12075,-30905,-13092,16717,1855,15,-25435,27067,20786,-5291,-24986,100,19,-5144,21317,-12854,-152,8270,2213,10,29818,19552,-2553,8135,137,-1530,9,-1035,5791,-13732,1818,7189,9,9,-2138,-11062,4318,5864,3580,-551,10,9311,9269,11852,-4819,-2627,5,6,-17017,1631,150,5856,6614,-1244,5,-432,2322,-5222,-2289,2391,-81,7,14493,-3787,2382,1259,-1972,1841,5,2542,6192,6582,5673,-4092,-2316,-20,7013,10208,13285,685,9247,-1,0,7893,-10284,-3237,-18254,655,822,0,-1574,5001,1643,-8017,-1105,231,0,-2954,5955,-8837,2176,-1744,-246,0,1917,791,2941,4643,-675,1118,-7,6434,-1551,1923,-2697,2613,1216,-8,1344,-1816,3278,1410,811,-236,-8,1378,971,2933,-396,-2137,-689,-10,279,-4445,149,-3999,-2387,-1984,-8,2458,4258,3106,-3981,-240,476,-12,3341,8527,-922,-5751,-822,363,-13,55,-2501,1754,-3032,-1672,1487,-13,3310,-2520,2471,2072,-332,-14,-14,458,-1686,2345,1731,222,-544,-15,6156,-6768,4672,-153,2936,-107,-17,2164,2374,1428,1001,-2404,-670,-19,-11416,-2100,-4843,-1506,496,161,-17,4309,-2470,2483,3455,-3400,375,-17,3115,-994,-1980,1053,-237,-555,-15,1419,-6615,3044,-5213,4110,-789,-15,57,-1908,-1860,1725,300,-16,-15,-7786,-4517,-12841,1123,4087,70,-13,6122,9595,3462,7323,-4646,-277,-15,16504,8657,4846,-516,2030,-456,-17,7920,176,449,1818,4149,-585,-19,6746,6740,374,-1251,3019,-445,-25,-2998,2905,3446,420,2540,-163,-22,-2203,-926,809,1744,-2489,-246,-22,-1788,1483,4670,2100,1513,-251,-19,-8413,2089,3764,1092,145,-19,-19,2999,1702,6612,-3228,-2007,-15,-14,2632,-1179,4577,3363,5930,297,-16,1983,8156,2758,8574,-1995,285,-17,1067,1340,2311,-2527,-6963,-15,-17,-2101,4283,-3690,6301,366,-985,-39,4019,3321,4862,3263,5720,285,-21,11111,514,3485,-3034,1182,902,-23,7245,6221,-1242,494,1472,-1181,-35,-1265,-2411,4271,-4786,-12411,2036,-34,5938,3500,982,-2176,-2479,1970,-35,4472,4706,1234,4797,-400,747,-36,-2472,-1203,63,-2908,-3694,431,-35,-2781,-5836,-7029,-1137,5202,408,-26,-2048,2656,1035,1844,1790,-425,-30,953,2609,3401,1288,428,-318,-30,3286,596,1895,-3450,6151,-250,-31,1188,-4873,-329,-1808,2382,-568,-31,2495,-2363,3314,350,-3443,-32,-31,3669,-2810,7627,8417,3738,17,-33,-449,-6893,3704,-775,7823,-498,-32,5904,1127,1933,8776,-822,306,-34,3295,2241,4439,38,-408,1963,-35,-3342,9285,5079,1802,5583,1778,-37,572,-1649,-1328,-1274,3718,1178,-37,433,-936,-4042,-5117,-1870,-37,-36,-2032,-857,1573,1176,765,-415,-37,-2463,1483,463,2529,1424,1530,-39,806,-2596,463,-10798,6712,-866,-37,-229,1815,3928,2289,-4359,-170,-39,-10482,4079,6895,-9646,-169,106,-41,144,-3869,4432,3862,-578,-443,-44,1179,1900,551,1953,6368,1137,-45,4434,1511,357,285,-382,-779,-47,-3714,6381,6051,-11136,736,617,-48,6628,7253,431,-2899,1953,91,-49,5231,5748,-3638,7596,-1678,-773,-50,1290,4841,-4807,-5764,-368,225,-49,5135,-1046,-792,-5270,-3176,-50,-49,-17814,4206,11349,5093,-2274,-173,-49,4624,-4075,3225,-2186,737,-867,-49,1465,1065,-4157,10441,1525,-185,-44,-1507,104,287,4871,1426,-45,-46,-288,6530,5940,-1216,3904,173,-46,-2500,1253,-4386,-4388,-4389,-2160,-60,5915,6197,3637,1091,7646,1655,-43,-5653,-5708,2961,2583,2050,362,-45,511,-2050,1559,-4525,-6232,-45,-894,-6115,-69,574,-17838,-2312,-41,818,-5586,80,2406,-4003,1515,-41,6228,9704,2921,-3921,-3221,1212,-42,-8903,2654,-2662,10091,-10181,160,-42,-9798,9248,2961,688,701,-475,-39,7452,7062,-1465,2622,1499,741,-41,3569,10342,3796,-1608,5253,-42,-43,846,3471,2639,-2669,-2849,496,-44,-954,-7217,3747,3357,-9820,-358,-42,-22209,-5484,10758,567,5100,719,-47,9723,2430,-644,-7551,118,-6189,-49,594,7659,8729,-4923,-4729,706,-50,-23828,19068,7171,-9650,-11183,495,-48,-13733,-15017,-14097,-72979,39871,-1864,-40,-56070,-60546,1093,939,-16380,4196,-29,-22589,1339,15384,-6985,-2963,2554,-28,-220,3117,21678,13439,3531,1258,-32,6259,7539,-2175,2350,3549,-823,-34,1072,11698,-8342,-8822,6590,1514,-33,6501,-1889,-1763,-1293,5307,1764,-34,-5950,-4981,3095,-5942,-2402,1598,-27,-1206,9162,-2606,-4411,-9236,-26,-26,-6459,-5528,7286,12784,3437,-2001,-25,2288,2060,3734,-7897,-9046,409,-24,-13957,717,2407,-8196,13269,610,-20,1459,3121,-8440,-2568,3314,-1404,-20,454,-8290,1322,1019,8412,-690,-20,6798,-3899,598,444,1264,-1012,-21,5171,3185,-3761,-14425,-11823,-16,-17,-22001,2242,3966,-11985,-1768,-2252,-13,2725,1182,-6434,-1374,11079,-863,-13,4345,-6808,-5510,-6759,7177,-835,-13,-2935,-7550,7265,11146,759,262,-17,-8585,-2533,-2795,1073,6525,-1503,-13,3601,8827,-1271,1569,-3892,231,-15,1339,-3812,11446,5540,5397,-2175,-23,1729,592,4157,6966,553,-1502,-13,4295,3096,7701,1627,2990,1588,-14,-940,848,-4133,424,-6457,3595,-14,-7979,719,23,7267,-13021,-1097,-8,-5933,-8317,-5715,-7795,170,251,-11,-5420,858,-2705,58,9914,-4645,-11,8742,-14065,-5443,5244,-3079,1006,-13,25,-11401,-4449,1863,-18048,3418,-11,-12887,189,77,-3836,-7623,-1145,-9,7793,16332,-13683,-2452,-4997,1768,-5,548,-2480,5332,2716,-5077,611,-5,-123,3098,-6810,3897,2767,3109,-5,-293,9210,1449,-3133,4531,2348,-7,-2448,6365,-7566,-8444,17990,-3390,-6,3431,-55,-7327,20020,16475,-10148,-6,1131,10325,-4537,2619,-717,-1266,-7,-5719,6157,3275,3525,-1425,1004,-7,-9709,9651,10644,6841,894,-2426,-8,-2675,-5328,2223,-622,555,-440,-10,-669,2318,139,-15294,1305,-564,-7,-2387,1485,6633,-3551,2936,-566,-8,1848,2585,-9566,4844,-1994,-504,-7,2522,6915,14910,1590,7066,-9,-9,4855,2158,3692,6067,4933,315,-11,-1889,-3805,539,-1008,6563,334,-11,4884,665,1640,7075,4249,853,-14,-5747,6468,9322,9472,-5634,1447,-18,-3850,6006,-3259,4488,-1149,2250,-20,1398,-810,-1686,-776,-4779,2062,-15,138,-10662,-5178,6662,-6064,1201,-14,2379,-2059,3797,-885,9429,-283,-15,-3276,-361,2902,-1837,-3212,-912,-14,-5332,3880,-11190,9140,-2374,-556,-10,-2428,1748,-629,2093,-1792,3463,-11,2487,4694,4347,6218,636,296,-11,-275,630,-5388,5803,2772,-11,-266,5586,-476,2738,-3571,-11,-11,-421,1100,-1932,-240,-7401,-10,-11,-2724,-5410,-197,9060,781,1434,-11,-368,-5398,362,-795,2641,1150,-11,-1891,-3330,5103,1895,707,851,-5,-1627,-1340,883,1628,-329,147,-8,-9,-5581,-4233,-5922,5864,-409,-691,1718,-792,6962,7675,-9,-9,2123,4387,-2944,-1384,1869,-1076,-9,2489,2125,-1817,8948,3690,-3801,-10,668,-3074,-4896,8056,-6115,3379,-8,-1683,2856,-2675,1657,1961,-390,-7,-503,-2421,1133,-6668,-284,271,-6,2216,3131,8413,5407,-5178,-1008,-7,4672,2478,645,-4184,3514,1806,-8,-12023,21229,-9770,21966,2905,-27,-45,-1974,-8369,-2527,-2261,-374,-6,1092,-1906,1487,5074,-1969,436,-20,-1129,-2104,-5477,-3549,-3283,848,-16,-1324,-1175,224,4398,1722,773,-17,3561,4444,2064,-2134,1420,618,-18,371,-1729,2263,-228,1768,-15,-15,3909,-3367,-881,3022,-1424,1662,-16,-2781,231,-5148,-5920,3140,-222,-15,-1810,-4423,854,9291,1294,-1449,-15,-1772,-1475,183,-2216,5689,-900,-15,3182,7433,1534,-1655,122,2360,-16,612,2073,-7307,-2334,-2580,-859,-15,53,2112,-8845,-3572,1212,-10,-14,3855,-2055,3432,7491,1494,-1114,-16,1284,-1009,-629,2425,1113,231,-20,5217,6648,3116,-582,6638,-568,-18,914,-4432,-3148,4053,-320,-431,-19,4211,2029,-533,-1713,4048,1447,-20,1860,1911,1748,3213,400,-21,-21,-659,1720,5079,4757,1970,-753,-23,4302,3998,-2242,2867,1093,-1000,-24,-599,2255,5053,-10550,-3879,1745,-30,-42,-511,453,2165,1122,824,-23,1988,-564,-1950,-316,5355,2052,-21,10192,-5170,3054,4106,3858,-23,-23,-14,3556,2629,1103,-2419,567,-25,4325,4443,-2589,8054,4150,-1830,-19,-2287,10093,3325,-3060,5139,-383,-16,1473,-4690,5482,4437,84,-683,-17,-1398,-2440,3601,9938,6901,238,-20,-6277,522,-2868,3024,-2557,362,-20,5748,-4905,1499,-619,-1550,-899,-19,3678,1972,2368,986,5221,537,-18,9885,-5510,3862,5094,1720,1969,-19,2733,1638,6050,1990,1708,209,-27,3952,4474,-4804,2352,146,323,-18,-819,4692,-6193,-3456,4430,2049,-20,-5694,-8913,10309,-24,-2472,704,-20,389,11743,-597,659,6219,114,-21,210,-9528,943,4079,4748,-21,-22,5792,7894,-2028,-777,395,-1355,-21,469,411,412,2881,6476,570,-21,2330,465,-5333,-4024,-82,-23,-23,2047,5368,-5893,1051,4462,-797,-24,649,-5688,4858,10493,85,-928,-22,9450,2135,9684,3642,-3737,2554,-25,936,3956,-917,2877,1399,-24,-24,5973,-9267,1652,-468,-1753,-260,-23,1978,495,6735,4966,5766,-656,-25,3258,-421,9369,5398,1455,-787,-25,3412,8864,1350,-3985,-3992,1017,-28,8845,-941,-6492,-8376,4851,-118,-31,4115,5431,6625,-1548,-16089,-33,-33,-23222,4736,10575,8368,3583,259,-34,1197,3484,-10652,1721,6867,382,-27,356,1573,1817,-697,4475,311,-28,2976,585,-1427,782,4610,-106,-29,847,-5678,-3261,1687,-3691,-199,-33,1239,-2175,3305,8107,3593,-1633,-34,875,1296,-799,12874,2686,-254,-33,-256,3894,-4396,6162,612,-30,-35,1409,703,-6351,-2702,3240,-834,-33],"returnScale":1000000,"returns":[0,-905,1176,153,-20,2847,-258,635,49,-5610,1559,-21,1309,-529,-2683,-2595,5007,-920,-25,-40,4070,3332,2958,2310,431,-28,-1715,1079,-350,2790,7010,979,-19,2092,-1166,3420,3114,1935,1621,-29,-945,-891,3188,-2406,1188,218,-25,1121,1569,-4554,1576,5127,1479,-25,-2544,1281,-1442,-843,2647,-74,-38,-3126,-1376,2203,-4288,874,-689,-29,-2384,-1308,-5868,-213,-3077,-303,-166,-7377,-3165,2874,6462,1577,-133,-28,2305,402,259,529,197,754,-27,1040,666,-2265,407,1675,1289,-24,-4534,-747,463,6901,93,-611,-21,-1621,1407,-1765,2652,1828,1685,-17,223,-1537,3507,2974,3746,6234,-18,-5551,-4445,-4140,-1191,-5451,222,-18,1436,5782,-2432,1098,-1601,-604,-42,-2288,3019,-23,5110,3800,-814,-21,-2117,-3188,-665,-443,2709,1306,-21,-81,1776,-2532,533,1696,1101,-22,-1727,85,-1623,2410,230,2064,-20,-5440,-1969,1869,3363,-2530,623,-20,-1844,-2165,-2129,-1436,1804,-1603,-20,1079,-1706,-3414,-1402,-485,1517,-22,4296,-3780,2286,1924,-2388,-2753,-21,-778,7249,8455,7908,1683,-24,-24,352,-1586,5860,-180,-4209,-1739,-24,2455,-1644,2603,-254,-734,-848,-31,1850,-1631,-4898,-36,-1952,-29,-27,2556,-2376,-809,-3315,6256,1122,-28,-775,-55,1464,448,-3001,1827,-8,-869,-1262,-361,2185,182,-526,-9,-166,-3405,7371,-1902,-2910,-9,-32,-545,372,-532,-5059,-3534,2000,-9,-1036,1147,235,-1638,-1289,224,-9,-4996,-26,-1414,-218,-1620,2101,-9,6567,842,2171,-1403,-554,70,-9,-9952,1239,50,1945,371,-645,-6,-8149,-1815,-54,1076,6835,-2690,-7,3795,3616,2736,3934,3544,-8,-9,63,-262,-1579,-318,-4938,1208,-9,-6532,292,3528,1084,2470,-832,-8,465,-593,2346,1510,-1396,-1231,-8,3380,-3375,-2959,-117,3255,-1264,-10,2088,1564,-145,-4183,-8409,-1910,-9,-11083,793,88,13250,3856,-11,-11,-2284,-2366,-37,3420,-1665,2043,-11,-176,4320,1168,-258,-1182,-1673,-17,917,356,1938,3052,-6558,-2093,-12,982,-2126,602,-3602,3682,1827,-13,-3792,-1586,4368,800,2132,-159,-13,6604,1721,4555,-1480,4169,-2382,-14,-573,-2086,295,914,-815,1468,-14,-397,-59,-531,3786,5379,-16,-14,-2218,4570,4272,-382,7207,-2227,-16,4627,2457,1222,-1459,399,378,-18,-3916,426,2562,-2871,-3788,-799,-18,1941,5090,4394,4524,4974,-79,-19,615,1162,-532,2544,-1184,873,-19,227,-645,-1876,-3705,-1686,-5413,-11,-3340,-3226,726,-4813,-3888,-164,-854,-1379,6121,1030,1881,-469,101,-23,-902,-94,2890,1245,-1146,399,-22,1755,-2094,655,-327,520,-24,-23,-3629,715,369,-5505,-3207,-2604,-22,-722,-734,-1074,-502,-8631,-144,-21,-7209,1847,-3757,2693,6931,1879,-21,-4461,4308,700,-844,7099,-374,-47,-2959,-3842,-1161,4324,-8769,57,-22,-5346,-1102,-2062,-4106,4121,1334,-21,1242,601,5391,1688,259,-229,-19,4813,-1662,-2874,1855,2817,382,-19,2706,6814,4525,-751,4462,-1469,-21,383,-1506,156,-727,8585,-4627,-22,140,-2884,1813,2349,-3420,589,-22,-1104,556,-1773,-2651,-686,-239,-21,-572,2272,2856,-2407,-2943,-894,-29,-153,-3564,2215,-1546,2244,-5,-22,2663,384,7186,1042,-587,-587,-22,-70,5183,1631,-1148,-961,1742,-22,-2905,2062,2003,1468,-2887,-22,-22,18,-5812,-5832,327,1840,195,-21,-1165,1932,1391,713,28,751,-22,2035,3,472,-2424,5588,-456,-22,-2387,3194,3451,2012,-1329,-24,-22,242,-2160,-3661,-1583,183,562,-23,2118,-1952,178,-2300,8412,623,-24,-3441,-3146,2184,-6140,3804,-22,-22,4718,-1242,1268,4296,-15640,5499,-22,-5385,3237,2626,909,3940,-597,-22,-7,-2339,354,3465,3632,-249,-22,5440,3928,-526,4620,-2108,507,-24,-453,419,887,2521,3091,-83,-24,142,553,2040,575,417,-438,-46,-1104,-3779,151,5055,4791,-333,-24,-208,2483,-152,-745,2245,-124,-25,994,360,-462,1548,824,-117,-25,2093,2672,536,3073,969,-18,-25,-726,1681,-390,4762,705,-768,-25,-192,-83,4213,496,-4417,-540,-26,-1428,-3867,-829,1018,-2162,391,-25,589,1734,2697,4707,-2944,382,-25,-2532,-790,3147,-188,2419,990,-26,99,1079,3150,-145,868,714,-27,2190,-1470,989,506,1479,605,-33,-407,8909,9800,3633,944,1630,-34,1819,7487,1502,-2707,3797,302,-35,319,-2935,-3721,-2082,-685,-560,-35,9577,2283,3053,919,506,-175,-37,5618,9179,7641,9825,8929,1618,-39,11,-27,3439,-706,2074,-887,-38,-2901,-4188,2082,777,-3353,-368,-38,-826,-1740,-810,3638,-436,3151,-38,12,-1156,-1242,-4521,3774,-459,-35,-2721,2598,17885,-2019,19,-95,-36,73,12087,-8694,-3745,-1132,-1521,-37,942,2703,4695,1054,-165,-35,-37,7539,3397,-709,851,-813,263,-37,154,2377,2189,199,4375,644,-7,659,3427,3505,2888,4558,381,-10,-2515,-31,-1269,-118,4417,1149,-6,-1399,-1143,2137,4616,-910,724,-8,2205,1408,-1526,-124,-4706,61,-7,-905,4115,-679,727,-1893,-631,-7,898,5182,3356,-245,1421,-954,-8,-3689,-26244,-1935,-3650,-1415,-980,-6,37283,-2653,3841,-11438,-1301,144,-6,32,2017,-595,226,-954,-243,-5,-541,848,2488,1953,1573,742,-5,-1186,1793,-287,-114,-469,751,2,-2360,-2335,-2756,-1405,-483,0,0,374,-1666,1489,-689,-2943,1181,-1,8718,-2837,307,-1189,-1583,-924,-2,-133,-39,-952,2405,11191,-608,-1,-1418,2000,5964,478,63,-325,-1,2765,-3367,-6419,12142,6994,-1301,-3,9392,1496,365,-1668,-3731,671,-3,-357,-1218,672,4476,1507,-5,-5,-175,-3403,-1351,2747,1496,952,-5,-1756,1104,1095,-1763,1089,-29,-8,2621,-2570,-998,-48,-1835,-92,-7,1120,16450,-14445,-3292,-219,25,-10,3176,-1162,-2077,-1072,-1037,-726,-7,3310,1611,4555,3791,2185,69,-4,-4504,-1337,2411,2723,7840,-3056,-3,447,2628,-3625,-1461,-3677,-340,-1,3511,11474,-577,-454,671,-136,-5,4214,3533,-1748,639,-1129,2,1318,-2627,2282,1404,235,-729,0,-1288,2685,1553,187,-65,510,-2,-608,-363,-5075,4857,758,-1781,-3,-113,1234,3121,-1255,-1705,-4,-4,-4404,-1429,1635,-429,1574,-1424,-3,4290,-213,451,2412,97,-1234,-5,-4134,4343,3007,326,422,-512,-5,2662,-2012,-3658,1095,711,646,-6,1419,-1279,-47,-1523,-297,720,-8,1857,-424,1696,-1918,-2074,312,-7,125,2823,-1151,1948,1139,2650,-8,2389,-1174,-2016,-1671,686,-261,-9,-83,9,1568,-4013,-2732,-418,-7,-2658,-1361,-5945,-498,793,-438,-6,-1746,553,1217,-1461,-3842,-374,-7,536,997,2489,823,-2838,-495,-25,923,-1421,-1769,1110,2066,-25,-25,-80,860,-2146,-944,-2317,657,-25,3113,-1078,-885,1809,-552,101,-25,607,626,-2532,3393,-1138,-1105,-47,-25,2907,-958,5380,3374,325,-26,1407,1612,1327,3453,4212,-2093,-27,-80,-1404,5158,2709,1638,-26,-28,2839,-830,790,-376,3969,-534,-27,-50,-662,-168,1309,-3959,-146,-28,-6316,-6094,1396,-4614,-2875,-365,-30,4000,664,575,1145,-1290,429,-30,641,-255,2792,2200,3545,-397,-32,1711,-953,-164,-1342,-4224,-2531,-30,834,3184,2133,-538,1553,1860,-32,1630,-1985,-421,-1291,2416,620,-32,-3755,523,-562,-4125,-6277,-512,-34,898,-1512,-2323,-1056,1676,-111,-34,913,-471,4014,5229,-1697,-35,-35,-1508,-1517,-7078,1129,631,48,-35,-1389,3249,4489,3732,-61,1115,-39,2060,2745,-1540,2540,8803,1609,-42,2576,-264,5350,3506,979,297,-43,2197,-979,2520,1665,-1322,-908,-41,-855,1051,872,1966,24,339,-43,-3267,233,-1482,-986,-1802,-42,-41,-4723,-2972,5555,1480,4644,466,-42,2905,840,3473,1960,-2225,1216,-42,-124,-1486,2327,1018,-2176,-43,-43,606,1259,3670,-4039,9646,-1828,-44,183,-5779,-2865,-673,6259,-1351,-33,2787,4299,-4071,2261,-1441,-368,-27,4863,95,-622,-739,1381,140,-29,-3300,-4709,758,2869,1418,-1557,-29,-332,3762,1144,2664,-554,1588,-29,-160,3350,-4273,-1821,-1489,1887,-29,-476,348,-3092,-1509,-3922,2309,-29,-2335,1507,-3494,1390,-2452,-292,-29,831,-54,-1089,-3025,2284,-178,-25,3580,-1627,2697,-2326,-3423,707,-22,-692,754,-704,-2162,-1844,299,-24,1881,825,2231,551,-351,-1170,-24,757,974,2417,2681,224,143,-28,-257,1635,-764,4739,2288,2269,-28,-1522,-498,-26,-6926,-3680,-102,-25,-3434,3737,-671,-4710,-10,-1299,-22,-2365,1177,1092,1476,3936,580,-23,14178,-3419,-4741,1384,-4680,1197,-23,-2034,-2096,2689,4350,-406,-436,-23,-124,2095,1755,-1511,-1451,1322,-20,-3917,2144,-1359,-901,-2589,-720,-19,-3093,-8662,1251,-2441,-3060,841,-18,3329,-963,2585,814,-3799,464,-19,3593,-3129,1942,-6954,562,-356,-18,-698,1918,3947,617,-3587,1436,-10,-1853,-1868,-3143,-3365,-1197,587,-12,-2252,-1018,676,1742,4731,-1281,-13,415,-4,816,922,6567,-948,-12,1330,1246,3675,-961,81,24,-13,2083,2570,2345,-31,3079,-226,-15,-435,608,974,660,5414,139,-7,870,-1335,746,-96,221,428,-5,-650,1676,-800,-1285,-475,-21,-4,-288,1506,526,-1431,2094,64,-2,1551,2774,3375,-574,136,341,-2,2330,-1057,84,-841,-1545,576,-8,2485,1322,1269,-1099,-989,822,-9,2055,63,831,184,1159,-269,-9,3105,-1196,-2051,-155,-3655,1417,-10,-787,-1600,864,-307,1048,-49,-33,9757,217,1564,-1028,722,-251,-11,308,1121,138,-164,1186,-995,-11,-599,-1716,1327,157,1746,184,-9,765,-764,202,-1390,2042,-9,-10,863,-869,-2105,1008,1196,981,-11,-688,-2402,157,-3696,2418,-653,-10,-2495,4391,1559,4087,1288,610,-9,2692,1975,-2473,-1167,464,-15,-15,-182,-2609,-1123,1701,-451,-300,-21,3046,-963,-275,2682,458,-115,-24,112,71,-2234,-2435,-1000,-24,-24,-703,5194,3223,2714,-1077,-184,-23,-676,249,952,1684,3465,-251,-24,4003,70,3397,-499,-1057,476,-36,-2676,-572,1201,-103,-1481,494,-22,-188,-174,-969,-102,7042,-280,-22,-625,8117,1600,2654,2004,-426,-23,1911,258,588,-1133,-1733,-23,-24,-2570,-2414,-704,2065,-573,-133,-13,-1327,1797,-5184,-797,904,1360,-13,1843,2311,1879,-415,-1971,346,-14,869,-2483,1489,2360,1800,676,-13,263,2643,2530,731,-1123,689,-14,1892,1922,2470,1271,2526,-2631,-22,733,-273,810,1690,605,851,-22,5185,933,17,-915,2406,45,-26,560,731,-1714,-1234,-589,-570,-26,1393,-1172,4765,3257,3112,-15,-15,-7438,-1315,492,-4231,-2100,-547,-17,-4409,2359,1350,8661,996,411,-14,2527,23,-671,-3251,994,482,-15,7071,2119,5573,4686,-778,797,-11,41,-3195,-2901,-1374,2002,-725,-11,48,-218,-912,2297,2977,820,-9,-262,628,1013,1672,-595,594,-5,-2072,-1215,1835,912,3016,-91,-6,2304,-540,-454,1221,1166,-691,-7,770,1824,1409,497,692,252,-10,2226,1787,3848,2190,3174,-1040,-11,1946,83,-682,2490,409,818,-14,-631,607,-8,6048,10433,431,-14,10765,-1888,-1449,-6102,194,1166,-9,-248,600,5662,-1300,888,1346,-12,-5283,1464,-125,29,-1894,-317,-13,-2373,3272,3232,3507,-1437,280,-10,-1992,5836,2670,-1599,1726,-244,-9,1384,-275,-375,-963,-1211,-219,-8,-8426,-10031,-8070,-10964,-7445,115,8,8325,-431,7401,-1336,-15150,-2378,-1,-45719,6430,-7461,-56835,14842,2160,5,-41072,-11054,-28292,-11985,15304,1698,13,-23284,24778,19029,-4844,-22873,92,17,-4709,19514,-11767,-139,7571,2026,9,27296,17899,-2337,7447,125,-1400,8,-948,5302,-12571,1664,6581,9,8,-1957,-10127,3953,5368,3277,-504,9,8524,8485,10850,-4412,-2405,5,5,-15578,1493,138,5361,6054,-1139,5,-395,2125,-4780,-2096,2189,-74,6,13268,-3467,2181,1152,-1805,1685,5,2327,5668,6026,5193,-3746,-2120,-19,6420,9345,12162,627,8465,-1,0,7226,-9415,-2963,-16710,599,753,0,-1441,4578,1504,-7339,-1012,212,0,-2704,5451,-8090,1992,-1596,-225,0,1754,725,2692,4250,-618,1024,-7,5890,-1420,1761,-2469,2392,1113,-7,1230,-1662,3000,1291,743,-216,-8,1262,889,2685,-363,-1956,-631,-9,255,-4069,137,-3661,-2185,-1817,-7,2250,3898,2843,-3644,-220,436,-11,3059,7806,-844,-5265,-753,333,-12,50,-2289,1605,-2775,-1531,1361,-12,3031,-2307,2262,1896,-303,-13,-13,419,-1543,2146,1585,203,-498,-13,5635,-6196,4277,-140,2688,-98,-16,1981,2174,1307,916,-2200,-614,-17,-10451,-1922,-4434,-1378,454,147,-15,3944,-2261,2273,3163,-3113,344,-16,2852,-910,-1813,964,-217,-508,-14,1299,-6055,2786,-4772,3763,-723,-13,52,-1747,-1703,1580,274,-14,-14,-7128,-4135,-11755,1028,3742,64,-12,5604,8784,3169,6704,-4254,-253,-14,15109,7924,4437,-473,1859,-418,-15,7250,161,411,1664,3798,-535,-17,6175,6170,343,-1146,2764,-407,-23,-2745,2660,3154,385,2325,-149,-20,-2017,-848,741,1596,-2278,-225,-21,-1636,1357,4275,1923,1385,-230,-17,-7702,1912,3446,1000,132,-17,-17,2745,1558,6053,-2955,-1837,-14,-13,2410,-1080,4190,3079,5428,272,-14,1815,7466,2525,7849,-1826,261,-16,977,1226,2116,-2313,-6374,-14,-16,-1923,3921,-3378,5768,335,-902,-35,3679,3040,4451,2987,5236,261,-19,10171,471,3190,-2777,1082,825,-21,6633,5695,-1137,452,1347,-1081,-32,-1158,-2207,3910,-4381,-11362,1864,-31,5436,3204,899,-1992,-2270,1804,-32,4093,4309,1129,4392,-367,684,-33,-2263,-1101,58,-2662,-3382,395,-33,-2545,-5343,-6434,-1041,4762,373,-24,-1874,2431,948,1688,1638,-389,-27,872,2389,3113,1179,392,-291,-28,3008,546,1735,-3159,5631,-229,-28,1088,-4461,-301,-1656,2181,-520,-28,2284,-2164,3034,321,-3152,-30,-28,3359,-2573,6982,7706,3422,15,-30,-411,-6310,3391,-710,7162,-456,-30,5405,1032,1769,8034,-752,280,-31,3016,2052,4063,35,-373,1797,-32,-3060,8500,4649,1650,5111,1628,-34,523,-1509,-1216,-1166,3403,1079,-34,396,-857,-3700,-4684,-1712,-34,-33,-1860,-784,1440,1076,700,-379,-34,-2255,1358,423,2316,1303,1401,-36,738,-2377,424,-9885,6145,-793,-34,-210,1662,3596,2095,-3990,-156,-35,-9596,3734,6312,-8830,-155,97,-38,132,-3542,4058,3535,-529,-406,-40,1079,1740,504,1788,5830,1040,-41,4059,1383,327,261,-350,-713,-43,-3400,5842,5539,-10194,674,564,-44,6068,6640,394,-2654,1788,83,-44,4788,5262,-3330,6953,-1536,-707,-46,1181,4432,-4401,-5277,-336,206,-45,4700,-957,-725,-4824,-2908,-46,-45,-16307,3850,10389,4663,-2082,-158,-45,4233,-3731,2953,-2001,674,-793,-45,1341,975,-3806,9558,1396,-169,-40,-1380,95,263,4459,1306,-42,-42,-263,5978,5437,-1113,3574,158,-42,-2288,1147,-4015,-4017,-4018,-1978,-55,5415,5673,3330,998,7000,1515,-39,-5175,-5226,2711,2364,1877,331,-41,468,-1877,1428,-4143,-5705,-41,-818,-5598,-63,525,-16330,-2116,-38,749,-5113,73,2202,-3664,1387,-38,5702,8883,2674,-3589,-2949,1109,-38,-8150,2429,-2436,9237,-9320,147,-39,-8969,8466,2710,630,642,-435,-36,6822,6465,-1341,2400,1372,679,-38,3267,9468,3475,-1472,4809,-39,-39,774,3178,2416,-2444,-2608,454,-40,-873,-6607,3430,3073,-8989,-328,-39,-20331,-5020,9848,520,4668,658,-43,8901,2225,-590,-6912,108,-5666,-45,544,7011,7991,-4506,-4330,647,-46,-21813,17455,6565,-8834,-10237,453,-44,-12572,-13747,-12905,-66807,36499,-1706,-37,-51329,-55426,1001,860,-14995,3841,-27,-20678,1225,14083,-6394,-2712,2338,-26,-201,2853,19845,12302,3233,1152,-30,5730,6901,-1991,2152,3248,-753,-31,981,10709,-7636,-8076,6032,1386,-30,5951,-1729,-1614,-1184,4859,1614,-31,-5446,-4560,2833,-5440,-2198,1462,-24,-1104,8387,-2386,-4038,-8455,-23,-24,-5913,-5061,6670,11703,3147,-1832,-23,2094,1886,3418,-7229,-8281,375,-22,-12777,656,2204,-7503,12147,558,-18,1336,2857,-7727,-2351,3034,-1285,-18,415,-7589,1210,933,7701,-632,-18,6223,-3569,547,407,1157,-927,-19,4734,2916,-3443,-13206,-10823,-14,-16,-20140,2052,3631,-10972,-1618,-2062,-12,2495,1082,-5890,-1258,10142,-790,-12,3978,-6233,-5044,-6187,6570,-764,-12,-2687,-6912,6651,10204,694,240,-15,-7859,-2319,-2559,982,5974,-1376,-12,3296,8081,-1164,1437,-3563,211,-13,1225,-3489,10478,5071,4941,-1991,-21,1583,541,3806,6377,506,-1375,-12,3932,2834,7050,1489,2738,1453,-13,-860,776,-3783,388,-5911,3291,-13,-7304,658,21,6653,-11920,-1005,-7,-5431,-7614,-5232,-7135,155,230,-10,-4962,786,-2477,54,9075,-4252,-10,8003,-12876,-4983,4801,-2819,921,-12,23,-10437,-4073,1706,-16522,3129,-10,-11797,173,70,-3511,-6979,-1048,-8,7134,14951,-12526,-2245,-4574,1618,-4,501,-2270,4881,2487,-4648,559,-4,-113,2836,-6234,3567,2533,2846,-4,-268,8431,1326,-2868,4148,2150,-7,-2241,5827,-6926,-7730,16468,-3103,-5,3140,-50,-6707,18327,15082,-9290,-6,1036,9451,-4153,2398,-657,-1159,-6,-5235,5636,2998,3227,-1305,919,-6,-8888,8835,9744,6262,819,-2221,-7,-2449,-4878,2035,-569,508,-403,-9,-612,2122,127,-14001,1195,-516,-7,-2185,1359,6073,-3251,2688,-519,-7,1692,2366,-8757,4435,-1826,-461,-7,2309,6330,13649,1456,6468,-8,-8,4444,1976,3380,5554,4516,288,-10,-1729,-3484,494,-923,6008,306,-10,4471,608,1502,6477,3889,781,-13,-5261,5921,8534,8671,-5158,1325,-16,-3525,5498,-2983,4108,-1051,2059,-18,1280,-742,-1543,-711,-4374,1887,-14,127,-9761,-4740,6099,-5551,1099,-13,2178,-1885,3476,-810,8632,-259,-14,-2999,-331,2657,-1682,-2940,-835,-13,-4881,3552,-10244,8367,-2173,-509,-9,-2223,1601,-576,1916,-1641,3170,-10,2277,4297,3979,5693,582,271,-10,-252,577,-4933,5313,2537,-10,-243,5113,-435,2506,-3269,-10,-10,-386,1007,-1768,-220,-6775,-9,-10,-2494,-4952,-181,8294,715,1313,-10,-337,-4942,332,-728,2418,1052,-10,-1731,-3048,4671,1735,647,779,-4,-1490,-1226,808,1490,-301,135,-8,-8,-5109,-3875,-5421,5368,-375,-632,1573,-725,6373,7026,-8,-9,1944,4016,-2695,-1267,1711,-985,-8,2278,1945,-1663,8191,3378,-3479,-9,611,-2814,-4482,7375,-5598,3093,-7,-1541,2615,-2449,1517,1795,-357,-6,-461,-2216,1037,-6104,-260,248,-6,2029,2866,7702,4950,-4741,-922,-7,4277,2269,590,-3830,3217,1653,-7,-11007,19434,-8944,20109,2659,-24,-42,-1807,-7661,-2313,-2070,-342,-6,1000,-1745,1361,4645,-1802,399,-19,-1033,-1926,-5014,-3249,-3005,776,-15,-1212,-1075,205,4026,1576,708,-16,3260,4068,1890,-1954,1300,566,-17,340,-1583,2072,-209,1619,-14,-14,3579,-3083,-806,2766,-1303,1521,-14,-2546,211,-4713,-5419,2875,-204,-13,-1657,-4049,781,8506,1184,-1326,-14,-1622,-1350,167,-2028,5208,-824,-14,2913,6804,1405,-1515,111,2161,-15,560,1898,-6689,-2137,-2362,-786,-14,49,1933,-8097,-3270,1110,-9,-13,3529,-1881,3141,6858,1368,-1020,-15,1176,-924,-576,2220,1019,211,-18,4776,6086,2852,-533,6077,-520,-16,836,-4057,-2882,3711,-293,-395,-17,3855,1857,-488,-1568,3706,1324,-18,1703,1749,1600,2942,366,-19,-20,-603,1575,4649,4355,1803,-689,-21,3938,3660,-2052,2624,1001,-916,-22,-548,2064,4626,-9658,-3551,1598,-28,-38,-468,415,1981,1028,754,-21,1820,-517,-1785,-289,4902,1879,-20,9331,-4733,2796,3758,3532,-21,-21,-13,3255,2407,1010,-2215,519,-22,3959,4067,-2370,7373,3799,-1675,-18,-2093,9239,3044,-2801,4704,-350,-15,1348,-4293,5019,4061,77,-625,-16,-1279,-2234,3296,9098,6317,218,-18,-5746,478,-2626,2769,-2341,331,-18,5262,-4490,1372,-567,-1419,-823,-17,3367,1805,2168,902,4780,491,-16,9049,-5044,3535,4664,1574,1803,-18,2502,1500,5538,1822,1563,192,-25,3618,4095,-4397,2153,133,296,-16,-750,4295,-5669,-3164,4056,1875,-18,-5213,-8159,9437,-22,-2263,645,-18,356,10750,-547,603,5694,104,-19,192,-8722,863,3734,4346,-19,-20,5302,7227,-1857,-711,362,-1241,-19,429,376,378,2637,5928,522,-19,2133,426,-4882,-3684,-75,-21,-21,1874,4914,-5395,962,4085,-730,-22,594,-5207,4448,9605,78,-850,-20,8651,1955,8865,3334,-3421,2338,-23,857,3621,-839,2634,1280,-22,-22,5468,-8483,1512,-428,-1605,-238,-21,1811,453,6165,4546,5279,-601,-23,2983,-386,8577,4942,1332,-721,-23,3124,8114,1236,-3648,-3654,931,-26,8097,-861,-5944,-7667,4441,-108,-29,3767,4972,6065,-1417,-14729,-30,-30,-21259,4336,9681,7660,3280,237,-31,1096,3189,-9751,1575,6287,349,-24,326,1440,1663,-638,4096,285,-25,2724,535,-1306,716,4220,-97,-26,775,-5198,-2985,1544,-3379,-182,-30,1134,-1991,3026,7421,3289,-1495,-31,801,1187,-732,11785,2459,-232,-30,-235,3565,-4024,5641,560,-28,-32,1290,644,-5814,-2474,2966,-763,-30]}});
\ No newline at end of file
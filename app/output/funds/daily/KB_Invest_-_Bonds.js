@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Bonds", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1202668,-589,-1502,457,135,322,1024,-771,384,-4374,3214,135,852,-13,109,-2947,-720,-1511,134,-1530,2869,3855,4293,460,1000,135,1454,-590,-975,131,3699,1943,136,-172,1611,1808,188,-2646,3098,137,-182,-2111,111,-1702,-3045,566,135,-1553,-3775,-4187,-772,-34,2721,136,1024,-2525,597,-144,579,69,131,-4845,-1948,-12016,5393,-6310,-880,137,-2143,-764,-7432,-426,-2848,-291,-66,-1169,-4411,-2703,10108,16444,-228,139,2573,837,677,1998,395,1226,135,6329,-62,-210,809,895,2225,145,-1448,-590,767,2754,3538,-744,146,-255,-4115,5921,-794,-3242,2879,148,-896,-86,-3578,-866,1084,9887,151,-6392,-10793,-1340,5941,2653,590,151,1012,497,-772,13,1665,-796,150,-841,9163,1213,3193,4058,-1118,149,575,-1302,-2096,2095,682,2291,153,-1232,1613,-254,286,1671,1960,285,-2244,1679,2768,3584,3377,4131,157,-152,2082,3638,4982,-1767,1259,161,-491,-1447,-2629,1617,-810,-10153,160,2162,2640,25,920,1988,2509,158,1857,3748,4901,1474,-2237,-4591,157,115,4120,6563,1232,2708,156,156,1385,-565,5977,-1072,-3404,-2835,159,147,6058,18306,-1528,55,-1311,149,875,590,-3458,-1802,-5919,131,132,-95,1263,2326,-26824,-351,2424,176,91,1539,-861,587,-5068,2447,154,8638,-1991,4962,2469,815,-350,140,-752,-637,7383,537,-6112,143,90,48,-1292,-3705,-4066,-6162,2804,141,-745,1884,-2478,-1418,1293,425,140,-3743,-3455,-150,-1964,-6073,2885,139,2115,1120,5662,-105,-1371,240,141,-4968,828,-674,4897,1580,-697,143,-3030,2401,1235,-1662,3864,-3411,142,2683,3577,1626,2110,5298,133,132,535,629,-1052,-416,-3030,1743,141,-1119,-3437,-9953,490,1746,-1268,143,943,419,-215,2679,-201,-1377,143,638,363,-2741,-1943,1434,-1376,143,3216,1956,776,499,-3884,-2207,149,-8190,-4265,238,6608,3552,148,148,-1673,3433,-2097,1637,1081,2777,149,-9873,-360,1987,-2622,-998,-1699,147,2958,-400,558,523,-1100,-2144,145,131,1306,1428,-1434,-596,2211,147,-1219,-2121,1010,917,1122,-16,146,364,583,842,-778,6806,-2558,144,68,-231,1726,114,428,1714,145,3110,980,-1970,1659,1592,146,146,763,6735,-501,8642,4492,-2469,144,365,89,1673,681,853,534,140,-363,2042,2269,-639,-1189,-716,162,18,2665,3556,45,901,63,162,-17,694,-6563,1112,-613,1293,162,-1007,576,-1353,-1277,-2719,-6289,160,768,1869,-374,-18303,-754,-20,-843,-2014,1557,-3201,1808,3416,309,156,-1715,1098,-1989,1328,-4880,544,155,1470,-1239,2517,573,187,154,155,-872,121,5027,-982,222,-2931,155,-1132,-3599,1583,-462,-3268,278,155,-128,854,-4592,-787,4691,2479,156,-2016,-227,1664,-573,394,-239,78,-90,889,-874,327,-7045,244,154,-610,113,-2683,-1765,-2788,1903,155,978,2200,2800,1814,1209,-117,156,1180,2723,-100,-4804,-237,696,155,1011,4579,1980,1424,97,-1802,155,24,839,-2170,3401,4913,-5987,154,1325,-722,755,997,-5588,950,152,480,170,2237,415,-2102,-135,152,-2405,813,3936,-2655,-2284,-997,149,1775,1508,1448,1466,-497,168,151,277,485,1524,3878,1621,-554,150,-873,1395,423,1212,1517,2427,150,-205,550,-3185,-1380,-645,150,150,-225,19,-5120,2102,1577,422,149,590,442,774,929,1153,1166,150,3071,750,2651,729,4115,-444,142,65,937,290,3631,-125,135,140,1549,874,-1397,1088,-320,1086,144,1870,-4343,-250,157,35,1189,146,-792,-1407,1300,-713,2819,152,151,1968,-3999,1158,1502,-4961,9328,145,-305,2979,226,561,516,-787,152,156,209,211,3535,867,-445,152,244,2014,-1121,937,-2087,967,146,901,953,28,728,618,16,147,1465,556,281,520,-2618,-517,18,581,-1306,37,-102,2250,-335,151,852,2881,1199,-1951,971,-13,151,293,124,-2383,17938,-529,-6,146,392,1435,-236,2111,-266,161,146,-90,4438,-535,1568,126,-1059,146,711,4109,3241,444,-488,-695,145,-1241,1126,-1046,-2,-523,814,145,-322,2785,227,3918,-1708,824,145,362,-446,2122,1574,436,1839,146,-347,-824,2811,-784,662,1356,144,131,-262,171,4987,764,1209,140,167,882,4495,1848,3365,2916,139,1459,-22,659,-1838,1075,761,140,2060,-900,-2598,-2333,-188,-762,137,-168,1240,-1536,-1485,1224,-89,139,-2933,4440,446,2257,-557,2891,142,2390,907,531,552,1766,-1275,142,578,-189,894,767,-1037,-396,144,529,-1476,56,792,762,5239,145,410,-454,228,-857,7894,-566,145,354,651,1999,-1336,-322,41,145,638,-596,568,1968,-1241,-2686,142,67,427,6285,-491,-1527,143,142,654,211,-858,3156,-4424,671,141,-111,3175,-1809,910,5234,1072,140,1176,135,1256,1414,2860,704,138,-35,1609,-2050,-1286,17,1970,146,644,694,1397,434,-1617,1383,152,336,-1482,-925,1669,-3562,257,142,504,2225,2651,869,-829,-1009,141,-855,-2502,-668,3415,420,-1619,141,-2457,-1025,216,-764,470,-1677,140,-447,-1779,-116,866,-2790,385,139,970,1204,-790,456,1051,-336,143,487,-1982,3616,4000,1355,1594,144,459,1097,824,-1037,869,1264,144,-326,1993,-1468,184,-597,141,142,203,-154,-1211,-807,104,1898,142,1243,-3294,556,1071,-198,-1239,140,-87,486,-2542,317,9233,-760,141,247,886,2855,690,1049,-342,138,680,-2710,-2509,-3215,1310,-1784,137,3794,2153,1403,344,-2056,1147,138,25,1904,751,-150,1812,136,135,-1523,-2575,-1136,1567,669,1631,136,-34,-736,3055,321,1628,101,132,-188,-1906,200,-1049,-2211,5,132,-467,-1829,-4046,-1607,152,108,28,803,-1097,-920,-3241,-913,125,223,235,-299,-154,801,221,128,399,-833,-1958,560,1519,-4222,128,-364,-27,-2092,2145,-823,-417,128,790,-1683,-505,-1352,-1254,-67,127,469,2310,-510,2510,-323,-717,130,-581,-1420,1513,2611,715,-966,132,974,-392,387,605,-770,811,137,-1024,1890,-6173,4769,1406,-2570,135,630,1190,1503,-389,-1342,134,135,-10219,-5785,1919,-602,4875,-2106,126,5550,-795,-491,-923,1133,-1803,125,-9074,9016,1764,1275,-701,-685,126,5777,1834,-1123,-1197,-267,1189,122,-917,169,-998,-1333,-1740,1333,122,-1533,344,2568,1647,-2088,639,122,1266,189,3955,-71,390,4480,123,472,-401,-6264,-2883,3615,-284,123,114,2235,62,-1222,-1840,-543,123,236,470,-2388,-2185,2286,-580,121,579,1226,3011,-317,-4061,-506,120,2778,-923,2453,2820,-314,-716,96,775,1152,1316,-98,254,96,96,-518,-1185,645,356,-3151,1264,98,262,-361,-993,-448,-473,309,98,82,2540,-2999,82,-929,-1697,40,146,-60,-2245,1414,1718,677,98,287,-752,-196,-1165,2465,-3300,96,349,-1564,1097,737,-500,97,96,-181,50,1710,-2286,-1651,-795,90,-532,1654,-985,-452,-339,-229,91,-169,1097,4001,-14,1654,-523,96,-747,-243,-3212,-1198,-4377,926,86,-290,1205,5262,803,1363,-582,98,865,-437,1247,2997,1106,-5200,93,-189,-98,-4026,-641,-876,4290,93,-170,-228,-2939,-3383,1627,1495,92,-26,-1610,927,2861,-1721,-965,91,-230,-1966,1463,-639,2758,-105,90,-396,897,1114,1830,862,92,91,-9532,-6077,-3571,975,3194,284,93,-6747,355,595,843,194,2633,80,908,3854,602,1483,558,3709,74,-412,11,-1170,1706,-424,872,75,118,209,-2,-74,778,-1903,75,-3973,-1282,4256,2862,-1007,945,75,-1771,2129,-1643,4117,22,77,78,-3253,4144,3872,-2729,-2869,1223,82,96,-2270,700,-4169,-4438,2983,81,316,-1195,-396,456,1156,81,81,558,4615,670,-1301,2219,-4082,81,294,-1983,3114,3219,1594,-2748,80,368,1663,-737,975,-2349,-646,79,3994,-2103,4256,76,3763,505,94,-1150,-2230,2174,3847,1090,-3199,91,-433,-1008,853,771,-217,3630,93,408,929,-5566,1546,-1482,4292,93,149,-286,-6021,-2000,-709,5355,93,-589,4036,-1091,3473,-802,-531,96,566,-1820,-3871,-4084,979,-240,94,1781,-2588,359,-1091,-2072,1666,103,552,1110,1486,-1656,-2511,828,100,-649,1319,255,293,-1210,-2475,104,-83,-1397,-1373,1604,-3566,478,102,-1085,1892,98,2746,2761,5192,103,-419,-2859,1584,-1994,2844,-66,104,73,-613,1226,-3649,736,-2869,104,-929,-1114,350,2321,364,1530,105,1623,-1281,-130,3026,-1164,3040,104,321,-3329,798,3635,-4893,-1049,111,1072,1427,-1866,-2795,2716,3299,110,-27,4252,1290,-5087,756,-2005,90,-777,-5392,838,382,-313,2153,78,764,-891,-1158,2120,-4465,1229,84,693,1688,-4051,1858,318,-730,87,-26,-2061,1662,1795,-3551,3640,90,781,-2017,-1331,-698,-1823,1582,86,297,427,46,-134,701,-3382,91,-32,240,2852,11,2416,-2430,93,675,-150,-567,72,-3001,202,97,421,3794,3429,2593,397,-388,116,787,3135,1340,841,3258,206,85,2336,-2978,-330,2077,-2576,1232,117,-135,2493,1696,2268,2524,72,120,41,1842,1260,223,566,362,117,1391,-3796,1685,-2332,-658,1147,116,1114,-563,1849,-815,-644,1576,116,13,1569,-204,2031,942,2273,116,421,-45,-1293,-288,984,-499,115,641,-1487,-85,459,-2264,3699,115,-492,-848,678,1474,3361,-214,65,972,427,1526,-1547,1973,-488,111,-188,26,-712,-587,-149,-2231,110,-399,1411,1281,188,1948,476,112,-110,517,695,680,3872,112,113,551,675,-4368,472,422,2461,112,123,-2842,-1044,-1964,460,-1398,112,-869,-250,318,2548,-578,1384,105,10,599,556,-1295,1309,101,102,256,-1866,315,2273,-1571,-531,86,2854,-3611,1670,-5222,187,-135,83,2512,-809,-2217,-787,491,84,84,-130,3090,2822,2257,-3474,-250,84,434,-1741,476,2077,98,-347,83,2151,1122,1846,285,-722,1164,86,-135,-54,-445,-492,-2565,1225,86,1119,-1894,2319,628,1613,-384,78,52,-12,3001,4155,264,-748,78,2711,-1312,-201,-1543,4387,78,77,475,-6425,1926,-944,562,-147,78,-432,-189,-1145,1202,1875,2851,77,-1376,1011,691,-1603,1032,778,77,20,-1316,361,758,1702,1387,77,-18,4160,2428,-3470,-2796,1369,78,16,-536,1389,2992,2286,-4934,76,-519,1057,696,871,44,1628,60,18,2071,-891,897,1930,180,52,226,2076,-20,-711,-479,-1016,-1076,-901,10,-56,-793,69,69,-53,-448,-227,-192,-1711,-909,73,719,-613,992,613,986,807,74,2389,-488,-56,-1611,-1500,800,73,343,-1070,1569,940,-515,1508,88,1726,-2692,677,1788,301,-1144,84,1915,-2548,-2246,106,39,1340,80,94,1117,-650,-156,453,1010,90,-3113,382,-1212,-256,-211,-5,89,4045,194,-1073,911,-1107,-1055,86,455,900,109,1665,-265,592,86,-1445,976,-69,-963,483,-1736,93,-178,791,-1095,-316,1828,1437,80,-937,650,475,2420,909,763,85,1213,-505,1306,610,-416,1936,94,-360,611,1081,-288,1255,2074,89,-2245,1356,1212,622,28,-466,86,316,392,1549,1897,-361,721,92,-1055,1021,1998,-341,1423,81,93,416,-129,430,-193,-332,-242,93,-1643,-1583,-1637,-3124,-7073,115,113,566,-2109,-61,-1536,-6994,-4107,102,-11597,-4142,-3780,-13012,2998,4389,115,-11351,-10147,-10431,675,4423,3490,128,-6113,3271,2988,5107,-7544,254,120,-24146,3487,2857,281,-2367,4105,122,21644,1190,-3227,6082,113,-2544,120,406,2472,-723,2594,-350,120,120,-83,-1890,-877,3288,3553,-837,121,136,-2288,-1083,-135,-1260,121,121,-688,986,3203,4424,916,-1987,121,2009,5649,1049,-984,5186,-51,112,6673,-4838,-278,592,-791,3101,110,-855,3135,5376,1444,-4176,-3624,89,6446,4588,2361,603,1317,103,104,2306,-1724,1734,-5433,581,1424,91,148,5782,-699,2429,733,466,92,236,200,-4240,26,2580,-309,92,148,-854,4773,158,-2150,1977,82,760,-3329,145,-124,-3767,2121,90,572,-2981,1499,1106,-124,-306,90,1491,1713,1329,-1175,-71,-1052,88,805,-5072,913,-1741,-1215,-2896,88,-104,365,2636,-2922,136,816,83,944,2790,-1257,591,-1779,648,83,385,-903,-511,-932,2815,2378,83,1112,-2128,504,1244,24,83,83,123,-1885,544,3537,1144,-736,81,175,562,558,1602,-2049,-61,80,-196,-183,-100,201,1772,-933,79,-2785,360,627,-469,2170,375,80,-63,-2142,-1009,747,-1598,707,80,829,-1153,-9252,1944,1176,-759,91,469,-6753,5570,874,2270,-1139,91,308,-3880,-1389,-1087,1772,108,107,-236,1442,-2111,3695,528,245,108,1016,5271,1108,3880,-4770,-311,107,2020,1189,4297,2483,-505,-575,108,2460,-915,-1044,962,1691,-769,108,2009,776,1744,-707,398,-535,108,-111,-83,1610,-626,-877,-111,105,82,989,193,401,-765,-230,105,215,189,1339,-914,-1478,-238,106,-419,2361,-2123,1961,-614,106,107,465,-137,-484,-6724,-1827,107,106,1002,-1922,105,232,192,549,106,-858,574,1360,357,1660,410,108,-435,1400,892,-715,-817,111,108,1410,1061,252,69,1385,-1145,75,745,1862,2047,1986,2297,492,110,902,-1904,-2513,-157,-365,1185,109,2302,-1791,-734,3583,-2272,-1398,109,174,-227,55,-765,-3954,2963,110,1273,2414,617,-1355,-923,2839,110,-2010,3382,967,2806,-3258,1145,111,-33,1737,646,-328,-713,639,97,-3001,-832,1036,2698,320,629,111,-1484,-35,287,146,-864,-390,98,14,-903,1605,-711,-449,-253,98,-1420,650,-509,-5156,2731,-180,92,673,-1807,834,2942,-327,-525,100,66,-536,17,1449,-1204,98,97,245,-939,3796,2085,-479,152,99,1094,-4809,-1990,646,2154,-391,98,859,-686,-2453,1436,897,479,98,192,1233,-1467,1955,-165,2252,98,335,539,-105,627,778,2043,96,910,22,313,-1073,1516,1408,96,-299,-622,429,-1169,5497,97,96,-130,1593,879,-1397,271,-296,96,214,1157,173,242,84,1756,96,-11,-614,84,-339,-1307,-666,98,182,575,-50,1218,-194,-47,96,-225,855,-132,1557,328,238,92,80,-1236,-1286,292,-1448,-280,81,1236,-2288,441,577,508,1039,73,71,1135,1022,528,-117,-512,73,-146,132,375,96,959,559,60,141,-434,-175,592,-423,156,59,-373,392,-98,694,-607,-447,59,131,207,499,15,1058,294,61,155,1340,-558,-870,964,120,61,-1581,2091,-646,-436,-616,-26,64,-1010,-1731,2432,-2304,613,-538,67,1860,-3800,354,2848,-3080,-6,79,-1122,-384,1104,-633,-658,76,77,-739,610,636,-1704,-549,223,75,-60,2190,-845,-175,-207,-1358,29,861,1467,-424,1308,1709,1046,64,488,-1163,-1214,-38,-905,313,69,-686,-1265,1088,615,-745,1647,70,-1947,-3948,339,1185,-4318,-1365,74,493,-437,-1947,1713,-543,1106,78,642,-502,1825,-1119,-1492,896,77,-14,-406,-1358,1204,-5734,232,90,-3435,1670,-769,-333,25,-250,94,1214,438,-968,309,566,757,94,-255,842,1724,-2484,-409,95,94,-2463,855,649,-3345,-9843,461,95,-2650,-2643,2077,1185,432,-118,96,-4216,-498,430,2848,2153,667,106,-396,-1026,-548,-2621,-1808,-4269,98,-1737,140,1997,-905,-3548,655,99,-7054,3962,1880,-3776,-3789,493,100,-3317,-11352,-18801,-48931,18107,-1570,90,-24579,-138906,-14811,2538,-10551,3647,116,-30522,-764,16587,-4207,235,1860,94,3699,2088,20877,-1127,-4052,937,104,-3767,199,-436,-871,2535,-364,103,2399,13122,-4441,-2330,3459,1054,106,-84,-4239,-2581,1280,-1522,1184,107,2131,-460,-1902,-858,-1987,835,107,60,-2054,3627,762,-1804,106,107,-8,-227,8398,2110,5333,-1158,116,-364,543,1282,1290,-2613,533,115,-3513,-475,3073,-304,2171,643,117,-831,-539,3134,102,6014,-1016,110,625,-2751,-2050,-29,-358,-416,114,313,-2657,-164,364,-256,-694,114,-2253,-2981,-4216,-5696,-4896,121,121,-7973,1082,2371,-5371,-2499,-1304,127,288,-866,-758,1105,860,-386,127,-334,-4621,-2509,-1290,4062,-339,127,780,-2577,1632,-2919,-3311,245,120,-2742,-1782,-3904,-4530,2794,-784,130,1599,-1199,1839,2903,6052,281,129,4255,-1668,2114,4471,3178,-1223,94,750,15357,2619,3346,2988,-884,133,7982,2337,-5334,2165,980,1178,132,1144,3248,883,211,-1517,2561,133,-1080,1465,549,1551,-4105,-606,133,193,-27089,-1700,-956,-267,297,135,-271,402,420,1135,715,-2760,135,2539,-5187,-1606,2546,-2644,788,128,1610,-11431,-3793,-3167,-3409,2431,130,-6697,-1495,-1671,-624,-7632,-631,130,3603,2617,-6883,-4995,-2071,1230,130,21,1736,6069,-3362,-1740,533,131,1046,948,-4821,-359,-1411,2178,124,2761,3933,327,3886,2439,1655,129,-949,2585,-3513,-344,5971,-2055,130,1049,79,-843,7079,7069,-6043,128,725,5601,4615,1290,-5005,-654,127,2514,4309,2318,1005,5954,778,127,1101,2986,5639,4542,1927,-1390,125,-721,-1904,2410,-2872,-2529,-118,120,-98,329,1725,-4064,3754,-284,125,-2498,2064,277,-2158,-1416,-388,139,515,-1463,-2811,155,-622,-205,140,-66,999,3142,-2654,1742,140,139,600,-3921,1655,4298,826,724,139,509,693,2428,1821,-1538,353,138,1447,298,3422,778,14184,639,122,-1904,-19,4413,2350,-5712,976,123,-3918,2853,106,6625,-3822,1114,120,-112,-1718,-1396,-1655,-2225,1037,128,-300,-5092,-1268,2593,222,707,128,1231,-1071,-1083,-2014,2314,8,129,1547,2347,-823,2097,1282,-317,128,2188,-2781,-1546,3770,323,13,144,-1150,-3421,-831,-509,1552,1516,143,3596,1911,571,1678,977,277,142,35,1910,625,177,156,328,142,-540,3412,164,744,-2062,141,141,490,-190,640,-1175,-2232,141,140,-4,410,584,-104,1019,760,141,-734,-1574,1354,-193,-1217,518,140,-940,590,3660,3010,-556,498,157,-2551,-1395,-169,-2669,1470,189,138,2316,-176,-618,-445,1371,-25,138,1192,1363,2079,2217,1733,138,138,1811,597,-1293,-1464,2011,-273,138,-340,2037,-461,531,1145,-1322,132,-1899,1160,492,4120,1562,1875,132,2350,1658,-1392,-376,-359,-1081,135,-2378,-2096,-336,-4075,-1191,256,132,1984,545,4062,6721,-257,-281,137,959,2649,500,-335,277,825,136,-639,2953,1275,1447,4940,1193,127,554,541,-1319,-7835,2442,11,139,3384,1348,800,126,6369,333,120,-4498,3136,72,-568,584,507,120,-1621,372,3774,1295,-563,427,120,817,1777,215,-1327,337,376,119,534,-314,646,1076,1684,124,124,-440,565,150,626,746,619,113,-97,-1751,146,-1890,854,85,121,-1088,1291,-1645,-3789,467,-441,118,-2832,-2609,-895,-106,-1514,-153,121,598,2512,1886,-1330,-157,931,114,-367,-1201,-2128,-1053,387,-194,115,-82,2093,-1155,-1735,1735,127,114,935,265,2218,5921,1620,-310,112,1273,-6,1556,-668,273,216,105,-1146,2647,118,476,2412,-71,113,1461,620,1074,429,329,-15,112,700,535,4126,-440,2973,490,102,1634,3516,3019,916,-887,100,101,177,1218,841,6733,1660,-141,103,663,597,189,837,37,-153,103,31,457,1543,-304,-1174,711,100,70,-389,-293,-552,-1160,352,103,214,-248,398,1617,2681,1154,117,280,-1199,3189,-356,289,117,118,1439,-361,233,1124,879,303,123,1778,1499,772,1807,-739,-385,120,-1568,1978,-135,-896,-435,16,122,641,-1421,1013,2463,-931,-63,121,164,-1,-528,862,935,194,121,231,-355,791,448,796,256,120,0,782,1348,803,703,-110,116,-17,-1052,332,-2009,-587,127,115,-93,-63,911,1598,1487,658,116,-358,-163,616,616,283,22,108,-570,-945,-478,717,-2417,250,115,-71,1854,-1889,-1301,2233,661,113,-1843,-2337,1264,415,-214,309,114,146,832,-1320,-1638,788,127,112,1534,-823,259,800,1973,106,107,552,1216,-1044,-1437,-65,-210,116,49,120,3758,1046,-1128,230,116,-220,-51,-382,-853,76,111,111,45,102,-1483,1121,1241,46,110,1242,471,632,-436,-1937,-164,113,-1254,1046,2068,-138,-773,831,112,-1127,727,-30,-1965,566,111,112,296,278,-847,192,-1040,48,113,-1691,-407,1635,200,1246,-60,113,1019,-346,991,2148,232,-11,113,-406,991,-72,-663,-428,430,114,1598,31,-560,33,1013,173,112,1931,468,1319,1222,2432,114,114,569,-3573,-353,114,1743,210,114,693,1121,751,-845,1427,240,114,978,1882,2614,-334,1323,216,114,-220,-208,305,-371,-6,38,113,-79,1277,1213,752,492,36,106,273,316,1610,-108,982,-363,104,1341,455,-326,789,-217,52,104,406,657,-638,129,1024,133,103,337,1513,529,-613],"returnScale":1000000,"returns":[0,-490,-1249,380,113,267,852,-641,319,-3637,2672,113,708,-11,91,-2450,-599,-1256,111,-1272,2385,3206,3569,383,831,112,1209,-490,-811,109,3076,1615,113,-143,1340,1503,157,-2201,2576,114,-151,-1755,92,-1415,-2532,471,112,-1291,-3139,-3482,-642,-28,2263,113,851,-2099,496,-120,482,57,109,-4029,-1619,-9991,4484,-5247,-732,114,-1782,-635,-6179,-355,-2368,-242,-55,-972,-3667,-2248,8405,13673,-190,116,2139,696,563,1661,329,1019,113,5262,-52,-174,672,745,1850,120,-1204,-490,637,2290,2942,-618,121,-212,-3422,4924,-661,-2695,2394,123,-745,-72,-2975,-720,901,8221,126,-5315,-8974,-1114,4939,2206,491,125,842,413,-642,11,1384,-661,124,-699,7619,1009,2654,3375,-930,124,478,-1083,-1742,1742,567,1905,127,-1025,1342,-212,238,1390,1629,237,-1866,1397,2301,2980,2808,3435,130,-126,1731,3025,4143,-1470,1047,134,-408,-1203,-2186,1344,-673,-8442,133,1797,2195,21,765,1653,2086,132,1544,3116,4075,1226,-1860,-3817,130,96,3425,5457,1025,2252,129,130,1152,-470,4970,-892,-2830,-2357,132,122,5037,15221,-1270,46,-1091,124,728,490,-2875,-1498,-4922,109,110,-79,1050,1934,-22304,-291,2015,146,76,1280,-716,488,-4214,2035,128,7182,-1655,4125,2053,678,-291,116,-625,-530,6139,447,-5082,119,74,40,-1074,-3081,-3380,-5124,2332,117,-620,1567,-2061,-1179,1075,354,116,-3112,-2873,-124,-1634,-5049,2399,115,1759,931,4708,-87,-1140,199,118,-4131,688,-560,4072,1313,-579,119,-2520,1997,1027,-1382,3212,-2836,118,2231,2974,1352,1755,4405,111,109,445,523,-874,-346,-2520,1450,117,-931,-2858,-8275,407,1452,-1054,119,784,348,-179,2228,-167,-1145,119,530,302,-2279,-1616,1193,-1145,119,2674,1627,645,415,-3230,-1835,124,-6810,-3546,198,5494,2954,123,123,-1391,2854,-1743,1361,899,2309,124,-8210,-299,1652,-2180,-830,-1412,122,2459,-332,464,435,-915,-1783,121,109,1086,1187,-1192,-496,1839,122,-1014,-1763,839,763,933,-13,121,303,484,700,-646,5659,-2127,119,57,-192,1435,95,356,1425,120,2586,815,-1638,1380,1323,122,121,635,5600,-417,7186,3735,-2053,120,303,74,1391,566,710,444,116,-302,1698,1887,-532,-988,-596,135,15,2216,2957,37,749,53,134,-14,577,-5457,925,-510,1075,135,-837,479,-1125,-1062,-2261,-5229,133,638,1555,-311,-15219,-627,-17,-701,-1674,1294,-2661,1503,2840,257,130,-1426,913,-1654,1104,-4057,452,129,1222,-1030,2093,476,156,128,129,-725,100,4180,-816,184,-2437,129,-941,-2993,1317,-385,-2717,231,129,-106,710,-3818,-655,3901,2061,130,-1677,-188,1383,-476,327,-198,65,-75,739,-727,272,-5858,203,128,-507,94,-2231,-1467,-2319,1583,129,813,1829,2328,1509,1005,-98,130,981,2264,-83,-3994,-197,579,128,841,3807,1647,1184,80,-1498,129,20,698,-1805,2828,4085,-4978,128,1102,-600,627,829,-4646,790,126,399,142,1860,345,-1748,-112,126,-2000,676,3273,-2207,-1900,-829,124,1476,1254,1204,1219,-413,140,125,230,404,1267,3224,1348,-460,124,-726,1160,352,1008,1261,2018,125,-171,458,-2649,-1147,-536,124,125,-187,16,-4257,1747,1312,351,123,491,368,643,773,958,970,125,2553,624,2204,606,3422,-370,119,54,779,241,3019,-104,112,117,1288,726,-1161,904,-266,903,120,1555,-3611,-208,130,30,988,122,-659,-1170,1081,-593,2344,127,125,1636,-3325,963,1249,-4125,7756,121,-254,2477,188,467,429,-655,127,129,174,176,2939,721,-370,126,203,1675,-932,779,-1736,804,122,749,792,24,605,514,13,122,1218,463,233,433,-2177,-430,15,483,-1086,31,-85,1871,-279,126,708,2396,997,-1622,807,-11,126,243,103,-1981,14915,-440,-5,122,326,1193,-196,1755,-221,134,121,-75,3690,-445,1304,105,-881,122,591,3417,2694,370,-406,-578,121,-1032,936,-870,-1,-435,677,120,-268,2316,189,3258,-1421,686,120,301,-371,1765,1308,363,1529,121,-288,-685,2337,-652,551,1127,120,109,-218,142,4147,635,1005,117,138,734,3737,1537,2798,2425,115,1213,-18,548,-1528,893,633,117,1712,-748,-2160,-1940,-156,-634,114,-140,1031,-1277,-1234,1017,-74,116,-2439,3692,371,1876,-463,2404,118,1987,755,441,459,1468,-1060,118,481,-157,743,638,-862,-330,120,440,-1227,46,659,633,4357,120,341,-377,189,-712,6563,-470,120,295,541,1662,-1111,-268,35,120,531,-496,472,1637,-1032,-2234,118,56,355,5226,-408,-1270,119,118,544,175,-713,2624,-3678,558,117,-92,2639,-1504,757,4352,891,117,978,112,1044,1176,2378,585,115,-29,1338,-1705,-1069,14,1638,122,535,577,1162,360,-1344,1150,126,280,-1233,-769,1388,-2962,214,118,419,1850,2204,723,-689,-839,117,-711,-2080,-556,2840,349,-1346,117,-2043,-852,179,-635,391,-1394,116,-372,-1479,-96,720,-2320,320,116,806,1001,-657,379,874,-279,119,405,-1648,3006,3326,1127,1325,120,382,912,685,-862,722,1051,120,-271,1657,-1220,153,-497,117,119,168,-128,-1007,-671,87,1578,118,1034,-2739,462,891,-165,-1030,116,-72,404,-2114,264,7677,-632,117,206,736,2374,574,872,-284,114,566,-2253,-2087,-2673,1089,-1483,114,3155,1790,1166,286,-1709,954,114,21,1583,625,-125,1507,113,112,-1266,-2141,-945,1303,556,1356,113,-28,-612,2540,267,1354,84,110,-157,-1584,166,-872,-1839,4,110,-388,-1521,-3364,-1336,126,90,23,668,-912,-765,-2695,-759,104,185,195,-248,-128,666,184,106,332,-693,-1628,466,1263,-3511,107,-303,-22,-1740,1784,-685,-346,106,657,-1400,-419,-1125,-1042,-56,106,390,1920,-424,2087,-268,-596,108,-483,-1181,1258,2171,594,-803,110,810,-326,322,503,-641,675,114,-852,1572,-5133,3965,1169,-2137,113,524,989,1250,-324,-1116,112,112,-8497,-4810,1596,-501,4054,-1752,105,4615,-661,-408,-768,942,-1499,104,-7545,7497,1467,1060,-583,-570,105,4804,1524,-933,-996,-222,989,102,-763,141,-830,-1109,-1446,1108,101,-1274,286,2135,1369,-1736,532,101,1053,157,3288,-59,325,3725,102,392,-333,-5208,-2398,3006,-236,102,95,1859,51,-1016,-1530,-451,102,196,391,-1986,-1816,1900,-482,101,481,1019,2504,-264,-3376,-421,100,2310,-768,2040,2345,-261,-596,80,644,958,1095,-82,211,80,80,-431,-985,536,296,-2620,1051,82,218,-301,-825,-373,-393,257,81,69,2112,-2494,68,-772,-1411,33,121,-50,-1866,1175,1429,563,81,239,-625,-163,-969,2050,-2744,80,290,-1301,912,613,-416,81,80,-151,42,1422,-1901,-1373,-661,75,-442,1375,-819,-376,-282,-190,76,-141,912,3327,-12,1376,-435,80,-622,-202,-2670,-996,-3640,770,72,-242,1002,4376,667,1134,-484,81,719,-363,1037,2492,920,-4324,77,-157,-81,-3348,-533,-728,3567,77,-141,-190,-2444,-2813,1353,1243,77,-22,-1338,770,2379,-1431,-802,75,-191,-1634,1216,-531,2293,-87,74,-329,746,926,1522,717,76,76,-7926,-5053,-2969,811,2655,237,77,-5610,295,495,701,161,2189,67,755,3204,501,1233,464,3084,61,-342,9,-973,1419,-353,725,63,98,173,-1,-62,647,-1582,62,-3303,-1066,3539,2379,-837,786,62,-1472,1770,-1366,3423,18,64,65,-2705,3446,3219,-2269,-2385,1017,68,80,-1888,582,-3466,-3690,2480,67,263,-994,-329,379,961,68,67,464,3837,558,-1082,1845,-3394,67,245,-1649,2589,2677,1325,-2285,66,306,1383,-613,811,-1953,-537,66,3320,-1748,3539,63,3129,420,78,-956,-1855,1808,3199,906,-2660,76,-360,-838,709,641,-180,3018,77,339,773,-4628,1285,-1232,3569,77,124,-238,-5006,-1663,-590,4453,77,-490,3356,-907,2888,-667,-441,79,471,-1513,-3219,-3396,814,-199,78,1481,-2152,298,-907,-1723,1386,85,459,923,1236,-1377,-2088,688,84,-540,1097,212,243,-1006,-2058,87,-69,-1162,-1141,1333,-2965,398,84,-902,1574,81,2283,2296,4317,86,-349,-2377,1317,-1658,2365,-55,87,60,-509,1019,-3034,612,-2386,87,-773,-926,291,1930,303,1272,87,1350,-1066,-108,2516,-967,2527,87,267,-2768,663,3023,-4069,-872,92,892,1186,-1551,-2324,2258,2743,91,-22,3535,1073,-4230,629,-1667,75,-646,-4484,697,318,-261,1790,65,636,-741,-963,1763,-3713,1022,70,576,1404,-3369,1545,265,-607,72,-22,-1713,1382,1492,-2953,3027,75,649,-1677,-1107,-580,-1516,1316,71,247,355,38,-111,583,-2812,75,-26,199,2372,9,2009,-2021,78,561,-125,-471,60,-2496,168,81,350,3155,2851,2156,330,-323,97,654,2607,1114,699,2709,172,70,1943,-2477,-274,1727,-2142,1025,97,-112,2072,1411,1885,2099,60,100,34,1531,1048,186,470,301,97,1157,-3156,1401,-1939,-547,953,97,926,-468,1537,-677,-536,1311,96,11,1304,-169,1689,783,1890,96,350,-37,-1075,-240,819,-415,95,533,-1236,-71,382,-1883,3076,96,-410,-705,564,1226,2794,-178,54,809,355,1269,-1287,1641,-406,92,-156,22,-592,-488,-124,-1855,91,-332,1174,1065,156,1620,395,94,-92,430,578,565,3220,93,94,458,561,-3632,393,351,2046,93,102,-2363,-868,-1633,383,-1163,93,-722,-208,264,2119,-481,1151,88,8,498,462,-1077,1089,84,85,212,-1551,262,1890,-1306,-442,72,2373,-3003,1389,-4342,155,-112,69,2089,-673,-1843,-655,408,70,70,-108,2569,2347,1876,-2888,-208,70,361,-1448,396,1727,81,-288,69,1788,933,1535,237,-600,968,71,-112,-45,-370,-409,-2133,1019,71,931,-1575,1928,522,1341,-319,65,43,-10,2496,3454,220,-622,65,2254,-1091,-167,-1283,3648,64,65,394,-5342,1602,-785,467,-122,65,-360,-157,-952,1000,1559,2370,64,-1144,841,574,-1333,859,646,64,17,-1094,300,630,1415,1154,64,-15,3459,2019,-2886,-2324,1138,65,13,-446,1155,2488,1901,-4103,63,-431,879,579,724,36,1354,50,15,1722,-741,746,1605,149,44,187,1727,-17,-591,-398,-845,-895,-749,8,-46,-660,58,57,-44,-373,-188,-160,-1423,-755,60,598,-510,825,510,820,671,61,1987,-406,-47,-1339,-1247,665,61,285,-890,1305,781,-428,1254,73,1435,-2238,563,1486,251,-951,69,1593,-2119,-1867,88,32,1114,67,78,929,-541,-129,376,840,75,-2589,318,-1008,-213,-175,-4,74,3363,162,-893,758,-921,-877,72,378,748,91,1384,-220,492,72,-1202,812,-58,-800,401,-1443,77,-148,658,-911,-262,1520,1194,67,-779,540,395,2012,756,635,70,1009,-420,1086,507,-346,1610,78,-299,508,899,-240,1044,1724,74,-1866,1127,1008,517,23,-387,71,263,326,1288,1577,-300,600,76,-877,849,1661,-283,1183,67,78,345,-107,358,-161,-276,-201,77,-1366,-1316,-1361,-2598,-5881,96,94,470,-1753,-51,-1277,-5816,-3414,84,-9642,-3444,-3143,-10820,2493,3650,95,-9438,-8437,-8673,561,3678,2901,107,-5083,2720,2484,4247,-6273,211,100,-20077,2899,2376,234,-1969,3414,101,17997,989,-2683,5057,94,-2115,100,337,2056,-602,2157,-291,100,100,-69,-1572,-729,2734,2954,-696,101,113,-1902,-901,-112,-1048,101,100,-572,820,2663,3679,762,-1653,101,1670,4697,873,-818,4312,-43,93,5549,-4023,-231,492,-658,2579,91,-711,2607,4470,1201,-3472,-3014,74,5360,3815,1963,501,1095,86,87,1917,-1433,1441,-4517,483,1184,76,123,4807,-581,2020,609,388,76,197,166,-3526,22,2145,-257,77,123,-710,3968,132,-1788,1644,68,632,-2768,121,-104,-3132,1764,75,475,-2478,1246,920,-103,-255,75,1240,1424,1105,-977,-59,-875,73,670,-4217,759,-1448,-1010,-2408,73,-86,303,2192,-2430,113,679,69,785,2320,-1046,492,-1479,538,69,321,-751,-425,-775,2340,1978,69,924,-1769,419,1034,20,69,69,103,-1568,453,2941,951,-612,67,146,467,464,1332,-1704,-50,66,-163,-152,-83,167,1473,-775,65,-2315,299,521,-390,1805,311,67,-52,-1782,-838,621,-1329,588,66,690,-959,-7693,1616,978,-631,76,390,-5615,4631,727,1887,-947,76,256,-3226,-1155,-904,1474,89,89,-196,1199,-1755,3072,439,204,90,844,4383,921,3227,-3967,-258,89,1679,989,3573,2065,-420,-478,89,2046,-761,-868,800,1406,-640,90,1671,645,1450,-588,331,-445,90,-92,-69,1338,-520,-729,-93,88,68,822,161,333,-636,-191,87,179,157,1113,-760,-1229,-197,88,-349,1963,-1765,1631,-511,88,89,387,-114,-402,-5591,-1519,89,88,833,-1598,87,193,160,456,88,-713,477,1131,297,1380,341,90,-362,1164,742,-595,-679,92,90,1172,883,209,58,1151,-952,62,620,1548,1702,1652,1909,410,91,750,-1583,-2090,-130,-304,986,90,1914,-1489,-610,2979,-1889,-1163,91,145,-189,46,-636,-3288,2464,91,1059,2007,513,-1127,-767,2360,92,-1671,2812,804,2333,-2709,952,92,-27,1444,537,-273,-592,531,81,-2496,-692,862,2243,266,523,93,-1234,-29,238,122,-719,-324,81,12,-751,1335,-591,-374,-210,81,-1180,540,-423,-4287,2271,-150,76,560,-1503,694,2446,-272,-436,83,55,-446,14,1205,-1001,81,81,204,-781,3156,1734,-398,126,82,910,-3999,-1654,537,1791,-325,81,715,-571,-2039,1194,745,399,81,160,1025,-1220,1626,-137,1872,82,278,448,-87,521,647,1699,80,756,19,260,-892,1260,1171,80,-249,-517,357,-972,4570,81,80,-108,1324,731,-1161,225,-246,80,178,962,143,202,70,1460,79,-9,-510,70,-282,-1087,-554,82,151,478,-41,1012,-161,-39,80,-187,711,-110,1294,273,198,77,66,-1028,-1069,243,-1204,-233,67,1028,-1902,366,480,423,863,61,59,944,850,439,-98,-425,60,-121,110,312,79,798,465,50,117,-361,-146,493,-352,130,49,-310,325,-81,577,-505,-371,49,109,172,415,12,880,244,51,129,1114,-464,-723,801,100,51,-1315,1739,-537,-363,-512,-22,54,-840,-1440,2023,-1916,510,-448,56,1547,-3160,294,2368,-2561,-5,66,-933,-319,918,-527,-547,64,64,-615,507,529,-1417,-456,185,63,-50,1821,-703,-146,-172,-1129,24,716,1220,-353,1088,1421,870,53,406,-967,-1010,-31,-753,261,57,-571,-1051,904,512,-620,1370,58,-1619,-3283,282,985,-3590,-1135,62,410,-364,-1619,1425,-452,920,65,533,-417,1518,-931,-1240,745,64,-12,-338,-1129,1001,-4767,192,75,-2856,1389,-640,-277,21,-208,78,1010,364,-805,257,471,629,78,-212,700,1434,-2065,-341,79,79,-2048,711,539,-2781,-8184,383,79,-2204,-2197,1727,985,359,-98,80,-3506,-414,358,2368,1790,555,88,-329,-853,-456,-2179,-1504,-3549,81,-1444,116,1661,-753,-2950,545,82,-5865,3294,1563,-3139,-3151,410,83,-2758,-9439,-15633,-40685,15056,-1306,75,-20437,-115498,-12315,2110,-8773,3032,97,-25379,-635,13792,-3498,195,1547,78,3076,1736,17359,-937,-3370,780,86,-3132,165,-362,-724,2107,-302,85,1995,10911,-3693,-1937,2876,876,88,-69,-3525,-2146,1064,-1265,984,89,1772,-382,-1582,-713,-1653,695,89,50,-1708,3016,633,-1500,88,89,-6,-189,6983,1754,4434,-962,96,-303,452,1066,1072,-2172,443,96,-2921,-395,2555,-253,1805,535,97,-691,-448,2606,85,5000,-845,92,519,-2287,-1704,-25,-297,-346,95,260,-2209,-137,303,-213,-577,95,-1874,-2478,-3506,-4736,-4071,101,100,-6629,900,1971,-4466,-2078,-1084,106,239,-720,-630,919,715,-321,105,-277,-3843,-2086,-1072,3377,-282,106,648,-2142,1357,-2428,-2753,204,100,-2280,-1482,-3246,-3767,2324,-652,108,1329,-997,1530,2413,5033,233,107,3538,-1387,1758,3718,2642,-1017,79,623,12769,2178,2782,2485,-736,111,6637,1943,-4435,1800,815,980,109,951,2701,734,176,-1262,2130,110,-898,1219,456,1290,-3414,-503,110,161,-22524,-1414,-795,-222,247,112,-225,334,349,944,595,-2295,112,2111,-4313,-1335,2117,-2199,656,106,1339,-9505,-3154,-2633,-2835,2022,108,-5569,-1243,-1389,-519,-6346,-524,108,2995,2176,-5723,-4153,-1722,1023,108,17,1444,5046,-2795,-1447,443,109,870,788,-4009,-298,-1173,1811,103,2295,3271,272,3231,2028,1376,107,-789,2149,-2921,-286,4965,-1709,109,872,65,-701,5887,5877,-5024,106,603,4657,3837,1073,-4162,-543,105,2091,3582,1928,835,4951,647,106,915,2483,4689,3776,1603,-1156,104,-600,-1583,2004,-2388,-2103,-98,100,-82,274,1434,-3379,3121,-236,104,-2077,1716,231,-1795,-1177,-323,116,428,-1216,-2338,129,-517,-170,116,-55,831,2612,-2207,1449,116,116,499,-3260,1376,3573,687,602,116,423,576,2019,1514,-1279,294,115,1203,248,2845,647,11794,531,101,-1583,-16,3670,1954,-4750,812,102,-3258,2373,88,5508,-3178,927,99,-93,-1428,-1161,-1376,-1850,862,107,-250,-4234,-1054,2156,184,588,107,1023,-890,-901,-1674,1924,6,108,1286,1951,-684,1744,1066,-264,107,1819,-2312,-1286,3135,268,11,120,-956,-2845,-691,-423,1290,1261,119,2990,1589,475,1395,812,231,118,29,1588,519,148,129,273,118,-449,2837,137,618,-1714,117,117,408,-158,532,-977,-1856,117,117,-4,341,486,-87,848,631,118,-611,-1308,1125,-160,-1012,431,116,-781,490,3043,2503,-462,414,130,-2121,-1160,-140,-2219,1222,157,115,1926,-147,-514,-370,1140,-20,114,991,1134,1728,1844,1441,114,115,1506,496,-1075,-1217,1672,-227,115,-283,1694,-383,441,952,-1099,110,-1579,964,409,3426,1299,1559,110,1954,1378,-1157,-313,-298,-899,112,-1977,-1743,-279,-3389,-990,213,110,1649,453,3378,5588,-213,-234,114,797,2203,416,-279,230,686,114,-532,2456,1060,1203,4107,992,106,461,449,-1096,-6515,2031,9,115,2814,1121,665,105,5296,276,100,-3740,2608,60,-473,486,421,100,-1348,310,3138,1076,-468,355,100,679,1478,179,-1104,281,312,99,444,-261,537,895,1400,103,103,-365,469,125,521,620,515,93,-80,-1456,121,-1571,710,71,100,-904,1073,-1368,-3150,388,-367,98,-2354,-2170,-744,-88,-1259,-127,101,497,2088,1569,-1106,-131,774,95,-305,-999,-1769,-876,322,-161,95,-68,1741,-961,-1442,1442,106,95,777,220,1845,4923,1347,-258,93,1059,-5,1293,-555,227,180,87,-953,2201,98,396,2005,-59,94,1215,516,893,356,274,-12,93,582,445,3430,-366,2472,408,85,1358,2924,2510,762,-738,83,84,147,1013,699,5599,1380,-117,86,551,496,157,696,31,-127,85,26,380,1283,-253,-976,591,84,58,-324,-243,-459,-965,293,86,178,-207,331,1345,2229,959,98,233,-997,2651,-296,241,97,98,1196,-300,194,935,730,252,103,1478,1246,642,1503,-615,-320,100,-1304,1645,-112,-745,-362,13,102,533,-1182,842,2048,-774,-52,101,136,-1,-439,717,777,162,100,192,-295,658,372,662,213,100,0,650,1121,668,584,-91,96,-14,-875,276,-1670,-488,105,96,-77,-53,758,1328,1237,547,96,-297,-136,512,513,235,18,90,-474,-786,-397,596,-2010,208,96,-59,1541,-1570,-1082,1857,549,94,-1532,-1943,1051,345,-178,257,94,122,692,-1098,-1362,655,106,93,1275,-684,216,665,1640,88,89,459,1011,-868,-1195,-54,-174,96,41,100,3125,869,-938,192,96,-183,-42,-318,-709,63,92,93,37,85,-1233,932,1032,38,91,1033,392,525,-362,-1611,-136,94,-1043,870,1719,-114,-643,691,93,-937,604,-25,-1633,470,92,94,246,231,-704,159,-865,40,94,-1406,-338,1359,167,1036,-50,94,847,-288,824,1786,193,-9,94,-338,824,-59,-552,-356,358,95,1329,25,-465,27,842,144,93,1606,389,1097,1016,2022,95,95,473,-2971,-294,95,1449,175,95,576,932,625,-703,1187,199,95,813,1565,2173,-277,1100,179,95,-183,-173,254,-309,-5,32,94,-66,1062,1009,625,409,30,88,227,263,1339,-90,816,-302,87,1115,378,-271,656,-180,43,86,338,546,-530,107,852,110,86,280,1258,440,-510]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("KB Invest - MBI 10", {"daily":{"start":17257,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000000,-49,-9,119,264,42,-89,56,57,131,-449,365,-85,56,56,56,56,94,2130,-174,-2001,52,52,-51,-2157,671,508,-1529,44,44,44,2129,564,1443,969,39,39,-65,1016,9270,-882,-3128,24,25,1100,-2600,-1792,3650,11442,24,25,6384,-1702,25,-2308,-800,28,29,-2452,-1293,1714,3490,24,25,24,184,-95,-507,176,355,19,19,1674,2180,1324,-412,-3156,15,16,2131,113,465,-692,1135,7,8,8,683,-910,454,3590,2,1,-1945,-3263,-418,-832,2086,-2,-3,9036,1526,11430,6637,1959,-9,-10,2136,250,8957,8980,20865,15,16,14225,-1527,-6718,-5494,-7120,21,20,3705,4278,20,224,2953,27,27,7343,2642,2279,1856,1371,17,17,371,-2842,397,3384,1008,9,8,-1457,2695,6180,-391,-218,17,18,19,-337,-649,2057,-2926,12,12,-299,2238,3675,-2080,5,4,5,873,-64,465,-144,-113,-16,-16,1090,-207,3209,6623,-8677,-25,-26,4108,-2803,3526,2727,-6722,-35,-34,-2543,-7549,-15352,-5700,8573,-38,-38,4678,2144,-42,-1525,3688,-42,-42,2796,-1405,-689,-7923,-2387,-41,-42,-41,1641,-12639,5643,1364,-40,-39,303,795,-416,679,-1314,-40,-40,-4973,-3101,-61,-3190,-1396,-40,-39,-144,693,1933,-2039,-2729,-39,-40,-13013,-3785,-8481,-2583,-8985,-38,-38,1582,5468,5909,10256,-9310,-39,-38,3621,-7100,-4275,1438,-45,-44,-45,-313,695,-3200,-136,166,-42,-42,1220,-1730,1664,-1043,-439,-42,-42,1068,-1217,982,14264,-42,-43,-42,-42,2275,6430,10089,9330,-43,-43,-43,-844,357,8814,7595,-44,-44,838,4342,10939,4266,-48,-47,-48,-3739,-3018,1836,11026,22824,-49,-49,6882,8008,6456,5891,565,-48,-48,-4837,-14617,-18248,-700,-1710,-49,-48,3597,9925,-4813,-237,-647,-46,-46,1529,-5594,-3349,6173,4045,-45,-44,-1399,143,594,6916,1738,-43,-43,2294,2530,9686,-4274,4248,-50,-50,3371,-873,10769,1299,-3967,-55,-55,-3271,-1440,-7102,-987,-7887,-54,-53,-841,-2599,-6020,-11601,3215,-53,-54,7358,-4749,14105,-4295,-51,-51,-51,-51,-3904,-8700,-3252,-66,-50,-51,4135,465,9786,2435,11654,-48,-49,-438,8474,-1498,4466,23120,-53,-53,2221,-54,18787,8723,-3889,-55,-55,882,-1699,3461,-4558,31,-56,-56,542,-745,4074,2554,1390,-50,-50,-3196,-7544,6051,-48,-48,-48,-48,-2283,-435,5967,12846,15585,-49,-49,8021,8578,15346,18171,6189,-48,-47,-3868,-2439,14326,4883,-44,-45,-44,8421,7696,25913,6894,21862,-47,-47,35618,-15204,-36039,-33835,28884,-52,-52,23176,11041,-11905,-7158,-8400,-53,-53,7402,1873,6903,-1908,-3285,-53,-53,-6482,-14997,-196,5117,5326,-49,-49,-694,12642,5218,1677,-1316,-46,-47,-2557,5127,562,-49,-6704,-52,-51,-6079,346,8693,661,-2900,-51,-51,-2752,-549,7000,-3761,-9358,-50,-49,1795,-2899,1515,3106,1054,-50,-50,5003,-50,2772,675,-2861,-50,-50,-645,9027,2201,3094,-1834,-52,-51,3270,-2824,1646,316,1851,-51,-51,-218,247,3600,-897,-2351,-50,-50,2490,1390,8838,10696,13419,-52,-53,-30489,4385,-11255,-20028,-24141,-42,-43,-14899,26930,18974,-44,-6200,-43,-43,-11792,2308,11946,14696,19781,-47,-47,74288,-47,-18665,-17343,-11903,-47,-47,586,903,2927,4732,1641,-48,-48,-620,-243,-2773,2808,-683,-47,-48,-492,11561,-1051,-9705,-5199,-49,-49,-5158,-13822,-183,-16679,-3833,-47,-47,10379,-5221,-2516,2338,-3994,-47,-48,1681,-1419,-11743,-12406,1608,-49,-49,12094,15506,9713,-2304,-13367,-50,-49,97,259,4071,-7854,-2080,-50,-49,-10241,-6185,-3379,18916,10372,-51,-50,-52,-52,4791,5523,11380,-51,-50,-51,4466,14757,-2604,8834,-46,-47,8389,1507,-1717,-870,-7785,-43,-44,-3965,1680,916,-2614,5098,-47,-47,10906,-4829,-2320,1489,2368,-49,-48,-2590,-1722,-4632,3343,2587,-49,-49,-134,1470,2997,944,784,-48,-49,4474,10531,4296,5386,-474,-51,-51,748,-13540,-364,-4991,-2033,-53,-54,6413,-1200,3295,969,1759,-52,-53,-1796,-721,5183,2027,891,-53,-54,-1143,-176,-2735,-2503,1284,-52,-53,-38,-4052,-2453,2909,-1964,-53,-52,415,-2214,-868,-4837,-1980,-52,-53,1062,8922,4340,106,-1327,-53,-53,-110,1049,3220,6373,-300,-53,-54,-193,-550,8539,-403,-56,-56,-56,-56,-7959,-56,5679,3784,-56,-55,5987,988,3913,524,14227,-53,-52,12481,4184,3961,9397,19418,-55,-54,19770,6331,-261,7932,-62,-62,-62,-4667,3187,43,-5279,-11047,-63,-62,-1109,-63,2947,3925,-6705,-65,-64,-3168,-12352,-6612,-10926,-64,-64,-64,-10229,1091,5712,15310,3328,-64,-65,-634,4052,-1094,-91,7285,-63,-62,8820,2128,4764,-3752,1866,-63,-63,-3003,3076,388,560,-1339,-63,-64,2519,-4114,-1831,3346,1508,-63,-64,-514,2610,-1890,2424,-486,-64,-63,3973,1195,9928,6211,-65,-65,-64,8208,854,297,3870,4228,-65,-66,409,2562,-3491,-3388,-8759,-65,-65,4720,15565,8933,106,-1616,-67,-66,-1566,-1564,-66,2610,4974,-67,-66,4243,4593,13999,5742,2329,-65,-66,-65,-854,1501,17,-2806,-65,-65,3150,5651,2647,10761,8177,-67,-67,30529,21913,14486,-1374,-4422,-74,-74,-2999,491,2199,-7366,4142,-74,-74,22056,7597,11459,-6055,-77,-77,-77,-41712,-18563,7732,-2519,-18460,-75,-76,-50807,11132,-74,55908,3676,-77,-76,6600,-1494,1699,-8647,-4341,-76,-76,4723,13323,20664,6532,-1344,-79,-78,-2165,-9789,-5091,-4382,6955,-78,-78,-2917,2816,4407,2669,11112,-78,-79,1265,5568,5478,10143,7530,-80,-80,-3394,776,2470,2374,6231,-79,-80,-79,-844,-2096,-3807,775,-79,-79,-3393,4073,4921,560,-146,-79,-80,-7472,10729,11786,13854,20092,-82,-81,14735,-81,-81,-1743,630,-82,-81,-81,-81,-1512,20131,50497,-82,-82,48352,-7976,-10242,-15124,692,-78,-78,10497,4795,9431,-1511,-4754,-79,-79,-4634,4035,-3091,-6041,5667,-79,-78,-8035,662,-503,6970,4548,-79,-79,7650,13759,-5857,-295,663,-80,-80,4851,-1110,-2185,2063,920,-80,-81,-4344,-25695,-55778,-39400,12872,-73,-74,64683,9159,25550,15622,-11344,-79,-79,-103674,23320,-23664,-158956,24550,-68,-68,-136533,-46049,-74688,-52745,44432,-70,-69,-67726,13552,59382,-79239,-90552,-62,-62,52771,94987,-40848,-6558,88615,-70,-71,65252,60978,-8688,-3658,5856,-70,-70,-3045,5836,-10574,12521,-70,-71,-70,-70,-7422,16028,21902,28097,-73,-73,33390,44254,33779,12358,-73,-74,-73,-37466,-21086,10302,5382,8563,-71,-72,3806,-3445,-789,85,-8051,-72,-71,-7810,601,3802,-2032,2216,-71,-72,-71,-9457,-5077,7396,-3769,-71,-71,-8316,-10491,539,-2984,-70,-74,-73,499,-10331,-12233,-9718,-4574,-72,-73,-8651,-12651,11774,8872,632,-76,-76,-7464,17369,97,-8034,2189,-76,-76,-425,4545,2545,-262,1384,-76,-77,-1221,3932,2527,1010,1213,-77,-76,7563,3894,-77,1862,4145,-77,-78,11205,-1957,11304,7246,4900,-79,-79,7733,-8138,11817,2454,-7703,-80,-79,-79,-2286,-4988,-7407,6529,-79,-79,-4912,7770,-3711,-2519,81,-78,-79,-5236,-4561,-747,-4507,340,-79,-78,-5569,-2295,1262,1737,-78,-78,-78,286,-134,6497,10092,296,-79,-78,7267,-79,3260,2675,26007,-81,-80,2298,12611,4813,10778,11300,-82,-82,4759,461,-9845,-13757,7489,-78,-77,-8227,8421,7134,12967,-10633,-77,-78,-9268,-13185,38132,-13653,-5955,-78,-78,-77,-19592,-321,-9414,-2299,-77,-76,430,-550,-4108,5096,-76,-76,-76,-6872,-3643,-11171,7161,24654,-80,-80,2697,-21872,-5748,-8978,-86,-79,-79,10963,10656,3775,1383,-920,-80,-80,-5905,-1260,2274,7539,16513,-81,-81,5439,11490,-4454,3637,1328,-82,-82,-11321,-14097,9390,-162,7184,-81,-81,-3343,-81,-6955,-2805,1124,-81,-80,-432,-3330,7460,4189,13235,-80,-81,8655,-4819,-4437,4542,11416,-79,-79,16996,24506,18776,-77,-78,-77,-78,1844,4772,-77,-78,-1794,-77,-78,9709,-3446,19648,17865,-4448,-80,-80,10304,-80,-2586,1195,-2419,-81,-80,341,-716,1452,13483,1585,-81,-81,-597,-1577,-3770,2072,679,-81,-81,19588,7701,13841,3968,-1810,-83,-83,18070,7432,20027,-13041,-5127,-84,-85,-3369,-1665,9074,-5164,-30607,-83,-82,-14513,14999,-1158,-3313,-17162,-82,-82,878,3655,-2290,-1134,2318,-82,-82,-7860,-2483,-3746,-5573,269,-81,-81,1885,795,-7405,-9493,1150,-80,-81,-7103,-3715,3471,13633,5758,-68,-81,2280,1381,2649,1672,7459,-76,-83,7471,1510,2300,4634,2816,-67,-83,1847,5106,-1706,-3111,2322,-95,-83,-3922,1886,7521,10076,-67,-85,-84,-84,-834,3021,3357,7832,-81,-85,11043,-9686,1788,-190,8513,-128,-85,5147,23946,17316,13013,-88,-88,-87,3206,13314,-5853,-10474,-9,-87,-1694,2000,6805,10947,1280,-74,-89,4426,2643,5861,5907,52,-86,-90,17405,-11938,-4331,-22477,-93,-89,-89,-53,-4467,-8932,-8883,-3565,-90,-87,-2769,19940,2842,-114,7334,-89,-89,8123,5084,1540,11076,-5310,-122,-90,-3933,1359,7334,8372,2843,-126,-90,5496,1894,-9784,-10277,3214,-96,-90,-1834,1879,-1351,10978,11414,-81,-91,-90,2937,12729,12988,33179,-92,-94,-323,3310,-13157,-13670,1095,-102,-101,438,40503,35781,-7199,-4950,-105,-104,8756,29226,29973,-9130,-1586,-103,-101,13955,17116,-21165,8609,4638,-99,-100,3326,12429,-72,-4279,-678,-81,-100,12707,-13416,-13920,-11780,-24226,-72,-98,-28782,-19621,32199,14810,-12688,-98,-97,6897,2018,-7637,3078,-8813,-108,-97,-3041,-2126,-8933,-1944,1482,-93,-97,-97,2184,7779,9970,3711,-98,-98,22656,6162,19148,22404,28343,-98,-98,-1359,2245,10755,-18503,16690,-135,-98,2408,649,-1011,8996,-11370,-97,-96,-26690,-14037,997,22572,-799,-96,-96,-9979,34,-1058,5547,5009,-94,-96,5915,-7846,-6932,-532,-5759,-95,-95,-8182,920,2383,-423,2885,-95,-95,4176,1111,-98,4695,3543,-96,-95,4913,-920,-2467,3629,-7091,-96,-95,-1666,4247,-533,740,13800,-105,-87,14521,29045,12715,9452,-49,-33,-91,-8184,6914,19208,-83,-91,-92,-91,4839,-2467,3235,7042,19095,-91,-91,10334,1825,-92,8510,-10045,-90,-92,-61452,-45067,15855,30825,15133,-100,-100,9122,2262,4979,9032,3572,-99,-99,9130,16062,308,-4017,-5437,-98,-100,-52120,25354,13513,-1825,-6983,-99,-99,-11183,-21361,-4585,-177538,82781,-95,-95,-17530,-778,-5321,5684,6363,-95,-94,-4909,-2323,2591,-4929,-16,-91,-94,10985,13720,25732,31767,14023,-99,-98,-3413,14343,-24,-10039,4757,-99,-99,3169,-1748,-2705,-2283,4494,-99,-98,6510,10928,21606,4320,-99,-98,-3039,-6299,-4064,-20737,-248,-97,-97,4268,6565,2205,7430,-98,-98,-98,-98,3854,9021,17617,33079,-101,-101,-100,-3805,-2170,1238,-17045,-100,-99,-39,7493,345,-15305,-3237,-100,-99,-4996,-19022,5281,-11436,-7562,-99,-100,-12224,-99,-15548,-8812,571,-98,-98,19062,21716,5451,7609,4548,-99,-98,-6588,-6480,-13585,-12071,-99,-99,-98,-22452,-21288,-11664,-1184,7637,-97,-97,-2405,-5896,1286,699,4927,-97,-96,-4214,2321,-2117,-1578,6813,-97,-96,-11510,1389,2417,6615,9330,-97,-97,-3923,-7187,-3596,-7507,-2510,-96,-95,16792,13713,-1972,14487,-2313,-98,-97,-12085,-1952,-6625,5113,22788,-97,-98,939,-97,-10029,-1636,942,-97,-97,-1240,275,7782,-1804,259,-97,-98,-4038,-5203,3269,-4008,-2796,-97,-97,20,-2556,-2801,-714,-533,-97,-96,-6496,-2677,-11363,-16043,6199,-95,-96,-567,1834,-2164,-95,2773,-95,-95,-5857,9503,-6541,-1294,-4778,-95,-95,-5014,-11296,1341,14945,-11292,-95,-94,-32068,-25841,6926,16915,-2062,-93,-92,-5989,-183,-21302,2851,14176,-92,-92,17098,-93,-9713,-11644,-6094,-91,-92,-31095,-7407,60,6654,8286,-90,-91,-90,10010,49899,17804,-5942,-93,-94,-2000,-4401,-1305,-5830,-3922,-92,-93,-8085,2931,-57,-1877,1661,-92,-92,-12269,-1295,1793,-5505,-4727,-91,-91,-4496,-10656,11021,7819,-1922,-91,-92,-7334,8510,53,4188,5145,-92,-92,-2099,10787,13569,-93,5603,-94,-92,-11202,-2152,-4027,-1101,6181,-92,-92,-4595,-7231,9072,9436,-2242,-93,-92,-4396,4985,-3852,8958,-90,-92,-91,-91,12958,15273,10574,-93,-92,-93,1741,2771,-2592,18253,10105,-95,-94,3240,-647,-3067,-94,-6877,-94,-94,-9434,-3330,-6424,6778,14016,-97,-97,-13070,11996,-12216,4347,1008,-94,-94,-5669,-5670,-2123,1733,-5428,-94,-95,-3886,-8560,-6671,10220,7810,-95,-94,7429,-2501,-1280,-9122,-3489,-94,-94,10966,4485,6514,14957,2698,-95,-96,3666,1022,-3065,5623,-10842,-96,-96,-6599,-3676,-8121,-9033,6780,-94,-95,-1533,-7204,1329,-753,8736,-95,-95,13829,-3492,4277,2702,-4242,-93,-94,-79,10370,-7111,-4969,7801,-93,-94,21100,-3808,4836,-2040,-94,-94,-94,-95,1138,-4184,19686,-95,-95,-95,-11383,6251,11501,29318,3314,-97,-97,-98,28581,7847,-9535,-5885,-99,-100,-14289,-10594,-19768,-4957,-980,-95,-99,-8045,7921,-1802,5209,-12295,-100,-101,2510,-4911,-101,1623,2060,-101,-100,-13035,424,-1445,-2528,-100,-100,-100,-3730,-2007,-3577,350,316,-99,-99,-2110,1639,-1376,3633,2563,-99,-99,5508,-22089,-4457,2262,-16719,-98,-98,12349,6986,2832,-8667,27923,-98,-99,1069,309,6367,416,-1077,-99,-100,14,6186,-10473,19617,-1419,-101,-101,-2917,-5079,-1218,-2652,143,-101,-101,7955,-1643,-8111,736,2455,-101,-101,16694,-3148,-101,-1015,251,-102,-102,-10569,-1298,-259,-563,-9439,-100,-101,-11138,-266,3028,4947,-1129,-101,-101,-262,2456,-5422,-7684,2142,-100,-100,-101,5838,10997,491,147,100,-100,-326,2273,-5635,8569,-101,-101,-101,10448,-7851,7898,-9121,2092,-101,-101,6992,5936,416,1615,4223,-102,-102,-293,-1765,-4628,5727,2434,-100,-100,2490,7587,4040,14214,25675,-103,-104,8660,1932,-109,5559,10712,-106,-106,-1484,-4018,-16913,13815,1203,-109,-108,-109,-15764,-19089,2846,-2754,-107,-107,1367,-1795,-8791,-1102,-755,-106,-107,429,-2858,-12117,2780,9993,-104,-104,-3492,6824,13569,16293,10412,-106,-106,-6811,-4802,-6813,7397,12520,-105,-106,14026,716,-1989,4150,2555,-106,-107,11343,3167,-867,1429,-107,-107,-107,-15791,2371,97,3736,9057,-113,-113,725,-4400,-2573,6365,-1716,-113,-113,-13796,7463,11663,4445,-104,-114,-113,-113,14906,15775,10806,9374,-115,-114,-115,1898,-2185,2971,4977,-117,-116,-4434,1238,3004,5367,-116,-116,-116,-5226,4406,5306,-1669,2211,-114,-115,9585,23415,33632,64656,136,-118,-119,-16658,8273,-6574,-1254,6274,-117,-118,2940,7966,9027,8151,-5388,-119,-118,2282,-5900,1830,9371,16244,-120,-119,24837,8721,-6654,-591,-7194,-121,-121,-4177,-8968,-3075,1543,-902,-118,-118,3704,-3911,476,25656,13745,-119,-120,4072,1847,4138,3168,23662,-121,-121,-7140,7376,-697,34943,11428,-121,-125,21015,-820,4272,3635,-6692,-121,-121,-52,3827,-121,-1282,3685,-122,-121,64,1937,34877,-13465,3474,-120,-119,4427,31256,-121,15346,7356,-118,-119,21654,-8423,-121,673,-121,-120,-120,-121,11779,-121,-14101,11735,-121,-122,294,5543,-5947,-10675,-2493,-121,-121,1367,8450,13035,12905,-122,-122,-122,8803,15401,11743,-7707,5663,-124,-125,-1791,1165,11184,27800,26476,-128,-128,20144,14498,30185,49272,-7769,-135,-135,13123,-18847,-28899,2632,-131,-131,-131,10261,2852,-5084,-630,1007,-125,-124,7147,12451,12604,11142,36476,-129,-129,796,22042,41523,11897,-23844,-131,-131,5564,57890,0,29866,19261,-135,-135,8366,-9237,15371,18876,0,-135,-135,2710,20928,-8597,12389,-135,-134,-135,-55951,-33367,-9685,41317,25196,-133,-133,1573,-10574,-12934,13250,14379,-133,-134,3037,15981,1198,-13080,25421,-135,-135,12338,8552,-136,-9425,2334,-135,-136,13453,-1447,-6865,-9830,9203,-135,-135,-135,2310,2011,3704,14120,-137,-136,-7418,7079,8420,14533,6529,-138,-138,8161,-7430,-7536,10188,816,-138,-138,4303,-94,-18600],"returnScale":1000000,"returns":[0,-49,-9,119,264,42,-89,56,57,131,-449,365,-85,56,56,56,56,94,2130,-174,-2001,52,52,-51,-2157,671,508,-1529,44,44,44,2129,564,1443,969,39,39,-65,1016,9270,-882,-3128,24,25,1100,-2600,-1792,3650,11442,24,25,6384,-1702,25,-2308,-800,28,29,-2452,-1293,1714,3490,24,25,24,184,-95,-507,176,355,19,19,1674,2180,1324,-412,-3156,15,16,2131,113,465,-692,1135,7,8,8,683,-910,454,3590,2,1,-1945,-3263,-418,-832,2086,-2,-3,9036,1526,11430,6637,1959,-9,-10,2136,250,8957,8980,20865,15,16,14225,-1527,-6718,-5494,-7120,21,20,3705,4278,20,224,2953,27,27,7343,2642,2279,1856,1371,17,17,371,-2842,397,3384,1008,9,8,-1457,2695,6180,-391,-218,17,18,19,-337,-649,2057,-2926,12,12,-299,2238,3675,-2080,5,4,5,873,-64,465,-144,-113,-16,-16,1090,-207,3209,6623,-8677,-25,-26,4108,-2803,3526,2727,-6722,-35,-34,-2543,-7549,-15352,-5700,8573,-38,-38,4678,2144,-42,-1525,3688,-42,-42,2796,-1405,-689,-7923,-2387,-41,-42,-41,1641,-12639,5643,1364,-40,-39,303,795,-416,679,-1314,-40,-40,-4973,-3101,-61,-3190,-1396,-40,-39,-144,693,1933,-2039,-2729,-39,-40,-13013,-3785,-8481,-2583,-8985,-38,-38,1582,5468,5909,10256,-9310,-39,-38,3621,-7100,-4275,1438,-45,-44,-45,-313,695,-3200,-136,166,-42,-42,1220,-1730,1664,-1043,-439,-42,-42,1068,-1217,982,14264,-42,-43,-42,-42,2275,6430,10089,9330,-43,-43,-43,-844,357,8814,7595,-44,-44,838,4342,10939,4266,-48,-47,-48,-3739,-3018,1836,11026,22824,-49,-49,6882,8008,6456,5891,565,-48,-48,-4837,-14617,-18248,-700,-1710,-49,-48,3597,9925,-4813,-237,-647,-46,-46,1529,-5594,-3349,6173,4045,-45,-44,-1399,143,594,6916,1738,-43,-43,2294,2530,9686,-4274,4248,-50,-50,3371,-873,10769,1299,-3967,-55,-55,-3271,-1440,-7102,-987,-7887,-54,-53,-841,-2599,-6020,-11601,3215,-53,-54,7358,-4749,14105,-4295,-51,-51,-51,-51,-3904,-8700,-3252,-66,-50,-51,4135,465,9786,2435,11654,-48,-49,-438,8474,-1498,4466,23120,-53,-53,2221,-54,18787,8723,-3889,-55,-55,882,-1699,3461,-4558,31,-56,-56,542,-745,4074,2554,1390,-50,-50,-3196,-7544,6051,-48,-48,-48,-48,-2283,-435,5967,12846,15585,-49,-49,8021,8578,15346,18171,6189,-48,-47,-3868,-2439,14326,4883,-44,-45,-44,8421,7696,25913,6894,21862,-47,-47,35618,-15204,-36039,-33835,28884,-52,-52,23176,11041,-11905,-7158,-8400,-53,-53,7402,1873,6903,-1908,-3285,-53,-53,-6482,-14997,-196,5117,5326,-49,-49,-694,12642,5218,1677,-1316,-46,-47,-2557,5127,562,-49,-6704,-52,-51,-6079,346,8693,661,-2900,-51,-51,-2752,-549,7000,-3761,-9358,-50,-49,1795,-2899,1515,3106,1054,-50,-50,5003,-50,2772,675,-2861,-50,-50,-645,9027,2201,3094,-1834,-52,-51,3270,-2824,1646,316,1851,-51,-51,-218,247,3600,-897,-2351,-50,-50,2490,1390,8838,10696,13419,-52,-53,-30489,4385,-11255,-20028,-24141,-42,-43,-14899,26930,18974,-44,-6200,-43,-43,-11792,2308,11946,14696,19781,-47,-47,74288,-47,-18665,-17343,-11903,-47,-47,586,903,2927,4732,1641,-48,-48,-620,-243,-2773,2808,-683,-47,-48,-492,11561,-1051,-9705,-5199,-49,-49,-5158,-13822,-183,-16679,-3833,-47,-47,10379,-5221,-2516,2338,-3994,-47,-48,1681,-1419,-11743,-12406,1608,-49,-49,12094,15506,9713,-2304,-13367,-50,-49,97,259,4071,-7854,-2080,-50,-49,-10241,-6185,-3379,18916,10372,-51,-50,-52,-52,4791,5523,11380,-51,-50,-51,4466,14757,-2604,8834,-46,-47,8389,1507,-1717,-870,-7785,-43,-44,-3965,1680,916,-2614,5098,-47,-47,10906,-4829,-2320,1489,2368,-49,-48,-2590,-1722,-4632,3343,2587,-49,-49,-134,1470,2997,944,784,-48,-49,4474,10531,4296,5386,-474,-51,-51,748,-13540,-364,-4991,-2033,-53,-54,6413,-1200,3295,969,1759,-52,-53,-1796,-721,5183,2027,891,-53,-54,-1143,-176,-2735,-2503,1284,-52,-53,-38,-4052,-2453,2909,-1964,-53,-52,415,-2214,-868,-4837,-1980,-52,-53,1062,8922,4340,106,-1327,-53,-53,-110,1049,3220,6373,-300,-53,-54,-193,-550,8539,-403,-56,-56,-56,-56,-7959,-56,5679,3784,-56,-55,5987,988,3913,524,14227,-53,-52,12481,4184,3961,9397,19418,-55,-54,19770,6331,-261,7932,-62,-62,-62,-4667,3187,43,-5279,-11047,-63,-62,-1109,-63,2947,3925,-6705,-65,-64,-3168,-12352,-6612,-10926,-64,-64,-64,-10229,1091,5712,15310,3328,-64,-65,-634,4052,-1094,-91,7285,-63,-62,8820,2128,4764,-3752,1866,-63,-63,-3003,3076,388,560,-1339,-63,-64,2519,-4114,-1831,3346,1508,-63,-64,-514,2610,-1890,2424,-486,-64,-63,3973,1195,9928,6211,-65,-65,-64,8208,854,297,3870,4228,-65,-66,409,2562,-3491,-3388,-8759,-65,-65,4720,15565,8933,106,-1616,-67,-66,-1566,-1564,-66,2610,4974,-67,-66,4243,4593,13999,5742,2329,-65,-66,-65,-854,1501,17,-2806,-65,-65,3150,5651,2647,10761,8177,-67,-67,30529,21913,14486,-1374,-4422,-74,-74,-2999,491,2199,-7366,4142,-74,-74,22056,7597,11459,-6055,-77,-77,-77,-41712,-18563,7732,-2519,-18460,-75,-76,-50807,11132,-74,55908,3676,-77,-76,6600,-1494,1699,-8647,-4341,-76,-76,4723,13323,20664,6532,-1344,-79,-78,-2165,-9789,-5091,-4382,6955,-78,-78,-2917,2816,4407,2669,11112,-78,-79,1265,5568,5478,10143,7530,-80,-80,-3394,776,2470,2374,6231,-79,-80,-79,-844,-2096,-3807,775,-79,-79,-3393,4073,4921,560,-146,-79,-80,-7472,10729,11786,13854,20092,-82,-81,14735,-81,-81,-1743,630,-82,-81,-81,-81,-1512,20131,50497,-82,-82,48352,-7976,-10242,-15124,692,-78,-78,10497,4795,9431,-1511,-4754,-79,-79,-4634,4035,-3091,-6041,5667,-79,-78,-8035,662,-503,6970,4548,-79,-79,7650,13759,-5857,-295,663,-80,-80,4851,-1110,-2185,2063,920,-80,-81,-4344,-25695,-55778,-39400,12872,-73,-74,64683,9159,25550,15622,-11344,-79,-79,-103674,23320,-23664,-158956,24550,-68,-68,-136533,-46049,-74688,-52745,44432,-70,-69,-67726,13552,59382,-79239,-90552,-62,-62,52771,94987,-40848,-6558,88615,-70,-71,65252,60978,-8688,-3658,5856,-70,-70,-3045,5836,-10574,12521,-70,-71,-70,-70,-7422,16028,21902,28097,-73,-73,33390,44254,33779,12358,-73,-74,-73,-37466,-21086,10302,5382,8563,-71,-72,3806,-3445,-789,85,-8051,-72,-71,-7810,601,3802,-2032,2216,-71,-72,-71,-9457,-5077,7396,-3769,-71,-71,-8316,-10491,539,-2984,-70,-74,-73,499,-10331,-12233,-9718,-4574,-72,-73,-8651,-12651,11774,8872,632,-76,-76,-7464,17369,97,-8034,2189,-76,-76,-425,4545,2545,-262,1384,-76,-77,-1221,3932,2527,1010,1213,-77,-76,7563,3894,-77,1862,4145,-77,-78,11205,-1957,11304,7246,4900,-79,-79,7733,-8138,11817,2454,-7703,-80,-79,-79,-2286,-4988,-7407,6529,-79,-79,-4912,7770,-3711,-2519,81,-78,-79,-5236,-4561,-747,-4507,340,-79,-78,-5569,-2295,1262,1737,-78,-78,-78,286,-134,6497,10092,296,-79,-78,7267,-79,3260,2675,26007,-81,-80,2298,12611,4813,10778,11300,-82,-82,4759,461,-9845,-13757,7489,-78,-77,-8227,8421,7134,12967,-10633,-77,-78,-9268,-13185,38132,-13653,-5955,-78,-78,-77,-19592,-321,-9414,-2299,-77,-76,430,-550,-4108,5096,-76,-76,-76,-6872,-3643,-11171,7161,24654,-80,-80,2697,-21872,-5748,-8978,-86,-79,-79,10963,10656,3775,1383,-920,-80,-80,-5905,-1260,2274,7539,16513,-81,-81,5439,11490,-4454,3637,1328,-82,-82,-11321,-14097,9390,-162,7184,-81,-81,-3343,-81,-6955,-2805,1124,-81,-80,-432,-3330,7460,4189,13235,-80,-81,8655,-4819,-4437,4542,11416,-79,-79,16996,24506,18776,-77,-78,-77,-78,1844,4772,-77,-78,-1794,-77,-78,9709,-3446,19648,17865,-4448,-80,-80,10304,-80,-2586,1195,-2419,-81,-80,341,-716,1452,13483,1585,-81,-81,-597,-1577,-3770,2072,679,-81,-81,19588,7701,13841,3968,-1810,-83,-83,18070,7432,20027,-13041,-5127,-84,-85,-3369,-1665,9074,-5164,-30607,-83,-82,-14513,14999,-1158,-3313,-17162,-82,-82,878,3655,-2290,-1134,2318,-82,-82,-7860,-2483,-3746,-5573,269,-81,-81,1885,795,-7405,-9493,1150,-80,-81,-7103,-3715,3471,13633,5758,-68,-81,2280,1381,2649,1672,7459,-76,-83,7471,1510,2300,4634,2816,-67,-83,1847,5106,-1706,-3111,2322,-95,-83,-3922,1886,7521,10076,-67,-85,-84,-84,-834,3021,3357,7832,-81,-85,11043,-9686,1788,-190,8513,-128,-85,5147,23946,17316,13013,-88,-88,-87,3206,13314,-5853,-10474,-9,-87,-1694,2000,6805,10947,1280,-74,-89,4426,2643,5861,5907,52,-86,-90,17405,-11938,-4331,-22477,-93,-89,-89,-53,-4467,-8932,-8883,-3565,-90,-87,-2769,19940,2842,-114,7334,-89,-89,8123,5084,1540,11076,-5310,-122,-90,-3933,1359,7334,8372,2843,-126,-90,5496,1894,-9784,-10277,3214,-96,-90,-1834,1879,-1351,10978,11414,-81,-91,-90,2937,12729,12988,33179,-92,-94,-323,3310,-13157,-13670,1095,-102,-101,438,40503,35781,-7199,-4950,-105,-104,8756,29226,29973,-9130,-1586,-103,-101,13955,17116,-21165,8609,4638,-99,-100,3326,12429,-72,-4279,-678,-81,-100,12707,-13416,-13920,-11780,-24226,-72,-98,-28782,-19621,32199,14810,-12688,-98,-97,6897,2018,-7637,3078,-8813,-108,-97,-3041,-2126,-8933,-1944,1482,-93,-97,-97,2184,7779,9970,3711,-98,-98,22656,6162,19148,22404,28343,-98,-98,-1359,2245,10755,-18503,16690,-135,-98,2408,649,-1011,8996,-11370,-97,-96,-26690,-14037,997,22572,-799,-96,-96,-9979,34,-1058,5547,5009,-94,-96,5915,-7846,-6932,-532,-5759,-95,-95,-8182,920,2383,-423,2885,-95,-95,4176,1111,-98,4695,3543,-96,-95,4913,-920,-2467,3629,-7091,-96,-95,-1666,4247,-533,740,13800,-105,-87,14521,29045,12715,9452,-49,-33,-91,-8184,6914,19208,-83,-91,-92,-91,4839,-2467,3235,7042,19095,-91,-91,10334,1825,-92,8510,-10045,-90,-92,-61452,-45067,15855,30825,15133,-100,-100,9122,2262,4979,9032,3572,-99,-99,9130,16062,308,-4017,-5437,-98,-100,-52120,25354,13513,-1825,-6983,-99,-99,-11183,-21361,-4585,-177538,82781,-95,-95,-17530,-778,-5321,5684,6363,-95,-94,-4909,-2323,2591,-4929,-16,-91,-94,10985,13720,25732,31767,14023,-99,-98,-3413,14343,-24,-10039,4757,-99,-99,3169,-1748,-2705,-2283,4494,-99,-98,6510,10928,21606,4320,-99,-98,-3039,-6299,-4064,-20737,-248,-97,-97,4268,6565,2205,7430,-98,-98,-98,-98,3854,9021,17617,33079,-101,-101,-100,-3805,-2170,1238,-17045,-100,-99,-39,7493,345,-15305,-3237,-100,-99,-4996,-19022,5281,-11436,-7562,-99,-100,-12224,-99,-15548,-8812,571,-98,-98,19062,21716,5451,7609,4548,-99,-98,-6588,-6480,-13585,-12071,-99,-99,-98,-22452,-21288,-11664,-1184,7637,-97,-97,-2405,-5896,1286,699,4927,-97,-96,-4214,2321,-2117,-1578,6813,-97,-96,-11510,1389,2417,6615,9330,-97,-97,-3923,-7187,-3596,-7507,-2510,-96,-95,16792,13713,-1972,14487,-2313,-98,-97,-12085,-1952,-6625,5113,22788,-97,-98,939,-97,-10029,-1636,942,-97,-97,-1240,275,7782,-1804,259,-97,-98,-4038,-5203,3269,-4008,-2796,-97,-97,20,-2556,-2801,-714,-533,-97,-96,-6496,-2677,-11363,-16043,6199,-95,-96,-567,1834,-2164,-95,2773,-95,-95,-5857,9503,-6541,-1294,-4778,-95,-95,-5014,-11296,1341,14945,-11292,-95,-94,-32068,-25841,6926,16915,-2062,-93,-92,-5989,-183,-21302,2851,14176,-92,-92,17098,-93,-9713,-11644,-6094,-91,-92,-31095,-7407,60,6654,8286,-90,-91,-90,10010,49899,17804,-5942,-93,-94,-2000,-4401,-1305,-5830,-3922,-92,-93,-8085,2931,-57,-1877,1661,-92,-92,-12269,-1295,1793,-5505,-4727,-91,-91,-4496,-10656,11021,7819,-1922,-91,-92,-7334,8510,53,4188,5145,-92,-92,-2099,10787,13569,-93,5603,-94,-92,-11202,-2152,-4027,-1101,6181,-92,-92,-4595,-7231,9072,9436,-2242,-93,-92,-4396,4985,-3852,8958,-90,-92,-91,-91,12958,15273,10574,-93,-92,-93,1741,2771,-2592,18253,10105,-95,-94,3240,-647,-3067,-94,-6877,-94,-94,-9434,-3330,-6424,6778,14016,-97,-97,-13070,11996,-12216,4347,1008,-94,-94,-5669,-5670,-2123,1733,-5428,-94,-95,-3886,-8560,-6671,10220,7810,-95,-94,7429,-2501,-1280,-9122,-3489,-94,-94,10966,4485,6514,14957,2698,-95,-96,3666,1022,-3065,5623,-10842,-96,-96,-6599,-3676,-8121,-9033,6780,-94,-95,-1533,-7204,1329,-753,8736,-95,-95,13829,-3492,4277,2702,-4242,-93,-94,-79,10370,-7111,-4969,7801,-93,-94,21100,-3808,4836,-2040,-94,-94,-94,-95,1138,-4184,19686,-95,-95,-95,-11383,6251,11501,29318,3314,-97,-97,-98,28581,7847,-9535,-5885,-99,-100,-14289,-10594,-19768,-4957,-980,-95,-99,-8045,7921,-1802,5209,-12295,-100,-101,2510,-4911,-101,1623,2060,-101,-100,-13035,424,-1445,-2528,-100,-100,-100,-3730,-2007,-3577,350,316,-99,-99,-2110,1639,-1376,3633,2563,-99,-99,5508,-22089,-4457,2262,-16719,-98,-98,12349,6986,2832,-8667,27923,-98,-99,1069,309,6367,416,-1077,-99,-100,14,6186,-10473,19617,-1419,-101,-101,-2917,-5079,-1218,-2652,143,-101,-101,7955,-1643,-8111,736,2455,-101,-101,16694,-3148,-101,-1015,251,-102,-102,-10569,-1298,-259,-563,-9439,-100,-101,-11138,-266,3028,4947,-1129,-101,-101,-262,2456,-5422,-7684,2142,-100,-100,-101,5838,10997,491,147,100,-100,-326,2273,-5635,8569,-101,-101,-101,10448,-7851,7898,-9121,2092,-101,-101,6992,5936,416,1615,4223,-102,-102,-293,-1765,-4628,5727,2434,-100,-100,2490,7587,4040,14214,25675,-103,-104,8660,1932,-109,5559,10712,-106,-106,-1484,-4018,-16913,13815,1203,-109,-108,-109,-15764,-19089,2846,-2754,-107,-107,1367,-1795,-8791,-1102,-755,-106,-107,429,-2858,-12117,2780,9993,-104,-104,-3492,6824,13569,16293,10412,-106,-106,-6811,-4802,-6813,7397,12520,-105,-106,14026,716,-1989,4150,2555,-106,-107,11343,3167,-867,1429,-107,-107,-107,-15791,2371,97,3736,9057,-113,-113,725,-4400,-2573,6365,-1716,-113,-113,-13796,7463,11663,4445,-104,-114,-113,-113,14906,15775,10806,9374,-115,-114,-115,1898,-2185,2971,4977,-117,-116,-4434,1238,3004,5367,-116,-116,-116,-5226,4406,5306,-1669,2211,-114,-115,9585,23415,33632,64656,136,-118,-119,-16658,8273,-6574,-1254,6274,-117,-118,2940,7966,9027,8151,-5388,-119,-118,2282,-5900,1830,9371,16244,-120,-119,24837,8721,-6654,-591,-7194,-121,-121,-4177,-8968,-3075,1543,-902,-118,-118,3704,-3911,476,25656,13745,-119,-120,4072,1847,4138,3168,23662,-121,-121,-7140,7376,-697,34943,11428,-121,-125,21015,-820,4272,3635,-6692,-121,-121,-52,3827,-121,-1282,3685,-122,-121,64,1937,34877,-13465,3474,-120,-119,4427,31256,-121,15346,7356,-118,-119,21654,-8423,-121,673,-121,-120,-120,-121,11779,-121,-14101,11735,-121,-122,294,5543,-5947,-10675,-2493,-121,-121,1367,8450,13035,12905,-122,-122,-122,8803,15401,11743,-7707,5663,-124,-125,-1791,1165,11184,27800,26476,-128,-128,20144,14498,30185,49272,-7769,-135,-135,13123,-18847,-28899,2632,-131,-131,-131,10261,2852,-5084,-630,1007,-125,-124,7147,12451,12604,11142,36476,-129,-129,796,22042,41523,11897,-23844,-131,-131,5564,57890,0,29866,19261,-135,-135,8366,-9237,15371,18876,0,-135,-135,2710,20928,-8597,12389,-135,-134,-135,-55951,-33367,-9685,41317,25196,-133,-133,1573,-10574,-12934,13250,14379,-133,-134,3037,15981,1198,-13080,25421,-135,-135,12338,8552,-136,-9425,2334,-135,-136,13453,-1447,-6865,-9830,9203,-135,-135,-135,2310,2011,3704,14120,-137,-136,-7418,7079,8420,14533,6529,-138,-138,8161,-7430,-7536,10188,816,-138,-138,4303,-94,-18600]}});
\ No newline at end of file
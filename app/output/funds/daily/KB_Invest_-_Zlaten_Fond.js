@@ -0,0 +1 @@
+registerFundSeries("KB Invest - Zlaten Fond", {"daily":{"start":18718,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000072,-12,-12,-12,-12,-12,-1032,-126,530,-239,-24,-3693,5227,-1685,10278,4219,-429,-34,-3291,2736,10814,-7886,-5420,-866,-47,-66,-11085,2498,-6253,-6790,-35,-36,15418,-7943,6809,18132,8796,127,-46,-3755,-1857,-12054,745,11762,-753,-52,31250,3298,-12759,5953,-2486,827,-60,1357,-3989,-5038,-887,3954,2995,-61,1077,4533,402,-22276,5035,3654,-61,-5856,-11659,-5382,13165,-9806,2710,-62,-7193,-8493,-13659,-38073,-6416,-56,-56,9737,-3940,-1689,-2744,-2921,-702,-59,-7759,-5347,6239,1335,7543,3179,-60,-375,981,3769,-19180,9960,-936,-59,-7480,8543,10817,8318,-24218,-10,-59,-15152,3702,5412,-4514,-5738,368,-58,8428,1037,8976,18442,-5777,-1175,-61,-3297,5163,-2035,-15351,-29256,1832,-63,-15417,-8799,17075,-10072,9584,-1534,-62,-1690,-2523,-13825,-8614,692,811,-61,24259,-166,-11058,-4641,20727,118,-63,-9369,6057,-5635,-1094,11299,-1003,-62,793,-18500,-6043,-7808,-10172,246,-59,13596,4638,-1944,-26481,-992,-817,-57,-1422,7333,1687,-11436,-3834,-509,-56,-1887,-7509,-9300,17213,3319,-685,-57,10325,1079,13793,12467,6550,-335,-60,-924,14044,27982,19067,-8835,60,-60,-8294,9223,4909,-1852,7985,411,-61,5279,-1948,-4805,-9436,-19926,-3336,-62,2084,-42,3015,794,21203,2764,-64,5084,254,20270,27342,3788,736,-68,4487,-8145,10025,-4913,-14099,4620,-68,-17400,-14272,-5362,4052,-10855,-5254,-64,371,1606,-20521,-6706,1981,2620,-62,7874,-847,5793,-22306,-10276,2571,-61,-3098,-5221,-15287,37963,-249,-396,-61,696,9492,2998,3563,-475,-659,-64,-166,-2826,593,13132,3812,613,-64,-14586,-641,-3754,-27653,5450,-61,-61,8561,16890,11868,-14008,-12472,275,-61,-3362,-11803,49709,-404,-11473,-1456,-64,-13803,10693,-16082,-24173,-4879,180,-59,21446,9575,-5896,-12664,6807,-12386,-60,16202,12958,2798,-15733,32528,1178,-65,22508,-8337,22555,27862,-4111,1180,-70,-2817,-7028,14359,-28190,25723,-3328,-70,-19846,-17001,-4327,5948,32125,11443,-70,22236,10591,-8828,3178,-15298,7115,-72,-37841,3981,-4978,19465,-9714,3713,-69,16529,-7131,18016,1249,4284,-1413,-73,-24682,9357,3352,-9682,22333,4444,-72,-6079,-15886,-1797,12237,23898,4081,-74,-1456,1192,18457,2553,-4053,4453,-76,1366,-23412,3448,-43737,-31683,-68,-68,-28778,-17300,7431,20254,2418,-2815,-68,-12147,11539,8613,-24957,-13767,-1473,-65,-44218,-13462,-3844,-33887,27098,2005,-63,10306,1270,-24854,36063,-935,-3125,-64,3927,5752,-3143,-5491,-92,-908,-65,1916,-25315,3394,30095,-13524,-2365,-64,-8852,-619,2277,-32185,28484,-63,-63,-46449,-5362,7421,16042,-3319,-6046,-61,-5032,4353,-14950,-26403,18318,-2150,-59,-1211,-21566,-11269,-24822,23178,-3727,-58,2246,-32687,5673,13913,399,978,-56,-9870,-8284,16372,-33662,-1760,-3032,-53,7483,3691,-22263,12616,-4175,1367,-52,-17431,6938,15440,15999,11086,-5051,-54,-1364,-9524,-10197,18738,2730,-3533,-54,19786,3095,714,-11684,5508,3174,-56,-9583,6799,-18571,-3043,-12222,6898,-53,-2268,13438,11805,6920,-29886,-2352,-53,-10175,-15560,-9138,-21722,18116,443,-51,1536,-1210,15875,8032,17908,-9195,-52,7491,-27824,-4651,-6789,-761,1676,-50,14341,-15370,512,3443,-28226,6690,-49,-15508,12451,36836,12579,4505,-2782,-53,23143,20263,-15688,2194,-17657,3279,-49,-14354,-1299,-51,-7702,-25090,1001,-46,12231,8169,-20821,5603,22117,4046,-49,-2677,5997,12718,-9283,-5614,5091,-50,-11511,14323,-31465,-17993,58171,-5264,-50,10280,28021,1323,39287,14907,-20436,-56,-6264,-7652,-13486,-8604,6994,-1876,-53,-4807,30446,6718,788,-8615,2106,-55,-23572,10344,25488,24578,-4983,-5484,-57,-18518,-6482,12295,445,-7683,-166,-56,-4842,15418,484,-32289,893,-1583,-54,-3570,23836,13070,-6153,1372,-188,-56,-56,12934,-16620,2527,-6349,135,-55,-56,21162,39778,-4614,16191,-61,-61,-2079,4663,-3883,11307,10359,-1906,-63,1914,-24805,-9664,11415,11400,-962,-62,-283,3524,6288,-6762,-12848,1879,-61,-7443,-4340,15175,-14125,-36884,1915,-56,-2507,16826,2042,-16075,-11392,4085,-56,-3680,-547,-26260,-953,-10994,3389,-54,159,-11964,-17447,-2641,-4325,1466,-51,990,5702,12247,-428,14440,-219,-55,-12023,-23811,-8276,4212,10533,-2266,-51,40966,299,-1593,9601,24706,-1152,-57,17238,-23741,2104,14791,4321,8238,-60,1976,14066,-5630,11595,-5024,612,-62,9248,31624,9606,-404,1643,987,-67,-7268,15795,2122,22296,-17181,-68,-68,-19519,5361,-10621,21,-8633,-68,-68,1117,-6551,-7294,4617,-1650,4032,-68,-5095,25083,11259,22297,-4195,5844,-72,-3618,-7291,3886,-29223,-3561,1672,-69,10459,-19812,-12663,-14981,1753,691,-65,-3348,-7412,-11780,-21302,3331,-1033,-63,-727,-3285,7297,27910,-3629,-64,-64,1020,-342,-7475,3198,-6970,-2257,-62,417,-6503,-1688,-1604,7612,-8810,-61,1303,-24732,-6625,-3353,-5880,5529,-58,5105,-10147,-10021,6334,7625,3538,-59,11902,-748,-13941,-19425,2374,-179,-57,13615,5068,32879,8499,-9446,-2654,-60,-369,11115,-3473,-16510,20,3576,-60,-4513,9334,-368,-22816,911,5637,-58,12725,-27943,-17875,-4521,8219,-473,-56,-4986,-6376,2709,1538,-163,276,-55,-9266,-12263,-9527,-8697,-2900,1298,-52,2765,3905,24244,5569,-8198,1842,-55,13444,8078,3831,-12077,-2393,1601,-56,-50,-13535,3283,-4687,4202,-55,-54,9273,5048,-1080,8485,16457,4952,-60,575,-6843,5596,-17428,19,53,-59,-7841,-18047,-23632,1376,-2252,-2188,-53,-21684,1633,807,6171,10720,-2154,-53,20705,13353,13329,-9207,24200,5098,-58,2400,12275,-4549,2036,2271,-2426,-60,-7789,157,-13957,-242,14443,514,-59,-5303,-19506,-6321,8312,23250,-2146,-59,-3567,-19012,-20057,-6710,-11629,-161,-55,-5309,33909,-2205,-795,-839,-1161,-55,-1743,9176,3223,1141,376,-873,-56,14554,32673,6678,-2099,17171,4133,-63,-14371,-13885,-768,-1278,-14803,-60,-60,-6031,-17600,32710,22839,-11527,-2024,-66,3538,23923,-17204,15414,2297,-2074,-65,-64,1545,9095,-19921,-9450,3846,-65,-65,-11080,-15140,-78,-3151,1476,-62,606,-10046,-3383,-6620,20160,3151,-61,1049,-30730,-22807,-849,-306,-58,-57,-11,16454,-10359,9325,-1250,1570,-58,4972,389,-3734,25511,-20147,-3076,-56,-19266,10897,-5517,-7708,-7614,-655,-54,5291,-44161,-1150,21760,4105,-1249,-52,-519,557,-7838,-13129,5477,765,-52,-5467,-8292,-8632,16444,20596,923,-53,30925,2440,14215,10192,-778,-1840,-57,12587,-12243,15805,-11079,-1601,1478,-60,-8904,-12234,24760,3198,-12374,4517,-60,7359,-967,21768,22365,324,1686,-65,10508,19267,16766,-7010,17055,751,-83,1621,16985,-15193,15084,693,5918,-76,-10502,-14193,16735,1164,3792,1337,-74,-32974,7682,-314,27932,14173,567,-76,9058,-40862,-1201,3142,-2696,-72,-72,17988,2937,-1847,24334,11149,-3714,-76,-6601,8273,10958,-1849,19216,1685,-78,17447,-7482,-31910,-21819,8694,-75,-75,2824,15653,-21812,7244,1891,-2407,-75,-374,-33966,7092,29349,-49575,-2108,-71,10692,-6677,8237,-19891,1688,7399,-71,-4872,8982,1673,18413,-886,-73,-72,-1048,-10322,4696,11738,-2583,-744,-72,-8815,-531,28914,1689,21750,-2094,-77,670,-723,25119,22303,4348,-2605,-80,-4702,30036,-16878,-15174,-15251,2547,-79,2439,635,-1222,-24621,958,59,-78,8230,7477,24298,-11643,-16668,-78,-78,-33831,-9344,-17440,13369,10897,1568,-75,29686,15442,-407,-6301,25567,1640,-80,21049,8785,4433,-25133,8321,1387,-83,-2406,-5885,-18174,9958,131,-346,-81,-4311,-25698,-10388,8987,-25006,-556,-76,4598,9423,12883,42074,28297,-5685,-84,-763,-11290,-12517,13511,10928,-1225,-83,-3410,23839,2220,6660,-25370,143,-83,-23418,13813,11368,-16817],"returnScale":1000000,"returns":[0,-12,-12,-12,-12,-12,-1032,-126,530,-239,-24,-3693,5227,-1685,10277,4219,-429,-34,-3291,2736,10813,-7885,-5420,-866,-47,-66,-11084,2498,-6253,-6789,-35,-36,15417,-7943,6809,18131,8795,127,-46,-3755,-1857,-12053,745,11761,-753,-52,31248,3298,-12758,5952,-2485,826,-59,1356,-3988,-5038,-887,3954,2995,-61,1077,4532,402,-22274,5034,3654,-61,-5855,-11659,-5381,13164,-9805,2709,-62,-7192,-8492,-13658,-38071,-6415,-56,-56,9736,-3940,-1689,-2743,-2921,-702,-59,-7759,-5346,6238,1335,7543,3179,-60,-375,980,3769,-19178,9959,-936,-59,-7480,8543,10816,8317,-24216,-10,-59,-15151,3702,5412,-4514,-5738,368,-58,8428,1037,8975,18441,-5777,-1175,-61,-3297,5163,-2035,-15350,-29254,1832,-63,-15416,-8798,17074,-10071,9583,-1534,-62,-1690,-2523,-13824,-8613,692,811,-61,24257,-166,-11057,-4641,20726,118,-63,-9369,6057,-5635,-1094,11299,-1003,-62,793,-18499,-6043,-7807,-10171,246,-59,13595,4637,-1943,-26480,-992,-816,-57,-1422,7332,1687,-11435,-3834,-509,-56,-1887,-7508,-9300,17212,3319,-685,-57,10324,1079,13792,12466,6550,-335,-60,-924,14043,27980,19066,-8835,60,-60,-8293,9222,4909,-1852,7984,411,-61,5279,-1948,-4805,-9435,-19924,-3336,-62,2084,-42,3014,794,21202,2764,-64,5083,254,20269,27340,3788,736,-68,4486,-8144,10024,-4913,-14098,4620,-68,-17399,-14271,-5361,4051,-10854,-5253,-64,371,1605,-20519,-6706,1981,2620,-62,7874,-847,5792,-22304,-10275,2570,-61,-3097,-5221,-15286,37960,-249,-396,-61,696,9492,2997,3563,-475,-659,-64,-166,-2826,593,13131,3812,613,-64,-14585,-641,-3753,-27651,5449,-61,-61,8561,16888,11867,-14007,-12471,275,-61,-3361,-11803,49706,-404,-11472,-1456,-64,-13802,10692,-16081,-24171,-4879,180,-59,21445,9574,-5896,-12663,6807,-12385,-60,16201,12957,2798,-15732,32525,1178,-65,22507,-8337,22554,27860,-4111,1180,-70,-2817,-7028,14358,-28188,25722,-3328,-70,-19845,-16999,-4327,5947,32123,11442,-70,22235,10590,-8827,3177,-15297,7115,-72,-37838,3980,-4977,19463,-9713,3713,-69,16528,-7131,18015,1249,4283,-1413,-73,-24680,9357,3351,-9681,22331,4444,-72,-6078,-15885,-1797,12236,23896,4081,-74,-1456,1192,18456,2552,-4052,4452,-76,1366,-23410,3448,-43734,-31681,-68,-68,-28776,-17298,7430,20253,2417,-2814,-68,-12147,11539,8612,-24955,-13766,-1473,-65,-44215,-13461,-3844,-33884,27096,2005,-63,10305,1270,-24852,36060,-935,-3125,-64,3927,5752,-3143,-5491,-92,-908,-65,1916,-25313,3394,30093,-13523,-2365,-64,-8852,-619,2277,-32182,28482,-63,-63,-46446,-5362,7421,16041,-3319,-6046,-61,-5031,4352,-14949,-26401,18317,-2150,-59,-1211,-21564,-11268,-24821,23177,-3727,-58,2246,-32685,5673,13912,399,978,-56,-9870,-8283,16371,-33660,-1760,-3031,-53,7482,3691,-22262,12615,-4174,1367,-52,-17430,6937,15439,15998,11085,-5050,-54,-1364,-9524,-10196,18737,2730,-3533,-54,19785,3094,714,-11683,5508,3173,-56,-9582,6799,-18570,-3043,-12221,6898,-53,-2268,13437,11804,6919,-29883,-2352,-53,-10174,-15559,-9138,-21720,18115,443,-51,1535,-1210,15874,8032,17906,-9194,-52,7491,-27822,-4651,-6789,-761,1676,-50,14340,-15369,512,3443,-28224,6690,-49,-15507,12450,36833,12578,4505,-2782,-53,23142,20261,-15687,2194,-17656,3279,-49,-14353,-1299,-51,-7701,-25088,1001,-46,12230,8168,-20819,5602,22116,4045,-49,-2676,5996,12717,-9282,-5614,5091,-50,-11510,14322,-31463,-17992,58167,-5264,-50,10280,28019,1323,39284,14906,-20435,-56,-6263,-7652,-13485,-8603,6993,-1876,-53,-4806,30444,6717,788,-8614,2105,-55,-23570,10343,25487,24576,-4983,-5483,-57,-18517,-6482,12294,445,-7682,-166,-56,-4842,15417,484,-32286,892,-1582,-54,-3570,23834,13069,-6152,1372,-188,-56,-56,12933,-16619,2527,-6349,135,-55,-56,21161,39775,-4614,16190,-61,-61,-2079,4663,-3883,11306,10358,-1905,-63,1913,-24803,-9663,11414,11399,-962,-62,-283,3524,6288,-6762,-12847,1879,-61,-7443,-4339,15174,-14124,-36882,1915,-56,-2507,16825,2042,-16074,-11391,4085,-56,-3680,-547,-26258,-953,-10993,3389,-54,159,-11964,-17445,-2641,-4325,1466,-51,990,5702,12246,-428,14439,-219,-55,-12022,-23810,-8275,4212,10532,-2266,-51,40963,299,-1593,9600,24705,-1152,-57,17237,-23740,2104,14790,4321,8237,-60,1976,14065,-5630,11595,-5024,612,-62,9247,31622,9605,-404,1643,987,-67,-7267,15793,2122,22295,-17180,-68,-68,-19518,5361,-10620,21,-8633,-68,-68,1117,-6550,-7294,4617,-1650,4032,-68,-5095,25081,11259,22295,-4195,5844,-72,-3618,-7290,3885,-29221,-3560,1672,-69,10458,-19811,-12662,-14980,1753,691,-65,-3348,-7411,-11779,-21301,3331,-1033,-63,-727,-3285,7297,27908,-3629,-64,-64,1020,-342,-7474,3197,-6969,-2257,-62,417,-6503,-1687,-1604,7611,-8809,-61,1303,-24731,-6624,-3353,-5879,5528,-58,5105,-10146,-10021,6334,7624,3538,-59,11901,-748,-13940,-19423,2373,-179,-57,13614,5068,32877,8498,-9445,-2654,-60,-369,11114,-3473,-16508,20,3575,-60,-4512,9333,-368,-22814,911,5636,-58,12724,-27941,-17873,-4521,8218,-473,-56,-4985,-6376,2709,1538,-163,276,-55,-9265,-12263,-9526,-8696,-2900,1298,-52,2765,3904,24243,5568,-8197,1842,-55,13443,8077,3831,-12076,-2393,1601,-56,-50,-13534,3283,-4687,4202,-55,-54,9272,5048,-1080,8484,16456,4952,-60,574,-6842,5596,-17427,19,53,-59,-7841,-18045,-23631,1376,-2252,-2187,-53,-21683,1633,807,6171,10719,-2154,-53,20703,13353,13328,-9207,24198,5098,-58,2400,12274,-4549,2036,2271,-2426,-60,-7788,157,-13956,-242,14442,514,-59,-5303,-19504,-6321,8311,23249,-2146,-59,-3567,-19011,-20055,-6710,-11628,-161,-55,-5308,33906,-2205,-795,-839,-1160,-55,-1743,9175,3223,1141,376,-873,-56,14553,32670,6678,-2099,17170,4133,-63,-14370,-13884,-768,-1278,-14802,-60,-60,-6031,-17599,32708,22837,-11526,-2024,-66,3538,23921,-17202,15413,2296,-2073,-65,-64,1544,9095,-19920,-9449,3846,-65,-65,-11080,-15138,-78,-3151,1476,-62,606,-10046,-3382,-6620,20159,3150,-61,1049,-30727,-22806,-849,-306,-58,-57,-11,16453,-10358,9324,-1250,1570,-58,4972,389,-3734,25509,-20145,-3076,-56,-19265,10896,-5516,-7708,-7613,-655,-54,5291,-44158,-1150,21758,4105,-1249,-52,-519,557,-7837,-13128,5476,765,-52,-5466,-8292,-8631,16443,20594,923,-53,30923,2440,14214,10191,-778,-1840,-57,12586,-12242,15804,-11078,-1601,1478,-60,-8904,-12233,24759,3197,-12373,4517,-60,7358,-967,21767,22363,324,1686,-65,10507,19266,16765,-7010,17054,751,-83,1621,16984,-15192,15083,693,5917,-76,-10501,-14192,16734,1164,3791,1337,-74,-32971,7681,-314,27930,14172,567,-76,9057,-40859,-1201,3142,-2696,-72,-72,17987,2937,-1847,24332,11148,-3713,-76,-6601,8273,10957,-1849,19215,1684,-78,17446,-7481,-31908,-21817,8693,-75,-75,2824,15652,-21811,7244,1891,-2407,-75,-374,-33964,7092,29347,-49572,-2108,-71,10692,-6677,8236,-19889,1688,7398,-71,-4871,8981,1673,18412,-886,-73,-72,-1048,-10322,4696,11737,-2583,-744,-72,-8814,-531,28912,1689,21748,-2093,-77,669,-722,25117,22301,4348,-2605,-80,-4702,30034,-16877,-15173,-15249,2546,-79,2439,635,-1222,-24619,958,59,-78,8229,7477,24296,-11642,-16667,-78,-78,-33828,-9344,-17438,13368,10896,1568,-75,29684,15440,-407,-6300,25565,1640,-80,21047,8785,4432,-25131,8321,1387,-83,-2406,-5885,-18173,9958,131,-346,-81,-4311,-25696,-10387,8986,-25004,-556,-76,4598,9422,12882,42071,28295,-5685,-84,-763,-11289,-12516,13510,10927,-1225,-83,-3409,23837,2220,6659,-25368,143,-83,-23416,13812,11367,-16816]}});
\ No newline at end of file
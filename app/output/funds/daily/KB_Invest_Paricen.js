@@ -0,0 +1 @@
+registerFundSeries("KB Invest Paricen", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1119605,106,106,106,108,106,109,108,112,111,108,108,108,110,123,108,117,107,111,108,109,108,107,109,109,109,109,108,108,100,131,108,109,109,109,117,109,108,109,108,107,120,110,107,108,107,107,112,108,109,107,111,107,108,107,108,108,110,108,108,109,109,109,108,110,111,110,109,110,108,112,114,108,107,107,107,108,108,108,109,107,110,108,108,108,109,111,110,116,108,113,118,102,107,106,104,114,102,102,103,110,102,102,100,103,103,102,105,102,102,102,102,107,108,101,101,100,97,99,103,102,109,118,107,116,99,104,106,97,99,102,104,99,102,104,103,101,103,104,99,103,106,103,101,106,105,113,104,104,108,104,107,116,114,116,114,111,163,104,103,121,121,104,107,101,102,103,106,102,104,103,102,101,104,103,100,103,85,69,102,101,102,146,98,98,104,105,108,100,99,102,72,103,103,104,102,88,90,100,99,103,102,94,98,107,104,106,101,101,105,104,115,103,99,100,99,95,101,100,92,91,98,96,99,102,104,99,95,99,98,108,122,123,147,118,98,99,98,96,98,96,97,98,97,97,97,100,109,108,94,96,90,94,97,96,90,101,95,95,97,97,92,94,95,94,94,98,99,99,97,98,98,93,89,83,86,86,88,89,88,90,85,97,91,86,88,89,86,87,84,86,86,86,84,59,63,94,77,84,84,76,96,83,22,-22,86,87,87,36,81,87,78,89,80,83,92,86,95,86,85,86,83,92,94,90,87,85,85,78,90,94,99,90,89,84,84,93,133,151,127,86,87,113,80,83,100,89,84,85,115,104,100,84,91,84,84,90,87,86,86,85,83,83,83,90,82,89,82,84,83,85,84,82,74,60,84,84,84,102,99,90,63,84,84,88,63,70,85,83,83,83,101,115,81,74,46,82,83,59,61,81,85,74,83,85,76,91,20,43,102,83,82,97,79,99,83,76,82,81,88,83,87,97,94,83,82,102,94,83,90,102,90,87,131,79,113,90,86,58,83,85,98,76,80,86,87,87,93,80,87,-27,60,84,83,16,128,98,75,85,86,85,84,83,85,81,91,84,85,84,98,108,105,143,83,89,130,86,90,84,81,83,86,89,81,83,87,89,86,89,86,87,87,88,84,85,88,76,87,87,84,85,85,90,87,86,86,87,86,82,87,84,85,82,87,84,84,88,84,86,86,86,71,86,89,90,64,115,88,83,83,85,89,85,85,86,85,84,87,87,85,83,86,81,82,88,89,83,95,80,81,87,89,72,63,69,87,82,83,89,81,81,82,81,93,84,90,108,131,90,83,83,83,88,85,89,84,88,84,84,84,92,83,87,92,81,89,92,77,87,87,87,86,87,91,88,84,85,87,82,83,89,83,89,84,89,83,85,91,89,88,92,88,82,84,89,85,74,94,88,82,84,89,86,87,85,86,84,84,91,92,82,87,87,84,86,91,90,87,92,87,88,86,92,69,90,63,13,3,90,86,69,86,95,89,89,94,93,92,22,27,77,68,87,91,85,90,86,91,81,85,92,84,91,99,88,93,86,93,74,97,90,92,83,89,95,90,92,96,94,87,90,95,95,92,91,94,90,89,96,93,89,98,80,100,91,97,91,97,89,87,90,90,97,93,95,106,99,78,89,97,102,80,85,89,89,89,95,89,94,84,105,89,89,96,93,93,89,93,84,89,89,94,95,91,93,91,87,96,91,90,91,93,85,88,88,98,92,113,167,137,92,104,89,82,34,22,82,89,95,78,106,84,88,92,87,95,93,83,83,98,95,88,95,96,99,75,81,81,84,95,94,96,95,91,81,86,95,100,75,97,85,80,87,97,95,92,90,96,77,87,96,102,87,87,97,81,85,95,95,99,74,97,93,88,88,113,118,97,90,88,87,98,87,81,95,86,84,85,96,89,92,85,94,82,85,97,140,222,243,162,89,94,102,99,88,97,96,80,85,98,94,52,71,-1,-27,86,87,43,48,12,83,91,86,95,86,90,93,135,99,97,108,84,71,78,97,82,85,97,89,91,80,89,86,85,101,93,88,124,112,178,87,102,247,208,129,101,103,87,97,91,90,90,94,89,85,103,99,15,9,68,70,84,81,36,-12,-30,45,82,83,83,91,81,89,122,116,80,93,157,203,138,35,108,83,83,94,160,170,99,110,82,94,89,77,88,85,88,83,92,79,82,30,-39,18,81,81,94,70,88,145,151,83,100,150,140,95,86,82,82,82,100,89,80,71,60,80,94,89,98,87,95,79,79,91,87,86,81,83,77,82,81,94,86,80,106,79,76,101,57,31,-2,-15,28,76,70,53,33,67,67,85,76,87,87,65,60,71,48,75,84,34,43,94,170,158,80,95,23,-41,74,53,77,76,86,79,79,50,91,79,76,88,84,82,72,81,76,74,91,83,191,175,158,226,76,76,100,214,141,84,84,74,86,84,82,82,75,75,75,78,76,84,58,94,55,76,84,-21,-118,64,1,3,74,78,-33,45,13,48,75,80,95,101,82,90,89,84,74,85,72,82,83,74,53,76,84,104,70,93,69,88,76,76,89,65,81,95,64,73,83,63,90,86,82,63,74,85,96,77,81,59,82,74,86,71,78,81,92,71,76,87,88,97,125,129,112,73,91,127,138,284,223,122,73,100,101,72,62,-48,74,74,71,-153,-80,-35,65,74,73,85,79,78,72,52,80,74,85,93,80,90,91,66,74,74,99,96,85,82,74,74,74,87,66,85,76,80,79,86,68,132,125,102,73,74,95,112,60,41,73,63,73,84,75,143,75,83,186,73,90,174,203,127,101,74,73,90,67,92,87,71,75,73,85,79,81,78,82,78,71,83,77,75,41,41,20,71,78,48,-1,6,-41,23,73,74,88,78,74,75,73,69,81,70,72,65,73,70,71,81,72,72,71,78,75,73,90,77,164,126,30,74,74,74,77,23,52,73,68,71,101,76,78,74,76,71,72,83,76,79,73,62,79,75,80,66,82,89,75,61,70,80,82,78,72,78,92,71,71,61,74,74,79,64,71,85,79,83,111,70,71,71,89,36,107,85,57,79,71,79,96,82,51,86,60,72,80,78,95,62,53,73,73,81,58,74,74,74,72,69,79,72,71,65,68,76,69,90,82,68,76,78,46,69,66,97,74,69,75,43,69,76,69,105,70,76,51,68,79,65,89,64,84,67,67,74,72,78,72,74,67,66,76,57,66,54,96,52,66,76,84,70,40,70,97,66,78,62,80,62,78,66,67,78,66,73,64,62,73,64,86,72,70,70,70,66,67,77,60,70,33,93,76,68,79,71,70,70,70,66,66,77,69,68,61,75,64,68,90,83,61,78,76,69,65,76,62,70,61,73,66,70,77,35,74,84,92,68,66,82,63,78,80,72,66,67,76,70,71,59,85,65,65,77,70,70,68,74,65,66,67,71,70,53,70,69,65,77,91,72,66,68,65,66,77,79,71,66,73,67,65,80,51,79,85,72,66,66,79,70,64,80,77,73,71,86,80,74,77,80,69,75,86,59,94,75,73,80,77,97,71,92,82,71,77,73,73,93,84,68,78,74,72,86,71,79,133,58,37,71,83,93,55,91,123,138,70,95,80,179,182,155,109,72,96,90,78,88,73,73,74,89,76,18,-1,64,54,75,90,70,2,-17,8,35,75,80,77,100,74,75,81,67,85,67,82,73,78,70,69,84,70,35,110,79,59,71,87,68,96,73,71,68,69,85,85,66,75,246,146,68,109,32,-28,11,48,70,68,81,73,74,74,70,69,70,85,77,49,104,50,99,70,85,63,70,71,77,73,73,73,95,74,88,75,68,69,84,81,74,73,62,66,69,71,73,70,46,93,99,69,85,79,59,69,75,62,62,77,66,63,62,55,58,57,69,52,62,62,51,58,52,62,52,53,24,79,58,58,71,51,57,60,82,59,61,72,68,112,152,218,48,68,93,59,7,-41,-25,69,61,64,54,33,62,78,48,59,69,66,60,74,78,32,58,68,86,50,46,73,63,61,60,63,79,65,56,56,56,70,60,51,41,79,46,55,65,43,52,86,45,77,56,65,61,27,81,44,69,57,65,71,57,64,39,67,59,70,72,74,62,13,85,59,58,68,83,51,74,59,59,54,60,41,68,39,99,59,67,62,63,55,71,62,74,76,65,68,60,59,56,56,64,60,287,60,55,51,51,48,31,59,59,64,61,51,58,55,44,55,53,58,49,56,47,96,114,4,123,56,64,6,30,52,64,49,51,57,53,39,66,41,47,51,56,51,52,51,68,98,48,55,52,56,62,130,92,51,65,56,2,8,61,28,49,49,56,58,32,46,34,35,55,38,54,24,2,25,53,56,55,46,68,59,56,55,61,29,95,67,55,52,51,50,50,61,54,49,75,48,56,30,41,53,44,72,51,58,48,146,166,286,137,52,71,56,63,110,132,81,56,69,88,67,54,-35,-23,54,39,31,54,28,-11,-117,55,51,2,-13,-13,-13,52,55,59,72,191,308,344,146,55,88,90,45,54,57,52,54,59,47,57,54,196,-55,55,66,45,50,59,59,56,57,67,68,52,61,57,55,56,63,61,64,66,66,56,57,66,61,61,61,61,57,57,52,61,62,60,58,58,58,57,72,64,62,67,54,56,65,66,53,63,58,58,58,72,61,13,36,-2,33,55,60,112,81,107,72,62,55,66,61,58,53,58,55,55,55,66,59,57,73,44,56,66,58,58,60,49,53,53,63,59,59,45,34,52,52,57,51,53,54,50,50,49,55,51,49,53,53,50,52,58,59,63,56,52,50,50,55,51,51,47,38,51,45,21,39,46,50,50,54,46,51,53,34,46,47,45,45,50,50,50,50,55,42,50,50,59,47,65,30,45,43,47,54,12,-19,48,43,44,49,44,46,47,46,45,45,49,47,46,45,44,47,48,55,50,50,46,47,44,42,47,43,50,47,51,45,43,32,47,55,52,51,47,52,61,51,52,52,55,39,45,54,44,56,60,48,45,45,53,49,49,45,50,42,45,45,35,45,45,50,46,44,52,47,47,46,50,43,43,55,42,50,42,47,45,43,55,48,47,47,46,45,45,52,50,47,48,27,44,43,51,47,47,54,51,47,47,57,50,52,51,61,39,52,58,55,51,47,53,49,49,57,50,55,55,32,46,52,59,56,54,51,55,50,49,59,57,51,53,56,51,51,60,50,70,49,-715,52,51,28,-189,-169,48,32,13,45,51,97,26,174,439,136,47,81,153,61,85,49,46,45,53,277,230,79,48,50,51,60,54,52,47,49,49,46,53,49,53,51,33,47,48,55,52,62,52,50,52,49,55,52,51,51,55,48,54,65,61,53,53,52,49,49,57,51,52,36,53,48,49,56,51,52,56,54,43,49,56,53,53,48,56,44,50,60,73,-305,-541,-107,85,50,48,201,233,197,32,62,49,53,45,54,69,-49,101,53,59,56,50,22,56,18,56,62,123,-4,83,114,57,57,57,83,9,57,56,60,51,60,18,23,-244,21,-66,52,52,-88,-22,6,47,48,51,51,60,105,218,190,287,62,86,330,297,174,151,95,49,61,58,44,103,84,62,49,59,47,54,52,41,52,52,61,59,56,54,59,48,55,60,68,53,68,52,50,52,58,56,38,-239,-248,-45,51,38,-30,9,-21,-133,-58,52,45,-75,-72,51,72,31,44,51,31,7,-11,93,77,46,46,58,114,84,33,52,47,53,67,58,41,30,46,46,52,48,48,76,30,37,45,49,39,45,55,47,33,47,51,67,42,62,40,51,42,50,121,204,55,234,148,38,58,130,61,41,203,216,51,75,232,119,108,56,50,50,59,63,44,56,14,-3,52,56,55,81,100,56,73,50,49,61,52,37,56,49,51,58,55,51,51,52,49,49,56,50,50,49,57,-93,55,58,198,61,59,38,46,46,52,74,9,48,50,45,47,46,45,56,53,57,61,54,44,49,56,55,54,50,55,54,60,69,58,57,54,54,60,43,40,59,28,54,53,43,67,46,56,55,57,55,66,-6,-101,-413,57,-29,55,61,205,66,-65,216,270,55,93,207,218,83,53,52,52,78,36,56,56,58,52,51,61,55,52,58,44,58,51,60,57,55,55,55,50,59,3072,62,65,55,57,50,49,58,47,357,45,37,50,43,50,30,43,43,46,44,44,51,49,50,47,51,47,56,61,58,55,54,55,50,51,62,54,34,55,54,57,49,58,46,52,52,53,47,48,58,50,65,37,49,46,46,56,51,47,55,57,49,48,59,52,52,53,53,48,51,59,56,35,-319,-111,-262,55,35,110,-307,-43,-10,53,54,53,62,66,11,55,35,52,53,66,292,333,603,275,52,74,157,54,57,58,53,56,43,59,62,59,59,57,54,67,53,61,57,58,53,53,64,61,62,57,56,52,52,62,57,55,56,59,48,49,69,21,61,75,58,55,56,66,59,59,59,59,55,56,80,60,57,83,-66,167,56,67,61,-411,10,-318,-62,56,44,-678,-375,34,-84,91,57,62,85,45,62,64,53,57,63,61,59,63,63,59,59,71,59,68,56,71,60,59,74,65,46,79,42,79,59,46,63,63,63,67,59,60,69,64,64,58,66,59,59,69,63,43,94,49,33,50,65,96,45,68,66,59,59,71,64,39,63,63,59,60,71,64,64,64,66,60,59,72,63,64,61,65,50,60,77,45,97,84,42,59,60,71,46,68,53,70,60,60,71,64,64,63,65,388,61,62,89,538,545,614,64,66,102,72,33,60,74,56,63,77,65,81,63,69,61,63,52,77,70,72,76,66,63,75,56,74,58,79,58,64,77,69,69,91,78,37,63,74,75,71,-102,68,209,68,84,83,-72,-25,192,-177,70,76,-84,34,-217,-382,-283,69,47,-101,-44,99,78,63,69,73,90,80,61,77,70,69,88,124,230,511,617,667,69,130,86,75,68,79,71,69,110,74,61,74,74,68,69,84,78,102,56,75,70,70,85,78,77,76,74,73,71,86,36,92,79,91,66,73,90,75,83,78,76,75,73,88,79,82,78,78,76,74,90,81,30,10,59,51,74,65,103,122,112,51,157,75,94,56,117,118,60,76,77,93,83,83,83,81,88,76,95,69,84,83,84,63,76,95,96,53,-155,-294,76,77,76,81,297,-419,-358,77,76,63,141,-90,-194,5,77,77,76,98,187,158,131,-27,77,92,-38,141,-33,-25,57,78,63,63,123,31,139,78,78,98,85,85,91,85,78,77,98,85,85,64,99,78,77,104,77,94,58,93,94,78,99,48,84,58,112,74,77,99,96,409,802,367,450,80,128,449,95,-121,-365,-923,78,34,-329,60,65,93,89,79,100,87,85,56,121,49,81,110,84,98,86,82,89,81,103,90,-37,200,82,69,69,89,-32,158,95,94,83,83,102,91,90,52,95,117,84,85,79,90,89,52,120,82,107,70,86,109,65,88,82,81,109,108,38,126,95,81,103,207,368,235,114,86,85,118,125,100,14,0,28,85,98,9,-5,53,64,121,85,106,20,-4,107,110,56,86,106,106,94,93,93,104,85,107,112,86,76,92,88,88,106,88,100,93,95,73,88,88,114,112,95,86,99,88,108,127,-4,95,130,54,89,109,101,71,106,61,108,89,106,74,104,61,130,89,90,109,85,108,96,97,88,89,109,86,89,65,145,72,89,110,115,87,94,85,89,89,114,114,-5,172,99,65,66,106,93,93,93,42,141,89,105,94,92,73,99,102,86,85,112,106,148,110,86,85,86,105,87,195,381,415,87,129,109,392,381,237,87,87,124,147,96,93,92,87,87,103,99,87,89,103,89,89,104,93,92,96,93,87,87,105,73,93,94,93,88,86,102,93,95,94,97,87,87,103,95,94,89,83,105,87,111,90,33,-231,-128,106,88,98,-158,63,-384,-136,-26,87,93,39,92,85,138,51,87,109,95,113,174,130,-45,87,108,95,94,94,68,116,89,108,96,87,100,69,72,86,108,90,69,110,121,87,86,110,95,86,106,95,73,87,108,67,88,101,126,87,87,86,125,87,105,95,82,83,104,94,76,112,91,70,86,103,93,191,91,70,87,87,113,209,276,171,174,168,87,112,77,93,44,223,69,88,110,121,69,51,42,87,88,102,50,-42,43,81,88,87,107,80,31,84,163,86,87,106,96,36,87,75,88,88,105,97,5,-19,-45,147,90,105,98,43,151,70,104,90,109,110,66,72,95,146,90,110,32,59,59,225,90,89,117,97,-8,197,98,89,90,108,97,72,96,96,90,90,108,99,50,48,187,90,89,111,98,53,101,32,57,89,105,232,100,85,108,80,91,91,115,119,64,96,88,88,109,98,98,106,81,99,90,110,98,76,102,86,97,91,111,106,120,98],"returnScale":1000000,"returns":[0,95,94,95,96,95,98,96,100,99,97,96,97,98,110,96,105,95,99,97,97,97,95,98,97,97,98,96,97,89,117,96,98,97,97,105,97,97,97,97,95,107,99,95,97,95,96,100,96,98,95,99,96,96,96,96,97,98,96,97,97,98,97,96,99,99,98,97,99,96,100,102,97,95,96,95,97,96,97,97,96,98,96,97,96,98,99,98,104,96,101,105,91,96,95,93,101,91,92,92,98,91,91,89,92,92,91,94,91,91,92,91,95,97,90,90,89,87,88,92,92,97,105,96,104,88,93,94,87,89,91,93,88,91,93,92,90,92,93,88,92,95,92,90,95,94,101,93,93,96,93,95,104,102,103,102,99,146,93,92,108,108,93,96,90,91,92,95,91,93,92,91,90,93,92,89,92,76,62,91,90,91,130,88,87,93,94,97,89,88,91,65,92,92,93,91,78,81,89,88,92,92,84,87,96,93,94,90,91,93,93,103,92,88,90,88,85,90,90,82,81,88,85,89,91,93,88,85,88,88,96,109,110,131,106,87,89,87,86,88,85,87,88,86,87,86,90,97,97,84,85,81,84,86,86,80,91,84,85,87,87,82,84,85,84,84,87,88,89,87,87,88,83,79,74,77,77,79,79,79,80,76,87,81,77,78,80,77,77,75,77,77,77,75,52,57,84,68,75,75,68,86,74,20,-20,77,78,77,33,72,78,69,80,71,74,83,76,85,77,76,77,74,82,84,80,78,76,76,70,80,84,88,81,79,75,75,83,119,135,114,76,78,101,71,75,89,79,75,76,103,93,89,75,82,75,75,80,78,77,76,76,74,74,75,80,73,80,73,75,74,76,75,73,66,54,75,75,75,91,89,80,56,75,75,79,56,63,76,74,74,74,90,103,72,66,42,73,74,53,54,72,76,66,75,75,68,82,17,39,91,74,73,87,71,88,74,68,73,73,78,74,78,87,84,74,73,91,84,74,81,91,80,78,117,70,101,81,76,52,74,76,88,68,71,77,78,77,83,72,78,-24,53,75,74,15,114,87,67,76,77,76,75,74,76,72,82,75,76,75,87,97,94,127,74,80,116,77,80,75,73,74,77,79,72,74,78,80,76,80,77,77,78,79,75,76,78,68,78,78,75,76,76,80,78,76,77,78,77,73,78,75,76,73,78,75,75,78,75,77,77,77,63,77,79,81,57,103,78,74,75,75,80,76,76,77,76,75,77,78,76,74,77,72,73,79,80,74,84,72,72,78,79,65,56,62,77,74,74,79,73,72,73,73,83,75,80,96,118,80,74,74,74,79,76,79,75,79,75,75,75,82,74,78,82,73,79,82,69,78,77,78,77,78,81,78,76,75,78,73,75,79,74,80,75,79,74,76,81,80,79,82,78,74,75,79,76,66,84,79,73,75,79,77,78,76,77,75,75,81,82,73,78,78,75,77,81,80,78,82,78,79,76,83,61,81,56,11,3,80,77,62,77,85,79,80,84,83,82,19,25,68,61,78,81,76,80,77,81,73,76,82,75,81,89,78,83,77,83,66,87,80,82,75,79,85,80,82,86,84,78,80,85,85,82,81,84,81,79,86,83,80,87,72,89,81,87,81,87,79,78,80,81,86,83,85,95,88,70,79,87,91,72,76,79,80,79,85,79,84,75,94,80,79,86,83,83,80,83,75,79,80,84,84,82,83,81,78,85,82,80,81,83,76,79,79,87,82,101,149,123,82,93,79,74,30,20,73,79,85,70,94,76,78,82,78,85,83,74,74,88,85,78,85,86,88,67,73,72,75,85,84,85,85,82,72,77,85,89,67,87,75,72,78,86,85,82,81,85,69,78,86,91,77,78,87,72,76,85,85,88,66,87,83,79,78,101,105,87,80,79,78,87,78,72,85,77,75,76,86,79,82,76,84,74,75,87,125,198,217,145,80,84,91,88,79,86,86,72,75,88,84,46,64,-1,-24,77,77,39,43,10,74,82,77,84,77,81,83,120,89,86,97,75,63,70,87,73,76,86,80,81,72,79,77,76,90,83,79,110,100,159,78,91,221,186,115,90,92,78,86,82,80,80,84,80,76,92,88,14,8,60,63,75,72,32,-10,-27,40,73,75,74,81,72,80,109,103,72,83,140,181,124,31,96,75,74,84,143,151,89,98,73,84,80,68,79,76,79,74,82,70,74,27,-35,16,72,72,84,63,79,129,135,74,89,134,125,85,77,73,74,73,89,80,71,63,54,71,84,80,87,78,85,71,70,81,78,77,72,74,69,73,73,84,77,71,95,70,68,90,51,28,-2,-13,25,68,62,47,30,60,60,76,67,78,78,58,54,63,43,67,75,30,39,84,151,142,71,85,20,-36,66,47,69,68,77,70,71,44,82,70,68,79,75,73,64,73,68,66,81,74,171,156,141,202,68,68,89,191,126,75,75,66,77,75,73,74,67,67,67,69,68,75,52,84,49,68,75,-19,-105,57,1,2,67,69,-29,40,12,42,67,72,85,90,73,81,79,75,66,76,64,74,74,66,47,68,75,93,63,83,61,79,68,68,79,58,72,85,57,66,74,56,80,77,74,56,66,76,86,68,73,52,74,66,77,63,70,72,82,64,67,78,79,86,112,115,100,65,82,113,123,254,199,109,65,90,90,64,56,-43,66,66,63,-136,-72,-31,58,66,65,76,71,70,64,46,72,66,76,83,71,81,81,59,66,66,88,86,76,73,66,67,66,77,59,76,68,72,70,77,61,118,111,91,66,66,84,101,53,37,65,56,65,75,67,128,67,74,166,66,80,155,182,113,90,66,66,80,60,82,78,63,67,65,76,71,72,70,73,70,63,74,69,67,37,36,18,64,69,43,-1,6,-37,21,65,66,78,70,66,67,65,62,72,63,64,58,65,63,63,73,64,64,64,69,67,66,80,69,146,113,27,66,66,66,69,20,47,65,61,63,90,68,70,66,68,63,64,75,67,71,65,56,70,67,72,59,73,79,67,55,62,72,73,70,64,70,82,63,64,54,66,66,71,57,63,76,71,74,99,63,63,64,79,32,96,76,51,70,64,70,86,73,46,76,54,64,72,69,85,56,47,65,65,73,52,66,66,66,64,62,70,65,63,58,61,68,61,81,73,61,68,69,41,62,59,87,66,61,67,39,61,68,62,94,62,68,46,60,71,58,79,58,75,59,60,66,65,69,65,66,60,59,67,51,59,49,85,47,59,68,75,62,36,62,87,59,70,55,71,56,70,58,60,70,59,65,57,56,65,57,77,64,63,62,63,59,60,68,54,62,30,83,68,61,70,64,62,63,62,59,59,69,61,61,55,67,57,61,80,74,55,69,68,62,58,68,55,63,54,65,59,63,68,32,66,75,82,61,59,73,56,70,71,65,59,59,68,63,63,53,76,58,58,69,62,63,61,66,58,59,59,64,62,48,62,62,58,69,81,64,59,61,58,59,69,70,64,59,65,60,58,71,46,70,76,65,59,58,71,63,57,71,69,65,64,76,72,66,69,71,62,67,77,52,84,67,65,72,69,86,64,82,73,64,68,66,65,83,75,61,69,66,65,76,64,70,119,52,33,63,75,83,49,81,110,123,63,85,71,160,162,139,97,65,85,81,69,79,65,65,66,80,68,16,-1,57,48,67,81,62,2,-15,7,31,67,72,69,89,66,67,72,60,76,60,73,65,70,63,61,75,63,31,98,71,52,64,78,60,86,65,64,60,62,76,76,59,67,220,130,61,97,29,-25,9,43,63,61,72,65,66,66,63,61,63,76,69,43,93,45,88,63,76,56,63,63,69,65,65,65,85,66,79,67,61,61,75,73,66,65,55,59,62,63,66,62,41,83,89,61,76,71,52,62,67,55,56,69,59,56,55,49,52,51,62,46,56,55,45,52,47,55,47,47,21,71,52,51,64,45,51,54,73,53,54,65,60,100,136,195,43,60,84,52,7,-37,-22,61,55,57,48,30,55,70,42,53,62,59,53,66,70,29,51,61,77,45,41,65,56,55,53,57,70,58,50,50,50,63,53,46,37,70,41,49,58,39,46,77,40,69,50,58,55,24,72,39,62,51,58,63,51,57,35,60,53,62,65,66,55,12,76,52,52,61,74,46,66,52,53,48,54,36,61,35,88,53,60,55,57,49,63,56,66,68,58,60,54,53,50,50,57,53,257,53,49,46,46,42,28,53,53,57,54,46,52,49,39,49,47,52,44,50,42,86,102,3,110,50,57,6,26,47,57,44,45,51,47,35,59,37,42,45,50,46,46,46,61,87,43,49,47,50,55,116,82,46,58,50,2,7,54,25,44,44,50,52,28,41,31,31,49,34,48,22,2,22,47,50,49,41,61,53,50,49,55,25,85,60,49,47,45,45,45,54,48,44,67,43,50,27,36,48,39,64,46,52,43,130,148,256,122,46,64,50,56,98,118,73,50,61,79,60,48,-31,-21,48,35,28,48,25,-10,-104,49,45,2,-11,-12,-12,47,49,53,64,171,275,307,130,49,79,80,41,48,51,46,48,53,42,51,48,175,-49,49,59,41,44,53,53,50,50,60,61,47,54,51,49,50,56,55,57,59,59,50,51,59,54,55,54,55,51,51,46,54,56,53,52,52,52,51,64,57,56,59,49,50,58,59,47,56,52,52,52,64,54,12,32,-2,30,49,54,100,72,96,64,55,49,59,55,52,47,52,49,49,49,59,53,51,65,39,50,59,52,52,53,44,47,48,56,53,52,41,30,46,47,51,45,48,48,45,44,44,49,46,43,48,47,45,46,52,53,56,50,47,44,45,49,46,45,42,34,46,40,18,35,41,45,45,48,41,46,47,30,41,42,41,40,44,45,45,44,49,38,45,44,53,42,58,27,40,38,42,49,10,-17,43,39,39,44,39,41,42,41,40,41,43,42,41,41,39,42,43,49,45,44,41,42,40,37,42,38,45,42,46,40,38,29,42,49,46,46,42,46,55,45,47,46,49,35,40,49,39,50,54,42,41,40,47,44,44,40,45,37,40,40,32,40,40,45,41,39,47,42,42,41,44,39,38,49,38,44,38,42,40,38,50,42,42,42,42,40,40,46,45,42,43,24,39,39,45,42,42,48,46,42,42,51,45,46,46,54,35,46,52,49,46,42,47,44,44,51,44,49,49,29,41,47,52,50,48,46,49,45,44,52,51,46,47,50,46,45,54,44,63,44,-639,47,45,25,-169,-151,43,29,11,41,45,87,23,155,393,121,42,72,137,54,76,44,41,40,48,247,206,70,43,45,45,54,48,47,42,43,44,41,47,44,48,45,30,42,42,50,46,55,47,45,46,44,49,46,46,45,50,42,49,58,54,47,48,46,44,44,51,45,47,32,47,43,44,50,45,47,50,48,39,43,50,48,47,43,50,39,45,53,66,-273,-483,-96,76,45,43,179,209,175,29,55,44,48,40,48,62,-44,90,47,53,50,45,19,50,16,51,55,110,-4,74,102,51,51,51,74,8,51,50,54,45,54,16,20,-218,19,-59,47,46,-79,-19,5,42,43,46,45,54,94,194,170,256,56,76,295,265,156,135,85,43,55,52,39,92,75,55,44,53,42,48,46,37,47,46,54,53,50,48,53,43,49,54,60,48,61,46,45,46,52,50,34,-214,-221,-40,45,34,-27,8,-18,-119,-52,46,41,-67,-65,46,64,28,39,46,27,7,-10,83,69,41,41,52,102,75,29,46,42,48,60,51,37,27,41,41,46,43,43,68,27,33,40,44,35,40,49,42,29,42,46,60,37,56,35,46,38,44,108,182,50,209,132,34,52,116,54,37,181,193,46,67,207,106,97,50,44,45,53,56,39,50,13,-3,46,50,50,72,89,50,65,45,44,54,47,33,50,44,45,52,49,46,45,47,43,44,50,45,45,43,51,-83,49,52,177,54,53,34,41,41,47,66,8,43,44,40,42,42,40,50,47,51,54,49,39,44,50,49,48,45,49,48,54,61,52,51,48,49,53,39,35,53,25,48,48,38,60,41,50,49,51,49,59,-5,-91,-368,50,-25,49,54,183,59,-58,193,241,49,83,185,195,74,48,46,46,70,32,50,50,52,47,45,55,49,46,52,39,52,46,53,51,49,49,49,45,53,2744,55,58,49,51,45,44,51,42,319,40,33,45,38,45,27,38,39,41,39,39,46,44,44,42,46,42,50,54,52,49,49,49,44,46,55,49,30,49,48,51,44,52,41,46,47,47,42,43,52,44,58,33,44,41,41,50,46,42,49,51,44,43,52,47,46,48,47,43,45,53,50,31,-285,-99,-234,49,32,98,-274,-39,-9,48,48,47,56,59,9,49,32,46,48,58,261,298,538,246,46,66,141,48,51,52,47,50,38,53,55,53,53,51,48,60,47,55,51,51,48,47,57,55,55,51,50,46,47,55,51,49,50,53,43,44,61,19,55,67,51,49,50,59,53,53,53,52,49,50,72,53,51,74,-59,150,50,60,54,-367,9,-284,-56,50,40,-606,-335,31,-75,81,51,55,76,40,56,57,47,51,56,55,52,57,56,53,52,64,53,60,50,64,53,53,66,58,41,71,37,71,53,41,56,56,56,60,53,54,61,57,58,51,59,53,53,61,57,38,84,44,29,45,58,86,40,61,59,52,53,63,58,34,57,56,53,53,64,57,57,57,59,54,52,65,56,57,55,58,44,54,69,40,86,75,38,53,53,64,41,61,47,62,54,54,63,57,57,57,58,346,55,55,80,480,487,548,57,59,91,65,29,54,66,50,56,69,58,72,57,61,55,56,46,69,63,64,68,59,56,67,50,66,52,71,51,58,68,62,62,81,70,33,56,66,67,63,-91,61,187,60,75,75,-65,-22,171,-158,63,68,-75,30,-194,-341,-253,62,42,-90,-40,89,70,56,61,66,80,71,55,69,62,62,78,111,206,456,551,596,62,116,76,67,61,71,63,62,98,66,55,66,66,61,61,75,70,91,50,67,62,63,76,70,68,68,66,66,63,77,32,82,71,81,59,65,80,67,75,69,68,67,65,79,71,73,69,70,68,66,80,73,27,9,52,46,66,58,92,109,100,45,141,67,84,50,104,106,53,68,69,83,74,74,74,73,78,68,85,62,75,74,75,56,68,85,85,48,-139,-262,68,68,68,73,265,-374,-320,69,68,56,126,-81,-173,5,68,69,68,88,167,141,117,-24,68,83,-34,126,-30,-22,51,69,57,56,110,27,125,69,70,87,76,76,82,75,70,69,87,76,76,57,89,70,68,93,69,84,52,83,84,69,89,43,75,52,100,66,68,89,86,365,716,328,402,71,115,401,85,-108,-326,-825,70,30,-294,54,58,83,80,70,89,78,76,50,108,44,72,99,75,87,77,73,80,72,92,80,-33,179,73,62,61,80,-29,141,85,84,74,75,91,81,80,47,85,104,75,76,71,80,79,47,107,73,96,62,77,98,58,78,74,72,97,97,34,112,85,72,92,185,329,210,102,76,76,106,111,90,12,0,25,76,88,8,-5,48,57,108,76,94,18,-3,95,99,50,76,95,95,84,83,83,93,76,95,100,77,68,82,79,78,95,79,89,83,85,65,79,78,102,100,85,77,88,79,96,114,-4,85,116,48,80,97,90,64,94,55,96,80,95,66,93,54,116,80,80,97,76,97,85,87,79,79,98,76,80,58,129,65,79,98,103,78,84,76,79,80,102,101,-4,154,88,58,59,95,83,83,83,37,126,80,94,84,82,65,88,91,77,76,100,95,132,98,77,76,77,94,77,175,340,371,77,115,98,350,340,212,78,77,111,131,86,83,82,78,78,92,88,78,79,92,80,79,93,83,82,86,83,78,78,93,66,83,84,83,78,77,91,83,85,84,87,78,77,92,85,84,80,74,93,78,99,81,29,-206,-115,95,79,87,-141,56,-343,-121,-23,77,84,34,83,75,124,45,78,97,85,101,156,116,-41,78,97,84,84,84,61,104,79,97,85,78,89,62,64,77,97,80,62,98,108,78,77,98,85,76,95,85,65,78,96,60,79,90,113,77,78,77,111,78,94,85,73,74,93,84,68,100,81,63,76,92,84,170,81,63,78,77,101,187,246,153,156,150,77,100,69,83,40,199,61,79,98,108,62,45,38,78,78,91,45,-37,38,72,79,78,95,72,27,75,146,77,77,95,86,32,78,67,78,79,94,86,5,-17,-40,131,80,94,88,38,135,62,93,81,97,98,59,65,84,131,80,98,29,53,52,201,81,79,105,86,-7,176,88,79,81,96,87,64,86,86,80,80,97,88,45,43,167,80,80,99,87,48,90,28,51,80,94,207,89,76,97,71,81,82,102,107,57,85,79,79,97,88,87,95,72,88,81,98,88,68,91,76,87,81,100,94,107,88]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB Amerika", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1136376,4699,1066,-128,-100,4471,260,-1935,2949,-14646,-31,-99,-1044,-6827,2209,-13947,8517,-71,-98,5730,564,2957,745,592,-85,-99,2693,5287,-801,2073,1568,-67,-89,-2915,10206,-266,-1874,-173,-57,-90,4124,1798,4859,686,5182,-140,-100,1389,-1661,-3537,-4059,5904,-21,-100,-1873,5221,-4424,-2860,4744,-117,-101,-3096,-6229,-3451,-4171,-5304,-88,-98,4,-13303,945,-10486,-669,-106,-88,-13524,-8325,-10450,7895,7825,-527,-95,7653,-4265,-632,-149,-2011,-207,-95,409,8135,-327,54,-1851,-200,-88,10185,1199,6433,1314,-6720,-43,-89,-2828,-4047,-1793,-890,6012,-124,-89,-3567,-1251,896,5057,5109,-136,-89,-3986,2233,519,-1201,4947,141,-90,-3308,-6766,1309,-1159,4932,-225,-89,-7544,2159,3232,3949,-110,17,-90,-1571,-1759,-2260,378,2233,66,-88,-163,179,-1895,4150,3854,-26,-89,4528,-3654,-2142,-4485,5230,1434,-90,8770,-4648,-881,3900,-678,-256,-90,2446,-1668,-3279,-975,-760,6,-90,3367,-12105,2569,-20357,2442,-682,-88,481,1815,5293,893,701,177,-91,1512,-467,6203,-1426,1798,-90,-91,-1075,9429,11776,-7965,-3509,-126,-93,-4231,-3184,-1913,3235,-4257,-265,-92,-339,4203,-3199,-400,24,-91,-92,874,-5574,329,438,764,-3,-91,-5443,-4495,4626,9146,-539,-144,-92,3187,-7894,6257,1596,5930,226,-93,-1643,-4805,-73,-5476,-4037,-92,-92,-924,2111,1363,1020,-521,-84,-92,-10103,-3160,61,-92,583,-108,-91,-12230,-13763,-8862,-3799,5930,-101,-88,9881,-2766,2347,-655,-4295,-80,-89,-16133,1168,3174,-6044,-8008,-101,-89,-6036,7665,-4731,352,1630,-214,-89,5836,1845,3079,947,2893,-91,-91,-2485,1783,2748,-1120,893,-159,-94,-7397,3244,-2316,-442,5162,-939,-94,-3008,-3408,-3387,223,-4494,25,-93,351,4872,-1991,-2708,2030,-41,-93,1333,-3209,-3995,-2083,-8829,-190,-92,-29851,2410,-4955,13609,1436,-90,-90,-6466,-5806,-637,-3128,-2046,227,-86,132,-1793,3131,-569,-7699,-30,-85,2419,-8181,-7138,-5986,-3589,-305,-83,-2309,187,2163,7960,6980,-253,-84,663,-4334,1855,7646,3515,-75,-85,3317,-6151,-2324,382,4661,-442,-85,-1926,-2899,-2096,-1992,2448,-335,-84,1546,1921,1200,-1136,6663,-85,-85,4191,-6479,-2760,940,4690,-116,-86,2686,5550,-5913,1974,1885,-191,-86,-25,902,1216,-326,-6047,85,-86,-12603,3506,898,5698,6849,-90,-87,-1370,1923,-1217,309,2545,89,-87,-8583,2766,690,3396,-2823,56,-86,-2916,-131,-3171,-6559,-1885,-188,-63,-6219,6870,3287,5907,3322,-39,-86,-3439,-1577,1258,899,-762,-265,-86,2941,-433,5872,780,-156,-87,-87,3646,-5257,-2908,-7836,-5596,-72,-86,-3130,-1507,243,-8234,-3451,341,-85,-9437,-1819,-1649,-2951,15514,-65,-85,3632,1017,1414,1321,10998,-63,-86,-7312,-1943,-130,-967,-430,-17,-85,-3724,-8414,3629,-7774,-7523,-8,-83,4730,424,1530,1030,4514,-70,-84,5708,87,-6702,4006,5690,-96,-85,2249,-1681,1462,-959,6298,-81,-87,3177,7467,-4296,-2695,16880,-230,-90,5013,-5810,2005,1326,1501,-1,-90,-1753,3927,5791,-1716,-606,-68,-92,3958,-612,5319,2211,-6215,152,-92,-2969,-414,1569,-186,199,152,-92,1557,-1696,4556,360,3127,-349,-92,-1169,595,5878,649,-101,-141,-93,73,1149,332,3727,1423,-92,-91,-277,-6053,-6099,3281,1855,160,-90,3780,-2343,-2443,-184,1148,-71,-90,-275,8420,-4053,-91,3055,-51,-91,638,2078,725,450,-161,-1,2646,1170,-7892,-1284,789,-65,-91,567,-1335,2237,1557,-2161,-166,-91,-5353,-7219,2580,-1609,1550,-90,-90,7148,-3203,2662,4249,-20177,-171,-90,-5707,11542,1901,5426,2404,16,-93,-1097,5353,5173,4100,2794,-658,-93,-1417,5685,-427,4230,2739,114,-94,-7771,1272,133,551,2882,-244,-93,4816,8243,12669,4357,6189,-163,-97,-3967,-4298,-1320,-2821,-651,-86,-95,4660,3250,2306,-2167,-1464,-40,-96,-1772,-2873,10552,819,4045,-161,-94,-3042,1950,3893,4113,3721,-35,-94,-132,5071,-4810,9422,-1009,-15,-95,1956,11,2652,459,5229,-32,-95,-2932,-1503,-2264,2838,604,-175,-95,3660,854,-700,4037,4665,32,-97,-1563,-3783,3221,-7693,-1912,-254,-96,-4319,8796,279,-1,2382,78,-99,2118,-1782,-821,-206,576,37,-98,515,7813,6043,8431,2035,-125,-100,5067,5180,817,-1848,-2320,106,-101,2378,488,-5209,-4834,-2604,-134,-99,-2599,5627,-6364,231,278,-277,-100,-31113,-1374,4525,-1515,11084,-275,-98,1412,-3113,-1828,-1917,4547,-159,-97,-4412,-5338,2404,-3162,-1174,-152,-96,3422,-212,4891,-1763,1382,-16,-97,-2261,849,5036,-5308,-2717,-27,-96,-3714,220,5667,-2265,2909,-203,-97,660,1378,633,617,5834,-80,-98,528,-1591,3290,7370,3957,-100,-99,10664,9083,2499,110,591,148,-102,-3257,257,-2372,3655,-1898,172,-101,168,4329,-1704,4408,4751,-151,-103,1467,-1374,1750,5290,6385,321,-105,4546,4413,527,-1128,-656,-555,-103,2386,2700,823,3297,1245,176,-104,1593,1393,4469,5378,-2530,95,-104,2306,5465,1972,2738,-1648,-39,-106,-1577,516,1732,-2551,9159,249,-107,-2068,-3297,3373,6505,2553,714,-108,4098,-3374,-7007,-4261,1040,-66,-107,-5890,-3579,-9151,-11024,6155,-62,-104,1560,2410,-8935,-3697,5864,118,-104,4962,-5515,-837,-3367,14,-104,-104,-103,-884,4224,-1008,-3187,33,-104,6051,-1958,8228,-7934,-5693,752,-105,-106,560,-903,-84,-980,536,-106,720,143,10573,832,-6491,204,-106,-924,2833,2767,-7261,3805,-106,1056,3625,-3055,-368,10,529,-107,-5118,152,12144,-34,1817,-107,-106,-1188,4938,-4546,-564,3462,-12,-105,4785,-2044,-1573,-1636,-130,57,-103,-5076,3608,-3884,2367,3664,363,-100,6663,-2476,1240,-423,2205,-22,-101,-1722,-558,1381,-3554,1432,-641,-100,1847,3495,493,801,5076,-131,-100,-5089,4231,4024,563,7734,-252,-102,4027,1294,-2567,1233,-2879,353,-102,4976,2039,-15107,926,10362,-114,-104,-2922,273,613,158,-3629,-25,-104,4136,-819,2432,-1564,1103,-36,-104,-2226,4569,388,7251,-338,636,-105,-399,-3660,-3194,-884,4902,-259,-106,2933,1213,-8710,-899,-4745,-104,-104,651,-4117,-15830,122,-652,-119,-102,-6602,7745,-887,1019,-1632,-473,-102,-2482,-2656,-1104,4057,-4738,-48,-102,-1317,345,1269,-334,-324,-63,-102,7116,2854,5114,-1295,4336,-185,-100,-2185,-1089,1519,-4391,1321,6,-100,-2823,-535,-1270,-4428,2213,-70,-100,-1154,385,-304,-3429,-15282,-220,-98,-847,-1989,6301,-696,9,-184,-98,-5073,1394,-3854,4473,915,-109,-97,-7233,1002,-1410,-622,382,411,-97,-906,-678,-1117,4099,1549,84,-97,4076,-2148,-10765,3866,-112,-97,-97,1872,2987,-1038,3453,-225,-66,-98,-3601,-4771,1678,-2736,2365,42,-98,138,3497,-11184,7403,4066,1592,-97,-98,1101,-4590,4371,6514,-87,-99,3344,2587,1342,1690,5669,139,-100,-977,3548,123,4484,-2576,-101,-100,4906,-872,-2107,3343,5394,-17,-101,-2013,-2069,-677,3128,-3177,357,-102,-1354,-18272,7796,-2361,-6470,-189,-100,5936,-5038,819,1,3946,-80,-96,2248,-5131,-692,-966,-1791,101,-96,-3079,3749,8241,-3153,-257,-246,-96,-2816,-495,-951,6298,1069,-297,-96,-729,-2028,3116,595,-986,-97,-719,-4709,-906,1720,-8127,15,491,2309,-4223,-1951,52,-209,-96,-392,542,4900,196,-989,-97,-96,3253,351,-1362,-711,1862,-1,-97,-617,-1407,3507,715,-5114,-74,-96,2637,774,4920,-102,784,12,-97,3155,107,1672,-599,86,132,-98,-2284,-5007,4272,33861,3523,-19,-102,3765,1613,6135,1387,697,-230,-102,-4256,-788,-208,-3732,1261,-102,-102,1102,-2212,-5351,-6469,5201,-44,-101,-781,1928,2245,-323,-1738,-139,-102,1155,-861,-2621,-1700,2564,-102,-103,-3840,3186,1224,54,1141,-87,-103,-874,-7076,892,2101,-1105,-195,-102,-4450,-614,3145,7807,-13234,-502,-102,10281,4799,-1293,-4558,1805,-193,-102,-2424,-7198,3114,-398,3630,-233,-104,3785,2239,890,-3382,385,-47,-97,-2847,2858,-1733,-1468,259,-240,-97,3180,1595,-2374,-1568,-4989,-7,-96,-6198,2588,1821,-2250,-1179,42,-96,-2802,1348,-2276,-2912,-1436,-132,-94,210,-3566,-700,-2687,-2749,27,-94,-6,-1075,-3165,-3734,-727,163,-93,4850,2320,112,-4813,-593,32,-94,-7105,7641,2701,-1630,456,-133,-93,-1995,-6821,-6249,1320,359,-188,-92,-3106,-2309,3066,-5466,1666,-54,-92,-3582,-350,-5872,-14136,11932,-135,-90,5565,-6836,-906,-3182,-3135,-331,-89,6505,-2449,-2187,-5843,-349,-107,-90,-100,-5269,205,78,5401,-185,-89,-2991,-672,5816,1290,889,-51,-90,3195,-6639,-1180,4853,491,-102,-89,-1217,-4726,-6711,1413,-977,-201,-88,216,-1263,4484,-748,1570,207,-88,-251,-1361,-6630,-8229,-1447,55,-87,-3464,2343,-9538,-2166,-517,2,-83,1645,2843,-9873,-5571,192,46,-82,-1334,-53,178,691,9419,39,-82,-100,-166,-6830,-7112,3064,-94,-81,3651,475,-421,563,-5218,-255,-82,6387,8676,17203,2894,6907,-273,-87,-4280,1447,-667,537,-1449,278,-87,1773,2411,6306,-4922,1607,311,-88,-2592,-148,-600,-1354,-1311,53,-87,-734,1288,-1234,147,2162,-210,-87,4187,3589,367,1944,4889,-458,-89,-2246,-2057,-929,3686,-3741,-185,-88,1987,6502,2230,1925,3232,16,-90,-1760,-2824,5115,-2306,-4302,-62,-91,8804,-3799,4075,-1873,-3635,-95,-92,4116,-4077,-5456,1710,1427,84,-92,1434,651,467,31,518,217,-93,-2583,1951,3558,2831,1680,33,-93,2249,-373,3946,-433,-818,198,-94,-146,2359,-4307,1794,1997,-94,-94,2492,4809,142,464,757,-95,-95,-5602,-2467,-5020,-6279,6980,-127,-94,-4205,-1539,1869,3809,8207,-147,-95,-2531,-1074,782,6282,1200,-95,-95,-450,1599,-2478,2286,-3081,49,-95,-4753,227,4117,-2996,1194,86,-95,3472,1265,-533,-4593,0,3306,-86,-855,-194,6125,5248,177,-20,-86,-2451,-1327,-1797,-3689,453,-202,-85,2448,1080,416,3034,2008,-28,-90,-4648,-3213,-795,3727,-1275,-117,-90,-4676,-16,-2795,5104,2174,-188,-89,-2245,934,5748,-2542,7069,-112,-98,907,691,-4831,1056,-725,-98,-98,-3409,2724,-1724,1825,-1430,-448,-98,607,-820,307,-1111,-3028,-125,-98,1708,345,1872,-1709,-2088,-96,-97,-3506,-4270,-377,-1109,1825,-40,-96,-2242,2211,759,221,-851,-23,-96,-1986,4846,3230,1312,2542,-150,-97,277,527,3596,5156,-1840,33,-101,5974,2055,3871,4380,1912,-161,-103,-3648,-1673,-2519,-4675,-278,-206,-101,2364,1622,-2011,2652,3377,-102,-102,-1569,620,2944,79,-133,-48,-103,-5583,382,2712,6242,-4351,-118,-104,2780,-377,-777,-4099,816,-10,-104,3066,686,3886,2282,-2526,-320,-105,139,1741,589,-2624,2083,-104,-105,1132,4196,-2308,3488,3392,193,-106,-325,-1722,811,2270,516,-35,-106,2377,-3709,-414,2120,-310,-176,-107,-107,-1814,626,1665,2103,-141,-106,1983,-1455,1756,-1537,-1776,-159,-106,6227,1240,448,1301,1495,-222,-107,429,-434,385,-609,3600,-174,-108,913,-2265,2848,8708,11142,48,-109,12009,-4356,-1627,-6636,-2051,122,-109,3134,563,4875,-320,177,292,-110,-4502,-1546,-237,3333,-2653,-99,-109,-5195,2699,954,5616,-515,-313,-110,-843,1979,941,-4282,1098,-584,-110,-13,-1479,623,-2703,-800,-101,-109,-28398,-16486,84,-6553,-12337,-112,-103,-4482,6430,3409,-2587,-23575,-578,-100,-72613,14437,-23043,-73903,19316,1014,-88,-44295,7793,-20336,-19379,15001,-128,-81,-24129,23535,19125,3867,-682,-156,-85,-2720,14545,-6300,-3897,8252,-72,-85,28843,24491,-2813,7481,338,-44,-91,-517,2649,-13830,-4286,5013,-90,-90,-2299,-14308,3946,5453,-2463,591,-89,3034,11467,2074,-2412,-532,-90,-90,-11658,3610,628,1744,6039,136,-90,707,3738,-2264,-1450,3692,36,-91,8732,1268,-4608,3991,-7114,-210,-91,2954,9958,4847,446,5206,-26,-93,4162,4445,8015,7885,-767,-96,-97,4164,-5454,219,-5172,-7542,-40,-95,-5829,2691,1144,-6956,4985,-743,-94,1674,-2318,-5357,-7597,-1118,196,-93,750,4708,-850,3792,-1918,17,-100,3996,-1131,-524,-74,-155,-24,-101,2508,-2714,2970,-1095,-1143,-159,-100,-3878,3055,-1179,-1878,-2566,66,-99,-218,-1096,1145,-2192,-1853,139,-99,1491,1197,2249,-1707,790,228,-96,8075,12706,1545,-1433,-3402,-997,-98,-1067,1066,-234,2160,-54,340,-98,450,596,2785,3479,-7077,-98,-98,-2016,340,-647,1010,-9567,-231,-97,1471,-1610,5894,-2978,3620,-176,-97,-406,3642,1130,-6713,1751,-87,-97,-5376,2445,4036,2009,-7692,36,-97,5185,-7331,2645,2322,-5115,-59,-97,3562,-2551,-2222,-71,-409,-405,-96,-3099,-2824,5918,-1784,2687,-101,-97,-2881,-2490,2152,1217,-2317,-96,-95,-10149,-447,-6268,-4393,3968,-156,-94,3861,5585,2313,4693,-6793,-447,16530,2971,8100,-1704,-3676,-114,-97,8336,1324,765,1222,-235,-136,-99,7504,148,4365,2657,-107,-209,-99,2786,-2377,7878,-926,4641,112,-101,2956,-3343,3060,1186,-4362,202,-100,-1764,-1446,330,1801,5017,-150,-101,-8330,4799,3514,379,263,12,-101,7339,1277,-454,-546,-1670,-102,-101,5507,5353,605,8730,11302,-592,-105,792,10017,-94,3529,-162,707,-106,-2181,156,-3,-7299,921,-127,-105,-4407,4184,1383,-275,-3811,-131,-105,4496,-1325,3279,3230,-2050,303,-105,3414,-385,1876,-2338,1789,-205,-107,3080,4825,147,-380,-858,-174,-108,-2968,1480,3022,-1888,-4139,206,-108,4982,620,1661,-831,-1248,509,-109,1087,4179,-3133,1127,2461,-232,-110,-345,-3381,-1531,-2334,-971,-152,-105,-5702,43,-2695,-2571,587,-79,-104,1570,1719,2212,1966,421,68,-105,664,-659,3450,4055,374,294,-106,-331,2853,1578,-546,1487,-267,-106,1912,784,-5163,-703,2481,-101,-106,4315,861,-2121,2161,153,-106,-107,4054,910,4343,2681,2608,-139,-108,5501,-5334,5257,-4437,3209,97,-109,4411,1459,1508,4549,979,-153,-109,4483,-1884,3702,-3308,355,266,-111,45,4718,4470,1046,1568,-135,-112,-964,-456,2646,356,4912,269,-112,-644,1267,4667,-2753,-1089,-112,-112,-5093,-3482,1275,1833,2248,-32,-112,-2297,-4666,-3772,1921,226,-85,-111,1060,-3137,4153,-3272,-1547,-370,-111,-1105,1159,-2497,834,-2246,-550,-110,-9804,2444,-814,1934,4127,-307,-110,1210,1382,3168,9400,-798,351,-111,6845,4052,-213,-245,2232,47,-113,5482,1300,-636,867,-639,-85,-113,1432,1734,3299,-7918,-959,60,-113,-319,2389,51,2356,429,-139,-113,3446,-537,-1215,2990,1592,88,-114,-714,1976,-4547,-5670,951,110,-114,1013,-2098,-1823,-650,-6394,-43,-112,-14166,3602,8996,8034,-822,-164,-113,4096,-3603,4816,625,2805,-699,-114,-1449,2242,-2952,3060,-2234,-257,-114,678,1047,1927,2529,-88,0,-114,1441,1417,1335,-4004,7550,-801,-117,-4243,7549,-2304,4622,-5220,-843,-114,729,1321,3159,1349,2495,-24,-114,2657,-6098,1446,5237,-774,-141,-116,-617,1237,1648,2564,-3231,-269,-116,-254,-1228,6500,-45,-7601,-127,-116,-2420,-7456,2966,151,-792,-227,-116,-1014,7855,-3018,3958,-665,111,-116,-2055,716,-1389,4872,-1553,-329,-116,-6053,7168,1209,1178,1271,-9,-117,7314,5742,1529,-6177,-571,463,-117,11721,6160,5321,-2151,3685,-119,-120,1704,5457,1080,2446,6928,-133,-121,-88,418,4810,-88,-9919,-237,-120,-28452,-3343,10218,-3061,-2137,38,-118,4052,5310,1841,-6154,-2564,-31,-117,3454,30,2337,2690,-3531,-271,-118,-20127,12193,5306,-6791,-3802,-231,-116,-5398,-16610,-4388,-60731,34662,-179,-111,-30614,3018,5535,5872,-20495,367,-108,-21164,-3330,14592,1875,5879,-295,-108,7052,3710,22526,5230,7493,83,-112,11734,7954,-6834,-8324,6606,-154,-113,5123,12992,-3422,-903,5371,175,-115,3463,1756,-1736,-4447,7350,215,-116,469,-7047,-4392,1321,-743,-442,-114,-514,1855,4008,1496,-1566,-115,-115,-3557,228,-1213,1124,-3779,23,-115,685,-2767,7965,-5608,-7218,594,-114,-6556,-9640,-597,-14936,12178,53,-112,-56,7212,-3325,-1950,6207,172,-113,2488,-7270,-282,-3875,1683,-237,-113,13763,-3178,974,5978,-517,429,-116,10708,1043,2224,-517,-3143,-117,-118,-27287,458,-947,-1208,-8703,407,-114,-934,352,-4871,6144,-1589,-168,-114,8624,-1487,-4777,-9669,-113,42,-114,-171,-3453,-1767,4903,-1379,-265,-113,4329,-4785,-5639,-1153,376,-267,-113,-923,104,4024,939,3569,-315,-113,2796,1951,2316,7012,-5831,1,-114,2773,-9225,7540,1950,3667,-105,-117,3181,2461,1658,5891,2294,-10,-116,-360,1338,-4055,2317,-2112,231,-115,-791,-5549,-578,-2687,1995,-87,-115,-10427,3470,-1901,-5789,-3186,-232,-112,-4856,588,-16228,0,3081,-705,-111,6540,5355,-10605,5675,-4552,21,-111,-6364,-4860,-5518,-3457,-7234,-67,-109,-15113,-6142,-17579,-6554,3869,111,-106,-3059,9876,1516,4547,3126,-6,-107,-6954,-267,1128,-6618,8423,144,-106,-4400,5061,-3117,273,80,606,-107,-3139,2141,10344,10633,-2271,-57,-109,6035,449,-3743,-8156,572,6,-108,-4720,1097,-909,11766,7032,-215,-109,3596,5793,1034,3494,3329,-134,-111,-1860,-5505,-315,-2716,-1454,-141,-109,-5933,4805,12,6273,4060,-180,-111,2461,450,1496,3995,3273,4,-111,-1518,-1148,-3220,-781,-4734,-457,-109,-5033,5004,5053,-1491,855,-611,-109,-353,-197,804,-178,-2262,-118,34,3762,7618,-928,6817,109,-109,-109,13726,4489,1692,11265,9574,901,-113,-10978,-832,253,-5449,3436,-109,-113,-8,4779,-1092,6577,-4082,-112,-112,-2576,4019,14054,11286,-9690,1859,-120,-2217,11033,-2958,-7808,-1442,4216,-121,5540,1282,2993,-7567,-4107,5604,-121,2183,-21965,-4206,3270,-4470,3616,-119,1403,-1000,-9544,5447,19906,-936,-120,5983,-11367,1179,-6955,-11811,-2686,-118,15,3970,-6184,30439,-11967,-2408,-120,5851,2224,-19811,4286,-4366,11896,-119,2316,-5090,7497,5048,9852,957,-121,5946,-2779,-2280,265,2363,1877,-121,-2386,0,-5438,12452,-9130,-121,-120,2129,247,4475,-3508,1605,-121,-121,84,-21636,-7373,16374,8513,5717,-122,22,-13072,-5204,-14444,12811,5302,-119,1218,-7931,12960,-2010,381,3614,-118,1998,-4931,11369,14882,-1048,392,-120,336,-11448,-4239,8133,20427,-1789,-121,-218,562,-7319,13763,14237,-123,-124,-3528,2539,-5324,2597,-634,-4620,-122,10179,7707,-348,13350,-4575,-15622,-123,-214,-1752,-7399,6064,-14192,11032,-122,-6494,5571,-4295,4877,12232,5659,-124,-596,-4354,-1704,-10507,-6901,1038,-122,3962,498,7179,6272,-16610,-4112,-122,1735,7610,2219,-1718,6624,7489,-124,4395,5573,7554,-8297,5458,12122,-129,444,-7126,-9627,-1594,524,-1621,-128,13040,-10952,-5744,-2432,-5955,1520,-129,8229,-5005,-7448,-5151,-42,3432,-128,6226,-9223,15275,-6066,4998,3320,-129,6834,15448,4287,-10221,3592,2525,-131,-54,-386,1007,-2588,5415,-132,-131,5695,-9592,3577,7047,-13313,7725,-122,714,-4916,-16650,-17091,5725,-1346,-119,3274,-15209,2370,12613,-2407,-6168,-118,-660,-6827,13395,-4067,9915,-4144,-118,5298,8409,-2366,-6207,-9497,10279,-119,12568,-3546,-17998,-2602,-12221,-3617,-117,-2476,7573,-24404,-6551,-3615,-195,-114,15825,-19,6512,28630,-3902,-4544,-117,2029,440,6566,-6802,13025,773,-118,-1995,20449,-2339,-10813,3044,-2511,-119,7796,-7062,2137,4444,1342,-1786,-120,-2345,-2963,-740,1394,10638,5947,-122,-7114,463,196,12518,4935,-122,-122,4323,5641,8992,3436,-13810,-3105,-122,7441,9979,-20289,13743,-3201,-4403,-124,-123,6087,-393,-3456,-8462,6885,-123,-123,-5339,2907,316,-2111,3403,-122,16701,-1608,4575,-624,-1953,5725,-125,-126,-6134,2176,12428,16582,-127,-127,2971,1990,3724,4408,-16,2436,-129,9546,6512,-23388,16634,20292,-8406,-131,-5011,17865,8668,-3622,6692,-1854,-133,106,-18806,10284,17169,-10651,-3204,-133,-133,-7128,42,26797,-2539,1095,-134,-6418,-661,-2928,10865,7144,1520,-135,-3353,-18634,6290,8423,-10921,-4566,-133,942,15755,-48,-5716,-9358,3571,-133,7967,7244,15577,4339,-9435,10055,-136,-5926,-6233,7632,5980,613,2212,-136,-1628,-2691,-1407,-19278,5198,1165,-134,-1254,4254,-14633,9298,-2565,8649,-134,-16464,603,-4618,-2836,-17335,3037,-133,12472,20627,-8160,-9195,9821,578,-135,268,-20324,-1868,9406,20194,-136,-135,14674,-2337,-7202,4694,6429,-6044,-136,-147,5466,17484,-6105,-3432,2538,-137,824,433,-2270,-4996,2226,-135,-135,-136,2140,-13027,-11303,16629,-4437,-135,2933,5747,13507,831,-564,-4218,-136,3296,20867,12618,-1708,-233,12224,-140,9715,1971,-891,-6532,-788,-140,-141,-4329,5035,3555,6666,-7730,-1297,-140,4179,726,8252,-3887,4136,-3210,-141,137,-1180,18290,-19188,1908,-5000,-151,2845,6664,-19306,-17043,-7627,5444,-147,15090,-1077,-29239,-6810,18168,-1243,-147,-1471,-3533,23821,-17623,-21976,-144,-145,-45844,-7942,-4259,34937,6115,1581,-142,157,25094,5167,9796,5359,2160,-146,15222,-9101,323,-17542,9720,1697,-145,-5066,-3015,-10323,277,24620,-102,-146,-145,-27268,318,-5878,-28600,-926,-139,21097,6906,25853,8390,11911,-8714,-146,4608,-6831,-8530,25414,-6159,-1429,-145,2842,8770,-4962,-288,651,-522,-146,6330,-18185,17161,2202,17643,1065,-148],"returnScale":1000000,"returns":[0,4135,938,-112,-88,3934,229,-1703,2595,-12888,-28,-87,-918,-6008,1944,-12273,7494,-62,-86,5042,496,2603,655,521,-75,-87,2370,4652,-704,1824,1380,-59,-79,-2565,8981,-234,-1649,-152,-50,-79,3629,1582,4276,603,4561,-124,-88,1223,-1462,-3113,-3571,5195,-18,-88,-1649,4595,-3893,-2517,4175,-103,-89,-2725,-5481,-3037,-3670,-4668,-77,-87,4,-11707,832,-9228,-588,-94,-77,-11901,-7326,-9196,6948,6886,-464,-84,6735,-3753,-556,-132,-1769,-182,-84,360,7159,-288,47,-1628,-176,-78,8963,1055,5661,1156,-5913,-38,-78,-2489,-3561,-1578,-783,5290,-109,-78,-3139,-1101,788,4450,4496,-119,-79,-3507,1965,456,-1056,4353,124,-79,-2911,-5954,1152,-1020,4340,-198,-78,-6639,1900,2844,3475,-97,15,-79,-1383,-1547,-1989,332,1965,59,-78,-143,157,-1667,3652,3391,-23,-78,3984,-3215,-1885,-3947,4603,1261,-79,7718,-4090,-776,3432,-596,-226,-79,2153,-1468,-2886,-858,-668,5,-79,2963,-10653,2261,-17914,2149,-600,-78,424,1597,4658,785,617,156,-80,1331,-411,5458,-1255,1583,-80,-80,-946,8298,10362,-7009,-3088,-110,-82,-3724,-2801,-1684,2847,-3746,-233,-81,-299,3699,-2815,-352,21,-80,-81,769,-4905,289,386,672,-2,-80,-4790,-3956,4071,8048,-474,-127,-81,2805,-6947,5506,1405,5218,199,-82,-1446,-4228,-64,-4819,-3553,-80,-81,-814,1858,1200,897,-458,-74,-81,-8891,-2781,54,-81,513,-95,-80,-10762,-12111,-7799,-3343,5218,-89,-77,8695,-2434,2065,-576,-3780,-70,-78,-14197,1028,2793,-5319,-7047,-89,-78,-5312,6745,-4163,310,1434,-188,-78,5135,1624,2709,834,2546,-80,-81,-2186,1569,2418,-986,786,-140,-82,-6510,2855,-2038,-389,4542,-826,-83,-2647,-2999,-2980,196,-3955,22,-81,308,4288,-1752,-2383,1786,-36,-82,1173,-2824,-3515,-1833,-7770,-167,-81,-26268,2120,-4360,11976,1263,-79,-79,-5690,-5109,-561,-2752,-1801,200,-76,116,-1577,2755,-501,-6775,-26,-75,2129,-7200,-6281,-5268,-3158,-268,-73,-2032,164,1904,7004,6143,-223,-74,584,-3814,1632,6729,3093,-66,-75,2919,-5413,-2045,336,4102,-389,-75,-1695,-2551,-1844,-1753,2154,-295,-74,1361,1690,1056,-1000,5864,-75,-75,3688,-5701,-2429,827,4127,-102,-75,2363,4884,-5203,1737,1659,-168,-76,-22,794,1070,-287,-5322,75,-75,-11091,3085,791,5014,6027,-79,-77,-1206,1693,-1071,272,2239,79,-77,-7553,2434,607,2989,-2484,49,-76,-2566,-115,-2791,-5772,-1658,-166,-55,-5473,6046,2892,5198,2924,-35,-75,-3027,-1387,1107,791,-671,-233,-76,2588,-381,5168,686,-137,-77,-76,3208,-4626,-2559,-6896,-4924,-63,-76,-2754,-1327,214,-7246,-3036,300,-75,-8305,-1600,-1451,-2597,13652,-57,-75,3196,895,1244,1163,9678,-56,-75,-6435,-1710,-114,-851,-378,-15,-75,-3277,-7404,3193,-6841,-6620,-7,-73,4162,373,1347,906,3972,-61,-74,5023,76,-5897,3525,5007,-84,-75,1979,-1479,1286,-844,5542,-71,-76,2795,6571,-3780,-2372,14854,-202,-79,4411,-5113,1765,1167,1321,-1,-80,-1542,3456,5096,-1510,-534,-60,-81,3483,-538,4681,1945,-5469,134,-81,-2613,-364,1381,-164,175,134,-81,1370,-1492,4009,317,2751,-307,-81,-1029,524,5173,571,-89,-124,-82,64,1011,292,3280,1252,-81,-80,-243,-5327,-5367,2887,1633,140,-79,3327,-2062,-2150,-162,1010,-62,-79,-242,7409,-3566,-81,2689,-45,-80,561,1829,638,396,-142,-1,2329,1029,-6945,-1129,694,-57,-80,499,-1175,1968,1370,-1901,-146,-80,-4711,-6353,2271,-1416,1364,-79,-80,6291,-2819,2343,3739,-17756,-150,-80,-5022,10157,1673,4775,2115,14,-81,-966,4711,4552,3608,2459,-579,-82,-1247,5003,-376,3722,2410,101,-83,-6838,1119,117,485,2536,-215,-81,4238,7253,11149,3834,5446,-143,-86,-3490,-3783,-1161,-2483,-573,-75,-84,4101,2860,2029,-1907,-1288,-35,-85,-1559,-2528,9285,721,3560,-142,-83,-2677,1716,3426,3619,3275,-31,-83,-116,4463,-4233,8291,-888,-13,-84,1722,9,2334,404,4602,-29,-83,-2580,-1323,-1992,2497,532,-154,-84,3221,751,-616,3553,4105,28,-85,-1376,-3329,2835,-6770,-1682,-224,-84,-3801,7740,246,-1,2096,69,-87,1863,-1568,-722,-182,507,33,-86,453,6875,5318,7419,1791,-110,-88,4459,4558,719,-1626,-2042,94,-89,2092,430,-4584,-4254,-2291,-118,-87,-2288,4952,-5600,203,245,-244,-88,-27379,-1209,3982,-1333,9753,-242,-86,1243,-2740,-1608,-1687,4001,-140,-85,-3883,-4697,2115,-2782,-1033,-134,-84,3011,-187,4304,-1551,1216,-14,-85,-1990,747,4432,-4671,-2391,-24,-84,-3269,194,4987,-1993,2559,-178,-86,581,1213,557,543,5134,-71,-86,465,-1400,2895,6485,3482,-88,-87,9385,7993,2199,96,521,130,-90,-2866,226,-2087,3216,-1670,151,-89,148,3810,-1500,3879,4181,-133,-91,1291,-1209,1540,4655,5619,283,-93,4001,3883,464,-993,-577,-488,-91,2100,2376,724,2901,1096,155,-92,1402,1226,3932,4733,-2226,83,-91,2029,4809,1735,2410,-1450,-35,-93,-1388,454,1524,-2244,8059,220,-95,-1819,-2902,2968,5725,2246,629,-95,3606,-2969,-6166,-3750,915,-58,-94,-5183,-3150,-8052,-9701,5416,-55,-91,1373,2120,-7862,-3254,5161,103,-91,4366,-4853,-736,-2963,12,-91,-92,-91,-777,3717,-887,-2805,29,-91,5324,-1723,7241,-6982,-5010,662,-92,-94,493,-794,-74,-863,472,-93,633,126,9304,732,-5712,180,-93,-814,2493,2435,-6389,3348,-93,929,3190,-2688,-324,9,465,-94,-4504,134,10687,-30,1599,-94,-94,-1045,4345,-4000,-497,3047,-11,-92,4211,-1799,-1384,-1440,-114,50,-91,-4467,3175,-3417,2083,3224,319,-88,5864,-2179,1091,-372,1940,-19,-89,-1515,-492,1216,-3128,1260,-564,-88,1626,3075,434,705,4467,-115,-88,-4479,3723,3542,495,6806,-222,-90,3544,1139,-2259,1085,-2534,311,-90,4379,1794,-13294,815,9119,-101,-91,-2571,240,539,139,-3193,-22,-92,3640,-721,2140,-1376,971,-32,-92,-1958,4020,342,6380,-297,560,-93,-351,-3221,-2810,-778,4314,-228,-94,2581,1068,-7665,-791,-4176,-91,-92,573,-3623,-13930,107,-573,-105,-90,-5809,6815,-781,897,-1436,-416,-90,-2184,-2337,-972,3570,-4169,-42,-90,-1159,304,1116,-294,-285,-55,-90,6262,2512,4500,-1140,3816,-163,-88,-1923,-958,1337,-3864,1162,5,-88,-2484,-471,-1117,-3897,1948,-62,-88,-1016,339,-267,-3018,-13448,-193,-87,-745,-1750,5545,-613,8,-162,-86,-4464,1226,-3391,3936,805,-96,-85,-6365,882,-1241,-547,336,361,-85,-797,-597,-983,3607,1363,74,-85,3587,-1890,-9473,3402,-99,-85,-86,1648,2628,-913,3038,-198,-58,-86,-3169,-4198,1476,-2407,2081,37,-86,121,3077,-9841,6514,3578,1401,-85,-86,968,-4039,3847,5732,-77,-87,2943,2276,1181,1488,4988,123,-88,-860,3122,108,3946,-2267,-89,-88,4318,-768,-1854,2942,4747,-15,-89,-1772,-1820,-596,2753,-2796,314,-90,-1191,-16079,6860,-2078,-5693,-167,-88,5224,-4433,720,1,3473,-71,-84,1978,-4515,-609,-850,-1576,89,-85,-2709,3299,7252,-2775,-226,-217,-84,-2478,-436,-837,5543,940,-261,-84,-642,-1785,2742,524,-868,-85,-633,-4144,-797,1514,-7152,13,432,2032,-3716,-1717,46,-184,-84,-345,477,4311,173,-870,-86,-84,2862,309,-1198,-626,1639,-1,-86,-543,-1238,3086,630,-4501,-65,-84,2320,681,4330,-90,690,11,-86,2777,94,1471,-527,76,116,-86,-2010,-4406,3759,29797,3101,-17,-90,3313,1420,5398,1221,613,-202,-90,-3745,-694,-183,-3284,1110,-90,-90,970,-1946,-4709,-5693,4577,-39,-89,-687,1697,1975,-284,-1529,-123,-89,1016,-758,-2306,-1496,2256,-90,-90,-3379,2803,1077,48,1004,-77,-90,-769,-6227,785,1849,-973,-171,-90,-3916,-540,2767,6870,-11646,-441,-90,9047,4223,-1138,-4011,1589,-170,-90,-2133,-6334,2740,-350,3194,-205,-91,3331,1970,783,-2976,339,-42,-85,-2505,2515,-1525,-1292,228,-211,-86,2799,1403,-2089,-1380,-4390,-6,-85,-5454,2278,1602,-1980,-1038,37,-84,-2466,1186,-2002,-2563,-1264,-116,-82,184,-3138,-616,-2364,-2419,23,-82,-6,-946,-2785,-3286,-639,143,-82,4268,2042,98,-4235,-522,28,-82,-6253,6724,2377,-1434,401,-117,-82,-1756,-6002,-5499,1162,316,-166,-81,-2733,-2032,2698,-4810,1466,-47,-81,-3153,-308,-5167,-12439,10500,-119,-79,4897,-6016,-797,-2800,-2759,-291,-79,5725,-2155,-1925,-5142,-307,-94,-79,-88,-4637,181,68,4753,-163,-78,-2632,-591,5118,1135,782,-45,-79,2812,-5843,-1038,4270,433,-90,-79,-1070,-4159,-5906,1244,-860,-177,-78,191,-1112,3946,-658,1381,182,-77,-221,-1198,-5834,-7241,-1274,49,-77,-3048,2062,-8394,-1906,-455,2,-73,1448,2502,-8689,-4902,169,40,-72,-1174,-46,156,608,8289,34,-72,-88,-146,-6010,-6259,2697,-83,-71,3212,418,-370,495,-4591,-225,-72,5621,7634,15139,2546,6079,-241,-76,-3767,1274,-587,472,-1275,245,-77,1561,2121,5549,-4331,1414,274,-78,-2280,-131,-528,-1191,-1154,47,-77,-646,1134,-1086,129,1903,-185,-77,3685,3158,323,1711,4302,-403,-78,-1977,-1810,-817,3243,-3292,-163,-77,1749,5721,1963,1694,2844,14,-79,-1549,-2485,4501,-2029,-3786,-55,-80,7748,-3343,3586,-1649,-3198,-84,-81,3622,-3588,-4801,1505,1256,74,-81,1262,572,411,28,455,191,-81,-2273,1716,3131,2492,1478,29,-82,1979,-328,3473,-381,-720,174,-83,-128,2076,-3790,1578,1758,-83,-83,2193,4232,125,408,666,-83,-84,-4930,-2170,-4418,-5525,6142,-112,-83,-3700,-1354,1644,3352,7222,-129,-84,-2227,-945,688,5528,1056,-83,-84,-396,1407,-2180,2011,-2711,43,-83,-4183,200,3623,-2637,1051,76,-84,3055,1113,-469,-4041,0,2909,-76,-752,-171,5390,4618,156,-18,-75,-2157,-1168,-1581,-3247,399,-178,-74,2154,950,366,2670,1767,-24,-80,-4090,-2827,-700,3280,-1122,-103,-79,-4115,-14,-2460,4492,1913,-166,-78,-1976,822,5059,-2237,6220,-98,-87,799,608,-4252,930,-638,-87,-86,-3000,2397,-1517,1606,-1258,-394,-87,535,-722,270,-977,-2665,-110,-86,1503,303,1648,-1504,-1838,-84,-86,-3085,-3757,-332,-976,1606,-35,-85,-1973,1946,668,194,-748,-21,-84,-1748,4265,2842,1155,2236,-132,-85,244,464,3164,4537,-1619,29,-89,5257,1809,3406,3854,1683,-142,-90,-3210,-1473,-2216,-4114,-245,-181,-89,2080,1427,-1769,2334,2971,-89,-90,-1381,546,2590,70,-117,-42,-91,-4913,336,2387,5493,-3829,-104,-92,2447,-332,-684,-3607,718,-9,-91,2698,604,3419,2008,-2222,-282,-92,122,1532,518,-2309,1833,-91,-93,996,3693,-2031,3069,2985,170,-93,-286,-1516,714,1998,454,-31,-93,2091,-3264,-364,1866,-273,-155,-94,-94,-1597,551,1466,1850,-124,-93,1745,-1281,1546,-1353,-1563,-140,-93,5480,1091,394,1145,1316,-196,-94,378,-382,339,-536,3168,-154,-95,804,-1993,2506,7663,9805,42,-96,10568,-3833,-1432,-5840,-1805,108,-96,2758,495,4290,-282,156,257,-97,-3961,-1361,-208,2933,-2335,-87,-96,-4572,2376,839,4942,-453,-276,-96,-742,1741,828,-3768,967,-514,-97,-12,-1301,548,-2379,-704,-88,-96,-24990,-14508,74,-5766,-10857,-98,-91,-3944,5658,3000,-2277,-20745,-509,-88,-63899,12705,-20278,-65034,16998,892,-77,-38979,6858,-17896,-17053,13200,-112,-71,-21234,20711,16830,3403,-601,-137,-75,-2393,12799,-5544,-3429,7262,-64,-75,25382,21552,-2476,6584,297,-39,-80,-455,2331,-12170,-3771,4411,-79,-79,-2024,-12590,3472,4799,-2168,520,-78,2670,10091,1825,-2123,-468,-79,-79,-10259,3177,552,1535,5314,120,-79,622,3289,-1992,-1276,3249,31,-80,7684,1116,-4055,3512,-6260,-185,-80,2600,8763,4265,392,4582,-23,-82,3662,3912,7053,6939,-675,-85,-85,3664,-4799,193,-4552,-6637,-35,-83,-5130,2368,1007,-6121,4386,-653,-83,1473,-2040,-4714,-6685,-984,172,-81,660,4143,-748,3337,-1688,15,-88,3516,-995,-461,-65,-137,-21,-89,2207,-2388,2613,-963,-1006,-140,-88,-3412,2688,-1038,-1652,-2258,58,-87,-192,-965,1008,-1929,-1631,123,-87,1312,1053,1979,-1502,695,201,-85,7106,11181,1360,-1261,-2994,-877,-86,-939,938,-206,1901,-48,299,-86,396,525,2450,3062,-6228,-86,-86,-1774,299,-570,889,-8419,-203,-85,1294,-1417,5187,-2621,3186,-155,-85,-358,3205,995,-5908,1541,-76,-86,-4730,2151,3552,1768,-6769,31,-85,4563,-6451,2327,2044,-4502,-52,-85,3135,-2245,-1956,-62,-360,-356,-85,-2727,-2485,5208,-1570,2364,-88,-86,-2535,-2191,1893,1071,-2039,-84,-84,-8931,-393,-5516,-3866,3492,-137,-83,3398,4915,2035,4130,-5978,-393,14546,2614,7128,-1499,-3235,-100,-86,7336,1165,673,1076,-207,-120,-87,6603,131,3841,2338,-94,-184,-87,2451,-2091,6932,-815,4084,99,-89,2601,-2941,2692,1044,-3839,178,-88,-1552,-1273,291,1585,4415,-132,-89,-7331,4223,3093,333,232,10,-89,6459,1123,-399,-481,-1469,-90,-89,4846,4711,532,7683,9945,-521,-92,697,8815,-83,3105,-142,622,-93,-1919,137,-3,-6423,811,-112,-93,-3878,3682,1217,-242,-3353,-116,-92,3956,-1166,2886,2842,-1804,267,-93,3005,-339,1651,-2058,1575,-181,-94,2711,4245,130,-335,-755,-153,-95,-2612,1303,2659,-1661,-3643,182,-95,4384,545,1462,-731,-1098,447,-95,956,3678,-2757,991,2166,-204,-97,-304,-2975,-1347,-2054,-854,-134,-93,-5017,38,-2372,-2262,516,-69,-92,1382,1512,1947,1730,370,60,-92,584,-580,3036,3569,329,258,-93,-291,2510,1389,-480,1308,-235,-93,1682,690,-4543,-619,2184,-89,-94,3798,757,-1866,1901,135,-93,-94,3567,801,3822,2359,2295,-122,-95,4840,-4693,4626,-3905,2824,85,-95,3881,1284,1327,4003,862,-135,-96,3945,-1658,3258,-2911,312,234,-97,39,4152,3934,920,1380,-119,-98,-849,-401,2328,314,4322,237,-99,-566,1115,4107,-2423,-958,-99,-98,-4482,-3064,1122,1613,1978,-28,-99,-2021,-4106,-3320,1691,199,-75,-98,933,-2760,3654,-2879,-1362,-325,-98,-972,1020,-2198,734,-1976,-484,-97,-8627,2150,-716,1702,3632,-271,-96,1064,1217,2787,8272,-702,309,-98,6024,3566,-188,-215,1964,41,-99,4824,1144,-560,763,-562,-75,-100,1261,1525,2904,-6968,-844,53,-100,-280,2102,45,2073,377,-122,-99,3032,-472,-1070,2632,1401,77,-100,-629,1739,-4001,-4990,837,97,-100,891,-1846,-1604,-572,-5627,-38,-98,-12466,3169,7917,7070,-724,-144,-99,3604,-3171,4238,550,2469,-615,-101,-1275,1973,-2598,2693,-1966,-226,-100,596,922,1696,2225,-77,0,-101,1268,1247,1175,-3523,6644,-705,-103,-3734,6643,-2028,4068,-4594,-742,-100,642,1162,2780,1187,2196,-22,-100,2338,-5366,1273,4608,-681,-124,-102,-543,1088,1451,2256,-2843,-237,-102,-224,-1080,5720,-40,-6689,-111,-103,-2129,-6561,2610,133,-697,-200,-102,-893,6913,-2656,3483,-585,97,-102,-1808,630,-1222,4287,-1367,-289,-102,-5327,6308,1064,1037,1118,-8,-103,6436,5053,1346,-5436,-502,407,-103,10315,5420,4683,-1893,3243,-105,-106,1500,4802,950,2153,6096,-117,-106,-78,368,4233,-77,-8729,-209,-105,-25038,-2942,8992,-2693,-1881,33,-103,3565,4673,1620,-5415,-2257,-27,-103,3040,26,2057,2367,-3108,-238,-104,-17711,10729,4670,-5976,-3346,-203,-103,-4750,-14616,-3862,-53442,30502,-158,-97,-26940,2655,4871,5167,-18035,323,-95,-18624,-2931,12841,1650,5174,-260,-95,6206,3265,19822,4603,6593,73,-98,10326,6999,-6014,-7325,5813,-135,-100,4509,11432,-3011,-795,4727,154,-101,3047,1545,-1527,-3914,6468,190,-103,413,-6201,-3865,1162,-653,-389,-101,-452,1632,3527,1317,-1378,-101,-102,-3130,201,-1068,990,-3326,20,-101,603,-2435,7009,-4935,-6352,523,-100,-5769,-8484,-525,-13143,10716,47,-99,-49,6346,-2926,-1716,5462,152,-100,2190,-6398,-248,-3410,1481,-208,-100,12112,-2797,857,5261,-455,377,-102,9423,918,1957,-455,-2766,-103,-104,-24012,403,-833,-1063,-7659,358,-100,-822,310,-4287,5407,-1398,-148,-100,7589,-1309,-4204,-8508,-100,37,-100,-150,-3039,-1555,4315,-1214,-233,-100,3810,-4211,-4962,-1015,331,-235,-99,-813,92,3541,826,3141,-277,-100,2461,1717,2038,6170,-5131,1,-100,2440,-8118,6635,1716,3227,-92,-103,2799,2166,1459,5184,2018,-9,-102,-316,1177,-3568,2039,-1859,203,-101,-696,-4883,-509,-2364,1755,-76,-101,-9176,3054,-1673,-5095,-2803,-204,-99,-4273,517,-14280,0,2711,-620,-98,5755,4712,-9332,4994,-4006,19,-98,-5600,-4277,-4856,-3042,-6366,-59,-95,-13300,-5405,-15469,-5767,3404,98,-93,-2692,8690,1335,4001,2751,-6,-94,-6119,-235,993,-5824,7412,127,-94,-3872,4454,-2743,240,71,533,-94,-2762,1884,9102,9357,-1998,-50,-96,5310,395,-3293,-7178,504,5,-95,-4153,965,-800,10354,6188,-189,-96,3164,5098,910,3075,2929,-118,-97,-1637,-4845,-277,-2390,-1279,-124,-96,-5221,4228,11,5520,3573,-159,-97,2165,396,1317,3515,2880,4,-98,-1336,-1010,-2833,-688,-4166,-402,-96,-4429,4404,4446,-1312,753,-538,-96,-310,-174,708,-157,-1990,-104,30,3310,6704,-817,5999,96,-96,-96,12079,3950,1489,9913,8425,793,-99,-9661,-732,223,-4795,3023,-96,-99,-7,4205,-961,5788,-3592,-99,-98,-2267,3537,12367,9932,-8527,1635,-105,-1951,9709,-2603,-6871,-1269,3710,-106,4875,1128,2634,-6659,-3614,4931,-106,1921,-19329,-3702,2878,-3934,3182,-104,1234,-880,-8398,4793,17517,-824,-105,5265,-10003,1038,-6121,-10393,-2364,-104,13,3494,-5442,26786,-10531,-2119,-105,5148,1958,-17434,3772,-3842,10468,-105,2038,-4479,6597,4443,8669,842,-106,5232,-2445,-2006,233,2079,1652,-107,-2099,0,-4786,10958,-8034,-107,-105,1873,217,3938,-3087,1413,-107,-106,74,-19040,-6488,14409,7491,5031,-107,19,-11503,-4579,-12711,11274,4665,-104,1071,-6979,11405,-1769,335,3181,-104,1758,-4339,10004,13096,-922,345,-105,295,-10074,-3730,7157,17975,-1574,-106,-192,494,-6440,12111,12528,-108,-109,-3105,2235,-4685,2285,-558,-4065,-108,8958,6782,-307,11748,-4026,-13747,-108,-188,-1542,-6511,5336,-12489,9708,-107,-5715,4903,-3780,4292,10764,4980,-109,-525,-3831,-1500,-9246,-6073,914,-108,3487,438,6318,5519,-14617,-3618,-108,1527,6697,1953,-1512,5829,6590,-109,3868,4904,6647,-7301,4803,10667,-113,390,-6271,-8471,-1403,461,-1426,-113,11475,-9637,-5055,-2140,-5241,1338,-114,7242,-4404,-6555,-4532,-37,3020,-113,5479,-8116,13442,-5338,4398,2921,-113,6014,13594,3772,-8994,3161,2222,-115,-48,-340,886,-2277,4765,-116,-115,5011,-8441,3148,6201,-11715,6798,-107,628,-4326,-14652,-15040,5038,-1184,-105,2881,-13384,2086,11099,-2118,-5428,-104,-580,-6008,11787,-3578,8725,-3647,-104,4662,7400,-2082,-5462,-8357,9045,-105,11060,-3120,-15838,-2290,-10754,-3183,-103,-2179,6664,-21475,-5765,-3181,-172,-100,13926,-17,5730,25195,-3434,-3999,-103,1786,387,5778,-5986,11462,680,-104,-1755,17995,-2058,-9516,2679,-2210,-105,6861,-6215,1881,3911,1181,-1572,-106,-2063,-2608,-651,1227,9361,5233,-107,-6260,407,173,11015,4343,-107,-107,3804,4964,7913,3023,-12152,-2733,-107,6548,8781,-17854,12094,-2817,-3875,-109,-108,5357,-346,-3041,-7447,6059,-108,-109,-4698,2558,278,-1857,2994,-107,14697,-1415,4025,-549,-1718,5038,-110,-111,-5398,1915,10936,14592,-111,-112,2614,1751,3278,3879,-15,2144,-113,8400,5730,-20581,14638,17857,-7397,-116,-4409,15721,7627,-3187,5889,-1631,-118,94,-16549,9049,15109,-9373,-2819,-117,-117,-6273,37,23581,-2234,963,-117,-5648,-582,-2577,9562,6286,1338,-119,-2951,-16397,5535,7412,-9610,-4018,-117,828,13865,-43,-5030,-8234,3142,-117,7011,6374,13708,3818,-8302,8848,-120,-5215,-5485,6717,5262,539,1947,-120,-1432,-2369,-1238,-16964,4574,1025,-118,-1103,3743,-12877,8183,-2258,7611,-117,-14489,531,-4064,-2495,-15255,2672,-117,10976,18151,-7181,-8091,8642,509,-119,236,-17885,-1644,8277,17771,-120,-118,12912,-2056,-6338,4131,5657,-5318,-120,-129,4810,15385,-5372,-3020,2233,-120,725,381,-1998,-4396,1959,-119,-119,-119,1883,-11464,-9946,14633,-3905,-118,2581,5057,11886,731,-496,-3712,-120,2901,18363,11103,-1503,-205,10757,-123,8549,1735,-784,-5748,-694,-123,-124,-3810,4431,3128,5866,-6802,-1141,-123,3677,639,7262,-3421,3640,-2825,-124,120,-1038,16095,-16885,1679,-4400,-133,2504,5864,-16989,-14998,-6712,4791,-129,13279,-948,-25730,-5993,15988,-1094,-129,-1295,-3109,20963,-15509,-19338,-127,-128,-40342,-6989,-3748,30745,5381,1391,-125,138,22083,4547,8620,4716,1901,-129,13395,-8008,284,-15437,8554,1493,-128,-4458,-2653,-9084,244,21665,-90,-128,-128,-23995,280,-5173,-25168,-815,-122,18565,6077,22751,7383,10481,-7668,-128,4055,-6011,-7507,22364,-5420,-1257,-128,2501,7718,-4367,-253,573,-460,-128,5570,-16002,15101,1938,15526,937,-131]}});
\ No newline at end of file
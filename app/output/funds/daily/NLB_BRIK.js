@@ -0,0 +1 @@
+registerFundSeries("NLB BRIK", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1389172,-4366,8097,819,-124,28382,-1473,-2901,-1606,-31265,7861,-114,19210,-860,-16296,-14671,12812,-4753,-114,-4668,7667,-2266,-1029,7490,2140,-115,-15301,26519,-3889,16999,25718,5051,-121,-10419,2167,-9294,-13898,-2471,8289,-119,4711,-11915,7414,-13630,3918,1214,-119,-13211,-2309,2037,4072,39869,8035,-123,-828,-10613,8765,-7641,-15717,-352,-119,-26253,-640,15229,-1464,11578,-3569,-117,-16698,-21368,-16896,-10453,-22767,-1478,-801,-32712,-15968,30052,24825,20567,-343,-112,19909,1156,-1962,-693,1430,3948,-113,5805,-7931,2643,1363,1694,6530,-101,-8681,-5933,21644,25180,3892,-3154,-104,-14844,6952,-2441,20019,19110,8868,-108,-12218,530,32069,19782,-287,33429,-115,-10702,-15759,-27564,-12697,-21350,1023,-107,8541,20630,-1391,-4329,-9320,-3067,-109,2320,9807,-808,21898,22276,-4428,-114,-6281,2014,7084,-5430,-1190,7054,-112,-16102,12633,-10133,6678,8512,6089,-114,-300,-7587,-14495,2698,-6249,10159,-113,-12189,-11968,13942,2477,3307,-111,6856,8844,15974,-4216,6582,-8748,-115,-5304,-14846,-16033,-9952,-492,8590,-110,27376,5389,26610,13055,-6963,-15563,-118,2242,12223,52411,30476,8202,-126,-127,7792,-3062,36764,5551,-44345,-10055,-127,-2813,20756,16824,227,997,-5023,-129,9492,-4164,-23877,-25458,-12743,-117,-118,3566,-4264,-10176,-17488,10268,6510,-116,2932,-2067,-12352,1115,-1394,6113,-99,-12125,1730,15097,4798,11753,-1899,-102,-101,-2587,15455,-15307,-14128,-100,-99,-2076,-1426,-18119,-17406,-17483,6526,-96,-120,1188,1383,-1743,5991,682,-96,-12992,2389,8799,1834,-18164,7002,-95,9633,12053,8440,-10134,-7010,162,-96,-24391,15745,-6001,9169,-1927,-2243,-115,-20578,-15907,-27467,9551,19770,-8808,-104,13427,5465,-4734,11863,14174,-107,-107,-9821,4008,-5641,-9113,-25453,3836,-105,-20287,-10042,14526,-1304,4093,-2006,-103,-13690,3102,-1804,-5865,-1328,-3803,-101,12028,-17357,-23990,-8984,7773,-3956,-99,-5753,-1782,-15161,-17588,-35269,-5516,-91,-51450,7283,1825,46870,7078,-92,-91,-7931,-22585,-706,10998,-23579,4918,-86,-3700,20678,10437,-7818,-8179,-4350,-87,2919,2859,20680,3073,-17029,-5556,-87,-1355,-3160,-7671,-5611,2692,4579,-87,-14194,-1555,14554,1080,13211,-465,-89,25768,-105,20888,868,8809,-6339,-98,-4511,-13782,410,13480,3465,4047,-98,-2829,1139,-13157,13711,11717,-98,-99,-9659,10912,-3691,-11792,10528,-5454,-97,7023,11393,12070,-2878,-5979,843,-96,-6659,-1351,2573,-5365,-17217,-2121,-97,9296,10821,5999,8639,7739,-210,-101,-1841,-1130,-6454,3762,-13069,1768,-103,380,2143,-3799,-8820,-9584,-12043,-92,-9525,-6884,-4808,-10886,-20714,-451,-2035,-2664,17517,8194,5008,-7568,196,-93,2077,-20,12876,1424,-2703,745,-95,-9510,1077,-10218,1928,1947,-93,-93,-20668,-73,-5960,-24115,-6369,-5950,-86,-10119,-3776,-1841,3808,-32183,-757,-82,-3962,13657,-20748,6247,24012,4321,-84,-6915,-133,226,-982,22585,-896,-85,-9984,-19304,-1351,11238,-17840,104,-83,-15672,-8685,1487,-23567,6971,2954,-79,12545,12300,14906,1165,-1668,-619,-85,27089,-13574,-8275,-3435,6937,953,-86,6719,30550,15951,15533,16011,-3927,-93,1199,-16809,2854,-491,23702,-13057,-93,-2495,-14415,12301,21803,-2023,1746,-96,3420,-2749,-14048,-2885,835,-848,3654,1203,15468,-11505,-6879,-2844,-97,-8418,-13431,4307,-8450,15367,-49,-97,12228,12785,29921,1763,-2036,-1993,-101,-8855,14704,-4002,-2141,1745,5562,-102,-16311,5415,5355,-3802,-13436,-100,-100,-9793,-26864,-15343,3230,2584,571,-96,-7727,10822,731,-5420,-10578,2172,-95,10200,-3132,-2518,-12323,9572,-1369,-95,-7883,8966,16856,10297,3005,-107,-98,2267,580,-2836,3443,2960,1939,-99,9866,2106,9736,-13798,-15680,2196,-98,-14837,-6676,10614,-6852,9250,-97,-98,16892,-8926,1187,18137,-41764,18779,-98,-13637,24342,18511,10065,7251,-2185,-113,3172,-14898,-6466,6896,10387,-173,-102,16984,14309,-1551,13148,-6296,1865,-106,5824,-1782,5692,-440,3599,-188,-107,-2013,8727,-1901,-4800,-7646,-1685,-106,-2836,-13131,1805,5325,20294,-1382,-108,6930,8448,-10131,2900,8264,-487,-109,15899,-7787,-12157,9819,-6454,-463,-109,-10104,4799,-11443,6025,1182,-97,-108,3120,11106,-6652,5186,17499,-3277,-112,6315,15198,3151,-2415,-21673,-2355,-113,-6363,-17545,-938,10223,-7282,1766,-112,9932,6322,14456,13451,-21181,1639,-114,-14787,2373,9758,-7390,-1725,4279,-113,12338,-5368,16054,1931,1318,3226,-115,8939,-15958,-4365,-4147,6221,2608,-113,-4575,18591,1814,4668,-130,7153,-116,10093,-4537,-9339,-10315,-1613,775,-115,1651,-10727,-27175,-6781,-8950,-2263,-110,30429,4709,-8169,-14455,-10262,-775,-111,-7890,23172,-661,6289,-1007,6752,-113,14033,10214,15,2205,7791,-3679,-116,3123,-6970,15242,-14081,-4045,-1396,-116,2644,3085,5933,10931,-689,13583,-119,-4350,5876,-15861,-4168,7909,-1888,-117,-7534,4712,3394,-16832,-1138,-282,-116,-116,3418,10994,9109,-5833,-7217,-116,3112,22589,15900,7354,-16052,-120,-120,2830,7337,4003,3258,-15857,1377,-121,-3224,4229,-4769,-3694,-1572,2495,-121,4027,399,5903,5103,7986,1465,-123,-10352,-1972,-2131,-6298,561,5357,-121,3389,540,8552,8135,7309,4213,-124,11518,-5272,6002,4713,-18438,108,-124,1851,17042,8702,-4237,-19318,-3190,-125,-3466,-10553,12679,-10839,5759,-4587,-124,-617,-5500,-7705,-13328,1417,-4723,-121,23216,-10539,17038,16762,-16197,-268,-124,13405,-18592,-6227,286,4295,-1601,-123,-2653,137,10770,7347,-260,3868,-125,12705,8195,851,-7739,-3539,2931,-126,-10467,-1898,-9214,-5354,-2663,-123,-124,8546,-13482,-14591,-1160,1385,4109,-122,13382,-2465,-1585,-2328,-2070,-3916,-123,2092,1183,-3101,-10109,47,-2703,-122,3704,12417,18792,405,6912,-1516,-125,11627,-4442,-24087,-43074,15844,-4664,-120,2698,-869,-2055,10332,5369,1939,-122,1215,1148,-8495,-1540,884,-122,-122,-2844,-2066,999,4187,-8067,4026,-123,-10584,30,2015,-14680,4373,-176,-121,15170,-13436,3137,1994,-1868,-438,-121,8330,-8861,-6298,-16237,-1290,34,-119,7862,4344,2933,-4973,-4041,-2630,-117,10882,7379,19052,2235,13935,134,-122,-560,-5698,1223,-5218,1536,-12719,-120,1341,613,5416,-747,-1198,-2351,-120,5343,9171,-6005,-1756,-4804,-719,-120,8251,10054,-12724,-12684,-8313,-2721,-119,8963,794,12619,-9984,4134,-3427,-120,4350,11079,5982,6693,7112,752,-123,-1940,-5488,-11459,17801,15136,-7673,-124,-3672,-1763,4887,1460,64372,-130,-130,13351,-1280,6501,-11093,9110,-7256,-134,9527,-7311,-2197,-9309,-72828,-5317,-126,-14061,9554,1864,-4245,6435,-2478,-125,4377,20691,10324,2004,-3538,2982,-129,-4061,5894,-4469,2648,6767,3618,-129,5272,-3929,3823,-9561,-8120,1254,-127,-4725,9299,11621,-3260,12171,12927,-134,-3164,-3180,10727,3353,-10008,-1305,-135,9740,2301,3157,-4112,-863,-2337,-136,-7057,-16583,-18004,12657,19245,-2362,-134,-709,25900,17725,-9696,-5672,-2443,-137,-13778,-4729,-11276,-14361,-8072,-3020,-131,12908,1147,-16002,3293,14193,-133,-133,12686,-1540,567,3167,-18531,3262,-135,12504,2452,-1242,11741,5053,584,-137,-138,11383,-15642,-3328,421,-5469,-136,-136,26706,8014,13671,7332,1645,-141,6733,4774,2308,3515,13469,-11251,-143,3255,-7814,21589,12504,2990,-146,-147,14415,6873,11875,-17658,11726,-2998,-150,-14921,-13833,7086,-5710,-33152,-2241,-145,-25805,957,-12312,-45472,-4097,-2007,-135,18133,4792,21726,23570,-18438,2450,-141,-2631,740,16478,8489,17028,-2197,-145,15858,-24885,-21925,3896,-12110,-13310,-140,-1017,751,-20684,4697,18027,10874,-141,12625,-9209,-14515,204,3226,3418,-140,-15548,8184,12099,-35515,-25721,-2723,-135,12143,-8100,-16932,13876,6395,-469,-136,-12351,10694,-1131,14242,-15896,-145,-145,-24159,27639,-5626,6304,-9445,457,-149,-13957,8810,17411,-2811,-14197,7206,-142,-5263,20515,-11630,14254,15873,10170,-147,2479,-7111,-10742,520,5077,2196,-146,821,13819,16814,21649,4565,-6115,-151,10848,-22041,22055,-10243,-26430,2384,-148,806,10964,-24471,491,-3611,-147,-146,697,-16849,10908,-7297,9324,3194,-147,16261,-16237,16259,-16487,-16196,8489,-146,-815,1052,-5613,-11720,-4711,-144,-143,-9542,-6644,19670,-21468,13627,-11867,-142,-27243,-11451,-18656,1713,25277,-7255,-134,-1887,-4970,-1673,-4514,7406,-1761,-134,29013,3339,-11876,16566,10722,1111,-139,-11354,-3629,-4801,390,19204,-8391,-138,6595,13163,14265,-567,7443,9112,-143,2341,-3966,-17099,-8673,11755,10706,-142,-2768,7805,-8356,313,-25728,13176,-139,-15074,15116,-27131,15505,-1289,-1989,-137,14771,-1902,-1666,-26499,17740,-1017,-138,19996,-4057,7564,-17816,-1832,3922,-139,-1991,-7814,-12870,7,3173,1699,-137,-13624,-1527,-7397,19952,2425,-6660,-136,-5512,5992,16733,10608,-7230,1433,-139,-3334,6796,6424,12045,4735,12605,-142,39,-12993,8507,-32657,-10422,-526,-138,11966,3043,-19889,-25139,23844,-7316,-137,-3475,23088,-6262,-24772,6419,3279,-136,10609,-19950,-15179,18632,-6759,6603,-131,-8195,16357,15075,33242,-1894,-2372,-137,3455,10514,5973,-17797,-11916,7482,-137,-16262,9360,4911,17836,1081,-4226,-138,-4346,-36319,15834,-473,-17227,4899,-134,-1503,-5391,27114,7963,-7862,2637,-135,23336,-12632,-11034,-17986,39,-2123,-134,-32982,-1406,24488,10124,-19699,8055,-131,-5340,-3000,-18807,-8447,-10017,3234,-127,-10031,260,21109,-1125,6704,-7195,-127,3957,-293,10698,-10618,36851,-5356,-130,3821,8770,14736,1582,-9387,26,-132,-11180,15197,9491,9469,15628,-941,-136,2997,-13151,11364,9774,7979,-198,-145,-19706,-11832,29127,16646,-3248,1965,-146,1107,7959,-5541,-16696,900,-243,-145,-6492,21719,-10936,563,5105,580,-146,-1568,-4693,13334,-1613,9613,2757,-149,6044,-9420,-3997,-14786,-892,3573,-148,-858,15573,2746,-12102,-5424,5350,-148,27240,14618,4994,-4985,18543,-1845,-159,21697,1041,-1047,-5781,-45989,10116,-157,-6556,11076,-10513,16233,19515,-1689,-152,14468,7031,9272,-7249,11600,-1932,-156,3260,-4060,-1254,-16732,-7466,-7190,-153,-3723,13850,5339,5375,5787,767,-156,-5296,1479,-15569,-5496,16215,-154,-155,2199,-702,-19077,-1821,12917,7045,-155,-24940,-30489,-11209,-30928,7319,-4560,-145,-33681,15893,-4076,10657,-22626,3658,-142,8796,19447,1667,-18194,22110,-145,-146,-1594,-8161,2184,17429,-4165,-2041,-146,15544,-2646,-15323,-7859,5221,-930,-146,4393,16715,-18320,4416,-8565,-146,-145,-7865,33096,13267,35355,-24556,-1204,-150,-231,-20491,14236,6860,-2979,-1376,-150,18763,1741,6228,5447,-5653,3188,-156,-10691,9223,11385,-2001,-10527,3665,-156,-4250,1324,4383,3078,-5377,-1345,-155,-1824,-222,933,-9898,2562,-3089,-155,948,-16034,-13587,-20988,-15973,-148,-149,-49152,-2890,-7484,22175,-11074,-658,-138,-8603,12581,-31254,4289,13152,7387,-137,3906,-593,6705,-19481,-2918,1671,-136,-2242,-4268,176,5723,12563,3586,-137,-177,-12858,25228,5487,3578,3118,-140,9789,-719,13252,7116,9172,-13773,-143,9,-2257,-4820,-15312,17519,3799,-143,4935,-5623,144,6964,-1142,168,-143,-373,-6506,-17172,7197,-1238,-3010,-141,-3656,-11411,12713,12082,13091,-143,-143,-5300,4586,7019,3105,-11091,-3225,-144,8414,8497,6132,7784,8378,2157,-148,4676,3898,1869,-10928,10818,1750,-149,14723,1333,1692,14948,-12143,4469,-152,-10708,-11304,-6709,-4159,14335,-4089,-150,-9420,8461,-6579,5219,-3029,3590,-149,12695,-6658,4270,773,-17986,2662,-151,6672,-18542,8748,3605,7910,-282,-152,1243,-1427,13356,27726,-981,-4072,-156,5168,10134,2027,9774,-2135,2304,-165,3009,-2003,-918,3231,8188,-7883,-164,-1786,-5892,-5652,31263,-9839,6152,-165,-10793,-1260,-3433,21735,1487,2618,-166,15674,-8067,-13755,748,11953,8272,-168,-133,-31173,-3229,-1812,-4180,7901,-165,-38423,15300,-8500,-21882,-35317,-2844,-156,-714,27265,19744,8579,-20932,3636,-160,-6628,27289,22904,-17101,-2270,1896,-162,1778,-13605,21504,-16244,-12755,-1786,-160,-56305,-21116,-2771,-39982,-40895,-1102,-143,13665,-17162,8601,-25688,-50706,-13510,-129,-111118,28439,-28429,-97517,62251,10891,-115,-78425,13348,-64755,1943,25275,6712,-106,-38014,51280,27921,30285,-49201,197,-109,2511,16374,-26562,27350,-7742,8485,-110,33041,10336,3177,8396,169,-6217,-115,-126,8129,-40993,12619,23007,-115,-115,-12081,-31158,34365,5285,-9032,-2233,-114,17314,7071,32845,-13965,-26569,-115,-115,-13087,1960,-756,7053,16195,-4795,-116,-6967,862,-15958,-7056,190,-530,-113,30120,-12079,8100,-8789,-18380,6779,-113,1275,19152,5932,1961,-4686,-8942,-115,20282,28676,16625,-9508,24309,-123,-123,7193,-9790,-3480,-50645,14211,3117,-119,-7200,15172,-7284,8260,9068,776,-120,2384,11430,-28979,7595,-8116,-1062,-118,-806,-5981,12876,20070,-2843,4475,-130,41104,-22878,11971,2043,-5839,4927,-133,-1525,-5268,-5036,-3301,2869,-1159,-131,19878,12437,-3557,-16452,2279,-3066,-133,13337,-27205,12272,-15939,-13733,-7555,-128,-107,12494,15552,-11348,-6115,1683,-123,5348,14847,3812,2322,-9062,1290,-125,4465,1959,-10916,-14850,4588,5564,-124,11233,-2829,3205,-3425,9443,-126,-126,-14419,-3703,-8455,-1492,-797,-2144,-123,2005,-8145,12210,2275,-648,-470,-123,4756,14063,-4009,-2634,-5618,-2647,-124,-16702,-1266,-10206,-5464,8014,619,-122,3134,-9807,8130,3415,-9156,1384,-122,12855,-4699,4819,10618,4957,-2230,-124,6723,-2365,7386,-15936,2000,-3147,-123,7075,-29,1670,1124,7272,-125,-125,-13956,-7183,-34783,10358,-4080,259,-120,7471,18118,10942,18575,-3177,-1156,-125,32998,5410,11123,-8779,1790,-1866,-129,22368,-12,-2009,-4479,-6523,-2377,-129,9919,11965,6749,-1242,1426,-1788,-131,-15547,20041,4661,-4801,9538,-709,-133,3955,-2272,1157,15110,129,-1035,-134,-1210,7823,5183,-466,-2136,-1102,-136,-25382,6376,-436,15114,-2127,-143,-135,9042,2649,8254,-2342,-1310,-136,-136,2647,5537,4163,12757,13373,1353,-140,-10252,25916,-2795,20181,-14137,177,-142,758,18183,7445,-5133,-28149,-153,-141,-14232,-2145,-19828,12879,-22924,-3513,-136,30728,22936,5587,6555,15941,939,-145,13309,-2393,-4891,8717,3271,3099,-147,6244,11729,-8865,-4942,13496,-4802,-147,-24382,7325,3286,-14396,-35859,8080,-142,17517,5402,8050,-14799,9186,7729,-145,-15114,27925,-7107,31705,-20088,2828,-147,1431,-508,-12199,-16166,-1619,1475,-144,4165,-16488,-16063,-7841,21482,1410,-142,-383,7757,8800,3576,-2207,-1787,-143,3700,-17437,-4968,782,-10010,-1243,-141,-16221,3870,11309,-7411,6031,-1322,-142,-15700,-15507,7436,10068,6131,-1788,-140,8466,4022,7592,-2124,-24875,-140,-139,-4237,-8807,20401,10742,4106,-22,-142,-4853,-7620,-20528,-1313,15106,-811,-140,6238,7152,-13263,4236,-54,952,-140,4765,625,6238,11006,13601,4856,-144,-1562,10852,7643,-3320,7807,5635,-147,-2538,-8297,-2617,2645,315,3821,-146,9013,-7933,-1934,-6863,1423,-146,-145,3472,8649,3814,5294,3301,-1290,-148,-1596,-954,-1539,-7767,2607,4871,-147,1626,-20608,-1210,-17330,11815,-2007,-145,3588,7489,2342,-5727,-11552,133,-144,-20542,8974,10513,3859,-2446,485,-144,-8565,-11586,16870,5571,-20338,-1537,-142,7615,8264,-54,4311,-6600,3343,-144,2091,1208,8720,473,-3778,-2302,-145,-6100,-9744,-6970,-18077,-45,1800,-141,9826,14973,3587,-8663,11227,271,-144,2182,3474,8642,1308,5775,-2273,-146,1632,-2653,-15612,1630,4529,-54,-144,1270,412,2495,-4369,-12569,-1052,-143,-25973,14975,12129,17374,-6942,-481,-145,13791,-19839,5589,1548,7326,-2021,-145,-12972,15638,-3540,23935,4757,-675,-148,7380,-990,11458,6429,5880,-164,-151,1925,8719,-5555,-8199,-3311,479,-150,15791,1437,-10088,-7419,-17540,-4788,-147,11801,-7013,-8455,785,1413,4028,-146,18176,-4371,-6336,15219,5766,1066,-153,-8175,-4296,9,-9153,-12104,7974,-153,-34981,12449,2903,13229,-54532,-7362,-148,11481,-19086,6452,21252,-30961,5149,-147,2650,32647,7090,-1163,-10808,4123,-150,-27581,-3416,-6829,14232,-30223,508,-145,-26636,39238,11320,1962,-2170,-1101,-147,5852,-4208,-8429,21711,-714,1312,-148,17728,4300,-8247,6011,19829,-152,-152,3871,33645,17789,-15381,-9343,1791,-155,340,-26397,9851,6362,-24956,-1314,-151,-37131,11188,5941,-6364,21283,2322,-151,38036,9669,-14250,-27461,15753,-19964,-150,-4407,20812,25501,-12531,-22037,2167,-151,-18956,39312,919,-24636,-15546,1612,-149,-30539,-4696,-23329,-77554,42903,-5773,-140,-11405,-5109,15517,-14771,-34470,15437,-136,-41977,4625,36116,-27134,-30027,9319,-132,-23057,-6412,72921,14293,12100,4414,-139,-11017,18274,-5866,6698,-2484,-2806,-138,2551,23218,-16738,-21341,25508,5098,-141,29921,-21506,-5629,-6059,4004,5950,-141,-21571,-8517,6894,-7536,-6326,6507,-138,-1853,-9125,-451,-16221,-30838,-132,-133,-19607,-4589,22958,34727,27559,-6434,-138,-4828,260,-7401,-15770,-22308,140,-131,-24058,-7718,1149,-18787,32428,2249,-129,1629,30175,-35033,-6510,21567,-5457,-130,11201,-24195,3834,9077,25095,-2811,-132,14319,-6020,354,5250,-6945,-4175,-133,12994,1474,14890,-21784,-19253,-132,-133,-44712,32319,17934,-30974,8902,-9463,-131,-3820,19302,-25535,7286,26168,-3547,-132,11316,-13165,-3248,-8065,5169,-4153,-132,4279,-3124,14604,32587,8646,1622,-137,-25135,-7060,4003,-6429,6134,-6338,-133,6668,1869,-6882,10199,-4149,920,-134,-117,-9569,31089,11718,-900,-9099,-137,-1972,-13016,8963,11761,5352,-6238,-139,-1875,745,12438,-2008,5914,6037,-135,-2406,5042,5010,-9082,-16195,13450,-135,-11821,17923,6788,21167,-13666,-4374,-137,-5145,522,-11198,-3376,-3515,1002,-134,-4191,4505,1002,9780,20616,-18949,-136,9211,-35675,-7264,11257,-17688,4004,-133,2823,605,-14683,-4154,-25370,14007,-130,-14044,9783,-7430,-3361,-7236,-4667,-128,11542,20281,5423,-7491,-19283,6742,-130,-9853,-12692,-3777,4271,-14853,2168,-126,16408,10334,-22336,1476,8944,9257,-128,-29387,6446,-19349,-13660,-5484,8540,-123,-7477,20383,-12744,-3221,55455,-12786,-126,7196,-5364,-19688,5486,43652,-36279,-127,-313,31792,-20769,-4220,11440,-4698,-128,-12924,16090,6765,-1982,-8781,3498,-127,-9474,16456,33448,1705,-11588,-8791,-129,11108,-16434,-8456,14515,1468,-2613,-130,-11476,4614,507,-33877,72,-791,-125,723,573,2571,-4369,-8182,-14,-125,-125,-1932,10111,3015,-2373,-1885,-126,-82,-1576,28871,-4459,13136,-128,-128,18907,-10552,8601,6975,5125,-3144,-131,-2542,-713,-2455,-3874,17142,919,-132,6565,-8276,-13792,11898,-13515,2824,-130,-15411,529,10463,1676,-21721,4692,-128,-18553,30899,8785,-2644,-18281,7858,-131,6286,1907,-8234,2339,-9155,8013,-133,1833,-25699,-8523,13033,-26175,4909,-132,2289,-7110,24511,-15503,25994,-1287,-135,695,-8863,-9869,-6948,-27908,-3841,-129,1189,-22264,-7496,22472,4964,-3383,-133,-14144,3301,-2862,19649,-16727,15831,-131,-8634,10730,13571,6970,8224,1248,-134,-4004,-2850,-2393,-1903,2895,2401,-133,-289,13813,-20255,-4115,-9428,-132,-131,11438,-4450,-13482,6049,-16856,-130,-130,-3726,-21191,5006,6235,10160,7021,-130,-2753,-5718,-7460,-3573,12713,6664,-130,5785,-20219,9118,-704,2991,3953,-130,17000,334,-7643,9604,-14791,1241,-130,10284,-14003,-11560,-14900,13778,-2134,-129,-1251,1596,-21123,16000,36449,-131,-132,483,5979,10519,1354,6676,-5353,-133,-4664,14699,898,16670,7422,-17333,-134,-9078,-7531,-11736,3348,-21294,11930,-132,-4771,14745,-7124,-5345,2715,6069,-132,23341,-1807,-13059,-16709,1208,591,-132,5551,3214,8078,19570,-19036,-3890,-132,8780,-17640,-3240,-249,7499,7792,-133,-7872,31252,6227,-2680,5811,13586,-139,17861,-11064,-22929,-10636,8443,-2131,-137,-2817,-20914,8043,800,-20141,1650,-136,-16306,-41,-6219,-986,-16264,3326,-132,-7621,3023,20682,11345,-15932,3437,-135,14232,15859,-7169,-19768,11638,2621,-135,19923,-8240,-335,-10290,10753,-137,-136,6681,-5133,-1395,4136,-3835,8363,-129,0,-2628,-14194,-20502,26562,-1377,-128,-15784,-10073,10246,2542,17106,-7077,-128,-3888,-21650,99,2275,13481,-4677,-127,-2640,18354,683,2139,-24240,10838,-127,-3109,-135,-20590,-17465,-13110,-3640,-120,-1003,-2512,-2874,9477,16050,-114,-122,4763,-21578,1500,23789,6138,-4816,-122,12603,-17033,-513,-1631,-6489,875,-121,8699,12576,17023,-25199,-13344,-2415,-121,18311,-13827,4908,11795,-6733,-1630,-122,-3972,-1344,-12313,401,6924,5809,-122,-188,-9495,13027,1373,4564,-123,-122,-8199,7621,-873,9258,1984,-2967,-123,-733,6999,-14076,10985,-27314,-4361,-121,-120,2144,16539,15135,-9147,7265,-123,-123,-11695,8456,9327,-7488,3286,-123,-15515,-7877,-1257,10006,2174,5327,-123,-4843,-22202,-22131,9637,-2348,-119,-118,-11556,8421,29845,14410,-6837,2516,-123,9933,-14526,-8754,11608,-3641,-7705,-122,-3945,57085,-7741,-20830,3969,-1648,-124,-3180,-4496,16356,16575,13354,-3263,-128,-9823,6951,7811,16474,-4300,915,-129,-4991,-280,-11296,1553,14664,1344,-130,-7425,-21917,14670,-9131,-4077,-4245,-127,680,20091,-7227,-8123,-15011,3369,-126,6003,-11016,15084,7552,-21636,9480,-126,-7226,4856,-1405,18348,488,2106,-128,406,14219,-1279,-6625,-14328,1246,-128,10687,4885,3175,-478,-11298,8933,-129,-8577,-17236,-803,4172,-3719,2889,-127,25146,13903,9009,6612,7954,578,-133,5705,-9421,2469,19477,16046,-136,-137,0,-8180,-12019,1400,13389,-5933,-136,15471,5492,1142,8712,13425,2856,-140,508,-17911,-3919,-9760,-5368,-138,-138,6120,-1704,-27610,-1143,-2528,-4513,-134,41515,-53633,5482,10926,-5756,-4177,-135,724,10560,-1300,-1479,-6819,12180,-136,522,-1507,18196,-3286,-15054,-136,-136,4583,2949,7641,-6089,-2828,-1255,-133,-887,-60,18884,113,-7370,-3186,-134,-3974,4599,671,12670,13696,-4170,-135,-14848,-9908,-5419,-7329,-21035,4549,-131,12254,-15352,-8021,-10114,9158,-1261,-130,9734,-2005,12272,-10866,-21327,-128,-129,-19396,-11887,16582,5358,12267,881,-129,3040,600,-6403,-6672,15094,1580,-129,11724,-17999,-3490,-1182,-2147,1297,-128,7510,3910,-9384,2521,14162,-358,-130,-8043,-1208,-820,-9797,-15939,-728,-127,-5787,-299,3467,12475,8051,-7231,-129,2789,1320,-190,19695,4533,-1204,-130,1633,44633,436,40754,29440,-48,-141,9512,1835,67335,-30656,32706,1301,-150],"returnScale":1000000,"returns":[0,-3143,5829,589,-89,20431,-1060,-2089,-1156,-22506,5659,-82,13828,-619,-11731,-10561,9223,-3421,-82,-3361,5519,-1631,-741,5392,1541,-83,-11015,19090,-2799,12236,18514,3636,-87,-7501,1560,-6690,-10005,-1778,5967,-86,3391,-8577,5337,-9812,2821,874,-86,-9510,-1662,1466,2932,28699,5784,-88,-596,-7640,6310,-5501,-11314,-253,-86,-18898,-461,10963,-1054,8334,-2569,-84,-12020,-15382,-12163,-7524,-16389,-1064,-577,-23547,-11495,21633,17870,14806,-247,-81,14332,832,-1413,-499,1030,2842,-81,4178,-5709,1903,981,1219,4701,-73,-6249,-4271,15581,18126,2801,-2270,-75,-10685,5004,-1757,14411,13756,6384,-78,-8795,381,23085,14240,-206,24064,-83,-7704,-11344,-19842,-9140,-15369,736,-77,6149,14850,-1001,-3116,-6709,-2208,-79,1670,7060,-582,15764,16035,-3187,-82,-4522,1450,5099,-3908,-857,5078,-81,-11591,9094,-7294,4807,6127,4384,-82,-216,-5462,-10434,1942,-4498,7313,-82,-8774,-8615,10036,1783,2381,-80,4935,6366,11499,-3035,4738,-6297,-83,-3818,-10687,-11541,-7164,-354,6183,-79,19707,3879,19155,9398,-5012,-11203,-85,1614,8798,37729,21938,5904,-91,-91,5609,-2204,26465,3996,-31922,-7239,-91,-2025,14941,12111,164,717,-3616,-92,6832,-2997,-17188,-18326,-9173,-84,-85,2567,-3070,-7325,-12589,7392,4686,-83,2110,-1488,-8891,802,-1003,4400,-71,-8728,1245,10868,3454,8460,-1367,-73,-73,-1862,11125,-11019,-10170,-72,-71,-1495,-1026,-13043,-12530,-12585,4698,-69,-87,855,996,-1255,4313,491,-69,-9353,1720,6334,1320,-13075,5040,-68,6934,8677,6075,-7295,-5046,117,-70,-17557,11334,-4320,6600,-1387,-1615,-82,-14814,-11450,-19772,6875,14231,-6340,-75,9665,3934,-3407,8539,10204,-78,-77,-7069,2885,-4061,-6560,-18322,2761,-75,-14604,-7229,10457,-939,2946,-1444,-74,-9855,2233,-1298,-4222,-956,-2738,-72,8658,-12494,-17270,-6467,5595,-2847,-72,-4141,-1283,-10913,-12661,-25389,-3970,-66,-37036,5242,1314,33740,5095,-66,-66,-5709,-16258,-508,7917,-16974,3541,-62,-2664,14885,7513,-5627,-5888,-3131,-63,2101,2058,14887,2212,-12258,-4000,-63,-975,-2275,-5522,-4039,1938,3296,-62,-10218,-1119,10476,778,9510,-335,-64,18549,-75,15036,625,6341,-4563,-71,-3247,-9921,295,9704,2494,2913,-70,-2037,820,-9471,9870,8434,-70,-71,-6953,7855,-2657,-8489,7579,-3926,-70,5055,8202,8688,-2071,-4304,606,-69,-4793,-973,1852,-3862,-12393,-1527,-70,6692,7789,4319,6219,5571,-152,-72,-1326,-813,-4646,2708,-9408,1273,-74,273,1543,-2735,-6349,-6899,-8669,-66,-6857,-4955,-3461,-7837,-14911,-324,-1465,-1918,12610,5898,3605,-5448,141,-66,1495,-15,9269,1025,-1946,537,-69,-6845,775,-7356,1388,1402,-67,-67,-14878,-53,-4290,-17359,-4585,-4283,-62,-7284,-2718,-1326,2742,-23167,-545,-59,-2852,9831,-14936,4497,17285,3111,-61,-4978,-95,162,-707,16258,-645,-61,-7187,-13896,-972,8089,-12842,75,-60,-11281,-6252,1070,-16965,5018,2127,-57,9031,8854,10730,839,-1201,-446,-61,19500,-9771,-5957,-2473,4994,686,-62,4837,21991,11483,11181,11526,-2827,-67,863,-12100,2055,-354,17062,-9399,-67,-1796,-10377,8855,15695,-1456,1257,-69,2462,-1979,-10113,-2077,601,-610,2630,866,11135,-8282,-4952,-2047,-70,-6060,-9668,3100,-6082,11062,-36,-69,8802,9203,21539,1269,-1465,-1435,-73,-6374,10585,-2881,-1541,1256,4003,-73,-11741,3898,3854,-2737,-9671,-72,-72,-7050,-19338,-11045,2325,1860,411,-69,-5562,7790,526,-3901,-7615,1564,-69,7343,-2255,-1812,-8871,6890,-985,-68,-5675,6454,12134,7412,2163,-77,-70,1632,417,-2041,2478,2131,1396,-71,7102,1516,7008,-9932,-11288,1581,-70,-10681,-4806,7641,-4933,6659,-70,-70,12160,-6426,855,13056,-30064,13518,-71,-9816,17522,13325,7246,5219,-1573,-81,2284,-10725,-4654,4964,7477,-125,-73,12226,10300,-1116,9464,-4532,1343,-77,4193,-1283,4097,-316,2590,-135,-77,-1449,6282,-1368,-3456,-5504,-1213,-76,-2041,-9453,1300,3833,14609,-995,-78,4989,6081,-7293,2088,5948,-350,-79,11445,-5605,-8751,7068,-4646,-333,-79,-7273,3454,-8237,4337,851,-70,-77,2245,7995,-4788,3733,12597,-2359,-81,4546,10940,2268,-1738,-15601,-1696,-81,-4580,-12630,-675,7359,-5242,1271,-81,7150,4551,10406,9683,-15248,1180,-82,-10644,1708,7024,-5319,-1242,3080,-81,8881,-3864,11557,1390,948,2323,-83,6435,-11488,-3142,-2985,4478,1877,-81,-3293,13383,1305,3361,-94,5149,-83,7265,-3266,-6722,-7426,-1161,558,-83,1189,-7722,-19562,-4882,-6442,-1629,-79,21904,3390,-5881,-10405,-7387,-558,-80,-5680,16681,-476,4527,-725,4861,-82,10102,7353,10,1588,5608,-2648,-84,2248,-5017,10972,-10136,-2912,-1005,-84,1904,2220,4271,7869,-496,9778,-86,-3131,4230,-11418,-3000,5693,-1359,-84,-5424,3392,2443,-12116,-819,-203,-84,-83,2460,7914,6557,-4199,-5195,-83,2240,16261,11445,5294,-11555,-86,-87,2038,5281,2882,2345,-11415,991,-87,-2320,3044,-3433,-2659,-1132,1796,-87,2899,287,4249,3674,5749,1054,-88,-7452,-1420,-1534,-4534,404,3857,-88,2440,389,6156,5856,5261,3033,-89,8291,-3795,4321,3392,-13272,77,-89,1333,12267,6264,-3050,-13906,-2296,-90,-2495,-7597,9127,-7802,4146,-3302,-90,-444,-3959,-5546,-9595,1020,-3400,-87,16712,-7586,12265,12066,-11659,-193,-90,9650,-13384,-4482,206,3092,-1153,-88,-1910,98,7753,5289,-187,2784,-90,9146,5899,613,-5571,-2548,2110,-91,-7534,-1367,-6632,-3854,-1917,-89,-89,6152,-9705,-10504,-835,997,2958,-88,9633,-1774,-1141,-1676,-1490,-2819,-88,1506,851,-2232,-7277,34,-1946,-88,2666,8939,13527,292,4976,-1092,-90,8370,-3198,-17339,-31007,11406,-3358,-86,1942,-626,-1479,7438,3865,1395,-87,874,827,-6116,-1108,636,-88,-87,-2048,-1487,719,3014,-5807,2898,-88,-7619,21,1451,-10567,3147,-126,-87,10920,-9672,2258,1435,-1344,-316,-87,5997,-6379,-4534,-11688,-928,24,-86,5660,3127,2111,-3580,-2908,-1894,-84,7834,5311,13715,1609,10031,96,-87,-403,-4102,880,-3756,1106,-9156,-87,966,441,3899,-538,-862,-1693,-86,3846,6602,-4323,-1264,-3458,-518,-86,5939,7238,-9160,-9130,-5984,-1959,-86,6452,572,9084,-7187,2976,-2467,-87,3132,7975,4306,4818,5120,541,-89,-1396,-3951,-8248,12814,10895,-5523,-89,-2644,-1269,3518,1051,46339,-94,-94,9611,-921,4680,-7986,6558,-5223,-97,6858,-5262,-1582,-6701,-52426,-3827,-91,-10122,6878,1342,-3056,4632,-1784,-90,3151,14895,7431,1443,-2547,2147,-93,-2923,4242,-3217,1907,4871,2604,-93,3795,-2828,2752,-6882,-5846,903,-91,-3402,6694,8366,-2347,8761,9306,-97,-2277,-2289,7722,2413,-7204,-940,-97,7012,1656,2273,-2960,-622,-1682,-98,-5080,-11937,-12960,9111,13853,-1700,-96,-511,18644,12760,-6980,-4083,-1758,-99,-9918,-3404,-8117,-10338,-5811,-2174,-94,9292,825,-11519,2371,10217,-96,-96,9132,-1108,408,2280,-13340,2348,-97,9001,1765,-894,8452,3637,421,-99,-99,8194,-11260,-2396,303,-3937,-98,-98,19225,5769,9841,5278,1184,-101,4846,3437,1661,2531,9695,-8099,-103,2343,-5625,15541,9001,2153,-105,-106,10377,4947,8548,-12711,8441,-2158,-108,-10741,-9958,5101,-4110,-23865,-1613,-104,-18576,689,-8863,-32733,-2949,-1445,-97,13053,3449,15640,16967,-13273,1764,-102,-1894,533,11862,6111,12257,-1581,-105,11416,-17914,-15782,2804,-8717,-9582,-100,-732,540,-14889,3381,12977,7827,-101,9088,-6629,-10449,147,2322,2461,-101,-11192,5891,8709,-25565,-18515,-1961,-97,8741,-5830,-12189,9989,4603,-337,-98,-8891,7698,-814,10252,-11443,-104,-105,-17391,19896,-4050,4538,-6799,329,-107,-10047,6342,12533,-2023,-10220,5187,-102,-3788,14767,-8371,10260,11427,7320,-105,1784,-5119,-7732,374,3655,1580,-105,591,9948,12104,15584,3286,-4402,-109,7809,-15866,15876,-7373,-19026,1716,-106,580,7892,-17615,353,-2599,-106,-105,502,-12129,7852,-5253,6712,2299,-105,11705,-11688,11704,-11868,-11659,6111,-105,-587,757,-4040,-8437,-3391,-104,-103,-6869,-4782,14159,-15454,9810,-8543,-102,-19611,-8243,-13429,1233,18195,-5222,-97,-1358,-3578,-1204,-3249,5331,-1268,-96,20885,2403,-8549,11926,7718,800,-100,-8174,-2612,-3456,281,13824,-6041,-99,4748,9475,10269,-408,5357,6560,-103,1685,-2855,-12309,-6243,8462,7707,-103,-1992,5618,-6015,225,-18520,9485,-100,-10851,10881,-19530,11161,-928,-1432,-98,10633,-1369,-1200,-19075,12770,-732,-99,14394,-2921,5445,-12825,-1318,2823,-100,-1433,-5625,-9265,5,2284,1223,-98,-9808,-1099,-5325,14363,1746,-4795,-97,-3968,4313,12045,7637,-5205,1032,-100,-2400,4892,4624,8671,3408,9074,-102,28,-9353,6123,-23508,-7502,-379,-99,8614,2190,-14317,-18096,17164,-5267,-98,-2502,16620,-4507,-17833,4621,2360,-97,7636,-14361,-10926,13412,-4865,4753,-95,-5899,11775,10852,23929,-1363,-1708,-98,2487,7568,4300,-12811,-8578,5386,-99,-11706,6738,3535,12839,778,-3042,-99,-3129,-26144,11398,-340,-12401,3526,-96,-1082,-3881,19518,5733,-5660,1898,-97,16799,-9093,-7943,-12948,28,-1528,-96,-23742,-1013,17628,7288,-14180,5798,-94,-3844,-2160,-13538,-6081,-7211,2328,-91,-7221,187,15196,-810,4826,-5180,-91,2849,-211,7701,-7644,26528,-3856,-94,2751,6313,10608,1139,-6758,19,-95,-8048,10940,6832,6816,11250,-677,-98,2157,-9467,8181,7036,5743,-142,-105,-14185,-8517,20967,11982,-2338,1415,-105,797,5729,-3989,-12018,648,-175,-105,-4673,15634,-7872,405,3675,418,-105,-1129,-3378,9598,-1161,6920,1985,-108,4351,-6781,-2877,-10644,-642,2572,-106,-618,11210,1977,-8712,-3904,3851,-107,19609,10523,3595,-3588,13348,-1328,-115,15619,749,-754,-4161,-33105,7282,-113,-4720,7973,-7567,11685,14048,-1216,-109,10415,5061,6674,-5218,8350,-1390,-113,2347,-2923,-902,-12045,-5374,-5176,-110,-2680,9970,3843,3869,4166,552,-112,-3812,1064,-11207,-3956,11672,-111,-111,1582,-505,-13732,-1311,9298,5071,-111,-17953,-21948,-8069,-22263,5268,-3282,-105,-24245,11441,-2935,7672,-16288,2634,-102,6331,13999,1200,-13097,15916,-104,-105,-1148,-5874,1572,12546,-2998,-1469,-105,11189,-1905,-11030,-5657,3758,-669,-106,3163,12032,-13188,3179,-6165,-105,-105,-5661,23824,9550,25451,-17677,-867,-108,-166,-14751,10248,4938,-2144,-991,-108,13507,1253,4484,3921,-4070,2295,-112,-7696,6639,8196,-1441,-7578,2639,-113,-3059,953,3155,2216,-3871,-968,-112,-1313,-159,671,-7125,1844,-2223,-112,683,-11543,-9780,-15109,-11498,-106,-108,-35382,-2080,-5388,15963,-7971,-474,-99,-6193,9056,-22498,3087,9468,5317,-98,2812,-427,4826,-14023,-2101,1203,-98,-1614,-3072,127,4119,9044,2581,-98,-128,-9256,18161,3950,2575,2245,-101,7047,-518,9540,5122,6603,-9915,-103,7,-1625,-3470,-11022,12611,2735,-103,3552,-4048,104,5013,-822,121,-103,-268,-4684,-12361,5181,-892,-2166,-102,-2632,-8214,9152,8697,9424,-103,-103,-3816,3302,5052,2236,-7984,-2322,-104,6057,6117,4414,5603,6031,1553,-107,3366,2806,1346,-7867,7788,1259,-107,10599,959,1218,10761,-8742,3217,-109,-7708,-8137,-4830,-2994,10319,-2943,-108,-6781,6090,-4735,3756,-2180,2584,-107,9139,-4793,3074,556,-12947,1916,-109,4803,-13347,6297,2595,5694,-203,-109,894,-1027,9615,19958,-706,-2931,-113,3721,7295,1459,7036,-1537,1658,-118,2166,-1442,-661,2326,5894,-5675,-118,-1285,-4242,-4068,22504,-7082,4428,-119,-7769,-907,-2471,15646,1070,1885,-120,11283,-5807,-9901,538,8605,5954,-121,-96,-22440,-2324,-1304,-3009,5687,-119,-27658,11013,-6118,-15752,-25423,-2048,-112,-514,19627,14213,6175,-15068,2618,-115,-4772,19644,16488,-12310,-1634,1365,-117,1280,-9794,15480,-11693,-9182,-1286,-115,-40531,-15201,-1994,-28782,-29438,-793,-103,9837,-12354,6191,-18492,-36500,-9726,-93,-79988,20472,-20465,-70198,44812,7840,-83,-56455,9609,-46614,1398,18195,4831,-76,-27364,36914,20099,21800,-35417,142,-79,1808,11787,-19121,19688,-5573,6108,-79,23784,7441,2287,6044,121,-4475,-83,-91,5852,-29509,9084,16562,-83,-83,-8696,-22430,24738,3805,-6502,-1608,-82,12464,5090,23644,-10053,-19126,-83,-83,-9420,1411,-545,5078,11658,-3452,-84,-5015,621,-11488,-5079,137,-382,-81,21682,-8695,5831,-6327,-13231,4880,-82,918,13787,4270,1412,-3374,-6437,-82,14600,20642,11968,-6845,17499,-88,-89,5178,-7047,-2505,-36457,10230,2243,-85,-5183,10921,-5243,5946,6528,558,-86,1716,8228,-20861,5468,-5843,-764,-85,-580,-4306,9269,14447,-2046,3221,-93,29588,-16468,8617,1471,-4204,3547,-96,-1097,-3792,-3626,-2376,2065,-834,-94,14309,8953,-2561,-11843,1641,-2207,-96,9601,-19584,8834,-11474,-9885,-5439,-92,-77,8994,11195,-8169,-4402,1212,-89,3850,10688,2744,1671,-6523,928,-90,3215,1410,-7858,-10690,3303,4005,-89,8086,-2037,2308,-2466,6798,-91,-91,-10379,-2666,-6086,-1074,-574,-1543,-89,1443,-5863,8790,1637,-466,-339,-88,3423,10124,-2886,-1896,-4044,-1906,-89,-12023,-911,-7347,-3933,5768,446,-88,2256,-7059,5852,2458,-6591,997,-88,9254,-3383,3469,7643,3569,-1606,-89,4840,-1703,5317,-11472,1440,-2265,-89,5093,-21,1202,810,5234,-90,-90,-10046,-5171,-25038,7456,-2937,186,-86,5378,13042,7877,13371,-2287,-832,-90,23754,3894,8007,-6319,1288,-1343,-93,16102,-9,-1446,-3224,-4696,-1711,-93,7140,8613,4859,-894,1026,-1287,-94,-11192,14427,3355,-3456,6866,-510,-96,2847,-1636,833,10877,93,-745,-96,-871,5631,3731,-335,-1538,-793,-98,-18272,4590,-314,10880,-1531,-103,-97,6509,1907,5941,-1685,-943,-98,-98,1905,3986,2997,9183,9627,973,-100,-7380,18655,-2012,14528,-10177,128,-103,546,13089,5360,-3695,-20264,-110,-101,-10245,-1544,-14274,9271,-16501,-2529,-98,22119,16511,4022,4718,11476,676,-105,9581,-1723,-3521,6275,2355,2231,-106,4495,8443,-6382,-3557,9715,-3457,-106,-17551,5273,2365,-10363,-25813,5816,-102,12610,3889,5794,-10653,6613,5564,-105,-10880,20102,-5116,22823,-14460,2036,-106,1030,-366,-8781,-11637,-1166,1062,-104,2998,-11869,-11563,-5644,15464,1015,-102,-276,5584,6335,2574,-1589,-1286,-103,2663,-12552,-3576,563,-7206,-895,-101,-11677,2786,8141,-5335,4341,-951,-102,-11302,-11163,5353,7247,4414,-1287,-101,6094,2895,5466,-1529,-17907,-101,-100,-3050,-6339,14685,7733,2956,-16,-102,-3494,-5485,-14777,-945,10874,-584,-101,4491,5148,-9547,3049,-39,685,-100,3430,450,4490,7923,9790,3496,-104,-1124,7812,5502,-2390,5620,4056,-106,-1827,-5972,-1884,1904,226,2751,-105,6488,-5711,-1392,-4940,1024,-105,-104,2499,6226,2746,3810,2377,-929,-106,-1149,-687,-1108,-5591,1877,3506,-106,1171,-14835,-871,-12475,8505,-1445,-104,2583,5391,1686,-4123,-8316,96,-104,-14787,6460,7568,2778,-1761,349,-104,-6165,-8340,12144,4010,-14640,-1107,-102,5482,5948,-38,3103,-4751,2406,-103,1505,869,6278,340,-2720,-1657,-104,-4391,-7014,-5018,-13013,-32,1296,-102,7074,10778,2582,-6236,8082,195,-104,1571,2501,6221,941,4157,-1636,-105,1175,-1910,-11238,1173,3260,-39,-103,914,297,1796,-3145,-9048,-758,-102,-18697,10780,8731,12506,-4997,-346,-104,9927,-14281,4023,1114,5274,-1455,-104,-9338,11257,-2548,17229,3425,-486,-107,5313,-713,8248,4628,4233,-118,-109,1386,6276,-3998,-5903,-2383,345,-108,11367,1034,-7261,-5341,-12626,-3447,-106,8495,-5048,-6086,565,1017,2899,-105,13084,-3146,-4561,10955,4151,767,-110,-5885,-3092,6,-6588,-8713,5740,-111,-25181,8962,2089,9523,-39255,-5299,-107,8265,-13739,4644,15299,-22288,3707,-106,1908,23501,5103,-837,-7780,2968,-108,-19854,-2459,-4916,10245,-21756,365,-104,-19174,28246,8148,1413,-1562,-793,-106,4213,-3029,-6068,15629,-514,944,-106,12761,3096,-5937,4327,14274,-109,-110,2787,24219,12806,-11072,-6726,1289,-111,244,-19002,7092,4579,-17964,-946,-109,-26729,8054,4277,-4582,15321,1672,-109,27380,6961,-10258,-19768,11340,-14372,-108,-3172,14982,18357,-9021,-15863,1560,-109,-13646,28299,662,-17734,-11191,1160,-107,-21984,-3380,-16794,-55827,30884,-4156,-101,-8210,-3677,11170,-10633,-24814,11113,-98,-30218,3330,25998,-19533,-21615,6709,-95,-16598,-4616,52493,10289,8710,3177,-100,-7930,13154,-4222,4821,-1788,-2020,-99,1836,16714,-12049,-15363,18362,3670,-101,21538,-15481,-4052,-4361,2882,4283,-101,-15528,-6131,4962,-5425,-4553,4684,-100,-1333,-6569,-325,-11677,-22198,-95,-96,-14114,-3304,16527,24998,19838,-4631,-99,-3476,187,-5327,-11352,-16059,101,-94,-17319,-5555,827,-13524,23343,1619,-93,1173,21721,-25218,-4686,15525,-3929,-93,8063,-17417,2760,6534,18065,-2024,-95,10308,-4334,255,3779,-4999,-3005,-96,9354,1061,10718,-15681,-13859,-95,-96,-32186,23265,12910,-22297,6408,-6812,-94,-2750,13895,-18382,5245,18837,-2553,-95,8146,-9477,-2338,-5806,3721,-2990,-95,3081,-2249,10513,23457,6224,1168,-99,-18093,-5082,2881,-4628,4416,-4563,-95,4800,1345,-4954,7342,-2987,662,-96,-84,-6889,22380,8435,-648,-6550,-98,-1420,-9369,6452,8466,3852,-4490,-100,-1350,537,8953,-1445,4257,4346,-98,-1732,3630,3606,-6537,-11658,9682,-97,-8510,12902,4886,15238,-9838,-3149,-98,-3704,376,-8061,-2430,-2531,722,-97,-3017,3243,722,7040,14840,-13640,-98,6630,-25680,-5229,8103,-12733,2883,-96,2032,436,-10570,-2990,-18263,10083,-94,-10109,7042,-5348,-2420,-5209,-3359,-92,8308,14599,3904,-5392,-13881,4853,-93,-7093,-9137,-2718,3074,-10692,1561,-91,11811,7439,-16078,1062,6439,6663,-92,-21154,4640,-13928,-9834,-3947,6147,-88,-5383,14673,-9174,-2318,39919,-9204,-91,5180,-3861,-14172,3949,31423,-26116,-91,-226,22886,-14951,-3037,8235,-3382,-92,-9304,11583,4870,-1427,-6321,2518,-92,-6819,11845,24078,1227,-8341,-6328,-93,7996,-11830,-6087,10448,1057,-1881,-93,-8261,3321,365,-24387,52,-569,-90,520,413,1851,-3145,-5890,-10,-90,-90,-1391,7278,2171,-1709,-1356,-91,-59,-1135,20783,-3210,9456,-92,-92,13610,-7596,6192,5021,3689,-2263,-94,-1830,-513,-1768,-2788,12339,662,-95,4726,-5958,-9928,8565,-9729,2033,-94,-11093,380,7532,1207,-15636,3377,-92,-13355,22242,6324,-1903,-13160,5657,-94,4525,1372,-5927,1684,-6590,5768,-96,1320,-18500,-6135,9382,-18843,3534,-95,1648,-5118,17644,-11160,18712,-926,-98,501,-6380,-7105,-5001,-20090,-2765,-93,856,-16026,-5396,16176,3573,-2435,-96,-10181,2376,-2060,14144,-12041,11396,-94,-6215,7724,9769,5017,5920,899,-97,-2882,-2052,-1722,-1370,2084,1728,-96,-208,9944,-14581,-2962,-6787,-95,-94,8234,-3204,-9705,4355,-12134,-94,-93,-2683,-15254,3604,4488,7314,5054,-94,-1982,-4116,-5370,-2572,9152,4797,-94,4164,-14554,6563,-506,2153,2845,-93,12237,241,-5502,6913,-10647,893,-93,7403,-10081,-8321,-10726,9918,-1536,-93,-900,1149,-15206,11518,26238,-95,-95,348,4304,7572,975,4806,-3854,-95,-3358,10581,647,12000,5342,-12477,-96,-6535,-5421,-8449,2411,-15329,8588,-95,-3435,10615,-5129,-3847,1954,4369,-95,16802,-1301,-9400,-12028,869,426,-95,3996,2313,5815,14088,-13703,-2801,-95,6321,-12699,-2332,-179,5398,5609,-96,-5666,22497,4482,-1929,4183,9780,-100,12857,-7964,-16506,-7656,6077,-1534,-98,-2028,-15055,5790,576,-14499,1188,-98,-11738,-29,-4477,-710,-11708,2395,-96,-5486,2177,14888,8166,-11468,2474,-97,10245,11416,-5161,-14230,8378,1886,-97,14342,-5932,-241,-7407,7740,-98,-98,4809,-3695,-1004,2977,-2760,6020,-93,0,-1892,-10217,-14759,19121,-991,-92,-11363,-7251,7376,1830,12314,-5095,-92,-2799,-15585,72,1637,9705,-3367,-91,-1901,13212,492,1540,-17450,7802,-91,-2238,-97,-14822,-12572,-9438,-2620,-86,-722,-1809,-2068,6822,11553,-82,-88,3429,-15533,1080,17124,4419,-3467,-88,9073,-12262,-369,-1174,-4671,630,-87,6262,9052,12254,-18139,-9606,-1738,-87,13181,-9954,3533,8491,-4847,-1173,-88,-2859,-968,-8863,289,4984,4181,-87,-136,-6835,9378,988,3286,-89,-88,-5902,5486,-628,6664,1428,-2135,-89,-528,5039,-10133,7908,-19663,-3139,-87,-86,1543,11906,10895,-6585,5230,-89,-88,-8419,6087,6714,-5390,2365,-88,-11169,-5670,-905,7203,1565,3835,-89,-3486,-15982,-15931,6937,-1690,-86,-85,-8319,6062,21484,10373,-4921,1811,-89,7151,-10457,-6301,8356,-2621,-5547,-88,-2839,41092,-5572,-14995,2858,-1187,-89,-2289,-3237,11774,11932,9613,-2349,-92,-7071,5003,5623,11859,-3095,658,-93,-3592,-202,-8131,1117,10556,968,-94,-5345,-15777,10561,-6573,-2935,-3056,-91,489,14463,-5203,-5847,-10806,2425,-90,4321,-7930,10858,5437,-15575,6824,-91,-5201,3495,-1011,13208,351,1516,-92,292,10236,-921,-4769,-10314,897,-92,7693,3516,2286,-344,-8133,6430,-92,-6175,-12407,-578,3003,-2677,2080,-92,18102,10008,6485,4760,5725,416,-95,4106,-6781,1777,14021,11550,-97,-99,0,-5889,-8651,1007,9638,-4270,-98,11137,3953,822,6271,9664,2056,-100,365,-12893,-2821,-7026,-3864,-99,-100,4406,-1227,-19875,-823,-1820,-3248,-97,29885,-38608,3946,7865,-4143,-3007,-97,521,7602,-936,-1065,-4908,8767,-98,376,-1085,13099,-2366,-10836,-98,-98,3299,2123,5500,-4383,-2036,-903,-96,-638,-43,13593,82,-5306,-2293,-97,-2860,3310,483,9121,9859,-3002,-97,-10688,-7133,-3901,-5275,-15143,3275,-94,8821,-11051,-5774,-7281,6593,-908,-94,7007,-1443,8834,-7822,-15352,-92,-93,-13962,-8557,11936,3857,8831,634,-93,2188,432,-4609,-4803,10866,1137,-93,8440,-12957,-2512,-851,-1546,934,-92,5406,2815,-6756,1815,10195,-258,-93,-5790,-870,-590,-7053,-11473,-524,-92,-4166,-215,2496,8980,5796,-5206,-92,2007,950,-136,14177,3263,-866,-94,1175,32130,314,29336,21193,-35,-101,6847,1321,48471,-22067,23543,937,-108]}});
\ No newline at end of file
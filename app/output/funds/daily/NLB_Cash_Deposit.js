@@ -0,0 +1 @@
+registerFundSeries("NLB Cash Deposit", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1083309,112,92,89,89,90,92,91,96,95,96,94,94,94,96,48,96,96,95,95,97,97,93,93,93,93,94,93,94,94,95,93,93,94,94,95,93,94,93,96,97,98,95,95,94,94,93,95,96,95,94,95,95,95,95,97,96,96,96,95,96,97,96,96,98,98,95,95,94,95,96,96,96,96,95,96,96,97,95,101,93,96,94,95,96,95,104,101,94,92,110,98,91,91,91,91,111,88,87,89,89,90,89,89,91,91,91,92,90,92,91,91,105,108,89,89,90,89,89,90,92,96,93,92,142,93,90,89,98,89,89,89,91,91,88,90,88,88,89,90,88,88,90,89,89,90,90,89,91,95,94,90,130,89,90,90,92,89,90,94,90,90,89,91,79,78,84,85,86,86,87,85,86,86,85,85,86,85,86,86,86,87,87,87,86,87,87,100,87,87,86,84,84,84,85,84,84,86,87,85,85,86,86,85,85,85,84,85,85,87,85,85,83,82,83,83,83,83,89,79,79,85,79,80,80,80,80,77,77,80,81,79,82,82,81,82,81,82,82,83,83,82,83,82,53,83,82,85,83,83,84,83,39,84,85,81,81,84,71,72,72,69,71,71,69,69,69,67,69,67,68,67,72,71,69,67,67,68,68,42,70,67,81,83,66,67,76,68,71,68,71,70,70,69,47,51,81,65,72,71,66,84,75,12,-31,68,68,69,24,70,79,68,74,74,82,78,74,81,74,73,74,71,83,84,101,73,71,71,67,75,79,83,107,108,80,78,82,130,129,109,74,74,107,77,75,114,79,76,76,64,100,78,63,74,68,69,73,69,65,68,68,66,66,65,70,66,93,64,64,64,66,62,66,49,34,64,65,64,88,82,68,38,67,65,70,-16,45,67,65,65,65,88,111,62,48,7,61,61,23,31,58,65,49,64,65,65,79,-22,8,94,64,64,85,70,88,65,59,65,66,76,71,74,85,85,68,56,89,79,66,71,89,66,65,117,65,97,73,65,65,66,60,80,60,60,63,62,73,77,64,67,-78,30,59,66,-29,122,70,49,62,61,63,60,58,62,53,72,57,76,79,76,98,112,118,58,77,104,73,67,62,57,56,76,69,61,62,59,58,55,74,59,61,65,65,55,55,76,59,64,64,61,57,56,76,67,64,64,65,60,57,76,63,65,60,64,57,59,73,63,64,66,62,44,58,75,73,49,84,64,56,57,76,66,65,65,64,60,58,77,64,65,65,65,57,59,75,69,55,65,58,54,59,76,41,34,44,67,57,58,78,60,61,62,58,69,58,81,94,113,73,66,60,60,77,65,71,59,59,56,56,56,87,60,68,72,57,59,78,58,65,65,67,60,59,84,68,65,65,66,57,59,78,59,20,64,64,57,65,79,62,66,76,66,58,58,77,65,51,76,70,55,58,77,65,65,62,59,57,57,87,71,58,64,65,56,57,80,68,64,63,69,61,58,82,37,72,45,-18,-37,58,67,42,61,73,67,61,73,82,70,-10,-11,49,37,57,81,62,68,64,63,51,55,79,53,71,79,60,62,55,80,45,78,64,67,52,55,85,67,70,75,68,59,61,103,72,71,68,70,64,62,84,70,63,74,58,73,61,85,67,74,61,77,64,62,84,70,72,86,79,54,65,86,82,14,67,69,66,65,86,70,74,65,76,62,62,85,72,73,66,71,58,63,85,69,86,67,79,67,63,87,74,71,73,74,63,65,64,94,72,91,140,108,70,96,69,62,14,2,56,63,89,58,87,69,68,68,64,86,79,68,66,78,71,65,88,76,74,67,66,62,65,84,64,68,78,79,67,65,84,81,62,76,84,61,66,85,77,74,76,79,59,66,84,77,72,74,79,65,68,83,74,76,53,67,64,59,59,106,119,74,67,64,64,92,79,74,69,67,65,65,84,72,75,66,78,63,65,85,115,189,209,137,65,92,94,96,78,107,69,59,63,84,73,41,53,2,-23,63,68,36,36,12,56,66,61,79,63,67,70,105,71,79,90,62,54,67,71,59,62,83,68,70,63,68,63,62,83,74,67,95,89,139,63,93,200,175,107,79,76,62,86,71,70,70,66,58,60,84,87,5,-2,49,50,64,74,23,-22,-40,26,60,59,60,82,63,65,104,97,61,88,140,199,125,8,91,58,59,95,154,164,88,91,59,84,71,62,69,68,66,60,81,25,64,2,-86,-14,60,70,79,48,74,137,146,61,92,146,134,86,70,61,60,89,94,62,67,57,42,59,81,73,80,69,76,59,58,80,68,67,65,66,58,59,59,84,68,66,82,58,55,87,45,18,-13,-26,12,56,60,40,30,50,54,63,57,76,69,53,48,56,38,57,74,32,35,71,124,112,63,91,18,-35,52,56,58,57,74,63,63,46,72,61,57,75,68,64,58,63,59,57,81,65,140,135,121,163,57,57,99,157,114,72,68,57,80,66,66,66,55,57,56,76,62,67,50,71,42,47,72,-7,-77,43,9,7,54,41,-13,35,19,28,49,51,95,78,63,69,68,61,57,73,59,60,67,60,40,55,70,78,56,72,57,65,57,57,81,53,65,72,49,57,73,44,72,68,70,48,57,75,78,63,65,54,64,57,76,60,61,64,73,54,60,77,73,81,98,103,89,58,82,101,111,220,187,95,56,87,81,58,50,-36,57,57,72,-112,-62,-24,52,57,56,71,64,63,59,44,62,57,74,76,64,48,65,43,57,57,81,91,69,79,57,58,57,82,64,69,70,64,58,76,58,100,103,80,58,59,89,77,50,34,58,50,59,75,62,119,63,63,148,58,86,141,164,107,95,58,58,83,54,76,68,60,60,58,76,66,68,65,65,60,58,78,64,61,35,32,12,58,69,39,-5,1,-34,14,59,64,73,63,62,60,57,55,74,57,37,53,58,55,55,74,61,63,56,66,58,55,100,60,142,108,17,57,56,57,83,11,43,57,53,57,71,68,61,59,63,57,57,79,60,66,60,50,64,64,73,53,70,69,64,47,56,71,69,65,59,73,75,56,73,48,61,61,67,50,57,79,65,69,91,57,56,56,84,29,88,74,43,50,49,71,82,64,37,79,41,56,77,58,81,52,40,55,55,76,47,59,63,60,57,55,71,60,62,55,57,63,57,99,71,58,61,62,35,55,67,79,61,57,59,33,54,68,57,82,62,61,42,53,68,54,70,55,64,53,53,69,59,69,52,64,53,53,67,47,55,54,74,43,53,68,67,59,37,56,74,54,68,52,64,53,63,53,53,68,53,63,53,55,61,53,82,64,60,59,62,54,54,69,61,39,35,71,59,52,69,58,58,57,59,52,52,69,56,59,55,61,50,53,92,63,52,62,63,48,50,67,58,61,48,60,52,51,66,36,56,62,70,56,56,74,48,63,62,58,50,51,68,56,56,53,67,50,51,69,58,58,55,60,50,50,69,57,55,40,55,53,50,67,67,58,54,54,50,50,67,63,58,55,59,53,51,68,48,61,66,59,52,51,69,57,65,65,66,59,62,81,64,64,65,68,57,60,79,55,79,61,51,56,51,76,54,85,60,58,58,55,55,83,65,61,65,57,56,74,60,66,102,54,35,57,72,76,52,73,96,102,57,89,67,130,135,123,83,57,89,74,66,72,59,57,58,78,63,34,12,53,46,59,75,60,14,-1,15,33,63,69,66,80,69,67,61,55,77,67,69,63,67,58,59,76,60,46,86,69,53,60,77,61,80,63,61,58,59,76,73,59,61,167,99,50,98,42,1,28,46,58,58,70,64,65,64,66,60,59,76,66,50,79,47,77,58,74,56,41,63,63,67,68,67,90,62,83,61,59,59,75,68,66,66,58,57,58,74,63,61,48,77,78,60,81,66,54,64,68,58,59,82,66,64,63,61,60,59,83,58,73,71,60,60,57,68,60,61,51,73,58,58,73,64,56,58,71,56,56,68,58,79,99,142,41,50,103,57,30,3,9,62,57,62,54,48,57,68,49,54,68,59,57,61,81,38,52,67,74,53,50,58,54,53,49,50,62,59,50,51,50,83,72,50,44,68,45,50,65,54,50,67,49,61,50,65,56,36,63,47,55,48,64,62,51,42,60,53,49,71,59,60,53,26,57,44,44,61,59,40,52,40,40,57,42,34,44,32,57,37,55,41,48,37,38,31,54,56,57,43,45,43,41,40,55,44,39,62,41,38,38,56,33,44,38,49,47,41,54,44,36,48,41,42,38,52,35,70,79,25,74,42,55,20,31,38,53,35,36,43,48,34,44,38,31,33,44,37,37,35,45,58,32,49,38,40,65,88,61,39,66,38,15,14,40,24,34,33,49,41,38,37,36,37,23,36,44,40,12,26,41,48,45,46,60,42,40,40,71,25,61,66,41,40,38,38,38,58,41,39,47,34,48,25,37,37,34,42,34,47,35,81,97,160,78,34,71,38,51,67,87,54,39,67,56,56,48,4,7,44,45,34,48,36,14,-14,45,42,23,12,8,9,42,44,51,55,123,191,227,101,57,104,70,50,51,54,48,49,62,54,53,51,57,62,49,64,47,49,54,55,50,50,65,39,51,57,54,51,51,57,49,66,56,56,51,51,64,56,56,61,54,50,50,63,53,54,55,51,50,50,51,72,55,55,58,48,50,62,36,51,52,51,51,51,69,55,24,42,15,37,51,57,82,69,88,70,52,49,61,55,52,50,52,49,49,49,63,53,48,61,42,50,56,51,54,53,45,46,46,60,52,52,36,43,46,45,56,48,50,40,45,43,42,59,34,33,34,31,31,30,37,39,46,33,33,29,29,40,33,33,31,32,32,28,39,27,30,38,35,21,18,30,35,24,30,32,28,28,39,32,32,32,43,31,35,34,51,39,41,23,26,27,24,35,31,23,27,26,26,38,29,30,30,33,29,29,41,33,29,35,29,30,29,45,35,33,13,31,25,26,39,29,36,32,35,30,30,41,26,37,35,36,31,31,45,34,39,39,42,28,33,45,37,44,48,34,32,32,42,35,36,33,26,32,32,32,47,36,36,39,33,29,46,39,38,39,37,34,34,50,36,42,36,50,31,31,46,40,39,39,38,36,35,48,38,40,40,41,36,36,46,41,43,44,44,38,38,52,44,43,42,50,33,38,51,43,0,44,43,39,38,52,39,49,46,46,37,39,50,30,44,42,45,40,39,54,49,46,48,50,44,45,56,42,56,47,-533,45,45,15,-124,-112,41,21,17,41,47,77,43,129,326,94,39,77,111,54,65,44,39,39,47,188,162,66,41,41,40,59,44,46,42,44,40,40,47,38,45,46,44,40,40,48,383,42,43,42,40,38,48,43,43,42,45,39,41,56,46,44,44,44,40,40,50,36,80,40,42,41,40,50,44,44,47,47,38,41,51,45,11,45,45,35,43,50,61,-221,-409,-82,64,41,42,144,173,150,36,51,40,48,38,42,72,-25,74,41,48,49,42,23,45,21,43,53,90,8,60,80,43,43,43,78,15,40,45,45,39,49,20,22,-151,27,-36,42,42,-68,-7,10,39,39,43,43,56,75,148,140,216,49,78,216,182,117,101,65,37,54,44,38,65,67,43,35,44,36,42,43,33,41,41,52,46,46,43,47,41,45,53,55,40,56,41,38,39,48,45,32,-141,-155,-19,44,26,2,12,-6,-78,-30,44,35,-36,-39,38,52,25,38,45,31,16,3,70,60,39,39,63,83,68,31,42,39,46,52,45,36,40,42,41,38,40,42,57,29,28,33,40,31,37,43,37,28,40,43,50,37,46,33,40,34,44,75,154,33,161,105,34,55,82,46,34,140,164,45,73,157,90,79,44,37,46,38,24,31,35,9,-7,35,47,38,61,66,42,53,47,40,37,43,43,45,43,37,40,41,42,37,37,34,33,42,38,34,37,28,-59,37,48,130,47,44,32,36,36,43,48,24,36,39,36,37,44,41,43,41,44,42,33,41,40,45,45,47,45,47,52,47,58,44,44,48,45,41,51,39,33,45,41,41,49,49,37,43,42,48,44,40,8,-47,-206,25,3,49,41,131,57,-25,125,159,37,83,124,135,71,39,39,39,35,33,39,43,41,37,46,38,40,44,36,38,45,39,37,40,39,39,42,51,47,39,248,40,40,39,43,40,36,36,37,54,44,41,36,33,27,36,36,38,35,43,34,41,41,37,42,47,47,53,51,44,45,44,48,44,41,37,44,43,45,52,44,41,39,45,45,46,48,45,42,46,55,37,45,48,45,46,40,39,42,53,44,41,38,42,43,36,39,45,41,37,41,39,-161,-64,-162,43,39,72,-164,-29,3,41,41,41,48,51,19,42,30,51,45,41,201,224,413,188,43,109,90,50,46,47,43,43,48,56,44,44,46,48,44,40,40,48,44,44,46,49,49,45,54,44,41,37,37,47,42,36,42,47,39,40,54,36,43,45,49,41,52,42,22,45,45,44,40,41,51,44,46,48,-15,98,39,50,45,-198,-4,-170,-22,16,42,-355,-231,22,-37,62,46,41,60,39,-261,-72,47,46,41,46,43,45,43,42,42,56,43,53,44,52,43,43,58,49,30,58,37,57,44,57,47,49,48,50,44,45,59,51,50,48,63,45,46,59,50,39,64,45,35,45,56,71,42,50,55,46,46,53,51,51,23,50,46,46,59,52,51,115,51,46,46,60,51,52,58,50,38,43,53,41,64,60,42,46,47,58,39,48,45,63,46,47,58,48,39,50,56,229,49,48,86,326,364,408,51,52,115,60,58,53,58,46,50,64,55,57,50,53,50,51,64,58,58,57,67,53,51,68,43,55,43,66,51,53,71,61,60,78,65,35,51,71,63,77,-27,69,160,76,90,98,-8,15,143,-65,72,78,-18,44,-99,-212,-140,70,18,-33,-4,85,81,68,73,72,104,78,71,78,72,72,90,98,165,341,400,396,69,169,81,73,66,76,67,67,81,74,76,76,74,76,76,86,77,91,70,75,71,71,88,78,69,77,76,73,71,89,69,82,78,91,67,71,88,77,79,79,75,75,72,89,79,79,77,78,73,72,93,80,41,35,63,59,73,87,92,103,100,64,121,74,96,67,95,106,70,73,74,91,81,80,79,82,80,75,94,74,81,82,86,70,77,87,92,69,-27,-115,78,77,78,60,194,-152,-139,85,84,37,121,1,-67,34,84,84,85,104,143,137,124,26,85,98,-24,120,24,22,73,85,94,78,111,62,119,82,82,108,92,93,98,92,84,83,104,92,91,81,96,84,84,112,87,96,78,95,93,85,105,87,88,77,104,83,84,105,103,248,462,267,273,85,153,276,117,-21,-160,-452,85,-18,-129,51,80,94,90,85,107,85,92,93,106,69,85,106,91,97,91,85,85,82,103,93,29,125,85,70,70,-17,48,111,89,83,75,76,96,96,87,70,89,93,80,104,87,86,87,72,93,77,98,76,85,95,83,85,83,83,110,99,71,100,88,83,107,145,227,197,99,84,85,122,108,113,58,54,62,86,94,58,44,68,78,100,85,105,63,50,92,99,74,85,103,98,93,93,93,94,86,102,100,87,99,91,84,85,103,91,93,92,94,80,86,86,112,100,95,92,91,87,107,108,60,87,0,181,87,106,95,85,86,73,87,81,96,87,90,81,107,87,88,111,91,97,95,95,84,84,103,85,88,79,109,77,84,109,97,87,90,82,84,83,106,99,61,117,101,84,85,103,93,97,91,72,104,84,106,90,83,75,91,87,81,80,107,93,107,98,81,81,80,102,100,137,221,224,85,151,97,189,208,128,73,73,129,100,81,79,81,73,73,93,83,81,79,82,73,73,94,82,87,87,90,83,82,106,84,84,82,84,74,73,92,80,78,77,80,70,70,93,78,78,75,73,75,70,91,78,56,-39,-22,82,75,81,-43,61,-86,-28,37,69,69,67,78,78,95,63,74,96,83,87,100,107,33,72,86,79,75,72,68,76,68,92,78,75,91,83,69,54,86,72,71,81,88,71,70,97,82,70,86,81,67,71,92,72,72,85,85,71,72,71,134,73,90,82,72,72,91,84,82,86,80,67,72,95,83,110,86,68,72,72,100,118,146,117,110,98,72,106,75,78,64,118,66,72,98,82,74,73,61,71,72,89,66,33,55,71,72,73,98,77,60,74,102,76,76,101,83,63,74,72,73,72,94,81,59,36,27,92,73,91,82,65,95,81,78,72,97,86,78,71,79,90,74,102,62,65,68,114,74,74,113,83,51,100,91,73,74,97,83,82,80,82,73,73,98,82,69,65,104,73,73,103,82,62,86,62,63,73,88,122,92,80,83,69,73,72,103,84,79,77,73,72,95,82,80,83,77,75,72,95,82,70,81,80,75,74,96,84,86,88,81,58,69],"returnScale":1000000,"returns":[0,103,85,82,83,83,85,84,88,88,89,86,87,87,88,45,88,89,88,87,90,90,85,86,86,86,87,86,86,87,88,86,85,87,87,88,86,86,86,89,89,91,87,88,87,87,86,87,89,88,86,88,88,87,88,90,88,89,88,88,89,89,89,89,90,91,87,88,87,87,89,89,88,89,88,88,89,89,88,93,86,89,86,88,89,87,96,94,86,85,102,90,84,84,84,84,103,81,80,83,82,83,82,82,84,84,84,85,83,85,84,84,97,100,82,82,83,82,82,83,85,89,86,85,131,86,83,82,90,83,82,82,84,84,81,83,81,82,82,83,81,81,83,83,82,83,83,82,84,88,87,83,120,82,83,83,85,82,83,87,83,83,82,84,73,72,78,78,79,80,80,79,79,79,79,78,80,78,80,79,79,81,80,80,80,80,80,93,80,80,80,77,78,77,79,77,78,79,80,79,78,80,79,79,78,79,77,79,78,80,79,78,77,76,76,77,76,77,82,73,73,78,73,74,74,74,74,71,71,74,75,73,75,76,75,75,75,76,76,76,77,75,77,76,49,76,76,78,77,77,77,77,36,77,79,75,74,78,65,67,66,64,66,65,64,64,63,62,64,62,62,62,67,65,64,62,62,62,63,39,65,61,75,77,61,62,70,63,65,63,65,65,65,63,44,47,75,60,66,66,60,78,69,11,-28,62,63,64,22,65,73,62,69,68,76,72,68,75,68,67,69,65,77,77,94,67,66,65,62,69,73,77,99,99,74,72,76,120,119,101,68,68,99,71,69,105,73,71,70,59,92,72,58,69,62,64,67,64,60,63,63,61,60,60,65,61,86,59,59,59,61,57,61,45,32,59,60,59,81,76,63,35,62,60,64,-15,42,62,60,60,60,81,103,57,44,7,56,56,21,29,54,60,45,59,60,60,73,-21,8,87,59,59,78,65,81,60,55,60,60,71,65,68,79,78,63,52,82,73,61,65,83,60,60,109,60,89,67,60,60,61,56,74,55,55,59,57,67,71,59,62,-72,28,54,61,-27,113,65,45,57,56,59,55,54,57,49,66,53,70,73,70,90,104,109,53,71,96,68,62,57,52,52,70,64,56,58,54,54,50,69,54,56,60,60,51,51,70,55,59,59,56,53,51,71,61,59,60,60,55,53,70,58,60,55,59,53,54,68,58,59,61,57,41,53,70,67,45,78,59,51,53,70,61,60,60,59,56,53,71,59,60,60,60,53,54,70,63,51,60,54,50,54,70,38,31,41,62,52,54,72,55,57,57,53,64,54,74,87,105,67,61,55,56,71,60,65,55,54,52,52,51,81,55,63,66,53,54,72,54,60,60,62,55,54,78,63,60,60,61,52,55,72,54,19,59,59,52,60,73,58,61,70,61,53,54,71,60,47,70,65,50,54,71,60,60,57,55,52,53,80,66,53,59,60,52,53,74,62,59,59,63,57,53,76,34,66,42,-17,-34,54,62,38,57,67,62,56,68,75,65,-9,-10,45,34,53,74,58,62,59,59,47,50,73,49,66,73,55,57,51,74,42,72,59,61,48,51,79,62,64,69,63,55,56,95,66,66,63,64,59,58,77,65,58,68,54,67,57,78,62,68,56,72,59,57,77,65,66,80,73,50,60,79,76,13,61,64,61,60,80,64,68,60,71,57,57,79,66,67,61,66,53,59,78,64,79,62,73,62,58,80,68,66,67,69,58,60,59,87,66,84,129,100,65,88,64,57,13,2,52,58,82,54,80,64,62,63,59,80,73,62,61,72,66,60,81,70,68,62,61,57,60,78,59,63,72,73,62,60,77,75,57,70,78,56,61,79,71,68,70,73,54,61,78,71,66,69,73,60,62,77,68,71,48,62,59,55,54,98,110,68,62,59,59,85,73,69,63,62,60,60,78,66,69,61,72,58,60,79,106,174,193,127,60,85,87,88,72,99,64,54,58,78,67,38,49,2,-21,58,62,34,33,11,52,61,56,73,58,62,64,97,66,73,83,57,50,62,65,55,57,77,63,64,58,63,58,57,77,68,62,88,82,128,59,85,185,162,98,73,70,58,79,66,64,65,61,53,56,77,80,5,-2,45,47,59,68,21,-20,-37,24,55,55,55,76,58,60,96,90,56,81,129,184,116,7,84,53,55,88,142,151,81,84,55,77,66,57,64,63,61,55,75,23,59,2,-80,-13,56,64,73,45,68,126,135,56,85,135,124,79,65,56,56,82,87,57,62,52,39,54,75,68,73,64,70,55,53,74,63,62,60,61,53,55,54,78,62,61,76,54,50,81,41,17,-12,-24,11,52,55,37,28,46,50,58,52,71,63,49,44,52,35,53,68,30,32,66,114,103,59,84,16,-32,48,52,53,53,68,58,58,43,66,57,52,69,63,59,54,58,54,53,75,60,129,125,111,151,52,53,91,145,106,66,63,52,74,61,61,61,51,52,52,70,58,61,47,65,39,43,67,-7,-71,40,8,7,49,38,-12,33,17,26,45,47,88,72,58,64,63,56,53,67,54,56,62,55,37,51,64,72,52,67,52,60,53,52,75,49,60,67,45,52,68,40,67,63,64,45,52,69,72,59,60,49,59,53,70,56,56,59,67,50,56,71,67,75,90,95,83,53,76,93,102,204,172,88,52,80,75,53,46,-33,53,52,67,-104,-57,-22,48,53,51,66,59,58,55,40,57,53,68,71,59,44,60,40,52,53,75,84,63,73,53,53,53,76,59,63,65,59,54,70,53,93,95,74,53,55,82,71,46,31,54,46,55,69,57,110,58,58,137,53,80,130,151,99,88,53,54,76,50,70,63,56,55,54,70,61,62,60,60,56,53,72,59,57,32,30,11,53,64,36,-5,1,-31,13,54,59,68,58,57,55,53,51,68,53,34,49,53,51,51,68,56,59,51,61,54,51,92,55,131,100,16,52,52,53,76,10,40,53,49,52,66,63,56,54,59,52,53,73,55,61,55,47,59,59,67,49,65,63,59,44,51,66,64,60,54,68,69,51,68,44,56,57,62,46,52,73,60,64,84,53,51,52,78,26,82,68,40,46,45,66,75,59,34,73,38,52,71,54,74,48,37,51,51,70,43,55,58,55,53,51,65,56,57,51,52,58,53,91,66,53,57,57,32,51,62,73,56,53,54,31,50,62,53,76,57,56,39,49,63,49,65,51,59,49,49,64,54,64,48,59,49,49,61,44,51,49,69,39,49,63,62,54,35,51,69,49,63,48,59,49,58,49,49,63,49,58,49,51,56,49,76,59,55,55,57,50,50,63,57,36,32,65,55,48,64,53,54,52,55,48,48,63,52,55,50,57,46,49,85,58,48,57,58,45,46,62,53,56,45,55,48,47,61,33,52,57,65,52,51,69,44,58,57,54,46,47,63,51,52,49,62,46,47,64,53,54,51,55,46,46,64,53,50,37,51,49,46,62,62,53,50,50,46,46,62,58,54,51,54,49,47,63,44,57,61,54,48,47,64,52,60,60,61,55,57,75,59,59,60,63,52,56,73,50,73,57,47,51,48,70,50,78,55,54,53,51,51,77,60,56,60,53,51,69,55,61,94,50,32,53,66,70,48,68,88,95,52,82,62,120,125,113,77,53,82,68,61,66,55,53,53,72,58,32,11,49,42,55,69,55,13,-1,14,30,59,63,61,74,64,62,56,51,71,62,63,58,62,54,54,70,56,42,80,63,49,56,71,56,74,58,56,54,54,71,67,54,57,154,91,46,91,39,1,25,43,53,54,65,59,60,59,61,55,55,70,61,46,73,43,71,54,68,52,38,58,58,62,62,62,83,58,76,57,54,54,70,62,61,61,54,52,54,68,58,57,44,71,72,56,74,61,50,59,63,54,54,76,61,59,58,56,56,54,77,53,68,65,55,56,52,63,56,56,47,67,54,53,68,59,52,53,66,51,52,63,53,73,92,131,38,46,95,52,28,3,8,57,53,57,50,44,53,63,45,50,63,54,53,56,75,35,48,62,68,49,46,54,50,49,45,46,57,55,46,47,46,77,66,46,41,63,41,46,60,50,46,62,45,57,46,60,52,33,58,43,51,44,59,58,47,39,55,49,45,66,54,55,49,24,53,41,40,57,54,37,48,37,37,52,39,32,40,30,52,34,51,38,44,35,35,28,50,52,52,40,42,39,38,37,51,41,36,57,38,35,35,51,31,41,35,45,43,38,50,41,33,44,38,39,35,48,32,65,73,23,68,39,51,18,29,35,49,32,33,40,44,32,40,35,29,30,41,34,34,33,41,54,29,45,35,37,60,82,56,36,61,35,14,13,37,22,31,31,45,38,35,34,33,34,22,33,40,37,11,24,38,45,41,43,55,39,37,37,65,23,57,60,38,37,35,35,35,54,38,36,43,32,44,23,34,34,32,38,32,43,33,74,90,148,72,31,65,36,47,61,81,50,36,61,52,52,44,4,6,41,41,32,44,33,13,-13,42,39,21,11,7,9,38,41,47,51,113,177,209,94,52,96,65,46,47,50,44,45,58,50,48,48,52,57,46,59,43,45,50,51,46,46,60,36,47,53,50,47,47,53,45,61,51,52,47,47,59,52,52,56,50,46,46,58,49,50,51,47,46,46,47,67,51,50,54,44,46,58,33,47,48,47,47,47,64,51,22,38,14,34,48,52,76,64,81,64,48,46,56,51,48,46,48,45,45,46,58,49,44,56,39,46,52,47,50,49,41,43,42,56,48,48,33,40,42,42,51,45,46,37,41,40,39,54,31,31,31,29,29,27,34,36,43,30,31,27,26,37,31,30,29,29,30,26,36,25,27,35,33,19,17,27,33,22,28,29,26,26,36,29,30,29,40,29,32,31,47,36,38,22,24,24,23,32,29,21,25,24,24,35,27,27,28,30,27,27,38,30,27,32,27,28,27,41,32,31,12,29,23,24,36,26,34,29,32,28,28,38,24,34,32,33,29,29,41,32,36,36,38,26,31,41,34,41,44,32,29,30,38,33,33,30,24,30,30,29,43,34,33,36,30,27,43,36,35,36,34,31,32,46,33,39,33,46,29,28,43,37,36,36,35,33,32,45,35,37,37,37,34,33,42,38,40,41,40,35,35,48,41,40,38,47,30,35,47,40,0,41,39,36,35,48,36,46,42,42,35,36,46,27,41,39,41,37,36,50,45,43,44,46,41,41,52,39,52,43,-492,42,41,14,-115,-103,38,19,16,38,43,71,40,119,301,87,36,71,102,50,60,41,36,36,43,174,149,61,38,38,37,54,41,42,39,41,37,37,43,35,42,42,41,37,36,45,353,39,40,39,37,35,44,40,39,39,42,36,37,52,43,40,41,40,37,37,46,34,74,36,39,38,37,46,41,40,44,43,35,38,47,42,10,41,42,32,40,46,56,-204,-377,-76,59,38,39,133,159,139,33,47,37,44,36,38,67,-23,68,38,44,45,39,21,42,19,40,49,83,7,56,74,39,40,40,72,14,36,42,42,36,45,18,21,-140,25,-33,39,38,-62,-7,9,36,36,40,40,51,70,136,130,199,45,72,200,168,108,93,60,34,50,40,36,60,61,40,32,41,33,39,40,30,38,38,48,42,43,39,44,38,41,49,51,37,52,37,35,36,45,41,30,-130,-143,-18,41,24,2,11,-6,-72,-28,41,32,-33,-36,35,48,23,35,42,28,15,3,65,55,36,36,58,77,63,28,39,36,42,48,42,33,37,39,38,35,37,38,53,27,26,30,37,29,34,40,34,26,36,40,46,35,42,30,37,32,40,70,142,30,149,97,31,51,76,42,31,130,151,42,67,145,83,73,41,34,42,35,22,29,32,9,-7,32,44,35,56,61,39,49,43,37,34,40,40,41,40,34,37,38,39,34,34,31,31,39,35,31,34,26,-54,34,44,120,43,41,30,33,33,40,44,22,33,36,34,34,40,38,40,38,40,39,31,38,36,42,42,43,41,44,48,43,54,40,41,44,42,38,47,36,30,42,38,37,46,45,34,40,39,44,40,37,8,-44,-190,23,3,45,38,121,53,-23,115,147,34,77,114,125,65,36,36,36,32,31,36,40,37,35,42,35,37,41,33,35,42,36,34,37,36,36,38,47,44,36,229,37,37,36,39,37,34,33,34,50,40,38,33,31,25,33,33,35,33,39,32,38,37,35,38,44,43,49,47,41,41,41,44,41,38,34,40,40,42,48,40,38,36,42,41,43,44,42,38,43,51,34,41,45,41,43,36,36,39,49,41,38,35,38,40,33,36,42,38,34,38,36,-149,-59,-149,39,36,67,-152,-26,2,38,38,38,44,47,18,39,27,47,42,38,185,207,381,174,40,100,83,46,43,43,40,40,44,52,40,41,42,45,40,37,37,44,41,41,42,45,46,41,50,41,37,35,34,43,39,33,39,43,36,37,50,33,40,41,46,38,48,38,21,41,42,40,37,38,47,41,42,45,-14,90,36,46,42,-183,-4,-157,-20,15,39,-328,-213,20,-34,57,43,37,56,36,-241,-67,44,42,38,43,39,42,40,38,39,52,39,49,41,48,40,39,54,45,28,53,35,52,41,52,44,45,44,46,41,42,54,47,46,45,58,41,43,54,46,36,60,41,32,42,52,65,39,46,51,42,43,49,47,47,21,46,43,42,55,48,47,106,47,42,43,55,47,48,54,46,35,40,49,38,59,55,39,42,44,53,36,44,42,58,43,43,54,44,36,46,52,211,45,45,79,301,336,377,47,48,106,55,54,49,53,43,46,59,51,52,46,49,47,47,59,53,54,52,62,49,47,63,40,50,40,61,47,49,66,56,55,72,60,33,47,65,58,71,-24,63,148,70,83,91,-8,14,132,-60,67,72,-17,41,-92,-196,-129,65,16,-30,-4,79,75,62,68,66,96,72,66,72,66,67,83,90,153,314,370,365,64,156,75,67,61,70,62,62,74,69,70,70,68,71,70,79,71,84,65,69,66,65,81,72,64,71,70,68,65,82,64,76,72,84,62,65,81,71,73,73,70,69,66,82,73,73,71,72,68,66,86,74,38,32,58,55,67,80,85,95,93,59,111,69,88,62,88,98,64,68,68,84,75,74,73,75,74,69,87,68,75,76,79,65,71,80,85,64,-25,-106,72,71,72,55,179,-140,-128,78,78,34,112,1,-62,31,78,77,79,96,132,126,115,24,78,90,-22,111,22,21,67,78,87,72,103,57,110,75,76,100,85,86,90,85,78,76,96,85,84,75,88,78,78,103,80,89,72,88,85,79,97,80,81,71,96,77,78,96,96,228,427,246,252,79,141,255,108,-19,-148,-417,78,-17,-119,47,74,87,83,79,98,79,85,86,97,64,79,97,84,90,84,78,79,76,95,86,26,116,78,65,64,-15,44,102,83,76,69,71,88,89,80,65,82,86,74,96,80,79,81,66,86,71,91,70,78,88,76,79,77,76,102,91,66,92,81,77,99,133,210,182,91,78,78,113,99,105,53,50,57,80,87,53,41,62,72,93,78,97,58,47,84,92,68,79,95,90,86,86,86,86,80,94,92,81,91,84,78,78,95,84,86,85,87,73,80,79,104,92,88,85,84,80,99,99,56,80,0,167,80,98,88,78,80,67,81,74,89,80,83,75,99,80,81,103,84,89,88,88,77,78,95,78,82,73,100,71,78,100,90,80,83,76,78,76,98,91,57,108,93,78,78,95,86,89,84,67,96,77,98,83,77,69,84,81,74,74,99,86,99,90,75,75,73,95,92,126,204,207,79,139,89,175,192,118,68,67,119,92,75,73,75,67,68,85,77,75,73,75,68,67,87,76,80,80,83,77,76,97,78,78,75,78,68,67,85,74,72,71,74,65,64,86,72,72,69,68,69,65,84,72,51,-36,-20,76,69,75,-40,56,-79,-26,34,64,64,62,72,72,87,58,69,88,77,80,93,98,31,66,80,73,69,66,63,70,63,85,72,69,84,77,63,50,80,66,66,74,82,65,65,89,76,65,79,75,62,65,85,67,66,79,78,66,66,66,123,68,83,75,67,66,84,78,76,79,74,62,66,88,76,102,79,63,67,66,92,109,135,108,102,90,67,97,70,72,59,109,61,66,90,76,69,67,56,66,66,82,61,31,51,65,67,67,90,71,56,68,94,70,71,93,76,59,68,66,68,66,87,75,54,33,25,85,68,84,75,60,88,75,72,66,90,79,72,66,73,83,68,94,58,60,62,106,68,68,104,77,47,92,84,68,68,90,76,76,74,76,67,67,91,75,64,60,96,68,67,95,76,57,79,58,58,67,81,113,85,74,76,64,67,67,95,77,73,71,68,66,88,76,74,76,71,70,66,88,75,65,75,74,69,68,89,77,80,81,75,53,64]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB Cash Fund", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[10664081,2536,1084,1003,928,928,3556,463,1031,1076,1075,1026,1120,1136,1049,1048,1078,1038,1026,1044,1109,1139,1043,1037,1035,1031,1031,1035,1041,972,1240,1025,1025,1028,1034,988,1263,880,1026,1026,1024,1060,1610,855,1059,1026,1027,1029,1035,1061,1028,1028,1029,1026,1022,1030,1048,1090,1012,1011,1006,1033,1070,1071,1013,1029,1030,1030,1030,962,1253,1021,1054,1055,1055,1028,1020,1113,977,1016,1271,1270,1045,1024,1009,1060,1042,1018,1020,1019,1418,1013,1012,333,1012,1008,1463,1007,1010,1010,1756,1016,1003,1004,1007,1068,996,976,1055,995,995,993,1425,1000,1090,999,999,996,999,1000,1022,991,991,989,2320,998,1001,987,751,927,933,925,1408,813,923,918,914,914,926,922,924,924,922,922,922,921,942,924,978,939,945,946,2036,1070,903,1045,917,1102,1101,823,870,870,872,887,874,868,870,890,893,877,863,869,869,822,922,851,855,857,897,897,858,843,882,846,823,823,824,1023,865,815,814,812,812,812,812,812,800,810,769,770,770,769,770,779,767,768,768,768,776,804,768,901,823,824,823,818,803,761,1017,821,824,824,812,812,813,805,780,809,812,857,807,825,935,870,807,807,806,807,809,800,814,810,810,777,788,809,816,798,811,810,848,948,776,853,818,810,811,811,814,814,812,812,812,813,812,812,812,813,815,844,842,825,719,1122,839,767,767,765,765,751,737,745,909,910,572,571,869,580,579,576,572,572,570,545,573,609,611,617,617,229,1618,581,506,-1336,58,591,592,627,247,601,678,594,673,4767,998,2076,650,681,673,673,904,632,612,666,1267,665,665,665,820,667,670,667,665,1270,671,675,682,876,667,668,668,670,669,669,549,1186,682,678,637,669,669,668,734,699,659,658,490,949,654,655,657,657,597,597,604,607,1084,607,608,410,617,612,603,594,585,601,600,574,596,609,514,584,600,824,602,527,586,604,603,602,920,362,794,606,685,591,590,484,481,479,594,596,591,595,593,550,902,571,565,599,586,468,432,750,572,599,592,593,1016,595,594,553,795,590,589,592,592,589,594,589,590,589,548,594,436,614,588,594,591,660,592,592,594,598,597,590,838,592,593,593,595,593,593,593,593,626,604,592,592,591,593,594,594,592,593,593,592,593,886,594,593,594,594,593,621,602,595,591,394,596,595,592,592,560,594,592,592,592,601,597,612,588,586,587,399,547,588,575,292,597,588,588,364,605,602,1001,509,585,585,707,505,587,583,692,585,585,585,587,589,592,628,577,589,983,853,583,608,596,596,597,594,594,596,601,1019,596,595,582,599,606,595,740,599,593,578,650,596,647,696,588,586,586,576,552,557,571,566,566,568,574,564,560,491,573,568,217,594,1338,560,558,561,560,-581,573,571,560,584,580,579,579,554,1968,573,602,597,586,580,554,583,582,583,585,585,973,454,566,585,586,588,581,553,586,564,995,582,995,991,722,1145,427,838,242,582,581,581,848,238,617,471,582,583,583,558,543,912,586,585,586,584,655,580,584,583,584,584,383,1262,579,563,750,585,584,584,576,583,993,567,566,588,585,580,585,530,569,588,1008,-886,623,558,634,566,580,586,582,582,585,584,601,580,583,584,583,679,773,588,590,588,589,424,597,474,982,585,587,626,651,662,852,617,621,620,527,629,500,656,604,621,621,829,679,618,600,766,631,624,168,556,657,571,559,574,571,574,1032,572,937,511,581,574,561,579,661,584,585,585,586,598,612,589,594,489,629,628,584,540,570,500,628,624,626,-162,651,829,616,908,626,620,-857,2135,623,625,508,621,624,625,624,993,659,749,940,827,-2500,3873,607,494,468,609,625,775,596,661,629,618,636,624,627,830,768,600,640,641,627,627,637,631,740,662,623,629,629,632,651,633,1023,1004,628,651,650,602,641,-378,622,632,627,1660,635,627,637,617,626,623,643,807,1651,737,606,611,570,773,625,586,614,624,614,614,1001,1050,631,623,617,618,617,893,1026,623,729,610,579,583,582,593,587,588,588,587,-913,-1690,1289,1340,17939,540,540,520,607,1171,1314,597,583,589,589,592,542,528,423,377,560,548,490,497,449,540,568,560,218,552,1496,565,178,570,1187,557,539,-17,1188,549,549,549,562,562,562,553,562,562,561,562,535,535,534,534,534,534,534,534,533,530,536,536,536,513,512,507,509,510,495,493,442,1107,580,509,501,511,512,506,491,500,505,502,504,505,505,506,505,571,508,507,504,494,511,512,507,535,540,534,533,865,838,921,537,538,533,422,533,533,535,536,536,536,534,535,536,523,-9991,11059,537,674,666,537,536,526,539,535,536,539,601,1029,1037,541,542,522,514,540,700,433,532,533,693,692,538,536,536,537,537,536,536,524,540,536,537,537,538,538,539,541,542,527,527,852,936,528,525,525,526,527,517,527,559,525,518,518,519,518,519,496,518,612,609,518,545,485,517,520,528,526,517,469,508,491,516,975,520,519,507,525,447,513,621,638,517,517,500,501,500,500,503,503,614,510,539,535,528,549,509,509,500,807,461,972,873,438,432,445,453,572,443,441,441,522,521,437,445,445,445,445,444,446,448,565,462,442,442,443,442,442,433,432,475,472,726,474,557,558,474,473,474,474,-4210,5174,548,616,529,474,475,474,473,474,474,474,473,473,550,473,582,582,475,474,419,473,734,731,475,474,475,474,485,164,704,460,468,468,641,562,403,433,467,410,409,593,804,649,772,903,820,473,667,973,1127,3331,2665,1231,513,690,765,460,334,-803,527,526,720,-1879,-928,-446,503,494,494,569,543,547,485,284,581,515,684,759,543,663,587,358,533,534,696,818,779,773,498,498,497,-1035,218,1365,-311,622,519,1293,4719,4168,1331,996,510,509,-21,982,28,-190,-91,317,520,346,352,4828,-3796,794,2752,524,2918,2808,1558,8525,-100,487,486,-1455,367,5316,-4003,280,533,482,475,3324,696,2826,469,518,480,564,510,464,-446,-293,-754,479,528,-177,-1321,-3037,5257,-740,452,-5622,886,467,2492,1987,491,425,617,351,460,310,443,404,424,617,3031,-425,509,2288,503,455,945,-4892,1817,1296,-247,822,823,822,713,-843,-820,683,412,473,560,1396,-2123,402,490,453,453,859,2811,737,2054,282,883,738,-3412,344,805,1005,457,305,424,484,537,496,386,1003,648,421,793,259,153,439,3262,351,469,-2128,500,636,778,450,450,450,574,102,733,631,766,1062,440,504,633,482,211,671,291,451,750,672,640,306,267,412,413,576,331,449,519,524,428,410,546,461,441,383,448,499,433,635,531,483,694,698,172,426,585,772,504,453,509,-30,228,572,488,825,492,539,285,462,683,411,694,336,653,463,463,631,548,1057,1002,547,463,449,610,363,466,493,692,351,454,578,888,505,254,486,697,459,589,411,586,440,563,462,458,578,458,534,450,451,595,457,1154,503,497,495,496,521,520,580,542,428,195,644,515,431,568,458,471,423,473,431,431,514,478,482,449,495,388,437,920,1012,401,547,469,413,425,567,487,537,377,448,453,453,454,190,520,636,696,491,473,872,615,704,571,515,459,461,940,513,489,594,929,463,463,618,498,514,494,552,465,468,613,511,518,265,511,501,461,562,786,549,480,497,447,457,638,578,593,477,561,481,466,654,326,611,687,551,468,467,789,492,583,577,592,520,519,807,684,527,585,592,492,517,715,406,789,629,555,655,525,743,529,682,612,501,579,529,528,797,665,601,718,533,519,696,525,602,1201,393,178,516,645,824,412,806,1152,1347,574,833,657,1766,1778,1553,1032,575,837,777,628,762,538,579,578,754,649,63,-302,390,339,576,730,517,-341,-553,-210,80,577,744,629,864,653,2876,1065,545,671,500,652,564,645,548,548,741,609,313,875,601,443,540,655,512,756,554,553,520,541,656,670,522,632,2815,1579,576,1390,441,-317,-45,356,550,539,639,378,580,540,976,540,540,665,584,333,794,343,800,539,657,469,294,579,1254,1109,1109,1109,895,669,1173,512,556,557,508,871,539,557,435,529,559,560,501,516,269,726,820,532,605,566,199,526,649,512,512,1042,673,543,542,503,571,547,1190,564,575,594,574,631,569,575,524,561,360,774,540,540,694,540,498,526,673,519,537,644,598,959,1311,2291,332,551,1392,529,54,-321,-162,640,564,539,502,374,568,468,246,228,436,442,461,450,535,266,429,500,619,2460,320,440,387,376,186,399,556,729,376,376,375,691,685,350,482,645,356,422,431,414,342,656,370,521,386,543,444,229,552,353,459,385,533,504,387,499,268,460,405,947,516,527,492,51,538,362,362,556,558,395,395,348,348,569,346,315,455,209,644,362,539,479,420,291,525,819,806,259,603,522,405,404,421,421,428,370,569,612,209,172,172,414,183,446,368,401,401,348,509,459,357,401,382,447,392,400,358,622,791,226,1105,401,408,111,248,372,400,347,357,416,548,319,493,357,339,355,542,389,411,410,458,722,354,451,368,387,536,985,752,470,874,684,152,239,501,325,438,438,542,499,428,422,440,442,529,381,464,331,165,300,453,532,471,452,593,479,502,460,558,763,771,886,505,500,452,452,451,577,453,458,622,451,552,335,493,438,400,567,452,547,445,1141,1235,1878,997,454,771,498,584,829,1037,685,482,997,707,512,471,-64,-61,395,426,343,485,291,48,-588,453,443,126,45,32,54,430,450,539,523,1282,1999,2884,1195,571,1325,1129,483,478,466,453,461,619,474,537,435,533,620,471,641,371,480,449,529,491,492,325,586,396,528,476,482,483,488,492,902,905,445,445,445,613,488,489,486,486,482,483,479,486,486,481,486,483,507,507,516,512,468,521,457,472,635,548,471,528,493,486,487,792,918,186,381,131,360,499,471,854,618,798,668,505,463,635,522,499,464,464,464,462,463,657,533,531,614,296,441,1408,465,601,522,465,467,467,542,535,503,499,606,441,430,765,623,427,433,-8791,9623,399,478,424,452,400,427,400,399,482,405,606,630,368,338,336,426,361,359,362,359,356,328,397,340,350,396,378,386,355,463,402,326,369,376,349,349,426,430,468,365,436,329,353,352,740,347,430,260,317,314,408,385,318,292,317,315,313,430,325,333,336,331,333,333,335,335,342,340,654,654,655,357,407,605,305,383,292,295,374,585,444,356,641,634,323,292,313,321,327,309,590,590,457,394,393,341,439,280,324,465,333,349,385,405,394,393,401,353,441,383,363,354,353,354,515,414,319,415,362,353,366,350,307,389,387,341,341,377,267,422,313,306,306,306,482,307,396,344,420,274,354,356,368,345,356,337,349,348,310,397,310,352,358,311,311,439,356,397,349,363,259,308,494,302,423,342,302,301,302,478,348,302,356,355,324,342,414,385,430,330,425,358,358,516,426,374,350,450,399,398,405,315,522,-10348,-4724,355,355,-81,-1547,-1423,407,385,126,431,369,912,362,1414,-5923,1126,392,948,1351,603,762,510,396,392,517,2401,2091,854,325,399,393,528,442,458,425,426,451,425,535,430,468,443,472,408,407,520,457,434,459,446,450,411,546,427,424,422,418,344,377,517,463,431,442,430,383,383,518,434,429,431,417,384,384,521,435,431,471,515,414,459,591,509,507,474,539,402,461,599,655,-2497,-4618,-1120,815,485,502,1843,2231,1906,411,643,488,596,476,524,890,-399,927,493,572,538,487,228,513,192,497,596,1088,48,696,979,516,517,516,798,109,512,562,615,524,661,204,224,-2485,337,-682,528,533,-2767,-240,68,504,527,556,556,677,1191,2404,1863,2998,560,894,2923,3153,1787,1503,1045,558,741,644,539,1118,1161,707,559,716,537,602,545,441,563,562,682,676,594,566,624,531,593,595,672,544,617,569,541,555,651,646,402,-2540,-2660,-468,557,404,-94,90,-206,-1339,-581,552,466,-739,-796,634,743,348,552,644,427,147,-21,1013,872,553,553,717,1262,1032,351,622,573,655,786,733,505,591,600,599,569,603,600,906,409,483,576,647,500,600,713,611,454,577,656,731,461,769,516,670,578,661,1449,2724,577,2907,1902,578,843,1888,753,545,2303,2420,577,878,2534,1369,1237,643,565,678,579,-1654,500,566,60,-113,551,590,575,931,1173,635,871,569,568,543,570,576,563,540,605,572,577,574,572,572,540,540,635,575,572,571,640,-822,480,499,1772,623,571,448,490,507,578,773,283,499,541,474,493,570,550,530,486,516,550,587,494,489,491,521,522,491,491,591,534,526,532,526,493,584,494,619,447,494,526,494,494,568,585,468,548,534,548,635,536,42,-746,-3108,455,-92,594,544,1654,665,-351,1708,2196,537,903,1823,1993,795,736,557,556,526,594,525,562,562,594,559,529,565,593,528,466,648,556,526,591,570,565,571,537,635,537,2363,563,565,560,525,618,524,560,554,738,640,644,552,525,402,543,554,554,528,528,609,559,558,545,570,540,540,632,567,566,565,564,532,532,626,569,564,554,567,601,534,630,504,564,569,568,598,566,537,572,691,453,560,537,623,537,585,554,575,567,603,568,536,573,568,569,569,598,568,537,573,592,-2566,-781,-2119,571,538,975,-2185,-287,51,572,572,572,643,687,243,579,424,665,607,573],"returnScale":1000000,"returns":[0,238,101,95,87,87,333,43,97,101,101,96,105,107,98,98,101,98,96,98,104,107,97,98,97,96,97,97,98,91,116,96,96,97,97,92,119,82,97,96,96,99,151,80,100,96,96,97,97,99,97,96,96,97,95,97,98,103,94,95,95,96,101,100,95,97,96,97,96,91,117,96,99,99,99,96,96,104,92,95,119,119,98,96,95,99,98,95,96,96,133,95,94,32,95,94,137,95,94,95,165,95,94,94,95,100,93,92,99,93,93,93,134,94,102,94,93,94,93,94,96,93,93,93,217,94,94,92,71,87,87,87,132,76,87,86,85,86,87,86,87,87,86,87,86,86,89,86,92,88,89,89,190,101,84,98,86,104,103,77,82,81,82,83,82,82,81,84,83,83,81,81,82,77,86,80,80,80,85,84,80,79,83,79,77,78,77,96,81,76,77,76,76,76,76,76,75,76,72,73,72,72,72,73,72,72,72,72,73,75,72,85,77,77,78,76,76,71,95,77,78,77,76,76,76,76,73,76,76,80,76,77,88,82,75,76,76,75,76,75,76,76,76,73,74,76,76,75,76,76,80,89,72,80,77,76,76,76,77,76,76,76,76,77,76,76,76,76,77,79,79,77,68,105,78,72,72,72,72,70,69,70,85,86,53,54,81,55,54,54,54,53,54,51,54,57,57,58,58,21,152,54,48,-125,5,55,56,59,23,56,64,56,63,447,93,195,61,64,63,63,85,59,57,63,119,62,62,63,77,62,63,63,62,119,63,63,64,82,63,63,62,63,63,62,52,111,64,64,59,63,63,63,68,66,62,61,46,89,62,61,62,61,56,56,57,57,101,57,57,39,58,57,57,55,55,57,56,54,56,57,48,55,56,77,57,49,55,57,56,57,86,34,74,57,64,56,55,45,46,44,56,56,55,56,56,51,85,54,53,56,55,44,40,70,54,56,56,55,96,55,56,52,75,55,55,56,55,55,56,55,56,55,51,56,41,57,56,55,56,62,55,56,55,56,56,56,78,56,55,56,56,55,56,56,55,59,57,55,56,55,56,55,56,55,56,56,55,56,83,56,55,56,56,55,58,57,56,55,37,56,56,55,56,52,56,56,55,56,56,56,57,55,55,55,38,51,55,54,28,56,55,55,34,57,56,94,48,55,54,67,47,55,55,65,55,54,55,55,56,55,59,54,55,92,80,55,57,56,56,56,56,55,56,57,95,56,56,54,57,56,56,70,56,55,55,60,56,61,65,55,55,55,54,52,52,54,53,53,53,54,53,53,46,53,54,20,56,125,53,52,53,52,-54,53,54,52,55,54,55,54,52,185,53,57,56,55,54,52,55,54,55,55,55,91,42,54,54,55,55,55,52,55,53,93,55,93,93,67,108,40,78,23,55,54,55,79,23,57,45,54,55,54,53,51,85,55,55,55,55,61,55,54,55,55,55,35,119,54,53,70,55,55,55,54,54,93,54,53,55,55,54,55,50,53,55,95,-83,58,52,60,53,54,55,55,54,55,55,56,55,54,55,55,63,73,55,55,56,55,40,55,45,92,55,55,59,61,62,80,57,59,58,49,59,47,62,56,59,58,78,63,58,56,72,59,59,16,52,61,54,52,54,54,54,96,54,88,48,54,54,53,54,62,55,55,54,55,56,58,55,56,46,59,59,54,51,53,47,59,59,58,-15,61,78,58,85,59,58,-81,201,58,59,47,58,59,59,58,93,62,70,88,78,-235,364,57,46,44,57,59,72,56,62,59,58,60,58,59,78,72,56,60,60,59,59,60,59,69,62,59,59,59,59,61,59,96,94,59,61,61,57,60,-36,59,59,59,155,60,59,59,58,59,58,61,75,155,69,57,57,54,72,59,55,57,59,58,57,94,98,60,58,58,58,58,83,97,58,68,58,54,55,54,56,55,55,55,55,-85,-159,121,126,1682,50,51,49,57,110,123,56,54,56,55,55,51,50,39,36,52,52,46,46,42,51,53,53,20,52,140,53,17,53,112,52,50,-1,111,52,51,52,52,53,53,52,52,53,53,52,51,50,50,50,50,50,50,50,50,50,50,50,51,48,48,47,48,48,46,46,42,104,54,48,47,48,48,47,46,47,47,48,47,47,48,47,47,54,48,47,47,47,48,48,47,50,51,50,50,81,79,86,50,51,50,39,50,50,51,50,50,50,50,51,50,49,-937,1037,50,64,62,50,51,49,50,51,50,50,57,96,98,50,51,49,48,51,66,40,50,50,65,65,50,51,50,50,51,50,50,49,51,50,50,51,50,51,50,51,51,49,50,80,87,50,49,49,50,49,49,49,52,50,48,49,48,49,49,46,49,57,57,49,51,45,49,49,49,49,49,44,48,46,48,91,49,49,47,50,42,48,58,60,48,49,47,47,46,47,48,47,57,48,51,50,49,52,48,47,47,76,43,91,82,41,41,41,43,53,42,41,42,49,49,41,41,42,42,41,42,42,42,53,43,42,41,42,41,42,40,41,44,44,69,44,52,53,44,44,45,44,-395,486,51,58,49,45,44,45,44,45,44,45,44,44,52,44,55,54,45,44,40,44,69,68,45,44,45,44,46,15,66,43,44,44,60,53,38,40,44,39,38,55,76,61,72,85,77,44,63,91,106,312,250,115,48,65,72,43,31,-75,49,50,67,-176,-87,-42,47,47,46,53,51,52,45,27,54,48,65,71,51,62,55,33,50,50,66,76,73,73,47,46,47,-97,20,128,-29,59,48,121,443,391,125,93,48,48,-2,92,2,-18,-8,30,48,33,33,453,-356,74,258,49,274,263,146,800,-10,46,46,-137,35,498,-375,26,50,45,45,311,66,265,44,48,45,53,48,43,-41,-28,-71,45,50,-17,-124,-284,493,-70,43,-528,83,44,234,186,46,40,58,33,43,29,42,38,39,58,284,-39,47,215,47,43,88,-458,170,121,-23,77,78,77,67,-80,-76,64,38,45,52,131,-199,38,46,42,43,80,264,69,192,27,83,69,-320,32,76,94,43,28,40,46,50,46,37,94,60,40,74,25,14,41,306,33,44,-200,47,60,73,42,42,42,54,10,68,60,71,100,41,48,59,45,20,63,27,42,71,63,60,28,26,38,39,54,31,42,49,49,40,38,52,43,41,36,42,47,41,59,50,45,65,66,16,40,55,72,47,43,47,-2,21,54,45,78,46,50,27,44,64,38,65,32,61,43,44,59,51,99,94,52,43,42,57,34,44,46,65,33,43,54,83,48,23,46,65,43,56,38,55,41,53,43,43,55,43,50,42,42,56,43,108,47,47,46,47,49,48,55,51,40,18,60,49,40,53,43,44,40,44,41,40,48,45,46,42,46,36,41,87,95,37,51,44,39,40,53,46,50,36,42,42,43,42,18,49,59,66,46,44,82,57,66,54,48,43,44,88,48,46,55,87,44,43,58,47,48,46,52,44,44,57,48,49,25,47,47,44,52,74,52,45,46,42,43,60,54,56,44,53,45,44,61,31,57,64,52,44,44,74,46,54,55,55,49,49,75,64,50,55,55,46,49,67,38,74,59,52,61,50,69,50,64,57,47,54,50,50,74,63,56,67,50,49,65,49,57,113,36,17,48,61,77,39,75,108,127,54,78,61,166,167,145,97,54,78,73,59,72,50,54,55,70,61,6,-28,36,32,54,69,48,-32,-52,-19,7,54,70,59,81,61,270,100,51,63,47,61,53,60,52,51,69,58,29,82,56,42,50,62,48,71,52,52,48,51,62,62,49,60,264,148,54,130,41,-29,-5,34,51,51,60,35,55,50,92,51,50,63,54,31,75,32,75,51,61,44,28,54,118,104,104,104,84,62,110,48,53,52,47,82,51,52,41,49,53,52,47,49,25,68,77,50,56,53,19,49,61,48,48,98,63,51,51,47,54,51,111,53,54,56,54,59,53,54,49,53,34,72,51,51,65,50,47,49,63,49,50,61,56,90,123,215,31,51,131,50,5,-30,-16,60,53,51,47,35,53,44,23,22,40,42,43,42,50,25,41,46,59,230,30,41,37,35,17,38,52,68,36,35,35,65,64,33,45,61,33,40,40,39,32,61,35,49,36,51,42,21,52,33,43,36,50,47,37,46,26,43,38,89,48,49,46,5,51,34,34,52,52,37,37,33,32,54,32,30,42,20,60,34,51,45,39,27,50,77,75,24,57,49,38,38,39,40,40,35,53,57,20,16,16,39,17,42,34,38,38,32,48,43,34,37,36,42,37,37,34,58,74,21,104,38,38,10,24,34,38,32,34,39,51,30,47,33,32,33,51,36,39,38,43,68,33,42,35,36,51,92,70,45,81,65,14,22,47,31,41,41,51,46,41,39,41,42,50,35,44,31,15,28,43,50,44,42,56,45,47,43,52,72,72,83,48,47,42,42,43,54,42,43,58,43,52,31,46,41,38,53,42,52,41,107,116,176,94,42,73,46,55,78,97,64,45,94,66,48,44,-6,-5,37,40,32,45,28,4,-55,42,42,12,4,3,5,40,43,50,49,120,188,270,112,54,124,106,45,45,44,42,44,58,44,50,41,50,58,44,61,34,45,43,49,46,46,31,55,37,49,45,45,45,46,46,85,85,42,41,42,58,45,46,46,45,45,46,45,45,46,45,46,45,47,48,48,48,44,49,43,44,60,51,44,50,46,46,45,74,87,17,36,12,34,47,44,80,58,75,62,48,43,60,49,46,44,43,44,43,44,61,50,50,58,27,42,132,43,57,49,43,44,44,51,50,47,47,57,41,40,72,58,40,41,-824,902,37,45,40,42,38,40,37,38,45,38,57,59,34,32,32,40,33,34,34,34,33,31,37,32,33,37,35,37,33,43,38,31,34,35,33,33,40,40,44,34,41,31,33,33,70,32,40,25,29,30,38,36,30,28,29,30,29,40,31,31,32,31,31,31,32,31,32,32,61,62,61,33,39,56,29,36,27,28,35,55,41,34,60,59,31,27,29,31,30,29,56,55,43,37,37,31,42,26,30,44,31,33,36,38,37,37,37,33,42,36,34,33,33,33,49,38,30,39,34,33,35,32,29,37,36,32,32,35,25,40,29,29,29,28,45,29,37,33,39,26,33,33,35,32,34,31,33,33,29,37,29,33,33,30,29,41,33,38,32,34,25,28,47,28,40,32,28,28,29,45,32,29,33,33,31,32,38,37,40,31,40,33,34,48,40,35,33,42,38,37,38,30,48,-970,-443,33,34,-8,-145,-133,38,36,12,40,35,85,34,133,-556,106,37,89,126,57,71,48,37,37,48,226,196,80,30,38,37,49,41,43,40,40,43,39,51,40,44,41,45,38,38,49,43,40,43,42,42,39,51,40,40,39,40,32,35,49,43,41,41,40,36,36,49,40,41,40,39,36,36,49,41,40,44,49,39,43,55,48,47,45,50,38,43,56,62,-234,-433,-105,76,45,48,172,210,178,39,60,46,56,44,50,83,-37,87,46,53,51,46,21,48,18,47,56,102,4,65,92,49,48,48,75,10,48,53,58,49,62,19,21,-233,32,-64,49,50,-259,-23,7,47,49,52,53,63,112,225,175,281,52,84,274,296,168,141,98,52,69,61,50,105,109,66,53,67,50,57,51,41,53,53,64,63,56,53,58,50,56,55,63,51,58,54,50,52,62,60,38,-238,-250,-44,53,37,-8,8,-19,-126,-54,51,44,-69,-75,60,69,33,52,60,40,14,-2,95,82,52,51,68,118,97,33,58,54,61,74,69,47,55,57,56,53,57,56,85,38,46,54,60,47,56,67,58,42,54,62,68,44,72,48,63,54,62,136,255,54,273,178,55,79,177,70,51,216,227,54,83,237,129,116,60,53,64,54,-155,47,53,5,-10,51,56,54,87,110,60,81,54,53,51,53,54,53,51,56,54,54,54,54,53,51,51,59,54,54,53,60,-77,45,47,166,59,53,42,46,48,54,72,27,47,50,45,46,53,52,50,45,49,51,55,47,45,47,48,49,46,46,56,50,49,50,49,47,54,47,58,42,46,49,47,46,53,55,44,51,50,52,59,51,4,-70,-292,43,-9,56,51,155,62,-32,160,206,50,85,171,186,75,69,52,52,50,55,50,52,53,56,52,50,53,55,50,44,60,52,50,55,54,53,53,51,59,50,222,53,53,52,50,58,49,52,52,69,60,61,51,50,37,51,52,52,50,49,57,53,52,51,54,50,51,59,53,53,53,53,50,50,59,53,53,52,53,57,50,59,47,53,53,53,57,53,50,54,64,43,52,51,58,51,54,52,54,53,57,53,50,54,53,54,53,56,54,50,54,55,-241,-73,-198,53,51,91,-205,-27,5,54,53,54,60,65,22,55,39,63,57,53]}});
\ No newline at end of file
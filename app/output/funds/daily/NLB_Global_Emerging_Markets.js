@@ -0,0 +1 @@
+registerFundSeries("NLB Global Emerging Markets", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[497466,-2867,3142,149,-53,-108,-4017,3563,-7447,-7730,2782,-52,-4456,-443,-4184,-1939,3061,-1581,-51,2798,8576,98,5025,2317,949,-53,-1611,3635,-2010,1854,8934,2114,-55,-328,1226,1682,1712,-2196,3690,-55,1880,-1829,2211,-1260,278,436,-55,1392,658,-866,-1307,2134,3780,-55,-169,-374,446,-1875,114,-303,-54,-2159,2156,1695,-920,4100,-1713,-55,-3121,-2737,-5732,499,-8465,-747,-443,-4776,-801,1827,12783,4650,-120,2301,677,915,-54,901,1975,-56,-3,-2349,-2013,840,-636,2952,-50,-5641,1320,4623,8658,-11226,10494,-51,-1549,-705,-1983,-3424,9636,4554,-51,799,1124,1036,5018,-1269,16080,-53,1871,-7289,-5844,2431,-3998,-7,-52,3756,2643,-3141,357,539,-1238,-52,-1536,11243,-814,3547,1841,-2302,-54,75,-969,-1293,130,1176,3938,-54,208,1722,-1430,-318,-93,3530,-54,2652,-1665,1009,1379,-3418,5344,-55,946,-4864,4357,12166,-4396,1613,-67,5653,-401,2698,-1119,784,-4677,-67,787,-9516,-8734,-3611,-72,4866,-66,6363,-5462,3050,1577,-3493,-8102,-65,3207,1562,7043,3943,8212,-59,-58,-2302,892,13172,-1017,-11943,-4732,-58,4742,2893,4310,-146,1120,-2239,-59,-17,1723,-7398,-7356,-5043,-57,-57,1204,-3713,-1771,-4436,4656,3636,-57,-4086,1654,-3089,6383,-8446,3510,-56,1371,-2196,9696,4729,-1439,-1375,-58,-165,-5805,16178,2591,-6038,-59,-58,784,-3621,-3042,-8976,-11066,4371,-56,-3315,1795,2728,-669,-2507,633,-56,-3744,2993,458,1497,-8334,4368,-56,4259,-410,3053,-2494,-514,289,-56,-10170,2847,1071,3817,618,-1214,-56,-2853,4822,-3114,-2681,5386,-5463,-67,6140,8494,2209,7140,9145,-70,-70,763,-3073,-5245,-3584,-10014,2397,-68,-4994,351,6034,-833,830,-1052,-68,-1306,-2069,26,1265,-2831,-2630,-56,6414,-6825,-5085,-3590,3356,-2739,-55,1932,1323,-2883,-8987,-22784,-3786,-52,-18245,-10856,14172,14654,4297,-52,-52,-3063,-11466,7110,493,-5910,3638,-52,169,10384,-5305,1944,68,-3386,-51,-1707,4978,3787,1301,-10087,-3714,-51,2784,-318,3749,-1318,-1725,3274,-50,-9785,-1102,6793,485,6170,-339,-50,9339,-1893,3408,1295,795,-4166,-51,294,-1927,-2689,5904,1207,2953,-52,-787,-518,-4010,10785,9295,-53,-53,-2034,9529,5248,-1776,3722,-3923,-56,5169,857,44,1936,1750,591,-57,-5394,2897,2119,-6576,-4148,-1504,-55,6165,2716,9685,1388,404,-28,-58,-1776,2721,595,3831,-1001,1284,-58,-1889,4765,-5123,-8239,5180,-9636,-57,-4632,-204,-2926,-3981,-7555,-330,-1445,1758,6970,6038,-4378,-4433,239,-55,2553,1479,2938,309,-1282,771,-55,-1180,3162,-2108,-3311,1407,-56,-55,-6092,-156,405,-10531,-4862,-4478,-53,1013,1756,-5106,6656,-13543,-589,-52,12,2495,-7073,1249,10126,3234,-53,-6115,6244,-5454,253,10831,-880,-53,-745,-6901,-100,-205,-16770,170,-51,-2436,1135,-6199,-3981,4719,2470,-50,439,7280,5785,-711,968,-500,-52,4738,-4151,1182,5255,-2589,708,-52,-2762,14414,3634,-322,307,-2731,-54,365,-3499,-133,1980,10375,-8665,-54,-265,-795,1410,3777,-8872,1202,-54,1031,193,384,746,72,-519,-53,-75,4043,1785,-5773,-889,-1798,-53,-147,-2042,5302,-3632,420,0,-54,-770,2854,5108,4249,121,-1238,-53,2022,1499,-1153,-3045,-1236,3211,-53,-566,-572,-1625,-4968,-5963,-51,-52,2608,-3290,-9912,2476,3527,234,-50,452,6316,-3164,-107,-2176,1408,-51,3798,-2357,1118,-225,5995,-944,-53,-2109,5497,3544,2171,316,-81,-55,-12,-15,-567,-1799,-1882,1183,-54,2667,-6056,960,-879,1477,1340,-55,-2950,-1840,667,610,556,-54,-54,2967,-3303,473,5828,-17511,10447,-54,-6224,8146,4266,5760,2820,-1305,-55,1582,-2567,2372,2299,5670,-147,-56,2544,2845,-868,3680,-2160,1027,-57,219,1870,2781,-304,2288,-129,-57,-1152,-1097,202,-258,-1827,-804,-57,262,-4552,683,3869,4593,-862,-57,-1143,3416,199,-1268,854,-332,-57,1245,-3471,-3451,3386,-3761,-312,-57,-1196,1861,-1620,3307,-121,-99,-57,1969,2724,-351,3049,3570,-1789,-57,-1004,2183,-95,-4177,-9365,-1477,-67,5058,-4554,-625,5467,-4383,927,-66,-701,2792,1775,3939,-5302,714,-66,-3790,1618,2952,-4115,2827,2195,-66,-99,-3998,4890,-2806,371,1319,-57,4204,-5873,-109,3723,-334,1442,-58,-1025,2198,-475,1247,-599,3680,-58,1773,-1328,-817,-1905,-18,203,-58,2482,40,-6915,-5702,-2289,-1147,-56,9177,4142,6523,-909,3807,-90,-58,2176,9953,2936,5104,-433,3670,-60,2510,-1670,-98,1327,4963,-2038,-61,-1326,-2658,-395,-1760,-3698,-737,-60,4908,-656,4858,1164,4212,7676,-63,-74,2221,-3687,-435,5877,-1104,-62,50,4109,5266,-2292,-246,-284,-63,-334,-432,-4648,208,-4336,-3964,-62,60,4823,9139,-2914,-2200,-63,-63,1226,-2005,-990,3098,-7377,621,-62,832,1412,-4685,-1611,1320,1262,-62,-660,-2853,3209,-395,3881,743,-62,-3044,79,-3908,-1297,4350,2661,-62,-299,102,3195,8738,-1740,2118,-63,0,6578,1644,4058,-6091,-28,-64,-1015,2929,1994,2192,-2338,-1541,-64,-373,672,8590,664,2112,-2523,-65,-1380,-3249,-674,-163,814,-2642,-64,366,-2659,6102,1293,-5783,-222,-65,-1549,-5390,-954,-954,42,-895,-64,-537,-846,1231,6499,-2018,2009,-73,-980,2424,-986,-2008,162,1453,-73,-793,996,-2226,-2931,-1278,-72,-72,3170,-1652,-1903,1115,-3721,2066,-72,6006,-4062,-1107,-264,-1094,-1999,-63,1356,1551,1552,2268,1009,-1342,-63,2568,981,4072,171,1492,-756,-64,1955,-4511,-10124,1291,5713,-2449,-64,5623,-3266,1301,1215,269,842,-64,-57,1866,2953,5706,2192,-65,-66,4330,-3599,-3751,69,-1575,1827,-65,-1362,-3074,-3146,-583,815,-103,-64,4659,-4410,811,376,120,-136,-64,196,-3375,-1112,-6969,94,8,-63,1236,-380,1960,-4999,1379,-1394,-63,3114,1914,6362,1145,4537,-19,-65,289,-994,-932,4332,2300,-6078,-65,4520,965,-3723,534,-3618,-1468,-64,1780,1371,-1612,266,-489,-321,-64,1551,4562,-649,-1634,597,-1236,-65,1908,-624,1304,-3932,-381,-1560,-64,260,4094,929,-1843,433,194,-65,-63,1372,-6468,7422,3135,-3329,-74,-1346,-2049,2609,-3546,-3412,-72,-73,4519,-166,3754,-2655,3334,-2611,-73,912,1341,-2941,-486,2499,-2158,-73,1117,1593,3740,29,-271,-1119,-65,1884,343,-2552,1934,1916,1153,-64,3470,-1542,-1004,-1610,-1467,1690,-64,5180,832,444,-4243,-1562,441,-66,-1930,1596,-1676,-1364,4849,5383,-66,-1566,299,1199,3605,450,-537,-67,-76,89,1989,-3011,-2671,-886,-66,-1389,-1393,-6405,-31,-260,-959,-65,-2375,2186,3393,-3598,-4048,-1066,-64,-940,3359,2645,4858,-455,-1229,-66,175,-2080,-508,-816,3430,-66,-65,2934,1650,-493,572,-1252,1335,-66,2842,-1905,-1321,1226,-81,165,-66,363,917,5034,4110,-2983,-1967,-66,-66,6493,-888,5232,1264,616,-67,-413,1780,2947,1253,3321,-4025,-68,328,-4129,7119,1578,-274,-68,-68,3724,-1396,-217,-4735,6245,-960,-69,-1000,-1500,-703,-37,-10765,-827,-67,-18099,3376,-1573,-13810,7117,-734,-65,6633,1394,61,4028,-2496,804,-66,-650,-1732,-213,1573,7773,-701,-66,4587,-6751,-2899,-2712,-279,-4441,-65,5554,4722,1634,3231,1914,3803,-67,-2828,-2326,-2200,1201,754,1134,-67,-8430,-2891,-453,-10460,-8635,-955,-64,9997,-7349,-307,311,3379,-150,-65,-6483,2218,6387,2683,-6463,-62,-63,2246,5298,-8779,2582,-1337,176,-65,1961,3754,492,-1127,-2208,1929,-72,-234,-778,-3208,3800,1690,2762,-72,-330,364,4518,4238,3175,596,-73,1081,1402,4469,3093,-617,-1812,-74,3211,-7671,4158,453,-3629,732,-67,2111,-3262,1092,780,-1001,-67,-67,-279,-3640,4868,-3871,4329,896,-67,4874,-1979,6842,3643,-3600,2591,-67,-2602,-3176,696,79,-482,-67,-68,-2168,3663,2780,-4805,4772,-3745,-68,-6934,-4151,-5059,360,2817,-2502,-66,4505,575,-1823,4748,-2675,-673,-66,4678,226,-128,2523,1683,226,-67,-1003,-2488,2784,2836,7356,-2836,-68,2932,3527,2060,2829,-2292,2956,-69,-984,-670,-371,2546,1625,3654,-70,-1678,2615,-2327,-424,-5325,4771,-69,-1731,4560,-2273,5851,-2001,-797,-70,1472,-2918,-1958,-4811,3282,-430,-70,6360,-1662,1580,-1718,1650,1417,-70,-416,492,330,-3058,-3492,714,-70,1573,2143,711,1664,-1175,-2373,-70,-2342,2058,262,5076,-3525,316,-70,-1217,-641,-482,7251,4207,4404,-69,-6265,-4126,955,-7366,-3851,-198,-68,-1355,6915,-11682,-11072,2538,-2561,-66,-4345,5509,1335,-26,9069,1105,-69,14764,-1289,-8809,6552,-8004,2260,-70,-3001,3421,5311,4004,-6326,-798,-69,3770,2476,4464,-2015,-2394,2558,-70,-7973,4176,-4570,467,-218,-1507,-69,-6579,-15215,-101,-23157,-2649,1588,-65,7161,281,9063,579,-1463,808,-66,3300,-9855,-1437,-4168,-6427,-678,-65,964,-474,4281,2390,-9849,2610,-64,-8160,-2346,-6516,-7579,-7470,1006,-62,-11412,-1315,14345,4432,3570,-2116,-61,2356,-113,979,-6043,13282,-1627,-62,277,2555,2574,989,-653,-48,-62,551,5445,1660,2836,1900,-302,-63,-222,-3188,1952,-1048,2378,-82,-63,-1149,-2954,4106,3601,-813,461,-64,2102,2435,-1621,-2615,2142,-68,-64,-774,5322,1740,-2018,5445,177,-65,-242,1058,4424,-1104,1106,677,-66,1693,-3248,-605,-2010,2378,825,-65,301,710,-1352,-1282,384,1355,-65,5893,-111,609,-102,2261,-488,-66,1433,-2419,-2269,3167,-5477,2477,-66,-1448,616,-950,2293,3095,-436,-67,9299,-306,1218,-2813,1305,-564,-66,776,-2484,1026,-387,4226,-1781,-67,1120,-1871,-404,-134,1759,107,-67,654,1264,-784,1708,3444,-67,-68,865,-1291,-4161,-1050,3837,1706,-68,-342,-6781,208,-3048,3449,-1139,-67,-5033,3118,3499,5585,1246,908,-67,1651,2696,-130,423,938,-68,-69,-1194,-3419,-3562,1599,-2082,-577,-68,-1228,1890,4264,772,1962,-297,-68,-637,-2306,-1907,-2110,629,-67,-68,-565,1212,2218,2531,-2926,-299,-68,401,-3380,-1327,1724,1108,-377,-67,3272,3941,3651,-3753,-1010,766,-68,-2458,1468,2662,-2722,-2479,905,-68,324,-1657,-352,1644,-2395,-336,-67,-442,2630,1451,789,4646,-943,-69,-205,-174,-1328,-822,1271,-68,-69,-9556,-1241,-870,8323,61,-264,-68,-1371,5066,-9790,-504,514,2239,-67,3669,-1216,3371,-1667,-4396,563,-68,1781,-1376,1148,3321,1142,970,-69,701,2538,5986,1964,-1389,806,-70,-1462,-566,2243,1968,-1653,-4250,-69,-2635,4192,282,285,-1213,1224,-69,7638,-826,4886,-460,797,15,-69,4022,-428,-7071,2259,4810,-911,-69,2313,-3491,6336,1115,1651,-70,-70,-11755,-1321,575,-2898,-5581,-988,-68,-2876,-2312,2572,7092,-742,577,-69,4242,-394,2455,-3850,-296,509,-70,993,1509,6422,1312,1039,1377,-71,-1699,-2105,-43,-2352,4232,-1404,-71,598,-294,-2185,102,1697,1076,-71,2285,4256,1425,1449,-480,802,-71,-4550,-3912,332,997,3390,-121,-72,-993,-189,1898,366,-262,-1322,-71,1153,1810,1185,3360,5071,612,-72,880,1279,494,3279,3776,-2156,-74,-1737,-572,-1548,4953,-1010,1598,-75,1688,-1683,775,5920,3175,703,-76,9402,-490,2224,-809,2568,2282,-77,-38,1049,2448,1772,-2442,2298,-77,-6468,4137,536,1593,-6528,-891,-77,2021,4225,2208,3488,-2812,1106,-78,4032,-1232,2749,-2499,1993,532,-79,584,-1752,1941,-1443,-3812,-471,-77,-15548,-10491,-5448,-17979,-5600,-363,-73,18302,-9814,15702,-1840,-10589,-4815,-73,-24649,4173,-11601,-40064,23303,4086,-69,-38972,5971,-10861,-5357,-4930,3035,-64,-14044,13970,2726,-795,-19261,297,-62,18365,5192,-11754,7144,11143,3674,-65,20216,3300,652,4841,2715,-2681,-68,-1963,11683,-8790,7935,4450,-69,-69,-3773,-7404,8966,2439,10229,-1051,-70,7955,707,6481,2955,-5723,-71,-71,-5243,-2045,3621,1903,3740,-1993,-71,2236,-2463,-6553,963,2462,-271,-71,3004,-4420,-302,-2890,47,2960,-71,74,-1105,-3645,2334,-241,-3806,-70,-447,1868,-142,-2377,2435,-71,-70,1241,-3245,-1177,-14991,1353,1189,-69,-245,4645,-803,5027,-249,267,-70,-1791,2443,-6502,-27,-3487,-468,-69,3169,1220,3442,1386,-2584,1832,-70,3767,-3709,2329,-730,-1728,1941,-70,1517,1568,-205,-834,-12,-425,-70,4421,-2533,3641,-7642,-2388,-1160,-69,2386,-7471,4301,657,116,-3019,-69,3161,683,1274,-384,1983,549,-69,-310,45,3611,-1612,-2762,583,-70,-1548,-231,-2763,-101,4318,2422,-70,701,-3301,3103,1697,960,-70,-70,295,-1845,3493,-2964,-405,-966,-70,2298,-6475,5501,-2229,1084,-299,-70,2605,2037,313,-551,407,-1153,-70,162,3474,-5489,334,5518,188,-70,1548,1011,2359,2341,-5758,565,-71,2140,-8410,5768,502,1522,-910,-70,5134,-6038,-867,-1284,2613,-1421,-71,-4783,-786,-542,-2545,918,-70,-70,-4677,595,-11327,6297,879,98,-70,2038,3263,4145,1987,-3817,-430,-70,1403,131,5877,-842,1974,-794,-71,1092,-2289,-4027,1599,156,-1024,-70,-1700,4482,-454,-633,705,-784,-70,-631,255,2054,-3266,-354,-278,-70,126,1869,-3136,-176,739,-570,-70,-3079,1681,1368,-308,-1790,-549,-69,-1191,3095,-2620,3386,351,-103,-70,5751,256,473,530,-427,-71,-70,-3466,-209,-1625,2853,1384,468,-70,-1593,301,2274,-829,367,116,-71,2371,3676,2510,1244,-1056,-106,-72,216,1574,-5641,2935,-4165,-1442,-71,2314,2165,2630,3298,1555,343,-72,594,-1979,-2334,-805,563,1170,-68,3922,1671,3722,-2966,-3478,-1839,-68,-2216,485,177,-9405,-4794,3226,-67,4714,192,-1484,-3113,6016,3090,-68,-4196,9822,-745,3230,-6727,1076,-69,2129,1586,683,-4142,1297,647,-65,3140,-1663,-8234,-1392,6053,617,-65,2670,-2790,2227,5914,-1108,-780,-67,5216,675,-1422,290,176,-617,-68,3027,-265,-2974,562,1198,-530,-68,-2098,-4372,2482,-795,2233,-888,-68,-1458,200,194,1290,-5773,-68,-68,1668,-5520,3808,4093,-545,-47,-68,-4409,-8731,-7789,767,5999,-439,-67,-362,-786,-3881,7038,-2921,646,-66,2381,138,-754,675,1961,2838,-70,-387,969,-593,-1298,5647,3204,-70,-2144,-3978,-642,2204,895,2254,-70,3169,-2945,-2535,2319,1856,-70,-70,3932,3910,254,1666,5431,-734,-71,2260,4323,726,-2466,2016,3117,-73,4,-7744,1316,-7723,7517,-1233,-72,607,5514,3463,142,-5912,51,-72,-10614,7525,3326,2229,-1802,296,-73,-9399,-7673,8775,3011,-8185,-940,-71,3178,769,-227,2177,-2038,2154,-72,1564,1377,3117,859,-1885,-1451,-72,-3828,-8088,-5030,-5071,4226,1185,-71,6465,9300,-290,-4650,1000,220,-71,3958,2148,3601,-459,-615,-1411,-73,168,3832,-7348,-2772,-1721,-3,-72,1179,-1415,-84,-2287,-2373,-669,-70,-13703,5153,5873,4775,-3827,-290,-69,2468,-10479,-1352,-397,5973,-1279,-70,-9951,6797,4296,15605,2075,-406,-74,710,-2053,6653,5243,2422,-63,-75,2279,7646,-3180,-750,-4609,323,-74,1990,-1963,1343,2650,-5815,-2922,-71,6266,-1004,2438,848,-1527,2519,-71,4956,-4546,-2773,7204,8698,572,-73,-2180,1073,312,-2116,-2578,3969,-73,-10900,1191,2396,4446,-15710,-3688,-70,3004,-8960,-4110,7434,-16404,2384,-69,7078,12033,2938,-2871,-156,1963,-71,-8808,-1792,-1582,409,-10446,220,-69,-11097,17940,3385,-754,-1146,-543,-70,3460,-2143,-3549,12022,-3300,613,-68,5891,142,-3585,4021,5845,-71,-71,1958,13454,7828,-8404,-970,778,-72,1012,-9857,571,-675,-13666,-570,-69,-10073,2882,1333,-4981,13217,1045,-69,18669,2541,-3697,-12923,3365,-8864,-70,-4742,8889,11198,-8225,-9715,1014,-69,-6929,17380,-2263,-9948,-5913,701,-69,-2703,-5329,-7042,-12416,20214,-2627,-65,-4671,-2060,7078,-6475,-9156,6903,-66,-17862,1592,19437,-14479,-14756,4207,-65,-9086,5630,35315,-169,5867,2056,-69,-5106,10601,-3276,4399,-573,-1271,-69,2326,9964,-9495,-12633,9621,2371,-70,12799,-6304,-6230,-2535,-241,2687,-69,-10967,-3594,4039,-5996,-2859,2907,-68,-385,-1313,-1303,-8732,-14414,-64,-63,-4682,-2945,10803,16716,8675,-2896,-66,363,-2395],"returnScale":1000000,"returns":[0,-5763,6316,299,-106,-217,-8075,7162,-14970,-15539,5593,-105,-8957,-891,-8410,-3898,6153,-3178,-102,5624,17239,197,10102,4657,1908,-107,-3238,7307,-4041,3727,17959,4250,-111,-659,2464,3382,3441,-4414,7417,-110,3779,-3677,4445,-2533,559,876,-110,2798,1323,-1741,-2628,4290,7599,-111,-340,-751,896,-3769,229,-609,-108,-4340,4333,3408,-1850,8242,-3443,-111,-6274,-5502,-11522,1003,-17016,-1502,-890,-9601,-1610,3673,25696,9347,-241,4625,1361,1840,-109,1811,3970,-112,-6,-4722,-4047,1689,-1279,5934,-100,-11339,2653,9293,17404,-22566,21095,-103,-3114,-1417,-3986,-6883,19370,9155,-103,1606,2260,2082,10088,-2551,32323,-106,3761,-14652,-11748,4887,-8037,-14,-104,7550,5313,-6314,717,1084,-2489,-104,-3088,22601,-1637,7131,3700,-4627,-109,151,-1948,-2599,261,2364,7916,-108,418,3462,-2875,-639,-187,7096,-109,5331,-3347,2029,2772,-6871,10742,-110,1901,-9777,8758,24456,-8837,3243,-135,11364,-806,5423,-2249,1576,-9402,-135,1582,-19129,-17557,-7258,-145,9781,-132,12791,-10980,6131,3170,-7022,-16286,-131,6447,3140,14158,7926,16507,-118,-117,-4627,1793,26478,-2044,-24008,-9512,-117,9533,5815,8664,-294,2252,-4501,-119,-34,3464,-14872,-14787,-10137,-114,-115,2420,-7464,-3560,-8917,9360,7309,-115,-8214,3325,-6209,12831,-16978,7056,-113,2756,-4414,19490,9507,-2893,-2764,-117,-331,-11670,32521,5209,-12138,-118,-117,1576,-7279,-6115,-18043,-22245,8786,-112,-6664,3608,5484,-1345,-5039,1272,-112,-7526,6016,921,3009,-16753,8781,-113,8561,-824,6137,-5013,-1033,581,-113,-20444,5723,2153,7673,1242,-2440,-112,-5736,9694,-6260,-5389,10826,-10981,-135,12343,17074,4441,14352,18384,-141,-141,1534,-6177,-10544,-7204,-20130,4818,-137,-10038,705,12130,-1675,1669,-2115,-137,-2625,-4159,52,2543,-5691,-5287,-112,12893,-13719,-10222,-7217,6746,-5506,-110,3884,2659,-5795,-18066,-45800,-7611,-104,-36676,-21823,28489,29457,8638,-105,-104,-6157,-23049,14292,991,-11880,7313,-104,339,20874,-10664,3908,137,-6807,-102,-3432,10007,7612,2616,-20277,-7466,-102,5596,-639,7536,-2650,-3467,6581,-100,-19670,-2215,13655,975,12403,-682,-100,18773,-3805,6850,2604,1598,-8375,-102,591,-3874,-5405,11868,2426,5936,-104,-1582,-1042,-8060,21679,18685,-106,-107,-4089,19155,10550,-3570,7482,-7886,-113,10391,1723,88,3892,3518,1188,-115,-10843,5824,4259,-13219,-8338,-3023,-111,12393,5459,19469,2790,812,-56,-116,-3571,5470,1196,7701,-2012,2581,-116,-3798,9579,-10298,-16562,10412,-19370,-114,-9311,-411,-5881,-8003,-15187,-663,-2905,3534,14011,12137,-8800,-8911,480,-110,5132,2973,5906,621,-2577,1550,-111,-2372,6356,-4237,-6656,2828,-112,-111,-12246,-313,814,-21170,-9773,-9002,-106,2036,3530,-10264,13380,-27224,-1184,-105,24,5016,-14218,2510,20356,6500,-106,-12292,12551,-10963,508,21773,-1769,-107,-1497,-13873,-201,-412,-33711,342,-103,-4896,2281,-12461,-8002,9486,4965,-101,883,14634,11629,-1429,1945,-1005,-104,9524,-8344,2376,10563,-5204,1423,-104,-5552,28974,7305,-647,617,-5490,-108,734,-7034,-267,3980,20855,-17418,-108,-533,-1598,2834,7593,-17835,2417,-109,2072,388,772,1500,145,-1044,-106,-151,8127,3588,-11604,-1787,-3615,-106,-296,-4105,10658,-7301,845,0,-109,-1548,5737,10268,8542,243,-2489,-106,4064,3014,-2318,-6121,-2485,6455,-106,-1138,-1150,-3267,-9986,-11987,-103,-104,5243,-6614,-19925,4977,7090,471,-101,909,12696,-6360,-215,-4374,2830,-103,7635,-4738,2247,-452,12051,-1897,-107,-4239,11050,7124,4364,635,-163,-110,-25,-30,-1139,-3617,-3783,2378,-108,5361,-12174,1930,-1767,2969,2694,-111,-5930,-3699,1341,1226,1118,-109,-108,5964,-6640,951,11716,-35201,21001,-109,-12511,16375,8575,11579,5668,-2623,-110,3180,-5160,4768,4621,11398,-296,-112,5114,5719,-1745,7397,-4342,2065,-115,441,3759,5590,-611,4599,-259,-115,-2316,-2205,406,-518,-3673,-1616,-115,527,-9150,1373,7777,9233,-1733,-115,-2297,6867,400,-2549,1716,-667,-115,2503,-6977,-6937,6806,-7560,-627,-115,-2404,3741,-3257,6648,-243,-199,-115,3958,5476,-706,6129,7177,-3596,-115,-2018,4388,-191,-8396,-18826,-2969,-135,10168,-9154,-1257,10990,-8811,1864,-133,-1409,5612,3568,7919,-10659,1436,-133,-7619,3253,5934,-8272,5683,4412,-132,-199,-8037,9830,-5641,746,2651,-114,8451,-11806,-219,7484,-672,2899,-117,-2060,4418,-955,2507,-1204,7397,-116,3564,-2670,-1642,-3829,-37,409,-117,4989,81,-13901,-11462,-4601,-2306,-112,18447,8326,13113,-1828,7653,-181,-116,4374,20007,5902,10260,-870,7377,-120,5045,-3357,-197,2668,9976,-4097,-122,-2666,-5343,-794,-3538,-7433,-1482,-121,9866,-1318,9765,2340,8467,15430,-126,-149,4464,-7411,-875,11814,-2219,-125,101,8260,10585,-4607,-494,-571,-127,-671,-869,-9343,418,-8716,-7969,-124,120,9696,18371,-5858,-4422,-127,-127,2465,-4031,-1990,6228,-14829,1248,-125,1673,2838,-9417,-3239,2654,2536,-124,-1327,-5735,6451,-794,7801,1494,-125,-6119,159,-7856,-2607,8744,5349,-124,-601,205,6422,17565,-3497,4257,-127,0,13224,3304,8158,-12244,-57,-128,-2041,5888,4008,4407,-4700,-3098,-128,-750,1351,17267,1335,4245,-5071,-131,-2774,-6531,-1355,-328,1637,-5311,-129,736,-5345,12266,2599,-11625,-446,-131,-3114,-10834,-1918,-1918,85,-1800,-128,-1080,-1700,2474,13064,-4056,4038,-146,-1970,4872,-1982,-4036,325,2921,-146,-1595,2003,-4475,-5892,-2569,-145,-144,6372,-3321,-3825,2241,-7480,4153,-145,12074,-8166,-2225,-531,-2199,-4018,-127,2726,3118,3119,4560,2028,-2698,-126,5162,1972,8185,344,2999,-1520,-128,3930,-9068,-20351,2595,11484,-4923,-129,11304,-6566,2616,2442,541,1692,-128,-115,3751,5936,11470,4407,-131,-133,8704,-7234,-7540,138,-3166,3673,-131,-2738,-6179,-6324,-1172,1638,-207,-128,9365,-8865,1630,756,241,-273,-129,394,-6784,-2235,-14009,189,16,-127,2485,-764,3940,-10049,2772,-2802,-127,6260,3847,12789,2302,9120,-38,-131,581,-1998,-1874,8709,4623,-12218,-131,9086,1940,-7484,1074,-7273,-2951,-129,3578,2756,-3240,535,-983,-646,-128,3118,9170,-1305,-3284,1200,-2485,-130,3835,-1254,2621,-7904,-766,-3136,-128,522,8230,1867,-3704,870,390,-131,-126,2758,-13002,14919,6302,-6692,-148,-2706,-4119,5245,-7128,-6859,-145,-147,9084,-333,7546,-5337,6702,-5249,-147,1834,2695,-5912,-977,5024,-4338,-147,2246,3202,7518,58,-545,-2249,-131,3788,689,-5130,3888,3851,2318,-129,6976,-3100,-2018,-3237,-2949,3398,-129,10413,1672,893,-8529,-3140,886,-133,-3879,3208,-3369,-2742,9748,10820,-132,-3148,601,2410,7247,904,-1079,-135,-153,179,3999,-6053,-5369,-1781,-133,-2792,-2800,-12876,-62,-523,-1927,-131,-4774,4394,6821,-7233,-8137,-2143,-129,-1889,6752,5317,9765,-914,-2471,-133,352,-4181,-1021,-1640,6895,-133,-131,5898,3317,-991,1150,-2517,2684,-133,5713,-3830,-2655,2464,-162,331,-132,729,1844,10119,8262,-5997,-3954,-132,-133,13052,-1785,10517,2541,1239,-135,-830,3578,5924,2519,6675,-8091,-136,659,-8300,14311,3172,-551,-137,-137,7486,-2806,-436,-9518,12553,-1929,-139,-2010,-3016,-1413,-74,-21640,-1662,-135,-36382,6786,-3162,-27761,14307,-1476,-130,13333,2803,122,8097,-5017,1616,-133,-1306,-3482,-428,3162,15625,-1409,-133,9221,-13571,-5827,-5452,-561,-8927,-131,11165,9492,3285,6495,3847,7645,-135,-5685,-4675,-4423,2414,1516,2280,-135,-16946,-5811,-911,-21027,-17358,-1919,-129,20096,-14773,-617,625,6793,-302,-131,-13032,4459,12839,5393,-12992,-124,-127,4515,10650,-17647,5190,-2688,354,-131,3942,7547,989,-2266,-4438,3877,-144,-471,-1564,-6448,7638,3398,5552,-145,-663,731,9082,8519,6383,1198,-147,2173,2818,8984,6217,-1240,-3642,-149,6455,-15420,8358,911,-7295,1471,-135,4244,-6557,2195,1568,-2013,-134,-135,-561,-7317,9786,-7782,8702,1802,-135,9798,-3979,13754,7323,-7236,5208,-135,-5230,-6385,1399,159,-969,-134,-137,-4358,7363,5589,-9659,9592,-7528,-137,-13938,-8345,-10169,724,5662,-5029,-133,9056,1156,-3665,9545,-5378,-1352,-133,9404,454,-257,5071,3383,455,-135,-2016,-5002,5597,5701,14787,-5701,-137,5894,7090,4141,5687,-4608,5942,-138,-1978,-1347,-746,5118,3267,7345,-141,-3373,5257,-4678,-852,-10705,9591,-139,-3479,9166,-4569,11762,-4023,-1602,-141,2959,-5865,-3936,-9671,6597,-864,-141,12785,-3341,3176,-3454,3317,2849,-141,-836,989,663,-6147,-7020,1436,-141,3162,4308,1429,3345,-2362,-4770,-141,-4708,4137,527,10204,-7086,635,-141,-2446,-1289,-969,14576,8457,8853,-139,-12594,-8294,1920,-14807,-7741,-398,-137,-2724,13901,-23483,-22257,5102,-5148,-133,-8734,11074,2684,-53,18231,2221,-139,29679,-2592,-17707,13170,-16089,4543,-141,-6032,6877,10676,8048,-12716,-1604,-139,7579,4977,8973,-4050,-4813,5142,-140,-16028,8395,-9187,939,-438,-3029,-139,-13225,-30585,-203,-46550,-5325,3192,-131,14395,565,18219,1164,-2941,1624,-133,6634,-19811,-2888,-8379,-12919,-1363,-131,1938,-953,8606,4804,-19798,5246,-128,-16403,-4716,-13099,-15235,-15016,2022,-124,-22941,-2643,28836,8909,7177,-4254,-122,4736,-228,1968,-12147,26699,-3270,-125,557,5136,5174,1988,-1313,-96,-125,1108,10945,3337,5701,3820,-608,-126,-446,-6409,3924,-2107,4780,-164,-127,-2310,-5938,8254,7239,-1635,927,-129,4226,4895,-3259,-5256,4305,-136,-129,-1556,10698,3498,-4056,10945,356,-131,-486,2126,8894,-2220,2224,1360,-132,3403,-6529,-1216,-4041,4781,1658,-131,605,1428,-2718,-2577,772,2723,-130,11846,-223,1224,-205,4545,-981,-133,2881,-4863,-4561,6366,-11009,4979,-133,-2911,1239,-1910,4609,6222,-877,-134,18692,-615,2449,-5655,2623,-1133,-133,1560,-4993,2062,-778,8495,-3580,-135,2252,-3761,-812,-270,3536,215,-135,1315,2541,-1576,3433,6924,-135,-137,1739,-2595,-8365,-2110,7713,3429,-136,-688,-13631,418,-6127,6933,-2289,-135,-10117,6267,7034,11227,2505,1825,-135,3319,5419,-261,850,1886,-137,-138,-2401,-6872,-7161,3215,-4186,-1159,-137,-2469,3800,8571,1552,3944,-597,-137,-1280,-4636,-3833,-4242,1265,-135,-137,-1136,2437,4458,5088,-5882,-601,-136,806,-6795,-2667,3465,2228,-758,-135,6577,7923,7339,-7544,-2031,1540,-137,-4941,2951,5351,-5471,-4984,1820,-137,651,-3331,-707,3305,-4815,-675,-135,-888,5286,2917,1586,9339,-1895,-139,-412,-350,-2669,-1653,2555,-136,-139,-19209,-2495,-1749,16731,123,-531,-137,-2756,10184,-19680,-1013,1033,4501,-135,7376,-2445,6777,-3351,-8837,1132,-137,3580,-2766,2308,6676,2295,1950,-139,1410,5101,12033,3948,-2792,1620,-140,-2939,-1138,4509,3956,-3323,-8543,-139,-5297,8427,567,573,-2439,2461,-139,15354,-1660,9821,-924,1602,30,-139,8085,-860,-14214,4541,9669,-1831,-139,4649,-7017,12736,2242,3319,-141,-141,-23630,-2655,1156,-5826,-11219,-1986,-136,-5782,-4647,5170,14256,-1491,1160,-139,8527,-792,4935,-7739,-595,1023,-141,1996,3034,12909,2638,2088,2768,-143,-3415,-4231,-87,-4728,8507,-2822,-143,1202,-591,-4392,205,3412,2163,-143,4593,8555,2865,2913,-965,1612,-143,-9146,-7864,667,2005,6814,-243,-145,-1996,-380,3815,736,-526,-2658,-143,2318,3639,2382,6754,10193,1231,-145,1769,2571,993,6591,7591,-4334,-149,-3492,-1149,-3112,9956,-2030,3212,-150,3393,-3383,1557,11901,6382,1413,-152,18899,-985,4471,-1626,5162,4587,-155,-76,2109,4921,3562,-4909,4619,-155,-13001,8316,1077,3202,-13122,-1791,-155,4063,8493,4438,7012,-5653,2223,-157,8106,-2477,5526,-5023,4006,1069,-159,1174,-3521,3901,-2900,-7663,-947,-155,-31254,-21089,-10952,-36141,-11257,-729,-147,36790,-19728,31564,-3699,-21285,-9679,-147,-49549,8388,-23320,-80536,46843,8214,-139,-78341,12003,-21833,-10768,-9910,6100,-128,-28231,28082,5480,-1598,-38718,597,-125,36917,10437,-23628,14361,22399,7386,-131,40638,6634,1310,9732,5457,-5389,-137,-3946,23485,-17669,15951,8945,-139,-138,-7585,-14883,18023,4903,20562,-2113,-140,15991,1421,13028,5940,-11504,-143,-143,-10539,-4111,7279,3825,7519,-4007,-143,4495,-4951,-13173,1936,4949,-544,-143,6038,-8885,-607,-5809,94,5951,-143,149,-2222,-7327,4692,-485,-7650,-141,-899,3755,-285,-4778,4895,-143,-141,2495,-6523,-2366,-30135,2720,2390,-139,-492,9337,-1614,10105,-500,536,-140,-3601,4911,-13070,-54,-7010,-941,-138,6370,2452,6919,2787,-5195,3683,-141,7573,-7456,4682,-1468,-3474,3902,-140,3049,3152,-412,-1677,-24,-854,-141,8887,-5092,7320,-15362,-4801,-2331,-139,4796,-15018,8646,1321,233,-6069,-139,6354,1373,2561,-771,3986,1103,-138,-624,91,7259,-3241,-5552,1172,-141,-3111,-465,-5554,-203,8680,4869,-141,1409,-6635,6237,3411,1930,-141,-140,593,-3709,7022,-5959,-814,-1942,-140,4619,-13016,11058,-4481,2180,-602,-140,5236,4095,629,-1107,818,-2318,-141,326,6983,-11034,672,11092,378,-141,3112,2032,4742,4706,-11574,1135,-142,4301,-16905,11594,1010,3059,-1829,-141,10320,-12137,-1743,-2581,5253,-2857,-143,-9614,-1580,-1090,-5116,1846,-141,-141,-9402,1197,-22770,12658,1767,197,-140,4096,6560,8332,3994,-7673,-864,-141,2820,264,11814,-1693,3968,-1596,-143,2195,-4601,-8095,3214,314,-2059,-140,-3418,9010,-913,-1272,1417,-1576,-140,-1269,513,4129,-6566,-711,-559,-141,253,3758,-6304,-354,1485,-1145,-141,-6190,3380,2749,-619,-3598,-1103,-139,-2394,6221,-5266,6806,706,-207,-141,11560,515,951,1065,-858,-143,-141,-6967,-420,-3267,5736,2782,940,-140,-3203,606,4571,-1667,738,233,-143,4767,7389,5046,2500,-2122,-214,-144,434,3164,-11340,5900,-8372,-2899,-142,4651,4352,5287,6630,3125,690,-145,1194,-3978,-4692,-1618,1132,2352,-137,7884,3359,7482,-5962,-6992,-3696,-137,-4455,975,356,-18906,-9637,6485,-134,9476,386,-2984,-6257,12093,6211,-136,-8435,19744,-1497,6492,-13522,2163,-139,4280,3188,1373,-8326,2607,1301,-131,6312,-3343,-16552,-2798,12168,1240,-131,5367,-5608,4477,11888,-2227,-1568,-135,10485,1357,-2859,583,354,-1240,-137,6085,-533,-5978,1130,2408,-1065,-137,-4217,-8789,4989,-1598,4489,-1785,-137,-2931,402,390,2594,-11605,-137,-137,3353,-11096,7655,8228,-1096,-94,-137,-8863,-17551,-15657,1541,12060,-883,-135,-727,-1580,-7802,14148,-5872,1299,-133,4786,278,-1516,1357,3942,5705,-141,-778,1948,-1192,-2609,11351,6441,-141,-4310,-7996,-1291,4431,1799,4531,-141,6370,-5920,-5095,4661,3731,-141,-140,7904,7860,510,3349,10917,-1475,-143,4543,8690,1460,-4957,4052,6266,-147,8,-15567,2646,-15525,15111,-2479,-145,1220,11085,6961,285,-11884,103,-145,-21336,15126,6686,4481,-3622,595,-147,-18894,-15424,17639,6053,-16453,-1890,-143,6389,1546,-457,4377,-4097,4330,-145,3144,2768,6266,1726,-3789,-2917,-144,-7695,-16259,-10111,-10194,8495,2383,-143,12996,18694,-583,-9347,2010,443,-143,7956,4318,7239,-923,-1236,-2837,-146,337,7703,-14770,-5573,-3459,-6,-145,2370,-2844,-169,-4598,-4770,-1345,-140,-27546,10359,11805,9599,-7693,-583,-139,4962,-21065,-2718,-798,12007,-2571,-141,-20003,13663,8636,31369,4171,-816,-149,1427,-4127,13374,10539,4869,-126,-151,4581,15370,-6393,-1507,-9265,649,-149,4001,-3946,2699,5327,-11689,-5874,-142,12595,-2018,4901,1705,-3070,5064,-143,9963,-9139,-5574,14481,17485,1150,-147,-4382,2157,627,-4254,-5182,7979,-147,-21911,2394,4816,8938,-31580,-7414,-141,6039,-18011,-8262,14944,-32976,4793,-139,14228,24189,5906,-5772,-313,3946,-143,-17706,-3602,-3180,822,-20998,442,-139,-22307,36063,6804,-1515,-2304,-1091,-141,6955,-4308,-7134,24167,-6634,1232,-136,11842,285,-7207,8083,11750,-143,-142,3935,27046,15735,-16893,-1950,1564,-145,2034,-19814,1148,-1357,-27471,-1146,-139,-20249,5794,2679,-10012,26568,2101,-139,37528,5108,-7431,-25978,6764,-17818,-141,-9532,17869,22510,-16534,-19529,2038,-139,-13928,34937,-4549,-19997,-11887,1409,-138,-5434,-10712,-14156,-24958,40634,-5281,-131,-9389,-4141,14228,-13016,-18406,13877,-133,-35906,3200,39072,-29105,-29662,8456,-130,-18265,11318,70989,-339,11793,4133,-138,-10264,21310,-6586,8843,-1152,-2555,-138,4675,20030,-19087,-25395,19340,4766,-140,25728,-12672,-12524,-5095,-485,5402,-139,-22046,-7224,8119,-12053,-5748,5844,-137,-774,-2639,-2619,-17553,-28975,-129,-126,-9412,-5920,21716,33602,17439,-5822,-132,729,-4814]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB South-East Europe", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[424936,2487,1703,-46,-44,1657,462,-296,633,-2059,-25,-45,-1423,-3376,-1235,-5045,4024,-37,-43,-426,-359,1097,-975,1245,-80,-44,-1872,1364,391,1441,1243,-65,-45,-502,2445,-247,1105,813,-12,-44,-209,-942,1898,-1085,1779,-83,-45,915,-1035,-3403,-2111,807,23,-44,-1760,821,-867,-2393,26,-68,-44,-739,-1096,-607,-215,-3408,-24,-43,-335,-3252,-982,-1905,1190,-46,-47,-3139,-2547,-2976,1310,1834,-175,-42,1560,-293,-1164,639,889,-124,-42,1335,2292,2410,32,-1418,-237,-40,1412,-977,1312,-121,-706,-66,-39,-561,-1168,-458,-41,1333,-115,-39,-1378,-733,-436,-519,25,-106,-39,-267,-426,1113,-950,1110,39,-39,-1593,-2284,817,150,-828,-136,-39,-1502,-1139,1169,-390,1654,119,-39,-1107,-279,560,-1104,1483,165,-39,-384,-177,385,-1606,3303,79,-39,1609,-1590,37,399,708,937,-39,1227,-2771,-959,-1127,-603,-225,-52,-537,-554,-1192,-684,-1614,93,-51,705,-1019,-1277,-1492,365,-250,-51,-235,-1254,589,190,-190,1001,-51,-919,400,1819,4162,889,-42,-41,36,2294,6463,517,-535,17,-42,-1965,-2681,-530,778,-1366,-329,-41,-2000,-821,1591,1759,56,-42,-41,-878,-2044,-629,-630,-254,223,-41,-2037,-1789,2262,2870,771,-24,-42,1203,-3390,428,1611,737,69,-41,619,-1889,-98,-1080,-1584,-40,-41,2528,-1715,-1108,1009,139,-19,-41,-1422,464,615,774,-811,-34,-41,-2271,-4099,-2315,492,1470,-59,-40,1218,379,1074,558,-946,-23,-41,-4282,1005,683,-59,-1289,-37,-40,-1979,1903,-1215,-588,45,-229,-53,628,3470,3291,623,804,-53,-53,113,265,708,-5,-23,-73,-53,-2694,96,1456,364,535,-276,-51,-1110,315,-597,830,-520,167,-39,-646,1275,-870,599,1160,28,-40,994,-1704,-526,-113,-966,-188,-39,-6420,-2630,-1134,1001,1294,-39,-37,-3196,492,653,-780,90,61,-38,-1663,363,186,-316,-1199,4,-38,-997,-2732,-570,-873,-569,-365,-37,-1317,912,16,1856,1495,-261,-35,-3921,878,524,3445,576,-21,-35,991,-1231,-735,-799,-381,-328,-36,709,-675,-855,-807,23,-216,-36,1001,286,278,2427,1556,-36,-37,728,-1338,-2178,546,1482,168,-39,13,-260,-806,-784,-1141,-107,-39,-167,-1563,-1227,-518,3721,31,-39,-1351,571,-114,1015,1238,-7,-38,-1243,-442,2948,-236,1669,83,-39,-2910,-629,-24,-2963,414,4,-38,-3642,-760,-500,-1134,-885,-185,-8,195,1378,1129,568,-85,15,-38,-926,-100,1218,1196,-97,-113,-38,1942,1354,4421,504,-72,-38,-39,-1016,-1152,-713,-2016,-1311,-75,-39,-1042,-2350,-188,-3821,-142,99,-38,-4245,683,43,-1074,1756,-10,-37,-1431,1010,341,677,1679,-38,-38,1612,-928,706,-1442,-420,55,-37,544,-1851,-673,1717,315,59,-38,-1881,1531,-103,2125,-916,-39,-37,2000,-893,-1499,-1206,1447,-50,-37,-181,414,1018,-1041,1673,37,-38,1445,-1335,179,1747,960,-147,-38,-48,236,-52,-439,1727,32,-38,151,540,2366,135,-866,-11,-38,-834,1554,462,1015,224,177,-38,-1036,-490,268,289,12,172,-39,477,28,-814,-641,737,-292,-36,-35,637,1084,841,1096,-80,-37,-507,-55,-144,-502,392,-37,-36,103,-764,-746,1247,4,153,-36,1498,574,-786,1994,350,-21,-37,-341,999,-443,-1061,2298,-5,-39,-2253,-240,-304,-1315,-248,28,-38,261,-843,250,-996,-184,-15,-39,-22,-336,121,2192,5229,-85,-39,1891,-4751,-259,-2359,-455,-38,-39,256,-584,974,-1264,-3015,-96,-38,-1381,633,529,456,2717,31,-38,3775,2531,2659,1164,3174,-183,-40,-559,985,703,-61,2392,102,-40,-2229,648,1041,1578,2286,-99,-41,1831,-666,2738,-188,801,-79,-41,1870,-1167,665,137,-66,-53,-41,-263,524,3906,938,-47,8,-41,458,-433,2893,1093,999,-85,-42,-237,1788,2475,3746,2048,-4,-43,-436,-1016,1538,5332,1170,-15,-43,-578,-1057,1609,281,1169,-10,-55,-71,-770,877,-1312,-234,-84,-54,672,-200,-666,339,2920,33,-55,1907,-2220,1058,-2191,-747,-166,-54,236,1907,2080,2577,1045,94,-44,2632,190,592,-1416,-2292,42,-44,871,1518,919,4912,-69,-57,-45,1326,567,1041,109,1151,-42,-45,1892,2805,-2356,-2769,347,-50,-45,-1834,1878,-1938,628,1666,-177,-46,3583,3371,5717,4814,6857,-180,-48,357,-2804,-2683,1217,508,-77,-47,-383,-4699,454,431,-3125,-57,-46,2241,-207,1157,207,-1677,19,-47,891,-3236,549,-3705,-4667,18,-45,-3644,1684,6942,1528,2544,-101,-46,307,780,-2470,-1148,755,-45,-46,-188,2530,1307,280,489,-47,-47,3280,2935,131,2643,-641,100,-47,2628,960,-274,1021,-845,121,-48,553,-1164,207,438,1466,-78,-48,1646,-504,931,328,2532,220,-48,1341,101,2100,3160,596,-72,-49,537,1168,-2305,1741,-2125,105,-49,-358,-154,52,1553,779,48,-49,-72,286,1136,-176,580,-3,-50,-657,-1494,-1150,-2940,-1844,163,-49,934,-751,1776,-26,-350,233,-49,-947,-1281,-2526,-2369,1709,-56,-48,-1528,-2045,-5036,-3961,466,-32,-56,1851,1198,-3663,-2830,2664,89,-55,718,-947,-1970,4,83,-56,-55,-55,1396,5157,-224,-2760,-45,-56,663,-2659,1262,-1086,-2252,342,-47,-47,796,-612,3195,706,227,-47,1475,1541,4910,1485,-2069,100,-47,-730,-2309,4519,4466,5782,84,-49,3716,-1374,-466,496,-290,147,-49,-713,3596,5890,9274,119,-50,-51,7951,-1414,-6429,-655,-3190,31,-51,779,-4114,-3696,0,-1623,28,-50,302,-710,-304,-791,414,210,-50,1704,847,232,2681,1393,-14,-50,-478,-2316,2633,-1985,3741,-255,-50,4217,4640,8144,2934,1726,-83,-52,-50,1387,3740,7799,4619,-93,-54,7388,824,-4562,1168,-264,68,-54,2062,1076,-1062,1160,-65,-62,-55,277,3721,2198,882,339,-18,-55,-4748,1978,-4490,4609,2010,-23,-55,554,447,2543,281,-1314,97,-55,-423,242,1788,534,-952,-149,-64,-1387,339,16,-2339,-377,-63,-64,259,-3496,-1399,-1604,-1698,-43,-63,-2207,1213,-4334,4428,-182,-151,-62,2707,-2133,-78,-580,-278,-24,-54,-472,-4117,-4981,1063,1937,-44,-52,6148,-1096,1103,1257,842,-66,-53,1971,-1170,-2383,-5277,-534,-14,-54,-454,3582,-2933,-748,-1092,-23,-53,-1508,109,809,1586,-1698,-103,-54,-1059,-2914,320,587,240,-107,-53,-2064,1186,-634,-689,-1082,-55,-53,-7440,423,-275,13938,-17447,161,-52,-2171,1250,594,1090,-74,-15,-52,790,-2449,-1660,-1165,55,-51,-51,665,1636,185,3155,-1143,-36,-51,-134,-1100,966,-243,492,11,-52,753,751,3445,7856,593,773,-51,-51,3886,432,1644,1044,-47,-52,2074,1177,483,2011,1922,53,-55,888,1760,3800,2158,71,-55,-55,166,-1831,-594,956,5786,0,-55,1633,2648,3015,2401,-796,11,-56,-2453,-8873,-3899,-252,-1508,-97,-55,1005,294,-3660,-398,1547,-49,-55,655,-1324,-669,1250,1420,36,-55,-491,-2582,1644,-309,-1734,-62,-55,1697,4892,8124,1049,-2986,-89,-56,-3240,3717,3874,44,447,90,-57,-4531,-2208,-1001,-3048,-1782,-17,-55,346,-759,-2955,-4110,1469,-109,-54,3528,-3534,2532,-722,-279,-52,-53,804,-584,-4202,-683,-2122,-6,-54,-233,-340,3773,3000,-929,-50,-61,-361,1426,-3163,0,2899,-20,-61,3093,40,8008,3614,-2387,55,-62,177,2344,-793,2501,385,-52,-63,4621,-3202,-298,-457,360,-102,-56,-512,-4242,1085,-319,552,-56,-55,-1250,-1061,-2203,1685,2565,-33,-55,3608,1430,2689,6526,338,-53,-57,-2313,-1674,2642,1367,-86,-56,-57,1224,637,984,-1522,5339,-53,-58,543,-6447,-7258,-2795,165,-95,-56,1299,1189,-1359,-484,-1377,-179,-56,1414,437,1802,-2038,-1899,-65,-56,-2953,-2901,3057,1589,5170,-89,-56,1207,3308,-952,1021,1964,-39,-56,-842,1299,-533,480,-1027,-108,-57,88,340,-760,-551,-2075,-14,-56,208,69,376,-1115,-3947,-31,-56,3,-2117,2053,-1451,475,-70,-55,4534,-184,810,3517,3742,-22,-57,-876,768,243,-20,-1131,34,-57,300,-1314,1867,-902,-1411,-21,-56,-123,1266,258,934,-178,-71,-57,31,-214,1066,5919,7329,-88,-57,-7785,-6172,-4137,-9780,-6391,-40,-53,-4114,9109,141,-766,-1611,-70,-54,-2499,-2294,1560,2326,9591,-141,-56,29268,-89,5663,-6368,-2175,-65,-59,-1992,-1725,2573,38,-1854,-92,-58,1231,903,309,405,-1328,-44,-59,-4024,1997,-3870,-3676,-1895,-64,-57,-6770,-11021,-2012,-20770,40,-92,-53,1156,-1549,525,31,-936,50,-54,16,208,-428,-7140,3244,-4,-53,-2195,1964,2081,-665,1314,-23,-54,-1839,149,-4344,-1754,-1153,-6,-52,-5120,-300,-893,4856,5927,-13,-49,14,-77,-294,-696,825,-55,-49,202,370,2545,2890,2846,-110,-49,2748,387,599,-194,-889,-90,-50,70,499,-777,517,-2237,28,-50,1507,819,540,1032,135,53,-50,-337,-211,-2942,1927,-370,-5,-51,-1306,1413,577,-634,597,-76,-50,446,4058,6248,2330,529,-143,-52,771,-1782,-776,325,-1428,-85,-52,814,73,512,384,178,-19,-51,76,-362,-739,-127,-968,-37,-51,1139,4236,-60,-769,525,-52,-51,-344,-826,-842,635,-145,-41,-51,2259,-1064,-302,-2410,-47,24,-50,-172,-1375,569,1017,104,-21,-51,1730,-1939,-2711,-1491,-505,9,-54,372,-1328,323,-112,-61,-54,-55,463,-340,1,244,-178,-54,-54,405,641,91,-2744,1999,-62,-54,1143,1127,420,1334,3600,-72,-55,3557,1892,-993,3976,-20,-56,-56,-2828,383,-1492,-1610,1298,-22,-55,-239,59,3370,2175,-326,-15,-56,-791,-1475,-949,-3803,-910,-55,-55,-96,-1667,1506,-1351,1411,-35,-55,177,401,-1309,639,2439,-87,-55,462,-523,1074,-2393,-306,-38,-55,-1780,95,2109,-1710,241,-62,-55,-2517,-1028,-768,-1593,881,-80,-54,-1538,62,86,568,496,-59,-55,-148,2033,2375,549,-288,-55,-55,-1697,-184,-980,-225,1368,-160,-55,3146,1456,-2980,-3636,-175,-64,-55,866,2274,-929,404,3969,-56,-55,-2662,-148,-816,380,689,-38,-55,-172,1672,-266,1357,-588,-35,-55,-368,1033,223,728,-820,-71,-55,-824,269,793,1307,-43,-17,-55,8573,59,5613,561,2724,-74,-56,432,2009,235,-583,347,-90,-56,4583,1812,3283,735,105,-57,-57,-12218,-3234,-442,-1992,-932,-38,-55,-5047,197,653,5615,-3405,-59,-56,2471,-390,-622,-2717,-397,-27,-56,1455,1690,4167,1116,272,-109,-56,677,-2004,-1169,-2020,2375,-56,-57,-126,1562,-1272,1570,5542,21,-57,-2480,540,403,1016,1891,-35,-57,-588,-967,-1051,1324,1315,-77,-57,734,-8,217,-2003,3210,-66,-57,-938,1582,2338,-1400,4337,-75,-58,3258,1116,-906,2292,4901,-86,-60,2109,91,64,542,834,-76,-59,-1241,1504,-406,3625,7535,-18,-61,8399,2116,233,-7504,2129,-2,-61,-161,514,4636,167,-693,50,-61,-2621,1026,-1008,128,1655,-55,-62,-5393,192,-762,2361,-1047,-121,-61,-210,-1433,-905,-1141,-748,-199,-60,362,172,-465,20,-307,-59,-60,-8839,-7537,-4251,-4622,-1984,-49,-58,3936,3249,4023,7728,-8242,-174,-59,-26967,795,-6802,-40509,3940,242,-53,-24874,-6246,-13229,-13500,4393,-60,-47,-16126,4830,10246,-11554,-8364,-64,-45,8193,13463,-8174,-2010,13899,-44,-47,12307,12545,-2410,6743,1988,-38,-51,-984,2172,-6585,3538,1181,-50,-51,-1287,-2679,2228,4947,2396,119,-51,6839,6102,2458,3124,-156,-53,-52,-7235,238,791,-94,875,-1,-52,512,1676,-3287,271,-1432,-22,-52,254,-214,-783,1203,114,-78,-52,128,412,-1751,2054,257,-38,-52,1033,841,2846,750,-527,-52,-52,-1,-2833,-653,-1411,-2095,-39,-52,-1952,-423,233,1376,1261,-199,-51,-2888,936,1230,-4065,-631,103,-52,-165,1781,58,565,127,-26,-51,507,-73,483,375,-3460,-33,-51,3338,819,415,66,611,-65,-52,829,-1007,1005,-401,-320,-19,-52,346,-1867,1492,792,-1294,-6,-52,43,215,-755,551,2698,10,-52,934,2896,265,-2216,-1020,-219,-52,-2329,-290,-1324,-19,-416,31,-52,-1384,-861,461,1226,-1492,-51,-51,1661,87,1314,3150,-2633,-77,-52,4665,-2196,1302,-807,3239,-67,-52,-211,1908,3041,-1324,368,-50,-53,436,225,-763,-805,-730,-24,-51,118,1952,1122,2058,-2600,-45,-53,77,-3959,1737,-1927,-2030,-116,-52,-283,-5340,2014,-1203,865,-52,-52,-1345,-754,795,-2156,-1269,-51,-51,-2792,351,-1972,-1372,2492,-64,-51,1048,190,1239,1180,-2115,-106,-51,3939,355,1928,-740,-1806,-55,-51,1064,703,1173,1015,1209,-60,-52,2369,2662,-47,977,1586,-77,-53,1027,-1719,2452,78,2311,-8,-53,624,-568,-1013,573,-3517,13,-53,-1782,-660,120,410,1385,-63,-53,-3164,1180,1352,112,1037,-28,-53,3926,1575,2488,-22,-492,-53,-54,865,1609,-18,2425,3518,-166,-54,1220,2105,-70,1315,-140,137,-55,1588,-407,-2753,19,-649,-59,-55,-5916,1043,-1440,1043,2405,-59,-54,-1707,-1290,764,804,-1207,59,-54,-6,-1872,777,-1377,1311,-81,-52,6163,6629,6614,-4277,2125,-77,-53,-904,448,1280,-2092,-2427,79,-53,-639,1817,1630,441,-576,220,-53,709,2414,-1317,-90,24,-109,-54,1077,-591,-464,-1241,0,-75,-51,68,-500,-8026,-4035,1414,-38,-49,1483,1645,2245,4727,-310,46,-52,309,-1027,1620,1461,-415,172,-52,907,2230,-300,-992,-301,-139,-53,1579,807,-1395,101,439,-53,-53,1478,-203,-548,462,86,-54,-54,2436,451,1840,198,931,-72,-55,4754,-5201,4185,-2404,1336,54,-54,1746,1480,498,2361,523,-81,-55,3121,415,3041,-2725,-361,198,-56,270,2231,1844,-200,1813,-65,-56,-1038,-566,907,-360,3097,175,-56,-1409,1482,2432,-1450,218,-56,-55,-2261,-2139,3706,483,836,-8,-56,-809,-2160,-2668,1218,171,-40,-55,-303,-467,1766,-989,-1716,-226,-55,-420,998,-562,37,-471,-343,-55,-5234,-414,451,853,1796,-182,-56,549,617,2355,4274,1411,241,-57,2554,1021,29,45,1339,46,-57,2085,-526,-281,-287,1518,-40,-58,1274,1490,3659,-3564,-1066,53,-58,639,1024,-241,226,503,-74,-58,1903,-1281,-680,896,2086,72,-59,-338,1006,-2653,-2960,670,90,-58,-179,-404,-1220,-1063,-2163,-7,-56,-7012,2513,3971,4132,-86,-90,-56,1041,45,226,1373,1429,-443,-57,1591,-188,-2228,1719,-808,-152,-59,-890,1249,1941,1788,910,15,-59,1146,1237,1646,-2388,4484,-512,-59,-2640,2352,-871,2850,-3550,-485,-56,69,594,1359,36,-83,-6,-56,1102,-1769,698,2146,793,-72,-57,-716,1215,641,1967,-601,-142,-58,360,110,1773,-35,-2915,-64,-57,-1268,-4425,675,-134,-220,-119,-57,-1126,2596,-471,1590,-871,66,-57,-289,-412,85,1908,1074,-174,-57,-2367,1258,-84,-100,516,-6,-57,3582,3778,1609,-3605,69,280,-56,5260,4517,2942,-1861,1534,-59,-59,832,2720,-171,1384,4263,-66,-60,-860,2145,2838,1961,-5214,-123,-59,-12051,-3931,6472,-3202,-1470,27,-58,2420,1477,370,-3517,-417,-15,-59,634,472,569,1224,-1211,-135,-58,-10602,7432,3686,-3474,-2453,-116,-59,-3292,-7567,-2578,-30407,17571,-89,-54,-16070,4080,3507,2111,-10039,188,-54,-10761,-3452,7015,2544,2499,-148,-53,2538,2278,12054,2820,4630,44,-56,7067,3727,-4468,-4325,2130,-78,-56,2085,5707,-1806,238,1762,89,-57,766,1649,-456,-2050,3461,110,-59,-755,-3065,-3429,37,-60,-265,-57,187,-258,1539,1162,-275,-56,-55,-2730,324,-599,1944,-1168,13,-55,293,-1839],"returnScale":1000000,"returns":[0,5853,4007,-108,-103,3899,1087,-696,1489,-4845,-59,-106,-3349,-7944,-2907,-11872,9470,-88,-101,-1002,-845,2582,-2295,2930,-188,-104,-4405,3210,920,3391,2925,-153,-106,-1181,5754,-582,2601,1913,-28,-104,-492,-2216,4466,-2553,4186,-195,-106,2153,-2435,-8009,-4967,1899,54,-104,-4142,1933,-2041,-5631,61,-160,-104,-1739,-2579,-1428,-506,-8020,-57,-101,-788,-7653,-2311,-4483,2800,-108,-111,-7387,-5994,-7003,3083,4316,-412,-99,3671,-689,-2739,1503,2092,-291,-99,3141,5394,5672,75,-3337,-558,-94,3323,-2299,3087,-284,-1662,-155,-92,-1320,-2749,-1078,-96,3137,-271,-92,-3242,-1725,-1026,-1222,59,-249,-92,-629,-1002,2619,-2235,2612,91,-91,-3749,-5375,1923,353,-1949,-320,-92,-3534,-2681,2751,-918,3893,280,-92,-2605,-657,1318,-2598,3490,388,-91,-904,-417,906,-3779,7773,186,-92,3787,-3742,87,939,1666,2205,-92,2888,-6521,-2257,-2652,-1419,-530,-122,-1264,-1304,-2805,-1609,-3799,219,-120,1659,-2398,-3005,-3511,859,-588,-120,-553,-2951,1386,447,-447,2355,-120,-2162,941,4281,9794,2092,-99,-96,85,5398,15209,1217,-1259,40,-99,-4624,-6309,-1248,1831,-3214,-774,-97,-4707,-1932,3744,4140,132,-99,-97,-2066,-4810,-1480,-1483,-597,524,-96,-4794,-4210,5323,6754,1815,-57,-99,2831,-7977,1007,3791,1734,163,-97,1457,-4445,-231,-2542,-3727,-94,-97,5949,-4036,-2607,2374,328,-45,-97,-3346,1092,1447,1822,-1909,-80,-96,-5345,-9646,-5448,1158,3459,-138,-95,2867,892,2527,1313,-2226,-54,-97,-10076,2365,1607,-139,-3033,-87,-95,-4657,4479,-2860,-1383,106,-539,-125,1478,8166,7744,1466,1893,-125,-125,266,624,1666,-12,-54,-172,-125,-6339,226,3426,857,1259,-650,-120,-2612,741,-1405,1953,-1223,393,-92,-1520,3000,-2047,1409,2730,66,-94,2339,-4010,-1238,-266,-2273,-442,-92,-15108,-6189,-2669,2356,3045,-92,-87,-7521,1158,1536,-1835,212,143,-89,-3914,854,438,-744,-2821,9,-89,-2346,-6430,-1341,-2054,-1339,-859,-87,-3100,2146,38,4368,3518,-614,-83,-9227,2066,1233,8108,1355,-49,-83,2332,-2896,-1730,-1880,-897,-772,-85,1669,-1589,-2012,-1899,54,-508,-85,2356,673,654,5712,3661,-84,-87,1713,-3149,-5125,1284,3488,395,-91,30,-612,-1896,-1845,-2685,-252,-92,-393,-3678,-2888,-1219,8757,73,-92,-3179,1343,-268,2389,2913,-16,-90,-2925,-1040,6937,-555,3928,195,-92,-6848,-1480,-56,-6973,974,9,-89,-8571,-1788,-1177,-2669,-2082,-436,-18,458,3243,2657,1337,-200,35,-89,-2179,-236,2867,2814,-228,-266,-90,4571,3186,10404,1186,-170,-89,-92,-2391,-2711,-1678,-4744,-3085,-176,-92,-2452,-5531,-442,-8992,-334,233,-90,-9989,1607,101,-2527,4132,-23,-88,-3367,2377,802,1593,3952,-90,-89,3793,-2184,1662,-3394,-988,129,-87,1281,-4356,-1584,4040,742,139,-90,-4426,3602,-242,5001,-2156,-92,-87,4707,-2102,-3527,-2838,3405,-118,-87,-426,975,2395,-2450,3938,87,-90,3401,-3142,421,4111,2260,-346,-90,-113,556,-123,-1033,4064,76,-90,356,1270,5568,318,-2038,-26,-89,-1963,3657,1087,2389,527,417,-90,-2438,-1153,631,680,28,405,-92,1123,65,-1915,-1509,1735,-687,-85,-82,1499,2551,1979,2579,-188,-87,-1194,-129,-339,-1181,922,-87,-85,243,-1798,-1756,2935,9,360,-84,3525,1351,-1850,4693,823,-49,-87,-803,2351,-1042,-2497,5408,-12,-92,-5302,-565,-715,-3095,-583,66,-90,614,-1983,588,-2344,-433,-35,-92,-52,-791,285,5159,12305,-200,-92,4450,-11180,-610,-5551,-1071,-89,-92,602,-1374,2292,-2974,-7096,-226,-89,-3250,1490,1245,1073,6394,73,-90,8884,5956,6258,2739,7469,-431,-94,-1315,2318,1654,-143,5629,240,-94,-5246,1525,2450,3713,5380,-233,-96,4308,-1567,6443,-442,1885,-186,-96,4400,-2746,1565,322,-155,-125,-96,-619,1233,9192,2207,-110,19,-97,1078,-1019,6808,2572,2351,-200,-99,-557,4207,5825,8815,4820,-10,-101,-1026,-2391,3619,12548,2754,-36,-101,-1360,-2488,3787,661,2751,-23,-130,-167,-1812,2064,-3088,-550,-198,-127,1581,-470,-1568,798,6872,77,-129,4488,-5225,2490,-5156,-1758,-390,-128,556,4488,4894,6065,2459,221,-103,6194,447,1393,-3332,-5394,99,-104,2050,3572,2163,11559,-162,-134,-106,3120,1335,2449,257,2709,-99,-106,4452,6601,-5544,-6516,816,-117,-106,-4316,4419,-4560,1477,3921,-417,-108,8432,7933,13454,11329,16136,-423,-113,840,-6599,-6314,2864,1196,-182,-110,-902,-11058,1069,1014,-7354,-134,-108,5273,-487,2723,487,-3946,44,-110,2096,-7615,1292,-8719,-10983,43,-106,-8576,3963,16337,3596,5987,-238,-108,722,1836,-5813,-2702,1777,-106,-108,-442,5953,3076,659,1151,-111,-110,7719,6906,309,6219,-1508,235,-110,6184,2259,-644,2402,-1988,284,-112,1301,-2739,487,1031,3449,-183,-113,3873,-1186,2191,772,5959,517,-112,3155,238,4942,7436,1403,-170,-115,1264,2749,-5425,4097,-5001,248,-116,-842,-363,123,3654,1834,113,-116,-169,673,2673,-414,1365,-7,-118,-1546,-3516,-2706,-6919,-4339,383,-115,2198,-1767,4179,-61,-824,549,-116,-2228,-3015,-5944,-5575,4022,-132,-113,-3596,-4812,-11852,-9321,1097,-76,-131,4355,2820,-8620,-6660,6269,209,-129,1690,-2229,-4636,10,195,-132,-129,-130,3285,12136,-527,-6495,-106,-132,1561,-6258,2970,-2556,-5299,805,-111,-111,1874,-1441,7519,1662,534,-111,3471,3627,11554,3495,-4869,235,-110,-1718,-5434,10635,10510,13606,198,-115,8744,-3233,-1097,1168,-683,346,-115,-1678,8462,13861,21825,280,-118,-120,18711,-3327,-15130,-1541,-7507,73,-120,1833,-9681,-8698,0,-3820,66,-117,710,-1671,-715,-1861,974,494,-118,4010,1994,546,6309,3278,-33,-118,-1125,-5450,6196,-4671,8804,-600,-118,9924,10919,19165,6905,4062,-196,-122,-118,3264,8802,18353,10870,-219,-127,17386,1939,-10735,2748,-621,160,-127,4852,2533,-2500,2730,-153,-146,-129,652,8756,5173,2076,797,-42,-130,-11173,4655,-10566,10846,4730,-54,-130,1304,1052,5985,661,-3092,228,-130,-995,569,4208,1257,-2240,-351,-151,-3264,798,38,-5505,-887,-148,-151,610,-8227,-3293,-3774,-3996,-101,-149,-5193,2854,-10199,10420,-428,-355,-146,6370,-5019,-184,-1365,-654,-57,-127,-1110,-9689,-11722,2502,4558,-103,-123,14468,-2579,2596,2958,1981,-155,-125,4639,-2754,-5608,-12418,-1257,-33,-127,-1068,8430,-6903,-1760,-2570,-54,-125,-3548,256,1904,3732,-3996,-242,-127,-2492,-6858,753,1382,565,-252,-125,-4857,2791,-1492,-1622,-2546,-129,-125,-17509,996,-647,32800,-41058,379,-122,-5109,2941,1398,2565,-174,-35,-123,1859,-5763,-3906,-2742,130,-121,-120,1565,3850,436,7424,-2689,-85,-120,-315,-2589,2273,-572,1158,26,-122,1772,1767,8107,18488,1395,1819,-120,-120,9145,1017,3869,2456,-110,-123,4881,2770,1137,4732,4523,125,-130,2090,4142,8942,5079,167,-129,-130,391,-4309,-1398,2250,13616,0,-130,3843,6232,7095,5650,-1873,26,-132,-5772,-20881,-9176,-593,-3548,-229,-129,2365,692,-8613,-937,3641,-116,-129,1541,-3115,-1575,2942,3341,85,-129,-1156,-6076,3869,-727,-4081,-146,-129,3993,11513,19118,2468,-7026,-210,-132,-7624,8747,9116,104,1052,212,-134,-10663,-5196,-2356,-7173,-4193,-40,-130,814,-1786,-6954,-9672,3457,-256,-127,8302,-8316,5958,-1699,-657,-122,-125,1892,-1374,-9888,-1608,-4993,-15,-127,-548,-800,8879,7060,-2186,-118,-144,-849,3356,-7444,0,6822,-47,-143,7278,95,18845,8505,-5618,130,-146,416,5516,-1866,5886,906,-122,-149,10875,-7535,-702,-1075,847,-240,-132,-1205,-9982,2553,-751,1299,-131,-130,-2942,-2496,-5185,3966,6036,-78,-129,8490,3366,6328,15357,796,-125,-134,-5443,-3940,6218,3217,-203,-132,-134,2881,1499,2315,-3581,12564,-125,-136,1278,-15172,-17080,-6578,388,-223,-132,3057,2798,-3198,-1139,-3240,-422,-131,3327,1028,4241,-4796,-4469,-153,-132,-6949,-6827,7194,3740,12166,-209,-132,2840,7785,-2240,2402,4622,-91,-132,-1982,3057,-1254,1129,-2416,-254,-135,207,801,-1789,-1297,-4883,-33,-131,489,162,885,-2624,-9288,-73,-132,7,-4982,4832,-3415,1118,-165,-129,10669,-433,1907,8276,8806,-52,-134,-2061,1807,572,-47,-2662,80,-134,706,-3092,4394,-2123,-3321,-49,-132,-289,2979,607,2198,-419,-167,-134,73,-504,2509,13929,17247,-207,-134,-18320,-14525,-9735,-23016,-15039,-95,-124,-9682,21436,332,-1802,-3792,-164,-127,-5881,-5399,3671,5474,22571,-332,-132,68876,-209,13327,-14986,-5119,-153,-138,-4688,-4060,6055,90,-4363,-217,-136,2897,2125,727,953,-3125,-104,-139,-9469,4699,-9107,-8651,-4459,-151,-134,-15932,-25935,-4735,-48878,94,-217,-124,2720,-3645,1235,73,-2202,117,-127,38,489,-1007,-16802,7634,-10,-124,-5166,4622,4897,-1565,3092,-54,-127,-4327,350,-10223,-4127,-2714,-14,-122,-12049,-706,-2101,11427,13948,-30,-116,33,-181,-692,-1638,1942,-130,-115,475,871,5989,6801,6698,-259,-115,6466,911,1410,-457,-2092,-212,-117,164,1175,-1829,1217,-5264,65,-117,3546,1928,1270,2429,318,124,-117,-793,-497,-6923,4534,-870,-12,-120,-3073,3325,1358,-1492,1405,-179,-118,1050,9549,14704,5483,1245,-337,-122,1814,-4193,-1827,765,-3360,-200,-123,1916,172,1205,903,419,-44,-121,179,-852,-1739,-299,-2277,-88,-120,2681,9968,-141,-1810,1236,-122,-120,-810,-1944,-1981,1494,-341,-97,-120,5316,-2503,-711,-5672,-110,56,-117,-405,-3236,1339,2393,245,-49,-120,4071,-4563,-6380,-3509,-1188,21,-127,875,-3125,760,-263,-144,-127,-129,1089,-800,3,574,-419,-127,-127,953,1508,214,-6457,4704,-146,-127,2690,2652,989,3139,8472,-170,-129,8371,4452,-2337,9357,-47,-132,-132,-6655,901,-3511,-3788,3054,-52,-129,-563,139,7931,5118,-767,-35,-132,-1861,-3472,-2233,-8949,-2142,-129,-130,-226,-3923,3544,-3179,3321,-83,-129,416,944,-3080,1503,5740,-205,-129,1087,-1231,2528,-5632,-720,-89,-130,-4188,223,4963,-4024,567,-146,-129,-5923,-2420,-1807,-3749,2074,-189,-127,-3619,146,202,1337,1167,-139,-129,-349,4785,5589,1292,-678,-129,-130,-3993,-433,-2307,-529,3219,-376,-130,7404,3426,-7013,-8556,-412,-151,-129,2038,5351,-2186,951,9340,-132,-129,-6265,-348,-1920,894,1621,-89,-130,-404,3934,-626,3194,-1384,-82,-130,-866,2431,525,1713,-1929,-168,-129,-1939,633,1866,3076,-101,-40,-130,20175,139,13209,1320,6410,-174,-131,1016,4728,553,-1372,817,-212,-132,10785,4264,7726,1730,247,-134,-134,-28753,-7610,-1041,-4687,-2194,-89,-129,-11878,464,1537,13214,-8013,-139,-132,5815,-918,-1464,-6394,-934,-63,-132,3424,3977,9806,2626,641,-257,-132,1593,-4716,-2751,-4753,5589,-132,-134,-297,3676,-2993,3695,13042,49,-134,-5836,1270,949,2391,4450,-83,-134,-1383,-2276,-2473,3115,3095,-181,-134,1727,-19,511,-4714,7554,-155,-134,-2208,3723,5502,-3294,10206,-177,-136,7667,2626,-2132,5394,11533,-202,-141,4963,214,151,1275,1963,-179,-139,-2920,3539,-955,8530,17732,-42,-144,19766,4979,549,-17659,5010,-5,-144,-378,1209,10910,393,-1631,118,-144,-6168,2415,-2372,301,3895,-130,-146,-12691,452,-1793,5556,-2464,-285,-143,-495,-3372,-2130,-2685,-1760,-468,-142,852,405,-1094,47,-723,-138,-142,-20800,-17737,-10004,-10877,-4669,-115,-137,9263,7646,9467,18186,-19396,-409,-139,-63461,1871,-16007,-95330,9272,569,-124,-58536,-14699,-31132,-31769,10338,-141,-111,-37949,11366,24112,-27190,-19683,-150,-106,19280,31683,-19236,-4730,32708,-103,-111,28962,29522,-5671,15868,4678,-89,-120,-2316,5112,-15497,8326,2779,-117,-120,-3029,-6305,5244,11641,5639,280,-120,16094,14360,5784,7352,-367,-125,-122,-17026,560,1861,-221,2059,-2,-123,1205,3944,-7735,638,-3370,-52,-122,598,-504,-1843,2831,269,-184,-122,301,969,-4120,4833,605,-89,-123,2431,1980,6697,1765,-1240,-123,-122,-2,-6667,-1537,-3320,-4931,-91,-123,-4593,-996,549,3238,2967,-468,-120,-6796,2202,2895,-9566,-1485,242,-122,-389,4192,136,1330,299,-62,-120,1194,-172,1136,883,-8142,-78,-120,7855,1927,977,155,1438,-153,-122,1951,-2370,2365,-944,-753,-44,-123,815,-4394,3511,1864,-3045,-14,-123,101,506,-1776,1296,6349,24,-122,2198,6815,623,-5215,-2400,-515,-123,-5480,-683,-3116,-44,-979,73,-123,-3257,-2026,1085,2885,-3511,-120,-120,3909,205,3092,7413,-6197,-181,-122,10978,-5168,3064,-1899,7622,-157,-123,-496,4490,7156,-3116,866,-117,-125,1026,530,-1796,-1894,-1718,-57,-120,278,4594,2640,4843,-6119,-105,-125,181,-9317,4088,-4535,-4777,-273,-122,-666,-12567,4740,-2831,2035,-122,-123,-3165,-1774,1871,-5074,-2986,-120,-120,-6571,826,-4640,-3229,5864,-150,-120,2466,447,2916,2777,-4978,-249,-120,9270,835,4537,-1741,-4250,-130,-120,2504,1654,2761,2389,2845,-142,-122,5575,6265,-111,2299,3732,-181,-125,2417,-4045,5770,184,5438,-19,-124,1468,-1336,-2384,1348,-8276,30,-125,-4193,-1553,282,965,3259,-148,-125,-7446,2777,3182,264,2440,-66,-125,9239,3707,5855,-52,-1158,-125,-127,2036,3786,-42,5707,8279,-391,-127,2871,4954,-165,3095,-330,322,-129,3737,-958,-6478,44,-1527,-139,-129,-13922,2454,-3389,2455,5660,-139,-127,-4017,-3036,1798,1892,-2841,139,-127,-14,-4405,1828,-3240,3085,-191,-122,14503,15600,15565,-10065,5001,-182,-124,-2128,1055,3012,-4923,-5712,186,-125,-1503,4276,3836,1037,-1355,518,-125,1668,5681,-3099,-212,57,-257,-127,2534,-1390,-1092,-2921,0,-176,-120,160,-1177,-18887,-9496,3328,-90,-115,3490,3871,5283,11124,-729,108,-122,727,-2417,3812,3438,-976,405,-123,2135,5247,-706,-2334,-708,-327,-125,3716,1899,-3283,238,1033,-125,-125,3478,-477,-1290,1087,203,-127,-127,5732,1062,4330,466,2190,-169,-129,11187,-12239,9848,-5657,3144,127,-127,4109,3483,1172,5556,1230,-190,-130,7345,977,7156,-6413,-849,466,-132,635,5251,4339,-471,4267,-153,-132,-2443,-1332,2135,-847,7288,412,-132,-3316,3488,5723,-3412,513,-132,-130,-5320,-5034,8721,1137,1967,-19,-131,-1904,-5083,-6279,2866,403,-94,-130,-713,-1099,4156,-2327,-4039,-531,-130,-988,2348,-1322,87,-1108,-808,-129,-12317,-975,1062,2007,4227,-429,-131,1292,1452,5542,10058,3320,567,-134,6010,2403,68,106,3151,109,-135,4907,-1238,-661,-675,3572,-94,-137,2998,3507,8610,-8387,-2508,124,-136,1504,2409,-567,532,1184,-174,-137,4479,-3015,-1600,2108,4909,170,-139,-796,2368,-6243,-6966,1576,212,-136,-421,-951,-2871,-2502,-5090,-16,-132,-16501,5913,9345,9724,-202,-212,-132,2450,106,532,3231,3363,-1043,-134,3744,-442,-5244,4046,-1902,-357,-139,-2095,2940,4567,4208,2142,35,-139,2697,2911,3873,-5619,10552,-1205,-139,-6212,5534,-2049,6707,-8355,-1141,-132,163,1398,3198,84,-195,-14,-132,2593,-4162,1642,5050,1866,-169,-134,-1685,2859,1509,4629,-1415,-334,-136,847,259,4172,-82,-6860,-151,-134,-2984,-10413,1588,-315,-518,-280,-134,-2650,6109,-1108,3742,-2050,155,-134,-680,-970,200,4491,2527,-409,-135,-5570,2961,-198,-235,1214,-14,-134,8429,8891,3786,-8483,162,659,-132,12379,10629,6924,-4380,3610,-139,-138,1958,6400,-402,3257,10032,-155,-141,-2024,5048,6678,4615,-12270,-289,-139,-28360,-9251,15231,-7535,-3460,64,-137,5695,3476,871,-8277,-981,-35,-139,1492,1111,1339,2880,-2850,-318,-136,-24950,17490,8674,-8175,-5773,-273,-139,-7747,-17807,-6067,-71556,41349,-209,-127,-37818,9602,8253,4968,-23625,442,-127,-25324,-8123,16508,5987,5881,-348,-125,5972,5361,28367,6636,10896,104,-132,16630,8771,-10514,-10178,5012,-183,-132,4906,13431,-4250,560,4146,210,-134,1802,3881,-1073,-4825,8145,259,-139,-1777,-7212,-8070,87,-141,-624,-134,440,-607,3622,2734,-647,-131,-130,-6424,762,-1410,4575,-2748,30,-129,689,-4327]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("NLB Top Brands", {"daily":{"start":16344,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1009441,-2262,1369,279,-23,1128,-2691,752,-5417,-6823,2570,-23,-976,-333,-4035,-1897,5705,-1527,-27,1063,5118,641,5285,1597,882,-34,-2037,4029,-2,2746,11743,1985,-36,-1861,-1472,1989,2142,353,3351,-37,2676,-1806,37,-2544,-111,505,-38,900,1218,419,-339,6332,3176,-37,179,141,2346,-69,222,-109,-37,-3290,1666,93,-1378,8292,-1591,-41,-4864,-6046,-4816,316,-11604,-651,-358,-6936,2484,5185,14190,6164,-154,-45,2818,2343,360,-104,941,1913,-46,-810,-5194,-890,652,-2394,3129,-50,-11683,657,6404,10650,1070,-1499,-51,-769,3967,-3808,-3702,9956,4493,-52,2349,936,5723,4058,498,15349,-55,3980,-9567,-9826,1995,-5258,215,-57,5200,7829,134,661,-1242,-1288,-57,-1762,10125,-2692,3318,3217,-2037,-58,-176,-1158,985,734,1327,3382,-52,-58,2500,585,2320,928,3056,-53,2838,-4072,1822,2547,-4828,5135,-59,-643,-5753,8635,8651,-4023,1635,-57,8511,486,3224,-3271,5195,-4661,-64,-917,-8232,-8310,-6783,-394,4493,-60,6281,-6196,5820,803,-3384,-7801,-60,4447,4399,8090,6059,8390,-63,-62,-3296,306,13282,-1081,-16050,-4707,-61,4416,4282,3166,-2463,5045,-2258,-61,4556,-1560,-10799,-6938,-4289,-39,-38,1242,-3147,-877,-4575,6088,2459,-44,-2836,-671,-3462,5307,-5290,2021,-51,-1179,1593,5959,2887,-1251,-860,-52,-489,-6219,11000,-613,-6544,-52,-51,-140,-1122,-2854,-8827,-9925,3331,-51,-3935,-717,4637,198,-3425,376,-79,-4582,2497,355,3716,-5532,3112,-72,11783,2865,1251,-3669,-2239,519,-73,-15167,-3500,4847,3473,-1782,-778,-74,-8863,-2275,-1462,4317,10412,-4200,-75,8426,6431,413,9014,7828,-78,-77,-553,-3066,-6727,-5246,-12232,1962,-75,-8805,2620,7513,530,2619,-746,-75,527,469,3460,-486,-609,-2364,-77,8736,-13093,-11909,-2893,2112,-2577,-78,585,654,-7737,-12268,-26525,-3393,-74,-24571,379,10532,22792,6087,-77,-77,-3868,-18367,7915,5102,-12635,3969,-74,841,13091,-1572,-845,-2764,-3793,-76,-1723,6188,10229,2533,-15065,-3626,-74,2777,-7197,2559,-6008,4790,3246,-74,-11870,-986,12170,-1535,8345,-461,-75,16050,801,9348,3066,3481,-4240,-78,-201,-6608,-1455,7378,1703,3151,-78,-170,-914,-3108,13009,14060,-80,-80,-3244,9149,3655,-1728,5786,-4282,-81,4587,3491,853,1419,-1588,692,-83,-7648,3256,4569,-9775,-9939,-1671,-81,4394,7992,8914,4720,1115,155,-84,-3192,-1060,2896,5978,-3759,1277,-84,-3259,4603,-5236,-14577,3245,-10354,-82,-1526,-4377,-2652,-5151,-15108,-467,-1643,-3478,12480,8023,-657,-8376,418,-82,-402,2031,9457,404,-2319,710,-83,-2421,6760,-6641,-4144,1434,-83,-83,-17985,-697,-4643,-17070,-8170,-4951,-78,-213,5730,-5034,5505,-22342,-485,-74,-973,7857,-13706,6638,13506,3349,-76,-5446,8784,-3713,-3079,14341,-1293,-77,-1626,-12107,-183,1146,-19083,469,-74,-8366,-1143,-3636,-12740,8945,2795,-73,6923,8357,14744,-1907,-359,-488,-77,9219,-8356,-4929,10213,179,840,-78,-2215,20802,5554,2640,3383,-3584,-81,375,-5198,-713,-2404,17353,-10468,-80,1649,-4730,4160,7074,-9819,1524,-80,199,-703,413,-2667,733,-745,-84,591,4901,7461,-10290,-6555,-2162,-84,-1990,-7650,6053,-5829,3717,17,-83,797,5761,12312,6795,624,-1682,-85,3824,7875,1410,-4486,-5393,3882,-86,-2158,-451,-2139,-4943,-11167,-88,-88,5034,-8301,-15379,2253,3586,121,-87,167,10792,-4982,-5879,-2463,2015,-87,5442,-4799,-661,-2957,7598,-1334,-88,-2867,11507,8640,6104,-327,-48,-90,833,-2454,-1868,-183,-2680,1609,-89,4860,-4706,2515,-5471,-9304,1917,-92,-9064,-5786,5051,1059,1812,-88,-87,13523,-4442,903,11755,-40187,15428,-87,-15460,18714,10214,9310,3324,-1492,-90,-1660,-7705,-2208,5063,10877,-462,-91,7426,8629,-3096,8683,-6376,1400,-92,1912,358,5598,-1724,849,-86,-92,-2899,2536,2772,-4708,-1046,-806,-92,-895,-9427,354,2294,14260,-1189,-93,834,7823,-940,340,1000,-579,-93,2094,-6208,-6461,3918,-5912,-333,-91,-3119,4347,-3603,-246,-533,-288,-91,885,6184,-3754,1101,7627,-2124,-92,-20,3682,1093,-7503,-13588,-2104,-90,4402,-7029,-2023,9163,-7352,1149,-90,1815,4592,3110,12435,-8856,903,-91,-10136,1017,6764,-5232,5584,2774,-91,-900,68,5122,-4306,-268,2008,-90,5555,-7128,212,1754,4164,1825,-92,-3563,4750,1035,4506,-1756,4918,-93,3117,-315,-2767,-3532,-1393,460,-93,-3794,-5524,-12675,-6916,-2856,-1509,-90,17082,6139,7535,-4104,5414,-385,-93,-4778,12643,41,7805,-6153,5436,-102,6135,1739,-871,1688,7916,-2949,-104,-5140,-979,-1135,-4227,-3324,-1043,-102,8405,-947,10409,5783,8483,10496,-104,1951,4928,-5402,1364,12772,-102,1735,3684,1878,-4802,-1363,-262,-98,-77,-149,-1610,1937,-5277,-4782,-95,1537,7617,9812,-1551,-773,-96,-96,-1725,-1100,644,-557,-7179,896,-96,-2833,3433,-3566,-2942,3624,1463,-95,-2603,51,6655,-2124,1089,909,-96,-6576,-862,-1981,-2773,339,3285,-96,-2466,1994,3686,4772,-943,2482,-97,6874,1756,2894,3818,-2264,98,-98,-410,8248,4950,1490,-5409,-1944,-98,-429,-614,11690,824,1837,-3077,-99,-2720,-1826,-1376,1589,1826,-3284,-98,590,-4565,6702,2598,-4837,-145,-97,713,-6294,-4057,2070,-382,-1091,-96,-458,1053,4575,8253,-1250,2446,-99,-3045,3144,-1566,-1746,345,1867,-99,-114,2120,-2846,-5040,-1766,-97,-98,3835,-5657,-4406,3582,-2289,2790,-98,12808,-2418,-2702,544,899,-2826,-101,1947,3739,121,3701,4414,-1867,-102,1180,2226,3505,239,1972,-1069,-104,3046,-4979,-18409,-3163,3052,-3566,-101,2867,-2860,1951,1400,-526,1482,-101,138,620,903,1670,6032,-102,-102,96,-5294,-1136,538,-2903,2723,-102,-3308,108,-1470,-1987,4723,-217,-101,7430,-7329,2761,2080,520,-257,-103,80,-7258,-1726,-18647,-1358,5,-101,4511,1267,1905,-7259,-388,-1956,-101,2585,1411,9550,-376,4899,-144,-103,-243,-2198,-1833,2526,-4628,-8942,-101,-5573,2650,-2957,3200,-4691,-2160,-100,-811,4688,-2793,-314,765,-469,-99,1345,4262,-4346,-5897,-1757,-1701,-98,7220,-1671,6582,-7878,-2678,-2207,-98,-1366,6851,-3528,-593,988,479,-98,-424,-1624,-9163,11690,6758,-4952,-99,-850,-1417,5161,407,-6973,-99,-98,10206,736,4726,-2404,5729,-4137,-100,785,2384,-3039,-3923,4217,-3328,-100,-2032,4404,4744,3000,2413,-1554,-101,4334,6749,817,2516,2064,1807,-102,-216,-1633,414,1605,-229,2214,-101,1110,1286,4214,-2851,-3385,513,-101,-2769,242,-799,5692,11129,7819,-104,-527,3868,4663,3216,2242,-755,-105,3075,1104,4673,-8566,-5980,-1379,-104,-2121,-3981,-11348,149,-911,-1431,-102,-72,9548,1291,-1143,-2323,-1604,-104,-2114,1309,-2543,7961,-4346,-1742,-104,538,-334,2089,392,4302,-104,-104,3983,1589,2672,-437,1952,2081,-2081,9267,-3600,-6395,2157,-4007,204,-105,-91,2721,-4429,-2537,-6006,-3240,-103,-103,5566,1260,7937,6342,981,-105,580,1754,2205,-1821,6289,-6699,-105,-406,-7766,8001,596,3024,-107,-106,5385,-1239,-3257,-7856,9369,-1451,-106,-5796,-5862,-2815,-9569,-21631,-1101,-102,-28832,3606,7190,-28649,11192,-875,-99,13807,-1353,5806,7001,-3774,1330,-97,-3251,-1387,-200,3240,10161,-1156,-98,8580,-8332,-7636,-7354,-2467,-6871,-96,6714,1085,-5849,5826,6954,5834,-97,873,-8750,-6081,3044,3575,1728,-97,-10913,3408,764,-16003,-12502,-1550,-94,10916,-4153,1959,8444,3329,-134,-94,-9871,7247,5820,12647,-11105,-92,-92,2395,12587,-7062,4019,4571,211,-94,1312,4831,584,-3660,-4048,2625,-90,1290,-1478,-3599,8177,-36,3728,-90,746,166,-115,1104,9686,795,-92,3399,1621,8680,4783,1419,-2280,-92,302,-4328,7670,7003,-3503,988,-92,3904,395,-5643,-191,-2151,-88,-88,-1497,-6459,9848,-8032,5988,1063,-88,3821,-2966,5094,-4962,-2029,3133,-90,301,-2302,-2144,6115,-3339,-93,-94,-4598,-1233,2978,-9116,7636,-4643,-90,-12800,86,60,3588,8165,-3110,-90,-2054,1905,-830,8700,1092,-872,-91,4658,1624,-5789,6085,4158,183,-92,-3473,1429,2813,1697,-594,-3709,-93,953,7483,2634,3888,-6325,3966,-94,-2893,567,-1861,-75,4222,4945,-95,2388,6565,-3250,617,-9634,6533,-95,-1526,2847,-7985,10297,-153,-1095,-95,4046,-996,-3536,-7476,5578,-564,-95,6211,-1268,4148,-4068,-6401,2032,-95,-45,-5299,-3104,-5195,-2426,987,-93,1491,5356,3428,3992,-997,-3186,-95,-3944,4727,814,10521,-1594,696,-95,-3296,-1182,-1697,8067,-1886,6242,-98,4629,-887,4616,-9388,-4141,-391,-97,-3872,3658,-20565,-19028,6898,-3689,-94,-2177,12773,-352,-6171,13343,2036,-111,-1925,-5698,-16977,19543,-12086,4134,-109,-1543,7604,12306,9013,-12525,-1441,-111,3512,2226,10615,-6274,-1224,4660,-111,-13135,8405,-6154,1539,2560,-2839,-111,-10936,-22028,5087,-2037,-6508,2683,-103,11865,-49,16471,207,-3187,1302,-103,11657,-15025,-8671,-10432,-9474,-1097,-100,-3648,3988,10412,6735,-17286,4470,-99,-14476,-3149,-9133,-12119,-7930,1659,-92,-17039,109,25152,-1759,5637,-4045,-105,6613,-465,-1722,-18565,27833,-2788,-93,-900,6821,616,120,-5031,-228,-93,-5868,9956,1774,4856,10172,-601,-95,236,-6579,2030,-1258,8336,-214,-108,-7462,-1185,16328,5905,4055,1143,-110,4251,11113,-1341,-10519,1462,-168,-108,1230,13118,4124,-7427,12292,449,-110,-105,-3401,6614,-3649,4679,1629,-110,2169,449,-1803,-3095,4042,1834,-110,-393,4289,-2849,-5426,-2230,3110,-108,13111,2176,6175,782,6506,-1120,-113,585,1458,-3336,8145,-19725,6034,-113,-1382,6713,2190,3799,10541,-801,-114,11070,1923,5501,-2391,3970,-1307,-117,2096,-4872,-27,-1633,9381,-4210,-117,936,2016,4013,5266,2987,259,-115,-399,5054,-3984,6746,8953,-116,-117,-284,-438,-11445,-2274,9837,3953,-116,-7937,-18109,1311,-10355,1910,-2064,-106,-17156,7142,12950,11086,-6195,1943,-106,-10195,4291,-1142,-9669,5096,-106,-106,1598,-7558,-10022,6552,-8711,-890,-104,-2311,11482,4214,594,10976,-590,-107,2503,3338,-2181,2283,231,-106,-107,-725,15451,4464,6127,-7289,-328,-111,-790,-10313,-785,1071,2204,-600,-110,7592,7342,9595,873,-5420,1452,-112,-2347,1953,3203,-3195,-4823,1717,-109,3695,-2284,-1429,1889,-4938,-492,-108,3909,10210,78,-5188,12016,-1857,-110,918,-4089,-13332,-6249,-7055,-111,-110,-21173,-1830,349,11249,-6261,-180,-106,-5391,10973,-18106,-472,10742,3415,-107,9150,-8568,8950,-3930,-16620,835,-106,7381,-557,3740,7110,3285,1371,-108,391,-450,11700,2847,-1878,975,-112,-3104,-2495,5576,6481,190,-4883,-113,-3370,3309,127,-96,-2309,1381,-117,221,-1519,505,1592,755,-8,-119,2388,-3260,-11149,1728,4414,-742,-118,-113,-6173,3658,3726,3353,-119,-118,-1469,2650,1022,130,-5252,-991,-118,2011,-1007,2797,3133,2792,504,-120,1847,-1788,3066,-2560,1291,417,-119,1741,-770,2700,2644,1235,1171,-121,-771,269,2203,-1818,3728,-1455,-121,-595,-1160,-2668,-768,463,970,-120,4006,2507,1432,-258,-3018,633,-120,-5192,-5221,3150,-278,4679,-181,-115,-1427,-319,2698,2536,332,-1584,-115,5356,-443,-1319,4009,3674,646,-117,555,141,-433,2639,1493,-2672,-117,-6145,-347,-1732,8345,-1964,2069,-117,1666,-2393,6171,-420,635,-118,3222,-3965,1568,1986,3604,2502,-119,-333,-954,-1979,-304,-994,2723,-118,-13407,6175,2152,-946,-11221,-1015,-117,3396,8961,7452,2465,-3877,1143,-119,3211,1624,6923,-4452,2515,310,-120,829,-4574,4521,-8795,-7076,-544,-119,-27385,-18199,-1300,-31220,-13073,-285,-110,27154,-20930,24749,-19803,-19008,-6042,-109,-54160,21284,-23963,-71393,56451,6404,-104,-73734,34880,-19952,12642,-12693,4322,-99,-20322,63536,9432,33800,-39297,796,-103,25262,-4244,-24086,17025,-7421,4787,-104,37218,-1726,4918,6177,94,-3428,-102,320,18816,-18270,7189,17880,-105,-105,-4548,-23701,20601,-1293,7226,-1556,-105,10453,-4298,19388,-8367,-16212,-108,-108,-8174,8365,2871,12229,12873,-3048,-110,345,-8162,-14273,-3041,8988,-404,-108,26352,-5381,6356,-8337,-4707,4910,-110,6293,3425,5252,2220,-1744,-6313,-111,1672,14542,15524,-7341,16043,-115,-115,5656,-6953,-70,-49286,7336,1930,-111,1384,22345,756,2283,-231,518,-116,2695,9305,-28280,8903,-12029,-707,-112,7821,3364,6922,12241,-7489,3107,-115,15901,-13724,7962,-2610,3845,3220,-117,-2511,-198,6983,-5194,426,-466,-116,11164,934,177,-15526,-13196,-1880,-114,5475,-11501,8382,-12176,-303,-5091,-113,12982,1380,9374,-2430,-2722,649,-114,1264,2902,12915,-4384,-8048,1074,-114,2332,69,-1476,-839,4684,4044,-116,13453,-2823,9740,-3449,1302,-117,-118,-3932,-1267,10643,-18133,-8767,-1616,-115,6501,-17849,17834,-9435,-2307,-509,-114,3882,3395,-4543,-7518,-5125,-1965,-113,-15256,9524,-7155,1357,7676,124,-112,15827,-5203,2174,2172,-7897,827,-113,10183,-9731,6101,7522,5889,-1240,-115,12523,-3398,-3783,-10260,8613,-2402,0,-11277,119,-5099,-2859,3815,-114,-113,-18655,-1869,-34756,10010,-6447,53,-108,9947,12350,23918,9462,-7234,-413,-113,15321,-1381,12198,-6993,6019,-1155,-115,7580,-4017,-7172,269,1352,-1605,-116,1615,13053,1911,842,0,-1270,-117,-5145,6251,2873,-6008,1774,-388,-118,-3206,3309,-3319,1408,-3598,-1097,-117,-2605,7188,8543,2081,-7933,-1009,-118,-11956,7089,2572,927,-1197,-257,-118,12249,423,-3773,-1778,-1485,-121,-121,-5621,1485,6515,9153,7863,655,-123,-7875,818,4930,122,-5331,487,-122,-1285,8943,12789,-2234,-5358,-251,-123,-2408,5353,-18795,8282,-20210,-2364,-120,15548,12111,9384,12779,2771,554,-125,3311,-5115,-4939,1055,1717,1867,-125,3369,-3,-3088,169,-4029,-3104,-124,-6824,-836,5190,-16207,-12106,5772,-124,21755,102,-4031,-5820,9732,5445,-127,4446,14037,6738,6529,-7731,1630,-129,2609,4273,5243,-5652,-7497,985,-129,8790,-6213,-6317,4632,14104,845,-130,3998,1533,2288,8396,-2033,-1119,-132,9722,2000,3038,2058,5281,-991,-134,385,-645,-4123,4682,6546,-652,-135,-3138,-17651,4634,226,1295,-1422,-133,320,-3263,1932,1043,-10811,-132,-132,5841,-13810,17198,9587,4354,-169,-138,-8116,-20433,-11875,8842,17449,-895,-137,-142,-9274,-16149,15100,754,1370,-136,8306,-1576,-3255,-106,6144,4394,-138,-4499,3763,3315,1603,9088,4636,-139,245,-2696,-2005,2531,5699,3434,-139,2379,-624,-4710,870,-6922,-137,-138,12293,6223,-5875,3799,4902,-993,-139,-2263,5991,-3916,6455,6639,4365,-142,2,-8089,11449,-15686,15758,-1670,-141,6841,168,3011,-4341,-8663,-337,-141,-26361,13371,11425,3143,14804,259,-142,-296,-9010,1975,1279,-12708,-1084,-138,471,6852,-2026,9374,1362,2905,-140,843,6054,5281,4116,1661,-2107,-142,-1358,-8448,-10038,-6677,7037,1501,-140,9400,-1665,-3348,-6167,3857,163,-140,6645,-4182,161,251,-4636,-1877,-139,3008,-2444,-8104,-4297,-4854,306,-137,5357,126,-2955,-2319,-8786,-1084,-136,-21349,10021,10557,13433,-2534,-473,-136,574,-19156,5329,-8299,12986,-1189,-135,-10613,9874,279,19483,-967,-600,-137,-4960,-3972,3487,15964,7053,-372,-139,-2345,5981,-1035,-4372,-3232,442,-137,2256,6882,-5259,5338,1215,-3634,-138,3757,7902,748,3433,7259,2992,-138,-1603,-10437,-3037,-303,11262,615,-139,2195,2274,1027,1908,-12003,5446,-140,-1053,-1406,437,7296,-40280,-4681,-136,8534,-14551,-3613,10228,-9079,3178,-135,16581,19415,4080,-4415,-5128,2705,-139,-8459,-6974,10170,3734,-17880,421,-136,-13031,23074,5492,5230,-868,-807,-138,10003,2141,-3395,588,-5552,1175,-139,16735,3613,-7618,-3525,-159,-140,-139,-3104,13244,1005,-11104,-6846,1094,-139,330,-12455,-4776,-5375,-19765,-714,-135,-16806,1897,10643,5454,16992,1432,-135,12232,9955,-5173,-29525,5750,-12382,-133,235,4445,17118,-12895,-11307,1409,-133,-13433,22440,-2872,-16568,-7562,904,-131,-5902,-6484,-11274,-12475,42703,-3893,-131,-7701,-22396,13945,-13852,-19249,9678,-127,-22790,86,37049,-18283,-12512,5715,-126,-1774,12871,22436,10056,6466,3203,-132,1612,9334,-9102,10960,4333,-1651,-133,3733,17549,-14637,-17987,6381,3536,-131,8050,-8072,-10024,3601,5324,3662,-131,-14723,-4669,10315,-4391,-3661,3121,-127,458,6643,-643,-13048,-25240,-123,-124,-3141,-18321,14842,27611,-14608,-3151,-123,95,6993,14886,-23338,-6976,-236,-123,-25987,5484,-667,-8129,27887,1193,-123,1373,12466,-30441,-8640,5553,-3016,-120,17283,-12430,6261,11547,11084,-1291,-123,1529,-7291,212,10010,-7123,-2387,-123,4101,9097,-2848,-22943,-26130,-120,-119,-28081,9270,11958,-24487,-877,-4285,-115,2929,13442,-8911,-1229,23262,-1451,-118,-1370,-11319,-2365,-11065,11925,-2522,-117,218,-10435,12169,21815,1595,802,-122,-10489,-3225,-2964,-10626,20949,-3289,-122,-2208,17577,-3470,6622,-4525,993,-123,1517,-9791,26471,5204,15645,-4838,-127,-2261,-7271,10300,117,539,-3246,-127,1247,221,11589,-183,5818,3215,-129,256,9156,-2363,535,-10960,7844,-129,-15512,4758,6257,9445,-27905,-2686,-127,-4640,-8150,-11367,-1391,151,318,-125,-3148,2197,7895,6200,14955,-9887,-126,10951,-34764,-714,2504,-7443,1929,-124,4777,-11282,-8824,904,-17732,7702,-122,-8497,4658,13271,-9592,-18185,-2238,-120,17218,24124,-9681,-7360,-12729,3617,-121,-7182,-1415,527,17168,-13475,886,-121,18706,5090,-7022,1301,10688,5030,-123,7733,11026,-13167,-15039,11355,5172,-123,-3551,1224,-16852,-4585,23032,-6982,-123,5732,-3722,-14468,31742,14499,-20437,-123,-1921,4896,-11395,-1020,8157,-2789,-123,-4795,17335,1933,-2187,-5258,1966,-123,-9557,-4965,24941,-671,-6229,-4843,-122,-10787,-12513,899,2163,-1774,-1229,-120,5334,8216,-2342,-27046,-6123,-807,-118,-3340,2317,13367,-11913,3435,-77,-119,-119,-1270,-8280,9974,-3398,-1099,-120,3507,-590,12693,-7383,13745,-121,-121,565,-1221,6785,5713,3941,-1491,-123,840,-3898,-12249,-4302,12126,376,-122,8068,-2449,473,6396,354,1629,-124,-8446,4547,10675,7208,-9472,3108,-125,-7102,20514,-2555,-5728,-2451,5435,-126,10085,350,-2719,-4980,-2759,4877,-127,71,-14602,-2800,5013,-10921,2888,-124,4501,-3036,-7103,4882,19214,-561,-126,726,-14328,-1242,-3664,-11264,-1678,-124,-8912,8437,-17389,28335,-14126,-1853,-122,7850,8875,-13675,2697,-8835,9853,-124,4528,-2477,9608,7753,8630,773,-126,6230,-2279,-4565,1613,1923,1237,-127,-1131,5058,-5980,13008,-4802,-127,-128,-349,3115,1861,-2776,1651,-128,-128,1343,-17939,-3884,16243,6694,4682,-128,-1778,-14957,-2069,-13096,16168,4223,-127,3183,-6962,7264,-203,-238,2585,-129,3347,-3775,9783,11869,1095,265,-129,-2277,-9951,-6488,3806,18548,-1376,-129,-352,-2040,-13659,17291,17204,-136,-135,-4787,3386,-7811,3201,-2474,-3441,-132,8046,7733,586,10265,-3423,-12688,-133,-3590,-2290,-7062,6365,-13734,9761,-133,-6235,5929,-2184,3982,13636,4260,-134,-577,-4057,-3773,-18413,-3501,831,-131,248,3180,12260,8971,-14955,-3413,-131,-971,6919,2063,-2293,3223,6118,-133,2241,8003,-902,210,4046,9759,-135,2851,-10514,-14919,-4555,3738,-1263,-133,9170,-9379,-3088,2089,-9499,1157,-132,6055,-10786,-5972,-5297,-1158,2614,-131,6762,-6265,13605,-8054,2605,2640,-132,8553,15341,2139,-10261,3404,2167,-134,-886,575,-2532,-4436,6651,-134,-134,8234,-5244,2474,11921,-9917,6431,-136,-2988,-3314,-13133,-19862,3335,-1287,-133,938,-15224,2833,11481,-884,-5192,-132,-1322,-11603,10047,-4582,10425,-3414,-132,5342,13791,-1718,-5502,-9383,8491,-133,11169,80,-17601,-5560,-15740,-2999,-130,-1073,8087,-17747,-11545,-1655,-278,-127,16003,-1984,10408,29119,-5878,-3686,-130,2393,-1420,5187,-1284,5423,530,-132,976,19867,-2740,-10261,6247,-2061,-132,7400,-9272,3248,4976,1777,-1468,-133,-3677,-3046,-1943,2333,12130,5102,-136,-7396,3080,1429,11049,8553,-136,-136,-2053,4495,6238,7063,-10806,-2487,-135,5918,10635,-14147,11540,-5500,-3514,-138,-138,4744,-664,-4583,-5771,5814,-137,-137,-4793,854,2154,-2801,2739,-136,12892,-2473,3379,-2768,288,4993,-139,-1044,-9271,-2402,12765,11311,-139,-140,1487,2172,10381,4488,9176,2156,-142,8906,7024,-22694,9376,21302,-6811,-144,-3686,18062,8286,-2578,5853,-1648,-144,1420,-18076,9302,15605,-7187,-2643,-144,1149,-7490,-1594,24765,-1887,1003,-146,-7854,637,-4210,11524,6758,1061,-146,-2819,-16755,5825,16014,-7742,-3622,-144,-2914,15637,3660,-3198,-8808,2774,-144,9100,5228,13441,3818,-8673,8164,-148,-2183,-3649,5002,3255,818,1879,-149,-405,-4574,3462,-17283,3872,1153,-151,2426,464,-10441,9268,-1932,7937,-152,-13312,-7879,-2701,-2332,-16635,2473,-145,13348,21369,-8193,-11681,15715,464,-149,-329,-17481,-1224,8356,17281,-150,-149,14978,4040,-6235,6629,6159,-5053,-151,-571,2786,14461,-9521,-2799,2011,-151,-168,1608,-5886,-1787,4293,-150,-150,421,3636,-13593,-7102,12165,-3647,-148,2148,1984,14468,5708,-2265,-3515,-150,-714,12597,13211,-11135,-4123,10171,-152,7871,1393,-1590,677,-1489,-151,-152,-1882,8981,1113,4936,-10733,-1134,-152,7678,1560,7489,-1104,5395,-2636,-153,-2611,-5605,18076,-17777,2707,-3590,-153,-1759,890,-23084,-16623,-6542,3868,-149,13432,708,-29785,-10802,13020,-1035,-148,-1567,42,18788,-17241,-28875,-145,-145,-38588,-4243,957,27629,9874,1077,-145,-1552,18702,5034,12644,3915,1612,-147,12128,-7110,-802,-12000,9628,1259,-146,-3172,-3810,-7341,4526,16922,-214,-147,-145,-24615,-5531,-5242,-26951,-670,-141,15284,-2581,21402,10267,8470,-6231,-145,1202,-2625,-6694,26497,-11865,-1090,-145,1227,10249,-3825,3590,11,-334,-144,-87,-12886,10927,-2069,14924,791,-144],"returnScale":1000000,"returns":[0,-2241,1356,277,-23,1117,-2665,745,-5367,-6759,2546,-23,-967,-330,-3997,-1879,5652,-1513,-27,1053,5070,635,5236,1582,874,-34,-2018,3991,-2,2721,11633,1966,-35,-1844,-1458,1970,2122,350,3320,-37,2651,-1789,36,-2520,-110,501,-38,891,1207,415,-336,6273,3146,-36,177,140,2324,-69,220,-108,-36,-3259,1650,92,-1365,8214,-1576,-40,-4819,-5989,-4771,313,-11496,-645,-354,-6871,2460,5137,14057,6107,-153,-45,2792,2321,357,-103,932,1895,-46,-802,-5145,-882,646,-2372,3100,-50,-11573,651,6344,10550,1060,-1485,-50,-762,3930,-3773,-3667,9863,4451,-52,2327,927,5670,4020,493,15206,-55,3943,-9477,-9735,1977,-5209,213,-56,5151,7756,132,655,-1230,-1276,-57,-1745,10030,-2667,3287,3187,-2018,-57,-175,-1147,976,727,1315,3350,-51,-58,2477,579,2299,919,3027,-52,2811,-4034,1805,2524,-4783,5087,-59,-637,-5699,8554,8570,-3985,1620,-57,8432,481,3194,-3240,5146,-4617,-64,-908,-8155,-8233,-6719,-390,4451,-60,6222,-6138,5766,795,-3352,-7728,-59,4405,4358,8014,6003,8311,-62,-62,-3265,303,13158,-1071,-15900,-4663,-60,4374,4242,3137,-2440,4998,-2237,-61,4514,-1546,-10698,-6873,-4249,-38,-38,1230,-3117,-869,-4532,6031,2436,-44,-2809,-665,-3429,5257,-5241,2002,-50,-1168,1578,5903,2860,-1239,-852,-51,-485,-6161,10897,-607,-6483,-51,-51,-138,-1112,-2827,-8745,-9832,3300,-50,-3899,-710,4594,196,-3393,372,-78,-4539,2474,351,3681,-5480,3083,-71,11673,2838,1239,-3635,-2218,514,-72,-15025,-3467,4801,3441,-1765,-771,-73,-8781,-2253,-1449,4277,10315,-4161,-74,8347,6371,409,8930,7754,-77,-76,-548,-3037,-6664,-5197,-12118,1944,-75,-8722,2595,7443,525,2594,-739,-74,522,465,3427,-481,-603,-2342,-76,8654,-12971,-11797,-2866,2092,-2553,-77,579,648,-7664,-12154,-26277,-3361,-73,-24341,375,10434,22578,6030,-76,-76,-3832,-18195,7841,5054,-12517,3932,-73,833,12969,-1558,-837,-2738,-3757,-76,-1707,6130,10134,2509,-14924,-3592,-73,2751,-7130,2535,-5952,4745,3216,-73,-11759,-977,12056,-1520,8266,-456,-75,15900,794,9260,3038,3448,-4200,-77,-200,-6546,-1441,7309,1687,3121,-77,-168,-906,-3079,12888,13928,-79,-79,-3214,9064,3620,-1711,5731,-4242,-80,4544,3459,845,1405,-1573,686,-82,-7577,3226,4526,-9684,-9846,-1655,-80,4353,7917,8830,4676,1105,153,-83,-3162,-1050,2869,5922,-3724,1265,-83,-3229,4560,-5187,-14440,3214,-10257,-81,-1512,-4336,-2627,-5103,-14967,-462,-1628,-3445,12363,7948,-651,-8298,415,-82,-398,2012,9369,400,-2297,703,-82,-2399,6697,-6579,-4105,1421,-83,-82,-17817,-690,-4600,-16910,-8094,-4904,-78,-211,5677,-4987,5453,-22133,-480,-73,-964,7783,-13578,6576,13380,3318,-76,-5395,8702,-3678,-3050,14207,-1281,-77,-1610,-11994,-182,1136,-18905,465,-73,-8288,-1133,-3602,-12620,8861,2769,-72,6858,8279,14606,-1889,-356,-484,-76,9133,-8278,-4883,10118,177,832,-77,-2194,20607,5502,2615,3352,-3551,-80,372,-5150,-706,-2382,17191,-10370,-79,1633,-4686,4122,7007,-9727,1510,-79,197,-697,410,-2642,726,-738,-84,586,4855,7391,-10193,-6494,-2142,-83,-1972,-7578,5996,-5774,3682,17,-82,789,5707,12197,6732,618,-1666,-85,3789,7801,1397,-4444,-5343,3846,-85,-2138,-447,-2119,-4897,-11062,-87,-88,4987,-8223,-15235,2232,3552,120,-86,165,10691,-4935,-5824,-2440,1996,-86,5391,-4754,-655,-2929,7527,-1322,-87,-2840,11399,8559,6047,-324,-47,-89,825,-2431,-1851,-181,-2655,1594,-88,4814,-4662,2492,-5420,-9217,1899,-91,-8979,-5732,5004,1049,1795,-87,-87,13397,-4400,894,11645,-39811,15284,-86,-15316,18539,10119,9222,3293,-1478,-89,-1644,-7633,-2188,5016,10775,-457,-90,7356,8548,-3067,8602,-6316,1387,-91,1894,354,5546,-1708,841,-85,-91,-2872,2512,2746,-4664,-1036,-798,-92,-886,-9339,351,2272,14127,-1178,-92,826,7750,-931,336,991,-573,-93,2075,-6150,-6401,3882,-5857,-330,-90,-3090,4306,-3569,-244,-528,-285,-90,877,6126,-3719,1091,7555,-2104,-91,-20,3648,1083,-7433,-13461,-2084,-90,4361,-6963,-2004,9077,-7283,1138,-89,1798,4549,3081,12319,-8773,894,-90,-10041,1007,6701,-5183,5532,2748,-90,-892,67,5074,-4265,-266,1989,-89,5503,-7061,210,1738,4125,1808,-92,-3529,4705,1026,4464,-1740,4872,-92,3088,-312,-2741,-3499,-1380,455,-92,-3758,-5473,-12556,-6851,-2830,-1495,-89,16922,6082,7465,-4066,5363,-381,-92,-4734,12525,41,7732,-6096,5386,-102,6078,1723,-863,1672,7842,-2921,-103,-5092,-970,-1124,-4188,-3293,-1033,-101,8326,-938,10312,5729,8403,10398,-103,1933,4882,-5352,1352,12652,-101,1719,3649,1861,-4757,-1350,-260,-97,-76,-148,-1595,1919,-5228,-4737,-94,1523,7545,9721,-1537,-766,-95,-95,-1709,-1090,638,-551,-7112,887,-95,-2806,3401,-3533,-2914,3590,1449,-94,-2579,51,6593,-2105,1079,901,-95,-6515,-854,-1962,-2747,335,3255,-95,-2443,1975,3652,4727,-934,2459,-97,6810,1740,2867,3782,-2243,97,-97,-406,8171,4904,1476,-5359,-1926,-97,-425,-608,11581,816,1820,-3048,-98,-2695,-1809,-1363,1574,1809,-3253,-97,584,-4522,6639,2574,-4792,-144,-96,707,-6236,-4019,2051,-378,-1081,-95,-454,1043,4532,8176,-1238,2423,-98,-3017,3115,-1551,-1730,342,1849,-98,-113,2100,-2819,-4993,-1749,-96,-97,3799,-5604,-4365,3548,-2267,2764,-97,12688,-2396,-2676,539,890,-2799,-100,1928,3704,120,3667,4372,-1849,-101,1169,2205,3472,237,1953,-1059,-103,3018,-4933,-18236,-3134,3024,-3533,-100,2840,-2833,1933,1387,-522,1469,-100,136,614,895,1654,5976,-101,-101,95,-5244,-1126,533,-2876,2698,-101,-3277,107,-1457,-1968,4679,-215,-100,7360,-7260,2735,2061,515,-255,-102,79,-7190,-1710,-18472,-1346,5,-100,4469,1255,1888,-7192,-384,-1938,-100,2561,1398,9461,-373,4853,-142,-102,-241,-2178,-1815,2502,-4585,-8858,-100,-5521,2625,-2929,3170,-4647,-2140,-99,-804,4645,-2767,-311,758,-465,-98,1332,4222,-4305,-5842,-1740,-1685,-98,7153,-1655,6520,-7804,-2653,-2187,-97,-1353,6787,-3495,-587,978,475,-97,-420,-1609,-9077,11580,6695,-4906,-98,-842,-1404,5113,403,-6907,-98,-98,10111,729,4682,-2382,5676,-4098,-100,778,2362,-3011,-3886,4177,-3296,-99,-2013,4362,4700,2972,2390,-1539,-100,4293,6686,810,2492,2045,1790,-101,-214,-1618,410,1590,-227,2194,-100,1099,1274,4175,-2825,-3353,508,-100,-2743,240,-792,5639,11025,7746,-103,-522,3832,4619,3186,2221,-748,-104,3046,1094,4629,-8486,-5924,-1366,-103,-2101,-3944,-11242,148,-903,-1417,-101,-72,9459,1279,-1132,-2302,-1589,-103,-2094,1297,-2519,7886,-4305,-1726,-103,533,-331,2070,388,4262,-103,-103,3946,1574,2647,-433,1934,2061,-2061,9180,-3566,-6336,2137,-3969,202,-104,-90,2695,-4387,-2514,-5950,-3209,-102,-102,5514,1248,7863,6282,972,-104,575,1737,2185,-1804,6230,-6636,-104,-403,-7693,7926,591,2995,-106,-105,5335,-1228,-3226,-7783,9282,-1438,-105,-5741,-5808,-2788,-9480,-21428,-1091,-101,-28563,3573,7122,-28381,11088,-867,-98,13678,-1341,5752,6936,-3739,1317,-96,-3220,-1374,-198,3209,10066,-1145,-97,8500,-8254,-7565,-7285,-2444,-6807,-95,6651,1075,-5794,5771,6889,5780,-96,864,-8668,-6024,3016,3541,1712,-96,-10811,3376,757,-15853,-12385,-1536,-93,10814,-4114,1940,8366,3297,-132,-93,-9779,7179,5766,12528,-11001,-91,-91,2373,12469,-6996,3981,4529,209,-94,1300,4786,578,-3625,-4010,2600,-89,1278,-1464,-3566,8101,-36,3693,-89,739,165,-114,1093,9596,787,-91,3367,1606,8599,4738,1406,-2259,-91,299,-4287,7598,6938,-3471,979,-91,3868,391,-5590,-190,-2130,-88,-87,-1483,-6398,9755,-7956,5932,1053,-88,3786,-2939,5047,-4916,-2010,3104,-89,298,-2281,-2123,6057,-3307,-93,-93,-4555,-1221,2950,-9031,7565,-4600,-89,-12680,85,59,3555,8089,-3081,-90,-2034,1887,-822,8618,1082,-864,-90,4614,1609,-5735,6029,4119,181,-91,-3441,1416,2787,1681,-589,-3674,-92,944,7413,2609,3852,-6266,3929,-93,-2866,562,-1844,-74,4182,4899,-94,2366,6503,-3219,611,-9544,6472,-94,-1512,2820,-7910,10201,-152,-1085,-94,4008,-986,-3503,-7406,5526,-559,-94,6153,-1257,4110,-4030,-6341,2013,-95,-44,-5250,-3075,-5146,-2403,978,-93,1477,5306,3396,3955,-988,-3156,-94,-3907,4683,806,10423,-1579,689,-94,-3265,-1171,-1681,7991,-1868,6183,-97,4586,-879,4573,-9300,-4102,-388,-96,-3835,3623,-20372,-18850,6833,-3654,-93,-2157,12653,-348,-6114,13219,2017,-110,-1907,-5645,-16818,19360,-11973,4095,-108,-1528,7533,12191,8928,-12408,-1427,-110,3479,2205,10516,-6215,-1213,4616,-109,-13013,8327,-6097,1525,2536,-2812,-110,-10834,-21822,5039,-2018,-6447,2658,-102,11754,-48,16317,205,-3158,1290,-102,11548,-14884,-8590,-10335,-9385,-1087,-99,-3614,3951,10315,6672,-17125,4428,-98,-14340,-3120,-9047,-12006,-7856,1644,-91,-16880,108,24917,-1743,5584,-4007,-104,6551,-460,-1706,-18392,27573,-2762,-92,-892,6758,610,119,-4984,-226,-92,-5813,9863,1757,4811,10076,-595,-94,234,-6518,2011,-1246,8258,-212,-107,-7392,-1174,16175,5850,4017,1132,-109,4212,11009,-1329,-10420,1448,-166,-107,1218,12995,4086,-7358,12177,445,-109,-104,-3369,6552,-3615,4635,1614,-109,2149,445,-1786,-3066,4004,1817,-109,-390,4249,-2822,-5375,-2210,3081,-107,12989,2155,6118,774,6445,-1109,-112,580,1444,-3305,8069,-19541,5978,-112,-1369,6650,2170,3763,10443,-794,-113,10967,1905,5449,-2368,3932,-1294,-116,2076,-4826,-27,-1618,9293,-4170,-116,927,1997,3976,5217,2959,256,-114,-395,5007,-3947,6683,8869,-115,-116,-281,-434,-11338,-2253,9745,3916,-114,-7863,-17940,1299,-10258,1892,-2045,-105,-16995,7075,12829,10982,-6137,1925,-105,-10100,4251,-1131,-9579,5048,-105,-105,1583,-7487,-9928,6491,-8630,-882,-103,-2289,11375,4174,589,10873,-585,-106,2480,3307,-2161,2262,229,-105,-106,-718,15306,4422,6070,-7221,-325,-110,-782,-10217,-778,1061,2184,-595,-109,7521,7274,9505,865,-5369,1438,-111,-2325,1935,3173,-3165,-4778,1701,-108,3660,-2263,-1415,1871,-4892,-487,-107,3872,10115,77,-5139,11903,-1839,-109,909,-4051,-13207,-6190,-6989,-110,-109,-20975,-1813,345,11144,-6202,-179,-105,-5340,10870,-17936,-468,10642,3383,-106,9064,-8488,8866,-3893,-16464,827,-105,7312,-552,3705,7044,3254,1358,-107,387,-445,11590,2821,-1861,966,-111,-3075,-2472,5524,6421,188,-4838,-111,-3339,3278,126,-95,-2288,1369,-116,219,-1505,500,1577,748,-8,-118,2366,-3230,-11044,1712,4372,-735,-117,-112,-6115,3624,3691,3322,-118,-117,-1455,2625,1012,129,-5203,-982,-116,1992,-998,2771,3104,2766,499,-119,1830,-1772,3038,-2536,1279,413,-118,1725,-763,2675,2619,1223,1160,-120,-763,266,2182,-1801,3694,-1442,-120,-589,-1149,-2643,-761,459,961,-119,3968,2484,1418,-255,-2990,627,-119,-5143,-5172,3120,-275,4635,-179,-114,-1414,-316,2673,2512,329,-1569,-114,5306,-439,-1307,3972,3639,640,-116,550,140,-429,2614,1479,-2647,-116,-6087,-344,-1716,8267,-1945,2049,-116,1651,-2371,6114,-417,629,-116,3191,-3927,1553,1967,3571,2478,-118,-330,-945,-1960,-301,-985,2698,-117,-13282,6117,2132,-937,-11116,-1006,-115,3364,8877,7382,2442,-3841,1133,-118,3181,1609,6858,-4410,2491,307,-119,822,-4532,4479,-8713,-7010,-538,-118,-27129,-18029,-1288,-30928,-12951,-282,-109,26900,-20734,24517,-19617,-18831,-5985,-108,-53654,21085,-23738,-70726,55923,6344,-103,-73044,34554,-19766,12524,-12574,4281,-98,-20132,62942,9344,33484,-38930,789,-102,25026,-4205,-23860,16865,-7351,4742,-103,36870,-1710,4872,6119,93,-3396,-101,317,18640,-18099,7122,17713,-104,-104,-4506,-23479,20408,-1281,7159,-1542,-104,10356,-4258,19206,-8288,-16061,-107,-107,-8097,8287,2844,12114,12753,-3020,-109,342,-8085,-14140,-3012,8903,-400,-107,26106,-5331,6297,-8259,-4663,4864,-109,6234,3393,5203,2199,-1728,-6254,-110,1657,14406,15379,-7273,15893,-114,-114,5603,-6888,-69,-48825,7267,1912,-110,1371,22136,749,2262,-229,513,-115,2670,9218,-28015,8819,-11916,-700,-111,7747,3333,6857,12127,-7419,3078,-114,15752,-13596,7888,-2586,3809,3190,-116,-2487,-196,6917,-5145,422,-462,-114,11059,925,176,-15381,-13073,-1862,-113,5424,-11394,8304,-12062,-300,-5044,-112,12861,1367,9286,-2407,-2696,642,-112,1252,2875,12794,-4343,-7973,1064,-113,2310,69,-1463,-831,4640,4007,-115,13327,-2797,9649,-3417,1290,-116,-117,-3895,-1255,10544,-17964,-8685,-1601,-114,6441,-17683,17668,-9347,-2286,-504,-113,3846,3363,-4500,-7448,-5077,-1947,-112,-15113,9435,-7088,1344,7604,123,-111,15679,-5154,2154,2151,-7823,819,-111,10087,-9640,6044,7452,5834,-1229,-114,12406,-3366,-3747,-10165,8533,-2380,0,-11171,118,-5052,-2832,3780,-113,-112,-18481,-1851,-34431,9916,-6387,53,-107,9854,12234,23695,9373,-7166,-409,-112,15177,-1368,12084,-6927,5962,-1144,-114,7509,-3979,-7105,266,1340,-1590,-115,1600,12931,1893,834,0,-1258,-116,-5097,6193,2846,-5952,1757,-384,-117,-3176,3278,-3288,1395,-3564,-1087,-116,-2581,7121,8463,2062,-7859,-1000,-117,-11844,7023,2548,918,-1186,-254,-117,12134,419,-3737,-1762,-1471,-120,-119,-5569,1471,6454,9068,7789,649,-122,-7801,810,4884,121,-5281,482,-121,-1273,8860,12669,-2213,-5308,-249,-121,-2386,5303,-18619,8204,-20021,-2341,-119,15402,11998,9296,12660,2745,549,-124,3280,-5067,-4893,1045,1701,1849,-123,3337,-3,-3059,167,-3991,-3075,-123,-6760,-828,5141,-16055,-11993,5718,-123,21552,101,-3993,-5766,9641,5394,-126,4405,13905,6675,6468,-7658,1614,-127,2584,4233,5194,-5599,-7427,976,-128,8708,-6155,-6258,4589,13972,837,-129,3961,1519,2266,8318,-2014,-1109,-131,9631,1982,3009,2039,5232,-982,-133,382,-639,-4085,4638,6485,-646,-133,-3109,-17486,4591,223,1283,-1408,-132,317,-3233,1914,1034,-10710,-131,-131,5787,-13681,17037,9497,4314,-168,-137,-8040,-20242,-11764,8760,17286,-887,-136,-140,-9188,-15998,14959,747,1357,-135,8229,-1561,-3225,-105,6087,4352,-136,-4457,3728,3284,1588,9003,4592,-137,242,-2671,-1986,2508,5645,3402,-138,2357,-618,-4666,862,-6857,-136,-137,12178,6165,-5820,3763,4857,-984,-138,-2242,5935,-3879,6395,6577,4324,-141,2,-8013,11342,-15540,15611,-1654,-140,6777,166,2983,-4300,-8582,-334,-140,-26114,13246,11318,3113,14666,257,-141,-293,-8926,1956,1268,-12590,-1073,-137,466,6788,-2007,9287,1349,2878,-139,835,5997,5232,4078,1645,-2087,-141,-1345,-8369,-9944,-6615,6971,1487,-138,9312,-1650,-3316,-6110,3821,162,-139,6583,-4143,159,249,-4593,-1859,-138,2980,-2421,-8028,-4257,-4809,304,-136,5307,125,-2928,-2297,-8704,-1074,-135,-21149,9927,10459,13307,-2510,-469,-135,569,-18977,5279,-8221,12865,-1178,-134,-10514,9782,276,19301,-958,-594,-136,-4914,-3935,3455,15815,6987,-369,-138,-2323,5925,-1025,-4331,-3202,438,-136,2235,6818,-5210,5288,1204,-3600,-137,3722,7828,741,3401,7191,2964,-137,-1588,-10339,-3009,-300,11157,609,-138,2175,2253,1017,1890,-11891,5395,-138,-1043,-1393,433,7227,-39903,-4637,-135,8454,-14415,-3579,10133,-8995,3149,-134,16426,19233,4042,-4373,-5081,2680,-138,-8379,-6909,10075,3699,-17713,417,-135,-12909,22858,5441,5181,-860,-799,-137,9910,2121,-3364,583,-5500,1164,-138,16578,3580,-7547,-3492,-158,-138,-138,-3075,13120,996,-11000,-6782,1083,-137,327,-12339,-4731,-5325,-19580,-707,-134,-16649,1879,10544,5403,16833,1418,-133,12117,9862,-5124,-29249,5696,-12266,-132,233,4403,16958,-12774,-11202,1396,-131,-13308,22230,-2845,-16413,-7491,895,-129,-5847,-6424,-11168,-12358,42303,-3856,-130,-7629,-22187,13815,-13723,-19069,9588,-126,-22577,85,36703,-18112,-12395,5662,-125,-1758,12751,22226,9962,6406,3173,-131,1597,9246,-9016,10857,4293,-1636,-132,3698,17385,-14500,-17819,6322,3503,-130,7974,-7996,-9930,3567,5274,3628,-130,-14585,-4625,10218,-4350,-3627,3092,-126,454,6581,-637,-12926,-25004,-122,-123,-3111,-18150,14703,27353,-14471,-3122,-122,94,6928,14747,-23120,-6911,-233,-122,-25744,5432,-660,-8053,27626,1182,-122,1360,12350,-30157,-8559,5501,-2988,-119,17122,-12314,6202,11439,10981,-1279,-122,1515,-7223,210,9916,-7056,-2365,-122,4063,9012,-2821,-22729,-25885,-119,-118,-27819,9184,11846,-24258,-869,-4245,-114,2902,13316,-8827,-1218,23044,-1437,-117,-1357,-11213,-2343,-10962,11814,-2499,-115,216,-10338,12055,21611,1580,795,-121,-10391,-3195,-2936,-10527,20753,-3258,-121,-2187,17413,-3438,6560,-4483,984,-122,1503,-9699,26223,5155,15499,-4793,-125,-2240,-7203,10203,116,534,-3215,-126,1235,219,11481,-182,5764,3185,-128,254,9070,-2341,530,-10857,7770,-128,-15366,4713,6199,9356,-27644,-2661,-125,-4597,-8074,-11261,-1378,150,315,-124,-3118,2176,7821,6142,14815,-9794,-125,10849,-34439,-708,2481,-7373,1911,-123,4732,-11176,-8742,896,-17566,7630,-121,-8418,4615,13146,-9502,-18015,-2217,-119,17057,23899,-9591,-7291,-12610,3583,-120,-7114,-1402,522,17007,-13349,878,-120,18531,5043,-6957,1289,10588,4983,-122,7661,10923,-13044,-14898,11248,5124,-122,-3518,1213,-16694,-4543,22817,-6917,-122,5679,-3687,-14333,31445,14364,-20246,-122,-1903,4850,-11288,-1011,8081,-2763,-122,-4750,17173,1915,-2167,-5209,1948,-122,-9468,-4918,24708,-665,-6171,-4798,-120,-10687,-12395,890,2143,-1758,-1217,-119,5284,8139,-2320,-26793,-6066,-799,-117,-3309,2296,13242,-11802,3403,-76,-118,-118,-1258,-8203,9881,-3366,-1089,-119,3474,-584,12574,-7314,13617,-120,-120,560,-1210,6722,5659,3904,-1477,-122,833,-3862,-12134,-4262,12012,373,-121,7993,-2427,469,6336,351,1614,-123,-8367,4504,10575,7141,-9383,3079,-124,-7036,20322,-2531,-5674,-2428,5384,-125,9991,346,-2693,-4934,-2733,4832,-126,70,-14465,-2774,4966,-10819,2861,-123,4459,-3007,-7037,4836,19035,-556,-125,719,-14194,-1230,-3630,-11158,-1663,-123,-8828,8358,-17227,28070,-13993,-1836,-121,7777,8792,-13547,2671,-8752,9761,-123,4486,-2454,9518,7680,8550,765,-124,6171,-2257,-4523,1598,1905,1226,-126,-1121,5011,-5924,12886,-4757,-125,-127,-346,3086,1843,-2750,1636,-127,-127,1331,-17771,-3848,16091,6631,4639,-127,-1762,-14817,-2049,-12974,16017,4183,-125,3153,-6897,7196,-201,-236,2561,-128,3316,-3740,9692,11758,1084,263,-128,-2256,-9857,-6428,3771,18374,-1363,-128,-348,-2021,-13532,17130,17043,-135,-134,-4742,3354,-7738,3171,-2450,-3409,-131,7971,7660,581,10169,-3391,-12569,-132,-3557,-2268,-6996,6305,-13605,9670,-132,-6177,5874,-2164,3945,13508,4220,-132,-572,-4019,-3738,-18240,-3469,824,-130,245,3151,12145,8887,-14815,-3381,-130,-962,6855,2043,-2271,3193,6060,-131,2220,7928,-894,208,4008,9668,-134,2825,-10416,-14779,-4513,3703,-1251,-132,9085,-9292,-3059,2070,-9411,1147,-131,5998,-10685,-5916,-5248,-1147,2590,-130,6699,-6207,13478,-7978,2580,2615,-130,8473,15197,2119,-10165,3372,2147,-133,-877,569,-2508,-4395,6589,-133,-132,8157,-5195,2451,11809,-9824,6371,-135,-2960,-3283,-13010,-19676,3303,-1275,-131,929,-15082,2807,11373,-875,-5144,-131,-1309,-11495,9953,-4539,10328,-3382,-131,5292,13662,-1702,-5451,-9295,8412,-132,11065,79,-17437,-5508,-15592,-2971,-129,-1063,8011,-17581,-11437,-1639,-276,-125,15853,-1966,10311,28847,-5823,-3652,-129,2371,-1407,5139,-1272,5372,525,-131,967,19681,-2714,-10165,6189,-2042,-131,7331,-9185,3217,4930,1760,-1454,-132,-3643,-3017,-1925,2311,12017,5054,-135,-7326,3051,1415,10946,8473,-135,-134,-2034,4453,6179,6997,-10705,-2463,-134,5863,10535,-14015,11432,-5448,-3481,-137,-137,4700,-658,-4540,-5717,5760,-136,-136,-4748,846,2134,-2775,2714,-135,12771,-2450,3348,-2742,285,4946,-137,-1035,-9184,-2380,12646,11205,-137,-139,1473,2152,10284,4446,9090,2136,-141,8823,6958,-22482,9289,21102,-6747,-143,-3651,17893,8208,-2553,5798,-1633,-142,1406,-17907,9215,15459,-7119,-2619,-142,1138,-7420,-1579,24533,-1869,994,-145,-7781,631,-4170,11416,6695,1051,-145,-2792,-16599,5771,15864,-7670,-3588,-142,-2887,15491,3625,-3168,-8725,2748,-143,9015,5179,13315,3783,-8592,8087,-146,-2163,-3615,4956,3224,811,1861,-148,-401,-4531,3430,-17122,3836,1142,-149,2403,460,-10344,9182,-1914,7862,-150,-13188,-7805,-2676,-2310,-16479,2449,-143,13223,21169,-8116,-11572,15568,460,-148,-326,-17317,-1213,8278,17119,-148,-148,14838,4002,-6176,6567,6101,-5006,-149,-566,2760,14326,-9432,-2773,1992,-149,-167,1593,-5831,-1770,4253,-149,-149,418,3602,-13466,-7036,12051,-3613,-146,2128,1965,14333,5654,-2243,-3482,-149,-707,12479,13087,-11031,-4084,10076,-151,7798,1380,-1576,671,-1475,-150,-150,-1865,8897,1103,4890,-10633,-1123,-151,7607,1545,7419,-1094,5345,-2612,-151,-2587,-5552,17907,-17611,2682,-3557,-151,-1743,882,-22868,-16468,-6481,3832,-148,13307,701,-29506,-10701,12898,-1025,-147,-1552,41,18613,-17080,-28605,-144,-143,-38227,-4204,948,27371,9782,1066,-143,-1538,18527,4987,12526,3878,1597,-145,12014,-7043,-795,-11887,9538,1247,-145,-3142,-3775,-7272,4484,16763,-212,-145,-144,-24385,-5479,-5193,-26699,-663,-140,15141,-2557,21202,10171,8391,-6173,-144,1191,-2600,-6632,26249,-11754,-1079,-144,1215,10154,-3790,3557,11,-331,-143,-86,-12766,10825,-2049,14784,784,-143]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("VEGA CASH", {"daily":{"start":19082,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000000,105,41,41,41,42,41,45,41,41,41,41,41,42,41,41,41,41,41,41,41,46,41,41,41,41,41,41,41,41,41,41,41,41,42,41,41,41,41,42,41,41,41,41,41,41,41,42,41,66,44,43,44,47,48,52,47,59,46,50,47,58,46,47,47,47,48,52,56,54,48,49,48,48,58,47,52,55,63,47,46,47,46,48,47,53,46,46,47,45,55,53,45,54,53,45,49,45,45,48,45,44,51,45,49,45,45,46,45,51,45,44,46,44,45,44,46,47,46,46,47,46,46,47,46,46,47,46,47,46,47,46,46,47,46,47,46,50,46,46,46,47,46,46,47,46,46,90,-2,46,46,46,46,45,46,45,41,41,46,45,46,46,48,46,46,45,47,47,46,47,47,46,53,55,46,46,46,46,91,46,47,51,46,46,47,46,46,93,51,48,47,48,48,48,47,53,48,48,48,48,48,49,50,49,49,50,49,49,50,49,53,52,50,49,54,50,50,50,50,50,49,50,49,49,49,50,49,49,49,42,38,56,55,57,55,58,55,64,56,56,56,57,56,62,59,52,57,56,58,56,31,57,76,56,43,65,37,44,73,27,59,56,36,52,17,0,11,56,56,33,44,59,57,55,57,56,57,57,55,60,58,58,70,59,79,105,115,122,54,55,59,55,55,56,55,56,58,52,53,54,54,53,53,54,54,64,50,51,52,51,52,37,58,59,58,60,60,59,56,63,63,62,57,59,60,58,60,60,57,59,59,58,58,59,57,60,58,58,58,58,38,43,55,52,58,57,67,71,69,53,80,60,60,55,72,66,17,65,65,66,68,65,67,71,70,67,66,62,68,70,71,66,71,58,75,60,-6,-68,74,75,74,72,153,-117,-81,69,70,69,92,7,-22,46,68,68,68,69,108,87,79,33,65,65,27,87,16,33,62,68,69,61,77,43,84,62,62,63,64,65,65,75,65,65,67,67,82,60,69,65,65,68,66,64,57,65,67,63,63,61,66,60,74,68,69,68,74,138,217,121,149,70,73,151,70,27,-18,-132,71,72,-12,69,68,73,74,72,71,67,72,72,79,66,71,72,71,74,72,71,73,72,72,75,-36,102,76,75,76,79,53,102,77,79,76,75,77,76,68,63,78,87,76,78,76,75,76,64,90,78,78,69,69,89,66,73,71,71,80,79,54,88,81,76,82,128,177,141,85,74,74,83,89,90,47,42,52,74,77,46,42,62,68,85,73,97,55,52,76,74,65,72,83,83,81,80,80,82,78,79,85,75,83,81,79,78,89,82,85,79,79,71,77,76,86,84,80,76,80,76,84,103,-7,71,91,67,77,84,81,73,75,68,83,78,82,80,80,69,91,78,78,84,79,84,80,80,79,78,85,78,79,74,99,73,79,87,85,77,82,77,77,78,79,81,55,97,87,87,87,87,84,84,84,75,103,89,87,86,84,80,81,70,66,66,87,89,97,91,81,80,80,81,89,117,178,188,81,105,87,176,170,126,82,82,100,99,82,83,83,81,81,86,83,87,81,85,83,83,85,84,75,81,85,77,77,92,83,83,84,92,80,79,94,84,84,90,85,80,79,95,85,85,87,81,84,78,94,84,66,-17,-4,83,79,91,15,70,-54,0,47,77,74,69,80,80,92,67,77,90,82,86,91,104,46,77,88,84,83,82,76,84,77,92,77,79,87,83,75,78,89,82,77,87,90,78,77,95,84,78,86,84,76,79,90,89,78,87,88,77,78,77,101,78,88,85,78,77,84,85,86,85,84,74,78,87,83,89,96,68,71,72,82,98,111,94,96,88,74,90,70,72,78,84,69,72,86,54,70,74,64,74,74,81,68,44,65,73,75,65,86,74,63,73,95,76,76,89,85,69,78,73,75,75,82,69,57,49,54,91,80,85,84,72,94,80,84,81,90,87,78,78,84,94,82,93,71,75,83,114,83,83,99,87,57,104,91,85,85,94,89,89,89,94,85,85,95,88,78,75,110,85,85,99,89,78,92,74,78,87,93,122,96,87,97,81,84,85,99,88,84,90,86,87,99,93,94,95,87,90,87,103,93,84,91,92,89,87,99,93,94,95,87,77,89],"returnScale":1000000,"returns":[0,105,41,41,41,42,41,45,41,41,41,41,41,42,41,41,41,41,41,41,41,46,41,41,41,41,41,41,41,41,41,41,41,41,42,41,41,41,41,42,41,41,41,41,41,41,41,42,41,66,44,43,44,47,48,52,47,59,46,50,47,58,46,47,47,47,48,52,56,54,48,49,48,48,58,47,52,55,63,47,46,47,46,48,47,53,46,46,47,45,55,53,45,54,53,45,49,45,45,48,45,44,51,45,49,45,45,46,45,51,45,44,46,44,45,44,46,47,46,46,47,46,46,47,46,46,47,46,47,46,47,46,46,47,46,47,46,50,46,46,46,47,46,46,47,46,46,90,-2,46,46,46,46,45,46,45,41,41,46,45,46,46,48,46,46,45,47,47,46,47,47,46,53,55,46,46,46,46,91,46,47,51,46,46,47,46,46,93,51,48,47,48,48,48,47,53,48,48,48,48,48,49,50,49,49,50,49,49,50,49,53,52,50,49,54,50,50,50,50,50,49,50,49,49,49,50,49,49,49,42,38,56,55,57,55,58,55,64,56,56,56,57,56,62,59,52,57,56,58,56,31,57,76,56,43,65,37,44,73,27,59,56,36,52,17,0,11,56,56,33,44,59,57,55,57,56,57,57,55,60,58,58,70,59,79,105,115,122,54,55,59,55,55,56,55,56,58,52,53,54,54,53,53,54,54,64,50,51,52,51,52,37,58,59,58,60,60,59,56,63,63,62,57,59,60,58,60,60,57,59,59,58,58,59,57,60,58,58,58,58,38,43,55,52,58,57,67,71,69,53,80,60,60,55,72,66,17,65,65,66,68,65,67,71,70,67,66,62,68,70,71,66,71,58,75,60,-6,-68,74,75,74,72,153,-117,-81,69,70,69,92,7,-22,46,68,68,68,69,108,87,79,33,65,65,27,87,16,33,62,68,69,61,77,43,84,62,62,63,64,65,65,75,65,65,67,67,82,60,69,65,65,68,66,64,57,65,67,63,63,61,66,60,74,68,69,68,74,138,217,121,149,70,73,151,70,27,-18,-132,71,72,-12,69,68,73,74,72,71,67,72,72,79,66,71,72,71,74,72,71,73,72,72,75,-36,102,76,75,76,79,53,102,77,79,76,75,77,76,68,63,78,87,76,78,76,75,76,64,90,78,78,69,69,89,66,73,71,71,80,79,54,88,81,76,82,128,177,141,85,74,74,83,89,90,47,42,52,74,77,46,42,62,68,85,73,97,55,52,76,74,65,72,83,83,81,80,80,82,78,79,85,75,83,81,79,78,89,82,85,79,79,71,77,76,86,84,80,76,80,76,84,103,-7,71,91,67,77,84,81,73,75,68,83,78,82,80,80,69,91,78,78,84,79,84,80,80,79,78,85,78,79,74,99,73,79,87,85,77,82,77,77,78,79,81,55,97,87,87,87,87,84,84,84,75,103,89,87,86,84,80,81,70,66,66,87,89,97,91,81,80,80,81,89,117,178,188,81,105,87,176,170,126,82,82,100,99,82,83,83,81,81,86,83,87,81,85,83,83,85,84,75,81,85,77,77,92,83,83,84,92,80,79,94,84,84,90,85,80,79,95,85,85,87,81,84,78,94,84,66,-17,-4,83,79,91,15,70,-54,0,47,77,74,69,80,80,92,67,77,90,82,86,91,104,46,77,88,84,83,82,76,84,77,92,77,79,87,83,75,78,89,82,77,87,90,78,77,95,84,78,86,84,76,79,90,89,78,87,88,77,78,77,101,78,88,85,78,77,84,85,86,85,84,74,78,87,83,89,96,68,71,72,82,98,111,94,96,88,74,90,70,72,78,84,69,72,86,54,70,74,64,74,74,81,68,44,65,73,75,65,86,74,63,73,95,76,76,89,85,69,78,73,75,75,82,69,57,49,54,91,80,85,84,72,94,80,84,81,90,87,78,78,84,94,82,93,71,75,83,114,83,83,99,87,57,104,91,85,85,94,89,89,89,94,85,85,95,88,78,75,110,85,85,99,89,78,92,74,78,87,93,122,96,87,97,81,84,85,99,88,84,90,86,87,99,93,94,95,87,90,87,103,93,84,91,92,89,87,99,93,94,95,87,77,89]}});
\ No newline at end of file
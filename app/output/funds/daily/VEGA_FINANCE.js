@@ -0,0 +1 @@
+registerFundSeries("VEGA FINANCE", {"daily":{"start":19082,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000000,-93,-93,-93,-92,-93,6551,-8104,8341,2073,-80,-1585,-11225,3084,-36,-2527,1553,-93,6014,9083,9452,-2078,-16757,-93,-94,-10120,-13375,-1445,10760,-5141,-1920,-91,-4658,17934,6668,-20705,-9749,-652,-90,-18976,884,7218,15136,3206,-91,-10361,14854,-12586,-5640,1477,-1762,-89,25479,-5963,6091,11891,6482,-592,-94,3600,-7771,-3900,2534,-4709,-1499,-92,5523,818,-9408,-17082,-27176,-88,-88,-18239,6690,13811,-21406,6375,-3303,-87,6668,9813,-5778,-19743,32139,-749,-89,-3802,-7887,-7365,-12317,9666,-2591,-87,3131,-16686,3745,21060,3728,630,-88,-8932,3366,-8928,-16353,26884,-2758,-87,7675,18694,-5263,8356,-6449,1523,-90,7782,-19160,11335,2913,14043,-3475,-91,-3675,-7984,11459,2622,8792,-2424,-106,1931,745,12991,10866,6916,2336,-95,-2074,7944,-6145,-1519,-18216,5527,-94,-17977,1083,2909,7990,-22766,-1911,-91,-1922,2928,-6597,-6137,12194,-52,-91,-8790,3609,2250,18858,14339,-5937,-93,15603,-21182,-3033,15712,-9196,1187,-93,2919,-12333,-11459,-5315,-26348,5699,-89,-14395,-6654,696,-9921,-7305,-1855,-84,12786,34126,-17475,-13229,-7883,2783,-86,-4756,-11304,-3373,31492,-677,517,-87,18767,14652,-10154,1096,11778,3917,-90,13602,13422,-987,0,6447,4352,-94,-2041,9516,-7351,-781,24846,-5716,-96,7568,-1859,-9446,27125,15001,-17333,-97,-3314,3069,-10636,-2136,12152,-2730,-97,-1085,11770,1344,769,-146,1429,-98,-13467,2237,14899,-6452,-7872,-3911,-98,-14430,-13407,-2167,754,6025,-711,-95,4880,10268,-10651,-28998,-641,-827,-92,2679,11216,16256,-8876,3077,-277,-95,-95,-107,-3725,7218,-4906,-947,-94,6747,13562,28424,-10678,14243,-100,-100,3345,-2994,3885,9717,4761,-905,-102,2915,-6811,-9020,-12114,14599,-160,-100,9366,-491,2193,9808,5322,1072,-103,-125,-289,6603,-7627,-326,2146,-102,-8678,13570,10306,1490,-6717,3731,-104,3361,2642,-5869,7190,-3200,2958,-105,-1308,-10369,-3741,5493,-3107,1675,-104,7191,5202,-8894,-12683,18617,-68,-105,2135,-23054,-3810,-26064,-30261,-313,-97,-56068,18687,-54777,21655,-29325,-1103,-87,6563,34703,-21746,-19762,-23708,6128,-86,18216,-814,13648,3877,2989,500,-89,-175,-7521,-4471,10379,1217,361,-90,2916,9953,-1529,1319,16652,-92,-92,-810,8372,7020,-7570,-6809,-92,-92,2217,-21948,-1042,11497,1432,2738,-92,-2302,-20274,-9520,-24058,25617,2211,-89,2500,-2344,0,-229,926,1145,-89,9641,-4977,17105,7473,1255,114,-92,4941,5924,-14900,551,8951,-713,-93,-1325,-5099,-19505,11836,24253,-93,-93,-6595,10899,6342,-542,-3747,-1110,-93,-1496,7810,-1680,-1620,-3336,-5653,-93,652,-6499,-2332,-11594,-9625,5130,-91,2012,7055,-189,15195,5265,1622,-94,10897,-4350,-7757,-19155,8182,359,-93,1670,5306,11200,5027,-12489,-1593,-94,7603,17399,5821,9966,-1704,2945,-97,8448,-1436,5948,-6061,2705,4978,-99,-783,-9425,-13765,6438,7614,-616,-98,6638,-18446,-1315,9822,227,496,-97,-1787,-12769,-4476,-2933,-3595,1050,-95,-107,-8483,5432,8184,-4726,1199,-96,10989,11231,-1209,-5363,5300,1230,-98,-155,-6237,-6402,-6842,4533,-96,-97,8504,13332,6460,16399,-3723,3478,-102,-10100,2370,-1147,-16375,-9972,-907,-96,-1333,-5031,-1896,12199,-1395,-2485,-97,-14906,-14133,2223,2990,11265,-1536,-96,-6681,17100,-177,-5920,-8568,3914,-95,9220,4497,-18903,-8956,-20795,-1195,-92,-5375,-4115,4219,6267,-11689,-416,-91,9874,2728,3994,23331,7749,-1582,-95,-2716,-4763,-1241,-1173,775,63,-94,3582,20082,5422,-6551,14057,-840,-98,1696,-9785,-942,3244,4005,-591,-98,-3852,633,11732,10470,12901,3031,-101,2449,-3556,7300,5724,12790,-103,-103,1275,2636,37022,-10015,-1193,-106,-5582,9129,-6098,2974,1485,-1416,-105,-106,3624,2661,-4175,-1037,3442,-107,-106,8621,-12524,11540,6224,1305,-108,3012,-10563,-3903,-15389,-4740,2570,-105,-862,-8236,-2659,962,8091,-104,-105,10213,-637,10492,299,5201,1367,-107,-2043,17250,-9919,-14629,14457,-2846,-107,-9407,3312,-8225,-7553,-249,-1086,-106,11442,-11872,5700,18621,278,-1284,-107,953,2765,-845,8563,2028,774,-109,-1831,5202,3313,6963,-31,-20,-110,7874,2903,1949,5106,1965,-1561,-112,1902,12664,3918,-8217,4778,1076,-113,2980,3156,7683,18467,-8005,3685,-115,-1511,3088,8685,5746,971,1148,-118,-3469,-1478,6393,-923,-6431,994,-117,6408,-7376,-8760,-15003,-2448,3820,-114,2523,-15447,6670,10057,7275,1184,-116,13505,12448,-6027,3642,1797,227,-118,-5815,-7604,796,3759,4412,-117,-118,9067,12289,304,1452,7481,-2153,-121,-457,8104,2104,-5070,4118,629,-121,-4584,2829,-7673,-4517,3510,-120,-121,786,-4501,-11549,6845,10931,-1843,-121,-3241,-10659,602,3518,3403,-1579,-119,-9100,-14168,6495,-14174,-9785,5302,-117,9044,5049,-926,4693,-9984,-117,-117,14421,-11781,-3260,284,2725,-798,-118,15510,-375,9099,4069,-8359,-1100,-119,-1644,240,6619,2883,-3934,-1080,-119,4589,4549,2975,-7153,-7734,1110,-119,8258,4420,-12352,803,7304,-960,-119,-4547,9333,-2855,-27485,-43679,-113,-113,-21690,-4606,15182,6575,4051,-11,-113,-223,5904,13121,11336,6990,994,-116,5866,-9244,-1647,1514,10457,787,-117,-2894,16,2108,4142,11570,-672,-119,-456,-8015,-5046,1214,-21380,-88,-115,13015,-15936,4112,3946,7316,-2407,-116,6282,5011,-3619,16798,-2999,-747,-118,-7650,2156,-9936,13041,970,206,-118,-5920,-12235,5038,-5376,21014,565,-119],"returnScale":1000000,"returns":[0,-93,-93,-93,-92,-93,6551,-8104,8341,2073,-80,-1585,-11225,3084,-36,-2527,1553,-93,6014,9083,9452,-2078,-16757,-93,-94,-10120,-13375,-1445,10760,-5141,-1920,-91,-4658,17934,6668,-20705,-9749,-652,-90,-18976,884,7218,15136,3206,-91,-10361,14854,-12586,-5640,1477,-1762,-89,25479,-5963,6091,11891,6482,-592,-94,3600,-7771,-3900,2534,-4709,-1499,-92,5523,818,-9408,-17082,-27176,-88,-88,-18239,6690,13811,-21406,6375,-3303,-87,6668,9813,-5778,-19743,32139,-749,-89,-3802,-7887,-7365,-12317,9666,-2591,-87,3131,-16686,3745,21060,3728,630,-88,-8932,3366,-8928,-16353,26884,-2758,-87,7675,18694,-5263,8356,-6449,1523,-90,7782,-19160,11335,2913,14043,-3475,-91,-3675,-7984,11459,2622,8792,-2424,-106,1931,745,12991,10866,6916,2336,-95,-2074,7944,-6145,-1519,-18216,5527,-94,-17977,1083,2909,7990,-22766,-1911,-91,-1922,2928,-6597,-6137,12194,-52,-91,-8790,3609,2250,18858,14339,-5937,-93,15603,-21182,-3033,15712,-9196,1187,-93,2919,-12333,-11459,-5315,-26348,5699,-89,-14395,-6654,696,-9921,-7305,-1855,-84,12786,34126,-17475,-13229,-7883,2783,-86,-4756,-11304,-3373,31492,-677,517,-87,18767,14652,-10154,1096,11778,3917,-90,13602,13422,-987,0,6447,4352,-94,-2041,9516,-7351,-781,24846,-5716,-96,7568,-1859,-9446,27125,15001,-17333,-97,-3314,3069,-10636,-2136,12152,-2730,-97,-1085,11770,1344,769,-146,1429,-98,-13467,2237,14899,-6452,-7872,-3911,-98,-14430,-13407,-2167,754,6025,-711,-95,4880,10268,-10651,-28998,-641,-827,-92,2679,11216,16256,-8876,3077,-277,-95,-95,-107,-3725,7218,-4906,-947,-94,6747,13562,28424,-10678,14243,-100,-100,3345,-2994,3885,9717,4761,-905,-102,2915,-6811,-9020,-12114,14599,-160,-100,9366,-491,2193,9808,5322,1072,-103,-125,-289,6603,-7627,-326,2146,-102,-8678,13570,10306,1490,-6717,3731,-104,3361,2642,-5869,7190,-3200,2958,-105,-1308,-10369,-3741,5493,-3107,1675,-104,7191,5202,-8894,-12683,18617,-68,-105,2135,-23054,-3810,-26064,-30261,-313,-97,-56068,18687,-54777,21655,-29325,-1103,-87,6563,34703,-21746,-19762,-23708,6128,-86,18216,-814,13648,3877,2989,500,-89,-175,-7521,-4471,10379,1217,361,-90,2916,9953,-1529,1319,16652,-92,-92,-810,8372,7020,-7570,-6809,-92,-92,2217,-21948,-1042,11497,1432,2738,-92,-2302,-20274,-9520,-24058,25617,2211,-89,2500,-2344,0,-229,926,1145,-89,9641,-4977,17105,7473,1255,114,-92,4941,5924,-14900,551,8951,-713,-93,-1325,-5099,-19505,11836,24253,-93,-93,-6595,10899,6342,-542,-3747,-1110,-93,-1496,7810,-1680,-1620,-3336,-5653,-93,652,-6499,-2332,-11594,-9625,5130,-91,2012,7055,-189,15195,5265,1622,-94,10897,-4350,-7757,-19155,8182,359,-93,1670,5306,11200,5027,-12489,-1593,-94,7603,17399,5821,9966,-1704,2945,-97,8448,-1436,5948,-6061,2705,4978,-99,-783,-9425,-13765,6438,7614,-616,-98,6638,-18446,-1315,9822,227,496,-97,-1787,-12769,-4476,-2933,-3595,1050,-95,-107,-8483,5432,8184,-4726,1199,-96,10989,11231,-1209,-5363,5300,1230,-98,-155,-6237,-6402,-6842,4533,-96,-97,8504,13332,6460,16399,-3723,3478,-102,-10100,2370,-1147,-16375,-9972,-907,-96,-1333,-5031,-1896,12199,-1395,-2485,-97,-14906,-14133,2223,2990,11265,-1536,-96,-6681,17100,-177,-5920,-8568,3914,-95,9220,4497,-18903,-8956,-20795,-1195,-92,-5375,-4115,4219,6267,-11689,-416,-91,9874,2728,3994,23331,7749,-1582,-95,-2716,-4763,-1241,-1173,775,63,-94,3582,20082,5422,-6551,14057,-840,-98,1696,-9785,-942,3244,4005,-591,-98,-3852,633,11732,10470,12901,3031,-101,2449,-3556,7300,5724,12790,-103,-103,1275,2636,37022,-10015,-1193,-106,-5582,9129,-6098,2974,1485,-1416,-105,-106,3624,2661,-4175,-1037,3442,-107,-106,8621,-12524,11540,6224,1305,-108,3012,-10563,-3903,-15389,-4740,2570,-105,-862,-8236,-2659,962,8091,-104,-105,10213,-637,10492,299,5201,1367,-107,-2043,17250,-9919,-14629,14457,-2846,-107,-9407,3312,-8225,-7553,-249,-1086,-106,11442,-11872,5700,18621,278,-1284,-107,953,2765,-845,8563,2028,774,-109,-1831,5202,3313,6963,-31,-20,-110,7874,2903,1949,5106,1965,-1561,-112,1902,12664,3918,-8217,4778,1076,-113,2980,3156,7683,18467,-8005,3685,-115,-1511,3088,8685,5746,971,1148,-118,-3469,-1478,6393,-923,-6431,994,-117,6408,-7376,-8760,-15003,-2448,3820,-114,2523,-15447,6670,10057,7275,1184,-116,13505,12448,-6027,3642,1797,227,-118,-5815,-7604,796,3759,4412,-117,-118,9067,12289,304,1452,7481,-2153,-121,-457,8104,2104,-5070,4118,629,-121,-4584,2829,-7673,-4517,3510,-120,-121,786,-4501,-11549,6845,10931,-1843,-121,-3241,-10659,602,3518,3403,-1579,-119,-9100,-14168,6495,-14174,-9785,5302,-117,9044,5049,-926,4693,-9984,-117,-117,14421,-11781,-3260,284,2725,-798,-118,15510,-375,9099,4069,-8359,-1100,-119,-1644,240,6619,2883,-3934,-1080,-119,4589,4549,2975,-7153,-7734,1110,-119,8258,4420,-12352,803,7304,-960,-119,-4547,9333,-2855,-27485,-43679,-113,-113,-21690,-4606,15182,6575,4051,-11,-113,-223,5904,13121,11336,6990,994,-116,5866,-9244,-1647,1514,10457,787,-117,-2894,16,2108,4142,11570,-672,-119,-456,-8015,-5046,1214,-21380,-88,-115,13015,-15936,4112,3946,7316,-2407,-116,6282,5011,-3619,16798,-2999,-747,-118,-7650,2156,-9936,13041,970,206,-118,-5920,-12235,5038,-5376,21014,565,-119]}});
\ No newline at end of file
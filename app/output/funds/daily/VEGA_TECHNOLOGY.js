@@ -0,0 +1 @@
+registerFundSeries("VEGA TECHNOLOGY", {"daily":{"start":19082,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000000,-93,-93,-93,-92,-93,-6809,-4309,-14124,2884,-76,-26027,-13457,25503,-24341,-3902,4159,-87,5279,17437,-11476,-27220,-25168,-83,-84,9414,-33043,8047,49043,-29245,-4241,-83,18361,3441,27641,-47722,-12954,114,-40624,14055,37688,-66568,51151,1709,-82,-19025,20953,-42724,-1709,-6534,-2971,-77,12878,-26919,9574,20129,24055,-1512,-80,872,-2248,424,23656,-20802,-2205,-81,2922,6029,-1029,-21904,-25370,-77,-77,-32857,17488,20443,-36604,12032,-5285,-75,809,15570,-4227,12152,32572,-2094,-79,-6124,-28263,-7143,-13062,4168,-2212,-75,-367,14354,10106,31900,-939,918,-80,-24166,-1060,3599,-3150,20021,-3604,-79,-2538,19314,14202,21904,-21321,512,-83,-4560,-23585,39725,3980,10042,-4976,-84,6399,5987,20755,11657,-6942,-3545,-88,-7133,-15289,25013,-4506,8352,3357,-88,1954,2123,-9040,2070,-20340,7660,-87,-20674,1115,9312,16058,-35290,-2300,-84,-9315,-7737,-7936,-2613,-7034,567,-81,-700,-2755,10998,8550,20388,-10570,-84,8483,-45859,5289,2693,-7004,2202,-80,4864,-10188,-10198,-9933,-9692,7482,-77,-7356,9367,11482,-22696,-17434,-3060,-75,16469,30694,-9576,-4229,-35912,4237,-75,-11616,-6256,226,12775,-22727,1386,-72,22419,2286,-4105,6166,13704,6027,-76,1352,17360,-25165,-17113,17330,5552,-77,-11389,-802,-25967,-10443,22821,-7950,-74,10036,-505,-25011,67287,29858,-26724,-78,-2836,17962,-26160,-2179,6321,-3592,-78,-10012,21720,11703,-4527,-14730,2753,-79,-11800,-11714,48485,5940,-12762,-6597,-80,-18416,-24950,-1401,7813,-2890,-2019,-76,7991,11863,-46106,-5149,-265,-73,-11774,298,11478,-23871,-530,191,-70,-70,-11070,-10213,20635,-2158,-1133,-70,889,83,19022,-14734,18972,-72,-72,11231,-663,7987,6344,5567,-1991,-74,106,2330,-9256,-8061,23708,778,-75,26877,-5639,4892,15036,7126,2002,-80,-21944,9870,28056,32988,-20014,3537,-83,-12394,29792,-8214,-6925,-15440,5671,-83,12757,10388,3565,-16657,-10347,5425,-83,-463,-19611,3482,9994,-13297,2938,-81,4290,1085,-11070,6675,26713,-835,-84,-1301,-12782,6902,-7048,-14964,-2467,-82,1438,16977,-171,45025,-7880,-2204,-86,2357,3544,-13128,16198,-11177,10432,-87,-4038,-9818,14695,9729,10506,812,-89,-4270,-2921,-15787,1062,1868,1544,-87,1991,-1759,-11899,12769,-7966,-87,-86,-715,3382,-4627,-5442,-1420,-85,-86,-4767,-25145,2477,21430,6314,4567,-86,261,-8649,-5226,3685,20619,4384,-88,10304,-8618,16062,474,-2770,2917,-89,9627,3711,12580,25539,456,334,-94,6895,-17019,-562,36449,44416,-1575,-100,-1157,5587,-16549,17154,2614,-102,-101,-1753,9801,-19948,6335,6821,-4052,-101,25989,5978,11502,6821,-13462,-13845,-103,-191,-947,-21349,8660,-14829,9654,-109,-12371,16994,-2090,-263,12619,4814,-103,3600,-3595,-4472,-9240,-3679,913,-102,4229,556,13569,21940,-19070,-3736,-103,8507,2941,-2017,-31094,1224,6594,-102,2318,12508,-908,4812,12613,10731,-105,2102,2305,-32262,-3094,-7574,-1384,-103,9063,-14649,-14888,453,-16948,1282,-98,18130,-3753,-12864,-9933,1952,2839,-98,24279,-7229,23600,-20617,-1336,2753,-100,10097,24266,6099,5332,9804,2178,-106,315,9363,852,-14263,2808,-106,-106,9857,-20922,6005,7167,-23710,6696,-105,-1882,-5147,-22777,-21189,9695,-1146,-100,4002,-16415,7747,21257,3183,-5381,-101,9278,-15912,21301,-3951,20467,-3612,-104,3080,11308,3892,18,-24346,8921,-104,11514,-7996,-19966,-9658,-18173,-3229,-100,4418,11023,-37756,-17278,12968,-168,-98,8425,679,24496,33858,3767,-4131,-103,4744,6084,11908,-5008,25666,721,-108,-1748,26585,-4697,-15103,3552,-2348,-108,13290,-15528,4213,-4991,-2008,-1644,-107,1757,-3372,4851,-280,2820,5251,-108,-17457,6005,-7498,27500,8795,-111,-110,10663,6334,5385,10819,-4165,-2782,-113,6108,9578,-23836,21492,-2028,-3928,-113,-114,12032,1126,-2753,-11718,5804,-114,-114,-30433,-3113,2423,2545,2806,-112,33045,4576,7939,-2969,-2480,4860,-116,-197,8873,-216,20570,34041,-121,-122,-1081,5135,23583,-1007,-10354,2090,-123,12874,-5088,-30845,11954,-153860,187216,-125,-989,6300,24542,2764,20243,-1641,-130,-5774,-29202,21905,6028,-14062,-2463,-128,-1105,-19727,-14208,48260,-7168,801,-128,3241,222,-8484,24893,37980,1161,-134,2692,-24962,18386,20678,-28250,-3535,-132,-16284,23173,-13713,-12361,-8142,2477,-130,10000,-3781,16419,8354,-6516,7206,-133,-4623,-2485,-1483,322,421,1569,-133,11076,-2949,7484,-16717,7220,869,-133,-4449,4413,-11027,12705,-7175,6498,-133,-17155,859,-11419,-9234,-22210,1866,-128,7037,21531,-1402,-5623,11165,309,-131,469,-19074,-8374,12582,20621,-132,-131,14319,-3130,-9870,-799,7041,-3752,-132,-1206,9785,24250,-3844,-1160,1872,-134,7501,-2969,1770,-2908,12567,-136,-136,-41,6643,-8070,-15493,-9903,-3331,-133,99,601,28152,-3138,1906,-3196,-135,9278,23231,29393,-83,-803,10530,-141,18127,-3578,-1571,-12053,-1274,-142,-141,-15233,10191,2173,9237,-4126,-1036,-142,8579,10995,14022,-3104,10690,-2526,-146,8679,-6042,16150,-30133,2892,-3582,-144,892,-1558,-50627,-10843,-18012,3874,-137,17265,-120,-50037,-14116,11591,-872,-134,-1980,-13852,40174,-45602,-40200,-129,-128,-31538,-10492,1465,46152,6389,1345,-130,2620,33877,2158,31422,3188,1883,-136,15590,-8921,3812,-35183,17668,1501,-136,-20821,-16402,7227,34880,-100,-137,98,-48076,-737,-2946,-50508,-811,-127,18131,23012,44762,11606,15843,-7541,-137,2798,-4351,-9131,43675,-884,-1275,-139,2832,12786,5275,12798,-12742,-454,-141,-638,-28527,17469,5029,27262,835,-143],"returnScale":1000000,"returns":[0,-93,-93,-93,-92,-93,-6809,-4309,-14124,2884,-76,-26027,-13457,25503,-24341,-3902,4159,-87,5279,17437,-11476,-27220,-25168,-83,-84,9414,-33043,8047,49043,-29245,-4241,-83,18361,3441,27641,-47722,-12954,114,-40624,14055,37688,-66568,51151,1709,-82,-19025,20953,-42724,-1709,-6534,-2971,-77,12878,-26919,9574,20129,24055,-1512,-80,872,-2248,424,23656,-20802,-2205,-81,2922,6029,-1029,-21904,-25370,-77,-77,-32857,17488,20443,-36604,12032,-5285,-75,809,15570,-4227,12152,32572,-2094,-79,-6124,-28263,-7143,-13062,4168,-2212,-75,-367,14354,10106,31900,-939,918,-80,-24166,-1060,3599,-3150,20021,-3604,-79,-2538,19314,14202,21904,-21321,512,-83,-4560,-23585,39725,3980,10042,-4976,-84,6399,5987,20755,11657,-6942,-3545,-88,-7133,-15289,25013,-4506,8352,3357,-88,1954,2123,-9040,2070,-20340,7660,-87,-20674,1115,9312,16058,-35290,-2300,-84,-9315,-7737,-7936,-2613,-7034,567,-81,-700,-2755,10998,8550,20388,-10570,-84,8483,-45859,5289,2693,-7004,2202,-80,4864,-10188,-10198,-9933,-9692,7482,-77,-7356,9367,11482,-22696,-17434,-3060,-75,16469,30694,-9576,-4229,-35912,4237,-75,-11616,-6256,226,12775,-22727,1386,-72,22419,2286,-4105,6166,13704,6027,-76,1352,17360,-25165,-17113,17330,5552,-77,-11389,-802,-25967,-10443,22821,-7950,-74,10036,-505,-25011,67287,29858,-26724,-78,-2836,17962,-26160,-2179,6321,-3592,-78,-10012,21720,11703,-4527,-14730,2753,-79,-11800,-11714,48485,5940,-12762,-6597,-80,-18416,-24950,-1401,7813,-2890,-2019,-76,7991,11863,-46106,-5149,-265,-73,-11774,298,11478,-23871,-530,191,-70,-70,-11070,-10213,20635,-2158,-1133,-70,889,83,19022,-14734,18972,-72,-72,11231,-663,7987,6344,5567,-1991,-74,106,2330,-9256,-8061,23708,778,-75,26877,-5639,4892,15036,7126,2002,-80,-21944,9870,28056,32988,-20014,3537,-83,-12394,29792,-8214,-6925,-15440,5671,-83,12757,10388,3565,-16657,-10347,5425,-83,-463,-19611,3482,9994,-13297,2938,-81,4290,1085,-11070,6675,26713,-835,-84,-1301,-12782,6902,-7048,-14964,-2467,-82,1438,16977,-171,45025,-7880,-2204,-86,2357,3544,-13128,16198,-11177,10432,-87,-4038,-9818,14695,9729,10506,812,-89,-4270,-2921,-15787,1062,1868,1544,-87,1991,-1759,-11899,12769,-7966,-87,-86,-715,3382,-4627,-5442,-1420,-85,-86,-4767,-25145,2477,21430,6314,4567,-86,261,-8649,-5226,3685,20619,4384,-88,10304,-8618,16062,474,-2770,2917,-89,9627,3711,12580,25539,456,334,-94,6895,-17019,-562,36449,44416,-1575,-100,-1157,5587,-16549,17154,2614,-102,-101,-1753,9801,-19948,6335,6821,-4052,-101,25989,5978,11502,6821,-13462,-13845,-103,-191,-947,-21349,8660,-14829,9654,-109,-12371,16994,-2090,-263,12619,4814,-103,3600,-3595,-4472,-9240,-3679,913,-102,4229,556,13569,21940,-19070,-3736,-103,8507,2941,-2017,-31094,1224,6594,-102,2318,12508,-908,4812,12613,10731,-105,2102,2305,-32262,-3094,-7574,-1384,-103,9063,-14649,-14888,453,-16948,1282,-98,18130,-3753,-12864,-9933,1952,2839,-98,24279,-7229,23600,-20617,-1336,2753,-100,10097,24266,6099,5332,9804,2178,-106,315,9363,852,-14263,2808,-106,-106,9857,-20922,6005,7167,-23710,6696,-105,-1882,-5147,-22777,-21189,9695,-1146,-100,4002,-16415,7747,21257,3183,-5381,-101,9278,-15912,21301,-3951,20467,-3612,-104,3080,11308,3892,18,-24346,8921,-104,11514,-7996,-19966,-9658,-18173,-3229,-100,4418,11023,-37756,-17278,12968,-168,-98,8425,679,24496,33858,3767,-4131,-103,4744,6084,11908,-5008,25666,721,-108,-1748,26585,-4697,-15103,3552,-2348,-108,13290,-15528,4213,-4991,-2008,-1644,-107,1757,-3372,4851,-280,2820,5251,-108,-17457,6005,-7498,27500,8795,-111,-110,10663,6334,5385,10819,-4165,-2782,-113,6108,9578,-23836,21492,-2028,-3928,-113,-114,12032,1126,-2753,-11718,5804,-114,-114,-30433,-3113,2423,2545,2806,-112,33045,4576,7939,-2969,-2480,4860,-116,-197,8873,-216,20570,34041,-121,-122,-1081,5135,23583,-1007,-10354,2090,-123,12874,-5088,-30845,11954,-153860,187216,-125,-989,6300,24542,2764,20243,-1641,-130,-5774,-29202,21905,6028,-14062,-2463,-128,-1105,-19727,-14208,48260,-7168,801,-128,3241,222,-8484,24893,37980,1161,-134,2692,-24962,18386,20678,-28250,-3535,-132,-16284,23173,-13713,-12361,-8142,2477,-130,10000,-3781,16419,8354,-6516,7206,-133,-4623,-2485,-1483,322,421,1569,-133,11076,-2949,7484,-16717,7220,869,-133,-4449,4413,-11027,12705,-7175,6498,-133,-17155,859,-11419,-9234,-22210,1866,-128,7037,21531,-1402,-5623,11165,309,-131,469,-19074,-8374,12582,20621,-132,-131,14319,-3130,-9870,-799,7041,-3752,-132,-1206,9785,24250,-3844,-1160,1872,-134,7501,-2969,1770,-2908,12567,-136,-136,-41,6643,-8070,-15493,-9903,-3331,-133,99,601,28152,-3138,1906,-3196,-135,9278,23231,29393,-83,-803,10530,-141,18127,-3578,-1571,-12053,-1274,-142,-141,-15233,10191,2173,9237,-4126,-1036,-142,8579,10995,14022,-3104,10690,-2526,-146,8679,-6042,16150,-30133,2892,-3582,-144,892,-1558,-50627,-10843,-18012,3874,-137,17265,-120,-50037,-14116,11591,-872,-134,-1980,-13852,40174,-45602,-40200,-129,-128,-31538,-10492,1465,46152,6389,1345,-130,2620,33877,2158,31422,3188,1883,-136,15590,-8921,3812,-35183,17668,1501,-136,-20821,-16402,7227,34880,-100,-137,98,-48076,-737,-2946,-50508,-811,-127,18131,23012,44762,11606,15843,-7541,-137,2798,-4351,-9131,43675,-884,-1275,-139,2832,12786,5275,12798,-12742,-454,-141,-638,-28527,17469,5029,27262,835,-143]}});
\ No newline at end of file
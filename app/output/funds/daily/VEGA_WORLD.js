@@ -0,0 +1 @@
+registerFundSeries("VEGA WORLD", {"daily":{"start":19082,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000000,-93,-93,-93,-92,-93,3677,81,1487,2024,-79,-7671,-3212,8250,3029,-2545,1686,-94,-1619,9398,472,-6590,-22351,-91,-92,4167,-26285,17842,19470,-9279,-2770,-92,-1707,-1195,19571,-23670,-9985,-642,-90,-23292,3427,-6598,-988,33080,1198,-91,-9455,8820,-32636,-7985,5167,-2356,-87,9900,-8628,3269,15839,12863,-910,-90,2521,-5361,-3167,11783,-5774,-1906,-90,2739,3044,-4886,-20107,-18591,-86,-87,-22283,10700,12452,-24236,6184,-4825,-85,832,12934,-4994,4555,27229,-1407,-89,-1001,-19940,-970,-4658,11613,-2948,-87,299,-9007,15007,23930,1595,779,-90,-11376,3254,-4049,-8286,21869,-3666,-89,-4930,20078,-7445,7676,-7037,1487,-90,4351,-12845,17711,8853,10415,-4618,-93,1777,-8048,11342,2586,-1997,-3235,-92,2298,-6754,10278,-4724,5669,3133,-93,5123,9568,-5362,-1639,-9918,7493,-94,-14882,236,4409,10458,-23273,-2352,-91,-2704,-4135,-10729,-353,-389,262,-90,-5334,5493,12047,18463,16474,-10511,-93,6188,-36566,-8289,5448,-7894,2297,-90,7686,-19909,-14734,-710,-15627,9114,-86,-10791,10397,20628,-12726,-25846,-3213,-85,23696,28336,-15109,-7266,-16580,4321,-87,2215,5572,-4246,15114,-17994,1156,-86,16974,4759,-14805,1356,21604,6065,-90,6877,17707,-6360,-10234,12441,6302,-92,-4194,8098,-18529,10141,45615,-9486,-95,5467,5338,-17113,42042,22448,-28707,-98,-6097,-945,-19333,2711,11660,-4010,-96,-3992,20924,119,-2150,-7467,2469,-97,-12689,-1406,27044,103,4192,-5979,-99,-17942,-12623,3323,6432,-9876,-1516,-95,7434,7240,-873,-35431,-5378,-562,-93,-8441,4085,22027,-16820,3022,-101,-93,-93,-1957,-8508,10329,-3505,-1311,-92,2915,3891,24171,-5523,20873,-97,-97,-3240,463,8055,6986,282,-1854,-98,2926,-3229,-9329,-12416,10127,145,-96,11976,-384,3976,248,-381,1766,-99,-11383,6632,13778,-5481,-10543,3206,-98,-6519,14904,-7525,-1543,-4607,5576,-98,7983,1411,-4514,-4529,-5671,4631,-98,1340,-14859,-1800,-23,-20796,2851,0,7850,1302,4229,6825,21556,-572,-99,-7192,-22455,-783,-13502,-21162,-1623,-93,-8742,7752,-24558,23874,-13132,-2226,-91,11767,10139,-18992,668,-8815,9771,-92,3094,7871,6542,6949,8886,657,-94,328,-7509,-12667,1479,1816,1337,-93,4306,9329,-11689,8911,-11044,-92,-93,1205,2930,-1940,-8500,-8712,-92,-91,1121,-21267,-7415,9337,8997,4067,-92,-1343,-12649,-7305,-10598,15316,3321,-90,-261,-4131,1479,-388,-1601,2435,-90,9428,-7881,9050,6781,-2165,212,-91,-396,-6915,-10544,-3773,12633,-1135,-90,-598,-2611,-10401,13631,23641,-93,-92,-4663,6530,1768,5328,-3777,-2624,-92,5643,14754,440,10516,-3674,-9954,-94,-1255,-9609,-6512,-1895,-14424,7274,-92,445,10649,-6201,2557,5199,3050,-94,6074,-3911,-4854,-18197,5703,714,-92,7540,1800,9171,6358,-17581,-2812,-92,-114,4494,-1071,897,-5,4991,-93,4436,4434,5375,-453,6037,7866,-96,4229,-11751,-13709,2816,-1227,-1250,-93,3156,-4130,2135,220,-13256,1017,-92,-1025,-8281,-8665,-4562,-1757,2076,-91,3404,-6871,4461,-7857,1882,2045,-90,8393,15258,859,-10837,5466,1668,-92,-1274,-4294,-1895,-8752,1696,-91,-91,5656,-3914,-1292,10287,-7042,5132,-93,-9660,-6583,-6059,-16586,2828,-1024,-88,-1889,-9904,1432,11898,4416,-3834,-88,-8117,-9323,7049,-6507,11242,-2625,-87,-2373,17794,-213,-9707,-12118,6503,-87,7652,960,-17943,-15543,-13277,-1997,-83,-3665,9732,-12525,-2118,-5581,-423,-82,10791,-1139,1655,29276,1740,-2848,-86,-1666,-5274,3351,-8535,5073,457,-85,3307,22924,4094,-16453,5940,-1466,-87,7337,-5076,618,3169,3057,-1060,-88,-5783,156,5124,2480,16185,3729,-90,-4059,-5390,6732,8904,9700,-91,-92,7456,-3812,10711,18253,-3826,-1915,-94,-5303,13077,-24431,14057,-3233,-2507,-93,-93,7019,2821,-2039,-4232,4468,-94,-94,-3887,-7446,-10,-1326,1929,-92,2687,-5954,-2727,-4957,-4868,3236,-92,-1115,-13526,-6174,2507,4915,-90,-90,-1315,5238,6754,-4654,4416,1505,-91,5832,-486,-8388,3532,2497,-4169,-92,-6177,19358,-1489,-4837,-1678,-1144,-92,6474,-15818,7677,13415,102,-1669,-93,945,-9724,3755,10429,-2293,612,-93,-4931,5220,-5693,7026,4482,354,-94,195,-11449,4758,5550,-3172,-2383,-94,446,5153,2652,-7819,802,1732,-93,4824,-1178,10031,2564,-10987,5218,-95,-562,-4310,9430,4618,720,1477,-95,-1122,-3204,4379,-12754,-2491,1094,-95,5695,1902,-7181,-339,-3168,5622,-94,-1685,-5355,-1812,-737,-8837,1832,-93,5617,7595,-988,-4342,7521,365,-94,8357,-15502,-9308,10724,6281,-94,-94,7667,1500,-8146,6392,3206,-3233,-94,4785,2743,4542,1068,4986,1212,-97,1174,-216,-7407,-10009,2850,-95,-95,916,-746,-12889,5138,7830,-2569,-95,-1923,-5251,10169,1766,-6551,-2393,-94,1776,1782,6219,-9629,-6266,7176,-94,5679,96,-1801,5820,565,-96,-97,9686,-4462,-1571,1767,-6766,-865,-96,3032,-22,12556,850,2914,-1703,-98,-6011,-8721,8276,2771,4083,-2189,-97,-6297,3663,-13000,-13733,-408,2320,-95,6059,-4195,-15468,-5012,6785,-829,-93,-1593,365,12623,-21374,-20228,-90,-91,-21595,-5113,2970,20113,1158,415,-90,1982,28411,-2127,14012,6139,1020,-95,8558,-6735,-711,-9934,12072,872,-95,-448,1105,-12856,4553,12063,-340,-96,187,-19009,-1080,-3659,-19803,-363,-91,6978,767,19476,8918,2550,-4077,-95,-995,221,-2506,18770,-10410,-830,-95,1217,16986,-5766,17953,4960,-133,-98,-5077,-389,8933,-7807,15829,461,-99],"returnScale":1000000,"returns":[0,-93,-93,-93,-92,-93,3677,81,1487,2024,-79,-7671,-3212,8250,3029,-2545,1686,-94,-1619,9398,472,-6590,-22351,-91,-92,4167,-26285,17842,19470,-9279,-2770,-92,-1707,-1195,19571,-23670,-9985,-642,-90,-23292,3427,-6598,-988,33080,1198,-91,-9455,8820,-32636,-7985,5167,-2356,-87,9900,-8628,3269,15839,12863,-910,-90,2521,-5361,-3167,11783,-5774,-1906,-90,2739,3044,-4886,-20107,-18591,-86,-87,-22283,10700,12452,-24236,6184,-4825,-85,832,12934,-4994,4555,27229,-1407,-89,-1001,-19940,-970,-4658,11613,-2948,-87,299,-9007,15007,23930,1595,779,-90,-11376,3254,-4049,-8286,21869,-3666,-89,-4930,20078,-7445,7676,-7037,1487,-90,4351,-12845,17711,8853,10415,-4618,-93,1777,-8048,11342,2586,-1997,-3235,-92,2298,-6754,10278,-4724,5669,3133,-93,5123,9568,-5362,-1639,-9918,7493,-94,-14882,236,4409,10458,-23273,-2352,-91,-2704,-4135,-10729,-353,-389,262,-90,-5334,5493,12047,18463,16474,-10511,-93,6188,-36566,-8289,5448,-7894,2297,-90,7686,-19909,-14734,-710,-15627,9114,-86,-10791,10397,20628,-12726,-25846,-3213,-85,23696,28336,-15109,-7266,-16580,4321,-87,2215,5572,-4246,15114,-17994,1156,-86,16974,4759,-14805,1356,21604,6065,-90,6877,17707,-6360,-10234,12441,6302,-92,-4194,8098,-18529,10141,45615,-9486,-95,5467,5338,-17113,42042,22448,-28707,-98,-6097,-945,-19333,2711,11660,-4010,-96,-3992,20924,119,-2150,-7467,2469,-97,-12689,-1406,27044,103,4192,-5979,-99,-17942,-12623,3323,6432,-9876,-1516,-95,7434,7240,-873,-35431,-5378,-562,-93,-8441,4085,22027,-16820,3022,-101,-93,-93,-1957,-8508,10329,-3505,-1311,-92,2915,3891,24171,-5523,20873,-97,-97,-3240,463,8055,6986,282,-1854,-98,2926,-3229,-9329,-12416,10127,145,-96,11976,-384,3976,248,-381,1766,-99,-11383,6632,13778,-5481,-10543,3206,-98,-6519,14904,-7525,-1543,-4607,5576,-98,7983,1411,-4514,-4529,-5671,4631,-98,1340,-14859,-1800,-23,-20796,2851,0,7850,1302,4229,6825,21556,-572,-99,-7192,-22455,-783,-13502,-21162,-1623,-93,-8742,7752,-24558,23874,-13132,-2226,-91,11767,10139,-18992,668,-8815,9771,-92,3094,7871,6542,6949,8886,657,-94,328,-7509,-12667,1479,1816,1337,-93,4306,9329,-11689,8911,-11044,-92,-93,1205,2930,-1940,-8500,-8712,-92,-91,1121,-21267,-7415,9337,8997,4067,-92,-1343,-12649,-7305,-10598,15316,3321,-90,-261,-4131,1479,-388,-1601,2435,-90,9428,-7881,9050,6781,-2165,212,-91,-396,-6915,-10544,-3773,12633,-1135,-90,-598,-2611,-10401,13631,23641,-93,-92,-4663,6530,1768,5328,-3777,-2624,-92,5643,14754,440,10516,-3674,-9954,-94,-1255,-9609,-6512,-1895,-14424,7274,-92,445,10649,-6201,2557,5199,3050,-94,6074,-3911,-4854,-18197,5703,714,-92,7540,1800,9171,6358,-17581,-2812,-92,-114,4494,-1071,897,-5,4991,-93,4436,4434,5375,-453,6037,7866,-96,4229,-11751,-13709,2816,-1227,-1250,-93,3156,-4130,2135,220,-13256,1017,-92,-1025,-8281,-8665,-4562,-1757,2076,-91,3404,-6871,4461,-7857,1882,2045,-90,8393,15258,859,-10837,5466,1668,-92,-1274,-4294,-1895,-8752,1696,-91,-91,5656,-3914,-1292,10287,-7042,5132,-93,-9660,-6583,-6059,-16586,2828,-1024,-88,-1889,-9904,1432,11898,4416,-3834,-88,-8117,-9323,7049,-6507,11242,-2625,-87,-2373,17794,-213,-9707,-12118,6503,-87,7652,960,-17943,-15543,-13277,-1997,-83,-3665,9732,-12525,-2118,-5581,-423,-82,10791,-1139,1655,29276,1740,-2848,-86,-1666,-5274,3351,-8535,5073,457,-85,3307,22924,4094,-16453,5940,-1466,-87,7337,-5076,618,3169,3057,-1060,-88,-5783,156,5124,2480,16185,3729,-90,-4059,-5390,6732,8904,9700,-91,-92,7456,-3812,10711,18253,-3826,-1915,-94,-5303,13077,-24431,14057,-3233,-2507,-93,-93,7019,2821,-2039,-4232,4468,-94,-94,-3887,-7446,-10,-1326,1929,-92,2687,-5954,-2727,-4957,-4868,3236,-92,-1115,-13526,-6174,2507,4915,-90,-90,-1315,5238,6754,-4654,4416,1505,-91,5832,-486,-8388,3532,2497,-4169,-92,-6177,19358,-1489,-4837,-1678,-1144,-92,6474,-15818,7677,13415,102,-1669,-93,945,-9724,3755,10429,-2293,612,-93,-4931,5220,-5693,7026,4482,354,-94,195,-11449,4758,5550,-3172,-2383,-94,446,5153,2652,-7819,802,1732,-93,4824,-1178,10031,2564,-10987,5218,-95,-562,-4310,9430,4618,720,1477,-95,-1122,-3204,4379,-12754,-2491,1094,-95,5695,1902,-7181,-339,-3168,5622,-94,-1685,-5355,-1812,-737,-8837,1832,-93,5617,7595,-988,-4342,7521,365,-94,8357,-15502,-9308,10724,6281,-94,-94,7667,1500,-8146,6392,3206,-3233,-94,4785,2743,4542,1068,4986,1212,-97,1174,-216,-7407,-10009,2850,-95,-95,916,-746,-12889,5138,7830,-2569,-95,-1923,-5251,10169,1766,-6551,-2393,-94,1776,1782,6219,-9629,-6266,7176,-94,5679,96,-1801,5820,565,-96,-97,9686,-4462,-1571,1767,-6766,-865,-96,3032,-22,12556,850,2914,-1703,-98,-6011,-8721,8276,2771,4083,-2189,-97,-6297,3663,-13000,-13733,-408,2320,-95,6059,-4195,-15468,-5012,6785,-829,-93,-1593,365,12623,-21374,-20228,-90,-91,-21595,-5113,2970,20113,1158,415,-90,1982,28411,-2127,14012,6139,1020,-95,8558,-6735,-711,-9934,12072,872,-95,-448,1105,-12856,4553,12063,-340,-96,187,-19009,-1080,-3659,-19803,-363,-91,6978,767,19476,8918,2550,-4077,-95,-995,221,-2506,18770,-10410,-830,-95,1217,16986,-5766,17953,4960,-133,-98,-5077,-389,8933,-7807,15829,461,-99]}});
\ No newline at end of file
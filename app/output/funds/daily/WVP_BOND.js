@@ -0,0 +1 @@
+registerFundSeries("WVP BOND", {"daily":{"start":17183,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000000,-1542,-61,-334,61,75,367,776,309,1104,1533,275,55,-155,756,-1474,783,487,729,51,328,72,395,416,-1284,-77,53,395,-365,-427,686,-1475,123,55,358,627,1353,828,-316,-264,55,227,244,-882,780,127,-529,55,215,-163,-885,-973,242,-536,53,395,-1104,740,1022,-391,542,53,284,926,195,568,483,-27,55,27,-525,415,1082,-129,485,55,736,573,-79,-557,312,323,55,-70,87,-536,-230,-426,55,54,54,507,-619,-449,375,712,55,768,-863,565,427,-36,-214,55,56,106,-1082,-282,-57,4,60,22,220,684,-181,224,-19,59,282,-238,-963,-1450,481,-748,53,1010,-515,643,-49,942,638,52,110,1370,884,629,1244,51,52,266,312,226,394,-34,395,51,385,44,1212,-483,510,41,52,-18,-637,490,-89,237,12,52,415,-419,-1264,-1138,-434,78,53,-90,354,-236,-1015,-1380,-373,52,727,43,520,-84,436,102,51,63,24,-381,254,586,-1106,51,-130,-305,-327,1177,-163,61,49,226,41,-732,535,-362,-13,48,175,782,-433,247,-81,-227,48,643,-205,807,588,299,-320,48,127,61,212,753,710,596,47,-96,-28,-1052,2170,861,-722,48,114,791,-389,119,180,56,56,225,-331,821,-303,1334,-659,54,432,-349,-528,-349,763,-698,54,-7,750,286,69,-114,-179,54,153,845,366,268,294,372,53,-98,-106,-416,350,-282,336,62,221,515,564,611,-1574,463,58,185,-208,238,-320,908,1152,59,631,474,-247,704,-739,-270,58,86,517,-55,-932,-874,-74,58,174,-457,-1010,-241,1337,127,58,388,987,1579,1025,-647,-251,62,455,-129,900,1883,532,-562,62,205,681,766,-56,38,61,61,-99,-1036,505,346,-804,505,60,243,345,-481,-203,63,407,59,79,1113,-15,114,-194,-1096,60,60,199,407,1029,-178,392,60,-95,391,1438,-303,1446,-1103,46,504,1248,1780,-259,169,47,46,271,154,-158,-1228,29,-466,47,-392,-372,1023,-1175,-720,221,46,133,342,1888,-65,-1246,-930,52,250,-33,-599,444,143,979,51,-105,245,904,499,484,182,51,620,585,378,243,-600,-2987,50,259,164,-663,-1233,386,1445,50,-306,-183,-850,-53,450,45,48,-439,-798,1056,152,-61,-438,48,-69,701,-418,-415,2024,210,41,13,-1548,-36,1345,756,51,51,-1390,-1165,-11944,-2975,6861,-345,49,-2123,-578,-242,-1609,513,552,50,-665,1600,1202,1524,-137,3175,51,-389,-943,-1337,-182,219,1244,49,93,1374,-61,355,3767,-651,49,216,-2462,1641,2118,808,355,44,-114,1215,970,2862,240,45,45,39,-436,2176,60,-1633,574,43,936,-1232,400,-2107,-2590,1195,45,148,-1584,-437,876,1676,46,45,-1210,-37,2021,-977,1605,-1866,46,-719,-1106,839,713,1630,-1330,49,-1993,-40,-1196,1527,-122,-697,49,1136,275,1652,1150,3142,93,39,18,-4011,-51,1810,9,-2209,48,1824,-501,1357,1534,-263,2440,47,69935,-72919,930,-912,717,2089,48,79,774,-1548,-1927,-3251,2053,47,-1153,913,1187,1626,-1193,-813,47,187,471,-2176,-3533,987,261,46,-14,-756,-303,-2375,-529,960,47,-256,294,595,-803,-1809,-780,47,-133,319,837,1677,373,-877,47,19,285,1072,2429,-1235,-267,47,280,379,531,1204,1001,3249,48,413,232,1955,-1986,-513,-52,47,-395,70,1222,-2174,1104,-1419,47,-656,117,413,658,305,1005,48,-406,-920,502,2466,-1045,1530,47,1574,-523,326,1974,-2722,-951,53,312,1312,-523,-2061,597,779,52,-816,1288,621,-1458,765,-276,53,-1214,-4298,2064,365,242,1014,54,-141,-2619,1677,523,157,-51,53,1262,617,-2314,447,444,-244,53,-602,-161,2116,1909,-639,1912,53,-99,-1222,-1060,-2205,-1792,-83,51,-163,193,316,-513,1024,-2022,51,-28,-271,40,1628,3066,-285,52,1094,98,2306,-1033,-1881,-61,44,121,2437,2622,2853,1548,130,51,258,2442,1784,1913,5190,-42,51,-1460,-1702,301,3592,-102,529,51,310,1740,1035,876,-67,140,51,-620,2176,951,-1062,320,553,52,145,-508,525,-559,492,580,51,1018,-363,-18,-647,-733,740,52,7,1227,525,377,123,584,51,937,498,-242,454,666,-221,51,725,1083,-83,1217,-727,1075,49,141,559,567,208,2001,343,45,339,-593,1281,-1044,605,-140,49,-88,-99,80,68,166,-807,57,-205,591,449,980,1293,270,49,48,258,196,-499,2358,50,49,352,282,-2045,-270,-464,1637,49,-37,-1200,-722,-1370,731,-1023,47,-955,-212,999,2188,-61,919,47,277,934,419,-851,862,47,47,54,-1179,215,342,713,-825,35,-169,86,1111,-695,767,60,34,586,-22,-1136,-743,1725,31,32,-120,4834,2591,3278,-3429,-315,35,19,-3315,274,1024,1911,-301,40,1345,1070,2701,72,-1424,967,42,205,528,349,271,-2405,900,41,748,262,1237,-408,576,-424,41,539,1015,2612,2154,765,-814,42,-544,9,-1338,-377,3078,41,42,-2180,-5364,1294,704,868,-191,41,-1756,221,-1687,1574,1859,2454,28,215,-1332,2285,769,529,373,25,308,-1184,607,741,2106,1225,24,396,2260,2159,-1707,-1513,1308,24,-317,-1614,-900,3064,501,-3508,22,-1223,2352,654,-672,257,1444,28,-487,-163,-2552,287,2244,-25,32,-133,452,-1753,-1175,582,-564,27,-88,-1059,-132,308,-285,27,27,-193,679,87,-270,-1794,-871,29,-55,-382,1778,7,107,931,29,-248,380,-704,684,-344,902,32,623,-670,1123,598,268,1224,29,-453,-660,444,824,731,-828,28,-288,-1535,75,-22,-378,1192,28,664,2039,-185,485,459,726,27,-956,-1232,-1065,342,323,-12,27,820,-65,1724,1000,-263,-793,28,420,1209,235,1061,-11,857,35,388,536,92,-59,634,-1473,35,-399,-1107,-1441,643,1455,1159,33,-412,479,251,1348,990,578,33,118,-451,798,135,-658,1878,34,49,394,-299,750,779,1862,31,-1227,270,1426,-71,-386,-856,44,276,-202,1847,1378,93,68,46,-431,1251,1862,123,1121,30,48,334,58,422,25,-735,50,-1319,-2218,-765,-3803,-4143,-886,62,609,518,1717,-1115,-5880,-4791,56,-11597,-4908,-5061,-21276,2174,5336,60,-12474,-7396,-10307,-9495,11972,3535,63,-6504,4824,9284,9566,-7079,-429,59,-2827,-229,-753,104,466,4851,54,4685,3596,-1512,7735,995,-1782,53,1736,5027,-5233,1119,2124,58,58,427,-3484,-271,1036,3182,-571,61,1035,-1012,1292,2671,-1633,59,59,-1467,-959,3043,1372,1526,-1614,58,342,3253,-1537,-2185,3690,157,58,4381,2350,144,797,-782,2284,52,-264,2271,-278,3025,297,-2910,43,1629,4300,4987,-164,659,62,61,2023,-3084,-1333,-6780,-500,951,62,-1474,5825,-1066,1935,1072,651,62,-919,745,-3959,-406,2116,-319,61,-580,-1835,2418,1880,-1749,1142,63,1896,-3057,1117,-186,-1080,1559,62,823,-1869,178,870,199,-560,61,2373,2659,3740,-1302,-1590,-1218,61,348,-3937,539,-1172,-626,-2718,59,1015,970,3192,-1484,321,634,61,752,2839,-102,716,-3201,773,58,-362,-2210,-279,-1163,2297,1851,60,1078,-1934,104,-56,-475,60,60,469,-654,1107,3120,414,-584,60,122,-265,423,1394,-1477,14,60,448,-27,-257,-406,1304,-970,61,-4223,132,523,-1220,1820,72,60,1654,-1407,-664,1496,-580,-30,60,1328,233,192,1356,2249,-563,60,587,557,27,-1240,2280,-962,60,312,-1543,-790,-1165,1379,60,59,-504,992,-2618,1186,-280,410,52,735,2210,1638,5629,-3018,-535,60,3241,236,2955,2633,-308,-631,51,1401,-60,-450,624,853,-620,50,880,-400,1974,-252,640,-791,41,-306,-573,364,-1222,-330,188,55,-26,684,31,496,-239,-138,56,582,-539,970,-246,-538,-523,56,-1205,1642,-1080,1878,-88,95,57,54,384,-292,-891,-1230,55,56,1125,-1169,-909,-387,230,654,55,-790,406,1034,854,1185,294,56,38,1589,449,-239,-1671,-465,57,-134,703,304,325,541,-602,43,412,1627,1504,697,1437,626,56,-124,-701,-1441,70,-587,598,54,-270,-720,-1462,1731,-719,-1111,55,-996,-745,280,-1003,-3332,1774,55,1872,1967,29,-793,-1376,1713,55,-1640,1679,210,2287,-3051,831,52,376,1089,-1032,-131,-14,432,49,-1907,-1126,973,985,305,565,55,-298,-901,1140,666,-927,-313,53,30,633,752,-1105,349,-289,52,256,-550,798,370,-250,283,50,276,-1746,-282,1138,-396,-47,50,-65,-614,-951,926,-777,55,55,155,122,2230,1041,-122,227,54,123,-3413,-1038,401,972,-216,54,224,-794,-2254,429,1081,448,54,183,385,-983,1066,1315,1694,52,136,-677,398,929,955,1796,56,336,-199,763,36,1359,1454,54,-627,-828,449,-1607,5254,57,58,-457,225,486,-908,495,-249,57,21,680,193,-451,1291,61,107,-1143,882,-1334,-1098,-225,57,90,-161,456,1294,-41,-4,57,-419,683,-234,577,308,317,56,-53,-1066,-778,734,-1274,-180,44,521,-947,363,841,-219,1082,55,-200,697,749,263,154,-503,55,325,-213,29,771,720,522,56,52,-517,-255,-338,-334,176,57,488,-21,-544,390,-679,-553,61,-138,-26,374,483,1198,320,61,45,2165,-814,-529,1403,-26,60,-1379,1776,-733,-720,-716,-133,60,-947,-787,843,155,632,-685,60,-776,-1533,3529,-854,-65,61,-500,-864,1394,1049,-831,256,61,-577,-59,-748,196,-708,648,60,-67,1812,414,-310,-68,-1659,48,-467,2360,-802,1941,2196,1418,60,391,-1372,-1020,1587,-121,60,-240,-122,1152,1720,-913,1770,61,-886,-4162,470,1564,-3595,-1883,60,552,70,-846,2071,-48,1335,60,782,1236,1314,-277,-1577,1120,64,145,-161,-1860,1903,-3766,54,65,-2680,2124,-440,601,141,-217,66,158,508,-95,253,-255,420,66,-507,200,1196,-3123,-407,65,66,-1717,776,276,-1352,-4526,-89,65,-1176,1595,1723,408,-124,66,-1712,359,1035,60,2021,768,67,1,203,-1143,-2789,-8373,120,2861,-1281,-1913,243,64,-1853,2895,-108,-1284,-580,456,67,-766,-1889,-4458,-9089,9575,-183,68,-3589,-4119,-1230,-14612,-7109,4198,152,-8148,740,3490,-2750,-1646,2504,69,55,350,1150,6355,-1632,1268,72,-431,-2681,134,788,1626,-476,65,1162,6065,-528,3,759,-11150,65,1293,-94,-2634,1039,-578,1510,66,-2012,-1352,80,58,18,-117,-1395,-171,-982,-4371,64,64,-2260,188,3544,1009,-500,-1269,65,-1059,-1554,-49,135,-3168,126,66,-3001,1529,-984,4723,561,67,-838,-1271,-4280,-812,1074,-1255,67,1111,-2004,1764,1591,883,-741,66,-281,-2806,1095,-363,360,-949,66,-486,-3152,-2863,-6183,-5414,67,67,-10291,5500,2443,-3237,-274,-2019,70,47,-395,-2330,1559,1241,-481,73,-712,-6036,-1859,-870,5857,-769,73,83,-636,1462,2866,-38,449,72,-636,-1631,-3010,-4250,3221,-971,74,2217,-18,4829,4613,100,58,2483,-2668,2163,5137,6021,-1554,47,1866,-714,958,5097,968,-825,61,4148,2403,2245,4545,-1900,1105,60,823,-1003,-208,-3196,2432,60,-2818,3245,1774,987,-2100,-697,61,-977,-3316,-3094,-1978,2572,188,63,-1766,1743,470,2352,1904,-3094,64,2640,-5168,-3700,2494,-2992,766,63,-393,-3435,-977,-4537,-4514,2915,63,-7157,-1394,-4197,-1022,-4684,-1043,64,3808,5307,-6902,-3413,-2455,1323,64,-1789,956,-1880,-2064,294,524,64,2498,1549,-3247,-21,-2278,2086,64,3036,3626,4148,3223,1612,1644,63,-426,2645,42,-1883,6889,-2324,63,2481,-177,321,7127,6374,-6479,62,1403,4356,-252,2609,-2219,-795,62,1744,3397,2115,1367,-1388,733,62,590,-507,2744,4705,-718,0,-1487,275,-2603,1223,-6,-223,-196,60,-649,860,646,-5114,-3687,-239,61,-1534,-2970,1332,-566,-811,-199,60,60,-617,-1838,-540,-424,-284,54,-785,2282,3405,-2089,1333,60,60,1621,-1942,1229,2036,1826,279,60,-307,113,2505,-135,-362,282,60,999,-899,2041,1487,264,555,60,-1229,-1704,2532,5920,-3059,872,60,-5032,1085,657,879,-4422,1425,59,-599,44,-2226,-414,-2695,1349,61,-50,-4898,-1003,2176,109,868,60,895,-888,-1842,-2504,3002,-116,61,2542,1856,-1261,1636,-844,-557,61,45,-4497,-2095,3324,-1263,-329,61,-1307,619,193,2150,-2278,2230,61,652,-749,-614,1573,464,230,61,1485,1542,-875,-1002,457,382,62,-34,-727,-876,149,-2338,63,62,-871,-78,-176,-1639,-1363,63,62,-1102,-358,766,-1305,671,1104,59,102,-784,374,-1181,890,63,-738,-245,2848,2170,584,611,67,-2618,-555,-897,430,942,142,67,-159,-1134,-46,-330,706,-195,67,852,2188,111,1791,1776,67,67,676,487,258,-719,749,-441,69,565,1353,482,-361,1271,-1723,69,-1776,1300,549,739,821,1819,69,360,-104,37,-902,-378,-611,69,-40,-938,-229,-3030,-1587,151,82,248,911,2837,3384,-86,-229,81,467,1549,863,198,417,566,80,825,941,638,2102,522,782,77,221,-722,-589,-1161,1226,-98,76,203,761,414,-36,-819,202,78,1732,-641,392,-663,104,365,79,-853,-69,2229,1863,-678,307,79,213,958,705,-524,280,268,78,268,854,396,70,1102,79,79,-83,84,207,214,28,458,80,-288,-603,-76,-1087,432,55,80,-807,-1607,-1473,-3949,424,-372,75,-2080,-1919,-1112,172,-331,-168,75,-55,1505,1168,278,-138,723,76,-314,-703,-1122,-466,-12,-125,75,-565,1432,-362,47,1481,92,76,705,495,1102,4096,1189,-257,75,415,29,955,22,198,174,75,-304,2133,889,205,2168,-94,76,873,613,589,409,-131,-45,75,512,279,3526,658,1820,398,76,1639,2417,2085,784,-1026,75,75,-278,831,363,4866,1846,-115,75,1436,714,521,786,131,-99,74,75,153,750,344,-580,491,61,64,203,-221,-508,-1335,290,77,-370,-108,262,1049,1393,998,76,276,-217,4522,-282,535,80,81,1549,-256,-109,1266,1276,196,77,1025,1066,1015,1164,223,-394,77,-635,1162,398,-452,252,-11,80,193,-787,-216,1514,-941,-97,80,71,-117,-875,533,-162,82,79,255,-447,-190,-120,-38,212,80,604,28,958,850,253,-148,76,309,-757,152,-1251,-602,93,85,-436,-163,666,1530,266,564,83,-312,-375,503,316,222,3,83,3,-782,224,458,-404,226,88,288,1528,-497,-1313,1781,577,89,-842,-2370,516,1125,-336,284,94,735,621,-903,-1421,322,117,91,1581,-740,48,220,1923,90,91,753,1253,-1190,-3676,410,-199,90,-182,-62,3597,1514,-526,192,91,45,-165,-278,-722,-172,88,88,186,487,-1227,393,971,6,91,384,-82,353,-254,-1048,-129,90,-971,427,1697,-463,-853,683,90,-568,15,-185,-214,210,88,89,-122,216,-241,-7,-65,16,89,-723,-722,1300,196,647,-129,90,1067,177,423,1401,-121,-50,89,54,146,217,-162,-125,392,90,90,6,108,-535,614,91,88,905,334,451,600,805,88,87,-1211,-1498,-183,240,535,93,88,311,787,543,-496,1427,189,88,796,1871,2773,14,1030,182,87,-88,54,219,-17,620,66,80,-284,368,561,455,495,4,86,51,-153,1759,-101,767,-336,86,814,672,292,832,-15,39,85,388,587,-238,-244,802,45,85,561,995,550,-537,-187,59,85],"returnScale":1000000,"returns":[0,-1542,-61,-334,61,75,367,776,309,1104,1533,275,55,-155,756,-1474,783,487,729,51,328,72,395,416,-1284,-77,53,395,-365,-427,686,-1475,123,55,358,627,1353,828,-316,-264,55,227,244,-882,780,127,-529,55,215,-163,-885,-973,242,-536,53,395,-1104,740,1022,-391,542,53,284,926,195,568,483,-27,55,27,-525,415,1082,-129,485,55,736,573,-79,-557,312,323,55,-70,87,-536,-230,-426,55,54,54,507,-619,-449,375,712,55,768,-863,565,427,-36,-214,55,56,106,-1082,-282,-57,4,60,22,220,684,-181,224,-19,59,282,-238,-963,-1450,481,-748,53,1010,-515,643,-49,942,638,52,110,1370,884,629,1244,51,52,266,312,226,394,-34,395,51,385,44,1212,-483,510,41,52,-18,-637,490,-89,237,12,52,415,-419,-1264,-1138,-434,78,53,-90,354,-236,-1015,-1380,-373,52,727,43,520,-84,436,102,51,63,24,-381,254,586,-1106,51,-130,-305,-327,1177,-163,61,49,226,41,-732,535,-362,-13,48,175,782,-433,247,-81,-227,48,643,-205,807,588,299,-320,48,127,61,212,753,710,596,47,-96,-28,-1052,2170,861,-722,48,114,791,-389,119,180,56,56,225,-331,821,-303,1334,-659,54,432,-349,-528,-349,763,-698,54,-7,750,286,69,-114,-179,54,153,845,366,268,294,372,53,-98,-106,-416,350,-282,336,62,221,515,564,611,-1574,463,58,185,-208,238,-320,908,1152,59,631,474,-247,704,-739,-270,58,86,517,-55,-932,-874,-74,58,174,-457,-1010,-241,1337,127,58,388,987,1579,1025,-647,-251,62,455,-129,900,1883,532,-562,62,205,681,766,-56,38,61,61,-99,-1036,505,346,-804,505,60,243,345,-481,-203,63,407,59,79,1113,-15,114,-194,-1096,60,60,199,407,1029,-178,392,60,-95,391,1438,-303,1446,-1103,46,504,1248,1780,-259,169,47,46,271,154,-158,-1228,29,-466,47,-392,-372,1023,-1175,-720,221,46,133,342,1888,-65,-1246,-930,52,250,-33,-599,444,143,979,51,-105,245,904,499,484,182,51,620,585,378,243,-600,-2987,50,259,164,-663,-1233,386,1445,50,-306,-183,-850,-53,450,45,48,-439,-798,1056,152,-61,-438,48,-69,701,-418,-415,2024,210,41,13,-1548,-36,1345,756,51,51,-1390,-1165,-11944,-2975,6861,-345,49,-2123,-578,-242,-1609,513,552,50,-665,1600,1202,1524,-137,3175,51,-389,-943,-1337,-182,219,1244,49,93,1374,-61,355,3767,-651,49,216,-2462,1641,2118,808,355,44,-114,1215,970,2862,240,45,45,39,-436,2176,60,-1633,574,43,936,-1232,400,-2107,-2590,1195,45,148,-1584,-437,876,1676,46,45,-1210,-37,2021,-977,1605,-1866,46,-719,-1106,839,713,1630,-1330,49,-1993,-40,-1196,1527,-122,-697,49,1136,275,1652,1150,3142,93,39,18,-4011,-51,1810,9,-2209,48,1824,-501,1357,1534,-263,2440,47,69935,-72919,930,-912,717,2089,48,79,774,-1548,-1927,-3251,2053,47,-1153,913,1187,1626,-1193,-813,47,187,471,-2176,-3533,987,261,46,-14,-756,-303,-2375,-529,960,47,-256,294,595,-803,-1809,-780,47,-133,319,837,1677,373,-877,47,19,285,1072,2429,-1235,-267,47,280,379,531,1204,1001,3249,48,413,232,1955,-1986,-513,-52,47,-395,70,1222,-2174,1104,-1419,47,-656,117,413,658,305,1005,48,-406,-920,502,2466,-1045,1530,47,1574,-523,326,1974,-2722,-951,53,312,1312,-523,-2061,597,779,52,-816,1288,621,-1458,765,-276,53,-1214,-4298,2064,365,242,1014,54,-141,-2619,1677,523,157,-51,53,1262,617,-2314,447,444,-244,53,-602,-161,2116,1909,-639,1912,53,-99,-1222,-1060,-2205,-1792,-83,51,-163,193,316,-513,1024,-2022,51,-28,-271,40,1628,3066,-285,52,1094,98,2306,-1033,-1881,-61,44,121,2437,2622,2853,1548,130,51,258,2442,1784,1913,5190,-42,51,-1460,-1702,301,3592,-102,529,51,310,1740,1035,876,-67,140,51,-620,2176,951,-1062,320,553,52,145,-508,525,-559,492,580,51,1018,-363,-18,-647,-733,740,52,7,1227,525,377,123,584,51,937,498,-242,454,666,-221,51,725,1083,-83,1217,-727,1075,49,141,559,567,208,2001,343,45,339,-593,1281,-1044,605,-140,49,-88,-99,80,68,166,-807,57,-205,591,449,980,1293,270,49,48,258,196,-499,2358,50,49,352,282,-2045,-270,-464,1637,49,-37,-1200,-722,-1370,731,-1023,47,-955,-212,999,2188,-61,919,47,277,934,419,-851,862,47,47,54,-1179,215,342,713,-825,35,-169,86,1111,-695,767,60,34,586,-22,-1136,-743,1725,31,32,-120,4834,2591,3278,-3429,-315,35,19,-3315,274,1024,1911,-301,40,1345,1070,2701,72,-1424,967,42,205,528,349,271,-2405,900,41,748,262,1237,-408,576,-424,41,539,1015,2612,2154,765,-814,42,-544,9,-1338,-377,3078,41,42,-2180,-5364,1294,704,868,-191,41,-1756,221,-1687,1574,1859,2454,28,215,-1332,2285,769,529,373,25,308,-1184,607,741,2106,1225,24,396,2260,2159,-1707,-1513,1308,24,-317,-1614,-900,3064,501,-3508,22,-1223,2352,654,-672,257,1444,28,-487,-163,-2552,287,2244,-25,32,-133,452,-1753,-1175,582,-564,27,-88,-1059,-132,308,-285,27,27,-193,679,87,-270,-1794,-871,29,-55,-382,1778,7,107,931,29,-248,380,-704,684,-344,902,32,623,-670,1123,598,268,1224,29,-453,-660,444,824,731,-828,28,-288,-1535,75,-22,-378,1192,28,664,2039,-185,485,459,726,27,-956,-1232,-1065,342,323,-12,27,820,-65,1724,1000,-263,-793,28,420,1209,235,1061,-11,857,35,388,536,92,-59,634,-1473,35,-399,-1107,-1441,643,1455,1159,33,-412,479,251,1348,990,578,33,118,-451,798,135,-658,1878,34,49,394,-299,750,779,1862,31,-1227,270,1426,-71,-386,-856,44,276,-202,1847,1378,93,68,46,-431,1251,1862,123,1121,30,48,334,58,422,25,-735,50,-1319,-2218,-765,-3803,-4143,-886,62,609,518,1717,-1115,-5880,-4791,56,-11597,-4908,-5061,-21276,2174,5336,60,-12474,-7396,-10307,-9495,11972,3535,63,-6504,4824,9284,9566,-7079,-429,59,-2827,-229,-753,104,466,4851,54,4685,3596,-1512,7735,995,-1782,53,1736,5027,-5233,1119,2124,58,58,427,-3484,-271,1036,3182,-571,61,1035,-1012,1292,2671,-1633,59,59,-1467,-959,3043,1372,1526,-1614,58,342,3253,-1537,-2185,3690,157,58,4381,2350,144,797,-782,2284,52,-264,2271,-278,3025,297,-2910,43,1629,4300,4987,-164,659,62,61,2023,-3084,-1333,-6780,-500,951,62,-1474,5825,-1066,1935,1072,651,62,-919,745,-3959,-406,2116,-319,61,-580,-1835,2418,1880,-1749,1142,63,1896,-3057,1117,-186,-1080,1559,62,823,-1869,178,870,199,-560,61,2373,2659,3740,-1302,-1590,-1218,61,348,-3937,539,-1172,-626,-2718,59,1015,970,3192,-1484,321,634,61,752,2839,-102,716,-3201,773,58,-362,-2210,-279,-1163,2297,1851,60,1078,-1934,104,-56,-475,60,60,469,-654,1107,3120,414,-584,60,122,-265,423,1394,-1477,14,60,448,-27,-257,-406,1304,-970,61,-4223,132,523,-1220,1820,72,60,1654,-1407,-664,1496,-580,-30,60,1328,233,192,1356,2249,-563,60,587,557,27,-1240,2280,-962,60,312,-1543,-790,-1165,1379,60,59,-504,992,-2618,1186,-280,410,52,735,2210,1638,5629,-3018,-535,60,3241,236,2955,2633,-308,-631,51,1401,-60,-450,624,853,-620,50,880,-400,1974,-252,640,-791,41,-306,-573,364,-1222,-330,188,55,-26,684,31,496,-239,-138,56,582,-539,970,-246,-538,-523,56,-1205,1642,-1080,1878,-88,95,57,54,384,-292,-891,-1230,55,56,1125,-1169,-909,-387,230,654,55,-790,406,1034,854,1185,294,56,38,1589,449,-239,-1671,-465,57,-134,703,304,325,541,-602,43,412,1627,1504,697,1437,626,56,-124,-701,-1441,70,-587,598,54,-270,-720,-1462,1731,-719,-1111,55,-996,-745,280,-1003,-3332,1774,55,1872,1967,29,-793,-1376,1713,55,-1640,1679,210,2287,-3051,831,52,376,1089,-1032,-131,-14,432,49,-1907,-1126,973,985,305,565,55,-298,-901,1140,666,-927,-313,53,30,633,752,-1105,349,-289,52,256,-550,798,370,-250,283,50,276,-1746,-282,1138,-396,-47,50,-65,-614,-951,926,-777,55,55,155,122,2230,1041,-122,227,54,123,-3413,-1038,401,972,-216,54,224,-794,-2254,429,1081,448,54,183,385,-983,1066,1315,1694,52,136,-677,398,929,955,1796,56,336,-199,763,36,1359,1454,54,-627,-828,449,-1607,5254,57,58,-457,225,486,-908,495,-249,57,21,680,193,-451,1291,61,107,-1143,882,-1334,-1098,-225,57,90,-161,456,1294,-41,-4,57,-419,683,-234,577,308,317,56,-53,-1066,-778,734,-1274,-180,44,521,-947,363,841,-219,1082,55,-200,697,749,263,154,-503,55,325,-213,29,771,720,522,56,52,-517,-255,-338,-334,176,57,488,-21,-544,390,-679,-553,61,-138,-26,374,483,1198,320,61,45,2165,-814,-529,1403,-26,60,-1379,1776,-733,-720,-716,-133,60,-947,-787,843,155,632,-685,60,-776,-1533,3529,-854,-65,61,-500,-864,1394,1049,-831,256,61,-577,-59,-748,196,-708,648,60,-67,1812,414,-310,-68,-1659,48,-467,2360,-802,1941,2196,1418,60,391,-1372,-1020,1587,-121,60,-240,-122,1152,1720,-913,1770,61,-886,-4162,470,1564,-3595,-1883,60,552,70,-846,2071,-48,1335,60,782,1236,1314,-277,-1577,1120,64,145,-161,-1860,1903,-3766,54,65,-2680,2124,-440,601,141,-217,66,158,508,-95,253,-255,420,66,-507,200,1196,-3123,-407,65,66,-1717,776,276,-1352,-4526,-89,65,-1176,1595,1723,408,-124,66,-1712,359,1035,60,2021,768,67,1,203,-1143,-2789,-8373,120,2861,-1281,-1913,243,64,-1853,2895,-108,-1284,-580,456,67,-766,-1889,-4458,-9089,9575,-183,68,-3589,-4119,-1230,-14612,-7109,4198,152,-8148,740,3490,-2750,-1646,2504,69,55,350,1150,6355,-1632,1268,72,-431,-2681,134,788,1626,-476,65,1162,6065,-528,3,759,-11150,65,1293,-94,-2634,1039,-578,1510,66,-2012,-1352,80,58,18,-117,-1395,-171,-982,-4371,64,64,-2260,188,3544,1009,-500,-1269,65,-1059,-1554,-49,135,-3168,126,66,-3001,1529,-984,4723,561,67,-838,-1271,-4280,-812,1074,-1255,67,1111,-2004,1764,1591,883,-741,66,-281,-2806,1095,-363,360,-949,66,-486,-3152,-2863,-6183,-5414,67,67,-10291,5500,2443,-3237,-274,-2019,70,47,-395,-2330,1559,1241,-481,73,-712,-6036,-1859,-870,5857,-769,73,83,-636,1462,2866,-38,449,72,-636,-1631,-3010,-4250,3221,-971,74,2217,-18,4829,4613,100,58,2483,-2668,2163,5137,6021,-1554,47,1866,-714,958,5097,968,-825,61,4148,2403,2245,4545,-1900,1105,60,823,-1003,-208,-3196,2432,60,-2818,3245,1774,987,-2100,-697,61,-977,-3316,-3094,-1978,2572,188,63,-1766,1743,470,2352,1904,-3094,64,2640,-5168,-3700,2494,-2992,766,63,-393,-3435,-977,-4537,-4514,2915,63,-7157,-1394,-4197,-1022,-4684,-1043,64,3808,5307,-6902,-3413,-2455,1323,64,-1789,956,-1880,-2064,294,524,64,2498,1549,-3247,-21,-2278,2086,64,3036,3626,4148,3223,1612,1644,63,-426,2645,42,-1883,6889,-2324,63,2481,-177,321,7127,6374,-6479,62,1403,4356,-252,2609,-2219,-795,62,1744,3397,2115,1367,-1388,733,62,590,-507,2744,4705,-718,0,-1487,275,-2603,1223,-6,-223,-196,60,-649,860,646,-5114,-3687,-239,61,-1534,-2970,1332,-566,-811,-199,60,60,-617,-1838,-540,-424,-284,54,-785,2282,3405,-2089,1333,60,60,1621,-1942,1229,2036,1826,279,60,-307,113,2505,-135,-362,282,60,999,-899,2041,1487,264,555,60,-1229,-1704,2532,5920,-3059,872,60,-5032,1085,657,879,-4422,1425,59,-599,44,-2226,-414,-2695,1349,61,-50,-4898,-1003,2176,109,868,60,895,-888,-1842,-2504,3002,-116,61,2542,1856,-1261,1636,-844,-557,61,45,-4497,-2095,3324,-1263,-329,61,-1307,619,193,2150,-2278,2230,61,652,-749,-614,1573,464,230,61,1485,1542,-875,-1002,457,382,62,-34,-727,-876,149,-2338,63,62,-871,-78,-176,-1639,-1363,63,62,-1102,-358,766,-1305,671,1104,59,102,-784,374,-1181,890,63,-738,-245,2848,2170,584,611,67,-2618,-555,-897,430,942,142,67,-159,-1134,-46,-330,706,-195,67,852,2188,111,1791,1776,67,67,676,487,258,-719,749,-441,69,565,1353,482,-361,1271,-1723,69,-1776,1300,549,739,821,1819,69,360,-104,37,-902,-378,-611,69,-40,-938,-229,-3030,-1587,151,82,248,911,2837,3384,-86,-229,81,467,1549,863,198,417,566,80,825,941,638,2102,522,782,77,221,-722,-589,-1161,1226,-98,76,203,761,414,-36,-819,202,78,1732,-641,392,-663,104,365,79,-853,-69,2229,1863,-678,307,79,213,958,705,-524,280,268,78,268,854,396,70,1102,79,79,-83,84,207,214,28,458,80,-288,-603,-76,-1087,432,55,80,-807,-1607,-1473,-3949,424,-372,75,-2080,-1919,-1112,172,-331,-168,75,-55,1505,1168,278,-138,723,76,-314,-703,-1122,-466,-12,-125,75,-565,1432,-362,47,1481,92,76,705,495,1102,4096,1189,-257,75,415,29,955,22,198,174,75,-304,2133,889,205,2168,-94,76,873,613,589,409,-131,-45,75,512,279,3526,658,1820,398,76,1639,2417,2085,784,-1026,75,75,-278,831,363,4866,1846,-115,75,1436,714,521,786,131,-99,74,75,153,750,344,-580,491,61,64,203,-221,-508,-1335,290,77,-370,-108,262,1049,1393,998,76,276,-217,4522,-282,535,80,81,1549,-256,-109,1266,1276,196,77,1025,1066,1015,1164,223,-394,77,-635,1162,398,-452,252,-11,80,193,-787,-216,1514,-941,-97,80,71,-117,-875,533,-162,82,79,255,-447,-190,-120,-38,212,80,604,28,958,850,253,-148,76,309,-757,152,-1251,-602,93,85,-436,-163,666,1530,266,564,83,-312,-375,503,316,222,3,83,3,-782,224,458,-404,226,88,288,1528,-497,-1313,1781,577,89,-842,-2370,516,1125,-336,284,94,735,621,-903,-1421,322,117,91,1581,-740,48,220,1923,90,91,753,1253,-1190,-3676,410,-199,90,-182,-62,3597,1514,-526,192,91,45,-165,-278,-722,-172,88,88,186,487,-1227,393,971,6,91,384,-82,353,-254,-1048,-129,90,-971,427,1697,-463,-853,683,90,-568,15,-185,-214,210,88,89,-122,216,-241,-7,-65,16,89,-723,-722,1300,196,647,-129,90,1067,177,423,1401,-121,-50,89,54,146,217,-162,-125,392,90,90,6,108,-535,614,91,88,905,334,451,600,805,88,87,-1211,-1498,-183,240,535,93,88,311,787,543,-496,1427,189,88,796,1871,2773,14,1030,182,87,-88,54,219,-17,620,66,80,-284,368,561,455,495,4,86,51,-153,1759,-101,767,-336,86,814,672,292,832,-15,39,85,388,587,-238,-244,802,45,85,561,995,550,-537,-187,59,85]}});
\ No newline at end of file
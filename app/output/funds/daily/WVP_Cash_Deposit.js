@@ -0,0 +1 @@
+registerFundSeries("WVP Cash Deposit", {"daily":{"start":16408,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000123,95,89,89,89,104,91,132,90,90,90,90,104,123,92,99,87,88,90,90,97,90,90,112,112,90,94,119,86,118,83,82,89,87,87,92,89,100,99,89,88,88,88,113,88,87,86,87,103,91,92,92,92,96,88,107,88,95,89,85,89,91,90,90,90,86,87,90,89,91,90,107,86,86,87,88,86,90,88,117,118,97,-67,100,81,93,78,87,84,159,136,124,119,312,84,85,109,186,82,89,68,85,83,86,83,98,82,76,84,83,91,63,91,-41,-137,85,84,63,351,63,59,98,84,84,76,90,85,-98,94,94,94,84,-8,4,47,51,83,89,32,59,109,80,108,89,85,124,69,122,83,69,69,97,-10,62,48,25,9,69,69,75,85,99,50,43,78,68,151,217,255,364,193,72,72,69,46,80,70,68,68,64,105,74,46,59,50,54,58,57,60,57,62,45,53,52,55,55,63,41,52,51,51,49,51,47,55,48,49,50,65,58,45,46,43,48,48,48,57,52,48,51,49,48,46,50,49,42,48,48,49,45,-31,-68,69,40,60,46,21,73,36,-152,-244,55,55,-56,-73,19,56,32,55,32,35,176,54,82,65,64,231,47,62,72,46,64,56,90,4,81,81,98,56,55,56,74,76,89,255,183,53,53,141,53,54,86,65,52,44,157,112,151,50,74,53,2,134,17,67,54,54,51,50,8,73,43,110,48,49,13,265,-166,56,15,-21,53,53,53,108,94,-217,-10,52,364,67,-10,7,58,52,52,53,-211,375,52,24,-56,54,55,-7,87,49,54,25,52,107,53,-29,-63,-47,101,50,53,83,36,94,51,37,50,50,66,210,29,90,88,53,-67,100,83,53,66,101,52,219,185,-136,235,67,53,49,73,43,74,35,52,52,49,86,65,91,54,-176,4,50,49,-96,124,59,33,49,49,51,41,43,48,28,66,48,-36,42,79,109,99,202,53,53,172,55,64,49,51,53,52,62,45,51,54,66,54,55,49,57,60,58,52,54,55,31,58,55,49,54,53,53,53,54,55,53,61,53,53,52,55,45,56,53,54,54,54,56,59,50,22,57,56,63,13,121,47,44,52,53,60,55,59,57,59,57,57,57,57,53,58,52,56,56,63,47,80,45,52,64,58,10,-2,17,70,55,57,57,45,49,51,44,81,57,58,120,162,67,55,62,61,58,56,71,50,66,57,58,58,58,46,61,70,58,62,58,40,58,58,60,57,58,67,60,57,56,60,52,56,55,57,56,54,57,54,65,56,58,59,79,56,52,54,61,51,27,77,69,51,55,56,56,57,51,60,55,56,56,69,44,54,57,54,55,56,60,53,70,57,62,57,57,19,57,4,-101,-129,56,56,12,50,72,58,88,80,61,70,-107,-90,41,18,64,63,60,50,55,60,55,65,65,60,65,93,56,80,63,64,22,94,63,71,56,63,68,62,69,81,64,63,69,68,72,69,66,71,72,67,68,70,55,88,38,100,69,70,63,81,70,62,72,70,70,73,78,105,85,42,68,68,94,40,57,63,70,68,67,71,72,52,90,67,66,67,67,71,56,71,59,71,62,83,77,60,76,74,67,66,69,66,67,72,63,66,67,66,73,112,219,172,61,67,60,45,-68,-91,54,70,76,30,103,65,57,76,66,66,72,44,47,81,79,66,65,77,54,30,51,59,68,67,76,96,69,72,43,54,66,90,33,94,59,53,64,77,78,70,66,78,55,78,69,95,61,57,86,57,67,68,76,80,26,85,78,68,69,83,114,71,74,69,68,68,77,57,81,62,67,66,67,66,74,70,74,63,68,67,174,346,380,201,111,112,72,93,64,73,74,57,69,68,85,-4,34,-95,-136,66,67,-12,-4,-63,55,77,67,66,59,63,67,136,122,97,78,53,39,37,68,60,60,60,56,61,56,58,63,61,61,68,57,108,91,202,61,61,299,232,113,83,78,56,60,61,59,63,64,62,62,61,80,-36,-42,40,53,74,55,-27,-109,-137,-6,63,63,63,63,56,68,128,123,63,63,193,267,162,-34,112,63,63,75,170,193,82,112,63,63,69,57,67,62,75,64,66,48,61,-27,-150,-43,62,70,72,45,63,158,177,62,65,163,151,78,58,58,59,66,59,58,54,47,29,60,63,62,85,67,79,62,61,61,61,65,59,63,63,65,64,63,63,67,110,70,64,73,16,-17,-69,-100,-26,62,54,24,3,46,46,72,61,60,69,41,35,52,26,60,60,4,17,81,183,176,71,66,-8,-73,58,36,58,55,56,57,58,32,75,59,57,57,62,59,49,58,60,57,66,58,169,146,129,208,55,56,56,154,125,65,61,56,55,61,60,58,52,54,54,51,50,59,34,71,33,53,54,-45,-150,54,-22,-18,54,54,-60,24,-7,21,59,62,66,84,61,70,69,67,56,56,53,64,59,52,29,55,56,84,44,73,44,70,56,57,60,38,62,69,41,54,55,31,75,45,65,35,48,63,73,51,56,36,59,48,67,43,51,56,68,52,54,65,70,73,105,110,92,48,67,109,121,318,254,106,48,76,81,45,30,-113,49,48,60,-236,-141,-81,39,46,47,62,53,54,47,22,56,48,66,67,54,72,63,31,47,48,71,83,62,52,49,48,48,65,44,60,50,55,48,61,43,106,104,79,48,48,74,82,33,17,45,36,48,60,49,132,59,60,164,49,63,152,182,105,84,49,49,71,39,69,59,47,50,49,62,54,61,54,52,53,51,62,53,53,12,10,-15,49,57,18,-42,-32,-92,-16,48,64,66,56,40,62,51,47,59,45,53,41,48,45,47,57,49,54,56,54,50,48,68,50,145,104,1,48,47,48,61,-6,24,47,44,48,59,58,51,52,52,48,48,68,51,60,51,43,58,63,63,43,66,64,56,37,49,60,61,58,54,69,71,49,54,36,51,54,57,39,48,73,56,62,88,47,48,47,67,13,87,63,31,39,37,50,68,45,16,64,24,43,67,49,71,38,25,45,44,66,33,50,51,50,46,44,63,48,50,47,51,57,50,77,51,50,55,60,14,42,53,75,52,47,52,15,43,60,48,76,54,54,29,45,59,44,68,43,64,45,47,59,51,70,45,55,44,45,58,29,46,37,78,30,44,62,65,52,17,48,77,46,64,42,62,46,60,48,48,58,46,55,48,47,64,50,74,52,51,53,51,50,52,54,49,50,19,70,59,48,57,52,52,52,52,48,49,58,52,53,51,59,50,54,62,52,44,61,53,49,51,55,48,59,45,53,50,49,56,20,54,65,73,58,56,62,45,53,59,53,51,51,56,52,53,45,67,51,50,56,52,53,51,61,49,50,49,53,53,28,53,54,51,56,75,54,48,50,49,51,54,60,51,47,56,52,50,57,30,62,69,53,50,50,56,50,44,52,51,48,49,55,51,45,51,53,46,49,54,33,76,52,56,61,49,48,46,58,53,42,49,45,45,67,55,44,59,46,44,61,47,52,105,31,11,44,56,65,29,63,95,110,43,67,53,155,155,123,88,49,67,62,50,61,39,45,45,59,51,-6,-29,30,24,44,58,40,-31,-48,-24,3,44,52,50,71,52,44,54,44,62,39,59,48,53,45,45,60,44,10,87,53,32,45,61,42,73,46,47,42,45,61,62,43,57,236,127,45,79,0,-69,-22,20,46,44,59,50,51,49,44,45,44,60,52,21,80,20,79,45,62,36,45,50,56,45,45,45,71,52,58,46,45,45,60,57,50,50,35,41,45,51,48,42,19,74,77,45,63,51,31,51,60,43,43,62,49,47,48,41,46,44,56,42,53,53,40,51,44,54,41,45,17,65,36,36,58,49,35,42,66,42,44,57,52,98,139,181,27,44,66,40,-8,-55,-39,51,44,50,41,23,47,62,34,43,55,48,45,45,62,19,42,52,69,37,31,50,41,41,26,42,60,73,52,44,48,47,39,42,17,60,28,37,44,39,32,69,28,57,37,51,41,9,55,20,42,30,45,45,30,41,14,41,34,58,46,46,35,-16,58,29,29,47,62,23,49,30,30,39,34,2,25,10,76,30,47,34,36,28,44,58,49,54,39,45,36,35,30,30,40,33,31,39,28,21,21,31,8,29,21,40,34,24,39,29,17,32,25,32,23,37,22,69,96,-21,85,24,38,-21,0,18,36,21,23,24,42,15,43,21,20,24,34,25,30,32,50,82,24,44,32,37,50,129,84,31,62,33,-31,-21,37,1,24,24,39,34,14,23,25,25,35,16,28,2,-30,-4,29,35,33,25,50,38,47,29,33,0,85,52,30,30,27,26,27,44,32,31,59,27,43,5,22,30,20,49,27,44,24,130,156,283,120,26,63,26,42,90,131,64,33,66,64,44,28,-69,-55,27,18,2,33,0,-47,-179,32,26,-30,-49,-51,-61,29,35,43,57,229,393,433,154,38,95,70,30,36,40,36,38,48,34,40,37,47,65,37,49,21,26,36,35,31,32,46,47,28,37,33,31,30,6,34,52,35,35,30,31,41,38,34,28,33,28,29,34,32,34,33,29,29,28,28,53,35,34,36,27,29,46,40,33,39,35,35,35,54,30,-21,13,-47,4,34,40,105,65,106,84,36,28,38,38,33,28,27,26,26,27,45,-22,35,46,17,30,49,32,25,38,18,22,22,35,31,30,19,13,23,22,33,51,0,28,25,22,22,34,25,26,28,29,24,23,42,29,40,28,30,23,24,31,28,28,28,28,30,24,27,21,25,33,30,31,25,39,35,19,28,30,23,24,34,32,36,28,37,31,32,32,37,41,35,17,24,24,33,35,-1528,10,28,28,26,40,31,36,32,34,21,21,36,31,31,31,30,28,29,41,33,43,25,32,27,27,40,35,39,33,36,30,31,32,38,35,39,38,34,33,44,32,41,41,46,25,34,43,32,43,40,36,34,33,44,40,37,35,38,34,33,34,33,34,33,40,34,34,42,37,36,36,40,36,35,46,31,42,32,36,35,35,43,38,38,36,35,35,34,44,41,37,38,25,35,34,42,38,38,37,38,35,34,47,36,38,37,47,25,33,45,15,-99,31,35,27,27,45,33,41,39,27,29,31,42,38,37,34,38,31,32,44,41,34,35,38,32,32,44,30,46,30,-643,32,31,-10,-188,-162,31,9,0,31,37,80,16,141,397,88,25,75,106,39,58,32,25,25,37,182,168,65,23,30,29,50,30,31,30,28,28,25,35,31,35,36,24,25,26,34,29,32,27,22,27,23,63,0,28,32,29,26,28,47,15,29,30,26,25,25,37,31,81,20,25,21,22,33,26,27,29,29,16,20,31,24,24,22,27,15,20,37,38,-262,-470,-125,48,19,33,134,170,142,16,35,22,33,3,29,48,-62,86,33,33,32,27,-2,30,-5,28,37,92,-22,50,78,29,29,28,56,-18,31,34,40,31,42,-5,-2,-285,7,-96,30,30,-119,-49,-19,25,27,30,30,45,86,204,170,269,30,65,263,264,155,126,72,29,46,36,22,84,79,48,32,43,27,33,22,17,27,27,41,37,31,29,34,22,29,39,48,26,35,30,28,30,39,34,15,-278,-279,-68,29,-22,-7,-16,-45,-155,-87,28,20,-100,-101,27,50,7,27,36,14,-12,-29,73,61,27,28,46,100,86,34,29,38,48,42,22,51,27,35,31,36,60,16,19,29,34,22,39,33,28,15,24,35,39,61,0,22,31,24,37,89,163,49,192,120,25,56,115,41,26,162,171,26,66,177,93,79,35,25,25,39,44,21,29,-7,-24,26,36,19,51,71,30,42,23,24,39,28,24,27,24,24,36,28,30,27,26,23,23,35,27,26,30,26,-77,26,28,141,36,35,15,24,23,33,45,5,24,28,23,25,34,19,31,27,30,36,30,41,27,34,34,34,31,31,44,35,35,35,36,31,32,42,45,24,75,0,34,34,34,43,29,36,37,36,35,44,-7,-70,-259,25,-16,35,39,124,47,-36,125,164,34,63,142,155,56,34,35,34,61,32,38,40,40,35,35,46,75,43,34,40,35,44,41,38,41,39,36,36,44,211,38,39,38,35,35,49,36,36,51,37,39,33,40,24,34,36,35,33,32,40,38,37,37,40,36,37,44,40,274594,-274516,39,35,36,45,39,34,37,40,41,36,45,14,38,39,40,35,36,26,37,53,32,41,38,38,54,44,42,45,45,41,42,55,42,42,76,39,40,115,29,26,-265,-94,-198,37,16,81,-245,-31,-4,38,38,38,45,48,12,37,25,37,37,50,197,223,399,181,38,93,86,44,43,42,39,38,38,42,43,43,47,41,39,51,40,88,4,51,40,39,50,44,43,45,44,40,40,51,44,44,44,52,44,44,55,26,43,44,46,40,40,56,46,91,0,516,40,40,54,46,750,-289,-7,92,39,50,45,-152,-6,-122,-14,38,13,-267,-182,8,-23,53,38,43,47,37,46,52,37,39,52,43,42,43,43,41,42,52,38,49,40,46,38,38,53,45,34,52,34,50,40,291,-210,43,44,42,36,36,51,42,41,40,44,37,38,51,43,33,57,37,29,38,46,57,3,38,51,43,42,56,47,36,45,46,0,83,55,47,46,46,46,42,41,55,47,47,46,51,37,42,53,38,60,57,38,41,42,52,36,44,39,46,45,44,56,51,47,49,48,224,44,44,82,307,337,371,45,47,94,51,54,49,54,43,46,59,52,59,44,48,46,46,46,53,52,55,62,51,50,67,46,58,46,60,46,49,62,54,54,63,59,34,49,61,59,54,-49,48,128,49,71,62,-24,-2,118,-77,50,57,-25,31,-91,-183,-127,55,17,-35,-11,74,62,52,54,54,73,63,55,60,54,55,73,89,159,329,409,411,55,146,66,60,53,65,56,55,69,63,60,59,60,62,63,72,62,80,48,61,56,56,73,62,66,61,61,57,56,71,38,69,65,75,54,59,75,63,67,66,63,60,59,75,66,66,64,64,62,59,77,66,33,17,49,44,60,60,79,92,88,51,108,59,80,51,86,90,55,60,61,77,68,67,67,67,68,61,79,60,66,66,66,52,59,79,77,51,-75,-161,61,62,61,45,198,-225,-203,62,61,14,105,-37,-111,6,59,60,60,77,129,122,104,-8,62,80,-8,112,0,-5,57,70,64,62,103,42,112,71,72,94,81,72,87,80,72,73,91,79,79,66,86,72,73,99,77,84,64,82,83,72,92,60,76,64,94,71,72,91,92,253,479,257,275,74,134,279,67,-171,-451,74,-10,-141,44,67,82,79,73,92,80,78,65,95,56,73,91,77,160,75,76,72,90,80,14,123,74,58,58,74,19,113,75,74,68,67,85,74,74,56,77,89,70,-84,74,79,80,49,84,62,86,62,75,156,0,67,62,63,88,87,45,94,79,71,87,151,258,193,88,69,68,107,96,82,26,17,34,70,77,24,16,48,58,89,70,86,36,18,80,87,54,70,86,89,77,75,76,79,70,87,87,69,70,75,70,70,87,75,82,76,76,58,66,66,88,75,74,74,77,72,86,93,26,73,95,54,72,223,78,67,83,59,83,73,87,66,76,39,96,74,73,97,72,87,80,80,74,73,89,73,76,61,107,64,75,91,91,74,78,72,75,75,95,91,18,124,84,74,74,86,80,83,85,49,104,74,89,80,80,67,82,85,74,75,97,89,118,95,75,75,75,96,78,149,272,287,75,124,97,259,253,158,75,75,113,109,80,81,75,74,75,86,80,70,220,82,74,76,75,77,81,89,65,74,73,86,69,81,82,84,83,82,89,87,81,81,83,77,78,89,82,83,77,77,87,76,88,80,43,-128,-67,89,78,81,-76,58,-220,-66,10,76,72,49,77,71,104,55,76,86,80,89,117,111,1,75,75,87,80,79,64,90,75,85,77,80,83,65,67,76,85,77,66,89,96,76,75,88,81,75,83,76,68,77,86,62,77,83,103,76,76,76,95,75,84,81,76,76,87,81,69,92,78,64,76,85,83,139,81,65,74,75,86,147,189,125,126,122,74,90,67,78,47,158,63,74,88,89,66,61,48,74,74,79,52,-1,47,71,74,74,84,68,40,71,123,74,74,86,78,42,71,67,74,73,81,74,14,-4,-21,114,75,82,79,42,116,61,84,74,85,87,57,59,80,112,74,87,34,49,49,171,73,73,93,79,1,149,82,73,73,85,78,60,77,77,73,61,86,78,43,41,145,73,73,94,80,48,79,33,51,73,82,180,84,68,90,64,73,74,92,95,53,76,74,73,87,80,79,87,66,81,74,89,80,60,85,72,81,75,89,87,93,88,79,39,75],"returnScale":1000000,"returns":[0,95,89,89,89,104,91,132,90,90,90,90,104,123,92,99,87,88,90,90,97,90,90,112,112,90,94,119,86,118,83,82,89,87,87,92,89,100,99,89,88,88,88,112,88,87,86,87,103,91,92,92,92,96,88,107,88,95,89,85,89,91,90,90,90,86,87,90,89,91,90,107,86,86,87,88,86,90,88,117,118,97,-67,100,81,93,78,87,84,159,136,124,119,312,84,85,109,186,82,89,68,85,83,86,83,98,82,76,84,83,91,63,91,-41,-137,85,84,63,351,63,59,98,84,84,76,90,85,-98,94,94,94,84,-8,4,47,51,83,89,31,59,109,80,108,89,85,124,69,122,83,69,69,97,-10,62,48,25,9,69,69,75,85,99,50,43,78,68,151,217,255,364,193,72,72,69,46,80,70,68,68,64,105,74,46,59,50,54,58,57,60,57,62,45,53,52,55,55,63,41,52,51,51,49,51,47,55,48,49,50,65,58,45,46,43,48,48,48,57,52,48,51,49,48,46,50,49,42,48,48,49,45,-31,-68,69,40,60,46,21,73,36,-152,-244,55,55,-56,-73,19,56,32,55,32,35,176,54,82,65,64,231,47,62,72,46,64,56,90,4,81,81,98,56,55,56,74,75,89,255,183,53,53,141,53,54,86,65,52,44,157,112,151,50,74,53,2,134,17,67,54,54,51,50,8,73,43,110,48,49,13,265,-166,56,15,-21,53,53,53,108,94,-217,-10,52,364,67,-10,7,58,52,52,53,-211,375,52,24,-56,54,55,-7,87,49,54,25,52,107,53,-29,-63,-47,101,50,53,83,36,94,51,37,50,50,66,210,29,90,88,53,-67,100,83,53,66,101,52,219,185,-136,235,67,53,49,73,43,74,35,52,52,49,86,65,91,54,-176,4,50,49,-96,124,59,33,49,49,51,41,43,48,28,66,48,-36,42,79,109,99,202,53,53,171,55,64,49,51,53,52,62,45,51,54,66,54,55,49,57,60,58,52,54,55,31,58,55,49,54,53,53,53,54,55,53,61,53,53,52,55,45,56,53,54,54,54,56,59,50,22,57,56,63,13,121,47,44,52,53,60,55,59,57,59,57,57,57,57,53,58,52,56,56,63,47,80,45,52,64,58,10,-2,17,70,55,57,57,45,49,51,44,81,57,58,120,162,67,55,62,61,58,56,71,50,66,57,58,58,58,46,61,70,58,62,58,40,58,58,60,57,58,67,60,57,56,60,52,56,55,57,56,54,57,54,65,56,58,59,79,56,52,54,61,51,27,77,69,50,55,56,56,57,51,60,55,56,56,69,44,54,57,54,55,56,60,53,70,57,62,57,57,19,57,4,-101,-129,56,56,12,50,72,58,88,80,61,70,-107,-90,41,18,64,63,60,50,55,60,55,65,65,60,65,93,56,80,63,64,22,94,63,71,56,63,68,62,69,81,64,63,69,68,72,69,66,71,72,67,68,70,55,88,38,100,69,70,63,81,70,62,72,70,70,73,78,105,85,42,68,68,94,40,57,63,70,68,67,71,72,52,90,67,66,67,67,71,56,71,59,71,62,83,77,60,76,74,67,66,69,66,67,72,63,66,67,66,73,111,219,172,61,67,60,45,-68,-91,54,70,76,30,103,65,57,76,66,66,72,44,47,81,79,66,65,77,54,30,51,59,68,67,76,96,69,72,43,54,66,90,33,94,59,53,64,77,78,70,66,78,55,78,69,95,61,57,86,57,67,68,76,80,26,85,78,68,69,83,114,71,74,69,68,68,77,57,81,62,67,66,67,66,74,70,74,63,68,67,174,346,380,201,111,112,72,93,64,73,74,57,69,68,85,-4,34,-95,-136,66,67,-12,-4,-63,55,77,67,66,59,62,67,136,122,97,78,53,39,37,68,60,60,60,56,61,56,58,63,61,61,68,57,108,91,202,61,61,299,232,113,83,78,56,60,61,59,63,64,62,62,61,80,-36,-42,40,53,74,55,-27,-109,-137,-6,63,63,63,63,56,68,128,123,63,63,193,267,162,-34,112,63,63,75,170,193,82,112,63,63,69,57,67,62,75,64,66,48,61,-27,-150,-43,62,70,72,45,63,158,177,62,65,163,151,78,58,58,59,66,59,58,54,47,29,60,63,62,85,67,79,62,60,61,61,65,59,63,63,65,64,63,63,67,110,70,64,73,16,-17,-69,-100,-26,62,54,24,3,46,46,72,61,60,69,41,35,52,26,60,60,4,17,81,183,176,71,66,-8,-73,58,36,58,55,56,57,58,32,75,59,57,57,62,59,49,58,60,57,66,58,169,146,129,208,55,56,56,154,125,65,61,56,55,61,60,58,52,54,54,51,50,59,34,71,33,53,54,-45,-150,54,-22,-18,54,54,-60,24,-7,21,59,62,66,84,61,70,69,67,56,56,53,64,59,52,29,55,56,84,44,73,44,70,56,57,60,38,62,69,41,54,55,31,75,45,65,35,48,63,73,51,56,36,59,48,67,43,51,56,68,52,53,65,70,73,105,110,92,48,67,109,121,318,254,106,48,76,81,45,30,-113,49,48,60,-236,-141,-81,39,46,47,62,53,54,47,22,56,48,66,67,54,72,63,31,47,48,71,83,62,52,49,48,48,65,44,60,50,55,48,61,43,106,104,79,48,48,74,82,33,17,45,36,48,60,49,132,59,60,164,49,63,152,182,105,84,49,49,71,39,69,59,47,50,49,62,54,61,54,52,53,51,62,53,53,12,10,-15,49,57,18,-42,-32,-92,-16,48,64,66,56,40,62,51,47,59,45,53,41,48,45,47,57,49,54,56,54,50,48,68,50,145,104,1,48,47,48,61,-6,24,47,44,48,59,58,51,52,51,48,48,68,51,60,51,43,58,63,63,43,66,64,56,37,49,60,61,58,54,69,71,49,54,36,51,54,57,39,48,73,56,62,88,47,48,47,67,13,87,63,31,39,37,50,68,45,16,64,24,43,67,49,71,38,25,45,44,66,33,50,51,50,46,44,63,48,50,47,51,57,50,77,51,50,55,60,14,42,53,75,52,47,52,15,43,60,48,76,54,54,29,45,59,44,68,43,64,45,47,59,51,70,45,55,44,45,58,29,46,37,78,30,44,62,65,52,17,48,77,46,64,42,62,46,60,48,48,58,46,55,48,47,64,50,74,52,51,53,51,50,52,54,49,50,19,70,59,48,57,52,52,52,52,48,49,57,52,53,51,59,50,54,62,52,44,61,53,49,51,55,48,59,45,53,50,49,56,20,54,65,73,58,56,62,45,53,59,53,51,51,56,52,53,45,67,51,50,56,52,53,51,61,49,50,49,53,53,28,53,54,51,56,75,54,48,50,49,51,54,60,51,47,56,52,50,57,30,62,69,53,50,50,56,50,44,52,51,48,49,55,51,45,51,53,46,49,54,33,76,52,56,61,49,48,46,58,53,42,49,45,45,67,55,44,59,46,44,61,47,52,105,31,11,44,56,65,29,63,95,110,43,67,53,155,155,123,88,49,67,62,50,61,39,45,45,59,51,-6,-29,30,24,44,58,40,-31,-48,-24,3,44,52,50,71,51,44,54,44,62,39,59,48,53,45,45,60,44,10,87,53,32,45,61,42,73,46,47,42,45,61,62,43,57,236,127,45,79,0,-69,-22,20,46,44,59,50,51,49,44,45,44,60,52,21,80,20,79,45,62,36,45,50,56,45,45,45,71,52,58,46,45,45,60,57,50,50,35,41,45,51,48,42,19,74,77,45,63,51,31,51,60,43,43,62,49,47,48,41,46,44,56,42,53,53,40,51,44,54,41,45,17,65,36,36,58,49,35,42,66,42,44,57,52,98,139,181,27,44,66,40,-8,-55,-39,51,44,50,41,23,47,62,34,43,55,48,45,45,62,19,42,52,69,37,31,50,41,41,26,42,60,73,52,44,48,47,39,42,17,60,28,37,44,39,32,69,28,56,37,51,41,9,55,20,42,30,45,45,30,41,14,41,34,58,46,46,35,-16,58,29,29,47,62,23,49,30,30,39,34,2,25,10,76,30,47,34,36,28,44,58,49,54,39,45,36,35,30,30,40,33,31,39,28,21,21,31,8,29,21,40,34,24,39,29,17,32,25,32,23,37,22,69,96,-21,85,24,38,-21,0,18,36,21,23,24,42,15,43,21,20,24,34,25,30,32,50,82,24,44,32,37,50,129,84,31,62,33,-31,-21,37,1,24,24,39,34,14,23,25,25,35,16,28,2,-30,-4,29,35,33,25,50,38,47,29,33,0,85,52,30,30,27,26,27,44,32,31,59,27,43,5,22,30,20,49,27,44,24,130,156,283,120,26,63,26,42,90,131,64,33,66,64,44,28,-69,-55,27,18,2,33,0,-47,-179,32,26,-30,-49,-51,-61,29,35,43,57,229,393,433,154,38,95,70,30,36,40,36,38,48,34,40,37,47,64,37,49,21,26,36,35,31,32,46,47,28,37,33,31,30,6,34,52,35,35,30,31,41,38,34,28,33,28,29,34,32,34,33,29,29,28,28,53,35,34,36,27,29,46,40,33,39,35,35,35,54,30,-21,13,-47,4,34,40,105,65,106,84,36,28,38,38,33,28,27,26,26,27,45,-22,35,46,17,30,49,32,25,38,18,22,22,35,31,30,19,13,23,22,33,51,0,28,25,22,22,34,25,26,28,29,24,23,42,29,40,28,30,23,24,31,28,28,28,28,30,24,27,21,25,33,30,31,25,39,35,19,28,30,23,24,34,32,36,28,37,31,32,32,37,41,35,17,24,24,33,35,-1528,10,28,28,26,40,31,36,32,34,21,21,36,31,31,31,30,28,29,41,33,43,25,32,27,27,40,35,39,33,36,30,31,32,38,35,39,38,34,33,44,32,41,41,46,25,34,43,32,43,40,36,34,33,44,40,37,35,38,34,33,34,33,34,33,40,34,34,42,37,36,36,40,36,35,46,31,42,32,36,35,35,43,38,38,36,35,35,34,44,41,37,38,25,35,34,42,38,38,37,38,35,34,47,36,38,37,47,25,33,45,15,-99,31,35,27,27,45,33,41,39,27,29,31,42,38,37,34,38,31,32,44,41,34,35,38,32,32,44,30,46,30,-643,32,31,-10,-188,-162,31,9,0,31,37,80,16,141,397,88,25,75,106,39,57,32,25,25,37,182,168,65,23,30,29,50,30,31,30,28,28,25,35,31,35,36,24,25,26,34,29,32,27,22,27,23,63,0,28,32,29,26,28,47,15,29,30,26,25,25,37,31,81,20,25,21,22,33,26,27,29,29,16,20,31,24,24,22,27,15,20,37,38,-262,-470,-125,48,19,33,134,170,142,16,35,22,33,3,29,48,-62,86,33,33,32,27,-2,30,-5,28,37,92,-22,50,78,29,29,28,56,-18,31,34,40,31,42,-5,-2,-285,7,-96,30,30,-119,-49,-19,25,27,30,30,45,86,204,170,269,30,65,263,264,155,126,72,29,46,36,22,84,79,48,32,43,27,33,22,17,27,27,41,37,31,29,34,22,29,39,48,26,35,30,28,30,39,34,15,-278,-279,-68,29,-22,-7,-16,-45,-155,-87,28,20,-100,-101,27,50,7,27,36,14,-12,-29,73,61,27,28,46,100,86,34,29,38,48,42,22,51,27,35,31,36,60,16,19,29,34,22,39,33,28,15,24,35,39,61,0,22,31,24,37,89,163,49,192,120,25,56,115,41,26,162,171,26,66,177,93,79,35,25,25,39,44,21,29,-7,-24,26,36,19,51,71,30,42,23,24,39,28,24,26,24,24,36,28,30,27,26,23,23,35,27,26,30,26,-77,26,28,141,36,35,15,24,23,33,45,5,24,28,23,25,34,19,31,27,30,36,30,41,27,34,34,34,31,31,44,35,35,35,36,31,32,42,45,24,75,0,34,34,34,43,29,36,37,36,35,44,-7,-70,-259,25,-16,35,39,124,47,-36,125,164,34,63,142,155,56,34,35,34,61,32,38,40,40,35,35,46,75,43,34,40,35,44,41,38,41,39,36,36,44,211,38,39,38,35,35,49,36,36,51,37,39,33,40,24,34,36,35,33,32,40,38,37,37,40,36,37,44,40,274560,-274482,39,35,36,45,39,34,37,40,41,36,45,14,38,39,40,35,36,26,37,53,32,41,38,38,54,44,42,45,45,41,42,55,42,42,76,39,40,115,29,26,-265,-94,-198,37,16,81,-245,-31,-4,38,38,38,45,48,12,37,25,37,37,50,197,223,399,181,38,93,86,44,43,42,39,38,38,42,43,43,47,41,39,50,40,88,4,51,40,39,50,44,43,45,44,40,40,51,44,44,44,52,44,44,55,26,43,44,46,40,40,56,46,91,0,516,40,40,54,46,750,-289,-7,92,39,50,45,-152,-6,-122,-14,38,13,-267,-182,8,-23,53,38,43,47,37,46,52,37,39,52,43,42,43,43,41,42,52,38,49,40,46,38,38,53,45,34,52,34,50,40,291,-210,43,44,42,36,36,51,42,41,40,44,37,38,51,43,33,57,37,29,38,46,57,3,38,51,43,42,56,47,36,45,46,0,83,55,47,46,46,46,42,41,55,47,47,46,51,37,42,53,38,60,57,38,41,42,52,36,44,39,46,45,44,56,51,47,49,48,224,44,44,82,307,337,371,45,47,94,51,54,49,53,43,46,59,52,59,44,48,46,46,46,53,52,55,62,51,50,67,46,58,46,60,46,49,62,54,54,63,59,34,49,61,59,54,-49,48,128,49,71,62,-24,-2,118,-77,50,57,-25,31,-91,-183,-127,55,17,-35,-11,74,62,52,54,54,73,63,55,60,54,55,73,89,159,329,409,411,55,146,66,60,53,65,56,55,69,63,60,59,60,62,63,72,62,80,48,61,56,56,73,62,66,61,61,57,56,71,38,69,65,75,54,59,75,63,67,66,63,60,59,75,66,66,64,64,62,59,77,66,33,17,49,44,60,60,79,92,88,51,108,59,80,50,86,90,55,60,61,77,68,67,67,67,68,61,79,60,66,66,66,52,59,79,77,51,-75,-161,61,62,61,45,198,-225,-203,62,61,14,105,-37,-111,6,59,60,60,77,129,122,104,-8,62,80,-8,112,0,-5,57,70,64,62,103,42,112,71,72,94,81,72,87,80,72,73,91,79,79,66,86,72,73,99,77,84,64,82,83,72,92,60,76,64,94,71,72,91,92,253,479,257,275,74,134,279,67,-171,-451,74,-10,-141,44,67,82,79,73,92,80,78,65,95,56,73,91,77,160,75,76,72,90,80,14,123,73,58,58,74,19,113,75,74,68,67,85,74,74,56,77,89,70,-84,74,79,80,49,84,62,86,62,75,156,0,67,62,63,88,87,45,94,79,71,87,151,258,193,88,69,68,107,96,82,26,17,34,70,77,24,16,48,58,89,70,86,36,18,80,87,54,70,86,89,77,75,76,79,70,87,87,69,70,75,70,70,87,75,82,76,76,58,66,66,88,75,74,74,77,72,86,93,26,73,95,54,72,223,78,67,83,59,83,73,87,65,76,39,96,74,73,97,72,87,80,80,74,73,89,73,76,61,107,64,75,91,91,74,78,72,75,75,95,91,18,124,84,74,74,86,80,83,85,49,104,74,89,80,80,67,82,85,74,75,97,89,118,95,75,75,75,96,78,149,272,287,75,124,97,259,253,158,75,75,113,109,80,81,75,74,75,86,80,70,220,82,74,76,75,77,81,89,65,73,73,86,69,81,82,84,83,82,89,87,81,81,83,77,78,89,82,83,77,77,87,76,88,80,43,-128,-67,89,78,81,-76,58,-220,-66,10,76,72,49,77,71,104,55,76,86,80,89,117,111,1,75,75,87,80,79,64,90,75,85,77,80,83,65,67,76,85,77,66,89,96,76,75,88,81,75,83,76,68,77,86,62,77,83,103,76,76,76,95,75,84,81,76,76,87,81,69,92,78,64,76,85,83,139,81,65,74,75,86,147,189,125,126,121,74,90,67,78,47,158,63,74,88,89,66,61,48,74,74,79,52,-1,47,71,74,74,84,68,40,71,123,74,74,86,78,42,71,67,74,73,81,74,14,-4,-21,114,75,82,79,42,116,61,84,74,85,87,57,59,80,112,74,87,34,49,49,171,73,73,93,79,1,149,82,73,73,85,78,60,77,77,73,61,86,78,43,41,145,73,73,94,80,48,79,33,51,73,82,180,84,68,90,64,73,74,92,95,53,76,74,73,87,80,79,86,66,81,74,89,80,60,85,72,81,75,89,87,93,88,79,39,75]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("WVP Dividend Akcii", {"daily":{"start":18647,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000952,-1323,-8509,-154,-64,1027,2888,-16127,5925,-16717,-2802,-63,10722,14163,2562,12258,2365,468,-71,6555,-836,-3033,3947,842,1958,-71,4230,-1250,-1320,152,-8466,-3206,-71,-2290,2670,6770,-16543,-13029,6131,-68,18678,299,-6585,-7364,12375,5517,-70,6039,17126,2961,2807,-3086,1643,-71,7581,3661,12,-4811,-116,1416,-72,12127,-11248,-3518,7477,19802,866,-72,2384,-3972,1706,5159,-2513,-1268,-73,11652,-1319,1553,2283,3781,-1394,-74,-1820,-560,-2343,3191,6141,-846,-74,-4185,-10664,4638,-4428,585,-1146,-73,-669,-2183,-1654,8524,-7494,-72,-72,7874,-7021,9769,13082,1393,-97,-73,-3875,-18661,-15023,14479,12036,-1001,-73,-438,-6375,-9760,10448,131,1277,-73,7575,-2740,-6408,2040,4911,3786,-73,-2536,-3780,3696,2486,8280,4090,-74,12954,-4381,1100,4724,1385,3402,-75,3712,-1270,-4429,546,-3365,-74,-74,5354,7649,-5194,-231,4722,-969,-75,1459,1619,1663,5704,4894,4410,-75,871,-6458,5971,-10625,10082,-1839,-76,2132,317,2693,-2917,-5307,-122,-75,-17803,10099,9022,-759,11223,217,-76,808,-4743,52,4090,-8044,-1053,-76,-2787,7126,-720,10176,2845,-77,759,3658,5369,781,1737,-1860,-77,770,-5607,-8124,3700,1674,-76,6568,726,-1253,-3182,68,253,-78,6392,-4470,-534,2516,-3575,-1901,-77,2894,-4340,-2777,-10726,-3629,190,-76,2671,-510,-1233,-595,-2665,-1371,-76,-19008,5829,2824,10524,2753,-17128,-5090,10593,-1046,-75,-10387,7977,3279,19048,-685,-769,-76,1117,-3870,5040,13139,3141,-690,-77,1140,5251,-4024,5003,-5157,679,-77,2053,-121,-9125,7426,4831,-4288,-77,3625,7489,5667,6259,4717,3774,-78,-1558,-4171,-5214,1098,15642,821,-78,307,5045,2151,-1968,-7409,6393,-79,-3827,-2072,3054,4007,-30556,-3309,-76,8504,-15358,-7020,9642,-4378,3464,-76,18883,19463,4748,-4062,2745,2949,-79,-5854,-6504,11370,2350,-12949,1076,-78,-19312,22147,8489,7094,-1519,-803,-78,11027,1365,-120,1791,-6100,1175,-79,6890,211,-5679,-3143,68,-78,-79,8686,2734,-11881,-3826,1699,-78,-120,-16615,-9244,-14032,-516,-76,-3735,-4229,4123,1286,27649,1678,-77,14454,5042,4917,-36116,3467,-15159,-76,-1129,8518,22207,-16934,-18591,1731,-76,-9148,20756,-293,-15093,-9008,1264,-76,-4410,-11490,-11858,-2455,40417,-5120,-75,-5023,-10661,17718,488,-16067,12651,-75,-25133,21038,-34857,6803,-74,-4871,16739,24235,12830,8370,3486,-77,-2021,14349,-11327,13388,4022,-2025,-78,2703,21217,-33832,9476,3865,-78,12250,-7151,-5467,6449,2966,4542,-80,-12840,-11557,13378,-8214,-4153,3789,-78,-2462,10800,-2741,-16205,-29847,-75,-76,1311,-19263,17668,34116,-15474,-4215,-77,3859,3606,17610,-30796,-14110,-510,-76,-31157,4989,-9057,38469,1665,-76,-4135,16019,-41528,-13646,7804,-4369,-73,17084,-17010,11852,20877,12396,-1815,-76,3762,-9622,-3420,16115,-9280,-3445,-76,4718,7999,-1963,-33753,-29594,-72,-72,-38903,17578,5606,-28935,8565,-7223,-70,394,15811,-8272,10056,34832,-2083,-73,-2148,-20443,-636,-6453,13660,-2923,-72,2883,-3345,15377,26521,165,1073,-75,-13106,-540,149,-10692,20347,-4579,-74,-2596,22236,-1990,9352,-11440,2061,-76,802,-13423,30906,9667,8731,-5879,-77,1557,-10650,15412,2559,-3950,-4522,-77,3301,-9077,19139,-3061,8925,3859,-79,4367,10041,-5697,-220,-15479,10085,-79,-19606,1165,10353,16729,-36289,-3781,-77,-10385,-6862,-12288,-2121,-5056,48,-74,-2712,4107,8659,11648,18461,-12958,-76,12333,-48116,-2911,6538,-6866,3163,-74,4669,-13947,-10140,-2064,-19183,6877,19398,-9802,-26181,-3431,-70,22609,32382,-14186,-9831,-19537,5117,-71,-7860,1395,-3792,17822,-17682,1031,-70,21080,5116,-16773,2101,12450,6395,-72,10409,16686,-14304,-24820,16534,6956,-73,-5615,5285,-20756,-2904,31277,-9398,-73,10338,-3970,-14856,47178,18079,-26440,-75,-8429,9662,-16871,-2341,12136,-3963,-74,-3470,24142,3681,-343,-7763,2231,-76,-12328,-6415,38148,-1090,-5267,-5599,-77,-11176,-17747,665,7769,-3662,-993,-75,7551,11185,-2787,-34032,-6143,-979,-73,-10697,2251,17025,-16147,362,-316,-73,419,-2497,-9462,13272,-6451,-435,-72,3287,5686,22827,-12999,19738,-74,-74,-812,-2112,8693,4594,5452,-884,-76,843,1187,-11745,-10239,19671,-42,-76,12953,-1114,-1052,7891,1352,2173,-77,-12489,5992,18492,11936,-14798,3982,-78,-8025,19861,-4906,-4768,-7094,6510,-77,14622,811,-3642,-8205,-3529,5438,-77,325,-19222,-3290,6573,-14308,3100,-76,3233,468,-5674,2639,23681,-324,-77,3171,-12933,-1905,-2259,-17433,-2403,-76,-6820,8132,-13353,31982,-13549,-2346,-76,4460,5024,-13752,5769,-7826,11741,-75,-1004,-1162,10870,8799,11108,569,-78,2323,-1524,-8077,5505,2328,1106,-78,726,5361,-5752,13313,-3238,-78,-79,-871,3265,622,-1383,-1391,-78,-79,-1298,-40282,-6482,18627,9287,3492,-77,686,-13899,-8053,-16226,15329,4455,-76,3684,-6097,8485,2783,1681,2415,-77,6306,-4059,9782,15684,-48,81,-79,1980,-14177,-6839,7988,22702,-1760,-87,3006,-1784,-16869,16642,15737,-82,-81,-3145,10405,-9358,3726,28,-3360,-81,11206,8881,3646,9752,-920,-12898,-82,-3254,-570,-7530,7629,-17125,8974,-81,-5464,8330,-1987,2240,10756,3942,-82,4206,-4864,-3364,-14048,-4523,1109,-81,2963,2654,10095,12226,-13025,-3511,-82,2414,4447,1531,-5896,1576,4829,-85,1346,10255,-1855,7316,19559,-7457,-17299,-2475,1667,-1202,-85,11292,-3151,-3659,6132,-14361,816,-85,3474,-5563,-11655,-6707,41,2880,-84,8180,-4013,15349,-6603,172,2562,-85,11386,15104,3405,-7567,6511,2555,-87,1948,2213,-4524,-3249,3111,-87,-87,7772,-8863,2465,9110,-11257,6232,-87,-1747,-1489,-32172,3321,-1419,-84,-898,-14087,3884,13677,-4537,-5002,-85,-774,-15911,10000,-932,12300,-3494,-84,1455,19179,1310,-1706,-14532,8243,-85,8756,378,-17057,-20965,-10729,-2895,-83,-1899,6027,-17584,-10264,781,-74,-81,10789,495,9373,26532,-4172,-3381,-84,2736,-2311,3074,-1537,9171,461,-85,54,18921,-862,-15969,6813,-815,-85,5664,-10665,3924,4114,2803,-1483,-85,-6400,-4541,-956,-53,13982,4570,-86,-7042,322,2525,11262,4939,-87,-86,8563,3041,12271,4848,-6789,-2492,-88,1143,9306,-16792,11618,1022,-3058,-87,-335,6501,1110,-3591,-5286,5515,-89,-86,-7935,-1296,4432,-4023,2048,-86,12204,-2974,5514,-1462,2952,4804,-87,718,-3716,-79,10870,11959,-88,-88,5569,-758,9815,5583,-84,2056,-90,10847,2542,-15224,7268,16212,-6339,-91,-1862,14408,11792,-4361,11011,-1781,-93,3854,-14129,7372,13628,892,-2779,-93,4578,-13568,-2354,26723,-2954,1069,-94,-1226,-6763,10101,13895,595,-95,-822,-15551,8072,12250,-8891,-3207,-95,-6018,14312,-1219,-7073,-7347,2204,-94,11856,5803,10138,10970,-9335,8456,-97,-2529,-2758,5623,8117,1474,2026,-98,-2877,-6014,1347,-15303,-3167,1693,-96,3474,2600,-13924,5751,-3574,7974,-96,-9035,-13012,-5563,-1444,-11386,2418,-93,11224,18343,-2256,-12646,7540,-387,-95,-1068,-11645,-4061,-7189,16796,-96,-95,11961,5110,-10531,7392,8725,-4641,-96,1385,1235,12946,-2721,-2224,1230,-96,4929,-2143,-8237,-2558,765,-96,-96,2119,-1354,-17879,-1731,16832,-3883,-96,7774,-2882,16324,660,-209,-2940,-97,-206,12777,11210,-11117,-2789,11174,-98,3865,-2164,698,48,-1078,-99,-98,1223,5325,-2120,-191,-1972,-1341,-98,3355,1200,4885,1941,2439,-2497,-99,-1467,-4384,14667,-7720,7251,-1367,-99,-1888,4144,-16301,-10625,-8680,2877,-97,13536,-2263,-20339,-5053,15292,-2704,-98,867,2065,19141,-16565,-32967,-97,-97,-53279,5775,12141,14930,9185,263,-96,-1811,19546,5828,14865,4616,1080,-98,10719,-6772,274,-12354,9781,1440,-99,-4300,-95,-4350,6196,19005,-1120,-100,-467,-22737,-9862,-9719,-21903,-263,-96,8017,2095,16703,9849,9763,-4995,-99,719,-6760,-8665,26026,-12251,-2229,-98,2059,13585,-3190,11001,7016,773,-100,-4619,-9506,12811,-3938,10710,995,-101],"returnScale":1000000,"returns":[0,-1322,-8501,-154,-63,1026,2885,-16112,5920,-16702,-2799,-63,10712,14149,2560,12246,2363,468,-71,6549,-836,-3030,3943,842,1956,-71,4226,-1249,-1319,152,-8458,-3203,-71,-2288,2668,6764,-16528,-13016,6125,-68,18660,299,-6579,-7357,12363,5512,-70,6033,17110,2958,2805,-3083,1641,-71,7574,3657,12,-4806,-116,1415,-72,12115,-11237,-3515,7470,19783,866,-72,2381,-3968,1704,5155,-2511,-1267,-73,11641,-1318,1552,2281,3777,-1393,-73,-1819,-559,-2341,3188,6135,-845,-74,-4181,-10654,4634,-4424,584,-1145,-72,-669,-2181,-1652,8516,-7487,-72,-72,7867,-7015,9760,13069,1392,-97,-73,-3871,-18643,-15009,14465,12025,-1000,-73,-438,-6369,-9750,10438,131,1275,-73,7568,-2737,-6402,2038,4906,3783,-73,-2534,-3776,3692,2484,8272,4086,-74,12942,-4377,1099,4719,1384,3399,-75,3708,-1268,-4425,545,-3361,-74,-74,5349,7641,-5189,-231,4718,-968,-75,1458,1617,1661,5699,4889,4406,-75,870,-6451,5965,-10615,10072,-1837,-76,2130,317,2690,-2914,-5302,-122,-75,-17786,10090,9013,-758,11212,217,-76,807,-4738,52,4086,-8037,-1052,-75,-2785,7119,-719,10166,2843,-77,758,3655,5364,780,1735,-1858,-77,769,-5601,-8117,3697,1672,-76,6562,725,-1252,-3178,67,253,-78,6386,-4466,-533,2514,-3572,-1899,-77,2891,-4336,-2774,-10716,-3625,189,-76,2669,-510,-1231,-595,-2662,-1370,-76,-18990,5824,2821,10514,2750,-17111,-5086,10583,-1045,-75,-10377,7970,3276,19029,-684,-768,-76,1116,-3867,5036,13126,3138,-689,-77,1139,5246,-4020,4998,-5152,678,-77,2051,-121,-9116,7419,4826,-4283,-77,3621,7482,5662,6253,4712,3771,-78,-1557,-4167,-5209,1097,15627,820,-78,307,5040,2149,-1966,-7402,6387,-79,-3823,-2070,3051,4003,-30527,-3306,-76,8496,-15343,-7013,9632,-4373,3460,-76,18865,19445,4743,-4058,2743,2946,-79,-5849,-6497,11359,2348,-12937,1075,-78,-19294,22126,8481,7087,-1517,-802,-78,11016,1364,-120,1789,-6094,1174,-79,6884,210,-5673,-3140,68,-78,-79,8678,2731,-11870,-3822,1697,-78,-119,-16600,-9235,-14019,-515,-76,-3731,-4225,4119,1284,27623,1677,-77,14440,5037,4912,-36081,3463,-15144,-76,-1128,8510,22186,-16918,-18573,1729,-76,-9139,20736,-293,-15078,-9000,1263,-76,-4406,-11479,-11847,-2452,40378,-5115,-75,-5018,-10651,17701,488,-16052,12639,-75,-25109,21018,-34824,6797,-74,-4867,16724,24212,12817,8362,3483,-77,-2019,14335,-11316,13375,4019,-2023,-78,2700,21197,-33800,9467,3861,-78,12239,-7144,-5462,6443,2963,4537,-79,-12828,-11546,13365,-8206,-4149,3785,-78,-2459,10789,-2738,-16190,-29818,-75,-76,1310,-19245,17651,34084,-15460,-4211,-76,3855,3602,17594,-30767,-14097,-509,-76,-31127,4984,-9049,38433,1663,-76,-4131,16004,-41488,-13633,7796,-4365,-73,17068,-16994,11841,20857,12384,-1813,-76,3759,-9613,-3417,16100,-9272,-3441,-76,4713,7992,-1961,-33721,-29566,-72,-72,-38866,17561,5601,-28908,8557,-7216,-70,394,15796,-8264,10046,34799,-2081,-73,-2146,-20423,-636,-6447,13647,-2920,-72,2880,-3341,15362,26496,165,1072,-75,-13094,-539,148,-10681,20327,-4574,-74,-2594,22215,-1988,9343,-11429,2059,-76,801,-13410,30877,9657,8723,-5873,-77,1555,-10640,15398,2556,-3946,-4518,-77,3298,-9068,19121,-3058,8916,3855,-78,4362,10032,-5692,-220,-15464,10076,-79,-19588,1164,10343,16713,-36254,-3777,-77,-10375,-6856,-12276,-2119,-5051,48,-74,-2710,4103,8651,11637,18443,-12945,-76,12321,-48070,-2908,6531,-6859,3160,-74,4665,-13934,-10131,-2062,-19164,6870,19380,-9793,-26156,-3428,-70,22588,32351,-14173,-9821,-19519,5112,-70,-7853,1394,-3789,17805,-17665,1030,-70,21060,5111,-16757,2099,12438,6389,-72,10400,16670,-14291,-24796,16518,6950,-73,-5610,5280,-20736,-2902,31248,-9389,-73,10328,-3966,-14842,47133,18062,-26415,-75,-8421,9653,-16855,-2339,12124,-3959,-74,-3466,24119,3677,-343,-7755,2229,-76,-12316,-6409,38111,-1089,-5262,-5593,-77,-11166,-17730,665,7761,-3658,-992,-75,7544,11174,-2784,-34000,-6137,-978,-73,-10687,2249,17009,-16132,362,-316,-73,419,-2495,-9453,13259,-6444,-435,-72,3284,5680,22806,-12987,19719,-74,-74,-811,-2110,8685,4590,5446,-883,-76,843,1185,-11733,-10230,19653,-42,-76,12940,-1113,-1051,7884,1351,2171,-77,-12477,5986,18474,11925,-14784,3978,-78,-8017,19842,-4901,-4764,-7087,6504,-77,14608,810,-3638,-8198,-3525,5433,-77,324,-19203,-3287,6567,-14295,3097,-76,3230,468,-5669,2637,23658,-324,-76,3168,-12921,-1903,-2257,-17417,-2400,-76,-6814,8124,-13340,31952,-13536,-2344,-76,4456,5019,-13739,5764,-7819,11730,-75,-1003,-1161,10860,8790,11098,568,-78,2321,-1523,-8069,5500,2326,1105,-78,725,5356,-5747,13301,-3235,-78,-79,-870,3262,621,-1382,-1389,-78,-79,-1297,-40244,-6475,18609,9278,3489,-77,685,-13886,-8045,-16211,15315,4451,-76,3680,-6091,8477,2780,1680,2412,-77,6300,-4055,9773,15669,-48,81,-79,1978,-14163,-6833,7981,22680,-1758,-87,3003,-1782,-16853,16626,15722,-82,-81,-3142,10395,-9349,3722,28,-3356,-81,11195,8873,3642,9743,-919,-12886,-82,-3251,-569,-7523,7622,-17109,8965,-81,-5458,8322,-1985,2238,10745,3939,-82,4202,-4860,-3361,-14034,-4519,1108,-81,2960,2652,10085,12215,-13013,-3508,-82,2412,4443,1529,-5890,1574,4825,-85,1345,10245,-1853,7309,19540,-7450,-17282,-2473,1665,-1200,-85,11281,-3148,-3656,6127,-14348,815,-84,3470,-5557,-11644,-6701,41,2877,-84,8173,-4010,15335,-6597,172,2559,-85,11376,15089,3402,-7560,6505,2553,-87,1946,2211,-4520,-3246,3108,-87,-87,7765,-8855,2463,9101,-11246,6226,-87,-1745,-1488,-32141,3318,-1418,-84,-897,-14074,3881,13664,-4533,-4997,-85,-773,-15896,9990,-931,12288,-3490,-84,1453,19161,1309,-1704,-14519,8236,-85,8747,378,-17041,-20945,-10719,-2892,-83,-1897,6021,-17567,-10254,780,-74,-81,10779,494,9364,26507,-4168,-3378,-83,2733,-2309,3071,-1535,9162,460,-84,54,18903,-862,-15953,6806,-814,-85,5659,-10655,3920,4110,2800,-1481,-85,-6394,-4537,-955,-53,13969,4566,-86,-7036,322,2523,11251,4934,-87,-86,8555,3038,12260,4843,-6782,-2490,-88,1142,9297,-16776,11607,1021,-3055,-87,-335,6495,1109,-3588,-5280,5509,-89,-86,-7927,-1295,4428,-4019,2046,-86,12192,-2971,5509,-1461,2950,4799,-87,717,-3712,-79,10860,11947,-88,-88,5564,-757,9806,5577,-84,2054,-90,10837,2540,-15210,7261,16197,-6333,-91,-1860,14394,11781,-4357,11000,-1779,-93,3851,-14116,7365,13615,891,-2776,-93,4574,-13556,-2351,26697,-2951,1068,-94,-1225,-6756,10091,13882,594,-95,-821,-15536,8064,12239,-8883,-3204,-95,-6012,14298,-1217,-7067,-7340,2202,-94,11845,5798,10128,10959,-9326,8448,-97,-2526,-2756,5618,8109,1473,2024,-98,-2874,-6008,1345,-15288,-3164,1691,-96,3471,2598,-13911,5745,-3570,7966,-96,-9026,-13000,-5558,-1442,-11375,2415,-93,11214,18325,-2254,-12633,7532,-386,-95,-1067,-11634,-4057,-7182,16780,-96,-95,11949,5106,-10521,7385,8716,-4636,-96,1383,1234,12934,-2718,-2222,1228,-95,4924,-2141,-8229,-2556,764,-95,-96,2117,-1353,-17862,-1729,16816,-3880,-96,7767,-2879,16308,660,-209,-2937,-97,-206,12765,11199,-11106,-2787,11164,-98,3861,-2162,697,48,-1077,-99,-97,1221,5320,-2118,-190,-1971,-1339,-98,3352,1198,4881,1939,2437,-2495,-99,-1465,-4380,14653,-7713,7244,-1366,-98,-1887,4140,-16285,-10615,-8672,2875,-97,13523,-2261,-20320,-5048,15278,-2702,-98,866,2063,19123,-16549,-32936,-97,-96,-53229,5770,12129,14916,9176,263,-96,-1809,19527,5823,14850,4612,1079,-98,10709,-6766,274,-12342,9772,1438,-99,-4296,-94,-4346,6190,18987,-1119,-100,-467,-22715,-9853,-9709,-21883,-262,-96,8009,2093,16687,9840,9754,-4991,-99,719,-6754,-8657,26002,-12240,-2227,-98,2058,13572,-3187,10990,7010,772,-100,-4615,-9497,12799,-3934,10700,994,-101]}});
\ No newline at end of file
@@ -0,0 +1 @@
+registerFundSeries("WVP Etiks Akcii", {"daily":{"start":19964,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[999906,-1580,-95,-98,780,-13393,-1228,-7573,-15749,-349,-93,6180,3238,13338,4957,5122,-4369,-92,293,-4793,-6019,20658,-14550,-900,-87,2016,6912,-998,3244,1894,-102,-88,622,-11399,7364,-5576,6905,497,-85],"returnScale":1000000,"returns":[0,-1580,-95,-98,780,-13394,-1228,-7574,-15751,-349,-93,6181,3238,13339,4958,5122,-4369,-92,293,-4793,-6020,20660,-14551,-901,-87,2017,6912,-998,3245,1894,-102,-88,622,-11400,7364,-5576,6905,498,-85]}});
\ No newline at end of file
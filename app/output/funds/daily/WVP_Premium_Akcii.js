@@ -0,0 +1 @@
+registerFundSeries("WVP Premium Akcii", {"daily":{"start":16408,"dateDeltas":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"priceScale":10000,"prices":[1000001,-66,-65,-66,-65,39,39,39,39,39,39,39,39,39,38,40,36,36,3,598,39,38,29,29,29,169,-1550,-470,100,-869,298,22,-6501,738,-504,9822,-5685,-332,8,920,4034,-3692,752,7627,2041,6,3370,1042,-375,6203,4463,4679,5,4630,-7452,-3685,3237,-3909,-391,8,5387,4174,-770,-2202,297,45,-6,-7631,7046,-718,9288,2540,-859,-9,-3653,274,-64,3005,1261,1458,-7,2898,2016,-1062,4987,1983,1517,-8,511,-6306,3381,5963,2437,2191,-34,1746,-4020,14324,4382,3238,-368,-34,13329,-8068,-3228,1955,7542,-1205,-38,-9193,709,-10447,-4782,1303,987,-38,12534,-6642,2741,-2826,-797,-2129,-34,-88,10196,-538,8885,11670,-27,-28,-2573,-5429,3169,-6299,-14894,-649,-22,8880,4403,-4314,-6204,1533,127,-31,9142,-12810,-18944,-178,-1398,-26,-27,5199,-15495,-1124,6366,12360,1596,-40,-3316,-10206,-4160,10857,-4965,436,-40,6695,11107,3341,2291,-191,-678,-43,-181,-9054,12387,-2470,-12478,-36,-36,2086,-8257,-65,-7905,-11230,1746,-40,-8108,-2574,12094,4357,-7332,540,-35,-9825,4238,-4361,6270,-3990,1432,-36,17814,3843,-1310,544,-1613,421,-43,-22421,-5378,10507,-2225,-2839,-119,-46,-8268,-7042,4626,11098,16421,-1582,-49,9906,6199,2038,10848,956,-52,-53,4319,-7744,-7037,-1347,-11231,296,-56,-15681,5332,7204,1437,2994,-1309,-53,5390,-814,7937,-810,-6551,-1870,-55,6772,-15981,-20746,4439,1318,-1936,-54,425,1263,-9804,-15289,-30928,-2694,-52,-37066,17785,-2765,27815,2588,-53,-53,-3125,-19379,4023,13194,-16258,2864,-54,3359,11246,2062,-4784,-4056,-3031,-55,-2693,7786,7537,1591,-17034,-1659,-53,5055,-17345,4429,-12574,15428,2207,-52,-15666,-4510,15407,-4641,6004,-144,-51,21021,1926,1213,4980,4730,-3071,-59,1530,-6149,-10638,13791,5448,2488,-57,2186,-1525,-1317,17705,19007,-62,-61,-952,5528,8684,-3038,2864,-3105,-62,5559,3176,-1698,3679,2072,-669,-64,-12124,5197,6613,-13969,-9501,-959,-61,4557,17239,5007,6176,2568,-9,-67,-2451,-7486,10891,8995,-1755,592,-66,141,-1918,-2897,-26849,-773,-7104,-63,4807,-10457,-8251,-3736,-17034,-115,-814,-10361,20660,5726,10313,-10873,351,-68,-6126,840,15500,809,-2012,768,-70,-3665,11750,-7611,-3179,1342,-64,-64,-27214,2700,-5611,-19965,-12488,-4881,-61,-3654,10122,-4365,-5423,-22269,-654,-57,-1639,10522,-22164,10810,17875,4471,-59,-5233,6240,-657,-11392,20096,-1334,-60,-3418,-13431,-8256,-1834,-19451,-41,-56,-21190,-6763,5568,-18632,13364,3054,-56,16837,2595,17997,172,-1038,-968,-56,14884,-11158,-9018,15614,7391,755,-59,-1999,20491,5773,-1127,3081,-2440,-61,-2262,-5655,1982,-9118,25888,-7490,-62,4918,-4210,1513,-1370,-3063,1480,-62,1285,90,795,-9073,499,-586,-61,-472,4832,9564,-9338,-10863,-2195,-60,1665,-12078,7286,-7067,5423,22,-58,-58,6763,17118,6938,-2111,-1075,-60,5747,12447,4828,-3529,-5005,2637,-61,-4073,1409,1459,-2887,-17392,-59,-59,4756,-11948,-15683,3564,2685,-86,-62,5795,8266,-4722,-7146,3471,1264,-64,1911,-5277,4295,-7870,11993,-1336,-64,-3801,16541,9380,7153,2016,-395,-66,2032,-4003,-3728,-1787,-6304,875,-65,3828,2108,-1874,-7513,-15925,1002,-64,-14007,-10826,5846,-1446,4696,-62,-63,21515,3946,3920,13699,-49409,3195,-63,-19356,15847,16351,10131,5399,-1753,-63,-3417,-8932,-7886,2962,12339,-963,-63,10828,7268,-2042,8270,-2155,678,-59,-826,-1850,9270,-1219,1215,-540,-64,-59,4373,1676,-5922,649,-241,-65,-1656,-13627,772,4133,11583,-867,-65,892,13784,-2431,5785,-436,-486,-66,2005,-5239,-9268,3834,-4497,-584,-65,-3358,6416,-642,-2283,1906,-192,-64,219,6674,-5864,-1406,13267,-1148,-66,-373,2359,3848,-6276,-13519,-2007,-64,-3651,-5030,-3065,6931,-8262,521,-64,6034,3055,3585,15465,-6950,-120,-65,-14389,-297,8917,-4747,5403,1417,-64,318,2773,-830,-4279,-4040,-753,-64,8876,-6061,-4344,-3885,8238,1385,-64,-6030,8341,2607,2622,-619,2712,-65,2332,-1987,-3062,-320,-1204,-329,-65,-3698,-9373,-12520,-6712,-7171,-805,-61,16906,3810,14740,-1422,3512,1447,-65,274,8232,-4721,5530,-4013,2449,-65,2116,723,-1674,2292,5025,-1738,-65,-7647,2910,4247,-7025,-2556,-642,-65,8927,3273,13396,8165,6610,6554,-69,-85,8410,-4963,5609,8939,-1229,-70,2722,3640,912,-2804,-987,-721,-70,-123,1089,-1041,390,-1677,-3207,-69,4639,4594,7835,-1458,-993,-70,-70,-2924,-1180,-6,-4493,20,11,-68,-4389,-3845,1170,-2190,2362,952,-68,-6380,2560,12730,3541,89,503,-69,-8836,-6120,295,-2468,4928,1964,-69,-7271,2393,1341,10653,620,802,-69,8628,1670,4522,-724,-954,-595,-71,910,9594,5294,-216,-8866,-911,-70,757,-370,18227,1085,-147,-2899,-71,-4112,-2031,-516,1539,1145,-2797,-71,1386,-4294,4795,5278,-1689,175,-72,-2511,-8059,-5106,6003,553,-1052,-71,-3800,6706,4251,6217,1007,2090,-71,-4710,4091,-3388,179,991,1036,-73,-730,-1253,-2941,-6050,-1091,-71,-72,2895,-10963,-3304,4635,-1342,1979,-71,25533,-2251,-329,-1914,-684,-1446,-70,495,2990,2144,7227,5418,-781,-73,-2034,2377,2673,-2649,2617,-697,-74,3614,-2993,-19180,-4943,6061,-2821,-71,2297,-1478,1918,-502,162,375,-71,419,-2935,987,3700,7478,-71,-71,-522,-6738,-2001,1487,6771,385,-70,-6021,2336,309,-4975,5203,20,-72,10408,-7378,-2879,793,-3893,245,-68,2597,-5926,-2971,-17832,-5854,72,-67,9819,-1257,-5,-7271,-922,-1686,-69,3486,-1245,12953,-568,2640,32,-70,-989,-9227,523,2704,-7802,-5384,-70,-2900,5038,175,-3493,-5475,-1797,-69,-1333,6026,-5396,341,5954,-197,-70,-670,2829,-8436,-6911,-2675,-1102,-69,10780,-476,6809,-6665,-3068,-1303,-69,-4155,11197,-3106,-444,202,554,-68,-2442,-7655,-2177,9511,6618,-2535,-68,-2918,-2407,5306,3185,-1410,-69,-69,11566,4005,4435,-2380,2024,-1296,-71,4089,546,-1984,614,1958,-1887,-70,209,2642,6286,3995,6317,-1262,-72,5719,3319,1181,2540,150,624,-74,415,-1132,-429,103,-894,2164,-72,1052,700,4562,-4674,-470,219,-73,-287,1327,-5784,8332,8070,4602,-74,-914,1743,8582,1885,-70,-579,-74,198,-2274,1597,-12387,-6402,-497,-74,-2440,-4425,-10000,3289,-1382,-957,-73,4468,8789,-3179,-104,88,-964,-73,-3891,5721,1600,5362,-7401,-868,-73,8129,-1402,-1743,1731,7283,-75,-75,286,4935,-1615,-4385,349,1083,-74,10871,-5040,-7224,4108,-3494,214,-73,36,1788,-1612,-3611,-4370,-1708,-71,-72,-1858,4761,12653,9025,705,-75,1991,3375,-757,-1066,5514,-3751,-76,-1390,-4806,4128,3187,7326,-75,-76,4587,2672,-5980,-4532,6293,-815,-76,-3755,-9021,-2297,-9363,-18547,-480,-72,-24745,-8962,14379,-31008,-1383,-1130,-69,15306,-4289,7522,5615,3057,783,-71,-4765,3004,-1889,3003,7381,-367,-71,10539,-5596,-9410,-12996,-13836,-4652,-70,11476,1231,-631,8495,6234,3817,-71,-283,-11191,-5966,4098,5968,1076,-71,-13266,5254,-977,-19938,-15021,-1140,-68,4930,1466,2077,9059,2134,-77,-68,-7151,925,3377,22813,-10862,-70,-70,93,12446,-10276,7192,904,532,-71,71,9727,3513,-3890,-1401,1371,-72,2766,-3494,-4189,8885,4491,2219,-71,-166,-662,901,-3570,10740,513,-73,6727,-1161,9528,6191,-863,-1895,-73,1291,-4860,5105,10627,-3556,994,-76,6122,-226,-12508,-3375,-1471,-75,-75,-2558,-12834,13002,-13402,8917,785,-74,3698,-6616,6747,-3337,-4190,2930,-74,5744,-2516,-858,9308,-5663,-74,-75,-8627,-5136,5351,-12225,13034,-3890,-73,-19690,-1325,4028,-1141,7447,-2387,-72,-3503,5178,671,8665,344,-1103,-73,7150,2401,-11699,7681,5355,-567,-73,-1996,-378,9148,-799,-1711,-2848,-73,-48,7989,-190,8883,1248,2844,-75,-3812,2060,-4566,-6328,4017,3737,-75,2210,7268,-4005,-1295,-15288,5435,-74,-6652,3440,-13063,11574,-1311,-988,-73,6282,2059,-6748,-2942,4137,-779,-73,8820,-3088,1335,-6014,-8259,1763,-73,1696,-5497,-6838,-7105,-2270,1500,-71,2007,1444,5993,1199,1958,-2353,-72,-1744,5485,2907,9019,3343,255,-73,-6676,927,-552,6986,-6549,4503,-75,3734,-3815,6263,-6780,-6548,-76,-74,-6309,3316,-17407,-24545,1315,-2877,-68,2305,15286,-2507,-6509,4482,1080,-71,-3163,-13333,-10865,13190,-13263,2160,-68,-1769,2449,14858,4271,-4278,-406,-70,5802,1424,11782,-1734,-1667,2708,-72,-16117,5528,-6330,259,-1235,-1838,-69,-9133,-17366,8617,-5745,-1221,1751,-68,12594,-1247,10735,3605,-1919,636,-68,10811,-14301,-11693,-22934,-2758,-701,-66,-9930,6086,13218,1167,-12522,2624,-67,-13550,-6824,-3563,-16369,-7257,1140,-64,-11741,236,15457,-9103,13013,-1670,-63,4061,150,777,-12566,28264,-1528,-65,-2311,7243,8815,3307,-3783,-145,-66,-5104,9635,3444,1966,17909,-464,-67,-1513,-7782,1127,1728,8836,334,-68,-9243,2654,10579,2184,2228,440,-68,1615,14348,-476,-14374,-2999,143,-69,5620,10647,2898,-5110,17249,361,-71,366,-2497,6637,-3138,1203,345,-71,2415,499,-2224,475,3841,544,-71,-286,3441,-2516,-4918,-4731,1623,-70,8787,-2061,5613,4367,9236,-801,-72,3844,2736,-9251,3633,-19846,3874,-72,-2580,6214,-293,3051,10147,-397,-72,10979,1763,6287,1193,3870,-1310,-74,-824,-5564,-397,-293,3513,-2150,-74,749,4243,1133,3206,1532,52,-74,38,5763,-2535,-167,6461,-74,-74,1983,3832,-6273,-4527,7488,2194,-75,-8097,-18811,2521,-14179,3990,-1211,-73,-15965,10860,7417,17647,-4349,1157,-75,-10010,6369,-841,-15351,7443,-73,-74,2482,-8909,-12411,5694,-11192,-871,-71,4933,10842,3664,1399,11416,-540,-74,2915,3416,-4229,865,-1049,-75,-74,-124,19050,2803,5690,-5556,-243,-75,-1720,-6076,-791,1587,6407,-517,-76,8438,3402,8792,1714,-5015,810,-76,-1684,-1988,-473,-1523,-1957,1162,-76,1870,2050,-3894,-1536,-825,10,-75,2031,11173,-717,-4273,7373,-2163,-76,1130,-11325,-5926,-1251,-18982,-74,-73,-25531,-5143,1919,19089,-7392,-599,-71,-5576,11370,-24938,893,14337,3136,-74,11879,-8059,13129,-5394,-15577,1293,-73,5053,83,2609,14152,5761,708,-75,2584,-4018,10277,7661,2813,255,-76,-698,1997,6961,5324,3163,-5020,-78,-7556,5969,166,4168,143,2140,-78,-5053,-2315,-1260,4061,4552,-189,-77,3589,-11926,-30275,1300,11433,-753,-76,2072,-12540,7845,8188,15692,-77,-78,-4580,11708,1416,-1760,-9164,-674,-78,4555,717,3274,9243,2842,318,-79,2407,810,3953,-6972,6259,756,-79,10312,1704,4887,6466,-998,1667,-81,-926,3483,-1360,-2830,7783,-1938,-81,-348,-3228,-4983,-570,1434,905,-81,8746,2453,2103,-1217,-2415,784,-82,-17943,-10126,10100,-2804,13485,-221,-81,-5325,-867,4841,7146,1278,-693,-81,12310,-3866,-3190,4495,9557,561,-81,2361,-210,-228,1313,2131,-1821,-82,-9266,-1167,-1025,11318,-2776,1428,-82,-1658,-1272,3368,9602,-1604,1043,-82,-1006,-2947,1880,2694,7560,2500,-83,-117,-3009,-5338,-4977,8385,2789,-82,-27006,11874,4453,-8381,-17280,-750,-80,4281,19866,17580,7727,-4605,896,-83,485,6852,8655,-3191,128,-91,-84,3137,-4605,10127,-9941,-8485,-75,-83,-46985,-28989,-1493,-43693,-37531,-213,-74,24358,-7878,28234,-21623,-38028,-4091,-73,-83085,4702,-18998,-106887,39038,3004,-62,-63749,31431,-44995,21517,5259,3526,-59,-28333,69707,24250,31072,-39529,1750,-62,22898,3822,-28141,12225,-8201,2975,-64,43602,10717,4381,12269,251,-2675,-67,-3234,15233,-27702,7796,24368,-68,-68,206,-32425,18238,3259,-510,-1283,-67,18505,9548,16265,-18182,-10542,-68,-68,-20803,12524,-3891,11600,11239,-1963,-69,-3920,-3760,-20255,-8957,6759,-412,-67,38261,-7736,7831,-8667,-3099,3454,-69,13536,7660,9985,8469,-10025,-4318,-71,4679,18861,26291,-5504,29035,-75,-76,1807,-12903,-5692,-54443,6646,1216,-71,-1291,29911,4789,-2339,5241,63,-74,-3675,13130,-35653,9757,-9417,-710,-72,11232,-1317,3737,18201,-9339,2120,-73,17687,-13452,-1861,-8155,9644,2091,-74,9439,-1231,13405,-5268,-1717,-231,-75,5413,4485,-5389,-9384,-15161,-1053,-73,663,-6086,4351,-20251,-8908,-3142,-71,19133,1096,7364,-6460,3516,1,-72,4797,14131,13578,-6882,-11051,975,-74,311,-5191,5300,-9501,925,3081,-73,19429,-5053,8441,-2768,-3027,-74,-75,-9384,-1271,16046,-15409,-10397,-1246,-73,13211,-17573,19939,-8476,-449,-864,-72,4538,4618,-1361,-4372,-7212,-1351,-71,-30348,5567,-3916,-4058,3650,-115,-70,18967,-6921,-2665,-704,-3278,572,-71,11150,-5394,3279,7977,8490,-784,-73,9148,-6411,-3897,-17535,13942,-1877,-72,-5479,-3079,-13437,-743,7547,-72,-71,-24908,-10876,-36240,6319,-3647,102,-66,18365,24103,23084,12914,-9079,-34,-71,45918,12186,11303,-9030,3256,-723,-75,13060,-3612,-3449,-5846,1987,-1145,-76,1362,14564,169,-1182,3177,-1131,-77,-10387,7506,3515,-6437,6370,-156,-77,-2702,1795,-1164,1250,-7506,-1622,-76,-1916,5764,7940,3937,-6077,-1277,-77,-22347,10559,6824,4330,-213,-322,-77,12341,2346,-3283,-2159,-1132,-76,-77,-2374,-1257,16331,6594,5713,327,-79,-5209,178,2309,3661,-5948,558,-78,-496,3323,7926,-3345,-5039,-403,-79,-7352,8392,-18539,6961,-26384,-1391,-76,12726,17600,4810,11204,1089,381,-80,5129,-2480,-4379,2010,6263,1128,-80,8755,-1882,-4940,-5067,1580,-1960,-79,-4667,-1001,8205,-12788,-17919,3365,-78,23513,2695,-1304,-3324,589,3372,-80,21550,8016,10182,2850,-1584,644,-82,1269,4828,847,2894,-8313,457,-82,1888,-6152,216,3745,13597,581,-83,5553,5391,-2185,4287,-1516,-412,-83,5314,4911,-889,4597,4440,-736,-85,-4559,-406,3440,6399,9494,-97,-86,-2511,-20025,12303,3934,-1439,-935,-86,774,-2230,1373,1878,-5758,-85,-84,8454,-14491,20527,8202,7313,-232,-87,-927,-24661,-2926,7747,16502,-732,-87,-1711,-5922,-17886,14588,5973,1354,-87,5273,-2039,-3633,1875,7585,2859,-88,-6964,5139,4361,1126,5439,2719,-89,2094,-1344,1715,2095,6289,2470,-89,2450,3850,-1567,113,-13893,-89,-89,11219,4303,-10092,8257,2074,-530,-90,-5823,4195,-4411,6308,3225,2604,-89,1731,-9102,10071,-19634,18353,-810,-90,6448,526,440,-6792,-6897,-609,-89,-30247,12154,14856,2091,15681,41,-91,-288,-8283,4960,4382,-8744,-463,-90,2715,5535,4027,10776,1802,-90,2064,5232,7539,4412,743,-1447,-92,-4479,-6288,-13237,7490,729,-91,7548,-3510,-890,-4334,4424,21,-91,2498,-4926,3287,3163,-8199,-1104,-91,8817,-5962,-10172,-5562,-2633,589,-89,7841,-1583,-6388,1037,-9356,-978,-89,-23125,13651,14233,15169,-5980,-417,-90,1096,-25498,8978,-9945,4259,-190,-89,-9138,14425,-7504,25142,-3345,-409,-89,-357,-5719,5636,20633,10203,-394,-91,-5313,3937,752,-2542,6889,373,-92,1558,8950,-5466,7013,3093,-2033,-93,6241,10044,1907,5953,7469,1521,-93,319,-4452,-1648,2191,5760,298,-93,4645,5379,2822,-2165,-8915,3774,-94,-1557,-6174,-774,7155,-54962,-2572,-90,8716,-15249,12660,-2635,-7006,2195,-89,21180,31186,-2212,-3878,-5211,2155,-93,-7997,-5027,8470,12783,-17716,442,-92,-21296,24773,11003,10183,-995,-616,-94,11449,7299,-5290,2169,-3045,1179,-94,10607,6704,280,-14514,-1804,-94,-95,-12364,10512,5295,-6087,-11870,924,-93,6212,-15866,-370,-20530,-442,-92,-35568,8051,17577,6716,3345,1186,-91,13970,12750,173,-27128,-6422,-10683,-90,8373,5048,21133,-7893,-15839,1296,-91,-22686,28291,-2274,-16267,-8777,792,-90,-15958,-6167,-11029,22379,-3626,-90,-10926,-30610,23324,-17777,-40965,8039,-85,-18241,-664,29030,-2729,4334,-85,7325,9656,31497,11730,7521,3175,-90,-3360,-1718,7641,3831,-901,-90,7158,24979,-14642,-19413,7455,3169,-91,11688,-5394,-15261,435,15717,2735,-91,-9153,-8746,7731,1659,-3240,2021,-91,239,635,9846,-3491,-33616,-89,-89,-13762,-18644,17000,23149,-2235,-2016,-89,-11032,7906,2114,-16932,-17727,-1007,-87,-34690,8467,10160,-11943,35585,915,-87,-4088,16674,-32264,-10684,-2341,-86,22794,-16122,7629,17938,20372,-474,-89,7271,-13006,-5357,12211,-6979,-2284,-88,11591,-475,-6689,-27371,-38790,-85,-85,-33578,1834,15407,-35987,5624,-2711,-82,9284,10832,-8438,-959,39203,-430,-85,2893,-11310,-1986,-15890,9018,-3166,-84,4045,-22613,22264,25586,3026,865,-86,-9200,1028,-10036,-14083,30162,-2880,-85,3890,22540,-5233,7540,-3672,2087,-87,3734,-8706,19830,11091,16630,-3826,-89,-2179,-8154,12111,2556,-6033,-2529,-89,5241,-5342,10328,-276,7111,2448,-90,4783,9761,-7462,2464,-11820,5849,-90,-20353,-2333,8428,7450,-30364,-2453,-88,-9874,-9193,-17510,-12768,11987,-203,-86,-8182,3537,3918,4942,19696,-6244,-87,19254,-35134,-7625,-14615,894,-84,3503,-14206,-360,-10703,-24036,5942,-82,-8301,745,12417,-14875,-6059,-961,-81,13949,40663,-14528,-9785,-17636,2720,-82,-5200,137,-1689,14684,-3545,58,-82,21145,7110,-6618,3510,5981,3377,-84,16053,15987,-2559,-5268,15687,4527,-87,339,6046,-12121,-5414,28991,-5015,-87,7432,3557,-10587,38424,4991,-15255,-90,1760,8256,-11251,-538,14912,-2416,-91,-1951,16796,4811,655,-1045,1203,-92,-9265,-5528,23537,2696,-4028,-3163,-91,-9400,-11341,-2437,1134,2261,156,-90,1276,14748,-2413,-43892,-11457,-1910,-87,-1649,-1238,21681,-16388,-634,-520,-88,-155,961,-8827,13122,-13026,-965,-87,10975,8677,14352,20961,-91,-90,8269,-5689,10208,7163,7747,-160,-93,3564,49,-9098,-16616,11064,-474,-92,9960,-2891,-2717,4279,2658,896,-93,-5129,995,2836,8143,2404,1901,-93,-9596,12561,2009,3279,-7699,3520,-94,16275,-1047,4358,-4739,-1692,2528,-94,-90,-12368,-1073,4000,-19407,1515,-92,14251,-7323,-6048,8757,17865,177,-94,1223,-14597,-303,-990,-18027,298,-93,-24988,18584,-31851,31651,-18739,-1209,-91,12238,11658,-4839,2619,-12916,6889,-92,10033,262,13125,10003,11327,527,-95,5301,-3090,-584,4385,1468,397,-95,702,5994,-2677,10984,1569,-96,-96,-1606,3846,1769,-1236,6998,-96,-97,36,-7588,-13212,10326,5345,3020,-97,-422,-15567,733,-13741,19814,2191,-96,4354,-6037,-1622,438,5082,1345,-96,859,-3963,4805,13191,5882,110,-98,-2298,-14772,-16533,1146,21834,-774,-97,-2522,-9275,-15440,11557,21075,-97,-98,-5805,2136,-3895,899,-3151,-1075,-96,6891,8569,353,6427,3596,-6348,-98,-8921,-4012,-5756,420,-10488,6412,-97,-4335,6945,3843,2584,14315,1072,-98,-2549,-4380,-8126,-30117,-3756,449,-95,4846,3924,16975,6272,-1615,-1885,-96,-6484,8200,452,5926,4827,3316,-98,-218,6703,-9886,17904,2288,5033,-100,3688,-9620,-18210,-8392,2732,-752,-98,8371,-1162,3774,9346,-13029,559,-99,3295,-11982,-2148,-13347,-3689,1100,-97,4720,2394,9701,-7389,1397,1295,-98,13371,12393,-875,0,-6543,1333,-99,-1081,-1325,-5915,2210,5012,-98,-99,5464,-3763,-4860,15888,-1543,3617,-100,-10080,-5414,1964,-21093,1098,-960,-98,-5460,-13856,278,10465,610,-2579,-97,-8133,-13349,5693,-56,11911,-1673,-96,-1901,22959,2491,-800,-12883,4306,-98,6100,1227,-18800,-11847,-18502,-1242,-95,-714,9330,-3079,-10986,-11647,-547,-94,13834,2731,10589,29205,-8881,-1737,-97,1198,-1565,7748,7883,-3423,135,-97,7326,14856,326,-7945,10746,-892,-99,2957,-3850,4099,5813,4467,-606,-99,-6406,-5133,1850,8781,14445,3051,-100,-1598,6660,3033,1167,12430,-100,-101,4263,4106,3233,-33,-5113,-1136,-101,-659,6685,-6059,3107,-2413,-1298,-102,-131,2255,170,-3701,1920,3584,-103,-101,-1706,-5528,9533,-4833,1241,-100,7016,-2237,3069,-8774,7303,2918,-101,-5604,-3043,-6906,11466,4861,-102,-101,7514,-5546,18162,4519,15788,1495,-104,6539,7691,-8427,2728,8970,-2884,-105,-217,14779,2085,-1004,1885,-1219,-106,6070,-15963,6625,13369,4264,-1383,-107,1554,-3216,-3258,24518,2973,868,-108,-4843,-990,-3257,2867,9378,-189,-108,3958,-12796,5705,20563,-7707,-1739,-108,-3069,15252,3919,-4095,-8732,1156,-109,2175,3998,5993,13670,-10321,4374,-111,673,1649,4516,4381,1361,1337,-110,-2365,-13721,3722,-9280,-11735,1398,-108,5916,-10368,-2280,-2068,873,4887,-108,-756,-15682,-610,4128,-4343,1583,-108,13257,19044,-8044,-13255,15766,396,-109,-1733,-13591,-38,-4936,12249,-109,-108,10194,16033,3714,11076,13171,-2854,-112,341,-1281,9397,-6267,-1242,506,-112,3126,-1519,-8194,-815,-2324,-112,-112,2994,-7898,-17191,994,15408,-2145,-112,4829,-3669,22204,7892,-1256,-2036,-113,-9302,-2353,18652,-18414,-14114,7749,-111,7283,3578,-2384,12983,-8708,-113,-112,10071,-2011,-5663,-2416,-3642,-1232,-112,6490,-7472,7477,5373,-2288,-1510,-113,-565,-13851,19444,-1486,16431,-1310,-114,-10028,853,-10918,-14753,-11049,1341,-111,17306,3770,-21710,-5735,19734,-1725,-112,-7489,6647,16606,-24542,-36948,-110,-109,-36112,2532,13899,12837,7442,-382,-110,-2569,14004,10005,21731,4282,1337,-114,10570,-9368,2543,-2772,10909,1123,-113,-1755,-1061,1918,12683,9223,-1195,-114,2153,-20993,-13918,-15711,-24663,93,-110,15802,-7054,9930,11998,10353,-2882,-113,-1546,1902,-10260,29453,-23506,-1035,-112,4228,16692,-4935,15155,7664,513,-115,-12672,-11781,10427,-9785],"returnScale":1000000,"returns":[0,-66,-65,-66,-65,39,39,39,39,39,39,39,39,39,38,40,36,36,3,598,39,38,29,29,29,169,-1550,-470,100,-869,298,22,-6501,738,-504,9822,-5685,-332,8,920,4034,-3692,752,7627,2041,6,3370,1042,-375,6203,4463,4679,5,4630,-7452,-3685,3237,-3909,-391,8,5387,4174,-770,-2202,297,45,-6,-7631,7046,-718,9288,2540,-859,-9,-3653,274,-64,3005,1261,1458,-7,2898,2016,-1062,4987,1983,1517,-8,511,-6306,3381,5963,2437,2191,-34,1746,-4020,14324,4382,3238,-368,-34,13329,-8068,-3228,1955,7542,-1205,-38,-9193,709,-10447,-4782,1303,987,-38,12534,-6642,2741,-2826,-797,-2129,-34,-88,10196,-538,8885,11670,-27,-28,-2573,-5429,3169,-6299,-14894,-649,-22,8880,4403,-4314,-6204,1533,127,-31,9142,-12810,-18944,-178,-1398,-26,-27,5199,-15495,-1124,6366,12360,1596,-40,-3316,-10206,-4160,10857,-4965,436,-40,6695,11107,3341,2291,-191,-678,-43,-181,-9054,12387,-2470,-12478,-36,-36,2086,-8257,-65,-7905,-11230,1746,-40,-8108,-2574,12094,4357,-7332,540,-35,-9825,4238,-4361,6270,-3990,1432,-36,17814,3843,-1310,544,-1613,421,-43,-22421,-5378,10507,-2225,-2839,-119,-46,-8268,-7042,4626,11098,16421,-1582,-49,9906,6199,2038,10848,956,-52,-53,4319,-7744,-7037,-1347,-11231,296,-56,-15681,5332,7204,1437,2994,-1309,-53,5390,-814,7937,-810,-6551,-1870,-55,6772,-15981,-20746,4439,1318,-1936,-54,425,1263,-9804,-15289,-30928,-2694,-52,-37066,17785,-2765,27815,2588,-53,-53,-3125,-19379,4023,13194,-16258,2864,-54,3359,11246,2062,-4784,-4056,-3031,-55,-2693,7786,7537,1591,-17034,-1659,-53,5055,-17345,4429,-12574,15428,2207,-52,-15666,-4510,15407,-4641,6004,-144,-51,21021,1926,1213,4980,4730,-3071,-59,1530,-6149,-10638,13791,5448,2488,-57,2186,-1525,-1317,17705,19007,-62,-61,-952,5528,8684,-3038,2864,-3105,-62,5559,3176,-1698,3679,2072,-669,-64,-12124,5197,6613,-13969,-9501,-959,-61,4557,17239,5007,6176,2568,-9,-67,-2451,-7486,10891,8995,-1755,592,-66,141,-1918,-2897,-26849,-773,-7104,-63,4807,-10457,-8251,-3736,-17034,-115,-814,-10361,20660,5726,10313,-10873,351,-68,-6126,840,15500,809,-2012,768,-70,-3665,11750,-7611,-3179,1342,-64,-64,-27214,2700,-5611,-19965,-12488,-4881,-61,-3654,10122,-4365,-5423,-22269,-654,-57,-1639,10522,-22164,10810,17875,4471,-59,-5233,6240,-657,-11392,20096,-1334,-60,-3418,-13431,-8256,-1834,-19451,-41,-56,-21190,-6763,5568,-18632,13364,3054,-56,16837,2595,17997,172,-1038,-968,-56,14884,-11158,-9018,15614,7391,755,-59,-1999,20491,5773,-1127,3081,-2440,-61,-2262,-5655,1982,-9118,25888,-7490,-62,4918,-4210,1513,-1370,-3063,1480,-62,1285,90,795,-9073,499,-586,-61,-472,4832,9564,-9338,-10863,-2195,-60,1665,-12078,7286,-7067,5423,22,-58,-58,6763,17118,6938,-2111,-1075,-60,5747,12447,4828,-3529,-5005,2637,-61,-4073,1409,1459,-2887,-17392,-59,-59,4756,-11948,-15683,3564,2685,-86,-62,5795,8266,-4722,-7146,3471,1264,-64,1911,-5277,4295,-7870,11993,-1336,-64,-3801,16541,9380,7153,2016,-395,-66,2032,-4003,-3728,-1787,-6304,875,-65,3828,2108,-1874,-7513,-15925,1002,-64,-14007,-10826,5846,-1446,4696,-62,-63,21515,3946,3920,13699,-49409,3195,-63,-19356,15847,16351,10131,5399,-1753,-63,-3417,-8932,-7886,2962,12339,-963,-63,10828,7268,-2042,8270,-2155,678,-59,-826,-1850,9270,-1219,1215,-540,-64,-59,4373,1676,-5922,649,-241,-65,-1656,-13627,772,4133,11583,-867,-65,892,13784,-2431,5785,-436,-486,-66,2005,-5239,-9268,3834,-4497,-584,-65,-3358,6416,-642,-2283,1906,-192,-64,219,6674,-5864,-1406,13267,-1148,-66,-373,2359,3848,-6276,-13519,-2007,-64,-3651,-5030,-3065,6931,-8262,521,-64,6034,3055,3585,15465,-6950,-120,-65,-14389,-297,8917,-4747,5403,1417,-64,318,2773,-830,-4279,-4040,-753,-64,8876,-6061,-4344,-3885,8238,1385,-64,-6030,8341,2607,2622,-619,2712,-65,2332,-1987,-3062,-320,-1204,-329,-65,-3698,-9373,-12520,-6712,-7171,-805,-61,16906,3810,14740,-1422,3512,1447,-65,274,8232,-4721,5530,-4013,2449,-65,2116,723,-1674,2292,5025,-1738,-65,-7647,2910,4247,-7025,-2556,-642,-65,8927,3273,13396,8165,6610,6554,-69,-85,8410,-4963,5609,8939,-1229,-70,2722,3640,912,-2804,-987,-721,-70,-123,1089,-1041,390,-1677,-3207,-69,4639,4594,7835,-1458,-993,-70,-70,-2924,-1180,-6,-4493,20,11,-68,-4389,-3845,1170,-2190,2362,952,-68,-6380,2560,12730,3541,89,503,-69,-8836,-6120,295,-2468,4928,1964,-69,-7271,2393,1341,10653,620,802,-69,8628,1670,4522,-724,-954,-595,-71,910,9594,5294,-216,-8866,-911,-70,757,-370,18227,1085,-147,-2899,-71,-4112,-2031,-516,1539,1145,-2797,-71,1386,-4294,4795,5278,-1689,175,-72,-2511,-8059,-5106,6003,553,-1052,-71,-3800,6706,4251,6217,1007,2090,-71,-4710,4091,-3388,179,991,1036,-73,-730,-1253,-2941,-6050,-1091,-71,-72,2895,-10963,-3304,4635,-1342,1979,-71,25533,-2251,-329,-1914,-684,-1446,-70,495,2990,2144,7227,5418,-781,-73,-2034,2377,2673,-2649,2617,-697,-74,3614,-2993,-19180,-4943,6061,-2821,-71,2297,-1478,1918,-502,162,375,-71,419,-2935,987,3700,7478,-71,-71,-522,-6738,-2001,1487,6771,385,-70,-6021,2336,309,-4975,5203,20,-72,10408,-7378,-2879,793,-3893,245,-68,2597,-5926,-2971,-17832,-5854,72,-67,9819,-1257,-5,-7271,-922,-1686,-69,3486,-1245,12953,-568,2640,32,-70,-989,-9227,523,2704,-7802,-5384,-70,-2900,5038,175,-3493,-5475,-1797,-69,-1333,6026,-5396,341,5954,-197,-70,-670,2829,-8436,-6911,-2675,-1102,-69,10780,-476,6809,-6665,-3068,-1303,-69,-4155,11197,-3106,-444,202,554,-68,-2442,-7655,-2177,9511,6618,-2535,-68,-2918,-2407,5306,3185,-1410,-69,-69,11566,4005,4435,-2380,2024,-1296,-71,4089,546,-1984,614,1958,-1887,-70,209,2642,6286,3995,6317,-1262,-72,5719,3319,1181,2540,150,624,-74,415,-1132,-429,103,-894,2164,-72,1052,700,4562,-4674,-470,219,-73,-287,1327,-5784,8332,8070,4602,-74,-914,1743,8582,1885,-70,-579,-74,198,-2274,1597,-12387,-6402,-497,-74,-2440,-4425,-10000,3289,-1382,-957,-73,4468,8789,-3179,-104,88,-964,-73,-3891,5721,1600,5362,-7401,-868,-73,8129,-1402,-1743,1731,7283,-75,-75,286,4935,-1615,-4385,349,1083,-74,10871,-5040,-7224,4108,-3494,214,-73,36,1788,-1612,-3611,-4370,-1708,-71,-72,-1858,4761,12653,9025,705,-75,1991,3375,-757,-1066,5514,-3751,-76,-1390,-4806,4128,3187,7326,-75,-76,4587,2672,-5980,-4532,6293,-815,-76,-3755,-9021,-2297,-9363,-18547,-480,-72,-24745,-8962,14379,-31008,-1383,-1130,-69,15306,-4289,7522,5615,3057,783,-71,-4765,3004,-1889,3003,7381,-367,-71,10539,-5596,-9410,-12996,-13836,-4652,-70,11476,1231,-631,8495,6234,3817,-71,-283,-11191,-5966,4098,5968,1076,-71,-13266,5254,-977,-19938,-15021,-1140,-68,4930,1466,2077,9059,2134,-77,-68,-7151,925,3377,22813,-10862,-70,-70,93,12446,-10276,7192,904,532,-71,71,9727,3513,-3890,-1401,1371,-72,2766,-3494,-4189,8885,4491,2219,-71,-166,-662,901,-3570,10740,513,-73,6727,-1161,9528,6191,-863,-1895,-73,1291,-4860,5105,10627,-3556,994,-76,6122,-226,-12508,-3375,-1471,-75,-75,-2558,-12834,13002,-13402,8917,785,-74,3698,-6616,6747,-3337,-4190,2930,-74,5744,-2516,-858,9308,-5663,-74,-75,-8627,-5136,5351,-12225,13034,-3890,-73,-19690,-1325,4028,-1141,7447,-2387,-72,-3503,5178,671,8665,344,-1103,-73,7150,2401,-11699,7681,5355,-567,-73,-1996,-378,9148,-799,-1711,-2848,-73,-48,7989,-190,8883,1248,2844,-75,-3812,2060,-4566,-6328,4017,3737,-75,2210,7268,-4005,-1295,-15288,5435,-74,-6652,3440,-13063,11574,-1311,-988,-73,6282,2059,-6748,-2942,4137,-779,-73,8820,-3088,1335,-6014,-8259,1763,-73,1696,-5497,-6838,-7105,-2270,1500,-71,2007,1444,5993,1199,1958,-2353,-72,-1744,5485,2907,9019,3343,255,-73,-6676,927,-552,6986,-6549,4503,-75,3734,-3815,6263,-6780,-6548,-76,-74,-6309,3316,-17407,-24545,1315,-2877,-68,2305,15286,-2507,-6509,4482,1080,-71,-3163,-13333,-10865,13190,-13263,2160,-68,-1769,2449,14858,4271,-4278,-406,-70,5802,1424,11782,-1734,-1667,2708,-72,-16117,5528,-6330,259,-1235,-1838,-69,-9133,-17366,8617,-5745,-1221,1751,-68,12594,-1247,10735,3605,-1919,636,-68,10811,-14301,-11693,-22934,-2758,-701,-66,-9930,6086,13218,1167,-12522,2624,-67,-13550,-6824,-3563,-16369,-7257,1140,-64,-11741,236,15457,-9103,13013,-1670,-63,4061,150,777,-12566,28264,-1528,-65,-2311,7243,8815,3307,-3783,-145,-66,-5104,9635,3444,1966,17909,-464,-67,-1513,-7782,1127,1728,8836,334,-68,-9243,2654,10579,2184,2228,440,-68,1615,14348,-476,-14374,-2999,143,-69,5620,10647,2898,-5110,17249,361,-71,366,-2497,6637,-3138,1203,345,-71,2415,499,-2224,475,3841,544,-71,-286,3441,-2516,-4918,-4731,1623,-70,8787,-2061,5613,4367,9236,-801,-72,3844,2736,-9251,3633,-19846,3874,-72,-2580,6214,-293,3051,10147,-397,-72,10979,1763,6287,1193,3870,-1310,-74,-824,-5564,-397,-293,3513,-2150,-74,749,4243,1133,3206,1532,52,-74,38,5763,-2535,-167,6461,-74,-74,1983,3832,-6273,-4527,7488,2194,-75,-8097,-18811,2521,-14179,3990,-1211,-73,-15965,10860,7417,17647,-4349,1157,-75,-10010,6369,-841,-15351,7443,-73,-74,2482,-8909,-12411,5694,-11192,-871,-71,4933,10842,3664,1399,11416,-540,-74,2915,3416,-4229,865,-1049,-75,-74,-124,19050,2803,5690,-5556,-243,-75,-1720,-6076,-791,1587,6407,-517,-76,8438,3402,8792,1714,-5015,810,-76,-1684,-1988,-473,-1523,-1957,1162,-76,1870,2050,-3894,-1536,-825,10,-75,2031,11173,-717,-4273,7373,-2163,-76,1130,-11325,-5926,-1251,-18982,-74,-73,-25531,-5143,1919,19089,-7392,-599,-71,-5576,11370,-24938,893,14337,3136,-74,11879,-8059,13129,-5394,-15577,1293,-73,5053,83,2609,14152,5761,708,-75,2584,-4018,10277,7661,2813,255,-76,-698,1997,6961,5324,3163,-5020,-78,-7556,5969,166,4168,143,2140,-78,-5053,-2315,-1260,4061,4552,-189,-77,3589,-11926,-30275,1300,11433,-753,-76,2072,-12540,7845,8188,15692,-77,-78,-4580,11708,1416,-1760,-9164,-674,-78,4555,717,3274,9243,2842,318,-79,2407,810,3953,-6972,6259,756,-79,10312,1704,4887,6466,-998,1667,-81,-926,3483,-1360,-2830,7783,-1938,-81,-348,-3228,-4983,-570,1434,905,-81,8746,2453,2103,-1217,-2415,784,-82,-17943,-10126,10100,-2804,13485,-221,-81,-5325,-867,4841,7146,1278,-693,-81,12310,-3866,-3190,4495,9557,561,-81,2361,-210,-228,1313,2131,-1821,-82,-9266,-1167,-1025,11318,-2776,1428,-82,-1658,-1272,3368,9602,-1604,1043,-82,-1006,-2947,1880,2694,7560,2500,-83,-117,-3009,-5338,-4977,8385,2789,-82,-27006,11874,4453,-8381,-17280,-750,-80,4281,19866,17580,7727,-4605,896,-83,485,6852,8655,-3191,128,-91,-84,3137,-4605,10127,-9941,-8485,-75,-83,-46985,-28989,-1493,-43693,-37531,-213,-74,24358,-7878,28234,-21623,-38028,-4091,-73,-83085,4702,-18998,-106887,39038,3004,-62,-63749,31431,-44995,21517,5259,3526,-59,-28333,69707,24250,31072,-39529,1750,-62,22898,3822,-28141,12225,-8201,2975,-64,43602,10717,4381,12269,251,-2675,-67,-3234,15233,-27702,7796,24368,-68,-68,206,-32425,18238,3259,-510,-1283,-67,18505,9548,16265,-18182,-10542,-68,-68,-20803,12524,-3891,11600,11239,-1963,-69,-3920,-3760,-20255,-8957,6759,-412,-67,38261,-7736,7831,-8667,-3099,3454,-69,13536,7660,9985,8469,-10025,-4318,-71,4679,18861,26291,-5504,29035,-75,-76,1807,-12903,-5692,-54443,6646,1216,-71,-1291,29911,4789,-2339,5241,63,-74,-3675,13130,-35653,9757,-9417,-710,-72,11232,-1317,3737,18201,-9339,2120,-73,17687,-13452,-1861,-8155,9644,2091,-74,9439,-1231,13405,-5268,-1717,-231,-75,5413,4485,-5389,-9384,-15161,-1053,-73,663,-6086,4351,-20251,-8908,-3142,-71,19133,1096,7364,-6460,3516,1,-72,4797,14131,13578,-6882,-11051,975,-74,311,-5191,5300,-9501,925,3081,-73,19429,-5053,8441,-2768,-3027,-74,-75,-9384,-1271,16046,-15409,-10397,-1246,-73,13211,-17573,19939,-8476,-449,-864,-72,4538,4618,-1361,-4372,-7212,-1351,-71,-30348,5567,-3916,-4058,3650,-115,-70,18967,-6921,-2665,-704,-3278,572,-71,11150,-5394,3279,7977,8490,-784,-73,9148,-6411,-3897,-17535,13942,-1877,-72,-5479,-3079,-13437,-743,7547,-72,-71,-24908,-10876,-36240,6319,-3647,102,-66,18365,24103,23084,12914,-9079,-34,-71,45918,12186,11303,-9030,3256,-723,-75,13060,-3612,-3449,-5846,1987,-1145,-76,1362,14564,169,-1182,3177,-1131,-77,-10387,7506,3515,-6437,6370,-156,-77,-2702,1795,-1164,1250,-7506,-1622,-76,-1916,5764,7940,3937,-6077,-1277,-77,-22347,10559,6824,4330,-213,-322,-77,12341,2346,-3283,-2159,-1132,-76,-77,-2374,-1257,16331,6594,5713,327,-79,-5209,178,2309,3661,-5948,558,-78,-496,3323,7926,-3345,-5039,-403,-79,-7352,8392,-18539,6961,-26384,-1391,-76,12726,17600,4810,11204,1089,381,-80,5129,-2480,-4379,2010,6263,1128,-80,8755,-1882,-4940,-5067,1580,-1960,-79,-4667,-1001,8205,-12788,-17919,3365,-78,23513,2695,-1304,-3324,589,3372,-80,21550,8016,10182,2850,-1584,644,-82,1269,4828,847,2894,-8313,457,-82,1888,-6152,216,3745,13597,581,-83,5553,5391,-2185,4287,-1516,-412,-83,5314,4911,-889,4597,4440,-736,-85,-4559,-406,3440,6399,9494,-97,-86,-2511,-20025,12303,3934,-1439,-935,-86,774,-2230,1373,1878,-5758,-85,-84,8454,-14491,20527,8202,7313,-232,-87,-927,-24661,-2926,7747,16502,-732,-87,-1711,-5922,-17886,14588,5973,1354,-87,5273,-2039,-3633,1875,7585,2859,-88,-6964,5139,4361,1126,5439,2719,-89,2094,-1344,1715,2095,6289,2470,-89,2450,3850,-1567,113,-13893,-89,-89,11219,4303,-10092,8257,2074,-530,-90,-5823,4195,-4411,6308,3225,2604,-89,1731,-9102,10071,-19634,18353,-810,-90,6448,526,440,-6792,-6897,-609,-89,-30247,12154,14856,2091,15681,41,-91,-288,-8283,4960,4382,-8744,-463,-90,2715,5535,4027,10776,1802,-90,2064,5232,7539,4412,743,-1447,-92,-4479,-6288,-13237,7490,729,-91,7548,-3510,-890,-4334,4424,21,-91,2498,-4926,3287,3163,-8199,-1104,-91,8817,-5962,-10172,-5562,-2633,589,-89,7841,-1583,-6388,1037,-9356,-978,-89,-23125,13651,14233,15169,-5980,-417,-90,1096,-25498,8978,-9945,4259,-190,-89,-9138,14425,-7504,25142,-3345,-409,-89,-357,-5719,5636,20633,10203,-394,-91,-5313,3937,752,-2542,6889,373,-92,1558,8950,-5466,7013,3093,-2033,-93,6241,10044,1907,5953,7469,1521,-93,319,-4452,-1648,2191,5760,298,-93,4645,5378,2822,-2165,-8914,3774,-94,-1557,-6174,-774,7155,-54962,-2572,-90,8716,-15249,12660,-2635,-7006,2195,-89,21180,31186,-2212,-3878,-5211,2155,-93,-7997,-5027,8470,12783,-17716,442,-92,-21296,24773,11003,10183,-995,-616,-94,11448,7299,-5290,2169,-3045,1179,-94,10607,6704,280,-14514,-1804,-94,-95,-12363,10511,5295,-6087,-11869,924,-93,6211,-15865,-370,-20530,-442,-92,-35568,8051,17577,6716,3345,1186,-91,13970,12750,173,-27128,-6422,-10683,-90,8373,5048,21133,-7893,-15839,1296,-91,-22686,28291,-2274,-16267,-8777,792,-90,-15958,-6167,-11029,22379,-3626,-90,-10926,-30610,23324,-17777,-40965,8039,-85,-18241,-664,29030,-2729,4334,-85,7325,9656,31497,11730,7521,3175,-90,-3360,-1718,7641,3831,-901,-90,7158,24979,-14642,-19413,7455,3169,-91,11688,-5394,-15261,435,15717,2735,-91,-9153,-8746,7731,1659,-3240,2021,-91,239,635,9846,-3491,-33616,-89,-89,-13762,-18644,17000,23149,-2235,-2016,-89,-11032,7906,2114,-16932,-17727,-1007,-87,-34690,8467,10160,-11943,35585,915,-87,-4088,16674,-32264,-10684,-2341,-86,22794,-16122,7629,17938,20372,-474,-89,7271,-13006,-5357,12211,-6979,-2284,-88,11591,-475,-6689,-27371,-38790,-85,-85,-33578,1834,15407,-35987,5624,-2711,-82,9284,10832,-8438,-959,39203,-430,-85,2893,-11310,-1986,-15890,9018,-3166,-84,4045,-22613,22264,25586,3026,865,-86,-9200,1028,-10036,-14083,30162,-2880,-85,3890,22540,-5233,7540,-3672,2087,-87,3734,-8706,19830,11091,16630,-3826,-89,-2179,-8154,12111,2556,-6033,-2529,-89,5241,-5342,10328,-276,7111,2448,-90,4783,9761,-7462,2464,-11820,5849,-90,-20353,-2333,8428,7450,-30364,-2453,-88,-9874,-9193,-17510,-12768,11987,-203,-86,-8182,3537,3918,4942,19696,-6244,-87,19254,-35134,-7625,-14615,894,-84,3503,-14206,-360,-10703,-24036,5942,-82,-8301,745,12417,-14875,-6059,-961,-81,13949,40663,-14528,-9785,-17636,2720,-82,-5200,137,-1689,14684,-3545,58,-82,21145,7110,-6618,3510,5981,3377,-84,16053,15987,-2559,-5268,15687,4527,-87,339,6046,-12121,-5414,28991,-5015,-87,7432,3557,-10587,38424,4991,-15255,-90,1760,8256,-11251,-538,14912,-2416,-91,-1951,16796,4811,655,-1045,1203,-92,-9265,-5528,23537,2696,-4028,-3163,-91,-9400,-11341,-2437,1134,2261,156,-90,1276,14748,-2413,-43892,-11457,-1910,-87,-1649,-1238,21681,-16388,-634,-520,-88,-155,961,-8827,13122,-13026,-965,-87,10975,8677,14352,20961,-91,-90,8269,-5689,10208,7163,7747,-160,-93,3564,49,-9098,-16616,11064,-474,-92,9960,-2891,-2717,4279,2658,896,-93,-5129,995,2836,8143,2404,1901,-93,-9596,12561,2009,3279,-7699,3520,-94,16274,-1047,4358,-4739,-1692,2528,-94,-90,-12367,-1073,4000,-19407,1515,-92,14251,-7323,-6048,8757,17864,177,-94,1223,-14596,-303,-990,-18027,298,-93,-24988,18584,-31851,31651,-18739,-1209,-91,12238,11658,-4839,2619,-12916,6889,-92,10033,262,13125,10003,11326,527,-95,5301,-3090,-584,4385,1468,397,-95,702,5994,-2677,10984,1569,-96,-96,-1606,3846,1769,-1236,6998,-96,-97,36,-7588,-13212,10326,5345,3020,-97,-422,-15567,733,-13741,19814,2191,-96,4354,-6037,-1622,438,5082,1345,-96,859,-3963,4805,13191,5882,110,-98,-2298,-14772,-16533,1146,21834,-774,-97,-2522,-9275,-15440,11557,21075,-97,-98,-5805,2136,-3895,899,-3151,-1075,-96,6891,8569,353,6427,3596,-6348,-98,-8921,-4012,-5756,420,-10488,6412,-97,-4335,6945,3843,2584,14315,1072,-98,-2549,-4380,-8126,-30117,-3756,449,-95,4846,3924,16975,6272,-1615,-1885,-96,-6484,8200,452,5926,4827,3316,-98,-218,6703,-9886,17904,2288,5033,-100,3688,-9620,-18210,-8392,2732,-752,-98,8371,-1162,3774,9346,-13029,559,-99,3295,-11982,-2148,-13347,-3689,1100,-97,4720,2394,9701,-7389,1397,1295,-98,13371,12393,-875,0,-6543,1333,-99,-1081,-1325,-5915,2210,5012,-98,-99,5464,-3763,-4860,15888,-1543,3617,-100,-10080,-5414,1964,-21093,1098,-960,-98,-5460,-13856,278,10465,610,-2579,-97,-8133,-13349,5693,-56,11911,-1673,-96,-1901,22959,2491,-800,-12883,4306,-98,6100,1227,-18800,-11847,-18501,-1242,-95,-714,9330,-3079,-10986,-11647,-547,-94,13834,2731,10588,29205,-8881,-1737,-97,1198,-1565,7748,7883,-3423,135,-97,7326,14856,326,-7945,10746,-892,-99,2957,-3850,4099,5813,4467,-606,-99,-6406,-5133,1850,8781,14445,3051,-100,-1598,6660,3033,1167,12430,-100,-101,4263,4106,3233,-33,-5113,-1136,-101,-659,6685,-6059,3107,-2413,-1298,-102,-131,2255,170,-3701,1920,3584,-103,-101,-1706,-5528,9533,-4833,1241,-100,7016,-2237,3069,-8774,7303,2918,-101,-5604,-3043,-6906,11466,4861,-102,-101,7514,-5546,18162,4519,15788,1495,-104,6539,7691,-8427,2728,8970,-2884,-105,-217,14779,2085,-1004,1885,-1219,-106,6070,-15963,6625,13369,4264,-1383,-107,1554,-3216,-3258,24518,2973,868,-108,-4843,-990,-3257,2867,9378,-189,-108,3958,-12796,5705,20563,-7707,-1739,-108,-3069,15252,3919,-4095,-8732,1156,-109,2175,3998,5993,13670,-10321,4374,-111,673,1649,4516,4381,1361,1337,-110,-2365,-13721,3722,-9280,-11735,1398,-108,5916,-10368,-2280,-2068,873,4887,-108,-756,-15682,-610,4128,-4343,1583,-108,13257,19044,-8044,-13255,15766,396,-109,-1733,-13591,-38,-4936,12249,-109,-108,10194,16033,3714,11076,13171,-2854,-112,341,-1281,9397,-6267,-1242,506,-112,3126,-1519,-8194,-815,-2324,-112,-112,2994,-7898,-17191,994,15408,-2145,-112,4829,-3669,22204,7892,-1256,-2036,-113,-9302,-2353,18652,-18414,-14114,7749,-111,7283,3578,-2384,12983,-8708,-113,-112,10071,-2011,-5663,-2416,-3642,-1232,-112,6490,-7472,7477,5373,-2288,-1510,-113,-565,-13851,19444,-1486,16431,-1310,-114,-10028,853,-10918,-14753,-11049,1341,-111,17306,3770,-21710,-5735,19734,-1725,-112,-7489,6647,16606,-24542,-36948,-110,-109,-36112,2532,13899,12837,7442,-382,-110,-2569,14004,10005,21731,4282,1337,-114,10570,-9368,2543,-2772,10909,1123,-113,-1755,-1061,1918,12683,9223,-1195,-114,2153,-20993,-13918,-15711,-24663,93,-110,15802,-7054,9930,11998,10353,-2882,-113,-1546,1902,-10260,29453,-23506,-1035,-112,4228,16692,-4935,15155,7664,513,-115,-12672,-11781,10427,-9785]}});
\ No newline at end of file
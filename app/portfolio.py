@@ -0,0 +1,214 @@
+import os
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from metrics import RISK_FREE_RATE, avg_annual_return
+from rolling import daily_returns, valuations_per_year
+
+# Pairwise statistics persisted next to the dashboard output, reused while the
+# data version they were computed for is current
+PAIRWISE_CACHE = 'output/pairwise_cache.npz'
+# Common valuation dates a pair needs before its covariance/correlation counts
+MIN_PERIODS = 20
+PORTFOLIO_COLUMNS = ['start', 'end', 'total_return', 'annual_return', 'volatility', 'sharpe_ratio', 'max_drawdown']
+
+
+def pairwise_moments(returns, min_periods=MIN_PERIODS):
+    # Pairwise-complete covariance and correlation of the rows of a (funds x
+    # dates) matrix, as DataFrame.cov()/corr() on its transpose: each pair only
+    # uses the dates both have a return on. Every term is a matrix product over
+    # the validity mask, so all pairs come out of a handful of BLAS calls.
+    # Returns (common date counts, covariance, correlation), NaN for pairs with
+    # fewer than min_periods common dates.
+    valid = ~np.isnan(returns)
+    mask = valid.astype(np.float64)
+    # Centre each fund first so the sums of squares don't cancel out
+    observed = mask.sum(axis=1, keepdims=True)
+    offset = np.where(valid, returns, 0.0).sum(axis=1, keepdims=True) / np.maximum(observed, 1)
+    x = np.where(valid, returns - offset, 0.0)
+
+    counts = mask @ mask.T
+    # sums[i, j]: sum of fund i's returns over the dates fund j also has one
+    sums = x @ mask.T
+    squares = (x * x) @ mask.T
+    products = x @ x.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        covariance = (products - sums * sums.T / counts) / (counts - 1)
+        variance = (squares - sums * sums / counts) / (counts - 1)
+        correlation = np.clip(covariance / np.sqrt(variance * variance.T), -1.0, 1.0)
+    enough = counts >= max(min_periods, 2)
+    np.fill_diagonal(correlation, 1.0)
+    return counts.astype(np.int64), np.where(enough, covariance, np.nan), np.where(enough, correlation, np.nan)
+
+
+class ReturnMatrix:
+    # Daily returns of every fund on the FundSeriesStore's shared calendar as one
+    # (funds x dates) float64 matrix. A fund's span runs from its first to its last
+    # valuation; outside it (e.g. before the VEGA funds launched) returns and
+    # prices are NaN. Inside it a return is taken against the previous valuation,
+    # so a date the fund wasn't valued on is NaN and the next return covers the gap.
+
+    def __init__(self, store, field='sale'):
+        prices = store.prices[field]
+        self.fund_names = list(store.fund_names)
+        self.fund_ids = dict(store.fund_ids)
+        self.calendar = store.calendar
+        self.returns = daily_returns(prices)
+
+        valid = ~np.isnan(prices)
+        columns = np.arange(prices.shape[1])
+        self.first = np.where(valid.any(axis=1), valid.argmax(axis=1), prices.shape[1])
+        self.last = prices.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)
+        live = (columns >= self.first[:, None]) & (columns <= self.last[:, None])
+        # Prices carried over gaps within each span: what a holding is worth
+        last_valid = np.maximum.accumulate(np.where(valid, columns, -1), axis=1)
+        self.held_prices = np.where(live, np.take_along_axis(prices, np.maximum(last_valid, 0), axis=1), np.nan)
+
+        digest = hashlib.sha1()
+        digest.update('\0'.join(self.fund_names).encode('utf-8'))
+        digest.update(self.calendar.tobytes())
+        digest.update(np.ascontiguousarray(prices).tobytes())
+        self.version = digest.hexdigest()[:16]
+        self._pairwise = {}
+
+    def pairwise(self, cache_path=PAIRWISE_CACHE, min_periods=MIN_PERIODS):
+        # (counts, covariance, correlation) from pairwise_moments, computed once per
+        # data version: kept in memory and, with a cache_path, on disk
+        key = f"{self.version}-{min_periods}"
+        if key in self._pairwise:
+            return self._pairwise[key]
+        result = self._load_pairwise(cache_path, key) if cache_path else None
+        if result is None:
+            result = pairwise_moments(self.returns, min_periods)
+            if cache_path:
+                self._save_pairwise(cache_path, key, result)
+        self._pairwise[key] = result
+        return result
+
+    def _load_pairwise(self, path, key):
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as cached:
+                if str(cached['version']) != key or cached['funds'].tolist() != self.fund_names:
+                    return None
+                return cached['counts'], cached['covariance'], cached['correlation']
+        except Exception as e:
+            print(f"Ignoring unreadable pairwise cache {path}: {e}")
+            return None
+
+    def _save_pairwise(self, path, key, result):
+        counts, covariance, correlation = result
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, version=key, funds=np.array(self.fund_names), counts=counts,
+                     covariance=covariance, correlation=correlation)
+        os.replace(tmp_path, path)
+
+    def correlation(self, funds=None, **kwargs):
+        return self._frame(self.pairwise(**kwargs)[2], funds)
+
+    def covariance(self, funds=None, **kwargs):
+        return self._frame(self.pairwise(**kwargs)[1], funds)
+
+    def _frame(self, matrix, funds):
+        funds = self.fund_names if funds is None else list(funds)
+        ids = [self.fund_id(fund) for fund in funds]
+        return pd.DataFrame(matrix[np.ix_(ids, ids)], index=funds, columns=funds)
+
+    def fund_id(self, fund):
+        if fund not in self.fund_ids:
+            raise ValueError(f"Unknown fund: {fund}")
+        return self.fund_ids[fund]
+
+    def weights(self, portfolios):
+        # [{fund: weight}] -> (portfolios x funds) matrix, each row scaled to sum to 1
+        weights = np.zeros((len(portfolios), len(self.fund_names)))
+        for row, portfolio in enumerate(portfolios):
+            for fund, weight in portfolio.items():
+                weights[row, self.fund_id(fund)] += weight
+            total = weights[row].sum()
+            if not np.isfinite(total) or total <= 0 or (weights[row] < 0).any():
+                raise ValueError(f"Portfolio weights must be non-negative with a positive sum: {portfolio}")
+            weights[row] /= total
+        return weights
+
+    def portfolio_values(self, weights, rebalance=True):
+        # Value of 1 invested in each portfolio (rows of weights), for all of them
+        # at once: (portfolios x dates), starting on the first date every fund
+        # it holds is valued and ending with the first of them to stop, NaN outside.
+        # rebalance=True restores the weights every day; False buys and holds.
+        # Returns (values, start, end) with start/end as calendar positions.
+        weights = np.asarray(weights, dtype=np.float64)
+        held = weights != 0
+        start = np.where(held, self.first, -1).max(axis=1)
+        end = np.where(held, self.last, len(self.calendar)).min(axis=1)
+        columns = np.arange(len(self.calendar))
+        active = (columns >= start[:, None]) & (columns <= end[:, None])
+
+        if rebalance:
+            # Unvalued dates leave a holding unchanged; the gap's return arrives later
+            portfolio_returns = weights @ np.nan_to_num(self.returns)
+            growth = np.where(active & (columns > start[:, None]), 1 + portfolio_returns, 1.0)
+            values = np.cumprod(growth, axis=1)
+        else:
+            # Units bought on the start date, valued at the carried prices
+            start_prices = self.held_prices[:, np.clip(start, 0, len(columns) - 1)].T
+            with np.errstate(invalid='ignore', divide='ignore'):
+                units = np.where(held, weights / start_prices, 0.0)
+            values = units @ np.nan_to_num(self.held_prices)
+        return np.where(active, values, np.nan), start, end
+
+    def evaluate(self, portfolios, rebalance=True, risk_free_rate=RISK_FREE_RATE):
+        # Summary per portfolio ({fund: weight} dicts) and the value matrix
+        weights = self.weights(portfolios)
+        values, start, end = self.portfolio_values(weights, rebalance)
+        return portfolio_summary(values, start, end, self.calendar, risk_free_rate), values
+
+
+def _mean_std(matrix):
+    # Row-wise mean and sample std, NaNs skipped
+    valid = ~np.isnan(matrix)
+    counts = valid.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, matrix, 0.0).sum(axis=1) / counts
+        deviations = np.where(valid, matrix - mean[:, None], 0.0)
+        std = np.sqrt((deviations ** 2).sum(axis=1) / (counts - 1))
+    return mean, np.where(counts > 1, std, np.nan)
+
+
+def portfolio_summary(values, start, end, calendar, risk_free_rate=RISK_FREE_RATE):
+    # Total and annualised return, annualised volatility, Sharpe ratio and maximum
+    # drawdown of each row of portfolio_values(). Volatility and Sharpe are
+    # annualised with the portfolio's valuations per year, as in rolling.py (MSE
+    # funds are valued on calendar days, not 252 trading days a year).
+    rows = np.arange(len(values))
+    empty = start > end
+    first, last = np.clip(start, 0, None), np.clip(end, 0, None)
+    days = (calendar.astype('datetime64[D]') - calendar[0].astype('datetime64[D]')).astype(np.int64)
+    per_year = valuations_per_year(values, days)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        daily = values[:, 1:] / values[:, :-1] - 1
+        _, std = _mean_std(daily)
+        mean_excess, std_excess = _mean_std(daily - (risk_free_rate / per_year)[:, None])
+        volatility = std * np.sqrt(per_year)
+        sharpe_ratio = np.sqrt(per_year) * mean_excess / std_excess
+        drawdown = values / np.fmax.accumulate(values, axis=1) - 1
+        max_drawdown = np.where(np.isnan(drawdown), np.inf, drawdown).min(axis=1, initial=np.inf)
+
+        total_return = values[rows, last] / values[rows, first] - 1
+        years = (calendar[last] - calendar[first]).astype('timedelta64[D]').astype(np.float64) / 365
+        annual_return = np.where(years > 0, avg_annual_return(values[rows, first], values[rows, last], years), np.nan)
+
+    return pd.DataFrame({
+        'start': pd.to_datetime(calendar[first]).where(~empty),
+        'end': pd.to_datetime(calendar[last]).where(~empty),
+        'total_return': np.where(empty, np.nan, total_return),
+        'annual_return': np.where(empty, np.nan, annual_return),
+        'volatility': np.where(empty, np.nan, volatility),
+        'sharpe_ratio': np.where(empty, np.nan, sharpe_ratio),
+        'max_drawdown': np.where(empty | np.isinf(max_drawdown), np.nan, max_drawdown),
+    }, columns=PORTFOLIO_COLUMNS)
@@ -0,0 +1,491 @@
+import os
+import json
+import math
+import time
+import asyncio
+import hashlib
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs, unquote
+
+import numpy as np
+import pandas as pd
+
+from fund_loader import load_fund_data, exclude_quarantined, STORE_PATH, CSV_PATH, QUARANTINE_PATH
+from metrics import FUND_COLUMN, DATE_COLUMN, PRICE_COLUMN, compute_metrics, fund_slices, return_series
+from benchmarks import CACHE_DIR, YahooBenchmark, FundBenchmark, benchmark_returns
+from fund_series_store import FundSeriesStore
+from series_pyramid import LEVELS, build_pyramid, lttb_series
+from portfolio import PAIRWISE_CACHE, ReturnMatrix
+from js_export import (RESOLUTIONS, SEPARATE_LEVELS, INDEX_FILENAME, SERIES_DIR, index_data, resample_series,
+                       series_filename, series_script, index_script, level_files)
+
+# Local query service over the fund dataset. Loads the store (or CSV) once,
+# answers JSON queries and serves app.html with live output/ scripts in place of
+# the ones baked by analysis.py:
+#
+#   python query_service.py --port 8000        # then open http://127.0.0.1:8000/
+#
+#   GET /api/funds
+#   GET /api/series?fund=<name>&start=2020-01-01&end=2024-12-31&resolution=daily|weekly|lttb|monthly
+#   GET /api/metrics?date=2023-12-31
+#   GET /api/top?metric=sharpe_ratio&n=10&order=top|bottom&date=2023-12-31
+#   GET /api/correlation?funds=["NLB BRIK","NLB Global Emerging Markets"]&statistic=correlation|covariance
+#   GET /api/portfolio?weights={"KB Invest - Balanced":0.6,"KB Invest - Bonds":0.4}&rebalance=daily|none
+#       (weights may also be a list of such objects, evaluated together)
+#
+# Responses are cached (LRU) with ETags. The data files are checked for changes
+# at most every --check-interval seconds; when the crawler writes a new store or
+# CSV the index is reloaded and the cache dropped.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESOLUTION = 'monthly'
+DEFAULT_TOP_N = 5
+SERIES_PREFIX = f"/output/{SERIES_DIR}/"
+
+
+class QueryError(Exception):
+    # Bad query parameters, reported to the client as 400
+    pass
+
+
+def _json_safe(value):
+    # NaN/inf aren't valid JSON; send them as null
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, (float, np.floating)):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def _date(params, name, default=None):
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        return pd.Timestamp(value)
+    except ValueError:
+        raise QueryError(f"Invalid {name}: {value}")
+
+
+def _json(params, name, default=None):
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        return json.loads(value)
+    except ValueError:
+        raise QueryError(f"Invalid {name}: {value}")
+
+
+def data_signature(paths):
+    # Identity of the data files; write_store swaps in a new directory and the
+    # crawler rewrites the CSV and the quarantine, so each changes inode, size
+    # or mtime
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            signature.append((path, None))
+    return tuple(signature)
+
+
+class FundIndex:
+    # The combined dataset sorted by fund and valuation date, with each fund's row
+    # range and dates indexed so range queries are two binary searches
+
+    def __init__(self, df, benchmark_cache=CACHE_DIR):
+        self.df = df.sort_values([FUND_COLUMN, DATE_COLUMN]).reset_index(drop=True)
+        funds, starts, ends = fund_slices(self.df)
+        self.returns = return_series(self.df[PRICE_COLUMN].to_numpy(), starts, ends)
+        self.df['Daily Return'] = self.returns.daily
+        self.df['Cumulative Return'] = self.returns.cumulative
+
+        self.funds = funds
+        self.slices = {fund: (start, end) for fund, start, end in zip(funds, starts, ends)}
+        self.dates = self.df[DATE_COLUMN].to_numpy()
+        self.current_date = self.df[DATE_COLUMN].max()
+        self.benchmark_cache = benchmark_cache
+        self._store = None
+        self._pyramid = None
+        self._return_matrix = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def load(cls, store_path=STORE_PATH, csv_path=CSV_PATH, benchmark_cache=CACHE_DIR,
+             quarantine_path=QUARANTINE_PATH):
+        # The rows analysis.py uses: the quarantined ones are left out
+        df, quarantined = exclude_quarantined(load_fund_data(store_path=store_path, csv_path=csv_path),
+                                              quarantine_path)
+        if quarantined:
+            logging.info(f"Left out {quarantined} rows quarantined by the data quality checks")
+        return cls(df, benchmark_cache)
+
+    def fund_rows(self, fund, start=None, end=None):
+        if fund not in self.slices:
+            raise QueryError(f"Unknown fund: {fund}")
+        first, last = self.slices[fund]
+        dates = self.dates[first:last]
+        lo = first + (np.searchsorted(dates, np.datetime64(start), side='left') if start is not None else 0)
+        hi = first + np.searchsorted(dates, np.datetime64(end), side='right') if end is not None else last
+        return self.df.iloc[lo:max(lo, hi)]
+
+    def fund_list(self):
+        return [{
+            'fund': fund,
+            'first_date': pd.Timestamp(self.dates[start]),
+            'last_date': pd.Timestamp(self.dates[end - 1]),
+            'rows': int(end - start),
+        } for fund, (start, end) in self.slices.items()]
+
+    def series(self, fund, start=None, end=None, resolution=DEFAULT_RESOLUTION):
+        if resolution not in LEVELS:
+            raise QueryError(f"Unknown resolution: {resolution} (expected one of {', '.join(LEVELS)})")
+        if resolution not in RESOLUTIONS:
+            # LTTB of the requested range rather than a cut of the whole history's
+            return lttb_series(resample_series(self.fund_rows(fund, start, end), 'daily'))
+        return resample_series(self.fund_rows(fund, start, end), resolution)
+
+    def store(self):
+        # The fund x date arrays behind the pyramid and the return matrix; built on first use
+        with self._lock:
+            if self._store is None:
+                self._store = FundSeriesStore.from_frame(self.df)
+            return self._store
+
+    def pyramid(self):
+        # Every fund's chart levels, as analysis.py exports them
+        with self._lock:
+            if self._pyramid is None:
+                self._pyramid = build_pyramid(self.store())
+            return self._pyramid
+
+    def return_matrix(self):
+        with self._lock:
+            if self._return_matrix is None:
+                self._return_matrix = ReturnMatrix(self.store())
+            return self._return_matrix
+
+    def correlation(self, funds=None, statistic='correlation'):
+        if statistic not in ('correlation', 'covariance'):
+            raise QueryError(f"Unknown statistic: {statistic}")
+        if funds is not None and not (isinstance(funds, list) and all(isinstance(fund, str) for fund in funds)):
+            raise QueryError("funds must be a list of fund names")
+        matrix = self.return_matrix()
+        # Shares analysis.py's cache when both run on the same data version
+        cache_path = os.path.join(APP_DIR, PAIRWISE_CACHE)
+        try:
+            with self._lock:
+                frame = getattr(matrix, statistic)(funds, cache_path=cache_path)
+        except ValueError as e:
+            raise QueryError(str(e))
+        return {'version': matrix.version, 'statistic': statistic, 'funds': list(frame.index),
+                'matrix': frame.to_numpy().tolist()}
+
+    def portfolios(self, weights, rebalance=True):
+        # weights: {fund: weight} or a list of them; value series start at 1
+        portfolios = weights if isinstance(weights, list) else [weights]
+        if not portfolios or not all(isinstance(p, dict) and p and all(isinstance(w, (int, float)) for w in p.values())
+                                     for p in portfolios):
+            raise QueryError("weights must be a {fund: weight} object or a list of them")
+        matrix = self.return_matrix()
+        try:
+            summary, values = matrix.evaluate(portfolios, rebalance=rebalance)
+        except ValueError as e:
+            raise QueryError(str(e))
+        results = []
+        for row, (portfolio, record) in enumerate(zip(portfolios, summary.to_dict('records'))):
+            active = ~np.isnan(values[row])
+            results.append(dict(record, weights=portfolio,
+                                start=record['start'] if active.any() else None,
+                                end=record['end'] if active.any() else None,
+                                dates=np.datetime_as_string(matrix.calendar[active], unit='D').tolist(),
+                                values=values[row, active].tolist()))
+        return {'rebalance': 'daily' if rebalance else 'none', 'portfolios': results}
+
+    def sp500(self, as_of):
+        nan = float('nan')
+        try:
+            history = YahooBenchmark('sp500', '^GSPC', cache_dir=self.benchmark_cache, offline=True).history(until=as_of)
+            return benchmark_returns(history, as_of, 'sp500')
+        except Exception as e:
+            logging.warning(f"No cached S&P 500 series for {as_of:%Y-%m-%d}: {e}")
+            return {'ytd_return': nan, '5y_return': nan, '10y_return': nan}
+
+    def metrics(self, as_of=None):
+        # compute_metrics over the rows valued on or before as_of; the frame is
+        # sorted by fund then date, so the mask keeps each fund's rows contiguous
+        if as_of is None or as_of >= self.current_date:
+            df, returns, current_date = self.df, self.returns, self.current_date
+        else:
+            df = self.df[self.dates <= np.datetime64(as_of)]
+            if df.empty:
+                raise QueryError(f"No valuations on or before {as_of:%Y-%m-%d}")
+            returns, current_date = None, df[DATE_COLUMN].max()
+        sp500 = self.sp500(current_date)
+        metrics_df = compute_metrics(df, current_date, (sp500['ytd_return'], sp500['5y_return'], sp500['10y_return']),
+                                     returns=returns)
+        return metrics_df, sp500, current_date
+
+    def top(self, metric, n=DEFAULT_TOP_N, as_of=None, bottom=False):
+        metrics_df, _, current_date = self.metrics(as_of)
+        if metric not in metrics_df.columns or metric == 'fund':
+            raise QueryError(f"Unknown metric: {metric}")
+        ranked = metrics_df.nsmallest(n, metric) if bottom else metrics_df.nlargest(n, metric)
+        return {'date': current_date, 'metric': metric, 'funds': ranked[['fund', metric]].to_dict('records')}
+
+    def index_script(self):
+        # Same content as analysis.py's baked output/fund_index.js
+        metrics_df, sp500, current_date = self.metrics()
+        benchmarks = {'sp500': sp500}
+        for benchmark in [FundBenchmark('mbi10', 'KB Invest - MBI 10', self.df)]:
+            try:
+                benchmarks[benchmark.name] = benchmark_returns(benchmark.history(until=current_date), current_date,
+                                                               benchmark.name)
+            except Exception as e:
+                logging.warning(f"Skipping benchmark {benchmark.name}: {e}")
+        series_files = {fund: level_files(fund, LEVELS) for fund in self.funds}
+        return index_script(index_data(metrics_df, sp500, benchmarks), series_files)
+
+    def series_script(self, path):
+        # path below output/funds/: <fund>.js, or <level>/<fund>.js for SEPARATE_LEVELS
+        level, _, filename = path.rpartition('/')
+        if level and level not in SEPARATE_LEVELS:
+            raise KeyError(path)
+        for fund in self.funds:
+            if series_filename(fund) == filename:
+                levels = self.pyramid()[fund]
+                wanted = [level] if level else [name for name in LEVELS if name not in SEPARATE_LEVELS]
+                return series_script(fund, {name: levels[name] for name in wanted})
+        raise KeyError(path)
+
+
+class ResponseCache:
+    # Least-recently-used cache of rendered responses, keyed by request target
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class QueryService:
+
+    def __init__(self, store_path=STORE_PATH, csv_path=CSV_PATH, cache_size=256, check_interval=2.0,
+                 benchmark_cache=CACHE_DIR, static_dir=APP_DIR, quarantine_path=QUARANTINE_PATH):
+        self.store_path = store_path
+        self.csv_path = csv_path
+        self.quarantine_path = quarantine_path
+        self.benchmark_cache = benchmark_cache
+        self.static_dir = static_dir
+        self.check_interval = check_interval
+        self.cache = ResponseCache(cache_size)
+        self.index = None
+        self.signature = None
+        self.version = None
+        self._checked = 0.0
+        self._reload_lock = asyncio.Lock()
+
+    async def ensure_current(self):
+        # Reload the index (and drop every cached response) when the data files change
+        now = time.monotonic()
+        if self.index is not None and now - self._checked < self.check_interval:
+            return
+        async with self._reload_lock:
+            self._checked = time.monotonic()
+            signature = data_signature([self.store_path, self.csv_path, self.quarantine_path])
+            if self.index is not None and signature == self.signature:
+                return
+            started = time.perf_counter()
+            self.index = await asyncio.to_thread(FundIndex.load, self.store_path, self.csv_path, self.benchmark_cache,
+                                                 self.quarantine_path)
+            self.signature = signature
+            self.version = hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:12]
+            self.cache.clear()
+            logging.info(f"Loaded {len(self.index.df)} rows for {len(self.index.funds)} funds "
+                         f"in {time.perf_counter() - started:.2f}s (version {self.version})")
+
+    def route(self, path, params):
+        # Returns (content type, body builder) for a request path
+        index = self.index
+        if path == '/api/funds':
+            return 'application/json', lambda: index.fund_list()
+        if path == '/api/series':
+            if 'fund' not in params:
+                raise QueryError("Missing fund")
+            return 'application/json', lambda: index.series(
+                params['fund'], _date(params, 'start'), _date(params, 'end'),
+                params.get('resolution', DEFAULT_RESOLUTION))
+        if path == '/api/metrics':
+            def metrics():
+                metrics_df, sp500, current_date = index.metrics(_date(params, 'date'))
+                return {'date': current_date, 'sp500': sp500, 'funds': metrics_df.to_dict('records')}
+            return 'application/json', metrics
+        if path == '/api/top':
+            try:
+                n = int(params.get('n', DEFAULT_TOP_N))
+            except ValueError:
+                raise QueryError(f"Invalid n: {params['n']}")
+            order = params.get('order', 'top')
+            if order not in ('top', 'bottom'):
+                raise QueryError(f"Invalid order: {order}")
+            return 'application/json', lambda: index.top(
+                params.get('metric', 'five_year_return'), n, _date(params, 'date'), bottom=order == 'bottom')
+        if path == '/api/correlation':
+            return 'application/json', lambda: index.correlation(
+                _json(params, 'funds'), params.get('statistic', 'correlation'))
+        if path == '/api/portfolio':
+            if 'weights' not in params:
+                raise QueryError("Missing weights")
+            rebalance = params.get('rebalance', 'daily')
+            if rebalance not in ('daily', 'none'):
+                raise QueryError(f"Invalid rebalance: {rebalance}")
+            return 'application/json', lambda: index.portfolios(_json(params, 'weights'), rebalance == 'daily')
+        if path == f"/output/{INDEX_FILENAME}":
+            return 'application/javascript', index.index_script
+        if path.startswith(SERIES_PREFIX):
+            return 'application/javascript', lambda: index.series_script(path[len(SERIES_PREFIX):])
+        return None
+
+    def render(self, path, params):
+        route = self.route(path, params)
+        if route is None:
+            return None
+        content_type, build = route
+        body = build()
+        if content_type == 'application/json':
+            body = json.dumps(_json_safe(body), separators=(',', ':'))
+        payload = body.encode('utf-8')
+        # The data version is part of the tag, so clients revalidate after a reload
+        etag = f'"{self.version}-{hashlib.sha1(payload).hexdigest()[:16]}"'
+        return content_type, payload, etag
+
+    async def respond(self, method, target, headers):
+        split = urlsplit(target)
+        path = unquote(split.path)
+        params = {k: v[-1] for k, v in parse_qs(split.query).items()}
+
+        if path in ('/', '/app.html'):
+            with open(os.path.join(self.static_dir, 'app.html'), 'rb') as f:
+                return 200, {'Content-Type': 'text/html; charset=utf-8'}, f.read()
+
+        await self.ensure_current()
+        key = (path, tuple(sorted(params.items())))
+        entry = self.cache.get(key)
+        if entry is None:
+            try:
+                entry = await asyncio.to_thread(self.render, path, params)
+            except QueryError as e:
+                return 400, {'Content-Type': 'application/json'}, json.dumps({'error': str(e)}).encode('utf-8')
+            except KeyError:
+                entry = None
+            if entry is None:
+                return 404, {'Content-Type': 'application/json'}, b'{"error":"Not found"}'
+            self.cache.put(key, entry)
+
+        content_type, payload, etag = entry
+        headers_out = {
+            'Content-Type': f"{content_type}; charset=utf-8",
+            'ETag': etag,
+            'Cache-Control': 'no-cache',
+        }
+        if etag in [tag.strip() for tag in headers.get('if-none-match', '').split(',')]:
+            return 304, headers_out, b''
+        return 200, headers_out, payload if method == 'GET' else b''
+
+    async def handle(self, reader, writer):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1')
+                if line in ('\r\n', '\n', ''):
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            parts = request_line.split()
+            if len(parts) != 3:
+                return
+            method, target, _ = parts
+            if method not in ('GET', 'HEAD'):
+                status, headers_out, payload = 405, {'Allow': 'GET, HEAD'}, b''
+            else:
+                try:
+                    status, headers_out, payload = await self.respond(method, target, headers)
+                except Exception as e:
+                    logging.exception(f"Failed to answer {target}")
+                    status, headers_out, payload = 500, {'Content-Type': 'application/json'}, \
+                        json.dumps({'error': str(e)}).encode('utf-8')
+
+            reason = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+                      405: 'Method Not Allowed', 500: 'Internal Server Error'}[status]
+            head = [f"HTTP/1.1 {status} {reason}", f"Content-Length: {len(payload)}", 'Connection: close']
+            head += [f"{name}: {value}" for name, value in headers_out.items()]
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload)
+            await writer.drain()
+            logging.debug(f"{method} {target} {status}")
+        finally:
+            writer.close()
+
+
+async def serve(host='127.0.0.1', port=8000, **options):
+    service = QueryService(**options)
+    await service.ensure_current()
+    server = await asyncio.start_server(service.handle, host, port)
+    logging.info(f"Serving on http://{host}:{server.sockets[0].getsockname()[1]}/")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve fund queries and a live app.html")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--store', default=STORE_PATH, help="columnar store written by the crawler")
+    parser.add_argument('--csv', default=CSV_PATH, help="combined CSV, used when there's no store")
+    parser.add_argument('--quarantine', default=QUARANTINE_PATH,
+                        help="data quality quarantine; its excluded rows are left out")
+    parser.add_argument('--benchmarks', default=CACHE_DIR, help="cached benchmark series directory")
+    parser.add_argument('--cache-size', type=int, default=256, help="responses kept in the LRU cache")
+    parser.add_argument('--check-interval', type=float, default=2.0,
+                        help="seconds between checks of the data files for new crawls")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    asyncio.run(serve(args.host, args.port, store_path=args.store, csv_path=args.csv,
+                      cache_size=args.cache_size, check_interval=args.check_interval,
+                      benchmark_cache=args.benchmarks, quarantine_path=args.quarantine))
+
+
+if __name__ == "__main__":
+    main()
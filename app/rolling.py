@@ -0,0 +1,171 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from metrics import FUND_COLUMN, DATE_COLUMN, RISK_FREE_RATE
+
+# Window lengths in calendar days. MSE funds are valued on weekends too, so
+# trading-day counts (21/63/252/756) would cover well under the labelled period.
+WINDOWS = {'1m': 30, '3m': 91, '1y': 365, '3y': 1095}
+METRICS = ['volatility', 'sharpe', 'drawdown', 'spread']
+
+# Persisted next to the dashboard output; Arrow IPC when pyarrow is available so
+# readers can memory-map it, CSV otherwise
+ROLLING_PATH = 'output/rolling_metrics'
+
+
+def daily_returns(price_matrix):
+    # Return against each fund's previous valuation in the matrix, carried across
+    # dates the fund has no price for
+    columns = np.arange(price_matrix.shape[1])
+    last_valid = np.maximum.accumulate(np.where(np.isnan(price_matrix), -1, columns), axis=1)
+    previous = np.full(price_matrix.shape, -1)
+    previous[:, 1:] = last_valid[:, :-1]
+    previous_price = np.take_along_axis(price_matrix, np.maximum(previous, 0), axis=1)
+    return np.where(previous >= 0, price_matrix / previous_price - 1, np.nan)
+
+
+def _window_sums(matrix, window):
+    # Sum over the trailing window for every column from one cumulative sum:
+    # sum[t] = cumsum[t] - cumsum[t - window]. NaNs count as 0.
+    cumulative = np.zeros((matrix.shape[0], matrix.shape[1] + 1))
+    np.cumsum(np.nan_to_num(matrix), axis=1, out=cumulative[:, 1:])
+    lagged = np.maximum(np.arange(matrix.shape[1]) + 1 - window, 0)
+    return cumulative[:, 1:] - cumulative[:, lagged]
+
+
+def rolling_mean_std(matrix, window, min_periods):
+    # Trailing mean and sample std, NaNs skipped. Each fund is centred on its
+    # overall mean first so the sum-of-squares difference doesn't cancel out.
+    valid = ~np.isnan(matrix)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        offset = np.nanmean(matrix, axis=1, keepdims=True)
+    centred = matrix - np.nan_to_num(offset)
+    counts = _window_sums(valid.astype(np.float64), window)
+    sums = _window_sums(centred, window)
+    squares = _window_sums(centred ** 2, window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sums / counts
+        variance = (squares - sums * mean) / (counts - 1)
+    std = np.sqrt(np.maximum(variance, 0.0))
+    enough = counts >= min_periods
+    return np.where(enough, mean + np.nan_to_num(offset), np.nan), np.where(enough & (counts > 1), std, np.nan)
+
+
+def rolling_max(matrix, window):
+    # Trailing maximum (NaNs skipped) in O(n) per fund with the van Herk/Gil-Werman
+    # block trick: max over [t - window + 1, t] is the max of the suffix maximum of
+    # the block containing the window start and the prefix maximum up to t.
+    n_funds, n_dates = matrix.shape
+    if n_dates == 0:
+        return matrix.copy()
+    window = min(window, n_dates)
+    n_blocks = -(-n_dates // window)
+    padded = np.full((n_funds, n_blocks * window), -np.inf)
+    padded[:, :n_dates] = np.where(np.isnan(matrix), -np.inf, matrix)
+    blocks = padded.reshape(n_funds, n_blocks, window)
+    prefix = np.maximum.accumulate(blocks, axis=2).reshape(n_funds, -1)[:, :n_dates]
+    suffix = np.maximum.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(n_funds, -1)
+
+    result = np.empty_like(prefix)
+    # Windows that start before the first date are plain running maxima
+    result[:, :window - 1] = np.maximum.accumulate(prefix[:, :window - 1], axis=1)
+    result[:, window - 1:] = np.maximum(suffix[:, :n_dates - window + 1], prefix[:, window - 1:])
+    return np.where(np.isinf(result), np.nan, result)
+
+
+def valuations_per_year(price_matrix, days):
+    # Each fund's observed valuation frequency over its history, as
+    # monte_carlo.steps_per_year: (valuations - 1) / years from first to last.
+    # days: the matrix columns as day numbers.
+    valid = ~np.isnan(price_matrix)
+    counts = valid.sum(axis=1)
+    first = days[valid.argmax(axis=1)]
+    last = days[price_matrix.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(last > first, (counts - 1) / ((last - first) / 365.25), np.nan)
+
+
+def _daily_grid(matrix, days):
+    # The matrix spread over one column per calendar day, so a window of n days
+    # is n columns even where no fund was valued
+    grid = np.full((matrix.shape[0], int(days[-1]) + 1 if len(days) else 0), np.nan)
+    grid[:, days] = matrix
+    return grid
+
+
+def compute_rolling(store, windows=WINDOWS, risk_free_rate=RISK_FREE_RATE):
+    # Rolling volatility, Sharpe ratio, drawdown from the window's peak and average
+    # sale/buy spread for every fund and valuation date of a FundSeriesStore.
+    # Windows are in calendar days; volatility and Sharpe are annualised with
+    # each fund's valuations per year. Returns one row per fund and valuation
+    # date with a <metric>_<window> column for each combination.
+    calendar = store.calendar.astype('datetime64[D]')
+    days = (calendar - calendar[0]).astype(np.int64) if len(calendar) else np.zeros(0, dtype=np.int64)
+    per_year = valuations_per_year(store.prices['sale'], days)[:, None]
+    price_matrix = _daily_grid(store.prices['sale'], days)
+    excess_matrix = daily_returns(price_matrix) - risk_free_rate / per_year
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spread_matrix = (price_matrix - _daily_grid(store.prices['buy'], days)) / price_matrix
+
+    row_fund, date_index = np.nonzero(~np.isnan(store.prices['sale']))
+    column = days[date_index]
+    result = {
+        FUND_COLUMN: np.asarray(store.fund_names, dtype=object)[row_fund],
+        DATE_COLUMN: store.calendar[date_index].astype('datetime64[ns]'),
+    }
+    for label, window in windows.items():
+        # A window needs at least half of the valuations the fund usually has in it
+        min_periods = np.maximum(2, np.nan_to_num(window * per_year / 365.25) // 2)
+        mean, std = rolling_mean_std(excess_matrix, window, min_periods)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sharpe = np.sqrt(per_year) * mean / std
+            drawdown = price_matrix / rolling_max(price_matrix, window) - 1
+        spread_mean, _ = rolling_mean_std(spread_matrix, window, min_periods)
+
+        matrices = {
+            'volatility': std * np.sqrt(per_year),
+            'sharpe': sharpe,
+            'drawdown': drawdown,
+            'spread': spread_mean,
+        }
+        for metric in METRICS:
+            # Back from the aligned matrix to one value per fund and valuation date
+            result[f"{metric}_{label}"] = matrices[metric][row_fund, column]
+
+    return pd.DataFrame(result)
+
+
+def write_rolling(rolling, path=ROLLING_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError:
+        target = path + '.csv'
+        rolling.to_csv(target + '.tmp', index=False)
+    else:
+        target = path + '.arrow'
+        table = pa.Table.from_pandas(rolling.astype({FUND_COLUMN: 'category'}), preserve_index=False)
+        feather.write_feather(table, target + '.tmp', compression='uncompressed')
+    os.replace(target + '.tmp', target)
+    return target
+
+
+def read_rolling(path=ROLLING_PATH, funds=None, start=None, end=None, columns=None):
+    # Reader for write_rolling's output, e.g. columns=['sharpe_1y', 'volatility_1y']
+    if columns is not None:
+        columns = [FUND_COLUMN, DATE_COLUMN] + [c for c in columns if c not in (FUND_COLUMN, DATE_COLUMN)]
+    if os.path.exists(path + '.arrow'):
+        import pyarrow.feather as feather
+        rolling = feather.read_table(path + '.arrow', columns=columns, memory_map=True).to_pandas()
+    else:
+        rolling = pd.read_csv(path + '.csv', usecols=columns, parse_dates=[DATE_COLUMN])
+    if funds is not None:
+        rolling = rolling[rolling[FUND_COLUMN].isin(list(funds))]
+    if start is not None:
+        rolling = rolling[rolling[DATE_COLUMN] >= pd.Timestamp(start)]
+    if end is not None:
+        rolling = rolling[rolling[DATE_COLUMN] <= pd.Timestamp(end)]
+    return rolling.reset_index(drop=True)
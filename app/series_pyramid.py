@@ -0,0 +1,136 @@
+import numpy as np
+
+# Chart levels per fund, densest first: every valuation, the last valuation of
+# each week (ending Sunday, as pandas 'W') and month, and a fixed-size
+# largest-triangle-three-buckets downsample of the whole history
+LEVELS = ['daily', 'weekly', 'lttb', 'monthly']
+PERIOD_UNITS = {'weekly': 'W', 'monthly': 'M'}
+LTTB_POINTS = 500
+
+
+def _periods(calendar, unit):
+    # Period number of every calendar date, and a function from period numbers
+    # to the period's last day (the label pandas' resample gives it)
+    days = calendar.astype(np.int64)
+    if unit == 'W':
+        # 1970-01-01 was a Thursday, so Monday-to-Sunday weeks start at day -3
+        return (days + 3) // 7, lambda ids: (ids * 7 + 3).astype('datetime64[D]')
+    months = calendar.astype('datetime64[M]').astype(np.int64)
+    return months, lambda ids: (ids + 1).astype('datetime64[M]').astype('datetime64[D]') - np.timedelta64(1, 'D')
+
+
+def period_last(store, unit, field='sale'):
+    # Last valuation of every fund in every period, for all funds at once:
+    # (period ends, funds x periods matrix, first period, end period) with the
+    # fund's own span being [first, end) - from its first to its last valuation,
+    # NaN for periods in between without one
+    matrix = store.prices[field]
+    ids, period_end = _periods(store.calendar, unit)
+    funds, columns = matrix.shape
+    if columns == 0:
+        return np.array([], dtype='datetime64[D]'), np.empty((funds, 0)), np.zeros(funds, int), np.zeros(funds, int)
+    id_range = np.arange(ids[0], ids[-1] + 1)
+
+    valid = ~np.isnan(matrix)
+    last_valued = np.maximum.accumulate(np.where(valid, np.arange(columns), -1), axis=1)
+    position = last_valued[:, np.searchsorted(ids, id_range, side='right') - 1]
+    clipped = np.maximum(position, 0)
+    in_period = (position >= 0) & (ids[clipped] == id_range)
+    values = np.where(in_period, np.take_along_axis(matrix, clipped, axis=1), np.nan)
+
+    valued = valid.any(axis=1)
+    first = np.where(valued, ids[valid.argmax(axis=1)] - ids[0], 0)
+    end = np.where(valued, ids[columns - 1 - valid[:, ::-1].argmax(axis=1)] - ids[0] + 1, 0)
+    return period_end(id_range), values, first, end
+
+
+def lttb(x, y, lengths, points=LTTB_POINTS):
+    # Largest-triangle-three-buckets over many series at once. x, y: (series x
+    # longest) arrays, row i holding lengths[i] values; returns (series x points)
+    # indices of the kept values and how many of each row are used. Series of at
+    # most `points` values are kept whole.
+    #
+    # LTTB keeps the first and last value and one per bucket in between: the one
+    # making the largest triangle with the previously kept value and the next
+    # bucket's mean. That step is sequential over buckets, so the loop runs over
+    # buckets with every long series advanced together.
+    lengths = np.asarray(lengths, dtype=np.int64)
+    kept = np.minimum(lengths, points)
+    selected = np.minimum(np.arange(points), np.maximum(kept - 1, 0)[:, None])
+    long = np.flatnonzero(lengths > points)
+    if len(long) == 0 or points < 3:
+        return selected, kept
+
+    x, y, n = x[long].astype(np.float64), y[long].astype(np.float64), lengths[long]
+    rows = np.arange(len(long))
+    cx = np.c_[np.zeros(len(long)), np.cumsum(np.where(np.arange(x.shape[1]) < n[:, None], x, 0), axis=1)]
+    cy = np.c_[np.zeros(len(long)), np.cumsum(np.where(np.arange(y.shape[1]) < n[:, None], y, 0), axis=1)]
+
+    def edge(bucket):
+        # Buckets split values 1..n-2 evenly; integer arithmetic keeps the last edge exact
+        return np.minimum(bucket * (n - 2) // (points - 2) + 1, n)
+
+    a = np.zeros(len(long), dtype=np.int64)
+    for bucket in range(points - 2):
+        lo, hi, next_hi = edge(bucket), edge(bucket + 1), edge(bucket + 2)
+        mean_x = (cx[rows, next_hi] - cx[rows, hi]) / (next_hi - hi)
+        mean_y = (cy[rows, next_hi] - cy[rows, hi]) / (next_hi - hi)
+
+        candidates = lo[:, None] + np.arange(int((hi - lo).max()))
+        inside = candidates < hi[:, None]
+        candidates = np.minimum(candidates, n[:, None] - 1)
+        ax, ay = x[rows, a][:, None], y[rows, a][:, None]
+        bx, by = np.take_along_axis(x, candidates, axis=1), np.take_along_axis(y, candidates, axis=1)
+        area = np.abs((ax - mean_x[:, None]) * (by - ay) - (ax - bx) * (mean_y[:, None] - ay))
+        area[~inside] = -1
+        a = candidates[rows, area.argmax(axis=1)]
+        selected[long, bucket + 1] = a
+    selected[long, points - 1] = n - 1
+    return selected, kept
+
+
+def _level(dates, prices, first_price):
+    return {
+        'dates': np.datetime_as_string(dates, unit='D').tolist(),
+        'prices': prices.tolist(),
+        'returns': (prices / first_price - 1).tolist(),
+    }
+
+
+def build_pyramid(store, points=LTTB_POINTS, field='sale'):
+    # {fund: {level: {'dates', 'prices', 'returns'}}} for every fund in a
+    # FundSeriesStore, each level computed for all funds in one pass. Returns
+    # are cumulative from the fund's first valuation, as in the daily data.
+    funds, starts, ends, prices, dates = store.observations(field)
+    first_prices = prices[starts]
+    lengths = ends - starts
+
+    # Daily values padded to one (funds x longest) matrix for LTTB
+    width = int(lengths.max()) if len(lengths) else 0
+    offsets = np.minimum(starts[:, None] + np.arange(width), len(prices) - 1) if len(prices) else np.zeros((0, 0), int)
+    days = dates.astype('datetime64[D]').astype(np.int64)
+    selected, kept = lttb(days[offsets], prices[offsets], lengths, points)
+
+    periods = {level: period_last(store, unit, field) for level, unit in PERIOD_UNITS.items()}
+    rows = {name: row for row, name in enumerate(store.fund_names)}
+
+    pyramid = {}
+    for i, fund in enumerate(funds):
+        start, end, first_price = starts[i], ends[i], first_prices[i]
+        levels = {'daily': _level(dates[start:end], prices[start:end], first_price)}
+        for level, (period_ends, values, first, last) in periods.items():
+            row = rows[fund]
+            levels[level] = _level(period_ends[first[row]:last[row]], values[row, first[row]:last[row]], first_price)
+        chosen = start + selected[i, :kept[i]]
+        levels['lttb'] = _level(dates[chosen], prices[chosen], first_price)
+        pyramid[fund] = {level: levels[level] for level in LEVELS}
+    return pyramid
+
+
+def lttb_series(data, points=LTTB_POINTS):
+    # LTTB of one {'dates', 'prices', 'returns'} series without gaps
+    dates = np.array(data['dates'], dtype='datetime64[D]')
+    prices = np.array(data['prices'], dtype=np.float64)
+    selected, kept = lttb(dates.astype(np.int64)[None], prices[None], [len(prices)], points)
+    chosen = selected[0, :kept[0]]
+    return {key: [data[key][i] for i in chosen.tolist()] for key in ('dates', 'prices', 'returns')}
@@ -0,0 +1,186 @@
+import os
+import io
+import sys
+import json
+import time
+import atexit
+import pstats
+import threading
+from contextlib import contextmanager
+
+# Opt-in run tracing shared by the crawler and analysis (crawl-mse.py imports
+# this module from app/, so a daemon running the analysis in-process has one
+# tracer). Disabled unless MSE_TRACE is set, in which case every span, counter
+# and (optionally) profile is written as one JSON document at exit, or each time
+# a long-running process calls write() (once per daemon refresh):
+#
+#   MSE_TRACE=trace.json python crawl-mse.py      # a file (the latest report), or a directory for <run>-<time>.json
+#   MSE_TRACE_PROFILE=1                            # add cProfile totals per function and package
+#   MSE_TRACE_MEMORY=1                             # add tracemalloc current/peak per span
+
+
+class Tracer:
+    def __init__(self, run, output=None, profile=False, trace_memory=False):
+        self.run = run
+        self.output = output
+        self.enabled = output is not None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profile = self.enabled and profile
+        self._trace_memory = self.enabled and trace_memory
+        self._reset()
+
+        if self._trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+        if self.enabled:
+            atexit.register(self._write_at_exit)
+
+    def _reset(self):
+        # Starts a new report: spans, counters, clock and profile
+        self.spans = []
+        self.counters = {}
+        self._started = time.perf_counter()
+        self._started_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self._profiler = None
+        if self._profile:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        if self._trace_memory:
+            import tracemalloc
+            tracemalloc.reset_peak()
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name, **attrs):
+        if not self.enabled:
+            yield attrs
+            return
+
+        stack = self._stack()
+        record = {
+            'name': name,
+            'parent': stack[-1]['name'] if stack else None,
+            'thread': threading.current_thread().name,
+            'start': time.perf_counter() - self._started,
+            'attrs': attrs,
+        }
+        stack.append(record)
+        t0 = time.perf_counter()
+        try:
+            # Callers can add counters (rows, bytes, ...) to the yielded attrs
+            yield attrs
+        except BaseException as e:
+            attrs['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record['seconds'] = time.perf_counter() - t0
+            if self._trace_memory:
+                import tracemalloc
+                current, peak = tracemalloc.get_traced_memory()
+                record['memory_current_bytes'] = current
+                record['memory_peak_bytes'] = peak
+            stack.pop()
+            with self._lock:
+                self.spans.append(record)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        # Total seconds per span name, outermost spans of each name only
+        totals = {}
+        for record in self.spans:
+            if record['parent'] != record['name']:
+                entry = totals.setdefault(record['name'], {'count': 0, 'seconds': 0.0})
+                entry['count'] += 1
+                entry['seconds'] += record['seconds']
+        return totals
+
+    def _profile_report(self, limit=40):
+        self._profiler.disable()
+        stats = pstats.Stats(self._profiler, stream=io.StringIO())
+        functions = []
+        packages = {}
+        for (filename, line, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+            functions.append({
+                'function': f"{filename}:{line}({function})",
+                'calls': calls,
+                'tottime': tottime,
+                'cumtime': cumtime,
+            })
+            packages[_package_of(filename)] = packages.get(_package_of(filename), 0.0) + tottime
+        functions.sort(key=lambda f: f['cumtime'], reverse=True)
+        return {
+            'top_functions': functions[:limit],
+            'tottime_by_package': dict(sorted(packages.items(), key=lambda p: p[1], reverse=True)),
+        }
+
+    def write(self):
+        # Writes everything traced since the tracer started or last wrote, then
+        # starts over, so a long-running process doesn't accumulate spans
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            report = {
+                'run': self.run,
+                'started_at': self._started_at,
+                'wall_seconds': time.perf_counter() - self._started,
+                'summary': self.summary(),
+                'counters': self.counters,
+                'spans': sorted(self.spans, key=lambda s: s['start']),
+            }
+            if self._profiler is not None:
+                report['profile'] = self._profile_report()
+            if self._trace_memory:
+                import tracemalloc
+                report['memory_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            self._reset()
+
+        output = self.output
+        if os.path.isdir(output):
+            output = os.path.join(output, f"{self.run}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        return output
+
+    def _write_at_exit(self):
+        # Whatever was traced after the last explicit write()
+        if self.spans or self.counters:
+            self.write()
+
+
+def _package_of(filename):
+    # Group profile time by top-level package (selenium, bs4, pandas, ...)
+    normalized = filename.replace('\\', '/')
+    if '/site-packages/' in normalized:
+        return normalized.split('/site-packages/', 1)[1].split('/', 1)[0]
+    if filename.startswith('<') or filename == '~':
+        return 'builtins'
+    return os.path.splitext(os.path.basename(normalized))[0]
+
+
+_tracer = None
+
+
+def get_tracer(run=None):
+    # One tracer per process, configured from the environment; the first caller
+    # (normally the entry point) names the run
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(
+            run or os.path.splitext(os.path.basename(sys.argv[0] or 'python'))[0],
+            output=os.environ.get('MSE_TRACE') or None,
+            profile=os.environ.get('MSE_TRACE_PROFILE') == '1',
+            trace_memory=os.environ.get('MSE_TRACE_MEMORY') == '1',
+        )
+    return _tracer
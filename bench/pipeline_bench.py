@@ -0,0 +1,255 @@
+import os
+import sys
+import json
+import time
+import logging
+import platform
+import argparse
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+
+# Benchmark harness for the ingest -> analysis -> export pipeline.
+#
+#   python bench/pipeline_bench.py                       # shipped fund_data/ plus 10x synthetic
+#   python bench/pipeline_bench.py --scales 1x 10x 100x  # larger synthetic datasets
+#   python bench/pipeline_bench.py --compare old.json new.json
+#
+# Every scale runs in a fresh interpreter so peak RSS is per dataset. Results go
+# to bench/results/<commit>.json for comparison between commits.
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'crawler'))
+sys.path.insert(0, str(ROOT / 'app'))
+
+RESULTS_DIR = ROOT / 'bench' / 'results'
+# (fund multiplier, year multiplier) against the shipped 26 funds x 10 years;
+# 'fixtures' is the recorded fund_data/ itself
+SCALES = {
+    'fixtures': None,
+    '1x': (1, 1),
+    '10x': (10, 1),
+    '100x': (10, 10),
+}
+STAGES = ['parse', 'concat_dedupe', 'quality', 'typing', 'metrics', 'js_export']
+# Entry points timed from a fresh interpreter: crawl-mse.py up to argument
+# parsing (where every subcommand starts) and the modules analysis.py imports
+# before it loads any data
+STARTUP_PROBES = {
+    'crawler': "import importlib.util; "
+               "spec = importlib.util.spec_from_file_location('crawl_mse', {crawler!r}); "
+               "spec.loader.exec_module(importlib.util.module_from_spec(spec))",
+    'analysis': "import fund_loader, metrics, incremental_metrics, benchmarks, fund_series_store, "
+                "js_export, series_pyramid, rolling, portfolio, monte_carlo, tracing",
+}
+# Packages only some code paths need; a probe reports which of them it loaded
+OPTIONAL_PACKAGES = ['selenium', 'bs4', 'xlrd', 'requests', 'yfinance', 'pyarrow']
+STARTUP_REPEAT = 5
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def dataset_files(scale, work_dir, seed):
+    if SCALES[scale] is None:
+        return sorted((ROOT / 'fund_data').glob('mse-funds-data-*.xls'))
+    from synthetic import generate_exports
+    funds_multiplier, years_multiplier = SCALES[scale]
+    target = Path(work_dir) / f"synthetic-f{funds_multiplier}-y{years_multiplier}-s{seed}"
+    return generate_exports(target, funds_multiplier, years_multiplier, seed)
+
+
+def run_scale(scale, work_dir, seed, parallel):
+    import numpy as np
+    import pandas as pd
+    from export_parser import parse_exports_by_file
+    from export_schema import NAME_COLUMN, VALUATION_COLUMN, SALE_PRICE_COLUMN, DATE_COLUMNS, EXPORT_DATE_FORMAT
+    from keyed_ingest import KeyedTable
+    from data_quality import check_table
+    from metrics import fund_slices, return_series, compute_metrics
+    from js_export import write_chunked_output
+    from series_pyramid import build_pyramid
+    from fund_series_store import FundSeriesStore
+
+    files = dataset_files(scale, work_dir, seed)
+    stages = {}
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+
+    def timed(name, fn):
+        t0 = time.perf_counter()
+        result = fn()
+        stages[name] = {'seconds': time.perf_counter() - t0, 'peak_rss_mb': peak_rss_mb()}
+        return result
+
+    parsed = timed('parse', lambda: parse_exports_by_file(files, parallel=parallel))
+
+    def concat_dedupe():
+        # Keyed upsert on (fund, valuation date), as the crawler ingests
+        table = KeyedTable()
+        table.upsert_many(columns for _, columns in parsed)
+        return table, table.to_frame()
+    table, df = timed('concat_dedupe', concat_dedupe)
+    # Every row is new here, so this is the full check a first ingest runs
+    timed('quality', lambda: check_table(table))
+
+    def typing():
+        typed = df.copy()
+        typed[NAME_COLUMN] = typed[NAME_COLUMN].astype('category')
+        for column in DATE_COLUMNS:
+            typed[column] = pd.to_datetime(typed[column], format=EXPORT_DATE_FORMAT)
+        return typed.sort_values([NAME_COLUMN, VALUATION_COLUMN])
+    typed = timed('typing', typing)
+
+    def metrics():
+        funds, starts, ends = fund_slices(typed)
+        returns = return_series(typed[SALE_PRICE_COLUMN].to_numpy(), starts, ends)
+        typed['Cumulative Return'] = returns.cumulative
+        return compute_metrics(typed, typed[VALUATION_COLUMN].max(), (0.0, 0.0, 0.0), returns=returns)
+    metrics_df = timed('metrics', metrics)
+
+    def js_export():
+        store = FundSeriesStore.from_frame(typed)
+        series = build_pyramid(store)
+        js_data = {'fundList': store.fund_names, 'fundMetrics': metrics_df.to_dict('records')}
+        with tempfile.TemporaryDirectory() as output_dir:
+            write_chunked_output(js_data, series, output_dir)
+            return sum(f.stat().st_size for f in Path(output_dir).rglob('*') if f.is_file())
+    output_bytes = timed('js_export', js_export)
+
+    return {
+        'scale': scale,
+        'files': len(files),
+        'input_bytes': sum(os.path.getsize(f) for f in files),
+        'rows': int(len(df)),
+        'funds': int(typed[NAME_COLUMN].nunique()),
+        'output_bytes': int(output_bytes),
+        'parallel_parse': parallel,
+        'wall_seconds': time.perf_counter() - started,
+        'baseline_rss_mb': rss_before,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': stages,
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+    }
+
+
+def measure_startup(repeat=STARTUP_REPEAT):
+    # Median over `repeat` fresh interpreters of the probe's own import time and
+    # of the whole process (interpreter start included)
+    results = {}
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / 'crawler'), str(ROOT / 'app')]))
+    for name, probe in STARTUP_PROBES.items():
+        code = (f"import sys, time, json; t0 = time.perf_counter(); "
+                f"{probe.format(crawler=str(ROOT / 'crawler' / 'crawl-mse.py'))}; "
+                f"print(json.dumps([time.perf_counter() - t0, "
+                f"[p for p in {OPTIONAL_PACKAGES!r} if p in sys.modules]]))")
+        imports, processes = [], []
+        with tempfile.TemporaryDirectory() as cwd:
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                completed = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env,
+                                           capture_output=True, text=True, check=True)
+                processes.append(time.perf_counter() - t0)
+                seconds, loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+                imports.append(seconds)
+        results[name] = {
+            'import_seconds': sorted(imports)[len(imports) // 2],
+            'process_seconds': sorted(processes)[len(processes) // 2],
+            'loaded': loaded,
+        }
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+
+def compare(old_path, new_path):
+    old_report, new_report = json.loads(Path(old_path).read_text()), json.loads(Path(new_path).read_text())
+    old = {r['scale']: r for r in old_report['results']}
+    new = {r['scale']: r for r in new_report['results']}
+    print(f"{'scale':<10}{'stage':<16}{'old s':>10}{'new s':>10}{'ratio':>8}")
+    for scale in [s for s in new if s in old]:
+        rows = [(stage, old[scale]['stages'][stage]['seconds'], new[scale]['stages'][stage]['seconds'])
+                for stage in STAGES if stage in old[scale]['stages'] and stage in new[scale]['stages']]
+        rows.append(('wall', old[scale]['wall_seconds'], new[scale]['wall_seconds']))
+        for stage, before, after in rows:
+            print(f"{scale:<10}{stage:<16}{before:>10.3f}{after:>10.3f}{after / before if before else float('nan'):>8.2f}")
+        print(f"{scale:<10}{'peak_rss_mb':<16}{old[scale]['peak_rss_mb']:>10.1f}{new[scale]['peak_rss_mb']:>10.1f}")
+    old_startup, new_startup = old_report.get('startup', {}), new_report.get('startup', {})
+    for name in [n for n in new_startup if n in old_startup]:
+        before, after = old_startup[name]['process_seconds'], new_startup[name]['process_seconds']
+        print(f"{'startup':<10}{name:<16}{before:>10.3f}{after:>10.3f}{after / before if before else float('nan'):>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ingest -> analysis -> export pipeline")
+    parser.add_argument('--scales', nargs='+', default=['fixtures', '10x'], choices=list(SCALES))
+    parser.add_argument('--work-dir', default=os.path.join(tempfile.gettempdir(), 'mse-funds-bench'),
+                        help="where synthetic exports are generated (and reused)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--parallel', action='store_true', help="parse with the process pool")
+    parser.add_argument('--output', help="results file (default: bench/results/<commit>.json)")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'))
+    parser.add_argument('--no-startup', dest='startup', action='store_false', help="skip the entry point startup timing")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    if args.child:
+        print(json.dumps(run_scale(args.child, args.work_dir, args.seed, args.parallel)))
+        return 0
+
+    results = []
+    for scale in args.scales:
+        command = [sys.executable, __file__, '--child', scale, '--work-dir', args.work_dir, '--seed', str(args.seed)]
+        if args.parallel:
+            command.append('--parallel')
+        completed = subprocess.run(command, capture_output=True, text=True)
+        if completed.returncode != 0:
+            print(completed.stderr, file=sys.stderr)
+            return completed.returncode
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        results.append(result)
+        stage_summary = ', '.join(f"{name} {stage['seconds']:.3f}s" for name, stage in result['stages'].items())
+        print(f"{scale}: {result['rows']} rows, {result['wall_seconds']:.2f}s wall, "
+              f"{result['peak_rss_mb']:.0f} MB peak RSS ({stage_summary})")
+
+    startup = measure_startup() if args.startup else {}
+    for name, result in startup.items():
+        print(f"startup {name}: {result['process_seconds']:.3f}s process, {result['import_seconds']:.3f}s imports, "
+              f"loaded: {', '.join(result['loaded']) or 'none of ' + ', '.join(OPTIONAL_PACKAGES)}")
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': results,
+        'startup': startup,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
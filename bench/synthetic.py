@@ -0,0 +1,86 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'crawler'))
+# tracing.py, which the crawler modules import, is in app/
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'app'))
+from export_parser import COLUMNS
+from http_crawler import EXCEL_TEMPLATE_HEAD, EXCEL_TEMPLATE_TAIL
+
+# Synthetic MSE-shaped exports: one mse-funds-data-<n>-<year>-<month>.xls per
+# month, laid out like the files btnExport produces, so every ingest path
+# (soup, streaming, manifest) can be benchmarked on them unchanged
+
+BASE_FUNDS = 26
+BASE_YEARS = 10
+LAST_MONTH = pd.Timestamp('2024-10-01')
+
+_HEADER_CELL = ("<th class='sorting_disabled' rowspan='1' colspan='1'>"
+                "<div class='dataTables_sizing' style='height:0;overflow:hidden;'>\n{}\n</div></th>")
+_ROW = ("<tr role='row' class='{parity}'>\n"
+        "<td class='text-nowrap'>{name}</td>\n<td>{calculated}</td>\n<td>{valued}</td>\n"
+        "<td class='td-right'>{price}</td>\n<td class='td-right'>{price}</td>\n<td class='td-right'>{price}</td>\n"
+        "</tr>")
+
+
+def _export_date(day):
+    return f"{day.month}/{day.day}/{day.year}"
+
+
+def generate_exports(output_dir, funds_multiplier=1, years_multiplier=1, seed=0):
+    # Returns the generated file paths; an existing, complete directory is reused
+    output_dir = Path(output_dir)
+    marker = output_dir / '.complete'
+    if marker.exists():
+        return sorted(output_dir.glob('mse-funds-data-*.xls'))
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    n_funds = BASE_FUNDS * funds_multiplier
+    n_months = BASE_YEARS * years_multiplier * 12
+    months = pd.date_range(end=LAST_MONTH, periods=n_months, freq='MS')
+    days = pd.bdate_range(months[0], LAST_MONTH + pd.offsets.MonthEnd(0))
+
+    rng = np.random.default_rng(seed)
+    names = [f"Synthetic Fund {i:05d}" for i in range(n_funds)]
+    # Funds start at staggered dates like the real list (e.g. the VEGA funds)
+    first_day = rng.integers(0, len(days) // 2, n_funds) * (rng.random(n_funds) < 0.3)
+    start_price = rng.uniform(20, 1500, n_funds)
+    volatility = rng.uniform(0.0005, 0.015, n_funds)
+
+    log_returns = rng.normal(0.0002, 1, (len(days), n_funds)) * volatility
+    prices = np.round(start_price * np.exp(np.cumsum(log_returns, axis=0)), 4)
+
+    header = ''.join(_HEADER_CELL.format(column) for column in COLUMNS)
+    month_index = days.to_period('M')
+    for iteration, month in enumerate(months, start=1):
+        rows = []
+        for d in np.flatnonzero(month_index == month.to_period('M')):
+            day = days[d]
+            calculated = _export_date(day + pd.offsets.BDay(1))
+            valued = _export_date(day)
+            for f in np.flatnonzero(first_day <= d):
+                rows.append(_ROW.format(parity='odd' if len(rows) % 2 == 0 else 'even', name=names[f],
+                                        calculated=calculated, valued=valued, price=f"{prices[d, f]:,.4f}"))
+
+        path = output_dir / f"mse-funds-data-{iteration}-{month.year}-{month.month:02d}.xls"
+        with open(path, 'w', encoding='utf-8') as out:
+            out.write(EXCEL_TEMPLATE_HEAD)
+            out.write("<table id='resultsTable' role='grid'><thead>\n<tr role='row'>")
+            out.write(header)
+            out.write("</tr></thead><tbody>\n")
+            out.write(''.join(rows))
+            out.write("</tbody>\n</table>")
+            out.write(EXCEL_TEMPLATE_TAIL)
+
+    marker.touch()
+    return sorted(output_dir.glob('mse-funds-data-*.xls'))
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else 'synthetic'
+    files = generate_exports(target, *(int(a) for a in sys.argv[2:4]))
+    print(f"{len(files)} files in {os.path.abspath(target)}")
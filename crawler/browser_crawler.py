@@ -0,0 +1,177 @@
+import os
+import time
+import logging
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from tracing import get_tracer
+
+
+class MutualFundCrawler:
+    # Chrome-driven download of the monthly exports through the MSE page's own
+    # form and export button. Kept apart from crawl-mse.py so that selenium is
+    # only imported, and Chrome only started, by runs that crawl with the browser.
+    def __init__(self, download_dir):
+        self.download_dir = download_dir
+        self.setup_driver()
+        self.first_load = True
+        self.downloaded_files = set()  # Keep track of successfully downloaded files
+
+    def setup_driver(self):
+        chrome_options = webdriver.ChromeOptions()
+        chrome_options.add_experimental_option("prefs", {
+            "download.default_directory": os.path.abspath(self.download_dir),
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+            "safebrowsing.enabled": True
+        })
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+
+        try:
+            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver.set_page_load_timeout(30)
+            self.wait = WebDriverWait(self.driver, 20)
+        except Exception as e:
+            logging.error(f"Failed to initialize WebDriver: {str(e)}")
+            raise
+
+    def sleep(self, seconds, reason):
+        # Fixed waits are traced separately so their share of a crawl is visible
+        with get_tracer().span('sleep', reason=reason, seconds=seconds):
+            time.sleep(seconds)
+
+    def wait_for_element(self, by, value, timeout=20):
+        try:
+            element = WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((by, value))
+            )
+            return element
+        except TimeoutException:
+            logging.error(f"Timeout waiting for element: {value}")
+            return None
+
+    def wait_for_clickable(self, by, value, timeout=20):
+        try:
+            element = WebDriverWait(self.driver, timeout).until(
+                EC.element_to_be_clickable((by, value))
+            )
+            return element
+        except TimeoutException:
+            logging.error(f"Timeout waiting for clickable element: {value}")
+            return None
+
+    def wait_for_download_and_rename(self, target_filename, max_wait=10):
+        start_time = time.time()
+        while time.time() - start_time < max_wait:
+            files = list(Path(self.download_dir).glob("*.xls"))
+            logging.info(f"Found files in directory: {[f.name for f in files]}")
+
+            for file in files:
+                if "Open - End" in file.name or "Open-End" in file.name:
+                    try:
+                        target_path = os.path.join(self.download_dir, target_filename)
+                        logging.info(f"Attempting to rename {file.name} to {target_filename}")
+                        # Replaces an earlier export of the same month
+                        os.replace(file, target_path)
+                        self.downloaded_files.add(target_filename)  # Add to tracking set
+                        logging.info(f"Successfully renamed file to {target_filename}")
+                        return True
+                    except Exception as e:
+                        logging.error(f"Error renaming file {file.name}: {str(e)}")
+                        return False
+            time.sleep(0.5)
+
+        logging.error("No matching files found for rename operation")
+        return False
+
+    def download_monthly_data(self, start_date, end_date, iteration):
+        url = "https://www.mse.mk/F/open-end-investment-funds"
+        max_retries = 3
+        retry_count = 0
+
+        while retry_count < max_retries:
+            try:
+                if self.first_load:
+                    logging.info(f"Accessing URL: {url}")
+                    with get_tracer().span('page_load', url=url):
+                        self.driver.get(url)
+                    self.sleep(5, 'first_load')
+                    self.first_load = False
+
+                start_date_input = self.wait_for_element(By.ID, "FromDate")
+                if not start_date_input:
+                    raise TimeoutException("Could not find start date input")
+
+                start_date_input.clear()
+                formatted_start = start_date.strftime("%m/%d/%Y")
+                start_date_input.send_keys(formatted_start)
+                logging.info(f"Entered start date: {formatted_start}")
+
+                end_date_input = self.wait_for_element(By.ID, "ToDate")
+                if not end_date_input:
+                    raise TimeoutException("Could not find end date input")
+
+                end_date_input.clear()
+                formatted_end = end_date.strftime("%m/%d/%Y")
+                end_date_input.send_keys(formatted_end)
+                logging.info(f"Entered end date: {formatted_end}")
+
+                find_button = self.wait_for_element(By.XPATH, "//input[@value='Find']")
+                if not find_button:
+                    raise TimeoutException("Could not find 'Find' button")
+
+                find_button.click()
+                logging.info("Clicked Find button")
+
+                self.sleep(2, 'after_find')
+
+                export_link = self.wait_for_clickable(By.ID, "btnExport")
+                if not export_link:
+                    raise TimeoutException("Could not find export link")
+
+                target_filename = f"mse-funds-data-{iteration}-{start_date.year}-{start_date.month:02d}.xls"
+
+                self.driver.execute_script("arguments[0].click();", export_link)
+                logging.info("Clicked Export link")
+
+                self.sleep(2, 'after_export')
+
+                with get_tracer().span('wait_for_file', file=target_filename):
+                    renamed = self.wait_for_download_and_rename(target_filename)
+                if renamed:
+                    logging.info(f"File successfully renamed to: {target_filename}")
+                    return True
+                else:
+                    raise Exception("Failed to download or rename file")
+
+            except Exception as e:
+                retry_count += 1
+                logging.error(f"Attempt {retry_count} failed: {str(e)}")
+                if retry_count >= max_retries:
+                    logging.error(f"Failed after {max_retries} attempts for period {formatted_start} - {formatted_end}")
+                    return False
+                self.sleep(5, 'retry')
+
+        return False
+
+    def alive(self):
+        # Whether Chrome still answers, before reusing a long-lived session
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        try:
+            self.driver.quit()
+            logging.info("WebDriver closed successfully")
+        except Exception as e:
+            logging.error(f"Error closing WebDriver: {str(e)}")
@@ -1,16 +1,50 @@
 import os
+import sys
+import runpy
+import signal
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+import argparse
+import threading
+from io import StringIO
 from datetime import datetime, timedelta
 import pandas as pd
 import time
 from pathlib import Path
-import xlrd
-from bs4 import BeautifulSoup
+# tracing.py lives in app/ and is shared with analysis.py, which analyze and the
+# daemon run in this process; appended, so crawler modules still come first
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'app'))
+from export_parser import parse_exports_by_file, frame_columns
+from ingest_manifest import IngestManifest, MANIFEST_FILENAME
+from keyed_ingest import KeyedTable, TABLE_FILENAME, log_revisions
+from data_quality import check_table, quarantine_frame, log_quarantine, QUARANTINE_FILENAME
+from crawl_planner import plan_crawl, plan_summary, CrawlCheckpoint, CHECKPOINT_FILENAME
+from fund_store import write_store, STORE_FORMATS
+from tracing import get_tracer
+
+# How process_downloads parses the exported .xls (HTML) files
+PARSE_MODES = {
+    '1': 'soup',      # BeautifulSoup + pd.read_html, one file at a time
+    '2': 'stream',    # Streaming table extractor, one file at a time
+    '3': 'parallel',  # Streaming table extractor across a process pool
+}
+DEFAULT_PARSE_MODE = 'parallel'
+
+# How option 1 downloads the monthly exports
+CRAWL_MODES = {
+    '1': 'http',      # Direct form submissions over a pooled connection, Selenium for failures
+    '2': 'selenium',  # Chrome session only
+}
+DEFAULT_CRAWL_MODE = 'http'
+HTTP_CONCURRENCY = 4
+
+# A crawl covers this many years back from today
+CRAWL_YEARS = 10
+# Combined dataset written by ingest/export: <name>.csv plus the columnar store <name>/
+OUTPUT_NAME = "combined_mutual_fund_data"
+# analysis.py and its outputs, run in-process by analyze and the daemon
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'app')
+# Seconds between the daemon's checks for new valuation days
+DAEMON_INTERVAL = 3600
 
 # Set up logging
 logging.basicConfig(
@@ -22,201 +56,124 @@ logging.basicConfig(
     ]
 )
 
-class MutualFundCrawler:
-    def __init__(self, download_dir):
-        self.download_dir = download_dir
-        self.setup_driver()
-        self.first_load = True
-        self.downloaded_files = set()  # Keep track of successfully downloaded files
-
-    def setup_driver(self):
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_experimental_option("prefs", {
-            "download.default_directory": os.path.abspath(self.download_dir),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
-        })
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(30)
-            self.wait = WebDriverWait(self.driver, 20)
-        except Exception as e:
-            logging.error(f"Failed to initialize WebDriver: {str(e)}")
-            raise
-
-    def wait_for_element(self, by, value, timeout=20):
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
-            return element
-        except TimeoutException:
-            logging.error(f"Timeout waiting for element: {value}")
-            return None
-
-    def wait_for_clickable(self, by, value, timeout=20):
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
-            )
-            return element
-        except TimeoutException:
-            logging.error(f"Timeout waiting for clickable element: {value}")
-            return None
-
-    def wait_for_download_and_rename(self, target_filename, max_wait=10):
-        start_time = time.time()
-        while time.time() - start_time < max_wait:
-            files = list(Path(self.download_dir).glob("*.xls"))
-            logging.info(f"Found files in directory: {[f.name for f in files]}")
-
-            for file in files:
-                if "Open - End" in file.name or "Open-End" in file.name:
-                    try:
-                        target_path = os.path.join(self.download_dir, target_filename)
-                        logging.info(f"Attempting to rename {file.name} to {target_filename}")
-                        os.rename(file, target_path)
-                        self.downloaded_files.add(target_filename)  # Add to tracking set
-                        logging.info(f"Successfully renamed file to {target_filename}")
-                        return True
-                    except Exception as e:
-                        logging.error(f"Error renaming file {file.name}: {str(e)}")
-                        return False
-            time.sleep(0.5)
-
-        logging.error("No matching files found for rename operation")
-        return False
-
-    def download_monthly_data(self, start_date, end_date, iteration):
-        url = "https://www.mse.mk/F/open-end-investment-funds"
-        max_retries = 3
-        retry_count = 0
-
-        while retry_count < max_retries:
-            try:
-                if self.first_load:
-                    logging.info(f"Accessing URL: {url}")
-                    self.driver.get(url)
-                    time.sleep(5)
-                    self.first_load = False
+# Opt-in timing trace (see tracing.py), e.g. MSE_TRACE=trace.json
+tracer = get_tracer('crawler')
 
-                start_date_input = self.wait_for_element(By.ID, "FromDate")
-                if not start_date_input:
-                    raise TimeoutException("Could not find start date input")
+def check_quality(table):
+    # Data quality checks for the rows upserted since they last ran; returns the
+    # quarantine table
+    with tracer.span('quality', rows=len(table.unchecked)) as span:
+        span['checked'] = checked = check_table(table)
+        quarantine = quarantine_frame(table)
+    log_quarantine(quarantine, checked)
+    return quarantine
 
-                start_date_input.clear()
-                formatted_start = start_date.strftime("%m/%d/%Y")
-                start_date_input.send_keys(formatted_start)
-                logging.info(f"Entered start date: {formatted_start}")
+def process_downloads(download_dir, mode=DEFAULT_PARSE_MODE, max_workers=None, incremental=True):
+    # Returns (combined dataset, quarantine), or (None, None) when nothing could be parsed
+    if mode != 'soup':
+        return process_downloads_streaming(download_dir, parallel=(mode == 'parallel'), max_workers=max_workers,
+                                           incremental=incremental)
 
-                end_date_input = self.wait_for_element(By.ID, "ToDate")
-                if not end_date_input:
-                    raise TimeoutException("Could not find end date input")
+    # Only the BeautifulSoup path needs bs4
+    from bs4 import BeautifulSoup
 
-                end_date_input.clear()
-                formatted_end = end_date.strftime("%m/%d/%Y")
-                end_date_input.send_keys(formatted_end)
-                logging.info(f"Entered end date: {formatted_end}")
-
-                find_button = self.wait_for_element(By.XPATH, "//input[@value='Find']")
-                if not find_button:
-                    raise TimeoutException("Could not find 'Find' button")
-
-                find_button.click()
-                logging.info("Clicked Find button")
-
-                time.sleep(2)
-
-                export_link = self.wait_for_clickable(By.ID, "btnExport")
-                if not export_link:
-                    raise TimeoutException("Could not find export link")
-
-                target_filename = f"mse-funds-data-{iteration}-{start_date.year}-{start_date.month:02d}.xls"
-
-                self.driver.execute_script("arguments[0].click();", export_link)
-                logging.info("Clicked Export link")
-
-                time.sleep(2)
-
-                if self.wait_for_download_and_rename(target_filename):
-                    logging.info(f"File successfully renamed to: {target_filename}")
-                    return True
-                else:
-                    raise Exception("Failed to download or rename file")
+    parsed = []
 
-            except Exception as e:
-                retry_count += 1
-                logging.error(f"Attempt {retry_count} failed: {str(e)}")
-                if retry_count >= max_retries:
-                    logging.error(f"Failed after {max_retries} attempts for period {formatted_start} - {formatted_end}")
-                    return False
-                time.sleep(5)
-
-        return False
-
-    def process_downloads(self):
-        all_data = []
-
-        try:
-            files = sorted(Path(self.download_dir).glob("mse-funds-data-*.xls"))
-            logging.info(f"Found {len(list(files))} files to process")
+    try:
+        files = sorted(Path(download_dir).glob("mse-funds-data-*.xls"))
+        logging.info(f"Found {len(list(files))} files to process")
 
-            for file in files:
-                try:
-                    logging.info(f"Processing file: {file}")
+        for file in files:
+            try:
+                logging.info(f"Processing file: {file}")
 
-                    # Read the file content
-                    with open(file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                # Read the file content
+                with open(file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                tracer.count('parse_bytes', len(content))
 
-                    # Parse HTML content
+                # Parse HTML content
+                with tracer.span('soup', file=file.name):
                     soup = BeautifulSoup(content, 'html.parser')
                     table = soup.find('table')
 
-                    if table:
-                        df = pd.read_html(str(table))[0]
+                if table:
+                    with tracer.span('read_html', file=file.name):
+                        df = pd.read_html(StringIO(str(table)))[0]
+                    tracer.count('parse_rows', len(df))
 
-                        # Check if the dataframe is empty
-                        if df.empty:
-                            raise ValueError("Dataframe is empty")
+                    parsed.append(frame_columns(df))
+                    logging.info(f"Successfully processed file: {file}")
+                else:
+                    raise ValueError("No table found in the HTML content")
 
-                        all_data.append(df)
-                        logging.info(f"Successfully processed file: {file}")
-                    else:
-                        raise ValueError("No table found in the HTML content")
+            except Exception as e:
+                logging.error(f"Error processing file {file}: {str(e)}")
+
+                # Additional error information
+                with open(file, 'rb') as f:
+                    file_start = f.read(50)  # Read first 50 bytes
+                logging.error(f"File starts with: {file_start}")
+                logging.error(f"File size: {os.path.getsize(file)} bytes")
+
+        # One row per (fund, valuation date), upserted in file order like the
+        # streaming parsers, so every parse mode gives the same dataset
+        table = KeyedTable()
+        with tracer.span('upsert', files=len(parsed)) as span:
+            revisions = table.upsert_many(parsed)
+            span['revisions'] = len(revisions)
+        quarantine = check_quality(table)
+        log_revisions(revisions)
+
+        if len(table):
+            with tracer.span('concat', rows=len(table)):
+                return table.to_frame(), quarantine
+        else:
+            logging.error("No data was successfully processed")
+            return None, None
 
-                except Exception as e:
-                    logging.error(f"Error processing file {file}: {str(e)}")
-
-                    # Additional error information
-                    with open(file, 'rb') as f:
-                        file_start = f.read(50)  # Read first 50 bytes
-                    logging.error(f"File starts with: {file_start}")
-                    logging.error(f"File size: {os.path.getsize(file)} bytes")
-
-            if all_data:
-                combined_df = pd.concat(all_data, ignore_index=True)
-                combined_df.drop_duplicates(inplace=True)
-                return combined_df
-            else:
-                logging.error("No data was successfully processed")
-                return None
+    except Exception as e:
+        logging.error(f"Error in process_downloads: {str(e)}")
+    return None, None
 
-        except Exception as e:
-            logging.error(f"Error in process_downloads: {str(e)}")
-        return None
+def process_downloads_streaming(download_dir, parallel=True, max_workers=None, incremental=True):
+    try:
+        files = sorted(Path(download_dir).glob("mse-funds-data-*.xls"))
+        logging.info(f"Found {len(files)} files to process ({'parallel' if parallel else 'sequential'} streaming parser)")
+
+        # One row per (fund, valuation date); republished prices replace older ones
+        if incremental:
+            # Only new or changed files are parsed and upserted, the rest are
+            # already in the manifest and the keyed table
+            manifest = IngestManifest(os.path.join(download_dir, MANIFEST_FILENAME))
+            with tracer.span('manifest_refresh', files=len(files)) as span:
+                span['parsed_files'] = len(manifest.refresh(files, parallel=parallel, max_workers=max_workers))
+            table = KeyedTable(os.path.join(download_dir, TABLE_FILENAME))
+            with tracer.span('upsert', rows=len(table)) as span:
+                revisions = table.sync(manifest, files)
+                span['revisions'] = len(revisions)
+            # Only rows new or changed since the last run (and their neighbours) are checked
+            quarantine = check_quality(table)
+            if table.dirty:
+                table.save()
+        else:
+            table = KeyedTable()
+            with tracer.span('upsert'):
+                revisions = table.upsert_many(columns for _, columns in
+                                              parse_exports_by_file(files, parallel=parallel, max_workers=max_workers))
+            quarantine = check_quality(table)
+        log_revisions(revisions)
+
+        if len(table):
+            with tracer.span('concat', rows=len(table)):
+                return table.to_frame(), quarantine
+        else:
+            logging.error("No data was successfully processed")
+            return None, None
 
-    def close(self):
-        try:
-            self.driver.quit()
-            logging.info("WebDriver closed successfully")
-        except Exception as e:
-            logging.error(f"Error closing WebDriver: {str(e)}")
+    except Exception as e:
+        logging.error(f"Error in process_downloads: {str(e)}")
+    return None, None
 
 def get_user_action():
     while True:
@@ -225,55 +182,352 @@ def get_user_action():
             return action
         print("Invalid input. Please enter 1 or 2.")
 
-def main():
-    try:
-        download_dir = os.path.join(os.getcwd(), "fund_data")
-        os.makedirs(download_dir, exist_ok=True)
-        logging.info(f"Created download directory: {download_dir}")
-
-        action = get_user_action()
-
-        crawler = MutualFundCrawler(download_dir)
-
-        if action == '1':
-            # Crawl and process data
-            end_date = datetime.now()
-            start_date = (end_date - timedelta(days=365*10)).replace(day=1)
-
-            current_date = start_date
-            iteration = 1
+def get_parse_mode():
+    while True:
+        mode = input("Parse files with (1) BeautifulSoup, (2) streaming parser or (3) parallel streaming parser? Enter 1, 2 or 3 [3]: ")
+        if not mode:
+            return DEFAULT_PARSE_MODE
+        if mode in PARSE_MODES:
+            return PARSE_MODES[mode]
+        print("Invalid input. Please enter 1, 2 or 3.")
+
+def get_crawl_mode():
+    while True:
+        mode = input("Download with (1) direct HTTP requests or (2) the Chrome browser? Enter 1 or 2 [1]: ")
+        if not mode:
+            return DEFAULT_CRAWL_MODE
+        if mode in CRAWL_MODES:
+            return CRAWL_MODES[mode]
+        print("Invalid input. Please enter 1 or 2.")
 
-            while current_date < end_date:
-                month_end = (current_date.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-                if month_end > end_date:
-                    month_end = end_date
+def monthly_periods(start_date, end_date):
+    # (month start, month end, iteration) for every month from start_date up to end_date
+    current_date = start_date
+    iteration = 1
+
+    while current_date < end_date:
+        month_end = (current_date.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        if month_end > end_date:
+            month_end = end_date
+
+        yield current_date, month_end, iteration
+
+        current_date = month_end + timedelta(days=1)
+        iteration += 1
+
+def crawl_with_browser(crawler, periods, checkpoint=None):
+    for period in periods:
+        current_date, month_end, iteration = period[:3]
+        logging.info(f"-------------------------------------------------------------------------------\n")
+        logging.info(f"Processing month: {current_date.strftime('%B %Y')}")
+        with tracer.span('download', mode='selenium', month=current_date.strftime('%Y-%m')) as span:
+            success = span['success'] = crawler.download_monthly_data(current_date, month_end, iteration)
+        if checkpoint is not None:
+            checkpoint.mark(current_date, 'done' if success else 'failed')
+
+        if not success:
+            logging.warning(f"Failed to download data for {current_date.strftime('%B %Y')}\n")
+        else:
+            logging.info(f"Successfully processed {current_date.strftime('%B %Y')}\n")
 
-                logging.info(f"-------------------------------------------------------------------------------\n")
-                logging.info(f"Processing month: {current_date.strftime('%B %Y')}")
-                success = crawler.download_monthly_data(current_date, month_end, iteration)
+def crawl_with_http(download_dir, periods, max_concurrency=HTTP_CONCURRENCY, checkpoint=None):
+    from http_crawler import HttpFundCrawler
 
-                if not success:
-                    logging.warning(f"Failed to download data for {current_date.strftime('%B %Y')}\n")
-                else:
-                    logging.info(f"Successfully processed {current_date.strftime('%B %Y')}\n")
+    http_crawler = HttpFundCrawler(download_dir, max_concurrency=max_concurrency)
+    on_result = None
+    if checkpoint is not None:
+        on_result = lambda period, success: checkpoint.mark(period[0], 'done' if success else 'failed')
+    try:
+        failed = http_crawler.download_months(periods, on_result=on_result)
+    finally:
+        http_crawler.close()
+    logging.info(f"HTTP crawl finished: {len(http_crawler.downloaded_files)} downloaded, {len(failed)} failed")
+    return failed
+
+def plan_months(download_dir, start_date, end_date):
+    # Only months that are missing, incomplete or stale in download_dir are crawled
+    with tracer.span('plan') as span:
+        manifest = IngestManifest(os.path.join(download_dir, MANIFEST_FILENAME))
+        manifest.refresh(sorted(Path(download_dir).glob("mse-funds-data-*.xls")))
+        plan = plan_crawl(download_dir, monthly_periods(start_date, end_date), manifest)
+        span['months'] = len(plan)
+    logging.info(f"Crawl plan: {plan_summary(plan)}")
+    return plan
+
+class BrowserSession:
+    # A MutualFundCrawler started on first use: runs that never need the browser
+    # don't import selenium or launch Chrome (so processing the local fund_data/
+    # archive works without either installed). A session whose Chrome has gone
+    # away is replaced.
 
-                current_date = month_end + timedelta(days=1)
-                iteration += 1
+    def __init__(self, download_dir):
+        self.download_dir = download_dir
+        self.crawler = None
+
+    def get(self):
+        if self.crawler is not None and not self.crawler.alive():
+            logging.warning("Browser session lost, starting a new one")
+            self.close()
+        if self.crawler is None:
+            from browser_crawler import MutualFundCrawler
+            self.crawler = MutualFundCrawler(self.download_dir)
+        return self.crawler
+
+    def reload(self):
+        # Load the MSE page afresh on the next download
+        if self.crawler is not None:
+            self.crawler.first_load = True
 
-        # Process downloaded data (for both actions)
-        combined_data = crawler.process_downloads()
+    def close(self):
+        if self.crawler is not None:
+            self.crawler.close()
+            self.crawler = None
+
+def crawl(download_dir, browser, crawl_mode=DEFAULT_CRAWL_MODE, years=CRAWL_YEARS):
+    # Download the months the plan finds missing, incomplete or stale, using the
+    # BrowserSession only for what plain HTTP can't do; returns the months still
+    # left to retry
+    end_date = datetime.now()
+    start_date = (end_date - timedelta(days=365*years)).replace(day=1)
+
+    checkpoint = CrawlCheckpoint(os.path.join(download_dir, CHECKPOINT_FILENAME))
+    periods = checkpoint.resume(plan_months(download_dir, start_date, end_date))
+
+    if crawl_mode == 'http':
+        failed = crawl_with_http(download_dir, periods, checkpoint=checkpoint)
+        if failed:
+            # Anything the plain-HTTP path couldn't fetch goes through the browser
+            try:
+                crawler = browser.get()
+            except ImportError:
+                logging.warning(f"selenium is not installed, leaving {len(failed)} months for the next run")
+            else:
+                logging.info(f"Retrying {len(failed)} months with the browser")
+                crawl_with_browser(crawler, failed, checkpoint=checkpoint)
+    elif periods:
+        crawl_with_browser(browser.get(), periods, checkpoint=checkpoint)
+    return checkpoint.finish()
+
+def export_data(combined_data, quarantine, data_dir='.', store_format='feather'):
+    output_file = os.path.join(data_dir, f"{OUTPUT_NAME}.csv")
+    with tracer.span('export', target='csv', rows=len(combined_data)):
+        combined_data.to_csv(output_file, index=False, sep='\t')
+    logging.info(f"Combined data saved to {output_file}")
+
+    # Next to the dataset, where analysis.py looks for it
+    quarantine_file = os.path.join(data_dir, QUARANTINE_FILENAME)
+    quarantine.to_csv(quarantine_file, index=False, sep='\t')
+    logging.info(f"Quarantine table with {len(quarantine)} flags saved to {quarantine_file}")
 
-        if combined_data is not None:
-            output_file = "combined_mutual_fund_data.csv"
-            combined_data.to_csv(output_file, index=False, sep='\t')
-            logging.info(f"Combined data saved to {output_file}")
-        else:
-            logging.error("Failed to create combined dataset")
+    try:
+        with tracer.span('export', target='store', rows=len(combined_data)):
+            write_store(combined_data, os.path.join(data_dir, OUTPUT_NAME), store_format)
+    except ImportError:
+        logging.warning("pyarrow is not installed, skipping the columnar store")
+
+def ingest(download_dir, parse_mode=DEFAULT_PARSE_MODE, data_dir='.'):
+    # Parse the downloads (only new or changed files, except with 'soup') and
+    # write the combined dataset
+    combined_data, quarantine = process_downloads(download_dir, mode=parse_mode)
+    if combined_data is None:
+        logging.error("Failed to create combined dataset")
+        return False
+    export_data(combined_data, quarantine, data_dir)
+    return True
+
+def export_keyed_table(download_dir, data_dir='.', store_format='feather'):
+    # Rewrite the combined dataset from the already ingested keyed table, no parsing
+    table = KeyedTable(os.path.join(download_dir, TABLE_FILENAME))
+    if not len(table):
+        logging.error(f"Nothing ingested in {download_dir} yet; run ingest first")
+        return False
+    # A table from before the quality checks existed gets checked here once
+    quarantine = check_quality(table)
+    if table.dirty:
+        table.save()
+    export_data(table.to_frame(), quarantine, data_dir, store_format)
+    return True
+
+def analyze(app_dir=APP_DIR):
+    # Run app/analysis.py in this process, from app_dir as it expects; modules it
+    # imports stay loaded for the next run
+    app_dir = os.path.abspath(app_dir)
+    cwd = os.getcwd()
+    sys.path.insert(0, app_dir)
+    try:
+        os.chdir(app_dir)
+        with tracer.span('analyze', app_dir=app_dir):
+            runpy.run_path(os.path.join(app_dir, 'analysis.py'), run_name='__main__')
+        return True
+    except Exception as e:
+        logging.error(f"Analysis failed: {str(e)}")
+        return False
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(app_dir)
+
+def downloads_signature(download_dir):
+    # Content digests of every export, from the ingest manifest (only new or
+    # changed files are hashed and parsed again)
+    manifest = IngestManifest(os.path.join(download_dir, MANIFEST_FILENAME))
+    manifest.refresh(sorted(Path(download_dir).glob("mse-funds-data-*.xls")))
+    return tuple(sorted((name, entry['sha256']) for name, entry in manifest.entries.items()))
+
+class RefreshDaemon:
+    # Polls the MSE on a schedule, keeping the browser session warm between
+    # refreshes once it's been needed, and, when the exports changed, ingests
+    # and re-runs the analysis in-process. A refresh normally fetches just the
+    # current month: the crawl plan skips every month that's already complete.
+
+    def __init__(self, download_dir, data_dir=None, app_dir=APP_DIR, crawl_mode=DEFAULT_CRAWL_MODE,
+                 parse_mode=DEFAULT_PARSE_MODE, interval=DAEMON_INTERVAL, years=CRAWL_YEARS, run_analysis=True):
+        self.download_dir = download_dir
+        # The dataset goes where analysis.py reads it unless told otherwise
+        self.data_dir = app_dir if data_dir is None else data_dir
+        self.app_dir = app_dir
+        self.crawl_mode = crawl_mode
+        self.parse_mode = parse_mode
+        self.interval = interval
+        self.years = years
+        self.run_analysis = run_analysis
+        self.browser = BrowserSession(download_dir)
+        self.signature = None
+        self.stopping = threading.Event()
+
+    def refresh(self):
+        # One poll; returns whether new data was ingested
+        with tracer.span('refresh') as span:
+            if crawl(self.download_dir, self.browser, self.crawl_mode, self.years):
+                self.browser.reload()
+
+            signature = downloads_signature(self.download_dir)
+            span['changed'] = signature != self.signature
+            if signature == self.signature:
+                logging.info("No new valuation days")
+                return False
+            if not ingest(self.download_dir, self.parse_mode, self.data_dir):
+                return False
+            # Remembered only once ingested, so a failed ingest is retried next time
+            self.signature = signature
+            if self.run_analysis:
+                analyze(self.app_dir)
+            return True
+
+    def stop(self, *args):
+        # Signal handler: the current refresh finishes, the wait for the next is cut short
+        self.stopping.set()
+
+    def run(self, once=False):
+        # Returns False without starting when the analysis wouldn't see the ingested data
+        if self.run_analysis and os.path.abspath(self.data_dir) != os.path.abspath(self.app_dir):
+            logging.error(f"Analysis reads the dataset in {os.path.abspath(self.app_dir)}, but it would be "
+                          f"written to {os.path.abspath(self.data_dir)}; drop --data-dir or pass --no-analyze")
+            return False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        try:
+            while not self.stopping.is_set():
+                started = time.monotonic()
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logging.error(f"Refresh failed: {str(e)}")
+                # One trace per refresh (with MSE_TRACE set), nothing kept in between
+                tracer.write()
+                if once:
+                    break
+                self.stopping.wait(max(0.0, self.interval - (time.monotonic() - started)))
+        finally:
+            if self.stopping.is_set():
+                logging.info("Refresh daemon stopped")
+            self.browser.close()
+        return True
+
+def interactive(download_dir):
+    # The original prompt-driven run
+    action = get_user_action()
+    crawl_mode = get_crawl_mode() if action == '1' else None
+    parse_mode = get_parse_mode()
+
+    if action == '1':
+        # Crawl and process data
+        browser = BrowserSession(download_dir)
+        try:
+            crawl(download_dir, browser, crawl_mode)
+        finally:
+            browser.close()
+
+    # Process downloaded data (for both actions)
+    ingest(download_dir, parse_mode)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Crawl, ingest and analyse MSE open-end fund data. Without a command, asks what to do.")
+    parser.add_argument('--download-dir', default=os.path.join(os.getcwd(), "fund_data"),
+                        help="where the monthly exports are kept (default: ./fund_data)")
+    parser.add_argument('--data-dir', default=None,
+                        help=f"where {OUTPUT_NAME}.csv and the columnar store are written "
+                             f"(default: the app directory for daemon, . otherwise)")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+
+    def crawl_options(command):
+        command.add_argument('--mode', choices=list(CRAWL_MODES.values()), default=DEFAULT_CRAWL_MODE)
+        command.add_argument('--years', type=int, default=CRAWL_YEARS, help="how far back to crawl")
+
+    def parse_options(command):
+        command.add_argument('--parse', choices=list(PARSE_MODES.values()), default=DEFAULT_PARSE_MODE)
+
+    def app_options(command):
+        command.add_argument('--app-dir', default=APP_DIR, help="directory of analysis.py")
+
+    crawl_options(commands.add_parser('crawl', help="download missing, incomplete or stale months"))
+    parse_options(commands.add_parser('ingest', help="parse the downloads and write the combined dataset"))
+    export_parser = commands.add_parser('export', help="rewrite the combined dataset from the ingested data")
+    export_parser.add_argument('--format', choices=STORE_FORMATS, default='feather', help="columnar store format")
+    app_options(commands.add_parser('analyze', help="run analysis.py"))
+
+    daemon_parser = commands.add_parser('daemon', help="refresh on a schedule with a warm browser session")
+    crawl_options(daemon_parser)
+    parse_options(daemon_parser)
+    app_options(daemon_parser)
+    daemon_parser.add_argument('--interval', type=float, default=DAEMON_INTERVAL, help="seconds between checks")
+    daemon_parser.add_argument('--once', action='store_true', help="refresh once and exit (e.g. from cron)")
+    daemon_parser.add_argument('--no-analyze', dest='analyze', action='store_false', help="only crawl and ingest")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    # Returns the exit status: 1 when the command didn't complete
+    args = parse_args(argv)
+    try:
+        download_dir = args.download_dir
+        os.makedirs(download_dir, exist_ok=True)
+        logging.info(f"Created download directory: {download_dir}")
 
-        crawler.close()
+        if args.command is None:
+            interactive(download_dir)
+            return 0
+        if args.command == 'analyze':
+            return 0 if analyze(args.app_dir) else 1
+        if args.command == 'daemon':
+            daemon = RefreshDaemon(download_dir, args.data_dir, args.app_dir, args.mode, args.parse, args.interval,
+                                   args.years, run_analysis=args.analyze)
+            return 0 if daemon.run(once=args.once) else 1
+
+        data_dir = args.data_dir or '.'
+        if args.command == 'export':
+            return 0 if export_keyed_table(download_dir, data_dir, args.format) else 1
+        if args.command == 'ingest':
+            return 0 if ingest(download_dir, args.parse, data_dir) else 1
+
+        browser = BrowserSession(download_dir)
+        try:
+            return 1 if crawl(download_dir, browser, args.mode, args.years) else 0
+        finally:
+            browser.close()
 
     except Exception as e:
         logging.error(f"Main process error: {str(e)}")
+        return 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
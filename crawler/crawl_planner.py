@@ -0,0 +1,161 @@
+import os
+import re
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from collections import namedtuple
+from pathlib import Path
+
+from export_schema import CALCULATION_COLUMN, EXPORT_DATE_FORMAT
+
+MONTH_FILE = re.compile(r"^mse-funds-data-(\d+)-(\d{4})-(\d{2})\.xls$")
+CHECKPOINT_FILENAME = '.crawl-checkpoint.json'
+CHECKPOINT_VERSION = 1
+# A resumable checkpoint older than this is from an earlier crawl, not an interrupted one
+CHECKPOINT_MAX_AGE = timedelta(days=1)
+# Republished prices for a month can still arrive this many days after it ends,
+# so a month downloaded earlier than that is fetched once more
+SETTLE_DAYS = 3
+
+# A month to (re)download: the same (start, end, iteration) the crawlers take,
+# plus why it was planned
+PlannedMonth = namedtuple('PlannedMonth', ['start', 'end', 'iteration', 'reason'])
+
+
+def month_key(day):
+    return day.strftime('%Y-%m')
+
+
+def month_files(download_dir):
+    # {'YYYY-MM': (iteration, path)} for the exports in download_dir; with several
+    # exports of one month the most recently downloaded one counts
+    months = {}
+    for path in Path(download_dir).glob("mse-funds-data-*.xls"):
+        match = MONTH_FILE.match(path.name)
+        if not match:
+            continue
+        key = f"{match.group(2)}-{match.group(3)}"
+        if key not in months or path.stat().st_mtime > months[key][1].stat().st_mtime:
+            months[key] = (int(match.group(1)), path)
+    return months
+
+
+def _last_date(values):
+    return max(datetime.strptime(value, EXPORT_DATE_FORMAT) for value in values) if len(values) else None
+
+
+def plan_crawl(download_dir, periods, manifest, now=None):
+    # periods: the full (start, end, iteration) schedule, e.g. monthly_periods().
+    # manifest: an IngestManifest refreshed with the files in download_dir, whose
+    # parsed columns tell how far each month's export reaches. A month is planned if
+    #   missing     - no export for it
+    #   unreadable  - its export couldn't be parsed
+    #   incomplete  - nothing in it was calculated after the month ended (e.g. the
+    #                 current month, or one downloaded before it was over)
+    #   stale       - downloaded before the month had settled (SETTLE_DAYS)
+    # An export without rows is done once downloaded after the month settled;
+    # before that it is incomplete like any other.
+    now = now or datetime.now()
+    files = month_files(download_dir)
+    plan = []
+    for start, end, iteration in periods:
+        key = month_key(start)
+        month_end = (start.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        month_end = month_end.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        if key not in files:
+            plan.append(PlannedMonth(start, end, iteration, 'missing'))
+            continue
+        file_iteration, path = files[key]
+        entry = manifest.entries.get(path.name)
+        if entry is None:
+            plan.append(PlannedMonth(start, end, file_iteration, 'unreadable'))
+            continue
+
+        last_calculated = _last_date(entry['columns'][CALCULATION_COLUMN])
+        downloaded = datetime.fromtimestamp(path.stat().st_mtime)
+        settled = month_end + timedelta(days=SETTLE_DAYS + 1)
+        if last_calculated is None:
+            if downloaded < settled:
+                plan.append(PlannedMonth(start, end, file_iteration, 'incomplete'))
+        elif last_calculated <= month_end:
+            plan.append(PlannedMonth(start, end, file_iteration, 'incomplete'))
+        elif downloaded < settled <= now:
+            plan.append(PlannedMonth(start, end, file_iteration, 'stale'))
+    return plan
+
+
+def plan_summary(plan):
+    reasons = {}
+    for month in plan:
+        reasons[month.reason] = reasons.get(month.reason, 0) + 1
+    return ', '.join(f"{count} {reason}" for reason, count in sorted(reasons.items())) or 'nothing to do'
+
+
+class CrawlCheckpoint:
+    # Progress of the current crawl, written after every month, so an interrupted
+    # crawl resumes with the months it hadn't finished:
+    #   {'version', 'started', 'months': {'YYYY-MM': 'pending' | 'done' | 'failed'}}
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.started = None
+        self.months = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            started = datetime.fromisoformat(data['started'])
+            if data.get('version') != CHECKPOINT_VERSION or datetime.now() - started > CHECKPOINT_MAX_AGE:
+                logging.info(f"Ignoring old crawl checkpoint {self.path}")
+                return
+            self.started = started
+            self.months = data['months']
+        except Exception as e:
+            logging.error(f"Error loading crawl checkpoint {self.path}: {str(e)}")
+
+    def save(self):
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': CHECKPOINT_VERSION, 'started': self.started.isoformat(), 'months': self.months},
+                      f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def resume(self, plan):
+        # Drops months an interrupted run already finished, records the rest as
+        # pending. A month the plan still finds incomplete or stale (the current
+        # month is, by design) is fetched again even if it was done.
+        refetch = {month_key(month.start) for month in plan if month.reason in ('incomplete', 'stale')}
+        with self._lock:
+            done = {key for key, state in self.months.items() if state == 'done' and key not in refetch}
+            if done:
+                logging.info(f"Resuming crawl from {self.started:%Y-%m-%d %H:%M}: {len(done)} months already done")
+            else:
+                self.started = datetime.now()
+            pending = [month for month in plan if month_key(month.start) not in done]
+            self.months = {key: 'done' for key in done}
+            for month in pending:
+                self.months[month_key(month.start)] = 'pending'
+            self.save()
+        return pending
+
+    def mark(self, start, state):
+        with self._lock:
+            self.months[month_key(start)] = state
+            self.save()
+
+    def finish(self):
+        # Keep the checkpoint while anything is left to retry
+        with self._lock:
+            remaining = sorted(key for key, state in self.months.items() if state != 'done')
+            if remaining:
+                logging.warning(f"Crawl incomplete, {len(remaining)} months left for the next run: {', '.join(remaining)}")
+            elif self.path.exists():
+                os.remove(self.path)
+        return remaining
@@ -0,0 +1,187 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from export_schema import NAME_COLUMN, VALUATION_COLUMN, SALE_PRICE_COLUMN, BUY_PRICE_COLUMN, PRICE_COLUMNS
+from keyed_ingest import export_dates, _DAY_BITS
+
+# A jump is a daily log return further than JUMP_SIGMAS robust standard
+# deviations (1.4826 x the median absolute deviation) from the median of the
+# JUMP_WINDOW returns before it; funds with fewer than MIN_WINDOW of those aren't
+# checked yet. MIN_SIGMA keeps near-constant series (the cash funds) from
+# turning every small move into a jump.
+JUMP_SIGMAS = 10
+JUMP_WINDOW = 60
+MIN_WINDOW = 20
+MIN_SIGMA = 0.0005
+# A jump beyond SPIKE_SIGMAS is a spike (a bad print) when the next valuation
+# takes back at least SPIKE_REVERSION of it. Real market days can do that too
+# (March 2020), just not as far out, so smaller reverted jumps stay plain jumps.
+SPIKE_SIGMAS = 20
+SPIKE_REVERSION = 0.75
+# Days between consecutive valuations of a fund (the MSE values weekends too)
+MAX_GAP_DAYS = 5
+# Consecutive valuations at one unchanged sale price
+STALE_RUN = 5
+# Buying price this far below the sale price
+MAX_SPREAD = 0.05
+# Rows checked at a time; the return windows take (JUMP_WINDOW + 2) floats a row
+CHECK_CHUNK = 8192
+
+# What analysis does with a row flagged by each check: 'exclude' drops it,
+# 'flag' only reports it
+CHECKS = {
+    'nonpositive_price': 'exclude',  # a zero, negative or missing price
+    'price_inversion': 'exclude',    # buying price above the sale price
+    'spike': 'exclude',              # a jump the next valuation takes back: a bad print
+    'jump': 'flag',                  # a jump that holds
+    'wide_spread': 'flag',
+    'stale_price': 'flag',
+    'calendar_gap': 'flag',
+    'date_order': 'flag',            # calculated before its valuation date, or before the previous day's
+}
+QUARANTINE_COLUMNS = [NAME_COLUMN, VALUATION_COLUMN, 'check', 'value', 'action']
+QUARANTINE_FILENAME = 'fund_quarantine.csv'
+
+
+def affected_rows(positions, n):
+    # Table rows whose checks read any of the given (sorted) row positions: the
+    # row before each (its next-day return), the row itself and the
+    # JUMP_WINDOW + 1 after it (their returns and jump windows). Built from merged
+    # ranges, so the cost follows the number of positions, not the table size.
+    if len(positions) == 0:
+        return np.empty(0, dtype=np.int64)
+    lo = np.maximum(positions - 1, 0)
+    hi = np.maximum.accumulate(np.minimum(positions + JUMP_WINDOW + 2, n))
+    run = np.r_[True, lo[1:] > hi[:-1]]
+    starts, ends = lo[run], hi[np.r_[run[1:], True]]
+    lengths = ends - starts
+    offsets = np.r_[0, np.cumsum(lengths)[:-1]]
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+
+def _log_returns(sale, positions, first, end):
+    # Log return into each position from the row before it, NaN outside the
+    # fund's rows [first, end). Only the window's rows are read, so nothing is
+    # taken over the whole table.
+    n = len(sale)
+    inside = (positions > first) & (positions < end)
+    if n < 2:
+        return np.full(positions.shape, np.nan)
+    clipped = np.clip(positions, 1, n - 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        now, before = sale[clipped], sale[clipped - 1]
+        returns = np.log(np.where(now > 0, now, np.nan)) - np.log(np.where(before > 0, before, np.nan))
+    return np.where(inside, returns, np.nan)
+
+
+def _nanmedian(matrix):
+    # Row medians ignoring NaN, from one sort (NaN sorts last); np.nanmedian
+    # works row by row and is much slower on many short rows
+    ordered = np.sort(matrix, axis=1)
+    counts = (~np.isnan(matrix)).sum(axis=1)
+    rows = np.arange(len(matrix))
+    return (ordered[rows, np.maximum(counts - 1, 0) // 2] + ordered[rows, counts // 2]) / 2
+
+
+def check_rows(table, rows):
+    # Every check for the given rows of a KeyedTable, whose keys sort each fund's
+    # valuations by date. Returns {check: (mask, value)} over rows. Only the
+    # rows and their lookback are read, and each row's fund range [first, end)
+    # comes from a binary search of the keys, so the cost follows len(rows) and
+    # not the table size.
+    keys, calculated = table.keys, table.calculated
+    sale, buy = table.prices[SALE_PRICE_COLUMN], table.prices[BUY_PRICE_COLUMN]
+    fund = keys[rows] >> _DAY_BITS
+    first = np.searchsorted(keys, fund << _DAY_BITS)
+    end = np.searchsorted(keys, (fund + 1) << _DAY_BITS)
+
+    prev = np.maximum(rows - 1, 0)
+    has_prev = rows > first
+    flags = {}
+
+    prices = np.column_stack([table.prices[column][rows] for column in PRICE_COLUMNS])
+    flags['nonpositive_price'] = (~(prices > 0)).any(axis=1), prices.min(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spread = 1 - buy[rows] / sale[rows]
+    flags['price_inversion'] = spread < 0, spread
+    flags['wide_spread'] = spread > MAX_SPREAD, spread
+
+    day = keys[rows] & ((1 << _DAY_BITS) - 1)
+    gap = day - (keys[prev] & ((1 << _DAY_BITS) - 1))
+    flags['calendar_gap'] = has_prev & (gap > MAX_GAP_DAYS), gap.astype(np.float64)
+    lag = calculated[rows] - day
+    behind = calculated[rows] - calculated[prev]
+    backwards = has_prev & (behind < 0)
+    flags['date_order'] = (lag < 0) | backwards, np.where(backwards, behind, lag).astype(np.float64)
+
+    # The STALE_RUN - 1 valuations before each row all at its sale price
+    before = rows[:, None] - np.arange(1, STALE_RUN)
+    clipped = np.maximum(before, 0)
+    repeated = ((before >= first[:, None]) & (sale[clipped] == sale[rows][:, None])).all(axis=1)
+    flags['stale_price'] = repeated, sale[rows]
+
+    # Returns before, into and out of each row: window columns, then r_in, r_out
+    returns = _log_returns(sale, rows[:, None] + np.arange(-JUMP_WINDOW, 2), first[:, None], end[:, None])
+    window, r_in, r_out = returns[:, :JUMP_WINDOW], returns[:, JUMP_WINDOW], returns[:, JUMP_WINDOW + 1]
+    enough = (~np.isnan(window)).sum(axis=1) >= MIN_WINDOW
+
+    r_prev = window[:, -1]
+    z_prev, z_in = np.full(len(rows), np.nan), np.full(len(rows), np.nan)
+    if enough.any():
+        median = _nanmedian(window[enough])
+        sigma = np.maximum(1.4826 * _nanmedian(np.abs(window[enough] - median[:, None])), MIN_SIGMA)
+        z_prev[enough] = (r_prev[enough] - median) / sigma
+        z_in[enough] = (r_in[enough] - median) / sigma
+    with np.errstate(invalid='ignore'):
+        big_in = np.abs(z_in) > JUMP_SIGMAS
+        spike = (np.abs(z_in) > SPIKE_SIGMAS) & (np.abs(r_in + r_out) <= (1 - SPIKE_REVERSION) * np.abs(r_in))
+        # The valuation after a spike jumps back; the spike row carries the flag
+        reverting = big_in & (np.abs(z_prev) > SPIKE_SIGMAS) & \
+            (np.abs(r_prev + r_in) <= (1 - SPIKE_REVERSION) * np.abs(r_prev))
+    flags['spike'] = spike, z_in
+    flags['jump'] = big_in & ~spike & ~reverting, z_in
+    return flags
+
+
+def check_table(table):
+    # Brings table.quarantine up to date with the rows added or changed since the
+    # last check (table.unchecked), re-checking only the rows that can see them.
+    # Returns the number of rows checked.
+    if len(table.unchecked) == 0:
+        return 0
+    rows = affected_rows(np.searchsorted(table.keys, table.unchecked), len(table))
+    for key in table.keys[rows].tolist():
+        table.quarantine.pop(key, None)
+    for lo in range(0, len(rows), CHECK_CHUNK):
+        chunk = rows[lo:lo + CHECK_CHUNK]
+        keys = table.keys[chunk]
+        for check, (mask, values) in check_rows(table, chunk).items():
+            for key, value in zip(keys[mask].tolist(), values[mask].tolist()):
+                table.quarantine.setdefault(key, {})[check] = value
+    table.unchecked = np.empty(0, dtype=np.int64)
+    table.dirty = True
+    return len(rows)
+
+
+def quarantine_frame(table):
+    # One row per flagged (fund, valuation date, check), by fund and date
+    records = [(key, check, value) for key in sorted(table.quarantine) for check, value in table.quarantine[key].items()]
+    keys = np.array([key for key, _, _ in records], dtype=np.int64)
+    return pd.DataFrame({
+        NAME_COLUMN: np.array(table.funds, dtype=object)[keys >> _DAY_BITS],
+        VALUATION_COLUMN: export_dates(keys & ((1 << _DAY_BITS) - 1)),
+        'check': [check for _, check, _ in records],
+        'value': [value for _, _, value in records],
+        'action': [CHECKS[check] for _, check, _ in records],
+    }, columns=QUARANTINE_COLUMNS)
+
+
+def log_quarantine(quarantine, checked):
+    counts = quarantine['check'].value_counts()
+    summary = ', '.join(f"{counts[check]} {check}" for check in CHECKS if check in counts) or 'nothing flagged'
+    logging.info(f"Data quality: checked {checked} rows; {summary}")
+    excluded = int((quarantine['action'] == 'exclude').sum())
+    if excluded:
+        logging.warning(f"{excluded} rows quarantined for exclusion from the analysis")
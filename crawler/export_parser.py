@@ -0,0 +1,120 @@
+import os
+import re
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+from export_schema import NAME_COLUMN, PRICE_COLUMNS, COLUMNS
+from tracing import get_tracer
+
+# Same whitespace handling pd.read_html applies to cell text
+_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+
+
+def _cell_text(element):
+    return _WHITESPACE.sub(" ", "".join(element.itertext())).strip()
+
+
+def _to_float(value):
+    value = value.replace(",", "")
+    return float(value) if value else np.nan
+
+
+def iter_table_rows(path):
+    # Stream the export's single <table> row by row instead of building a full
+    # document tree. Yields the header cells first, then each body row.
+    for _, row in etree.iterparse(str(path), events=('end',), tag='tr', html=True, encoding='utf-8'):
+        cells = [_cell_text(cell) for cell in row if cell.tag in ('td', 'th')]
+        row.clear()
+        # Drop already processed siblings so memory stays flat
+        while row.getprevious() is not None:
+            del row.getparent()[0]
+        if cells:
+            yield cells
+
+
+def parse_export(path):
+    # An export with the header and no rows (a month without valuations) parses
+    # to empty columns, so it can be recorded as downloaded
+    rows = iter_table_rows(path)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError("No table found in the HTML content")
+    if header != COLUMNS:
+        raise ValueError(f"Unexpected table header: {header}")
+
+    columns = {column: [] for column in COLUMNS}
+    for cells in rows:
+        if len(cells) != len(COLUMNS):
+            raise ValueError(f"Unexpected row with {len(cells)} cells: {cells}")
+        for column, value in zip(COLUMNS, cells):
+            columns[column].append(value)
+
+    for column in PRICE_COLUMNS:
+        columns[column] = np.array([_to_float(v) for v in columns[column]], dtype=np.float64)
+    return columns
+
+
+def frame_columns(df):
+    # A parsed export held as a DataFrame (the BeautifulSoup parser) in the
+    # column dict form parse_export returns
+    return {column: df[column].to_numpy(dtype=np.float64) if column in PRICE_COLUMNS else df[column].tolist()
+            for column in COLUMNS}
+
+
+def _parse_export_safe(path):
+    # Worker entry point: exceptions are returned rather than raised so a single
+    # broken file doesn't abort the whole pool
+    try:
+        return path, parse_export(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def combine_columns(parsed):
+    if not parsed:
+        return None
+    get_tracer().count('combined_rows', sum(len(p[NAME_COLUMN]) for p in parsed))
+    data = {}
+    for column in COLUMNS:
+        if column in PRICE_COLUMNS:
+            data[column] = np.concatenate([p[column] for p in parsed])
+        else:
+            data[column] = np.array([v for p in parsed for v in p[column]], dtype=object)
+    return pd.DataFrame(data, columns=COLUMNS)
+
+
+def parse_exports_by_file(files, parallel=False, max_workers=None):
+    files = [str(f) for f in files]
+    tracer = get_tracer()
+    with tracer.span('parse', files=len(files), parallel=parallel) as span:
+        if parallel and len(files) > 1:
+            max_workers = max_workers or min(len(files), os.cpu_count() or 1)
+            chunksize = max(1, len(files) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() keeps file order, so the combined frame matches a sequential run
+                results = list(executor.map(_parse_export_safe, files, chunksize=chunksize))
+        else:
+            results = [_parse_export_safe(f) for f in files]
+        span['bytes'] = sum(os.path.getsize(f) for f in files)
+        span['rows'] = sum(len(columns[NAME_COLUMN]) for _, columns, _ in results if columns is not None)
+    tracer.count('parse_bytes', span['bytes'])
+    tracer.count('parse_rows', span['rows'])
+
+    parsed = []
+    for path, columns, error in results:
+        if error is None:
+            parsed.append((path, columns))
+            logging.info(f"Successfully processed file: {path}")
+        else:
+            logging.error(f"Error processing file {path}: {error}")
+            logging.error(f"File size: {os.path.getsize(path)} bytes")
+    return parsed
+
+
+def parse_exports(files, parallel=False, max_workers=None):
+    parsed = parse_exports_by_file(files, parallel=parallel, max_workers=max_workers)
+    return combine_columns([columns for _, columns in parsed])
@@ -0,0 +1,64 @@
+import shutil
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from export_schema import (NAME_COLUMN, VALUATION_COLUMN, DATE_COLUMNS, PRICE_COLUMNS, EXPORT_DATE_FORMAT,
+                           PARTITION_COLUMN)
+
+STORE_FORMATS = ('feather', 'parquet')
+
+
+def to_typed_frame(df):
+    typed = pd.DataFrame({
+        NAME_COLUMN: df[NAME_COLUMN].astype('category'),
+        **{c: pd.to_datetime(df[c], format=EXPORT_DATE_FORMAT).astype('datetime64[ns]') for c in DATE_COLUMNS},
+        **{c: df[c].astype('float64') for c in PRICE_COLUMNS},
+    })
+    typed[PARTITION_COLUMN] = typed[VALUATION_COLUMN].dt.strftime('%Y-%m')
+    return typed
+
+
+def write_store(df, path, store_format='feather'):
+    # Columnar copy of the combined dataset, one directory per valuation month:
+    #   <path>/valuation_month=2024-10/part-0.<arrow|parquet>
+    # Feather (Arrow IPC) files are written uncompressed so readers can memory-map them.
+    # app/fund_loader.py is the matching reader.
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if store_format not in STORE_FORMATS:
+        raise ValueError(f"Unknown store format: {store_format}")
+
+    typed = to_typed_frame(df)
+    table = pa.Table.from_pandas(typed, preserve_index=False)
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if tmp_path.exists():
+        shutil.rmtree(tmp_path)
+
+    if store_format == 'feather':
+        file_format = ds.IpcFileFormat()
+        file_options = file_format.make_write_options(compression=None)
+        basename_template = 'part-{i}.arrow'
+    else:
+        file_format = ds.ParquetFileFormat()
+        file_options = file_format.make_write_options(compression='snappy')
+        basename_template = 'part-{i}.parquet'
+
+    ds.write_dataset(
+        table,
+        tmp_path,
+        format=file_format,
+        file_options=file_options,
+        partitioning=ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.string())]), flavor='hive'),
+        basename_template=basename_template,
+    )
+
+    # Swap the finished store in so readers never see a half-written directory
+    if path.exists():
+        shutil.rmtree(path)
+    tmp_path.rename(path)
+    logging.info(f"Columnar store ({store_format}) with {len(typed)} rows saved to {path}")
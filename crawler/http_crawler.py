@@ -0,0 +1,151 @@
+import os
+import re
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tracing import get_tracer
+
+MSE_FUNDS_URL = "https://www.mse.mk/F/open-end-investment-funds"
+
+# btnExport builds the .xls in the browser by wrapping #resultsTable in this
+# Excel HTML template, so the HTTP path does the same with the table it receives
+EXCEL_TEMPLATE_HEAD = (
+    "<html xmlns:o='urn:schemas-microsoft-com:office:office' "
+    "xmlns:x='urn:schemas-microsoft-com:office:excel' "
+    "xmlns='http://www.w3.org/TR/REC-html40'><head>"
+    '<meta http-equiv="Content-type" content="text/html;charset=utf-8" />'
+    "<!--[if gte mso 9]><xml><x:ExcelWorkbook><x:ExcelWorksheets><x:ExcelWorksheet>"
+    "<x:Name>My Worksheet</x:Name><x:WorksheetOptions><x:DisplayGridlines/>"
+    "</x:WorksheetOptions></x:ExcelWorksheet></x:ExcelWorksheets></x:ExcelWorkbook>"
+    "</xml><![endif]--></head><body>"
+)
+EXCEL_TEMPLATE_TAIL = "</body></html>"
+
+_RESULTS_TABLE = re.compile(r"<table[^>]*id=['\"]resultsTable['\"].*?</table>", re.S | re.I)
+_HIDDEN_INPUT = re.compile(r"<input[^>]*type=['\"]hidden['\"][^>]*>", re.I)
+_ATTRIBUTE = re.compile(r"(name|value)=['\"]([^'\"]*)['\"]", re.I)
+
+
+def extract_results_table(html):
+    match = _RESULTS_TABLE.search(html)
+    return match.group(0) if match else None
+
+
+def hidden_form_fields(html):
+    # Anti-forgery tokens and similar hidden inputs have to be posted back with the dates
+    fields = {}
+    for tag in _HIDDEN_INPUT.findall(html):
+        attributes = dict((k.lower(), v) for k, v in _ATTRIBUTE.findall(tag))
+        if 'name' in attributes:
+            fields[attributes['name']] = attributes.get('value', '')
+    return fields
+
+
+class HttpFundCrawler:
+    # Plain-HTTP version of MutualFundCrawler.download_monthly_data: submits the
+    # FromDate/ToDate form directly and saves the results table as the same
+    # mse-funds-data-<iteration>-<year>-<month>.xls file the browser export produces.
+
+    def __init__(self, download_dir, url=MSE_FUNDS_URL, max_concurrency=4, max_retries=3,
+                 backoff=1.0, timeout=30):
+        self.download_dir = download_dir
+        self.url = url
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.downloaded_files = set()
+        self._form_fields = None
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def form_fields(self):
+        with self._lock:
+            if self._form_fields is None:
+                logging.info(f"Accessing URL: {self.url}")
+                response = self.session.get(self.url, timeout=self.timeout)
+                response.raise_for_status()
+                self._form_fields = hidden_form_fields(response.text)
+            return dict(self._form_fields)
+
+    def request_with_retry(self, description, fn):
+        retry_count = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                retry_count += 1
+                logging.error(f"Attempt {retry_count} failed for {description}: {str(e)}")
+                get_tracer().count('http_retries')
+                if retry_count >= self.max_retries:
+                    raise
+                # Exponential backoff with jitter so concurrent workers don't retry in lockstep
+                delay = self.backoff * (2 ** (retry_count - 1)) * (1 + random.random())
+                with get_tracer().span('sleep', reason='backoff', seconds=delay):
+                    time.sleep(delay)
+
+    def fetch_results_table(self, start_date, end_date):
+        data = self.form_fields()
+        data['FromDate'] = start_date.strftime("%m/%d/%Y")
+        data['ToDate'] = end_date.strftime("%m/%d/%Y")
+
+        response = self.session.post(self.url, data=data, timeout=self.timeout)
+        response.raise_for_status()
+
+        table = extract_results_table(response.text)
+        if table is None:
+            raise ValueError("No results table in the response")
+        return table
+
+    def download_monthly_data(self, start_date, end_date, iteration):
+        description = f"period {start_date.strftime('%m/%d/%Y')} - {end_date.strftime('%m/%d/%Y')}"
+        target_filename = f"mse-funds-data-{iteration}-{start_date.year}-{start_date.month:02d}.xls"
+        try:
+            with get_tracer().span('download', mode='http', month=start_date.strftime('%Y-%m')) as span:
+                table = self.request_with_retry(description, lambda: self.fetch_results_table(start_date, end_date))
+                span['bytes'] = len(table)
+            get_tracer().count('download_bytes', len(table))
+        except Exception as e:
+            logging.error(f"Failed after {self.max_retries} attempts for {description}: {str(e)}")
+            return False
+
+        target_path = os.path.join(self.download_dir, target_filename)
+        tmp_path = target_path + '.part'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(EXCEL_TEMPLATE_HEAD)
+            f.write(table)
+            f.write(EXCEL_TEMPLATE_TAIL)
+        os.replace(tmp_path, target_path)
+
+        with self._lock:
+            self.downloaded_files.add(target_filename)
+        logging.info(f"Saved {target_filename}")
+        return True
+
+    def download_months(self, periods, on_result=None):
+        # periods: iterable of (start_date, end_date, iteration, ...); returns the ones
+        # that failed. on_result(period, success) is called as each month finishes.
+        periods = list(periods)
+
+        def download(period):
+            success = self.download_monthly_data(period[0], period[1], period[2])
+            if on_result is not None:
+                on_result(period, success)
+            return success
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            results = list(executor.map(download, periods))
+        return [period for period, success in zip(periods, results) if not success]
+
+    def close(self):
+        self.session.close()
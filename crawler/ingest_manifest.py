@@ -0,0 +1,101 @@
+import os
+import pickle
+import hashlib
+import logging
+from pathlib import Path
+
+from export_parser import parse_exports_by_file, combine_columns
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = '.ingest-manifest.pkl'
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    # Per-file record of what has already been parsed:
+    #   {file name: {'size', 'mtime', 'sha256', 'columns'}}
+    # where 'columns' is the typed column dict produced by export_parser.parse_export
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data['entries']
+            else:
+                logging.warning(f"Ignoring manifest {self.path} with unknown version {data.get('version')}")
+        except Exception as e:
+            logging.error(f"Error loading manifest {self.path}: {str(e)}")
+            self.entries = {}
+
+    def save(self):
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        logging.info(f"Saved manifest with {len(self.entries)} files to {self.path}")
+
+    def is_current(self, path, stat):
+        entry = self.entries.get(path.name)
+        if entry is None:
+            return False
+        if entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return True
+        if entry['size'] != stat.st_size:
+            return False
+        # Touched but possibly unchanged (e.g. re-downloaded) - compare content
+        if entry['sha256'] == file_digest(path):
+            entry['mtime'] = stat.st_mtime_ns
+            self.dirty = True
+            return True
+        return False
+
+    def refresh(self, files, parallel=False, max_workers=None):
+        files = [Path(f) for f in files]
+        names = {f.name for f in files}
+
+        removed = [name for name in self.entries if name not in names]
+        for name in removed:
+            logging.info(f"Dropping {name} from manifest (file no longer present)")
+            del self.entries[name]
+            self.dirty = True
+
+        stats = {f: f.stat() for f in files}
+        stale = [f for f in files if not self.is_current(f, stats[f])]
+        logging.info(f"{len(files) - len(stale)} files unchanged, {len(stale)} new or changed")
+
+        for path, columns in parse_exports_by_file(stale, parallel=parallel, max_workers=max_workers):
+            path = Path(path)
+            stat = stats[path]
+            self.entries[path.name] = {
+                'size': stat.st_size,
+                'mtime': stat.st_mtime_ns,
+                'sha256': file_digest(path),
+                'columns': columns,
+            }
+            self.dirty = True
+
+        if self.dirty:
+            self.save()
+            self.dirty = False
+        return stale
+
+    def combined(self, files):
+        # Keep the same file order as a full parse so the output is identical
+        parsed = [self.entries[Path(f).name]['columns'] for f in files if Path(f).name in self.entries]
+        return combine_columns(parsed)
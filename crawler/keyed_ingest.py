@@ -0,0 +1,279 @@
+import os
+import pickle
+import logging
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from export_schema import (NAME_COLUMN, CALCULATION_COLUMN, VALUATION_COLUMN, PRICE_COLUMNS, COLUMNS,
+                           EXPORT_DATE_FORMAT)
+
+TABLE_VERSION = 1
+TABLE_FILENAME = '.keyed-table.pkl'
+
+# Keys pack the interned fund ID above the valuation day (days since 1970-01-01)
+_DAY_BITS = 32
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_days_cache = {}
+_dates_cache = {}
+
+
+def export_days(values):
+    # Export dates (month/day/year without zero padding, e.g. 11/3/2014) as day numbers
+    days = np.empty(len(values), dtype=np.int64)
+    for i, value in enumerate(values):
+        day = _days_cache.get(value)
+        if day is None:
+            day = _days_cache[value] = datetime.strptime(value, EXPORT_DATE_FORMAT).toordinal() - _EPOCH_ORDINAL
+        days[i] = day
+    return days
+
+
+def export_dates(days):
+    # Inverse of export_days, back to the export's own date strings
+    unique, inverse = np.unique(days, return_inverse=True)
+    strings = []
+    for day in unique.tolist():
+        value = _dates_cache.get(day)
+        if value is None:
+            d = date.fromordinal(day + _EPOCH_ORDINAL)
+            value = _dates_cache[day] = f"{d.month}/{d.day}/{d.year}"
+        strings.append(value)
+    return np.array(strings, dtype=object)[inverse]
+
+
+class KeyedTable:
+    # The combined dataset keyed on (fund, valuation date), one row per key.
+    # When the MSE republishes a day, the row with the latest date of calculation
+    # wins (the later ingested one on ties) and the price change is reported.
+    # Keys are kept sorted, so an upsert is a binary search per incoming row
+    # rather than re-hashing the whole history; rows keep the position they were
+    # first seen at, so the output reads like the concatenated exports. Inserting
+    # new keys still copies the table arrays once per call (O(n + m log n) for m
+    # incoming rows), which is why sync and the ingest merge all their exports
+    # in one upsert_many call.
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.clear()
+        if self.path is not None:
+            self.load()
+
+    def clear(self):
+        self.funds = []
+        self.fund_ids = {}
+        self.keys = np.empty(0, dtype=np.int64)
+        self.calculated = np.empty(0, dtype=np.int64)
+        self.prices = {column: np.empty(0, dtype=np.float64) for column in PRICE_COLUMNS}
+        self.first_seen = np.empty(0, dtype=np.int64)
+        self.next_seen = 0
+        # file name -> sha256 of the content already upserted
+        self.sources = {}
+        # Data quality (see data_quality.py): {key: {check: value}} for flagged
+        # rows, and the keys added or changed since the checks last ran
+        self.quarantine = {}
+        self.unchecked = np.empty(0, dtype=np.int64)
+        self.dirty = True
+
+    def __len__(self):
+        return len(self.keys)
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') != TABLE_VERSION:
+                logging.warning(f"Ignoring keyed table {self.path} with unknown version {data.get('version')}")
+                return
+            self.funds = data['funds']
+            self.fund_ids = {name: fund_id for fund_id, name in enumerate(self.funds)}
+            for name in ('keys', 'calculated', 'prices', 'first_seen', 'next_seen', 'sources'):
+                setattr(self, name, data[name])
+            # Tables saved before the quality checks existed get every row checked once
+            self.quarantine = data.get('quarantine', {})
+            self.unchecked = data.get('unchecked', self.keys.copy())
+            self.dirty = False
+        except Exception as e:
+            logging.error(f"Error loading keyed table {self.path}: {str(e)}")
+            self.clear()
+
+    def save(self):
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                'version': TABLE_VERSION,
+                'funds': self.funds,
+                'keys': self.keys,
+                'calculated': self.calculated,
+                'prices': self.prices,
+                'first_seen': self.first_seen,
+                'next_seen': self.next_seen,
+                'sources': self.sources,
+                'quarantine': self.quarantine,
+                'unchecked': self.unchecked,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+        logging.info(f"Saved keyed table with {len(self)} rows to {self.path}")
+
+    def _fund_id(self, name):
+        fund_id = self.fund_ids.get(name)
+        if fund_id is None:
+            fund_id = self.fund_ids[name] = len(self.funds)
+            self.funds.append(name)
+        return fund_id
+
+    def _revision(self, key, old_calculated, new_calculated, old_prices, new_prices):
+        return {
+            'fund': self.funds[key >> _DAY_BITS],
+            'valuation_date': export_dates([key & ((1 << _DAY_BITS) - 1)])[0],
+            'old_calculated': export_dates([old_calculated])[0],
+            'new_calculated': export_dates([new_calculated])[0],
+            'old_prices': dict(zip(PRICE_COLUMNS, old_prices.tolist())),
+            'new_prices': dict(zip(PRICE_COLUMNS, new_prices.tolist())),
+        }
+
+    def _encode(self, columns):
+        # One parsed export as (keys, calculated days, prices matrix)
+        fund_ids = np.array([self._fund_id(name) for name in columns[NAME_COLUMN]], dtype=np.int64)
+        keys = (fund_ids << _DAY_BITS) | export_days(columns[VALUATION_COLUMN])
+        calculated = export_days(columns[CALCULATION_COLUMN])
+        prices = np.column_stack([np.asarray(columns[column], dtype=np.float64) for column in PRICE_COLUMNS])
+        return keys, calculated, prices
+
+    def upsert(self, columns):
+        # columns: one parsed export (export_parser.parse_export). Returns the
+        # revisions, i.e. keys whose prices changed.
+        return self.upsert_many([columns])
+
+    def upsert_many(self, batches):
+        # batches: parsed exports in ingest order, merged into the table in one
+        # pass. Each export is reduced to arrays as it arrives; then every incoming
+        # key is binary searched once and the new ones are inserted together, so
+        # the table arrays are copied once per call, not once per export. Per key,
+        # the versions are taken in ingest order as separate upserts would: a
+        # version replaces the current one unless it was calculated earlier, and
+        # replacing it with different prices is a revision.
+        encoded = [self._encode(columns) for columns in batches]
+        if not encoded:
+            return []
+        keys = np.concatenate([batch[0] for batch in encoded])
+        calculated = np.concatenate([batch[1] for batch in encoded])
+        prices = np.concatenate([batch[2] for batch in encoded])
+        batch_rows = len(keys)
+        if batch_rows == 0:
+            return []
+        revisions = []
+
+        # Incoming rows grouped by key, each group in ingest order
+        order = np.lexsort((np.arange(batch_rows), keys))
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        unique_keys = sorted_keys[starts]
+        counts = np.diff(np.r_[starts, batch_rows])
+
+        # Against the table: binary search each incoming key
+        position = np.searchsorted(self.keys, unique_keys)
+        found = position < len(self.keys)
+        found[found] = self.keys[position[found]] == unique_keys[found]
+
+        # Current version of every key: the table's, then each incoming one that
+        # replaces it (source: its incoming row, -1 while the table's holds)
+        current_calculated = np.zeros(len(unique_keys), dtype=np.int64)
+        current_prices = np.full((len(unique_keys), len(PRICE_COLUMNS)), np.nan)
+        current_calculated[found] = self.calculated[position[found]]
+        for i, column in enumerate(PRICE_COLUMNS):
+            current_prices[found, i] = self.prices[column][position[found]]
+        source = np.full(len(unique_keys), -1)
+        held = found.copy()
+        stale = 0
+        for step in range(int(counts.max())):
+            group = np.flatnonzero(counts > step)
+            rows = order[starts[group] + step]
+            old_calculated, old_prices = current_calculated[group], current_prices[group]
+            newer = calculated[rows] >= old_calculated
+            differs = ~((old_prices == prices[rows]) | (np.isnan(old_prices) & np.isnan(prices[rows]))).all(axis=1)
+            revised = held[group] & newer & differs
+            for key, row, old_day, old in zip(unique_keys[group[revised]], rows[revised],
+                                              old_calculated[revised], old_prices[revised]):
+                revisions.append(self._revision(key, old_day, calculated[row], old, prices[row]))
+            stale += int((held[group] & ~newer & differs).sum())
+
+            take = ~held[group] | (newer & (differs | (calculated[rows] != old_calculated)))
+            replaced, rows = group[take], rows[take]
+            current_calculated[replaced] = calculated[rows]
+            current_prices[replaced] = prices[rows]
+            source[replaced] = rows
+            held[group] = True
+        if stale:
+            logging.info(f"Ignored {stale} prices calculated before the ones already ingested")
+
+        changed = found & (source >= 0)
+        replace = position[changed]
+        self.calculated[replace] = current_calculated[changed]
+        for i, column in enumerate(PRICE_COLUMNS):
+            self.prices[column][replace] = current_prices[changed, i]
+
+        # New keys go in at their sorted positions (positions refer to the old
+        # arrays), in one pass per array; a new key takes the place of its first
+        # row in the exports
+        new = np.flatnonzero(~found)
+        if len(new):
+            at = position[new]
+            self.keys = np.insert(self.keys, at, unique_keys[new])
+            self.calculated = np.insert(self.calculated, at, current_calculated[new])
+            for i, column in enumerate(PRICE_COLUMNS):
+                self.prices[column] = np.insert(self.prices[column], at, current_prices[new, i])
+            self.first_seen = np.insert(self.first_seen, at, self.next_seen + order[starts[new]])
+        self.next_seen += batch_rows
+        self.unchecked = np.union1d(self.unchecked, unique_keys[source >= 0])
+
+        self.dirty = self.dirty or len(new) > 0 or bool(changed.any())
+        return revisions
+
+    def sync(self, manifest, files):
+        # Upsert every file whose current content (per the ingest manifest) isn't
+        # in the table yet, in file order. Rows can't be attributed back to a file,
+        # so a removed file means rebuilding from the remaining ones.
+        names = [Path(f).name for f in files if Path(f).name in manifest.entries]
+        removed = set(self.sources) - set(names)
+        if removed:
+            logging.info(f"Rebuilding keyed table ({len(removed)} files no longer present)")
+            self.clear()
+
+        batches = []
+        for name in names:
+            digest = manifest.entries[name]['sha256']
+            if self.sources.get(name) != digest:
+                batches.append(manifest.entries[name]['columns'])
+                self.sources[name] = digest
+                self.dirty = True
+        return self.upsert_many(batches)
+
+    def to_frame(self):
+        # Rows in the order they were first seen, in the combined CSV layout
+        order = np.argsort(self.first_seen, kind='stable')
+        keys = self.keys[order]
+        data = {
+            NAME_COLUMN: np.array(self.funds, dtype=object)[keys >> _DAY_BITS],
+            CALCULATION_COLUMN: export_dates(self.calculated[order]),
+            VALUATION_COLUMN: export_dates(keys & ((1 << _DAY_BITS) - 1)),
+            **{column: self.prices[column][order] for column in PRICE_COLUMNS},
+        }
+        return pd.DataFrame(data, columns=COLUMNS)
+
+
+def log_revisions(revisions):
+    for revision in revisions:
+        changes = ', '.join(f"{column} {old} -> {revision['new_prices'][column]}"
+                            for column, old in revision['old_prices'].items()
+                            if not (old == revision['new_prices'][column] or
+                                    (np.isnan(old) and np.isnan(revision['new_prices'][column]))))
+        logging.info(f"Revised {revision['fund']} on {revision['valuation_date']} "
+                     f"(calculated {revision['old_calculated']} -> {revision['new_calculated']}): {changes}")
+    if revisions:
+        logging.warning(f"{len(revisions)} published prices were revised")
@@ -0,0 +1,140 @@
+import re
+import sys
+import time
+import random
+import logging
+import argparse
+from pathlib import Path
+from urllib.parse import parse_qs
+from datetime import datetime
+from threading import Lock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the MSE open-end funds page, serving the recorded
+# fund_data/*.xls exports. Point HttpFundCrawler at it to exercise the HTTP
+# crawler (concurrency, retries) without touching mse.mk:
+#
+#   python stub_server.py --port 8765 --fail-rate 0.2
+#   HttpFundCrawler(download_dir, url="http://127.0.0.1:8765/F/open-end-investment-funds")
+#
+# A month without a recorded export gets the results table with no rows, as
+# mse.mk answers for a period without valuations. The handler class counts the
+# POSTs it received per FromDate and the most it served at once, for tests.
+
+TOKEN = 'stub-token'
+PAGE = """<html><body><form method='post'>
+<input name="__RequestVerificationToken" type="hidden" value="{token}" />
+<input id='FromDate' name='FromDate' /><input id='ToDate' name='ToDate' />
+<input type='submit' value='Find' /></form>
+{table}
+<a id='btnExport'>Export</a></body></html>"""
+
+_TABLE = re.compile(r"<table.*?</table>", re.S | re.I)
+_TABLE_HEAD = re.compile(r"<table.*?</thead>", re.S | re.I)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    fixtures_dir = None
+    fail_rate = 0.0
+    # The first fail_first POSTs for each FromDate are answered with 503
+    fail_first = 0
+    # Seconds each POST takes, so concurrent requests overlap
+    delay = 0.0
+    # Set per server by make_server
+    posts = None
+    in_flight = 0
+    peak_in_flight = 0
+    lock = None
+
+    def send_page(self, status, body):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self.send_page(200, PAGE.format(token=TOKEN, table=''))
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+        try:
+            self.answer_post()
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def answer_post(self):
+        length = int(self.headers.get('Content-Length', 0))
+        form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode('utf-8')).items()}
+        if self.delay:
+            time.sleep(self.delay)
+        period = form.get('FromDate')
+        with self.lock:
+            self.posts[period] = attempt = self.posts.get(period, 0) + 1
+
+        if attempt <= self.fail_first or random.random() < self.fail_rate:
+            self.send_page(503, 'Service Unavailable')
+            return
+        if form.get('__RequestVerificationToken') != TOKEN:
+            self.send_page(400, 'Missing verification token')
+            return
+
+        try:
+            start = datetime.strptime(form['FromDate'], '%m/%d/%Y')
+        except (KeyError, ValueError):
+            self.send_page(400, 'Invalid FromDate')
+            return
+
+        fixtures = sorted(Path(self.fixtures_dir).glob(f"mse-funds-data-*-{start.year}-{start.month:02d}.xls"))
+        table = ''
+        if fixtures:
+            match = _TABLE.search(fixtures[0].read_text(encoding='utf-8'))
+            table = match.group(0) if match else ''
+        else:
+            # The header of any recorded export, with an empty body
+            for fixture in sorted(Path(self.fixtures_dir).glob("mse-funds-data-*.xls"))[:1]:
+                match = _TABLE_HEAD.search(fixture.read_text(encoding='utf-8'))
+                table = match.group(0) + '<tbody></tbody></table>' if match else ''
+        self.send_page(200, PAGE.format(token=TOKEN, table=table))
+
+    def log_message(self, format, *args):
+        logging.debug(format % args)
+
+
+def make_server(fixtures_dir, host='127.0.0.1', port=0, fail_rate=0.0, fail_first=0, delay=0.0):
+    # The handler class is the server's RequestHandlerClass, e.g.
+    # server.RequestHandlerClass.posts
+    handler = type('Handler', (StubHandler,), {
+        'fixtures_dir': fixtures_dir, 'fail_rate': fail_rate, 'fail_first': fail_first, 'delay': delay,
+        'posts': {}, 'lock': Lock(),
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve recorded MSE exports for HttpFundCrawler")
+    parser.add_argument('--fixtures', default=str(Path(__file__).resolve().parent.parent / 'fund_data'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="fraction of POSTs answered with 503")
+    parser.add_argument('--fail-first', type=int, default=0, help="POSTs per period answered with 503 first")
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds each POST takes")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.fixtures, args.host, args.port, args.fail_rate, args.fail_first, args.delay)
+    print(f"Serving {args.fixtures} on http://{args.host}:{server.server_port}/F/open-end-investment-funds")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
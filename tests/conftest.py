@@ -0,0 +1,10 @@
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+FUND_DATA = os.path.join(ROOT, 'fund_data')
+
+# The crawler and app modules import each other by bare name, as when run from
+# their own directories; crawler first, as in crawl-mse.py
+sys.path.insert(0, os.path.join(ROOT, 'crawler'))
+sys.path.append(os.path.join(ROOT, 'app'))
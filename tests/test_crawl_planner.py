@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+from crawl_planner import CrawlCheckpoint, PlannedMonth, CHECKPOINT_FILENAME
+
+
+def planned(year, month, reason):
+    start = datetime(year, month, 1)
+    return PlannedMonth(start, (start + timedelta(days=32)).replace(day=1) - timedelta(days=1), 1, reason)
+
+
+def test_resume_refetches_months_still_incomplete(tmp_path):
+    # A crawl that finished the current month but failed another keeps its checkpoint
+    path = tmp_path / CHECKPOINT_FILENAME
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.resume([planned(2026, 9, 'missing'), planned(2026, 10, 'incomplete'), planned(2026, 8, 'missing')])
+    checkpoint.mark(datetime(2026, 8, 1), 'done')
+    checkpoint.mark(datetime(2026, 9, 1), 'failed')
+    checkpoint.mark(datetime(2026, 10, 1), 'done')
+    assert checkpoint.finish() == ['2026-09']
+
+    # The next refresh still plans the current month, and gets it
+    pending = CrawlCheckpoint(path).resume([planned(2026, 9, 'missing'), planned(2026, 10, 'incomplete')])
+    assert [month.start.strftime('%Y-%m') for month in pending] == ['2026-09', '2026-10']
+
+
+def test_resume_skips_months_already_done(tmp_path):
+    path = tmp_path / CHECKPOINT_FILENAME
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.resume([planned(2026, 8, 'missing'), planned(2026, 9, 'missing')])
+    checkpoint.mark(datetime(2026, 8, 1), 'done')
+
+    # Interrupted: the export for August was removed again, but the checkpoint says done
+    pending = CrawlCheckpoint(path).resume([planned(2026, 8, 'missing'), planned(2026, 9, 'missing')])
+    assert [month.start.strftime('%Y-%m') for month in pending] == ['2026-09']
@@ -0,0 +1,78 @@
+import io
+import os
+import shutil
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+from conftest import ROOT, FUND_DATA
+from export_parser import parse_exports
+from export_schema import NAME_COLUMN, VALUATION_COLUMN
+
+FILES = sorted(Path(FUND_DATA).glob("mse-funds-data-*.xls"))
+# 2024 so far: 2024-04 and 2024-06 list some funds twice for one valuation date
+DUPLICATED_FILES = [f for f in FILES if '-2024-' in f.name]
+
+
+def soup_parse(files):
+    # What crawl-mse.py's 'soup' mode reads from each export
+    frames = []
+    for file in files:
+        table = BeautifulSoup(file.read_text(encoding='utf-8'), 'html.parser').find('table')
+        frames.append(pd.read_html(io.StringIO(str(table)))[0])
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture(scope='module')
+def parsed():
+    return {
+        'soup': soup_parse(FILES),
+        'stream': parse_exports(FILES),
+        'parallel': parse_exports(FILES, parallel=True, max_workers=2),
+    }
+
+
+def test_fixture_exports_present():
+    assert len(FILES) > 100
+
+
+@pytest.mark.parametrize('mode', ['stream', 'parallel'])
+def test_streaming_parse_matches_soup(parsed, mode):
+    pd.testing.assert_frame_equal(parsed[mode], parsed['soup'])
+
+
+@pytest.mark.parametrize('mode', ['soup', 'stream', 'parallel'])
+def test_parse_reproduces_committed_csv(parsed, mode):
+    # The committed dataset is the soup parse, deduplicated, as tab-separated text
+    committed = Path(ROOT, 'crawler', 'combined_mutual_fund_data.csv').read_text(encoding='utf-8')
+    assert parsed[mode].drop_duplicates().to_csv(index=False, sep='\t') == committed
+
+
+@pytest.fixture(scope='module')
+def crawl_mse(tmp_path_factory):
+    # crawl-mse.py logs to crawler.log in the working directory
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp('log'))
+    try:
+        spec = importlib.util.spec_from_file_location('crawl_mse', os.path.join(ROOT, 'crawler', 'crawl-mse.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+
+def test_parse_modes_give_the_same_dataset(crawl_mse, tmp_path):
+    for file in DUPLICATED_FILES:
+        shutil.copy(file, tmp_path)
+    results = {mode: crawl_mse.process_downloads(str(tmp_path), mode, incremental=False)
+               for mode in crawl_mse.PARSE_MODES.values()}
+
+    combined, quarantine = results['soup']
+    assert not combined.duplicated([NAME_COLUMN, VALUATION_COLUMN]).any()
+    for mode in ('stream', 'parallel'):
+        pd.testing.assert_frame_equal(results[mode][0], combined)
+        pd.testing.assert_frame_equal(results[mode][1], quarantine)
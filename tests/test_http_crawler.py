@@ -0,0 +1,105 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from conftest import FUND_DATA
+from crawl_planner import plan_crawl
+from export_parser import parse_export
+from export_schema import VALUATION_COLUMN
+from http_crawler import HttpFundCrawler
+from ingest_manifest import IngestManifest, MANIFEST_FILENAME
+from stub_server import make_server
+
+# Four recorded months (numbered as in fund_data/, which starts at 2014-10),
+# then one the stub has no export for
+MONTHS = [(datetime(2024, month, 1), 111 + month) for month in range(7, 11)]
+EMPTY_MONTH = datetime(2030, 1, 1)
+
+
+def month_period(start, iteration):
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start, end, iteration
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**options):
+        server = make_server(FUND_DATA, **options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def crawler_for(server, download_dir, **options):
+    url = f"http://127.0.0.1:{server.server_port}/F/open-end-investment-funds"
+    return HttpFundCrawler(str(download_dir), url=url, backoff=0.01, **options)
+
+
+def test_crawl_saves_the_recorded_exports(stub, tmp_path):
+    server = stub(delay=0.05)
+    crawler = crawler_for(server, tmp_path, max_concurrency=2)
+    failed = crawler.download_months([month_period(start, iteration) for start, iteration in MONTHS])
+    crawler.close()
+
+    assert failed == []
+    for start, iteration in MONTHS:
+        name = f"mse-funds-data-{iteration}-{start.year}-{start.month:02d}.xls"
+        saved = (tmp_path / name).read_text(encoding='utf-8')
+        assert saved == Path(FUND_DATA, name).read_text(encoding='utf-8')
+    handler = server.RequestHandlerClass
+    assert set(handler.posts.values()) == {1}
+    assert 1 < handler.peak_in_flight <= 2
+
+
+def test_503s_are_retried(stub, tmp_path):
+    server = stub(fail_first=2)
+    crawler = crawler_for(server, tmp_path, max_retries=3)
+    failed = crawler.download_months([month_period(start, iteration) for start, iteration in MONTHS])
+    crawler.close()
+
+    assert failed == []
+    assert len(list(tmp_path.glob("mse-funds-data-*.xls"))) == len(MONTHS)
+    # Two 503s, then the export
+    assert sorted(server.RequestHandlerClass.posts.values()) == [3] * len(MONTHS)
+
+
+def test_month_fails_after_max_retries(stub, tmp_path):
+    server = stub(fail_rate=1.0)
+    crawler = crawler_for(server, tmp_path, max_retries=2)
+    periods = [month_period(start, iteration) for start, iteration in MONTHS[:2]]
+    failed = crawler.download_months(periods)
+    crawler.close()
+
+    assert failed == periods
+    assert list(tmp_path.iterdir()) == []
+    assert sorted(server.RequestHandlerClass.posts.values()) == [2, 2]
+
+
+def test_empty_month_is_recorded_as_done(stub, tmp_path):
+    server = stub()
+    crawler = crawler_for(server, tmp_path)
+    period = month_period(EMPTY_MONTH, 1)
+    assert crawler.download_months([period]) == []
+    crawler.close()
+
+    path = tmp_path / "mse-funds-data-1-2030-01.xls"
+    assert len(parse_export(path)[VALUATION_COLUMN]) == 0
+    manifest = IngestManifest(tmp_path / MANIFEST_FILENAME)
+    manifest.refresh([path])
+
+    # Downloaded before the month settled it is fetched again, afterwards it's done
+    downloaded = datetime(2030, 1, 20)
+    os.utime(path, (downloaded.timestamp(), downloaded.timestamp()))
+    assert [month.reason for month in plan_crawl(tmp_path, [period], manifest, now=downloaded)] == ['incomplete']
+    downloaded = datetime(2030, 2, 10)
+    os.utime(path, (downloaded.timestamp(), downloaded.timestamp()))
+    assert plan_crawl(tmp_path, [period], manifest, now=downloaded) == []